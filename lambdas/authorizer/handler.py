@@ -1,14 +1,20 @@
 
 
 import jwt
-from lambdas.common.constants import LOGGER, PRODUCT
-from lambdas.common.ssm_helpers import API_SECRET_KEY
+import time
+import hashlib
+from collections import OrderedDict
+from lambdas.common.constants import LOGGER, PRODUCT, AUTHORIZER_TOKEN_CACHE_SIZE, AUTHORIZER_WILDCARD_POLICY
+from lambdas.common.ssm_helpers import get_parameter
 from lambdas.common.errors import LambdaAuthorizerError
 
 log = LOGGER.get_logger(__file__)
 
 HANDLER = 'authorizer'
 
+# Verified tokens for this container: digest -> (claims, exp). Oldest dropped past AUTHORIZER_TOKEN_CACHE_SIZE.
+verified_tokens = OrderedDict()
+
 def generate_policy(effect, resource):
     #Return a valid AWS policy response
     #auth_response = {'principalId': principal_id}
@@ -27,13 +33,37 @@ def generate_policy(effect, resource):
     }
     return auth_response
 
+def get_policy_resource(method_arn):
+    #arn:aws:execute-api:{region}:{account}:{apiId}/{stage}/{method}/{path} -> every method and path of the stage
+    if not AUTHORIZER_WILDCARD_POLICY:
+        return method_arn
+    api_stage = method_arn.split('/')[:2]
+    if len(api_stage) < 2:
+        return method_arn
+    return '/'.join(api_stage) + '/*'
+
 def decode_auth_token(auth_token):
     #Decodes the auth token
     try:
         # remove "Bearer " from the token string.
         auth_token = auth_token.replace('Bearer ', '')
-        # decode using system environ $SECRET_KEY, will crash if not set.
-        return jwt.decode(auth_token, API_SECRET_KEY, algorithms=['HS256'])
+        # API secret from SSM (fetched on first use, then cached), will crash if not set.
+        secret = get_parameter('API_SECRET_KEY')
+        # Keyed on the secret too - a rotated secret never matches tokens verified with the old one
+        token_digest = hashlib.sha256(f"{secret}.{auth_token}".encode()).hexdigest()
+        cached = verified_tokens.get(token_digest)
+        if cached and cached[1] > time.time():
+            verified_tokens.move_to_end(token_digest)
+            return cached[0]
+        verified_tokens.pop(token_digest, None)
+
+        user_details = jwt.decode(auth_token, secret, algorithms=['HS256'])
+        # Only tokens that expire are cached - the entry is good until the token itself isn't
+        if 'exp' in user_details:
+            verified_tokens[token_digest] = (user_details, user_details['exp'])
+            while len(verified_tokens) > AUTHORIZER_TOKEN_CACHE_SIZE:
+                verified_tokens.popitem(last=False)
+        return user_details
     except jwt.ExpiredSignatureError:
         'Signature expired. Please log in again.'
         return
@@ -51,7 +81,7 @@ def handler(event, context):
             user_details = decode_auth_token(auth_token)
             if user_details:
                 # if the JWT is valid and not expired return a valid policy.
-                return generate_policy('Allow', method_arn)
+                return generate_policy('Allow', get_policy_resource(method_arn))
             
         log.warning("Authroizer: Deny.")
         return generate_policy('Deny', method_arn)
@@ -1,59 +1,399 @@
+import os
+import re
+import json
+import time
+import uuid
+import hashlib
 import aiohttp
 import asyncio
-from lambdas.common.constants import LOGGER
+from collections import OrderedDict
+from urllib.parse import urlsplit
+from lambdas.common.constants import (
+    LOGGER, SPOTIFY_REQUESTS_PER_SECOND, SPOTIFY_MIN_REQUESTS_PER_SECOND, SPOTIFY_BURST_SIZE, SPOTIFY_MAX_RETRIES,
+    SPOTIFY_READY_RETRIES, SPOTIFY_READY_BACKOFF_SECONDS, RESPONSE_CACHE_SIZE, RESPONSE_CACHE_DIR,
+    RESPONSE_CACHE_DISK_SIZE
+)
 
 log = LOGGER.get_logger(__file__)
 
 
-# Global rate limit event
-rate_limited = asyncio.Event()
-rate_limited.set()  # start in "open" state
+# Cost of a request against the shared budget, by endpoint class.
+# First matching (method, path pattern) wins - default weight is 1.
+ENDPOINT_WEIGHTS = [
+    ('PUT', re.compile(r'/playlists/[^/]+/images'), 3),
+    ('POST', re.compile(r'/playlists/[^/]+/tracks'), 2),
+    ('PUT', re.compile(r'/playlists/[^/]+/tracks'), 2),
+    ('DELETE', re.compile(r'/playlists/[^/]+/tracks'), 2),
+    ('POST', re.compile(r'/users/[^/]+/playlists'), 2),
+    ('GET', re.compile(r'/albums\?ids='), 2),
+]
+
+
+def endpoint_weight(method: str, url: str):
+    for weight_method, pattern, weight in ENDPOINT_WEIGHTS:
+        if method == weight_method and pattern.search(url):
+            return weight
+    return 1
+
+
+class RateLimiter:
+    """
+    Token bucket every Spotify request is paced through before it is sent.
+
+    Tokens refill at `rate` per second up to `burst`. Callers reserve tokens up front - a
+    negative balance is the queue of callers waiting their turn - and each waits until the
+    tokens credited since cover its place in that queue, so concurrent callers are spread out
+    in arrival order instead of woken together.
+    A 429 blocks the bucket for the Retry-After window and halves the rate (down to `min_rate`);
+    each success then nudges the rate back up toward `max_rate` (AIMD), so the limiter settles
+    just under the budget Spotify actually grants us. Waiters re-check at least every
+    `recheck_seconds`, so a rate change reaches callers already queued, not only new ones.
+    """
+
+    recheck_seconds = 0.25
+
+    def __init__(self, rate: float, burst: int, min_rate: float = 1.0):
+        self.max_rate = rate
+        self.min_rate = min(min_rate, rate)
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        # Total tokens ever refilled - a waiter is through once this passes its place in the queue
+        self.credited = 0.0
+        self.updated_at = time.monotonic()
+        self.blocked_until = 0.0
+
+    def __refill(self, now: float):
+        if now > self.updated_at:
+            tokens = min(self.burst, self.tokens + (now - self.updated_at) * self.rate)
+            self.credited += tokens - self.tokens
+            self.tokens = tokens
+            self.updated_at = now
+
+    async def acquire(self, weight: int = 1):
+        self.__refill(time.monotonic())
+        # Reserve now, pay later - no await between check and decrement so no lock needed
+        self.tokens -= weight
+        ready_at = self.credited + max(-self.tokens, 0)
+        while True:
+            now = time.monotonic()
+            self.__refill(now)
+            if self.credited >= ready_at:
+                return
+            # Timed at the current rate, and re-timed after a slice in case it changes meanwhile
+            wait = max(self.updated_at - now, 0) + (ready_at - self.credited) / self.rate
+            await asyncio.sleep(min(wait, self.recheck_seconds))
+
+    def throttled(self, retry_after: float):
+        now = time.monotonic()
+        self.__refill(now)
+        # One backoff per block - a burst of 429s from the same window only halves once
+        if now >= self.blocked_until:
+            self.rate = max(self.min_rate, self.rate / 2)
+        self.blocked_until = max(self.blocked_until, now + retry_after)
+        # Nothing refills until the block lifts. Spare tokens are dropped, but reservations are
+        # kept - callers already queued stay ahead of new ones, paced at the halved rate
+        self.tokens = min(self.tokens, 0.0)
+        self.updated_at = max(self.updated_at, self.blocked_until)
+        log.warning(f"Rate limited - blocking for {retry_after}s, rate now {self.rate:.2f} req/s.")
+
+    def succeeded(self):
+        if self.rate < self.max_rate:
+            self.rate = min(self.max_rate, self.rate + self.max_rate / 50)
+
+
+# Global limiter shared by every session in the container
+limiter = RateLimiter(SPOTIFY_REQUESTS_PER_SECOND, SPOTIFY_BURST_SIZE, SPOTIFY_MIN_REQUESTS_PER_SECOND)
+
+
+# Paths whose responses depend on who is asking - their cache entries are kept per access token
+USER_ENDPOINT_PATTERN = re.compile(r'/(me|users|playlists)(/|$)')
+
+
+def is_user_endpoint(url: str):
+    return USER_ENDPOINT_PATTERN.search(urlsplit(url).path) is not None
+
+
+class ResponseCache:
+    """
+    ETag cache for GET responses, keyed by URL.
+
+    Holds the parsed body of the `max_size` most recently used responses (LRU). User-specific
+    endpoints are keyed with a digest of the Authorization header, so one user's response is never
+    served to another. With a `directory`, shared entries are also written there - a second, larger
+    LRU of `disk_size` files that outlives the in-memory one in a warm container. User-specific
+    entries are never written: their keys change with every token refresh and would never be read
+    back. File reads and writes run on the default executor, off the event loop. Cached bodies are
+    shared between callers - treat them as read-only.
+    """
+
+    def __init__(self, max_size: int, directory: str = None, disk_size: int = RESPONSE_CACHE_DISK_SIZE):
+        self.max_size = max_size
+        self.directory = directory
+        self.disk_size = disk_size
+        self.entries = OrderedDict()
+        self.disk_keys = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+            # Whatever an earlier invocation left behind, oldest first
+            files = sorted((file for file in os.scandir(directory) if file.name.endswith('.json')), key=lambda file: file.stat().st_mtime)
+            for file in files:
+                self.disk_keys[file.name[:-len('.json')]] = None
+            for key in self.__evict_disk():
+                self.__remove_file(key)
+
+    def key(self, url: str, headers: dict = None):
+        scope = ''
+        if is_user_endpoint(url):
+            scope = hashlib.sha256((headers or {}).get('Authorization', '').encode('utf-8')).hexdigest()
+        return hashlib.sha256(f"{scope}|{url}".encode('utf-8')).hexdigest()
+
+    async def get(self, key: str):
+        """The cached (etag, body) for `key`, or None."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+            return entry
+        if key not in self.disk_keys:
+            return None
+        self.disk_keys.move_to_end(key)
+        entry = await asyncio.get_running_loop().run_in_executor(None, self.__read_file, key)
+        if entry is not None:
+            self.__remember(key, entry)
+        return entry
+
+    async def put(self, key: str, etag: str, body, persist: bool = True):
+        """`persist=False` keeps the entry in memory only - for user-specific responses."""
+        entry = (etag, body)
+        self.__remember(key, entry)
+        if not self.directory or not persist:
+            return
+        self.disk_keys[key] = None
+        self.disk_keys.move_to_end(key)
+        evicted = self.__evict_disk()
+        await asyncio.get_running_loop().run_in_executor(None, self.__write_file, key, entry, evicted)
+
+    def __remember(self, key: str, entry: tuple):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def __evict_disk(self):
+        evicted = []
+        while len(self.disk_keys) > self.disk_size:
+            key, _ = self.disk_keys.popitem(last=False)
+            evicted.append(key)
+        return evicted
+
+    def __read_file(self, key: str):
+        try:
+            with open(os.path.join(self.directory, f"{key}.json"), encoding='utf-8') as file:
+                stored = json.load(file)
+            return stored['etag'], stored['body']
+        except FileNotFoundError:
+            self.disk_keys.pop(key, None)
+            return None
+        except (OSError, ValueError, KeyError) as err:
+            log.warning(f"Response Cache Read {key}: {err}")
+            return None
+
+    def __write_file(self, key: str, entry: tuple, evicted: list):
+        path = os.path.join(self.directory, f"{key}.json")
+        try:
+            # Written aside and renamed so a reader never sees half a file
+            temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as file:
+                json.dump({'etag': entry[0], 'body': entry[1]}, file)
+            os.replace(temp_path, path)
+        except OSError as err:
+            log.warning(f"Response Cache Write {key}: {err}")
+        for evicted_key in evicted:
+            self.__remove_file(evicted_key)
+
+    def __remove_file(self, key: str):
+        try:
+            os.remove(os.path.join(self.directory, f"{key}.json"))
+        except FileNotFoundError:
+            pass
+        except OSError as err:
+            log.warning(f"Response Cache Remove {key}: {err}")
+
+
+# Shared by every session in the container - None when RESPONSE_CACHE_SIZE is 0
+response_cache = ResponseCache(RESPONSE_CACHE_SIZE, RESPONSE_CACHE_DIR or None) if RESPONSE_CACHE_SIZE > 0 else None
+
+
+# Headers that don't change what a shared endpoint returns - left out of the coalescing key
+COALESCE_IGNORED_HEADERS = {'authorization', 'if-none-match'}
+
+# Shared-endpoint GETs currently in flight, by coalescing key - identical requests wait on the same task
+in_flight_requests = {}
+
+
+def coalesce_key(method: str, url: str, headers: dict = None):
+    """Key identical requests share, or None for user-specific endpoints, which are never coalesced."""
+    if is_user_endpoint(url):
+        return None
+    shared_headers = sorted((name.lower(), value) for name, value in (headers or {}).items() if name.lower() not in COALESCE_IGNORED_HEADERS)
+    return method, url, tuple(shared_headers)
+
+
+class TransportResponse:
+    """The parts of an HTTP response callers read, the same whichever transport sent it."""
+
+    __slots__ = ('status_code', 'headers', 'content')
+
+    def __init__(self, status_code: int, headers, content: bytes):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+
+    @property
+    def text(self):
+        return self.content.decode('utf-8', errors='replace')
+
+    def json(self):
+        return json.loads(self.content)
+
+
+async def aiohttp_send(session: aiohttp.ClientSession, method: str, url: str, headers: dict = None, json: dict = None, data=None):
+    """Send one request over `session` as is - no pacing or retries."""
+    async with session.request(method, url, headers=headers, json=json, data=data) as resp:
+        return TransportResponse(resp.status, resp.headers, await resp.read())
+
+
+async def send_paced(send, method: str, url: str, headers: dict = None, json: dict = None, data=None, retry_statuses: tuple = ()):
+    """
+    Send one request through the shared limiter with `send` and return the final TransportResponse.
+
+    This is the one place requests are paced - every transport and helper goes through it.
+    429s are retried up to SPOTIFY_MAX_RETRIES times behind the limiter. `retry_statuses` are
+    treated as "not ready yet" - e.g. a 404 on a playlist created a moment ago - and retried
+    with exponential backoff up to SPOTIFY_READY_RETRIES times, then returned like any other status.
+    """
+    weight = endpoint_weight(method, url)
+    rate_limited = 0
+    not_ready = 0
+    while True:
+        await limiter.acquire(weight)
+        response = await send(method, url, headers=headers, json=json, data=data)
+        if response.status_code == 429:
+            if rate_limited >= SPOTIFY_MAX_RETRIES:
+                raise Exception(f"Spotify API rate limit retries exhausted ({SPOTIFY_MAX_RETRIES}) at {url}")
+            rate_limited += 1
+            retry_after = int(response.headers.get('Retry-After', 1))
+            log.warning(f"Rate limit reached for {method} {url} (attempt {rate_limited}). Retry-After: {retry_after}s.")
+            limiter.throttled(retry_after)
+            continue
+
+        limiter.succeeded()
+        if response.status_code not in retry_statuses or not_ready >= SPOTIFY_READY_RETRIES:
+            return response
+        backoff = SPOTIFY_READY_BACKOFF_SECONDS * 2 ** not_ready
+        not_ready += 1
+        log.warning(f"{method} {url} not ready ({response.status_code}). Retrying in {backoff}s...")
+        await asyncio.sleep(backoff)
+
+
+async def paced_request(session: aiohttp.ClientSession, method: str, url: str, headers: dict = None,
+                        json: dict = None, data=None, retry_statuses: tuple = ()):
+    """`send_paced` over `session` - returns the final TransportResponse whatever its status."""
+    return await send_paced(
+        lambda *args, **kwargs: aiohttp_send(session, *args, **kwargs),
+        method, url, headers=headers, json=json, data=data, retry_statuses=retry_statuses
+    )
+
+
+async def request_json(session: aiohttp.ClientSession, method: str, url: str, headers: dict = None,
+                       json: dict = None, data=None, ok_statuses: tuple = (200,), retry_statuses: tuple = ()):
+    """
+    Send one request with `send_paced` and return its parsed JSON body (None if it has none).
+
+    Anything not in `ok_statuses` once the retries are spent raises.
+    """
+    _, _, body = await __request(session, method, url, headers, json, data, ok_statuses, retry_statuses)
+    return body
+
+
+async def __request(session: aiohttp.ClientSession, method: str, url: str, headers: dict = None,
+                    json: dict = None, data=None, ok_statuses: tuple = (200,), retry_statuses: tuple = ()):
+    """`request_json`, returning (status, headers, body) for callers that need more than the body."""
+    response = await paced_request(session, method, url, headers, json, data, retry_statuses)
+    if response.status_code not in ok_statuses:
+        raise Exception(f"Spotify API error {response.status_code} at {url}: {response.text}")
+    content_type = response.headers.get('Content-Type', '').split(';')[0].strip()
+    if not response.content or content_type != 'application/json':
+        return response.status_code, response.headers, None
+    return response.status_code, response.headers, response.json()
+
 
 async def fetch_json(session: aiohttp.ClientSession, url: str, headers: dict = None):
     try:
-        await rate_limited.wait()  # wait if rate limited globally
-        async with session.get(url, headers=headers) as resp:
-            if resp.status == 429:
-                retry_after = int(resp.headers.get('Retry-After', 1))
-                log.warning(f"Rate limit reached for GET {url}. Retrying after {retry_after} seconds...")
-
-                # Block everyone - wait - reset
-                rate_limited.clear()
-                await asyncio.sleep(retry_after + 1)
-                rate_limited.set()
-                # Retry
-                return await fetch_json(session, url, headers)
-
-            if resp.status != 200:
-                text = await resp.text()
-                raise Exception(f"Spotify API error {resp.status} at {url}: {text}")
-
-            return await resp.json()
+        # Single flight - the first caller sends, identical callers that arrive meanwhile await its result
+        key = coalesce_key('GET', url, headers)
+        if key is None:
+            return await __fetch_json(session, url, headers)
+        task = in_flight_requests.get(key)
+        if task is None:
+            task = asyncio.ensure_future(__fetch_json(session, url, headers))
+            in_flight_requests[key] = task
+            task.add_done_callback(lambda _: in_flight_requests.pop(key, None))
+        else:
+            log.info(f"Coalesced GET {url} onto the request in flight.")
+        # Shielded so one caller being cancelled doesn't cancel the request for the others
+        return await asyncio.shield(task)
     except Exception as err:
         log.error(f"AIOHTTP Fetch JSON: {err}")
         raise Exception(f"AIOHTTP Fetch JSON: {err}") from err
 
 
-async def post_json(session: aiohttp.ClientSession, url: str, headers: dict = None, json: dict = None):
+async def __fetch_json(session: aiohttp.ClientSession, url: str, headers: dict = None):
+    """One GET, revalidated against the response cache when it is on."""
+    if response_cache is None:
+        return await request_json(session, 'GET', url, headers=headers)
+
+    # Revalidate what we already have - a 304 has no body to download or parse
+    key = response_cache.key(url, headers)
+    cached = await response_cache.get(key)
+    if cached is not None:
+        headers = {**(headers or {}), 'If-None-Match': cached[0]}
+    status, response_headers, body = await __request(session, 'GET', url, headers=headers, ok_statuses=(200, 304))
+    if status == 304 and cached is not None:
+        return cached[1]
+    etag = response_headers.get('ETag')
+    if etag and body is not None:
+        await response_cache.put(key, etag, body, persist=not is_user_endpoint(url))
+    return body
+
+
+async def post_json(session: aiohttp.ClientSession, url: str, headers: dict = None, json: dict = None, retry_statuses: tuple = ()):
     try:
-        await rate_limited.wait()  # wait if rate limited globally
-        async with session.post(url, headers=headers, json=json) as resp:
-            if resp.status == 429:
-                retry_after = int(resp.headers.get('Retry-After', 1))
-                log.warning(f"Rate limit reached for POST {url}. Retrying after {retry_after} seconds...")
-                # Block everyone - wait - reset
-                log.warning(f"RETRY AFTER: {retry_after}s.")
-                rate_limited.clear()
-                await asyncio.sleep(retry_after + 1)
-                rate_limited.set()
-                # Retry
-                return await post_json(session, url, headers, json)
-
-            if resp.status != 200 and resp.status != 201:
-                text = await resp.text()
-                raise Exception(f"Spotify API error {resp.status} at {url}: {text}")
-
-            return await resp.json()
+        return await request_json(session, 'POST', url, headers=headers, json=json, ok_statuses=(200, 201), retry_statuses=retry_statuses)
     except Exception as err:
         log.error(f"AIOHTTP Post JSON: {err}")
-        raise Exception(f"AIOHTTP Post JSON: {err}") from err
\ No newline at end of file
+        raise Exception(f"AIOHTTP Post JSON: {err}") from err
+
+
+async def put_json(session: aiohttp.ClientSession, url: str, headers: dict = None, json: dict = None):
+    try:
+        return await request_json(session, 'PUT', url, headers=headers, json=json, ok_statuses=(200, 201))
+    except Exception as err:
+        log.error(f"AIOHTTP Put JSON: {err}")
+        raise Exception(f"AIOHTTP Put JSON: {err}") from err
+
+
+async def put_data(session: aiohttp.ClientSession, url: str, headers: dict = None, data=None, ok_statuses: tuple = (200, 201, 202), retry_statuses: tuple = ()):
+    try:
+        return await request_json(session, 'PUT', url, headers=headers, data=data, ok_statuses=ok_statuses, retry_statuses=retry_statuses)
+    except Exception as err:
+        log.error(f"AIOHTTP Put Data: {err}")
+        raise Exception(f"AIOHTTP Put Data: {err}") from err
+
+
+async def delete_json(session: aiohttp.ClientSession, url: str, headers: dict = None, json: dict = None):
+    try:
+        return await request_json(session, 'DELETE', url, headers=headers, json=json, ok_statuses=(200, 201))
+    except Exception as err:
+        log.error(f"AIOHTTP Delete JSON: {err}")
+        raise Exception(f"AIOHTTP Delete JSON: {err}") from err
@@ -1,8 +1,9 @@
-import requests
 import aiohttp
 from lambdas.common.track_list import TrackList
 from lambdas.common.constants import LOGGER
 from lambdas.common.aiohttp_helper import fetch_json
+from lambdas.common.transport import get_transport
+from lambdas.common.release_index import ReleaseIndex
 
 log = LOGGER.get_logger(__file__)
 
@@ -13,6 +14,7 @@ class ArtistList:
     def __init__(self, term: str, headers: dict, session: aiohttp.ClientSession = None):
         log.info(f"Initializing Artist for term: {term}")
         self.aiohttp_session = session
+        self.transport = get_transport(session)
         self.term: str = term
         self.headers = headers
         self.artist_list: list = []
@@ -40,9 +42,9 @@ class ArtistList:
             log.error(f"Get Followed Artists Latest Release: {err}")
             raise Exception(f"Get Followed Artists Latest Release: {err}") from err
         
-    async def aiohttp_get_followed_artist_latest_release(self):
+    async def aiohttp_get_followed_artist_latest_release(self, release_index: ReleaseIndex = None):
         try:
-            await self.artist_tracks.aiohttp_get_artist_latest_release(self.artist_id_list)
+            await self.artist_tracks.aiohttp_get_artist_latest_release(self.artist_id_list, release_index)
         except Exception as err:
             log.error(f"AIOHTTP Get Followed Artists Latest Release: {err}")
             raise Exception(f"AIOHTTP Get Followed Artists Latest Release: {err}") from err
@@ -57,7 +59,7 @@ class ArtistList:
             while(more_artists):
                 
                 # Make the request
-                response = requests.get(url, headers=self.headers)
+                response = await self.transport.request('GET', url, headers=self.headers)
                 response_data = response.json()
 
                 # Check for errors
@@ -136,7 +138,7 @@ class ArtistList:
             url = f"{self.BASE_URL}/me/top/artists?limit=25&time_range={self.term}"
 
             # Make the request
-            response = requests.get(url, headers=self.headers)
+            response = await self.transport.request('GET', url, headers=self.headers)
             response_data = response.json()
 
             # Check for errors
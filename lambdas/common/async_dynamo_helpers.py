@@ -0,0 +1,38 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from lambdas.common.constants import LOGGER, DYNAMODB_MAX_CONCURRENCY
+from lambdas.common import dynamo_helpers
+
+log = LOGGER.get_logger(__file__)
+
+# DynamoDB calls from the asyncio pipelines run here instead of on the event loop. The pool is
+# the concurrency cap - at most DYNAMODB_MAX_CONCURRENCY calls are in flight, the rest queue up
+# while Spotify requests keep going. Kept apart from the default executor so DynamoDB latency
+# can't starve (or be starved by) anything else that uses it.
+dynamo_executor = ThreadPoolExecutor(max_workers=DYNAMODB_MAX_CONCURRENCY, thread_name_prefix='dynamo')
+
+
+async def run_in_dynamo_executor(function, *args, **kwargs):
+    """Await a blocking boto3 call (or any dynamo_helpers function) without blocking the event loop."""
+    return await asyncio.get_running_loop().run_in_executor(dynamo_executor, functools.partial(function, *args, **kwargs))
+
+
+async def aiohttp_update_table_item_fields(table_name, primary_key, primary_key_value, fields: dict, remove_fields: list = None, ledger_fields: dict = None):
+    return await run_in_dynamo_executor(dynamo_helpers.update_table_item_fields, table_name, primary_key, primary_key_value, fields, remove_fields, ledger_fields)
+
+
+async def aiohttp_update_user_table_release_radar_id(user: dict, playlist_id: str, image_hash: str = None):
+    return await run_in_dynamo_executor(dynamo_helpers.update_user_table_release_radar_id, user, playlist_id, image_hash)
+
+
+async def aiohttp_update_user_table_wrapped_data(email: str, top_tracks_last_month: dict, top_artists_last_month: dict, top_genres_last_month: dict, ledger_fields: dict = None):
+    return await run_in_dynamo_executor(dynamo_helpers.update_user_table_wrapped_data, email, top_tracks_last_month, top_artists_last_month, top_genres_last_month, ledger_fields)
+
+
+async def aiohttp_claim_table_item(table_name, primary_key, primary_key_value, claim_attribute, lease_seconds, ledger_fields: dict):
+    return await run_in_dynamo_executor(dynamo_helpers.claim_table_item, table_name, primary_key, primary_key_value, claim_attribute, lease_seconds, ledger_fields)
+
+
+async def aiohttp_release_table_item_claim(table_name, primary_key, primary_key_value, claim_attribute):
+    return await run_in_dynamo_executor(dynamo_helpers.release_table_item_claim, table_name, primary_key, primary_key_value, claim_attribute)
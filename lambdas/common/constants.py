@@ -6,6 +6,7 @@ AWS_DEFAULT_REGION ='us-east-1'
 AWS_ACCOUNT_ID = os.environ['AWS_ACCOUNT_ID']
 PRODUCT = 'xomify'
 AIOHTTP_ACTIVE = os.environ.get('AIOHTTP_ACTIVE', False)
+SSM_PARAMETER_TTL_SECONDS = int(os.environ.get('SSM_PARAMETER_TTL_SECONDS', 300))
 
 # Headers
 RESPONSE_HEADERS = {
@@ -21,10 +22,54 @@ LOGGER = Logger(LOG_LEVEL)
 # Dynamodb
 DYNAMODB_KMS_ALIAS = os.environ['DYNAMODB_KMS_ALIAS']
 WRAPPED_TABLE_NAME = os.environ['WRAPPED_TABLE_NAME']
+# Sparse GSIs - only enrolled users carry the index key, so a query reads enrolled users only
+ACTIVE_WRAPPED_INDEX_NAME = os.environ.get('ACTIVE_WRAPPED_INDEX_NAME', 'activeWrapped-index')
+ACTIVE_RELEASE_RADAR_INDEX_NAME = os.environ.get('ACTIVE_RELEASE_RADAR_INDEX_NAME', 'activeReleaseRadar-index')
+WRAPPED_INDEX_KEY = 'wrappedIndexKey'
+RELEASE_RADAR_INDEX_KEY = 'releaseRadarIndexKey'
+ACTIVE_INDEX_KEY_VALUE = 'ACTIVE'
+DYNAMODB_SCAN_SEGMENTS = int(os.environ.get('DYNAMODB_SCAN_SEGMENTS', 4))
+DYNAMODB_MAX_CONCURRENCY = int(os.environ.get('DYNAMODB_MAX_CONCURRENCY', 8))
 
-# 2025 LOGO
-BLACK_2025_BASE_64 = "/9j/4QC8RXhpZgAASUkqAAgAAAAGABIBAwABAAAAAQAAABoBBQABAAAAVgAAABsBBQABAAAAXgAAACgBAwABAAAAAgAAABMCAwABAAAAAQAAAGmHBAABAAAAZgAAAAAAAABgAAAAAQAAAGAAAAABAAAABgAAkAcABAAAADAyMTABkQcABAAAAAECAwAAoAcABAAAADAxMDABoAMAAQAAAP//AAACoAQAAQAAAAAEAAADoAQAAQAAAAAEAAAAAAAA/+EOK2h0dHA6Ly9ucy5hZG9iZS5jb20veGFwLzEuMC8APD94cGFja2V0IGJlZ2luPSfvu78nIGlkPSdXNU0wTXBDZWhpSHpyZVN6TlRjemtjOWQnPz4KPHg6eG1wbWV0YSB4bWxuczp4PSdhZG9iZTpuczptZXRhLyc+CjxyZGY6UkRGIHhtbG5zOnJkZj0naHR0cDovL3d3dy53My5vcmcvMTk5OS8wMi8yMi1yZGYtc3ludGF4LW5zIyc+CgogPHJkZjpEZXNjcmlwdGlvbiByZGY6YWJvdXQ9JycKICB4bWxuczpBdHRyaWI9J2h0dHA6Ly9ucy5hdHRyaWJ1dGlvbi5jb20vYWRzLzEuMC8nPgogIDxBdHRyaWI6QWRzPgogICA8cmRmOlNlcT4KICAgIDxyZGY6bGkgcmRmOnBhcnNlVHlwZT0nUmVzb3VyY2UnPgogICAgIDxBdHRyaWI6Q3JlYXRlZD4yMDI1LTA5LTAzPC9BdHRyaWI6Q3JlYXRlZD4KICAgICA8QXR0cmliOkV4dElkPmExODVkNjBkLTAxYWUtNGFmMy05ZGUzLTIzZWVhMjY0NGMzYTwvQXR0cmliOkV4dElkPgogICAgIDxBdHRyaWI6RmJJZD41MjUyNjU5MTQxNzk1ODA8L0F0dHJpYjpGYklkPgogICAgIDxBdHRyaWI6VG91Y2hUeXBlPjI8L0F0dHJpYjpUb3VjaFR5cGU+CiAgICA8L3JkZjpsaT4KICAgPC9yZGY6U2VxPgogIDwvQXR0cmliOkFkcz4KIDwvcmRmOkRlc2NyaXB0aW9uPgoKIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PScnCiAgeG1sbnM6ZGM9J2h0dHA6Ly9wdXJsLm9yZy9kYy9lbGVtZW50cy8xLjEvJz4KICA8ZGM6dGl0bGU+CiAgIDxyZGY6QWx0PgogICAgPHJkZjpsaSB4bWw6bGFuZz0neC1kZWZhdWx0Jz4yMDI1IC0gMTwvcmRmOmxpPgogICA8L3JkZjpBbHQ+CiAgPC9kYzp0aXRsZT4KIDwvcmRmOkRlc2NyaXB0aW9uPgoKIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PScnCiAgeG1sbnM6cGRmPSdodHRwOi8vbnMuYWRvYmUuY29tL3BkZi8xLjMvJz4KICA8cGRmOkF1dGhvcj5Eb21pbmljayBHaW9yZGFubzwvcGRmOkF1dGhvcj4KIDwvcmRmOkRlc2NyaXB0aW9uPgoKIDxyZGY6RGVzY3JpcHRpb24gcmRmOmFib3V0PScnCiAgeG1sbnM6eG1wPSdodHRwOi8vbnMuYWRvYmUuY29tL3hhcC8xLjAvJz4KICA8eG1wOkNyZWF0b3JUb29sPkNhbnZhIGRvYz1EQUd4N3h2TV94cyB1c2VyPVVBRC1Fb3lwaURrIGJyYW5kPUJBRC1FZ1lJdEM0IHRlbXBsYXRlPTwveG1wOkNyZWF0b3JUb29sPgogPC9yZGY6RGVzY3JpcHRpb24+CjwvcmRmOlJERj4KPC94OnhtcG1ldGE+CiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCiAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAKICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgIAogICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgICAgCjw/eHBhY2tldCBlbmQ9J3cnPz7/2wBDAAYEBQYFBAYGBQYHBwYIChAKCgkJChQODwwQFxQYGBcUFhYaHSUfGhsjHBYWICwgIyYnKSopGR8tMC0oMCUoKSj/2wBDAQcHBwoIChMKChMoGhYaKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCgoKCj/wAARCAQABAADASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9oADAMBAAIRAxEAPwD5WooopAFFFFABRRRQAUUUUDCiiigAooooAKKKMUAFFLiigBBXt3wO0dYdKu9TkXMkzeXHkdAOuPxxXig5IHrX054Hs1svCGlRLj5oFlP1bn+tZVXZHz3Eld0sI4rqbhHb9aQJt60uc0E8Vzpn5sAFA/Kmg80uOKoRzvjLwrZ+JbAxygRXag+VOB0PofUV8++IdEvNCv5LS/iKOp4PZh6ivqTjNY/ibw9ZeItONtfIAwz5cwGWQ/4e1aRlY+nyXPJYVqlV1j+R8vUVv+LPDN74c1BoLtMxnmOVR8rj1FYFbJ3P0GnUjVipwd0woooplhRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFGKACijFGKACijFGKACijFGKACijFGKACijFGKACijFLigBKKXFGKAEopcUYoASilxRigBKKXFJigAooxRigAooxRigAooxRigAooxRigAooxRigAooxRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFACYoxS0UAJRS0UAJRS4pMUAFFFFABRRRQAUUUUAFFFFABRRRQIKKKKACiiigAooooAKKKKACiiigYUUUUAFFFFABRRiloASjFLRQAUUUUAFFFFAE1mnmXUSHuwFfVlhALbT7WBDlY4kQfgtfLOkgHU7YN90yLn86+r9oUBB0UBf0rmrnx3FknywQnUUlLilHT3rJaHww0CigAilxkVVxCUfWndKbVCZQ1jSbPWbB7S/hDxMMZ/iU+oPavAvHPg678NXZODNZOcxzAcEeh9DX0aPwqtf2cF/bSW15EssEnDIw/WrjKx72UZ1UwUuWWsT5PI5pK7n4geB7jw7Obi1Bm09z8r909jXD1snc/SMPiKeIgqlN3TEopaKLmwmKXFFFABijFFFABiiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACjFFFABijFFFABikxS0UAJiilooASiloouAlFLijFMBKKMUUAFFFFABRRRQAUUUUAFFFFABRRRQAUYoooATFFLRQAlFGKKACiiigAooooAKKKKACiiigQUUUUAFFFFAwooooAKKMUtABiiiigAooooAKKKKACiiigAooooAkgYpMjDsQa+qtHuTfaPY3feeBJD9SOa+UhX0Z8KLw3vgeyBfc8DPEw7gZyP51z11pc+Y4oo8+HVTszrioC9eaUijGRnvQeTXOmfnrEpKWkqxCUooNJg1SYCfxUrHkUY9OaQLz81UibEVxDFcQPBcRrJBICrIwyCK8R+IngKXR5XvdLR5dPbkjGTH7H2969z60josqNHIoeNhhlYZBHpVJ2PYyvNqmBnprHsfJR4pK9V+Ivw8a1EupaIhMH3pIR1T3HtXljAqSDwa1TufpWDxlLF01UpsbRRS4pnUJRS4oxQAlFLijFACUUuKMUAJRS4paAG0U6igBtFOooAbRTqKAG0U6igBtFOooASjFLRQAmKMUtFACYoxS0UAJijFLRQAmKMUtFACYoxS0UAJijFLRQAmKMUtFACYoxS0UAJijFLRQA2inUUANop1FADaKdRQA2inUUANop1FADaKdRQA2inUlACUUuKMUAJRS4oxQAlFLijFACUUuKMUAJRXQeEfDF/wCJ9SW1sIyQOXc9EHqa6n4ifDdvDGmw31nO9zbk7ZSVwVP+FK5yVMfQp1VQlL3n0PNqKKKZ1hRRRQAUUUUAFFFFABRiiigAxSUtFACUUtGKAEooxRTAKKKKACiiigAooooAKKKKAExRS0UAJRRiigAooooAKKKKACiiigQUUUtAxMUtFFABRRRQAUUUUAFFFFABRRS4oASjFLRSAMUUUUAFew/AbUmP9p6a2Nm0XCnvkcY/WvHq6n4b6sNH8XWE7/6pn8txnHDcf1zUTjeNjgzPD/WMNOHkfSG4elLnikK7WIGD7+tK1cR+TyjytpgetFHWkxxVJkhRS4o71VxDe9KWyKXFIRVJiG9ORR3pcUnfNUAvqD0PrXlfxI+H6yrJqmhxgOPmmt1H5lf8K9UFHNUmejl2ZVMDU5oPQ+S3UoxVgQR2pte2fEP4fJfiXUdFjCXI+aSAdH91Hr7V4xPDJbzNFMjJIhwykYINaJn6ZgMfSxtPnpvXsRUUUVR3BRRRSAKKKKBhRRRQAUUYoxQIKKMUYoAKKMUYouAUUYoxRcAooxSgZ6U1djEoqeK2llOEjYn2FaFvoN7Ng+XsB7tXRTwtar8EWzSNGc9kZGKK6mHwq/WWZfoBV+Lw3Zr98sxr0aWRYqp0sdMMvrS6HEBSegp6wSMflRj+Fegw6TZxY2wg/XmrKQRIPljUY9BXo0uGKj+OR0xyqX2meex6bdSn5YXP4Vbj8P3z9Y9v1ruxgdKPwrvp8MUl8UjeOV01uzjE8MXZ+8yD8anXwtJ/FMtdZRiuuHDuFjurmqy6ijmR4XQfenz9BTx4Ztx1kb8q6IijArojkeEX2SvqNFdDnx4atv77GnDw3a/3mrdxRVrJsIvsD+p0V0MP/hG7T+81NPhq1PSRq3cUYNP+xsJ/IL6pS7HPt4ZgxxK35VE3hhP4ZvzFdKRSVEsjwb+yQ8FS7HLP4YbHyzKahfw1cD7simuv4o/CsXw7hHsiHgKTOJk8P3idFDfQ1Vk0m8TrC1egYFJiuafC9B/C2ZSy6HRnnL2kyfejYfhUJUjqDXpTRq33gD9RVeTT7aQfPCpPrXDV4Vl/y7kYyy59GeeUV282g2jg7VKn61Sm8NIf9XLj6ivOq8O4qGyuc8sFURytFbk/h26j/wBXh/pWdPYXMP8ArImH4V5lXAYij8UGYSozjuipRTipHUEU3FcjTW5nYKKMUYqRBRRRQMKKKKACiiigAooooEFXdJ0+41TUIbO0RpJpWCqoFVY0aRwiDczcAV9B/CTwZ/Ydiup38f8Ap86/IpHMa/4mk2eZm2ZQy+g6kt+iOn8D+GIPC+ipaxhWuHG6aUfxH0+lbGoWUGo2c1pdxh4ZV2sp71aA9KX86g/IK2Oq1a7rt+8fO/jv4Y6hory3emKbzT8k5UfNGPcf1rzl0KsQwIPvX2b6+/auG8Y/DjS/EEbzW6pZXx6SIvysfcf1qkz7fKeLFK1LF/efNGKK2vFHh6+8N6i1pqEe1uqsOjD1FY1UfcU6kasVODumJikp1FMsbRS0YoASilxSUAFFFFABRRRQAUUUUAGKTFLRQAlFLRigBKKKKYBRRRQAUUUUAFFFFACYopaKAEooooAKKKKAFooooAKKKKACiiigAoopaAEpcUUUgFqW3t5rhwkETyMeyjNdF4J8JXnie+CRfu7ZP9ZKRwo/xr33w54f07w/arFYQJvH3pWGWY/WsalZQPHzHOKWC03kfOY8NayVyNNusf8AXNv8KzLi3mt5THPE8bjqrDBFfW/mvzzWN4i8O6br9s0d/bRtIRhZlXDqfrWUcTd6nk0OKYynapGyPlulro/GXhW88NX5inUvbsf3coHDD/H2rnMV1Jpq6PqqVWFaKnB3TEp8bFXVgcEHNNpaZo1fQ+nPA+qrrXhSxugSZEQRSA8ncvGT9etbn1r5++F3il9A1yOGeQjT7g7JR2XPRq+guMAg5HXPt61xVI8rPzXPcveFruS+FgBQaU0lQjwQpKWiqQhDRSc0oq0ISj5R96jFIyg1VxCdeacADj9aQJjGKOg/xpgBG4e9cJ8QfAsWuxPe6cix6ioyR0Ev/wBeu6J96O3vVJ2O3A46rg6inTZ8o3drLZ3DwXCNHKhwysMEGocV9D+OvBdr4jtmli2Q6kgO2THEns3+NeCanp9xpt5JbXkTRTRnBDCtEz9Ly3M6eOp3i9exTooopnqBRRRQFgooooCwUUUUBYKKWpIoZJW2xqSfYVUYuTshqLeiIqK3bPw3dzcygRL/ALXWtuz8N2sWDKTI3p0Fenh8nxNfaNkdlLAVanSxxccTucIhP0FaNroV7Pg+WVHq3FdzBZwQDEUSLjvjmpcV7mH4aitasj0KeUpfGzmbXwsi83EoPstatvo1lB0iDH/arRxS/SvboZThqO0Tup4OlDZEaRRoMIiqPYU4j0pcGjFehClCGyOhRS2QmKKXFGK1GIaMUuKTBpiYlGKXmjFO4rCUUvNFO4hDSU7FJigVhMUmKXFGKYhMUmKdikIoJEopcUYoEJikp1JTASilxRigQ2iiigQUUUUxCU1l3DBAI9CKeaKlwjLdCaT3KM+m20w/eRLn24rMuvDsT5MDlT6GugNJmuCvlWGr/FE554anLdHFXOiXUGcLvA7rWc8UkZw6kH3FeikCoZ7WGf8A1kat+FeDiuF4PWjKxx1MAvss88orrrvw/DJzCdh9+lYl3o9zbk/LuUdxXzuKybE4fVxujinhqkN0ZlFPdGQ4YEUyvKlFxdmYWsFFFFIAoxRivR/hd4DfXbldQ1JWTTIjnkcyn0FJuxy4vF08JSdWo7JGx8HfA/nyJrmqxHyUOYI2H3z/AHj7CvbBzUcUcccaRRIscUYCqijAA9KeB6VNz8jzfM55hWc5bdEPAxSgU0HilHAPNB44ooPXikHFKevBouB5/wDGfRoNR8JyXrLi5syGV/VT1FfOB4r6P+NOsx6f4UezyPOvDtC9wAetfOPU1SP1jhV1PqS59uglFGKKZ9MFFFFAgooopgJRilooATFJTqKAG0UuKKAEooooAKKKKACjFFFACUUtGKAEooopgFFFFABRRRQAUmKWigBKKU0lAC0UUUAFFFFABS4oopAFFFFABW94R8PXPiLVUtbcYQHMkh6KPU1hV7x8EZdPk8OTR2y7b9HzcZ6sD90j27VnVlyxujz8zxMsNh5VIK7O10XTLXRdOisrJFWNByR1Y+pq99KXFA46V5Tld3Z+YVqsqs3KbuxCT36UDjrTjTaEzEo61pVrrGnyWl7ErxuOCeqn1FfPHjXwtdeGtRaOQFrZzmKXHDCvpYfKOazte0iz1vTntL6PejDgjqp9RXTSquLsz3cnzeeDnyT1iz5VorovGHhm68Oak0EwLwkkxygcMK53Fdyaauj9EpVY1YqcHdMVSQQR2r6M+GeuHW/C8JlYtc237mTJ5IHQ/lXzkK9j+BcEyQ6hM6kW7bVB7E1nWV4njcQ0YTwjlLdHq3WjFBPvQa40fmrFpKPrRVpiENJ3pTSVVxC0hFLSYNNAA4pCaUikqrisJn2pf5UvSgdKpANHXmuf8ZeF7PxLZFJ1WO7UfupwOQfQ+oroDnHFA96pM6cLiqmGmp03ZnzB4g0W80PUHtL6Mo69Djhh6isvFfTfiXQLLxDp5tb5PnH+rmA+aM/1HtXz/wCKPD174d1F7W9Tjqkg+649QatM/SMpzenjoWekjExRRS4pntBSU4KWOBya19P0G6u8Mw8tD3NbUcPUrO0Fc1p0Z1HaKMcDPSr1lpd1eMPKjOPU9K66x0G0tgCy+a/qela6oFGFUKB2FfRYTh6UverOx6tDKW9ajObsfDEaYa6k3H+6tblvZW9sAIIlX8OasgUYr6PDZbQw/wAMT1qWEpUvhQlFLmjivRSS2OiwlFLxSVSAKKKKZIUGlpKYCUUtHFMQ2ilopisJRS0lAgpKWimhCUlLRQISjmloNUIbRS0UEiUnNOpCKYmhM0UYoxQIKKKKYBRRRQIbRS0UEiUEZpaSgBKKXFGKBWEpDS0UCEpCAeopcUYoaT3E1cp3en290D5iDPqOKw7zw6w+a2fP+yetdO2aK8vFZRh8T8UdTmqYaE90ef3NnNbsRLGRVfFejPCk/wAroHB7EVteHPAWnX93HPOj+WpyY88NXx2Z5J9UXPCWh4GY1aWAi5zehz3wx8Cy+Irz7Zfq0WlwnLN08w/3RX0JbQRW1ukFuixwRgKqKMACorS3itreO3t4lihjGFRRgCrA6V82z8kzrN6mYVO0VshyiikPFKvIoPCHdqO1ApT1pEhnFNeRI43eRtqKMlj0A9acTmvNfjN4sXS9LOk2cn+l3I/eEHlE/wDr0I9DLMDPG4iNKK9Tyz4neJD4i8SzSRsfssJ8uEegHf8AE81x9ObJJJPNNq0fsuHoRw9KNOGyCiiimbhRRRQITFFTwW0077YoncnsozWvbeE9cuUDw6Zcsp77DSuZTr04fFJIwaK6STwR4hRNzaVc7fXZWXcaNqFuSJrOZMdcoadyY4qjP4ZL7zPopzKythgQfQ02i5utdgooopgFJilooAbRTqTFACUUUUAFFFFABRiiigBKKWkpgFFFFABRRRQAUUUUAFFFLQAYooopAFFFFABRRS4oAMV0fgXxFL4a1+G7Qkwk7JU/vIeornaKUlzKzIq041YOEtmfWtpcxXlrFc2zh4ZVDqw7g1L715F8GPFWxzoV9IAjndbM3Zu6/jXr3I7Y9a8mrTdOVj8yzTAywdZx6dBRSEUtJUJnlWGjoc0LyCKd2oqkwMrxFottrmmva3SBsj5W7qfavnHxJos+iapNaTKflPytjqK+oh1BrN1jQ9N1dVGo2iTbfunoR+NdFOryH0GUZy8H7lTWJ8++DfC134h1BERGS2B+eUjgCvojStPttL0+G0tECxRrgD19zUtnaW9lbpBawpFCo4VRj/Jqck06lRyMs2zeeNfLHSIU3FOApDiszww7dKDRmiqTASiijFVcmwE0lKRzRVIBppRRRVAHakA70ozSVQhMj8aCDTdoBzTs56iquAdazdf0ez1zTns7+MNG3Kt/EjeorROaCOM55ppm1CvOhNTg7NHzx4s8G6joFyVMbXFsT8k0a5BHv6Gs7TtAvLvDshii/vOMV9HXcIeMgjNcdrVgQ7EA4r1suoUq0/3jP0zIc3p4xqFfc4qw0a1swMKHf+81aYAHYU6RSjkEYxTe9fd4bD0qUUqaP0vDwpxj7iDFLRRXYbiUYpaKoQmKMUtFMQmKMUtFO4CUYpaKdxCYpMc06imFhpoxS0U0ybCYoxRRRcQYpCKWkNO4gxRiiimhBim4p1J3oATFFLRRcVhMUlLiinckTFBFFFMQYpKU0lO4gpMUtFFxCYoxS0UxWEIpMUpoouISkp1IaLisJRRRTCwlFFLQSNo5paDRcQlPjjLngfhToIi7DFdBo+kNMynBrixeMhQi22ePmWZ08LBtsj0XSnndSV4r0bR7EW0QAGOKj0jTkto1O3mtgcAAV+f5pmUsRJpPQ/IM8zmeNm0noKD2pRSYpa8M+ZYoPNLTaWgkcKM0nSmyOsaM7sFRRkk9AKQ4wc3yozfEutW+gaPNf3TABBhF7s3YV8t69qlxrGqT3t05aSVifp7V1vxU8Wvr+rG2tnP2G2JVAP4j3NcFVJH6pw7lKwVH2k170hKKWjFM+kCgAk9Ca6Hwx4R1bxHOF0+2Yx5+aVuFX8a9o8KfC/S9HKy6gRf3Q5ORhAfYd6VzyMwzrDYFe+7vseO+GfBGs+IHU2lsyQE8yyfKor1bw/8ACHTLMK+rXDXcvdE+VQfr1r02KNIUWOJQiDoqjAp+MHPT60mz4TH8VYnENxpe6jN0zR9O0tAljYwwgdwvP51pZNLxn3oBpHzVTE1ajvKTYgLZ74ocCRSrqrqRghhkGnc0fWghVpx2Zwvjb4eaZr1rLJZ26W2oAZVoxhWPoRXzlqVlNYXs1rcoVliYqwPY19jtxyOtfPnx406O18UR3MShRcxB2x3bvTTPvOE82q1ZvDVXfseYYopaKs++EopcUlABRRRTEFJilooAbRTqTFACUUUUAFFFFABikpaKAEooopgFFFFAC0UUUgCiiigApaMUtACUtFFABRRRSGS288ltPHNCxWRGDKw4IIr6Q8A+Jo/EuiJKzqL2EBZ0Hr2b8a+a66HwT4im8N63FdxkmInbKnZlPWsa1P2kTys2wCxlFpfEtj6Zzk9sUfnUVpcQXtrDdWsgeCZd6MO4qfIry2raH5nUpunJxluhKSlzRinczsIc9OKTFOI4xSYppgJ0/wDr0Y4pcUfjVpgNpRzSdKUmqTFYMUcUdaMUwEJoooqkxCY55oxS0VSYgpPxpaSquKwlJS0VSY7Df50dqXvQaq4WENNI5p2KQH5sUwsI6lh71n6hZiRTxWkKRwGFb0azpu6OrC4qeHmpRPPtW04xsxxWKylTgg16TqNoJVPGa5LU9OKE4FfZZbmSmlGR+tcPcRRrRVOo9TCFLSshQkGm5r6OMlJXR95CamroXFJS0VaKCilpKoQUUUZoEJiiloppgJRS0UxCUUtJincQ2inUU7kiGkpTRincBKKKKBAaSlpMU7iCijFFAhMUUtJimmISilxRRcQmKSnUhp3EJRRRRcQUmKWimmKwmKSlop3FYbRinUnFFxWExRil4oouISgigUHpQIQ1JDC0jDApYYTIwxXTaHpLSsp2+/NcGMxkaEbtniZpmkMJB66jdF0kyFcrxXdaXYLAi8cj1p2n2SW6DjmtEAAe9fAZjmUq8mkfj+b5vUxc2k9BVGOlOApKXNeLd7s+deotFFLQIBS0lLimIM4rg/i7fXtr4ceOyDBZOHYeld5iq97ZQ3tu0NzGrxsOQRSOzL68cPXjUmrpHyG3JyetNxXsXjT4WSNI1zoQDBuTCT0+lc/oPwu1u+vFW+jFpbA/NIxycewqj9Vo51g50vac6Rw1lZXF9cpBaQvLK5wFUZJNexeC/hKqCO78RtluGFqp/wDQj/SvQfDXhjS/DluI9OgHmkYaZuXb/Ct0545pNnyGbcVTq3p4XRdyK1torO3S3tIkhiQYVEGAKk6fWnKeOaBjvSPjalSVR803diryMnrRSGimZh3paTJzSigVhwPFO4PWmUuaRNhSMivEv2hlH2nSj38s8/jXthJFeH/tCTZ1DS4u6xE5+poW59Lwon9fj8zx+ilpMVofrIUUUUAGKSlozQAlFLSUAFFFFMQlFLRQA2ilxSUAFFFFABSUtFACUUUUwFooopAFLRS0AFFFFABRRS0hhiiiigQUopKXFAz1X4O+Lfs840O/kAglObdj/A57fQ17LznDZzXyTE7RyK8ZKspyCPWvor4deJl8R6GvmsPt1sAkw7t6N+NcGJpfaR8dxDln/MRTXqdZmkbikDZOaDh2rjR8c0LnFGKCPT86APWqTJEpO9OHWgj3p3GJSYx2paMfSqEGKSilxxTTEJ/OilxQatMTG4opTQRTAQUHFHakNWmKwpIpM80UHpTTCwlH40UlWFhTTdvOaU4op3AWmn2pTSU0wEIyDms/ULNZUJxWh160MMjBroo1nTldHVhsTPDzUos4HVNOKMSBWI6lGwa9Jv7ISKeK5LU9NKMcLX2OW5mpLlkfq/D3EUasVCbMIHiinOhjYgjimivoozUldH30JqaugopcUYrRMoSjvS4oxTuISg0uKMUXASkp2KQiquJiUUuKTFO4gpOadSU7iYlGaWkxTuIKO9GKMUXEJRS0lMQUUUUCD8KQ0ppKdxWCkNGKMUXFYM0maWimIQ0lOxQRQIbRilxRincQhFJTsUEUXEMxRT8UmKLisNoxTsUhFO4hp6VLDE0jdKWCIyPXRaJpRkYErxXDi8ZGhFts8bNMzhhIPUXRNKMrrla7rTrNYI1wozSabYrBEOBnFX+g4FfAZjmMq8mk9D8dzfNp4uo7PQUdafmm9qWvHbufPvUcDS0wUtImw6lzTaCfemFh9GaZmnUXJsPzRmkopCsLuxS5P4U2gdKAuKDSkZ5pKWgQA04GkpR70CDrS0YFFBIUo6UlLnFAmhTSjNNLHNG4mkKzHE46dK+c/jdqH2zxg8K9LZBH+PWvoLUryOwsLi7nYCOFC5yfbpXyVrl/Jqeq3V5KfnmkLH8TTifccG4RupKu9loZ9FLRirP0QSkxS0UAJRilpKAEopaTFMAooooAKKKKYBSYpaKBDaKU0lABRRRQAUlLRQAUtLRQAUUUUAFGKXFFIYUUUUAFFLiigAoopcUgCt3wfr1x4d1mG8gJKg4kTs6nqKw6BSaurMipTVWLhLZn1dYXcOo2UN5aNugmUOpHp6GrQHevF/g94q+xXf8AY17IRbTt+5Y/wP6fQ17QOpHcV5NaDhKx+bZrgJYSs10ewtIelFFZ3PJsJS0cc0DrxVXCw0ilpaTNNMLB70lLmk/lVIVhaTNKTxScVSYWuH4UlKaMVSYrCUhNKR6dKCKpMVhpoAopaq4WG0U6kxVXCwmKQinYo607gNpCOafimkU0xBj5aQj86cKSqTAZgGqN7aLIp4rQ7mkYAjGM1vSrOm7o6sNiJUJqUWcNq2mbSWUGsGRGjYgg4r0u8tVkQ8CuV1XTdrMQK+ty3NL2jI/UeHuI1NKnUZzgNKeafNEY2INMHWvpYVVJXR+g06saiugpKdRWlzQbRTs0U7iEpDTuKSncTEopcUYqriEoNLiimmIbSYp1FO4huKKWincBMUUtBp3FcbijFLilouIZRTqKLiG0lOxRincQn4UlLS4p3ENop2KSi4htFOoouKw2iloo5hCUmKdSGi4mN7U6NC5GKVELsAOlbekaa0rjjiuXE4uNCN2eXmOPhhabbZJo2mGV1+Wu70uxWCIcc03S7BYYxkc1pgYHFfAZlmUq8mlsfjmdZvLF1Gk9B2Ow6UtJ24oFeLe584xRRigUtBNhMfSlFAooAKDS0tO4iMU8dKCKVRxSBjhnFLSDpS0EWFoH1pBS0CsLRSClNArAKdSAj0ozTCwtFFFILC0q9803FKKRNhWyORSZwOetLzVa9uY7O0mubhgscSl2J7AUGlKm6klFdTzP44eIvsumw6PA/wC8uP3kuD0XsD+NeFEVteLNXl13Xbu+mJPmOdo9F7CsaqR+xZRgVgsNGmt+o3FGKdRiqPUG4opaKBDaMU6koAaRSU+kxTENpKcRikoASilxSUwCiiimAUhpaKBDaKWkoAKKKKAHUUUUAFKKBSUhi0UUUAFLRRSAKKWloGJS0UoFIBMUoFLRQMfG7RuroSrKcgjsa+hfhv4mXxBoirMwN/agJKO7Ds3+NfPAFbfhLXJ/D2twX0GSqnEidnU9RWNanzxseZmmBjjKLj1Wx9Njn8KQ9cdqgsbyG+soLu1fdDOodT7Ht+HSpzzXku6dmfm1SlKnJxkIetGOKMd6UCmmZWEoPPXiloxTTCwlHWlwKQVSYWEA5pcCgijp3qkxWEx70YpeaMVVxWG9KM0vFIapMLB1pDS00+oqkxWFopKM1SYWA0CjPrR3pphYKKKCKdwsIRSGlIpKaYWEopaQ9KpMLCEdqp3dqsqkY5q3g0uPatqdVwd0dFCtKjJSicZqumFScCueliaNuRivS7u1Eqmua1XTOSQK+qy3NPsyP0vIOIrpU6jOVHIpcVNPA0Tn0qIGvqKdVTV0folKrGpHmTExS0tFaXNBCKTFOoNO4DcUU7FJVKQhKKWkppiEpMU6iquITFJilozRcQ2inUlO4DcUYp1FFxDcUYp1FO4huKDS0uKLiG0lOoouIb3op1FO4huKMU7FGKVxDKKdRimmIbQqljgUuMkAda1dLsDK4449a58RiY0Y3ZwY7GRw1Nykx2k6e0zjjNd3pNgsKAlRmo9I01YkUkYNbCrgYAr4TNMzdaTjE/Ic8ziWKm4xegqjb0pRSqpIpF4614Tdz5Z6jhS5pBS0iGhRilFNxQKYrDqWm8+lFArC0tNzTs0XE0KMUopopRRcmwvNOptFFxWHUtNHvS0BYWikFLmi4rC96WmilHWi4WFBoJzRRSuLlFFOGaZ3pc+tK4nEUnnFeV/G7xEbXT4tGt2xLOA8uD0XsPxr0fVL6LTtPuLy4YLFChc/h2r5e8R6rNresXN9cE7pWyB/dHYU0fXcL5Z7at7ea0j+ZkYoxTsUYqj9JsMIpMVJSYp3ER0U/FJincBuKSnEUmKLgNxRS0UwEpCKWimIZRTiKbigQlFLSUwCiiimAUlLRQIbRSmkoAdSikFKaQwooooAKWiikAUuKMUtIYUoFFLQAUUtKBSGJilAp2KAKVwExS4pcU4ClcZ6j8HfE3kTNol6/wC6lO63Zj91+6/jXr/TIPBHUV8qQSPDKksTFXQhlI7GvofwL4gTxDocczEC7iASdR6/3vxrgxVL7SPj8/y2z9vBep0Z4HHegUufpR1riTPkrBRzRRVJhYTH5UZpaMVSYco3rR9acaSquLlEoooqkxcomKMUc0fWqTFYaRRinU38apMTQYoxS0hzVJisFFHFGKdwsJRQaKq4WE/CjmlpBRcOUT8aMUtIfancdgxzR3oxQV4p3HYbjB9qrXcAkQjFWgmOtGOa1p1XB3RvRqSpSUonJanpvXC1ztxA0bHIr0meBZFOa5/VNNzkgV9Pl2a2tGR+iZDxDa1OozkKXj0qzc2zROciq4r6mnVU1dH6LRrxrR5osT8KKdijFapmwyinYoxVJiG0lPxSYqrgNpDT8UmKakIbRS4oxVcwhtFOxSYp8whtFOxRii4DaKdijFPmENx7UU4ijFHMSNxRxTqTFLmASjFOwaMUuYVhuKMU6inzCGY4oIycCnYz0q5Y2plkUAVlVrqnG7OTFYmNCDlIdp1k0zrwa7fR9P8AKRSVqLRdOCKCV5roEUKMV8TmmZuo3GLPyjP85lXm4RegIMCnd6XigAV865X1Z8c9Xdi9qQCiilcnlFFLSc0oNO5NhaKKKq4rC8UUlLRcmwUUYoAouFh2KKO1HFFybC0tNFOAouHKANOplOBpXDlFpabSii4uUWgZpM0DmlcOUWlo5ooDlFHXmmucKTStwOaydYvRBbt83PpWlGm6slFG+Hw7rTUUcD8ZNUlfSYrO2J8tpP3uO+OleL4r1XXJReSOJOQ3HNefatpxtZCy8xnoa9nG5TOjTVWOx+u5XgfquFjFIysUm2pNtJivEudthmKTFSYpCKdwI8UhFSYpMU7isR4oxT8U0ii4DCKTFSYppFVcQykp1IRTASkNLRQIaRSU6kIpiG0UtJTAKKKKYBSGlooELQKSlpDCloopAFKKBSikMBSiiloGFKBQBTwKVwEApQKXFLUjExSgUoFOApXGIBS4pQKcFpXGNArpfA3iCTw9rcc+SbaT5JkB+8p/wrnsUYqZLmVmZ1aUasHCWzPqWGWOaFJoWDxSKHRh3BHFS4x1FeafCLxEZ7f+xrt/3kYLQEnkr3X+tel9R1ryKsXCVj85zHBSwtVx6B2o60hoGKhM8/lFNJmjikqkw5QopaQ1SYuUKKOTRVJisIaTFLSE+lUmS0GBSYpaTmqTFYTJop1HaqTCw3jPajrTuKSquKwhox7UtFO4WG4oxS0Yp3HYSilo7U7jsJR9aPxoouPlEpMUv40fjTTCwmKhmhDg55qcjv3oNXCo4u6Nac3Td0c3qmmg5IHNcxdWzRMeDxXo00SyKcjrWFqWnBskCvo8tzRxajI+8yLP3BqE2ccKXFWrq1aJjxVYe9fW0q6qK6P0jD141oqUWJikxTqK2UjoGUYp+KTFUpCGYoxTsUGqUhDMGjFPpKq4DcUmKfijFO4hmKMUuKMUXENxRT8UUXAbijFOxRii4huKWloxS5iRtFOoxRzANIFAFOIqa2gMjjis6lVQV2YV60aUeZi2luZHAxXX6Npu0BmFQ6Npv3SRXTwQiNQK+QzTNHJuMWfmfEGdOpJwgxYUCKAOKmHNNwKUV8xKbk7s+GneTuwpRSY96UUrmfKHelA9KSlp3E4i0YpKKdyeUXFFANKKdybCc0oopRincmwUopOKXFFxWAUtIBSii4rBilAooBoFYUClBpAaBSbCw6koo5pXHygeaFpRQcUXHYXPFGRSZpjOFUkmhasap30RHdT+VGxJ6VwfiPUvMZlDcVreItT2gqretcLeTmVzkk19Vk2Bu1OSPueHMmc2qs0Vpm8xyc1VuYUniKOMg1YxTSOa+wlCM4cj2P0qNJRjynFahZtazFSDt7GqZFdzf2yXMRVxz61yN5bNbylGHSvgs2y14WfPH4WedWoum/IpkUmKlIppWvEuYEZFNIqUikIp3ERYpCKkIpuKdxEZFJUhFNIqrgMIppGKfSEU0ySM0hp5GKaaoBKSlooEMNBpxGabTEJRQaKYBRRRTELSikpakYUooFKKQwFLRS0DClAoAp4GKlsAAxSigCnAUhiAU4ClApwFJsYgFOApQKcBU3GJilApwFOAqbjGgU4CnAUoWlcdifTbubT76G6tmKTRMHU19C+G9Yh1rSob2EgFhh1/ut3FfOoWvSvhvLNptvIsjfu5mDBfQjvUSw7r/CefmGV/XqfurVHqoNGKhtZxKgIxzU30ryZwcJWZ8DXw0qMnGSDFBoxRUpmHKGKMYoNJirTFyh7UUtJVJicRO1GKXNIapMlxCk70tHFUmTyjaKWkwapMXKFBo5oqri5QozR3NGKdx8olFKRik4p3HyiUvFBoouNREwKXHNFFHMNREx+dIetO/Gg0+YpREAoHpRS0XDlGsKjkiDg8VKwNNPWtITcXdGlNuDujB1LT1YHA5rmLu0aJjxXoTxh856VlajYK6kgV9Bl+ZuD5ZM+zyTPXRahNnEYxwaUir95ZmNjxVLbjg19ZRxEaiuj9HwuKhXipRY3FJin4pMV0qR1DMUYp+KTFWpAMxRinEUYqlIQ3FJinYoxT5hDcUmKeRSYp8wWExSYp+KTFHMITFGKdijFLmENxRinYNAFLmEIBQRTsUoUsQBUSqWV2TOSirsIYjI3eum0TTclWYCq2kWPmMMjiuvs4BEgGK+YzXMrLliz8/wCIc4tenBj7eIRIAKmHSgdaUHmvk51HJ3Z+e1G5u7DFFLRUXM+USlFFFFxcoZpaMUU7k8otFIKWquS4i0UmaWnchxFFL3puKOaaZLiOopvPpS59qdxco6lzTaUUXFyi0uKT8aWlcXKFFFLSuPlAHmlJpKMcUrj5RRjmikPWkJxSuNRFLYGaxtavxFGwB5q1f3YijJJrh9avmlc4Netl2Edaab2PoMmyqWJqJtaGdql200hJP61lEc5NTSEsaaVr7vDwVKCSP1nB4WOHpqKRFijFP20hFdKmdYwiqOpWS3MR4G4dDWhigrmsq9KFeDhIznBTVmcHPC0UhRxgioiK6rWbDzkLoPnH61zLoVYg9RX59mOClhKluh5VWk4OxCRTSKmIppGa89MxsREU0ipSKaRVXEREU01IRTSKpMCMim1IaaRTEMIplSU0iqRIw0hpxpKoBKaRTqSmIbSUpooEJRRRTAdRRSikAU6kFOFIYUoFApyikxigYpRRSgVIxQKcBQBTgKlsYAU8CgCngVLYxAKcBSgU4CpbKsIBTgKcBTgKlsdhoFOC09Vq/plg97cKijjufSiKc3yo0p03OXKiz4f0s3cokkB8lf1NdpFmNl28Y9KS1tkt4VjiGFWp9lfSYWhGjCz3PrMJgo0adnuzd0i/K4VjXTwTCRQRXA27FGBrpNKvOisTXhZnhU/eifE8Q5GpN1II3s0U2Ngyg07NfNt2dj8/qYWUHZoBilOKSjFNSMXSaCiikq1IzcLC0EZ6UlFUmQ4iYopaTNWmTyiY9aMUtGKpMlxENJTu1Iaq4colGKWijmDlExxQRQaTmncfKLRmkpcU7jUQzSUv0o/GlzFqAlBxRQBS5zRU2xPwpaB1oxR7RFKixPwoPHalxRin7RD9gxpx6Ux0DA1KO9IBWkKttgUJQd0Y2oWIkBIHNczfWjROeK7yRQRgiszULIOpIAr3cvzJ02k2fU5NnEqElCexxHfBoxWhe2ZRiQMYqjgg4r7ChiI1I3R+kYXFRrx5ojMUYp+KTiulSOoZig0/FIRVqQDMUU7FGKrmENxSU/FGKOYBlFPxRilzCY3FGKdiihyEJilIpcUYqHMTGgbjgVo6famRwMVFZ25kccV1ekWWwAkV42Y49UotI+YzrM1Qg4xepb060EUYJFaIpFXAwKBXxNfEOpK7PzCvKVebkx1AooFc/OjJUGLj2oxQaKOcXsGFFGfeimpkOk0LS02lq1IycB1FNozVJkOI+koBozTTIcRaM0cUVVyXEWj/AD1pMUYouLlHCikFLRcXKLmjNGKKGw5RaDRSZxU3Gojs0E00nmlPHGaTZSgOBqC5lEaEk09mCisDWr7apUGt8NTdSSR3YLBSxFRJIzNb1HdkA1y9xIXcmrd7KZJDVYR19tgqcaMT9XyjLY4amnbUrAe1Jt9qteXSeWa9D6wj22irj2pCtW/Lppjo+sIViqVoK+lWfLpDHVrEImxUZMjmue1vTyp82McHqK6vyz6VHLAJFKkZBrix9KGKpuL3MatLnR56UNMK1uajp5t5TgfKelUGhPpXwVWLpTcJHlyg4uzKBHtTCKuvFULpikpXM3ErEUwipmWoyK0TJaIyKaakIph61SEMIppp5ppqkSRkU01IaZVIQhpKWkNMQ00lONIaYhpoHSlpO9MB9LSClFSMWlopRSGKBTqBSipGKBTgKAKcBSYxQKeopFFPAqGxigU4CgCngVDZQAU8CgCpEXNS2UkIq1IqVJGnpVmKHPaspTsWo3GW9u0siogyScV3Oj6ctnbqMfORljVbw5pe0efKvJ+7XSxxcdK9DCWpr2ktz6LLcIoL2ktyusdPEVamn6XdX0nl2dtLO/cRqTj6+ldbpvw51e5Aa58i0U9nbc35Dj9a1qZgejUxNOn8TOBEPpVm2JRhivWLP4Y2aD/S7+eQ/wDTNQn881pxfDzQkxuS4f8A3pT/AEriq4znVmedXxtCouV6nmlhcblANaAORmvQR4E0Rf8AVxzp9JT/AFpsngixx+5uLlPqQw/lXh16MpO8T5HG5bTqy5qZwGaK6288E3KZNpcxyj0cFT/Wufv9LvdPP+l27xjpuxlT+I4rjanD4keHWyuUehT6CikNLVRqXPLq4NxEo70tJW8Z3OCdFoMc0lKODRzWikYuA2jFLRiruRyic0YpeKKq4co3FKBS0mOaLhyhQaXFHFFx8o00dqXFFDkaRp3EopaKylVsdlLCuQlGKUDJAAJJ6CtrT/DOp3oDLB5MZ/imO39Ov6Vl7Ry+E9Sjl0p7IxKK7i18DDGbq9Of7saf1P8AhWjF4N0tBhvPkPqz4/kKpQqM9CGUSe55sRRXp3/CI6Rj/Uyf9/DUUvgzSnXC+fGfVXz/ADBp+zqI0eTs82pK7i68DcZtL3n+7Kn9R/hWDqHhnVLIFmt/OQfxQnd+nX9KLzjujkq5VOPQxMU10DDBFSFSDgjBHUGkrWniLM8yphJQd0ZGoWQdTgVzV9aGNjgV3TqCMEVmahZCQHivosuzNwaTZ7OVZnPDyUZPQ4nHOD1pcZFX76zMbHAqjjBwa+xoYiNSN0foWGxMa8U0xmKMVJg0mK6lI6hlJin4oxVcwDMUYp2KNtHMIbijBp+KMUuYQzbS4p2KXFS5ANxT4oi7gAGlVCxAFbOmWZdhxxXBi8ZGjFs8/H4pUINlvSLL7pIrooUCKAKitYRGgFWRXweOx7qyep+bY2U8VUbCipbe3muZNlvE8r/3UUk1u2XhHU7gBpVjt1P/AD0bJ/IZry/aylsFHLJS2Rz1Fd1beB4Fwbm8lc+kahf55q8ng7Sl+8J3/wB6T/CjlqM74ZNLqeb0V6U3hHSSOIpV+khqvN4KsG/1c9yh+oI/lRyVEVLJpHn1Fdfd+CJ1ybS6jk/2ZFKn8xmsDUNHv9Pybm2dUH8a/Mv5ijnnHdHDWyqcehn0tJRWsK1zyquCcegtAoorojO5586LQ6ikzS1qmcziFFFGadyHEMmlyaSlzTuLlFzRSUUXFyjqKKM0rhyi0UlHapci407js8c00mkyar3cwRD61Cld2O7D4N1JJIr6jd+WpGa5K+maVzWjfztIxAPFN03Q9Q1R8WNnPOM43Kvyj6noK9jCzjRXMz9EyXKI0IqczCEJJziniGvSdM+GGpzKGvbi3tQf4R87D8uP1roLX4W6eoH2q+upD/0zCp/PNdE82S0TPpXXpw0ueL+R7UfZ690X4aaGB/rL0/8AbQf/ABNL/wAK10P+9ef9/B/hWLzcn61TPCfs/tR5HtXu3/CtdD/vXn/fwf4Uf8K00L+9ef8Afwf4Uf2uL61TPCDb037P7V7z/wAK00L+9ef9/B/hSf8ACs9C/vXn/fwf4VX9sC+s0zwY2/tSG39q96/4VnoX968/7+j/AAo/4VloX968/wC/g/wprORfWaZ8+XtgJ4irDntXMXFiY2KsORX1QfhjoJ/ivP8Av4P8KrXHwk8Nztl2vs+0o/8Aia83HYmOI96O5z1ZU56o+U5rbHaqM0WO1fWL/Bfwu/V9R/7/AC//ABNfNviiwisNd1K0g3eVb3MkSbjk7VYgZ/AVxQm1ucsoo5SRMVAwq/OuCapuOa7IO5zyViA01hUjCmGtkQRmmmnkUw1QhpphqQ0xhVIkaaSlpKoBppKcabTEIaDS0lAh9OFNFOpDFpyiminipYxRTgKSngVLGKBTgKQCnqKllDgKeBSAU8CobKQqingUgFSotQ2UkKi5qxHHmkiTOKv28OawnOxpGNxIYc44rc0bTTcTrkfIOSajs7QuwAHWvbfh78OpLm2iudUDQWpwwQcPJ/gP8+9c8Z80juw8IxfPPZHOaBoF5q0wg0+3L7eC3RUHua9Q0H4c2FoFk1OQ3cvXYPlQH+Z/zxXZ2FlbafbJb2cKQwqOFQYqxW06rkbV8fOfuw0RFa20FpCIrWGOGMdFRQoH5VLRRWRwNthRWXqHiDStPYrd30KOOqBtzD8BzWRL4+0JM7Zpn/3Yj/Wg1jQqS1UTq6K5BPiFopPJuV+sf/160rLxbod2wWPUIlY9pAU/mBQEsPUjq4s3aGUMCGAIPBB70iOsihkYMp6EHINLRuZNdzntV8KWN7ueAfZZj3jHyn6r/hiuK1jRLzSnP2hN0ROFlTlT/hXq1NkRJUZJFV0YYKsMgiuaphYz1WjOSthIVVtqeMUgrsPEnhQwhrnTFLRjloepX3X1HtXIVwvmpO0j53F4BwewUhFFFbRlc8OrR5QooorZM53AKKKKq5PKIaQ07FFO4+USkpc0VLkaQp3DFJilqaztZr24SC2jMkr8AD/PSsJVOiPTw2Ec3sQgEkADJNdLovhG6vNsl5m1g9CPnP4dvx/Kuo8O+G7fS1WWYLNeY5c9F/3f8a3q1p4e+sz6bDZdGCvMz9N0ax00D7LAocf8tG5Y/jWhRRXWoqOx6aioqyCiq11f2drkXN1DER2ZwD+VZ0vinSIzj7XuP+yjH+lS6kVuxOcVuzaornv+Ev0nOPMl+vlmpovFOkSHH2vaf9pGH9KXtoPqL2ke5t0VWtb+0usC2uYZT6I4J/KrNWmnsWmmZ2qaLYamp+1QL5mP9YvysPx/xriNb8JXdkGltCbqAckAfOv1Hf8ACvSKKznRjI562Gp1VqjxJgaYy5HSvUPEPhm31MNNBiG767gPlf8A3h/WvOb6znsbh4LqMxyr1B7+49RWCcqT1PAxeAdLVGJfWYcHgVzd9ZlGJArtnUEc1n31mHB4r6HLszcGk2bZdmM8NJRk9DicEcGjtWjf2Zjc8cVnkYODX2VDERqxuj77DYmNeKkmJRinUmK6eY6hMUlOxRijmENpadijFDmA3HFPC54pQtW7WAuwrkxGIVON2ZVaigrsfY2u9hxXU6fbBEHGDVbTbUKASK7jw14Ym1LbNcbobP1/if6f418PmWPlWlyRPkMdUnip8kTHsLG4v5xDaRNI/oOg9ye1dppPguCILJqMhmfr5aHCj8ep/SunsbK3sIBDaRLHGPTqfcnvVivMjR6yChgYU9ZasitbaC1jEdtEkSeiLipaKK1skdySWwUVTvNUsbLi6uoo2/ulsn8hzWZJ4t0lTxNI/wDuxn+tS6kVuyXUit2b9Fc4PGOlk/8ALcfVP/r1ctvEmkzkBbtUY9pAV/U8UlVg+olUg+pr0U2N0kQNGyup6FTkGnVejL3MPVfDGn3+5lT7PMf44hgH6joa4nWfD97peXdfNg/56oOB9R2r1KkYBlIYAgjBB71nOinqjkr4OnVW2p4vS123iPworBrnSlw3VoB0P+7/AIflXEsCpIYEEcEHtWKlKm7SPmsblzpvYUUd6SlrrhO54FWhysXPFLTaWtUzkcBcUYoop3J5QpeKTFGKLhygKXNJ3palyKjC4UE0GmMcDNc86h6GHwrmwkcKOajstJ1DXpzHYRZQHDyNwi/U/wBBzXSeG/C76rtub/dHZ9VUcNL/AID3/wD116Fa28NpAkNtGsUSDAVRgCnTvufZZdl8aSU5LU5LQvAGmWO2W/8A9OuOvzjEY+i9/wAa7CONIkVI0VEUYCqMAU6itXJvc9pybCigkAc8Csm88SaNaEifUrYMOqq4Yj8Bmkk2Ci3sjWorm28ceHVODqI/CGQ/+y03/hO/Dn/QR/8AIEn/AMTT5JdivZT7HTUVzP8Awnfhz/oI/wDkCT/4mj/hO/Dn/QR/8gSf/E0+SXYPZT7HTUVzP/Cd+HP+gj/5Ak/+JpP+E88N/wDQR/8AIEn/AMTR7OXYPZT7HT0VzH/CeeG/+gj/AOQJP/iaP+E98N/9BH/yBJ/8TR7OfYPZT7HT0Vy58feGh/zEv/IEn/xNIfiB4ZHXUv8AyBL/APE1SozfQPZz7HU18Y+OR/xVWtf9fs3/AKMavqJviJ4WUZOqf+S8v/xNfKvi+6iuvEWqXEDb4ZbqWRGwRlS5IODz0NTOjONnJWE4uK1OZuB1qjJ1q7Ock1Tk6100zlkQtUZFSmo2rZGZGaYakamtVokjNNPSn001QhhpDSmkqhDTSGnGkpiY2g0UUxDx0paKUVJQ4U4UgpwqWMUU8U1aeoqWMcBTwKQU8VDKFUVIopFFPUVDZSHKKsRpUca1cgTJrGcrGkUTW8WTWxZ2+ccVXs4c44r1j4ReDBr2o/bb5M6basNwI4lfqF+nc/gO9cFSbk+VHTCKSuzoPhJ4AWRIta1qLMZ+a2gcfe/22Hp6Dv16dfZ6AAAABgDoKK0hHlViZScgpJHWNGeRgqKMkk4AFU9X1O10mye6vZAka8Ad2PoB3NeO+K/Fl5rkrJuMNkD8sKnr7t6n9KtJvQ6cNhJ13psdt4g+IVpZs8Olxi6lHHmE4jB9u5/zzXAav4p1bUywuLx1jP8AyzjOxcemB1/HNYLSVGWrpp4dvc9yjgqdLpqTmT3pvmVAWpM11LDxR2ctiwJKUSVXzRk0nh4sTibek63faXJusbqSIZyVByp+qng16F4d+IMc5WLV4xG3Tzoxx+K9vw/KvJA1TQylSK5K2GcdYnDiMHGor21PpGCaO4hWWCRZI2GVZTkGn14v4W8R3OkzgxNvgY/PEx4b/A+9euaVqNvqlmtxatlTwQeqn0Nccal3yvc8CrTdN2ZcrjfGHh0Mr39gnzDmWJR1/wBoe/rXZUUVaSqKzOapTVSPKzxWgGun8aaKLG5+2Wy4tpj8wH8Df4GuYFeXrTlys+YxuE5Gwx1opaT8a3jI8SdOzDvRS4pKtMz5QpKWkxT5hqAUUvfikrGcz0MNQ5mTWdtLeXMcFuheVzgAV6h4e0WHSLXauHuGH7yT19h7VT8H6KNNsxPOv+lzDJz/AAL2X/Guhrpw9Gy5pbn1mEwqpRu9woorjfFHinyme00tgXHDzDnHsv8AjW1SrGmrs65zUFdm5rWvWWlKVlfzJ+0Scn8fSuG1XxNqF+SqyG3hPRIjj8z1NYjszuWdizE5JJySaSvNnXnV8keVXxreiAnJySSTSUtHFQoHnyxEmJRS0n50+RE+2kKCQQVJBHORW3pfifUrEhWl+0RD+CXn8j1rDoppSjrFnRTxconqmi+IbLVQERvKuO8Tnk/Q962K8TBKsCCQRyCOoruPCviguyWeqPkniOdu/s3+NdVHE3fLM9ahilU0Z2lZXiDRodYtCj4SdR+7kx0PofatWiuyUVJWZ1SipKzPGLy1ms7mSC4QpKhwQarsuRXp/i/RV1OyM0K/6XCMrj+Md1/wrzE5zXHd0ZWPnMdhPZu6M6+tFkU8c1zl9ZlGJxxXZsM9aoX1oJFPFfQ5fmDg0mystzOWHmoyehxeMHBpcVoXtoY2PFUMYODX11DEKpG6Pv8ADYmNeKaG4pcUuKK35jqEpQKUVIi5NZ1KnKhN2HRRl2GBW7plp0JFVtPttxGRXdeDNBOqXgDgi2iw0h9fRR9a+SzTHuT5IngY/Eub5Imp4L8NC823d6pFqp+RD/y0P+H869GUBVCqAAOAB2pI0WNFSNQqKMAAYAFOrxYxsclOmoIKCQBknAFQ3lzDZ27z3MgjiQZJNec+IfElxqbNFAWhs+mwHl/97/Cs6tZU/UVWrGmrs6fWPF1pZs0VoPtUw4JBwg/Hv+FchqHiLUr4kSXBjjP8EXyj/E/jWRRXHKc6m7PIr45vRCnnr1ooopKmjgliZMKKKWn7NCWIkWLK9ubKTfaTyRN/sng/UdDXV6R4zYFY9UjBHTzoxz+I/wAPyri6WknKn8LOyjjZR6nslrcw3UKzW0iyRt0ZTmpa8k0jVLnS7jzbZ+D95D91h716Xouq2+rWnmwHDjh4yeVP+HvXXRrqej3PZo141UaFcv4s8PC9VryyQC6UZdB/y0H+P866iitpwU1ZmlSnGpHlkeL4IJB60tdd440URMdRtlwjH98o7H+9+NcgK5Ytwlys+Tx+D5Gx1ApBS11xlc8CpTswxRRRV3MeUXiikoIouHKLmikpDWU52OqhR5mBNdP4S8Pi/Zb2+X/RVPyIf+Wh9T7fzrL8OaW2r6ksJyIE+eVh/d9Pqa9SjRY41SNQqKAFUDgCsaced8zPr8twKiueSHAAAADAFFFVNW1K20qxku72QJEn5sewA7mulI9xK+iLE0scMTSTOscaDLMxwAPUmvPvEXxHihLQ6LEJWHHnyghfwHU/jiuP8W+K7vXpirEw2an5IFPH1b1NctJJXZQwrnqz0qOESV5mxq3iHU9UJ+3Xksin+AHan/fI4rIaWoGemFq9SnhIo60lHRIsGWm+bUBJpOa6Fh4ILk/m0hlqA5pDmqWHgK5N5tJ5tQnNNINaLDwFcnMvvTTNUBzTTmtI4eBNyczVE8tRHNMbNdFPDwE2Ekma5rX4MN5q9D1rffOKqXkQliZGHBrbEYCNek49TnrQ54nDymqzVdv4DbzMjdjVJutfHypunJxfQ8eSsyI0xqkNMaqRmyNqYakNMNUhDDTDTzTDVokaabT8ZppqhDWpKcaaaYhDSUppKYElOFIKUVIxwp4po604VDGhwqRelMHWpBUsoctPUU1RUi1DKQ5RUqimKKlQVm2UiaJea0rWPJFUoF5FbNlHyK5K0rI3po2vD+mTajf21napunncRoPcn+VfWfh7SLfQtHtdPtBiOFcFscu3dj7k15D8BNCE1/daxMvyWy+TDn++w5P4Lx/wKvb656S+0zWb6BVbUr2DTrKW6unCQxrkn+g96s15J8TNfN9qH9n27/6NbH5sfxSd/wAun51tua4ag60+XoYHijX7jXb9p5iViXIiiB4Qf4+prAd+aWRqhJzXfQo2V2fT06ahHliKTmjk0AVMqZrolNQRpexGFpdlaml6Re6nJssbaSYjqVHA+p6Cunt/h1rEigyNaw56h5CSPyBrmliuxz1MTTh8TOF2UhWu/m+HGqopMc1o+Owdgf5VzureHdT0sE3tpIkY/wCWg+ZfzHFJYkUMVSnomYOKBwanZMVERiuiNRTRve5PbzFW611nhTX5NKvVlUloWwJI8/eH+IrjOhq1bTFSOa8/F4a/vx3PPxeFVRXR9F208dzbxzwMHikUMpHcVJXnvw11zLHTJ2+VsvDnse6/1/OvQq54S5keBODg7MhvrWO9tJbecZjkXB9vevJNQtJLG9mtpvvxtjPr6H8a9hri/iFp/EF/GOf9VJj9D/MflXLjKd4866HDjKPtIXOJxRRR0rkhI+UxFKzFBpPxpaK3UjicQPNJS0VLkaU4XYldB4L0z7fqglkXMFvh2927D+v4Vz9eo+ErD7BosIYYll/ev+PQflilRj7Sp5I+iy/D3d2bNFFZ+u6iml6bLctguPljU/xMen+P4V6UpKKuz3W0lcwvG2um2Q2Fo2JnH71weVU9vqf5VwNPnleeV5ZWLSOSzMe5plePObqy5meLiq7kwooop3scCi5sKMc1p6Rol7qrZt49sQODK/Cj/H8K62y8FWcag3c0sz+i/Iv+P61cKdSpsjtpYGUtTz6ivT/+EU0fbj7M2fXzG/xqleeCrKRSbWaWF+2751/x/WreGqo1ll7toee0Vq6xoV7pRzOgaHOBKnK/j6Vl1ndp2kcNXDODEooookrkU5uLO98E68bhRp94+ZVH7pz/ABAfw/UV19eLQyPDKkkTFZEIZWHYivWtC1FdU0yG5GA5G2QDsw6/4/jXXha3N7ktz38NW542ZfrzXxvpf2HU/PiGILnLADs3cf1/GvSqx/FtgL/RJ1AzJEPNT6jr+ma2rw5olYmkqkGjykikZc9adiisaNQ+QxNPlloZ97arIp45rnL218liTwK7EqCPas7VNOS7hZCOor28HmEqJ35ZmssPK0tjkcqP41/OjK/3lrJ1jTp7CdsbimaopI57mvbjmya2PuaGZKrFNHSqMngir1pbliDXKRyOSAGNdl4Ys5NgklJP1rkxmarlsiMXj1CGhvabaElERSXYgAAck17VoGmppWmRW6gb8bpGH8THr/h+FcN4A04XGqm4dcx2w3f8CPT+p/CvSa+bhJ1JOozyKN53mwpk8qQQvLMwSNAWZj0Ap9cL491cvKNNgb5Fw0xHc9h+HX/9VOrUVONzWpNQjdmN4k1uXV7vjK2qH92n9T71j0UV50U5PmkfP4mu5MKWkorRtRONQcxaWpbS0uLyTy7WF5X9FGcfX0rdg8HapKoL+RF7O+T+gNSnKXwo64YKUlsc5S107+CtQVcrNasfTcw/pWTqGh6jYAtcWz+WP41+ZfzHT8ab547oqWBlFbGdRSUvShSTOSVJwCrmk6jNpd6lxAeRwynoy9wapUtTJW1R0Yes4s9h0+7ivrOK5t2zHIM/T1BqxXnvgbVTa332KZv3M5+XP8L/AP1+n5V6FXfRqe0jc+hpVOeNxk0STwvFKoaNwVYHuDXk+tWD6ZqUtsxJVTlD/eU9DXrdcr4+0/zrCO8QfPAdre6n/A/zNTXjdcy6GGMoqpA4EUtJSippTuj43E0bMWikpa6LnnuIUUUUmxxjdgTUcjhRTnbAzVrwzaf2p4gtoGG6JT5sg/2V7ficD8awacnY97LcI6kkeheD9M/s7SEMi4uJ/wB5J6j0H4D9c1uUUV0JWVj62MVFWQyeVIIZJpmCRRqWZj0AHU14b408RS69qJcFktI/lhjPp6n3Ndj8VtcMUUek27YLgSTkHt2X+v5V5TK3NdmGo87uerg6NlzsZI9QE5pzHNCrmvchFQR2jMZpwTNWIoWd1VVLMTgADJJrtdD+Hep36LJdlLGI9pBl/wDvnt+JFYVcXGBnOcYayZwojNHlV7LbfDPS0A8+6u5W/wBkqo/kasf8K40T+9d/9/B/hXI8wOd4umeJeVSeV7V7d/wrjRP713/38H+FJ/wrjRP793/38H+FJZgxfW6Z4iYqb5Rr3D/hW+if3rv/AL+D/Ck/4Vvon967/wC/g/wqlmIfWqZ4cYj6U0wn0r3P/hW2h/3rz/v4P8KT/hWuh/3rz/v4P8K0WZi+tUzwow+1RtF7V7z/AMK00L+9ef8Afwf4U0/DHQT/AB3n/fwf4VrDNktxfWYHgMkfBqrKmK+hG+FugN1e9/7+j/4mvD9etEtNWvraLd5cM7xrnk4DED+Ve3l+ZRxD5YjjUjU2OM8QWgeISqPmXrXLOMGvQbiMMrKwyDwa4jU7c29yyHp2rjznCcslWjszz8VT5XzIomo2qQ1G1eEjiYw0w9Ke1MNWiRh60008001SJYw0004001SEIaaacaaaoBDSUtJTESinCminCoYxy08U1elPWpZSHLTxTRT1qGMkWnrTBUi1DKQ9amjFRrU8Q5FZSZaLtqvIrcsU5FZFqORXSaNbtcXMUUY+Z2Cj6mvPrvoddJXPpz4XaaNM8EacmMSTp9of3L8j/wAd2j8K6uo7aFLe3ihiGI40CKPQAYFSVpFWViJO7MrxRqf9k6Fd3YI8xV2x/wC8eB/OvAZ5CzMzElicknvXp3xevdsNjZKfvEysPpwP5mvLJTzW9GPNI9/LaXLT5u5Ex5oUUnepIxXot8kT1Nh8aV6F4J8Em+jjvtVDJanBji6GQep9B/P+eb8PPD66xqZluVzZ2+Gcdnbsv+P/ANevZwAAABgDpXm1Kjkzx8fjHB+zhuRWttDawLDbRJFEvAVBgCpaKKyPEu2FIyq6lWAKngg96XIooDVHA+MPA0VxG93o0YjnHzNAOFf/AHfQ+3SvLJYyrFWBDA4II6GvpGvMfijoKQSJqtsu1ZW2TKB/F2b8e/8A9erhNxZ62Axjv7OZ5qw5pV6091phOOpwK7eZSjqey7Gnpl3JaXMU8LbZI2DKfcV75p90l9YwXUX3JUDj2yOlfOSXESnl/wAq9g+FWpLe6FLbbstbSYA9FbkfrurzHyxqWR42YUo25ona1S1q0F9pVzb4yXQ7f94cj9cVdopyjzJo8hq6seLUGr+u2/2XWbyEDAWQlR7HkfoaoYrw4+62j5nGU7SYlOoIpO9bqR5LjqGKKWkNTKR0UIXZc0a1+26ra2+PleQbvoOT+gNeu1514BhEmuNIf+WUTMPqcD+RNei12YKPuuR9Tg4csArz7x/fGfUktFPyQLkj/aPP8sfrXoJrx3Ubg3V/cXBOfMkLfhmljp2io9y8TLliV8UCilrhjojwp+8xK6Twn4e/tJvtN2CLRTgDoZD6fSsXS7N7/UILWPgyNgn0Hc/lmvXLaCO2t44YVCxxqFUe1dGGpe1lzPZHpYPDr4mOjjSKNUiVURRgKowAKdRUdxPFbRGS4kSKMdWc4FenpFHpklFZH/CS6QZNn21M/wC62PzxitSGWOeMSQyLJG3RlOQamNSMtIsBZEWSNkkUMjDBVhkEV5x4t0D+y5RcWoJtJDjHXyz6fT0r0moL61jvbOW2mGUkUqfb3qK1JVI+ZlVpKpGzPG6Q1PdwPa3UsEo+eNyp/Coa82L6M+frU+SQldb8Pb4xX0tm5+SZdyj/AGh/9b+VckavaJcfZdXs5s4Cyrn6E4P6GiMuSakdeDnaR69QeRzRRXsbo9rc8e1e1+x6ndW/QRyED6Z4/TFUzXReO4fK8QOw/wCWsav/AE/pXO15sfdm0fM4+naTCkxS0orrjI8OSszM1bTo7yIqQM46157q2mS2M7cHbmvVCM1nanpyXcZBHNbRrOJ6uAx8qLs9jhPDtg11cKxHyivRbOEQxAAYwKo6TpiWS8DmtUVy4mq5HoVMV9Ynpsel+A7UQaEspHzTuX/AcD+X610VVdJhFvpdpEBjZEoP1xzVquimuWKR7dOPLFIr6jdLZWM9y/SJC2PU9h+dePzyvPPJLK26SRizH1Jrv/iFdeVpUNup5mkyfcLz/MivPK4cTLmny9jgx1S2gtFFLSvZHh25pCV0vhjw0+pYubsmO0zwB1k+noPeqPhjSv7W1JY3z5EY3yEenp+NepRosaKkahUUYAAwAKuhS9o+aWx7WDwytzSGWtrBaQiK2iSKMfwqMVLRRXckkemklsFFFFPRgcz4h8LQXqNPYKsNz12jhX/wPvXn0sbxStHKpV1JDKRgg17PXH+PNJV4RqMK4dcLLjuOgP4dP/1Vx16NlzxOLFYZSXMjhaWkpawTujwpR5ZArMjBlJDA5BHY165ot6NQ0u3ueNzr82OzDg/rXkddz8O7otb3Vqx+4wkX6Hg/yH51WHly1Ldz2MDU6HYVFeQJdWs0En3JEKH8RUtFeg1dWPSaurHjMsbRSvG4wyMVI9xTa2PF1v8AZ/EF0AMK5Eg/EZP65rHrgpuzaPlcfStJh3pwNNpa60zxJR1FJ5pCcCg1Xupwimmk5OyNcPRc5JIivLgKCM12fwotty6hesOSVhU/qf8A2WvNbqfc5r1/4YQiPwnE+OZZXc/nt/pW7pciufd4PB/V6HM92dZTZpEhieWRtqIpZj6AU6uf8e3RtPCl+ynDSKIh/wACIB/QmpR0QjzSSPGNd1B9S1O6vJM7pnLAHsOw/AYFZDnJqxMarN1r2cJGyue8lZWQ0DNW7K2luriOCBC8sjBVUdSTUCCvTPhFpCSXFzqcq58n91FnsxHzH8sD8TTxVflWhnVqezi5HUeDvCFroUKTTqs+oEfNIRwnsv8Aj1rqaKK8WUnJ3Z4s5ubuworOv9b0ywk8u7vYIpP7hbkfUVV/4SvQ/wDoJQfnS3BU5PZG3RWJ/wAJXoX/AEE7f8zSf8JZoX/QTt/zp8rH7OfY3KKw/wDhLNC/6Cdv+Zo/4S3Qf+gnb/mafK+wezn2NyisP/hLdB/6Clv+ZpP+Eu0H/oKW/wCZo5Jdhezl2N2isL/hL9A/6Clv+ZpD4w8Pjrqtt+ZpqnN9A9nLsb1fLviv/kYtU/6+pf8A0M19BHxn4dHXVrb8zXzv4knjn1zUZYXDxSXEjKw6EFiQa97JKU1UbaOnDRabuYk3Jrn/ABDbeZD5ij5l/lW/Icmqc6B1ZT0IxX2dXDLEUHBl1oc8bHBmo2q7qEBt7l07dqpNXwNSm6U3B9Dx5KzsNaozTzTWqUQMNMNPNNaqQhpptONNqiRtIacabVIBKQ0tIaYiUU4U0U8VDGOFPWmCnioZQ4VIvSmLUi1LGPFSLUa1KtZstD1qzD1quvarEPWspFxNOzHIr0H4eW4fXtPdhkfaIx+bCuBsRllHvXqfgiHyNV0lB1+0xE/99CuTk5pX7HqYOlzXl2PpIdKKKKZxPc8e+Kkxk8TbM8RQqv8AM/1rhpOprsPiZ/yNt3/up/6CK45+tdeGWp9ThFalEYOtWIh0qBaswjmtsRKyOiT0Pbvh1YrZ+F7ZsYecmZvx6foBXTVleFP+Ra0z/r3T/wBBFatecfJV3zVJNmb4i1WPRtLlu3XewwqJnG5j0ryDVdd1DU5Xa6uZCrf8s1YhB7AV3/xUONAt+f8Al5X/ANBavKGbmueonKVj1suoxcOdrU0dO1S70+ZZLO4kiYHOA3B+o6GvW/CGvLrtgzuoS5iIWVR09iPY14kG5rufhXMRrVzFnh4C35MP8aUE4SsaY6hF03K2qPUazvEdiNS0S8tduWeM7f8AeHI/UCtGiulnhRk4tNHzPe3AiyE5NZEsskjck1u+KbT7Lr+owYwI53C/TccfpisNxzXF9Yk9D25VZTSYsIyQSa9R+C8pXV76HJw8AbH0Yf8AxVeXxdRXonwfk2eKHH9+2df1U/0rGMv3iMK2tNntFFFFemeSeZ+Nk2+I7g/3lRv/AB0D+lYQzW/8Q3EXiNAf47dW/Vh/SsBTkcV4VRWqs8fH0nuLSZ5o70p9qtM8GUdRPSg0vQUzPNRNnVh46nZ/Dhc3F82OioPzJ/wruK4n4b/f1D6R/wDs1dtXp4P+Ej6egvcRBqDmOwuXHVYmI/I145XsGrf8gq8/64v/AOgmvIK5sf8AEjDF7BSUoFHauRvQ8iKvI6j4ewq+rTSn/lnEcfUkf/Xr0GuD+HX/AB/Xn/XMfzrvK9PBfwz3qCtBASACTwBya8m13VJtVvnldj5QJEadlX/GvVLv/j1m/wBw/wAq8arnzGT0iiqkuVCc1teFtWl03UY1LH7LKwWRe3PG76isanR/61PqK82DcJJoxhVuz2iiiivpFsdJ5p46gEPiCRgMeaiv/T+lc/XVfET/AJDFv/1wH/oTVy1ePU0qNHj4yPvCGgEg5HUUUVMzDDaM9pibfEjf3gDTqis/+PSD/cX+VS17Udke+tjgPiMuNTtW9Ycfkx/xrkq7D4j/APH7Z/8AXNv51x9ebN/vWeFmK95iUClNFdEWfPTWohoFOpB1qmyIrUSlUbiB6nFHenR/6xPqK5arPXwS1R7UOBxRRRXpLY+qWxwXxGkJ1C0izwsRb8zj+lcjXT/EP/kNw/8AXuv/AKE1cvXlz/iM8XHP3mL2ooopTehw0I3kei+ALURaO0+PmncnPsOB+ua6asbwb/yLdn9G/wDQzWzXo0VaCPpaatFIraneR6fYzXUoJSNc4Hc9APzxXmGqa5f6lKzSzukR6RISFA/r+Nd144/5F2f/AHk/9CFeZVwY6cudRT0JqVOUntbq4tJA9tNJEwPVWxXovhTXTq0Dx3AC3UQBbHRx615nXQ+BZNniGNc/fjZfrxn+lY4apKE0r6MmnV5nY9KqK8gW6tZoJB8siFD+IqWivZaurG71PGJY2ileNxhkYqR7imitTxVD5HiC9XsX3/8AfQz/AFrKryo6No8HFQtIWui8Bybde254eJl/kf6VznatvwY+3xHae+4f+OmhaVEaYN2kj0+iiivWPaPPPiCm3Wom7NAD+rVzNdf8RUxeWb+sbD8j/wDXrkBXnPSozwcxj7zHZ4oFJSM20ZNdMdT5+ULvQbM4RTmsLULrJIBqfU70KdoasORzI5zmvXweHv7zPqMky7manJEyNubNe6fDsY8HaeP9/wD9DavC4a91+H3/ACKGn/R//Q2qcXo7H1WMio0kkdFXGfFdyvhuIDo1yoP/AHyx/pXZ1xXxZ/5F23/6+l/9BauOO5w4f+Ijx2XrUB61PJ1qHHNe5Q0ie6SRjmvcvhvbrB4RtCo+aUu7e53EfyArw+Ic17v4B/5FHTv91v8A0I15+LldnDjvgR0FYfjPU5dK8P3FxbnEzYjRv7pJ6/hzW5XJfE/jws//AF1SuK1zz6KTmkzyCeVndmdizsclickmqry89aJmqpI/NelhcKpLU9x6Exlphlqsz0wvXqRwS7EtlszU0zVUZ6YXreOBXYm5cM3vTTNVMvTDJW8cAuwmy4Z/eo3m96qtJUbSV008BFdCWyaSX3qrI+aRmqFmr06GGUCGxrmoWOakc1Ea9WnGyM2YPiO33IsqjkcGucNdzdwiaF0PQiuJuIzFKyNwQa+Nz/Ceyq+0WzPKxUOWVyA00049aYa8A5RppppzUw1SExppDTjSVQhlJS0hpiEooNFMRIKeKaKcKljHLTxTRThUMoetSLTFpwqWUiRalWo1609etZspEq9qsw9arLVmDrWUi47nSeG4POu1J+6vJr03wv8A8h7TP+vmL/0MVxHhe38qz8w9XP6V2/hf/kPaZ/18xf8AoYq3S5Kd+59NhaPs8O2+p9E0UUVxHgPc8V+Jv/I23X+6n/oIrjX612XxN/5G26/3U/8AQRXGv1rswx9VhP4UfQRetW4aqL1q3D2qsTsbS2PffCv/ACLemf8AXvH/AOgitWsrwr/yLemf9e8f/oIrVrhWx8lV+NnF/Fb/AJF+2/6+V/8AQGryZzzXrPxW/wCRftv+vkf+gNXkj9alL3j3Mt/hCqea6/4aSbPE8a/343X9M/0rj1611Xw7J/4Syy+j/wDoDUVFZo6MUr0peh7LRRRVHzB4H8SoxF4x1JR3ZW/NFP8AWuPkHNdr8UMf8JnqGPSPP/fta4t+teV9tnr0/gQR9a7r4Uvt8X2w/vJIP/HSf6VwsfWu1+GBx4y0/wB/MH/kNqF8aCp8DPdqKKK9U8c8n+MTtDrNhKveAr+TH/GuX03UVkABPNdZ8a1/0jS29UkH6r/jXlJlaGTchxivKrRvUZvVwyrUkegKwYZ60oHPNc9pGqiQBHPNb8bBwCD1rJxaPkcVhZUpbD6Qj86U0hrKexOHWp2fw4+/qH0j/wDZq7auJ+G5+fUPpH/7NXbV6uC/hI+lo/Airq3/ACCrz/ri/wD6Ca8fFewat/yCrz/ri/8A6Ca8frlx/wAcTnxewtIaXtQa429DzIL3jrfhz/x+3n/XMfzrvK4T4df8ft5/1zH867uvVwX8JHt0vhRFdf8AHrN/uH+VeNV7Ldf8es3+4f5V40a5sw3iZ4jYMU6P76/UU2nR/wCsX6iuDqjkpfEe0UUUV9Etj0zz74if8he3/wCuA/8AQmrla6r4if8AIYt/+uA/9CauV9a8ar/FZ5eM3CiiiokctBe8ezWn/HrD/uL/ACqWorT/AI9Yf9xf5VLXtw+FHvLY4P4j/wDH7Z/9cz/OuQrr/iP/AMfln/1zP864+vMqfxWeJmG4tNI5pxoreLPnprUSiiiqIQop0X+sT6imU6L/AFifUVzVNz18Fuj2qiiivUWx9Qtjzv4h/wDIbh/691/9CauYrqPiH/yG4f8Ar3X/ANCauXry5/xGeJjviYUUHpRUVNjlw/xHqXg7/kW7P6N/6Ga2axvB3/It2f0b/wBDatmvUo/Aj6OHwowfHH/Iuz/7yf8AoQrzKvTfHH/Iuz/7yf8AoQrzKvPxf8Q5MUwrY8Jv5fiKyPqxH5qR/WsgVpeGz/xPrHH/AD1WsI6TRhh37x6xRRRXtnqHm/jtAuvsf70an+n9K52ul8f4/t1cf88V/ma5rsK8mf8AEZ4+MXvBWr4Wbb4gsT/t4/MGsutDw6ca7Yf9dl/nS+0iMJ8SPWaKKK9c9s4z4jr8unt6Fx/6DXEiu7+Io/0Ozb0kYfpXCE151T+Kzx8wWoHpWTrOorawsSRmrOpXa20LEnpXnes6g97cEA/KK7aELnFgsC6s7vYiu7+a5ujJvYAdOatWt84I3/MKzo0AHvViNeRXoqq6asj6+hH2SSidDaXKPjsa98+H3/Ioafj0f/0Nq+crUEEV9FfDj/kStM/3X/8AQ2rknWdSVma4mo5QSZ0lcV8Wf+Rdt/8Ar6X/ANBau1riviz/AMi7b/8AX0v/AKA9KO5zYf8AiI8el61EKll61EK9mi/dPdJoute6+Af+RR07/db/ANCNeFxV7p4B/wCRS0//AHW/9CNefiX7xw474EdBXI/FH/kVn/67JXXVyPxR/wCRWf8A66pXMtzgofxEeKTHrVOTrVybvVOSvosEtD2mQMaYTTzTTXswRBG1MJqQ0xq6IoTGE0xjTjTDXTFIljSaYTTjTGrpgkSxhNMantTTXVFEsjNMNONNNdMCGMNcv4itvLnEoHDV1BrO1qDz7N8DleRXBm+FWIw77o5sTDmicaelMNSNwajPWvzpqzseSNam040000IbSGlpGqhDTSGlNIaYhKQUtFMRIKcOtNFOHWoZSHCnrTRTlqWMeKkWoxT1qWUSLUq9aiFSCs2UiVavWEZmnSMdWOKoJ1ro/CcG+8MhHEYzRThzzUTpwtP2lRRO0s0EcSIOijFdJ4X/AOQ9pn/X1F/6GK56DtXQ+F/+Q9pn/XzF/wChiunGx5VZH11SPLSaXY+iaKKK8c+Se54p8Tf+Rtuv91P/AEEVxz9a7H4m/wDI23f+6n/oIrjW6muzDH1WE/hR9ATrVuDqKqL1q1D1qsTsbS2Pf/Cv/It6Z/17x/8AoIrUrL8K/wDIt6Z/17x/+gitSuFbHyVX42cX8V/+Rftv+vkf+gNXkr9a9a+K/wDyL9t/18r/AOgNXkrVMfiPcy3+EIvWus+HC7vFVsf7quf/AB0j+tcoort/hbCX1+SQD5Y4WJPuSB/jRUd5I6MW7UpHq9FFFUz5hHgXxFkEvi/U2HZwv5KB/SuRfrW34nuPtOuajMDkSXEjD6bjisN68hO8mz2Iq0Uh0fUGuz+GQ/4rLTv+2n/otq4yMciu6+FibvF9o39xJD/46R/WmtaiFU+BnuFFFFeseOeXfGwfNpJ9pf8A2SvJJ69a+NbfvdKX0WU/qv8AhXklx1rzan8VnqUF+7RWWVonDJxiuo0TWA4COea5R6SN2jcMhwaqUOZHHi8JGqj0+KQSKCvenGuT0XVjwkhrqIpVkUEGuKrFo+elhJUpnb/Dj7+ofSP/ANmrtq4r4cff1D6R/wDs1drXp4L+Cj1aXwoq6t/yCrz/AK4v/wCgmvH69g1b/kF3n/XF/wD0E14/2rkzD4omGK2FoNFBriex5sF7x13w6/4/bz/rmP513dcJ8Ov+P28/65j+dd3Xr4H+Ej2qXwoiuv8Aj1m/3D/KvG69ku/+PWb/AHD/ACrxquXMN4mVfYWljH7xfrTe9Oj++v8AvVwdUctL4j2iiiivo1sekef/ABD/AOQvB/1wH/oTVynWuq+If/IXg/64D/0Jq5avFrfxWeZi9wpKWk7VEjlofEezWn/HpD/uL/KpaitP+PSH/cX+VS17kPhR7q2OD+I3/H5Z/wDXM/zrkOwrr/iN/wAfln/1zP8AOuQ9K8up/FZ4uP3DtSGl7Uh5NbxPn57hR6UUoqmZoTFOi/1ifUUlOj++n1Fc1Q9bBbo9pooor1VsfULY87+If/Ibi/691/8AQmrmK6j4h/8AIah/691/9CauXry5/wARniY74mBpO9KaKipsc2H+I9S8G/8AIt2f0b/0M1s1jeDf+Rbs/o3/AKGa2a9Sj8CPoofCjB8cf8i7P/vJ/wChCvMq9N8cf8i7P/vJ/wChCvMq8/F/xDkxQCtXwuu7xBYj/ppn8hmsqt3wVEZfEVsQMiMM5/75I/mRWEdZpGOGWp6dRRRXtnpnmvjp93iCQf3EUfpn+tc/Wp4ol87xBfN6SbP++Rj+lZfavIbvNs8bFu8gHStDw8P+J5Yf9dl/nWfWp4YXd4gsR/00z+XNL7SFhF7x6tRRRXsI9o5P4i/8g61P/TX+hrzu4mWKMsTjFeg/Ehwun2mf+ehP6V4z4i1HAMcZ5NcMo3rHFWoOrOxk+ItTa4kMaNxWIq7RnvUpXLFmPJpterTSij0qNFUo2QL1qxEM1CowasRUpvQ6Ey9bcEV9EfDn/kS9M/3G/wDQ2r54tutfQ/w7/wCRM0z/AHG/9DauKHxir/Ajo64T4xkr4YtiP+ftf/QHru64T4yf8ivb/wDX2v8A6A9aVHaNzCl8aPGDdlThxkVJHMkhG04PvVG4HNQLuVuDW+Hxcoxsz0lVlFm/F1r3XwF/yKWn/wC63/oRr57tLlhgHkV9BfD9t3hDTWHdW/8AQzSqVVUehljJqUEdDXJfFH/kVn/66p/Wutrkvih/yKz/APXVKlbnHQ/iI8Umqm9XJu9U5OtfQ4J6I9tkDUw1IaYa9mDIZGaYakNMaumDJZG1RmpWFRtXTAljDUZ61I1MYV0wEyNqY1SNTDXVAhkbUw09qYa6IkjTUbgMpUjrxUhFMNbcvMrMiSucTqcBgu5E7ZyKpGuh8TwfOkw+hrnq/NMyw/sMRKJ41WPLJoYaaacaaa4kZMbSNS0GmIYaQ0ppKoQlFFFMCSnCm04VLGOFPFMFPFQxjhUgqNakFSyh4qQVGvSnrUMpEyV3HheDy7BXP3nOfwrirZDLKiDqxxXo9pGIYUjH8IArtwFLmk5dj28npc03N9C/DXQ+Fv8AkPaZ/wBfUX/oYrnYjzXQeFz/AMT/AEz/AK+Yv/QxSx0dD3q/wM+jKKKK8M+Qe54p8Tf+Rtu/91P/AEEVxr9a7D4nH/irrv8A3U/9BFcax5ruw0T6rCfwY+g5etWoTVNDVqE9KrEr3TeWx9AeFP8AkWtM/wCveP8A9BFatZXhT/kWtM/694//AEEVq1558jV+NnF/Ff8A5AFt/wBfK/8AoDV5M3WvWfiv/wAi/bf9fK/+gPXk5qNpHuZb/CBBzXrHwtsPI0ea7YYa5fC/7q8fz3V5ZBG0sqRxgs7EKoHcmvfdJs1sNNtrVMYijC59Tjk0l70rmeZ1LQUO5arO8RX40zQ728JwYoiV/wB7ov6kVo1wHxg1HyNItrBT89xJvYf7K/8A1yPyorT5INnj0o800jx2c5Jqo3Wp5jzUFeXDY9YkiHNej/B+3L+IJ5sfJFbnn3JGP6155COa9p+ENh9n0Ke8YYa5kwD6qvH8y1XRXNVRlXly02d3RRRXqnlHkfxolzq9jFn7sBb82P8AhXl0/Wu0+Jl+L7xXeFTlIMQL/wAB6/8Aj2a4mY815jfNUbPWpK0Eiq1M71I9MHWt0NkkZIYEHBrodH1Jk2q54rnlq5B14rnrRujGdCNQ9w+GEol/tAg9o/8A2au7rzL4LyM41UE5wIv/AGevTa68IrUkcEocj5Srq3/ILvP+uL/+gmvIB0r1/Vv+QVef9cX/APQTXkArizD4kceK2Cg0UGuJ7Hmw+I674df8f15/1zH867uuE+Hf/H9d/wDXMfzru69fA/wkezT+Eiu/+PWb/cP8q8bFeyXX/HrN/uH+VeN1zZjvEzr7BTo/9Yv+9TaWP/WL9a8/qjlpfEe0UUUV9Itj0Tz74h/8heD/AK4D/wBCauWrqfiH/wAhe3/64D/0Jq5avErfxWebi9w9aSl9aSokctD4j2a0/wCPSH/cX+VS1FZ/8ekH+4v8qlr3YfCj3FscH8R/+Pyz/wCubfzrj67D4jf8ftn/ANc2/nXIV5dX+Kzxcw3CjFFFbRPn57iUtFFWzNbhToz+8T6imU+L/WL9RXNU3PVwb1R7TRRRXqrY+pWx538Q/wDkNw/9e6/+hNXMV0/xD/5DcP8A17r/AOhNXL15k1+8Z4WOfvMWiiioqLQ5sO/ePUvBv/It2f0b/wBDNbNY3g3/AJFuz+jf+hmtmvTpfAj6SHwowfHH/Iuz/wC8n/oQrzKvTfHH/Iuz/wC8n/oQrzKvOxn8Q5cTqwrufh1Z4jurxh94iJfoOT/T8q4avW/D9n9h0e1gIw4Tc/8AvHk/zpYSHNUv2Hh4dTQqK6mW2tpZ5PuRoXP0AzUtc746vPs+iGJTh7hgn4Dk/wAgPxr0qsuSDZ1Sdlc86mkaaaSV+Wdix+ppvam0teVDueFXldi1u+CYjJ4igYDIjVnP5EfzIrBrt/h1a4ju7th1IiU/qf6VdOPNVSOrBx1Ozooor1j1Dzr4xXn2a109AeWMh/Lb/jXiV25kkZ2PJr0T4w6h9r8TfZlOY7SJUI/2j8x/QgfhXnE/esIK9Rs66dNJXZVfNN709qaK7kymAqeLtUIqeMdKiewol+3GMV9D/Dz/AJE3TP8Acb/0I1882/avof4e/wDIm6Z/1zP/AKEa4qfxsK/wI6GuE+Mf/Ir2/wD19r/6A9d3XC/GP/kWLf8A6+1/9AetavwM56Xxo8Pn61AMA1Ym61ABzWVN+6d73LEIGa+hfh3/AMiZpn+43/obV89wdcV9C/Dv/kTNM/3G/wDQ2opP32Y4j4Doq5L4of8AIrP/ANdU/rXW1xvxY/5FF8f89k/rXRKXKrnPRdpo8amHWqclDzvGcHke9IsqS9Dg+hr2MBioSSR7CqJkTCmGp3Wo2WvehURRCaYelSstRsK64SJZERTDUrCozXXBkkZphp7CmmuqDJZE1MNSNTK6YksjNMNSNTCK6YksjNNNPppreJLM7WofOsnA6jkVxhGK9AkUMpB7jFcNfxGG6kT0NfIcS4e0o1Uebi4WfMVGpDTjTTXyyOEbSGlNIaYhpptONNqhCUUppKYElOFNFLUDHinCminCkxoetPFRrTxUDJBT1qMVIvWoZSNrw1D52pJnonzV3S9a5fwfDiOWY9/lFdOp6V7uAp8tK/c+tymnyUb9y1Ga3vCzf8VBpf8A19Rf+hiueQ1dsLp7S7guYSPMidZFzyMg5H8qyxVLmTPQqx5otI+pB0orw5fiRr3/AD0t/wDv1Tv+Fka9/wA9Lf8A79V4Lwk0z57+zK3kN+KB/wCKwu/91P8A0EVx7GrmtatcavqEl5eFTM4AJUYHAxWeWr0KFFxWp7tCm6dNRfQkU81Yiaqamp42orU7o0kj6I8Jf8ixpf8A17R/+gitavD9P8daxZWcFtA8AihQIoMeTgDAq0PiFrn/AD0g/wC/deVKlJM8Cpl1WUmzsPizx4ftv+vpf/QHrykda1tb8UajrdqlvfPE0aOJBtTBzgj+prISsZxtqejhKMqNPlkdT8PdP+3eI4GYZjtwZm+o6fqR+VeyVxPwt0/yNJmvXHzXD4U/7K8fzz+VdtUwVkePjqnPVfkFeF/E/U/t3iq4RWzHbAQL9R979Sfyr2vVLtLDT7m6k+7DGXx64HSvnTVleeSScks7sWY+pPWscTFzVkVgqTlefYy5DTFGT0qN2IPIqWLBria5UdXUuWsbOwVQSxOAB3NfSGhWI0zR7OzAGYYlVsd2xyfzzXivw500ah4os1YZihPnv9F6frtr3iujBx3kzjxctohVXVrxdO0y6vJMbYI2fB74HA/GrVcL8XdSFp4fis1OHu5OR/sLyf1211VZcsWzmpx5pJHjV7K80zySEs7ksx9SetZkpqxcScnFU2DseAa4aNNs9az2RG5GabvFTpZTSfwkfWrMWm93YV6MMLOXQqNCcuhSViauW4YkcVcis4U6jNXoURfuqBSqYJpam8cK1ueh/BRSp1bPcRf+z16hXnPwi+9qn0i/9mr0appQ5I2PGxkeWq0VdX40q9P/AEwf/wBBNeQKwI4r1zWzjRr8/wDTB/8A0E14pBc+prixtJzaaOWeHdWDa6F/tQabG4YZp1ebNOOjPHVNwlZnW/Dr/j+vP+uY/nXeVwnw6/4/bv8A65j+dd3Xr4H+Ej1afwkV1/x6zf7h/lXjYr2S6/49Zv8AcP8AKvG65cx3iZ19gpY/9Yv1pKdH/rF+tcHVHLS3PZ6KKK+kjsj0Tz/4h/8AIYt/+uA/9CauWrqfiH/yF7f/AK4D/wBCauWrw638Vnm4vcB3pKWk7VEjmobnstn/AMekH+4v8qlqK0/49If9xf5VLXvQ+FHtrY4P4jf8ftn/ANcz/OuRrrviN/x+Wf8A1zP865CvKq/xWeLmG4GiloraLPnqm4hopaSrMgp0f+sX6im0oJBBHUVlJHbh6vK0e1UV5r/wl+rf34f+/dH/AAmGqj+OH/v3XWsRE+kWYUrE/wAQ/wDkNw/9e6/+hNXLirmq6lcapcrPdlTIqhBtGOMk/wBapVyv3pNo8XF11Um2hRRRRSlG5hRqWZ6l4N/5Fuz+jf8AobVs15bp/iXULC0jtrdoxEmduUyeTn+tWP8AhMNV/vw/9+66I4iMYpH0VPG0+VI6zxx/yLs/+8n/AKEK8yrY1LxFf6jaNb3LRmJiCdqYPFY/auLEzU5XRFSqqktDT8NWf27WrWEjKBt7/Qc//W/GvWK4v4dWeFur1h1xEh/U/wBK7SuzBw5YX7nbSVohXnfj+887Vkt1Py26YP8AvHk/pivQpXWKJ5HOEUFifQCvHr+4a7vZ7h/vSuX+mT0pYydoqPczxE+WJXpe1A60GuRaI8V+9IK9X8NWn2LRLWIjDld7fU8/1x+FebaDZ/b9XtbcjKs+W/3Ryf0FeuV04ON25Hr4SFo3CmTypBBJNK22ONS7H0AGTT65P4n6l/Z/hS4RWxLdEQL9Dy36Aj8a7ZOyudsI80kjw/XL1r/Ubq7kzvnkaQ+2TnFYkxzk1cuG5NUJW5qKC6noS00IW60gNBNFdiMmOFTRdagFTxdRWc9gRo2/avof4f8A/InaZ/1zP/oRr53tu1fRPgD/AJE7TP8Armf/AEI1x0/jYq/wI6CuF+Mf/IsW/wD19r/6A9d1XC/GH/kWLf8A6+1/9AetavwM56Xxo8Rm61CBzViUc1GF5rmhLQ73uSwDmvoP4ef8ibpv+43/AKG1eBQLXv3w+GPB+m/7jf8AobU6DvUZlifgR0Nch8Uxnwo4/wCmyf1rr6xvFukSa3pBs4pEjYurbmGRxXRVTcGkctNpSTZ883EOc1RkhZTxXsa/C/cMy6oAfRYM/rupsvwqjYfJqrA+9vn/ANmrloqrDodkq1PueR28pPyyfnU7R16HdfCe8HNtqNs5/wCmiMn8s1l3vgTXbFDutRcKP47dt36df0r28Lj5x92ZtSrxejZxbJULJWvc2kkEjRzRvHIOqupBH4VUkir26GNUjptfYzmWomFXZI6ryLXsUa6kS0VmqMip2GKiI5r0KcrktEZ6VGalNRtXZBkEZphqUiozXTBktEZFNNPamkcV0RZLRERmuW8SQ7LsOBwwrqyOaxvEsO+0D45U15ed0fa4Z+Ry4mF4HJmmGnmmnrX52jyBhpDTjTaoQ00hpxpppiENJ2paSqAkXpS0gpagY4U4U0U4daTGh9PWoxT1qWMeKkWox1qxbJ5kyKOpIpWu7FwV2kd34fh8nTIgRgt81agqG3QRwRoOiqBUor6ilDkppH3WHhyU1ElQ4qVW5qAU5SaznC5syyHp++qwbinA4rmlRQrE26lB4qIHNOB5qeSwEinmpVaoFp4NZTjcCwrVIrVWBqVOtcdSmibFpDmrdrG0sqRxjc7sFUepNU467H4cad9u8Rwu4zHbAzH6jgfqc/hXk4ha2MK8/Zwcj1vSbNbDTba1TpFGFz6nHJq1RRWR8o3zO5xnxRv/ALPokdorYe5fkf7K8n9dteRu3Ndb8SNR+2eIpY0bMdsoiH16n9Tj8K49zTpx5pXPo8DS5KSv1KtxapNkrwagWzkRuAavgc1YgBJAXJJ7CliKMWjWpRi9T0f4OaYYbC8v5F+aVxEmf7q8n8yf0r0Ws/w/YjTdFtLTADRxjdj+8eT+pNaFRTgoRsj5qtLmm2FeM/FC6/tHxG8Yb91aoIh9epP5nH4V69qF0llY3F1L9yJC5/AV8/Xs73FxLNIcySMXY+pJyacoqbUWd2W0eeTk+hmtbRA8jNLtVR8oAqRzUTGvUoUYxWiPejCK2QhoxRR3rrsWPWrEVV1qxHXHiNiWel/CL72qfSL/ANmr0avOfhF97VPpF/7NXo1ebHY+Zx38ZlHXf+QJf/8AXB//AEE14KXKt1r3rXf+QJf/APXB/wD0E14HLSau7HXlsVKMky3a3OCATWnHKHAxXOBiGFXrW4IwCa5sXhU1dGONy5N80T0b4df8f15/1zH867uuA+Gr77y8/wCuY/nXf08HHlpJHnKDhoyK6/49Zv8AcP8AKvGxXsl1/wAes3+4f5V433rjzLeJjW2CnR/6xfqKaKdH/rF+tef1Ry0viPZ6KKK+ljsj0Dz/AOIf/IXt/wDrgP8A0Jq5YV1PxD/5DFv/ANcB/wChNXLd68Ot/GZ52K3Ck7UtFZyOWhueyWn/AB6Q/wC4v8qlqK0/49If9xf5VLXvw+FHtrY4P4jf8fln/wBcz/OuQrsPiN/x+2f/AFzP864/FeVV/is8XMNxe1FJ2o5raJ87U3FpDS0hNUYth3ooo6inYalYKKOaKnlNFVYUUUVVhObYnSilpKGioyClpKWs3E6oVGFFBrV8MWf27W7aNhlFbzH+g5/wH41zyjzSSR62ETkz0bQLP7BpFrbkYcJuf/ePJ/U1oUUV7EY8qSR7iVlYwfGt59l0KVVOHnIiH0PX9AfzrzKuq+IF752pxWqnKwJkj/abn+WK5WvMry56noebjKmtgoo6UhNRLY4aMeaR2fw7s9091eMOEAjU+55P8h+ddzWT4Vs/sWhWyEYd18xvq3P8sD8K1q9KhDkgke7TjyxsFePfGTVPO1i3sEb5bWPcw/2m5/kF/OvX5ZFiieSRgqICzE9gK+b/ABLPNqWq3l64OZpC4HoOw/AYFVUi5KyO3DQbfN2MC4YHPNUnNT3AKk9apu5zW9Om4o2mwNANMD+tKCD0raxmSL71YixkVWB5qxERmsZ7DRo21fRPgH/kT9L/AOuZ/wDQjXztbdq+ivAP/In6X/1y/qa46fxsVf4Eb9cP8X+fDNv/ANfa/wDoD13FcT8Wxnw3b/8AX0v/AKA9aV3amzCj8aPFZEpFjq2Y67bwJ4KbVWW+1JWSwHKJ0Mv+C+9edTbn7sT0JtQV2Y/hXwnf66weFfJtQcNPIPl+g9TXtWiacmk6Vb2MbtIsK43MME5JP9atwxRwxJFCixxoNqqowAPQCn16FKiqevU4KlZ1NOgUUUVsYhRRRQAUUUUDKmo6bZajH5d9bRTr23rkj6HqK4PxF8N45N0uiS7D18iU5H4N1/P869HoqozcdjSnWnDZnzZqmmXWn3LQXsDwyr/Cw/Ueo96y5Y6+mtW0uy1a2MF/AkydsjlT6g9RXiPjPwtP4fvMHMlnIf3U2Ovsff8AnXrYTHNO0j0aOIVTR7nESJUDrWjNHVSRMV9RhsQpG7RUYUxhUriozXr05XIIzTGp5prCuqDJIzTKkNMaumLJZG1U9Rj820kXvirpHNRuuVIp1oe0puLMpq6sefOMMR6UxulW9Rj8q7lT0NVWr8urQ5Kjj2PDkrOxGaQ04001BDGmmmnmmmmIbSUtIaYEgpaaKcKQDqUUlApDJBThTBTx0qGUPFavh6LztUhXqAc1krXS+DYs3ckp/hWtsNDnqpHXgoc9aKOw708GmU4dRX1DVkfcLREgpR2popxrKSAcKeKjp61jJAPHanCmCnA1lJCJFpwpi08VjJAPFTR1CvarEYrirOyEyzCK9f8AhXp/2bRZbxxh7l+D/srwP13V5NZQPPPHDEN0kjBVHqScCvoXTLRLDT7e1j+7DGEHvgda8Oq+aR4+Z1bQUF1LNVtTu0sdPuLqT7sSFz74HSrNcX8UtQ+zaJHaKcPcvyP9leT+u2s3seRQp+0qKJ5TeTPPPJLKd0kjFmPqScmqrHmnueajrooxsj6qKsrDkrpvAun/ANoeI7RGGY4z5z/Ref54Fc3GMmvU/hRp+y0u7515kYRIfYcn9SPyrKs7ysc2Nq+zpNnfUUUVJ8ycb8UNQ+zaGlqpw9y+CP8AZXk/rj868hlNdf8AEnUPtniKSJWzHbKIxj16n9Tj8K4yQ81pQjzSufSYClyUl5kbGozSsabXrwjZHeLSDrS0measZItWIqrrU8VcWI2IZ6Z8Ivvap9Iv/Zq9Grzn4Rfe1T6Rf+zV6NXmx2Pmcd/GZR13/kCX/wD1wf8A9BNeBydK9813/kCX/wD1wf8A9BNeBSdDR9pHble0iFutSRkgimHmnpW9RXieq1c9E+FL7r69B/55L/OvSa8z+E//AB/33/XJf516ZXNTVkfOY2PLVaRFdf8AHrN/uH+VeNivZLv/AI9Zv9xv5V42pzXm5ktYnn1leIU6P76/UUlKn31+teat0clL4j2eiiivpo7I9A8/+IX/ACGIP+uA/wDQmrlq6n4hf8hiD/rgP/Qmrlq8Kv8AxWedi9woopKhnNQ3PZbT/j1h/wBxf5VLUVp/x6w/7i/yqWvfh8KPaWxwnxG/4/LP/rmf51yFdf8AEb/j9s/+ubfzrkOwryav8Vni5huL2pP50UVtE+cqbhigig0VojFiUUtGKZNxPrRRikphcWg+tFFBSYtJRS0mWhO1FAorOTOmirsK7n4dWe2K5vWHLHyk+g5P9PyrhgCTxXruh2f2DSba2xhkT5v948n9TU4aPNUv2PpcDT6l6myOscbyOcIoLE+gFOrB8a3n2TQpUBw85EQ+h6/oCPxr0KkuWLZ6MnZXPOdQuWvL6e4frK5bHp7VAKSgCvJhrqzwsRO7FPU1b0a1/tDV7W16q7jd/ujk/oDVJzgV1vw1s/Nu7u9cfLGoiT6nk/oB+dbU4c0kdeBo395noA4GB0ooor0z0zmfiHqH2HwzOqnElwRCv0PX9AfzrxKVq734raj52rQ2Sn5LZMsP9puf5AfnXnsprtwlPmlc9zB0+WnfuQTRpICHUVnT6ercxtj61osajNe3HDwktUbzpRlujDmtJY+oquwKnkYro81DLbxyjlcH2rCpgOsTknhf5TERuasxEGpJdPZcmM5FRLGyN8wIrysRQnDdGDhKO6NO2PSvozwF/wAifpf/AFy/qa+b7Vuma+kPAf8AyJ+lf9cf6mvLh/EZlX+BG9XGfFYZ8PW//Xyv/oLV2dYnizR31u0tLVW2ILgPI3ooVs49+QPxqq8XKm0jCk1GabPO/A3hY6xd/abtSLCI8j/no3936etevIixoqIoVFGAoGAB6VFZ2sNnaxW9sgjhjG1VFTUsPRVKNuo61V1JXCikkdY0Z3YKijJYnAAqKzuob22S4tnDwvnaw74OP6VtdXsZWe5NVDW9Vt9GsGu7sSGMELhBkkmr9cj8UTjwq/8A12T+tRVk4wbRVOKlJJmTd/E2FCRa6c7+8koX9ADVeL4pYbE2lDHqs/8A9jXmM0nXmqjy8nFcMKtWWtzudGmuh7ZZ/EvR5mC3EN1b5/iKhlH5HP6V1Ol61puqrnT72Gc4ztVsMPqp5FfNPm06O6eKRXjdkdTkMpwR+NbxqzW5m6EXsfUlFeL+GfH2q2aqt4/22AcYlPzj6N1/PNeo6B4hsNcizZy4lUZaF+HX8O49xXWrtXMZ0JwV+hr1V1XT7bVLGW0vIw8MgwR3HuPerVFNOxim07o+e/Fvh+fQdSe2m+eNvmilxw6/4+ormJo+tfSXivQodf0mS2kwsy/NDIf4G/wPQ18/anZy2l1Lb3CFJomKsp7EV7eX4t3sz1qFb2sddzCkWoGFX5kqo4r6/DVeZGrRXIphFSMOaYRXpwZFiM0xqkNMYV0wZLIzUZFSkUw1utSGjkPEcey/ZuzDNZBrpPFMf+qf8K5w1+cZtS9nipI8SvHlmyM00080015yMWNNNNOpDVEjaQ0ppDTAcKcKaKUUgHClFIKcKQ0KKeKYvWnCpZRIK7LwfHts5HP8TYrjV6V3/huPy9Ig9Wyxruy6N6tz1sohzVr9jWWnCmind6+hZ9aOHUetPpgp3aspAOWnCmjrmnViwH96ctMFPWsZAOFPFMFPWsJCJUq1EKrxjmrcIry8VOyJZ2fwz077b4hSZ1zFaqZD6bug/nn8K9krjfhdp/2XQWunGHun3f8AARwP6n8a7KvH8z5fHVfaVX5BXjXxH1H7b4ilRGzFbARD6jk/qcfhXrWr3i6fplzdv0ijLY9TjgfnXz9dStLK8kjFnclmJ7k0Wu7HTllK8nN9Cu5pB1pCaVOtdnwxPdLEK5IAGTXvnhyw/szRLO1xhkjG7/ePJ/UmvIfA+n/2j4itI2GY4281/ovP88D8a9vrivdtniZpVu1BBVbUrtLHT7i6k+5Ehc++B0qzXF/FLUPs2ix2inD3L8j/AGV5P67aGedQp+0qKJ5TezvcTyzSnMkjF2PqScmqTmpZTVdjXdhYaH1cFZWGmmig0CvSSNBaKQmlFNgPWrEfaq61Yi7Vw4jYlnpnwi+9qn0i/wDZq9Grzn4Rff1T6Rf+zV6NXmR2PmMf/GZR13/kCX//AFwf/wBBNeBSd69+13/kC3//AFwf/wBBNeBSd6PtI7cr2kQ09O1MNPSuifwnrnoPwn/5CF9/1yX+demV5p8J/wDkIX3/AFyH869LrmhsfOY/+MyG84s5/wDcb+VeIwzjIBNe3X3/AB5z/wDXNv5V4Du2mubE0vaWDDUFWhJG0rZApynDr9azbe46AmravuZcH+KvMnQcZHG8G6cz2+iiivdWwHn/AMQz/wATi3H/AEwH/oTVy3aui+JEuzXLcf8ATuP/AEJq5pH3CvGrwftGzjxdF25h/ekoxzRXPI4KPxHstp/x6Q/7i/yqWorT/j0h/wBxf5VLX0EPhR7S2OE+I3/H7Z/9cz/OuQJrr/iN/wAfln/1zP8AOuQrya38Zni5huFApaQVrE+cqbimkpTSYrVGDD+dIaWjFMgTv60poIopjEIopRRQUhKO9BFFI0iFFFArCoz0MNC7NfwpZfbtct0IzHGfNf6D/wCvgfjXqlch8PLPZaXF4w5kby1+g6/qf0rr66sJC0L9z6nDw5YBXnvxAvfP1SO2U5W3Xn/ePP8ALFd/NIsMMkshwiKWY+gHNeO3tw13eTXEn3pXLn2yajGTslHuTiZ8sbENJQaK5lojxG+aRDcMQMV6v4NsfsHh61RhiSUec/1bn+WB+FecaRYf2jqttbYysjjd/ujk/oDXsQAAAAwB0FdWFV7s97DaU7IKZNKkMMksjbURSzE9gKfXMfEbUPsPhqZFOJLkiFfoeT+gI/GuxHVThzyUTyHWr1tQ1K5u3zmaQvj0HYfgMCsmQ1PM1VZDXt4KnZH0UVyqyI2NNoJpK9mMbDFopKKqwhRkGnbFf7yimCpU61z14JrUTimKlmM5jNfQXgVSvhHSweohH8zXg8Pave/Bf/Irab/1yFfL4ilGFS6POx0FGKaNqiiisTywqK6uIrS3knuZFjhjG5mboBUteQ/EnxN/aF+2nWj/AOiW7Ycg8SOOv4Dp+ftWVap7ONzWlTdSVhni3xbNrMrQW5aGwU8J3k92/wAK9D8CnPhTTz/st/6Ea8KWTmvc/AJz4R04/wCy3/oRrhwjlKq5SOrExUaaSOgrkPip/wAim/8A12T+tdfXJfFEZ8Kv/wBdk/rXdX/hs5aXxo8Nm61TfrWnNHmqckVcFGaO+SKRJBphYmQCp5UIGO9Os7bc4Zugr0aEVUkkRGLbsX7c7IlHer1leTWlwk9tK8UyHKspwRWf0pytXtSwycbI70lax7f4I8Wx63ELW8Kx6go7cCUeo9/Uf5HW1822lzJBMksLskqEMrKcEGvb/BHiJde04+bhb2HAlUfxejD2NebUpuDPMxWH5PejsdHXnHxZ8PiWAaxbJ+8TCXAA6r0Dfh0/L0r0eo7mCO5tpYJ1DxSqUZT3B4NTTm4STRz0qjpyuj5cnTmqEq11HifSn0jV7qyk58p8K395TyD+WK52Za+xy/EcyR7F1JXRRcVGwqeQVCwr6SlK6IaImFMNSNTDXXBkjDUZqQ0xq6YslmN4jj3WJPdTXJV2+spusJR7VxDDmviOIocuIUu55GLVp3GNTDT260018+jjGUhpxppqhDTSGlNIaoQ6lFJSikAtPHSmU4dKQxw604UwU+pYyROSBXpOlpssLdfRBXnNuN0yD1Ir023XbEi+igV6uVR95s9/JI+9KRKKcKQU6vaZ9IKKcKYKeKykA4U4U0U4dRWTGOp69KYKevSsZCHd6kQVGOTUqCuWo7ATxCtPTrZ7q7gt4hmSVwi/UnFUIR0rvPhbp32vXzcsuY7VN3/AjwP6n8K8PFzvoc2Iqezg5HrNjbJZ2UFtEMRxIEX6AYqeiiuE+Tbu7nD/ABV1HyNIgskbDXD7mH+yvP8APH5V5JIa6r4h6j9v8SXAU5jt/wByv4df1z+Vck55rSjG7ufS4Gl7OkvMb3qWIc1GvJqxApJAAyT0FbVpWR1ydkeofCfT9lpdX7rzIwiQn0HJ/U/pXf1neHrAaZotpaYw0cY3Y/vHk/qTWjXIkfK4ip7So5BXjXxH1H7b4jlRGzHbARL9Ryf1OPwr1vVbxdP025upPuxRlsepA4FfPt3M00rySMWd2LMT3J600rtI7sspXk5voVZDULGnuaiJ5r2KELI99BRTaK6rDuOoHWkzSikwJFqxFVZKsRc1w4jYlnpvwi+9qn0i/wDZq9Grzn4Rfe1T6Rf+zV6NXlx2PmMd/GZR13/kCX//AFwf/wBBNeBS9a991440TUCe1vJ/6Ca+e57qNfU1LkoyVzsy2SipXFNSJWe98oPypTkvmPAUVdTEQUdz0nWien/Cf/kIX3/XIfzr0yvLPg9M0uo3+e0S/wA69TrOlJSjdHgY181VtEN9/wAec/8A1zb+VfPz9eSK+gL7/jxuP+ubfyr5slLZ6mscRV9m0dGXz5Uy+JFU/fX86uWd0glQGRfvVzvOatWYPnR/7wrlqVubodVRqa2PpeiiivTWx4bPKvixOItftRgkm2B/8eaudsnZ0BIIrpvijbmXxJaN2FsP/QmrnziGEnpivJr1LzcQxNS9NQJg43YzS9a5efVGW94Py5resrgTxgiuecTz1h3Bpnt9p/x6Q/7i/wAqlqK0/wCPSH/cX+VS17sPhR3o4T4jf8ftn/1zP865Guu+I3/H5Z/9cz/OuRFeRW/jM8XMN2FIKdSVtE+cqbiUtFBrRGDCiiiqM2JRS0lAIKKSigtCmkxS0etJmsFdiUqAswVQSScAUlbXg6y+2a7BuGUh/et+HT9cVzS96Sie5gaV2j0bSbQWOm29sP8AlmgB9z3/AFzVuiivWiuVWPpErKxz3ji8+y6I8anD3DCMfTqf5Y/GvNa6bx7e/aNXW3U5S3XH/Ajyf6flXM15daXPUfkeVjamtgoFFFRJ2RwUY80jsPh3Z7ri5vGHCARr9Tyf0x+dd3WT4Vs/sWh2yEYdx5jfU8/ywPwrWr0sPDlgkfQ048sUgryb4raj9o1mKzQ5S2Tkf7Tcn9NterzSLDC8shwiKWY+gFeAa7M95f3F1J96Zy59snpXRBrnSO7BuKqXZkStVZzUkhIOKgY19PhoaHuJ3ENJQaTNegkAtFJmjNOwCg1KnWoRUqdawqrQRch7V774M/5FbTf+uIrwGA1794M/5FbTP+uIr5jGK0zgzD4EbNFFFcZ5Bz3jrWDpGhSmFtt1P+6i9QT1b8B+uK8EnDo3I/Gu8+JupG78Qtbqcx2qhB6bjyT/ACH4VxjsDw3Io+re21PYw9C1NPqypFIc81778PTnwdpp/wBhv/Q2rwgwK3Kda92+HqlfB2mg9Qrf+htWEKDpT1MMXFxjqdFWZ4i0hNb0/wCySytEm8OWUZPHatOitpRUlZnnptO6ObsvBOhWyjdaee4/jmcsT+HT9Ksy+FNBkXDaVa4/2Ux/KtuipVOC0SKdST6nCax8MtHuwWsHlspPQEyJ+ROf1rz3xB4avdAkEd1FmIn5Jk5Vvx7H2Ne+1De2sN7ayW91GskMg2srd60pv2bujejiZQeup81suKjPFdV408OSaBf7AS9pLloZD1x3B9xXLuMV7WHqqaPWjJTXMgRsHrW94U1h9G1m3u1J8sHbKv8AeQ9R/X6gVzw61PG1TiaSauEoqSsz6WjdZI1dGDIwDAjoQadXL/DjUft/hiBWOZLYmBvoPu/oR+VdRXjtWdjwpx5JOJ5j8ZNMGLLUkXrmCQ/qv/s1eSXC9a+ivHlkL7wpqEeMtHH5q/Vef5Aj8a+erlete3ldW2h6eElzU7djLlFQEc1bmHWqr19ph5XRsyEimN0qVqYRXoQZBEaY1SUxq6osmxVvF3W0g9VNcHIMMa9BkGVI9q4K6G2dx718rxNDWMjy8atUyu1MNPPSmmvlEcAw0hpWpDVEjDSU402qEOpRSUopDFpwptOFIBwpRSClFSMu6Yu69hH+0K9LQV51oS7tUtx/tV6Kte3lS91s+myOPuSY4U7FJ3p34V6jPdBaeKaBxThWTAcKdTacOorJgOHSnrTKeBWEgHKOasRioUGasxCuKvKyEWYRXtfwy077F4dWdxiS6YyHP93oP8fxryDSLR76+t7WP78zqgPpk9a+iLWBLa2igiG2ONAij0AGK+erS5pHjZpVtFQRJVHXb9dM0i6vGx+6QlQe7dAPzxV6uA+LOo+VZWuno3zSt5jgf3R0/X+VZM8rD0/aVFE8vuJGkdmclmY5JPc1WY5NSSHmou9dlGNkfVRVlYegrp/Amn/2h4jtI2GY4z5z/ReR+uB+Nc1GOa9U+E2n7LS7v3HMjCJCfQcn9SPyrCu7uxy42r7Ok2egUUUVkfMnEfFTUfI0iGyRsPcPuYf7K8/zx+VeRymup+Ieo/b/ABJcBTmO3/cr+HX9c1yUhyeK3w8eaVz6XA0vZ0l5kTnmoyabNLFF/rJAPaqU2pxocRrn616iqQgtWdUqsY7svgelBwPvMB9axZNTlfIBwPaqzzySdWNYTx0Fsc8sZFbG+88SdZB+FQtqEKn5QTWJtc9zTliOeTXLPMH0MJYyT2Nb+0yfuKBU0V7K3fFZUSAVftwARXm18VOXUz9vKT3PXfgo7O2r7jniL/2evUK8v+Cn3tX+kX/s9eoVWHblBNnlYl3qMoeIP+QDqX/XtJ/6Ca+bZ15r6S8Qf8gHUv8Ar2k/9BNfN89c2LfvI3wezKjKAamiAyKhbrU0XUVzyeh2I9P+DX/IQ1D/AK4r/OvVa8q+Df8AyEdQ/wCuK/zr1Wu7CfwzzcV/EZBf/wDHjcf9c2/lXzbL1r6Tvv8AjyuP+ubfyr5sm61z47dG+D2ZD3q1af66P/eFVR1q1af66P8A3hXGzrex9KjpRQOlFe4tjxWeefEQf8Tq3P8A07j/ANCavPtbu/LQop5rvPidKItTgJ6/Zx/6E1eUX8zTSknpmvFqr98yo0+Z3ZVhRpp+Oua7DSoDFCM1k6JZ5YMwrpEXauKiozCvWTfKj2a0/wCPSH/cX+VS1Faf8ekP+4v8qlr3IfCjRHC/EX/j8s/+uZ/nXI4rrfiL/wAftn/1zb+dckK8it/GZ4uYbhSClI4pMVrE+bqbgR1opRSVojBhSClpAKpEi0lLSGmCEpaKKRSEpaBRUSZ1UY3Yhr0D4e2XlafNdsPmnbap/wBlf/r5/KuBjRpJFRBl2IUD1New6darZWEFsnSNAufU9zSwseafN2PqMBTsrlio7mZLa3lmkOEjUufoBmpK5rx7e/Z9IW3U4e4bH/ARyf6fnXdVnyRbPRm+VXPPrqZ7m5lnkOXkcufqTUVFFeVDufP4ifNISr2i2Zv9VtrbGVdxu/3Ryf0BqlXY/Duz3XFzeMOEXy0+p5P6Y/OqjHnmonRg6d5I7oAAcdKKKK9c9o57x1efZdDeJTh7giMfTqf04/GvJ7uHcp4rsvH179o1hbdTlLdNv/Ajyf6flXMOuRiuJVX7a66Hm4jFulO6OVvIirGqJPOK6e+tgVOBXP3UBjJwK+wy/EKcbHv5dmUa0bN6lc0maQGkr2Uj2kLmjNJRVWGOBqRDUI609TWVWN0IuwtzX0B4M/5FbTP+uK188xtXuvhDXNKg8NabFPqVlHKkKhkedQQfQjNfN4+k07o4Mem4qx1dI7BVZmOABkms3/hING/6C1h/4EJ/jVTV/EGk/wBl3gi1SxaQwvtCzoSTtOMc15qhJvY8uMJN7HiWp3Zu764uHzumkaQ/ic1RLc0jvk1Fu5r2KOHtE+gSsrFqJua918A8+EdO/wB1v/QjXgiNXtXgbWtMt/CthFc6jZxSqrbkeZVYfMeoJrjxdJrVHFjk3BWOxorM/t/R/wDoK2H/AIEJ/jTZPEOkLGxGqWLEDIAuE5/WuHlZ5ahLsVfEHirT9Fk8mUtNc4yYo+q/U9v51k2fxCsJZQtzbTwqT98EMB9e/wDOvLLm7kubiWeZt0kjF2PqTTFfNRKE1qerDBQ5ddz6GtLmG8t0ntZFlhcZVlOQalrzX4U38n226sSSYmj84D0IIB/PI/KvSqcXdHm1qXsp8pi+MdJXWNAubfaDMq+ZEfRx0/Pp+NeAyrX0xXzrrkIg1W9iUYWOZ0A9AGIrrws7SsduBk2nEyj1p8Z5FMbrTk7V689YneenfB66xdahak8OiygfQ4P/AKEK9Prxz4USbfE+AfvwOp/MH+lex14VVWkeRjFaoR3ESz28sT/dkUqfoRivmS8Qo7Kwwykg19P183eIkEesX6Dos8g/8eNdmXu0zXAvdHPTDrVR6uzd6qPX3WEeh2sgammnsKaa9SBBEaYaeaY1dUSSNua4fVV2X0w967kiuL14Y1KX614HEivRizzscvdTMw0w09qaa+LR5hG1JStSVRI1qbTm602qQh1KKSlFIYtOFNpwpAOFKKQU4VIzX8NjOrw/WvQV61wPhYZ1aL8f5V3y17uWfw2fU5L/AAmxw604dab3p4Fekz2hR0pQKQdOacKykAo4p4601acOTWMgHU8UwVIvWsJsCRBVuEVWiHNXYV4FeTi52RLZ3vwo037Trcl4y5S1Tg/7TcD9N1euVy/w4077B4ZhdhiW5Jmb6H7v6AH8a6ivEbufLY2r7Sq2FeG+OdS/tHxHdyKcxxnyU+i8fzyfxr17xRqI0vQby6Bw6phP948D9TXgMrZJ9aIrmlY7MrpXbmyFzzSL1oJ5pyDmu/4YnuE8K5IAGSe1e/8Ah2wGmaLaWmAGjQbv948n9Sa8h8B6f/aHiS0RhmOI+c/0XkfrgV7fXA3d3PDzSrdqAVS1u+XTdJurtsfuoywB7nsPzxV2uD+LGo+VpttYI3zTvvcf7K//AFz+lJnnYen7SoonllxIZHd3bLMSWJrD1G/2kpEePWrWr3Plp5ank9awSNxy1N1vZrlie7Xrcq5YkTl5GySfxpBHzzTz1oPasHNs89yb3AKo7Uv0FJmipFcUGnCmGnCkwJozV63qilXbeuapsaQPXfgp97V/pF/7PXqFeX/BTrq/0i/9nr1CurC/w0cOJ/iMoeIP+QDqX/XtJ/6Ca+bp6+kfEH/IB1L/AK9pP/QTXzdP3rnxfxI3wmzKzVLF1FRGpoutc8tjrR6d8G/+QjqH/XJf516rXlXwb/5COof9cV/nXqtd+E/hnnYr+IyC+/48bj/rm38q+bpetfSN/wD8eNx/1zb+VfN0vWufHbo2wezIO9WrT/XR/wC8Kq96t2QLTxgf3hXEzrk7I+lB0ooor3VseMzyb4wSFdZtUHe2H/oTV57awGaYccV3/wAX1LeIbQD/AJ9R/wChtXPaZahFBI5rxqztVZrVqKnSLlnCIkAx2qxQBiiueTPEjPmnc9ktP+PWH/cX+VS1Faf8esP+4v8AKpa+gh8KPVWxwnxGH+m2f/XNv51yIrrviL/x+2f/AFzb+dcl6V49b+Mzxcw3YUCjvSVrE+bqbi96Q0UGtEYsO9FBoqiWBpO9BopgFFFFJlJAKKKDWFSR6WFhdm74KsvteuRMwzHAPNP1HT9cflXptcx4AsvI0p7lh89w3H+6OB+ua6eu3Cw5YX7n1eHhyQQV5r44vftWtvGpzHbgRj69T+vH4V6HqFytnYz3L/diQtj19BXj0sjSyvJIcu5LMfUmssZPRQM8XPljYZRRRXKtEeE3zSCvVfCtl9h0O2QjDuPMf6nn+WB+FecaJZ/b9VtrbGVdwW/3Ryf0Br13oOK6MHG7cj28HC0bhUdxMlvbyzSHCRqXY+wGakrnPHd79m0byVOHuG2/8BHJ/oPxrtqS5YtnXOXLFs87u52ubmWeT78jlz9SahpaMV59JdT5bGVbtjJE3Lisu/tMg8Vr1HJGHGDXq4as6bOXC42VCaaZxtzCUY8VWzXR6haZzgVg3ERjavr8HiVVifouWZhHEQSuRZozSUV6Nj2AzTgabRmlKNxEyNUyvVQGnhq46uHUgLfmcdaQyVWD0bqwWFSFYlL5pueaZmkzWqpJCJ1apVeqoNPDVhUoJgWxJQZPeq26jdXN9VQrFkPUkb81UVqmjNc9egkgPQPhSc+Ipf8Ar2b/ANCWvWa8k+E3/IxTf9ezf+hLXrdeLJWZ4+N/iBXz74n/AORg1P8A6+pf/QzX0FXz94n/AOQ/qf8A19S/+hmtaHxGmA+JmG/WhOooehO1e59k9M7b4Wf8jVF/1yf+Vez14x8K/wDkaov+uT/yr2evCrfEeRjf4gV84+J/+Q5qX/XzJ/6Ea+jq+cfE/wDyHdS/6+ZP/QjXTgf4heB3Zz03eqcg61dn71UevuMG9DvZAaYelPam160GQRHrTGqQ0xq6oE2IzXHeIht1F/cCuyauR8TD/iYfgK8biFXwy9Tgxy9wxWphp7Uw18OjyWMNNpzU2qJGtTac3Wm1SEx1OFNpw6UhhTxTKfSAUU4U1aeKljNzwmM6ov0Nd4vSuF8I/wDITH+6a7odPeveyz+EfV5N/BFHWnjrTacK9BnrocKUUgFOrGTAUcinCkX9KctYyAUVKg4pgqVBXNVegXJ4l5FbOhWLajqdraIDmaQKcdh3P4DJrKhWvSPhLpvnanPfOPlt02qf9pv/AK2fzrwMZO+hy4qr7Om5HqkUaxRJHGAqIAoA7AU6ig1wHyu7POfi3qGFs9PRuuZnH6L/AOzV5fIea3/Gepf2n4hvJ1OYw3lx+m1eP16/jXOua3w8bu59Pg6fs6SQnWpYxUS9asxLmtq8rI6m7I9S+E2n+XZ3V+6/NIwiQ+w5P6n9K7+szwzYf2boVlakYdIwXH+0eT+pNadcSPlMTU9pUcgrxL4gaj9u8R3bg5jg/cp/wHr+ua9g1u9GnaTd3bY/dRlhnuccD88V88ahKxhldjljySe9FrnbltPWVR9DnbyQyzEn1qs5p7HJY+9Qua5nqxzldhmkNJ9KAaZmL3paaDTqAClXGaSlHWkwJ0q7B1qjH1q9b9RXNU2NIHrnwT66v9Iv/Z69Rry74J/e1f6Rf+z16jXVhf4aOHEfxGUPEH/IC1H/AK9pP/QTXzdN1r6R1/8A5AWo/wDXtJ/6Ca+b5658X8SOjCbMqmpYetRHrUsVc8tjrR6f8G/+QjqH/XFf516rXlXwb/5COof9cV/9Cr1Wu7CfwzzcV/EZBf8A/Hjcf9c2/lXzdL1r6Rv/APjxuP8Arm38q+bpetYY7dG+D2ZBWxosBaZGI/iFZlvGZZQBXT2EQhVOO9efJ6odapbQ9zooor6BbHAeY/E2HzfEdqfS2H/oTVhRqEUACup+Ia/8Tq3P/TuP/Qmrme1eFiH+9Zx4yo7WDvSCl70grFnBQ3PZLT/j1h/3F/lUtRWn/HrD/uL/ACqWvoofCj2lscJ8Rf8Aj9s/+uZ/nXI113xF/wCP2z/65n+dcj6V49b+Mzxcw3FpBSmgVpE+cqbiUooxSVojBhRRRVEhik74paSgaQvakpaKTZrBXYhp8MTTzRxRjLuwVR7nimV0Pgay+1a0JmHyW67/APgXQf4/hWDXPJRPdwNK7R6HZ262tpDbx/djQIPwFTUUV66VlY+jSscr8QbzytOhtVPzTvlv91f/AK5H5V59W74zvftmuSqpzHAPKH1HX9c/lWEK8mrLnqNnj42pdi0lL7UhqZPQ4aMbyOx+Hdnunubxhwg8tPqeT/T867qsfwlafY9BtlYYeQea349P0xWxXpYeHJBI+ipR5YpBXm/jy8+06z5KnKW6hf8AgR5P9B+Fei3EqwQSTSHCRqWY+wFeN3UzXFzLPJ9+Ri5+pOayxctFEwxlTlhYioooqaaPkcRO7DrSHpS0h65NdCOFsiljDg5rC1O0xkgV0RqC5hEikEV6GExTpSPRy/MJYaa1OJlQo54pgPpWjrca2hLup2eoFZUcscozE4PtX12ExUK0dGfpeX4+GJppp6klJ3pM0V3WPSHClzTaXNS4gLmlzTaBUOID80CkoqGhD80uaaKUVm4iHZpQaSisnECRDViLrVZasRVwYlaAd/8ACb/kY5f+vZv/AEJa9cryP4Tf8jHL/wBezf8AoS165XzlT4meNjf4gV8++J/+Q/qf/X1L/wChmvoKvn3xP/yHtT/6+Zf/AEM1dD4jTAfEzEehKGoTrXt/ZPTO2+Ff/I1Rf9cn/lXs9eMfCz/kaov+uT/yr2evDrfEeRjf4gV85eJv+Q5qX/XzJ/6Ea+ja+cvE3/Id1L/r5l/9CNdGB/iF4HdnPT96qP3q5P3qo9fcYR6I9BkLVGRUjUw160CWRmmNUh71G1dUCRhrkvFH/H6PcV1p61ynir/j8X/dryc//wB2ODHfAYLUw09qYa+ER44xqbT2plWSI3WmmnGmmmhC0opBSigBwp1NFOqWUKtPFNFPFSxm74R/5Ci/Q13S1wnhI41aP3B/lXeLXv5Y/wB2fU5O/wB0O707FJ3pa7pHrjxQeTilHFGKxbGO7U6kFO71jJiHrU0a1EtWYhzXBXnZCLMK17t8PtO/s7wzbbhiSf8AfP8Aj0/TFeO+HNPOpaxaWYBIlkAbHZepP5A19CIoRFVQAoGABXz1aXNI8bNKuighax/F2o/2X4evLhWxJs2R467jwPy6/hWxXmvxb1HMlppyHhQZpB79F/8AZvzrI83C0/aVVE82lNQHrT5DUdd9GPLE+qSsh8YrpfBGnf2j4is4iuY0bzX+i8/qcD8a52IV6p8JdO2W13qDrzIREh9hyf1x+Vc1eV3Y5cZV9nSbPQaKKKxPmDhPivqPk6Xb2KH5rh97j/ZX/wCvj8q8gv8A5rWUDsK634g6l/aHiS5KnMcH7lP+A9f1zXJSYcMp/iFb0Yc1z6TCUeSjbucxu5NMbk0TjyrhlPrSGuKceV2PMmrOwtFJRUk3FPWgGkNKKAFxTh1pvelpDJo6vW/UVRjq9b9a56uxpE9d+Cf3tW+kX/s9eo15d8E/vat9Iv8A2evUa6cL/DRw4j42UPEH/IB1H/r2k/8AQTXzdNX0j4g/5AOpf9e0n/oJr5tnIFc+M+JHRhNmVz1qWKoCwB61NEw4rnktDrR6h8G/+QjqH/XFf516rXlPwaOdR1D/AK4r/OvVq78J/DPOxX8RkF//AMeNx/1zb+VfN0vJwK+kb/8A48bj/rm38q+drS3aWYEg4rnx26Lw7tFsuaTa4G9hV65nCOig87hSlhBDgVjlpZrpTg43CvPUG3cinCVSTkz6Noo7UV9AtjnZ5/8AEL/kLwf9cB/6E1cv2rqPiF/yF4P+uA/9CauX7V4Ff+NI87Fbh3pKXvRWbOWhuex2n/HrD/uL/KpaitP+PWH/AHF/lUtfRQ+FHtLY4T4i/wDH7Z/9cz/OuSrrfiL/AMftn/1zP865L0rx638Zni5huw7fjRS44pDVxPnam4UH9KBRWiMGJRilxRTEGKSlpDTuNBxSdTRRWcmdNGN2JXpHgOy+zaN5zDD3Dbv+Ajgf1P4157awPc3MUEY+eRgg+pNew20K29vFDGMJGoRfoBirwkeabl2PqMBTsrklVtUu1sdPuLlsfu0JGe57D88VZrkviFe+XZQWan5pW3t9B0/X+VdtafJBs9CpLli2cG7M7szHLMck+ppB1pKWvJh3Pna8+aQGrej2hv8AVLa2GcSOA3+71P6ZqnXYfDuy33VxeMOI18tfqeT+n86qEeeaidODp3kjuwAAABgDoKKKK9laHtnO+Or37NophU4e4YJ+A5P9B+NebV0njy9+06z5CnKW67f+BHk/0H4VzdeZUlz1GeJmNXWwh60UUd66IHzNWV2NfpxTEfJwakPNV7lDjcnUVujFWehYpTzVa2nDjBPI61YzzVIzmnFlLULRbmBkdc5rzXXNPn0q7LR7hGT2r1cnIxWRrempe27Kw5xXXQrSpu6PVyvMZYeaTeh57a6rkATDPvWlFLHMuY2B9q5/UrJ9PumRgdueDUUczxnKmvocNmLStI/Q8LmHPFPdHVfWlFZNrqmcLKOPWtOORJRmNga9enXhUWjPVp1oz2JBRSClq2ai0tNFPFZsApRxRRUMQ4UUDpS1lIQ9asRVWSrEVefidgPQPhN/yMc3/Xs3/oS165Xkfwl/5GKb/r2b/wBCWvXK+aqfEzxsb/ECvn3xP/yHtT/6+Zf/AEM19BV8++J/+Q9qf/XzL/6Gauh8ZpgPiZiP1oj60PRHXtv4D0zt/hZ/yNUf/XJ/5V7NXjPws/5GqL/rk/8AKvZq8Ot8R5OO/iBXzn4m/wCQ7qX/AF8yf+hGvoyvnPxN/wAh3Uv+vmT/ANCNdGC/iF4DdnPT96qPVueqj9a+3wnwnoMhNMNSGmGvWgQRmmNUhqM11REMbrXJeKTm8Uf7Irrj0rkPE5zffhXk5+/9mODHfAYbUw09qZXwqPGGmmmlNIaskaaaacaaaaEKKcKaKcKAHUopKVaTGhwp4po608VDKNjwucavB+P8q9AWvO/D7bdWtz/tV6IBXuZY/caPpsmf7tofjmlFJTgK75M9ocvSnAU2nCsZAKKeopoqRBWE2BIg6VbhXkVXiFXYV6V5GLqWRDdj0f4R6bvvLrUHX5Yl8pP948n8hj869RrC8Ead/Znhu0iK7ZZF82T13Nz+gwPwrdrxW7ny+Lqe0qtgSACTXgXinUf7T1y8u85R3IT/AHRwP0Ar17xzqP8AZvhu7kVsSyjyU+rcfoMn8K8KlNOCvKx6GV0t5sic80ijmkPWnoOa737sT2SeFSSABknoBX0B4csP7M0S0tMANGg34/vHk/qTXkHgPTv7Q8R2iMMxxHzn+i9P1wK9wrz5O7ueJmlW7UArP8QX40vRru8OMxodue7HgD8yK0K8++LWo+XaWuno3zSEyuB6Dgfrn8qTPPw9P2lRRPLp3LMSxJJOST3qnIeanmNVnOa9PC07I+rirKxk63bZImQcHrisyN8jBrpG2sCrjKmsbUbBom3xcp2xU4vCX96J5+LwzvzxK9FQiUg4IpRIvrXkuLR5rTRLS1EZQO4pDMO3Wlytgrk4peAar73PCipEjmcjCmrVGT2Rag2WkYDGTV23dcjFVoNPnfGVIrUtdO243sKiphZ22OmFCb6HqfwRbLav9Iv/AGevUq80+DcSxHVQvORF/wCz16XTow5IWZ5mKjy1WmUPEHOg6kB1+zSf+gmvnGS1kbtX0frv/IEv/wDr3k/9BNeAyUp0lOSuduXU1NO5lDTyTlmAqzDZIuMtmpu9SJW0sPCMT1VRijv/AIRxrHqF/tz/AKpf516fXmfwn/5CF9/1yX+demVnTSUdDwMcrVmQ3v8Ax5z/APXNv5V4fEgRc17jd/8AHpN/uN/KvDLh9q4FcuL1kkLDJyTiQXMuTgUloCZU/wB4VETk1e0+PMiH3FTO1OJ6MnGjTPd6KKK71seIzz/4hf8AIXt/+uA/9CauX7V1PxB/5C9v/wBcB/6E1cv2rwMR/Gkebi9xKKXvSVkzlobnsdp/x6w/7i/yqWorT/j1h/3F/lUtfRw+FHtrY4T4i/8AH7Z/9cz/ADrkh0rrviL/AMfln/1zP865GvGr/wAZni5huLRR2oNXE+dqbhR+NJmj1q7mTFNNpe9GKdxWDrSUpoouNISkpaQ1jUkelhad2dN4CsvtGrtcMMpbrn/gR4H9a9ErA8E2X2TRI3YYec+Yfp2/Tn8a369LCw5KaPqqEOSCQV5b4svftuuXDKcxxnyk+g6/rmvRdbvBYaVc3OcMiHb/ALx4H64ryInJyTk1z42e0DDGTtGwlBpaSuVaI8L4pBXqvhWz+xaHbIRh5B5jfU8/ywK840Oz+36rbW2Mq75b/dHJ/QGvXRwOK6cFC7c2e5g6do3CorudLW1mnk+5Ghc/gKlrmPH175GkrbKfnuGwf90cn9cV21Z8kWzrnLli2ef3Ez3FxJNIcvIxdj7k1HRRXnUl1PlMZUuxDRRRXXE8abuwxSEZp3ak71qjJszL6NoX86Lt1FWLK6WeMEHnuKsOoZSCOKwL9ZNMuPOiBMRPzCtEdEEqq5XudAOaUjIx61WsbpLmJWQg5qzT2OWcXCWpzXibRlu4WZVG7HFeb3EL2sxjkGMdM17VIu9SD3rjPF2h+ahmiX5hzXTSq20PospzHlahJnDfSpoZ5IWypP51EAysUYEEU7Fd8KzjqmfZ053V4m1aamr4Wbg+taKEOMqQRXK7Soqxa3ctueCcelelQzFrSZ20sU1pI6MU4VVtLtLgY6NVqvTjUjNXid8ZqauhRSikH0p1JsoBSijFLWTYDkqxF1qutWYq4MVsB3/wl/5GKX/r2b/0Ja9cryP4Tf8AIxTf9ezf+hLXrlfNVPiZ4uN/ihXz94n/AOQ/qf8A18y/+hmvoGvn3xP/AMh/U/8Ar5l/9DNXQ+I0wHxMxHojofrQnWvbfwHqHbfCz/kaov8Ark/8q9nrxj4Wf8jVH/1yf+Vez14db4jyMd/ECvnPxN/yHdS/6+ZP/QjX0ZXzn4m/5Dupf9fMn/oRrfBfGXgN2c/P3qpJ1q3N3qpJ1r7fB7I9FkRqNqkNRtXrwIYw1GakaozXVAQxuhrjvEjZ1Bx6V2LVxWvtu1KX614nEMrUEvM87MHaCMpqaacaYe9fFI8djDSGlNNqyWIaaacaaaoQopwpBS0gHU5aaKctSykPFPFMFPHSoYy7pLbdQgP+0K9L65ry+1OyeNvRhXqKnKg+or2Mrlo0fQ5K9JIdTgKQU8e/1r0pM964CnCkAp6isZMAFSoKYBzUyDmuWrKyAmhWuj8Jab/aeu2dqRlGcM/+6OT+grBhXkcV6j8ItOy15qLjoBDGf1b/ANlrwMXO7scmLq+zptnpY4FFFJI6xozuQFUZJPauE+Y3Z5f8WtR8y+trBD8sK+Y/+8en5AfrXnMhrU8QX7alq13dsT+9kJGey9APyxWSxrehG+p9Thafs6aiNqaIVEOTVqBCzKqglicADua1rysjduyPUvhNp3lWN1fuvzSsI0J/ujr+p/Su+qhoNiNM0e0sxjMUYDY7t1J/PNX64kfK4ip7So5BXhfjjUv7S8RXcoOY0byo/wDdXj9Tk/jXr3irUP7L0C8uQcSBNqf7x4H868CmarguaSR6OV0tXNleU81XY81LIahavcoRsj3EN70ue2Mj0oFJXVYZXnsoJucbD7VVbR1/hkH41o/jS1lLDU5boylh4SeqMxdHH8UgqaPTLdfvEsau8elJ3pRwtOPQSw1OPQbHbwR/djB+tTLx91QPwpopw61fJFbI1UIrZEinpVmKqq1airhxOwmenfCD72qfSL/2avSK84+EH3tU+kX/ALNXo9eOj5jH/wAdlHXv+QJqH/XB/wD0E14DJ3r37Xv+QJqH/XvJ/wCgmvAZKF8SO7K9pEPepE7VH3p6dq3qfCesz0P4Tf8AIQvv+uS/zr0yvM/hP/x/33/XJf516ZXNT2PnMf8AxmRXn/HpP/uN/KvBZ2ya95vf+POf/rm38q8FClm6VhXtzJs0wNknJhBHubpWraptZPqKhtYsDNW04kX615eIrc0kkcmKxPPPlR7NRRRXux2RicB8Qf8AkLwf9cB/6E1cuK6j4g/8he3/AOuA/wDQmrlx0r5/EfxpHm4sQ0lONFZs5qHxHsVp/wAesP8AuL/KpaitP+PWH/cX+VS19HD4Ue2tjhPiL/x+2f8A1zP865LvXXfEX/j9s/8Armf51yVeLX/jM8XH7hRjmjtS1cT56puJRS0VZkJSUtGaYrCEUUGg0mzSEbsSp9Ptmvb6C3TrK4XPp6mq+a6v4fWfm6jLdMPlgXC/7zf/AFs/nWUVzzUT3cDSu0d7GixRpGgwigKB6AU6iiva2R9Acb8RL3EVtZIeWPmuPYcD+v5Vw2K1PEl79v1m5mBzGG2J9Bx/9f8AGsyvGqT56jZ42MqXkApKXNFTJ6HJQhzSOy+Hdnulub1hwo8pD7nk/wBPzruKy/DNl9h0S2iIw7L5j/U8/p0/CtSvWw8OSmkfQ0o8sUgrzPxte/a9ckRTlIB5Q+vf9ePwr0TUbpbKwnuX6RIWx6nsPzrx6R2kkd3OWYlifUmufGT2gc2MqcsLDRRRRWdNaHyeIndiDrQTRRXQjgkApB1pc8Unoa0RkwNQ3MKzxFGGQanPWkxWiYozcXdHIb5dGvcHJgY/lXT2lwk8QZCCDUWqWSXduysOa5rT7uXS7z7NPkRk8E1R6XKsTC63R2R4+tQzxCVCpGRSwyiWMMpyD6VIKL2PPipU5HnfijRDDKZ4V4rntu4cda9dvbZLiJlYDGK8+1jSXtLlmVfkrWFex9plONc48sjEEfrQ0fNXhFnmmtFjOa1Va59ElcpxsY2yvFb1hceegDfeFZDRjnjmn2bmKUEGvQwmLcJW6G1Go4M6ACngURfOit61MqV6866tc9VO+pFtoxVjZTSlY+3TAjUVYiqMDmpY+tc9ed4gd78Jv+Rjm/69m/8AQlr1yvI/hN/yMUv/AF7N/wChLXrlfP1PiZ4uN/ihXz94n/5D+p/9fMv/AKGa+ga+ffE//Iwan/19S/8AoZq6HxGuA+JmI/WhKV+tCda9r7J6h23ws/5GqL/rk/8AKvZq8Z+Fn/I1Rf8AXJ/5V7NXiVviPHx38QK+dPE3/Ic1H/r5k/8AQjX0XXzp4m/5Duo/9fMn/oRrowX8QvAbs56fvVR+tW5+9VZOtfbYTZHpMhNR1Kajr1oEsjamGpHqM11QJI3rhNXbdfzH/aru34U15/fNuuZD6sa+e4jl7kYnl5i9EiqaY1PNMavkUeSxhptONNNWiRDTKeelMqhMeKWgdKWpGOFOXrTRThUsaHinrTRT1qWMkj4ZT716dZvvtIWHdAa8xXg16LoD+ZpUDc8DbXo5bK02j2snlabRoipAKaBTx9a9eTPpBRTgOtIKcKxkwuOUVPEOaiQc1ZiWvOxE7IVyzCte/wDhDTv7M8O2duy4k2b5PXc3J/LOPwrx7wXpv9peILOArmMPvk442ryfzxj8a95r5+rLmlc8XM6uqgFc18QtR/s/w1cBWxLcfuV/Hr+ma6WvKPitqPn6vFZIcpbJlh/tNz/LH51kziwdP2lVI4OU1Aeakc0wDmu6krRPp0OQc11fw/077f4ktgy5jg/fN/wHp+uK5iMcivWfhTp/k6ZcXzr8077EP+yv/wBcn8q5q0ryscmNq+zpM7qiignAJrM+a3PN/i3qPNppyHp++kH6L/7NXmEprc8V6j/aeuXl0DlGcqn+6OB+grn5DXThY3dz6jB0vZ0kiJjURp7daZXtU1ZHYhO9FBorYYlApaSmMWkHWgUooELThTBTh1qWBKvUVZiqqvarUVefidiWen/CD72qfSL/ANmr0evOPhB97VPpF/7NXo9eMj5jH/x2Ude/5Amof9e8n/oJrwGTrXv2vf8AIE1D/r3f/wBBNeASdaF8SO3K9pEJ61LHzio+9WIEyRW1Z2ienOSij0D4UDF9ff8AXIfzr0qvO/hcu28vP+uY/nXolclB3jc+bxUuao2Q3v8Ax5z/APXNv5V4dbxZOTXuV3/x6Tf7jfyrxmJNorjx8+Wxl7b2cHYcgwKVDmRfrSMcCiEZkX615W7ucFN3ldntNFFFfTR2R1nAfEH/AJC8H/XAf+hNXLiuo+IP/IXg/wCuA/8AQmrlxXz+I/jSPNxe4tJ2oo7VkzmobnsVp/x6w/7i/wAqlqK0/wCPWH/cX+VS19JD4Ue2tjhfiJ/x+Wf/AFzP865Idq634if8ftn/ANcz/OuSFeLX/jM8XMNxaKSlFVE+eqbhSGlxSVZmFJThSGi40JRR3zQamTOijG7Er07wdZ/Y9ChLDEk371vx6fpivO9LtDfajb2y5/eOAfYdz+VevIoRQqjCgYAHYVtgoXk5n0+Bp2VxazfEl7/Z+i3U4OH27U/3jwP8fwrSriPiLebmtrJTwP3rj36D+tduInyQbO2cuVXOJVs0+omBHIpyNnivLjDS542Ijzu6Hmr/AIfsvt+r2sBGULbn/wB0cn+VUK7T4d2fNzesP+mSfzP9KVOPPUUS8HSuztqKKK9vY9g5P4hXvlWENop+aZtzf7o/+vj8q4Ctrxde/bdcnIOY4v3S/h1/XNYteRUl7So2eJj6t2FFFHpW8UfOVXdh3pDTjSGtkcrEopaKtMzYhoNLSZzVpkNCYyKxNe0xbqEsgxIOQRW5imsoYEGqTNqFV05XRyOgam0EptbnIYHAya61HDKCDxXMeI9KJP2i3GHHPFP8OaqZF8mY4cetKWx69ShGvH2kDpa7rTfBui6no9rNeWzPJJGGYiRhk/ga4VSGGRXrnhr/AJAFh/1yFY0neTTPTymkk3dHO/8ACsvC/wDz5S/9/wB/8a434qeDNG0Hw9BdaXbvFO9ysbFpGb5SrnoT6gV7NXn3xtGfCdsP+n1P/QHrd+6rn0dOTukfPzpiotmHFXpkwTVYjLAVtSmdVtTb075rce1ex+D/AAbo2o+HLK7u7d3nkUlmErDPzEdAfavIdMTEA96+gfh+MeENO/3W/wDQjXbiK0uRJM6MTOUKSaZW/wCEA8P/APPrJ/3+b/Gub8e+E9J0jQGurCBkmEirkyM3B9ia9OrkfikM+FX/AOuyVyU6slJanJQrTdRJs8TK4NPQcinMKEFelKd4ntndfCf/AJGKb/r2b/0Ja9bryT4Uf8jFN/17N/6Etet15M92eLjv4gV8/eJ/+Q/qf/XzL/6Ga+ga+fvE/wDyH9T/AOvmX/0M1pR+I1y/4mYj0J1ofrQnWvafwnqHbfCz/kaov+uT/wAq9mrxn4W/8jVF/wBcn/lXs1eJW+I8fHfxAr5z8S/8h3Uf+vmT/wBCNfRlfOfiX/kO6j/18yf+hGujBfGaYDdnPz9TVV+tW5+9VHr7bCbI9EhamGnmmmvWgIjamHpTzTG6V1QFYr3bbLeRvRTXnspy5Pqa7vWH2afMf9muCbk18pxFO9SMTxcxfvJDDTGp5phr5tHmsYaYaeaYatEiHpTac3Sm1QiQdKUU0U4VIxwp4pq9aeKljQ4U8U1aeKhlIkFd14Rk3aWV7qxrhVFdf4KkyLiMn0YV1YGXLVR6WWz5ayOpFOAzSYp46V7rZ9UKBT1HNNFPXmueoxXJUGatwrmq8Qq7AvIA6142LqWQpOx6h8I9N2xXeouvLEQxn2HLf0/KvRazPDOn/wBl6FZ2hGHRAX/3jyf1JrTrxz5fE1PaVHIjuJkt4JJpWCxxqWYnsAMmvn3V7x7/AFC5u5PvTOXx6ZPAr1v4k6j9i8OvChxJdMIh/u9W/Tj8a8YkPWnFXlY9PLKVk5sibk0ijJo709BzXa3yxPWLFtE0kiog3OxCgDua+gdGsl07SrW0TGIowpI7nufzryP4d6d9u8RwMwzHbgzN+HT9SPyr2iuC922eJmdW8lBBWD431H+zfDl1IrYlkHlR/VuP0GT+Fb1eX/FjUfMvrawRvlhXzHH+0en5D+dDOPCU/aVUjz2U1UkNTSmq7mvSwsLI+pirEbU2nGkr1IloSkpaSrQCUUpFJ0qihaKKKAFFKKSlFSxEi1aiqqvarMNefidiJHp/wg+9qn0i/wDZ69Irzf4P/e1T6Rf+zV6RXjI+Yx38ZlHXv+QJqH/XvJ/6Ca8Ak617/r3/ACBNQ/695P8A0E14A45oXxHble0iNRk1oWkfAJqtBGWYcVeZhGgA61GJndWRviKnM+VHc/DFs6hej0iH869Drzb4VnOoXx/6ZD+dek1NBWgePiVyzsRXX/HrN/uH+VeOdBXsl1/x6zf7h/lXjLHtXn5lvE46iuhPvGpYhh0+tMRakj++v+8K81vVHNGXvWR7LRRRX08dkdpwPxB/5C8H/XAf+hNXLiun+IP/ACF4P+uA/wDQmrmK+fxH8aR5mL3DtSUtJWTOahuexWn/AB6w/wC4v8qlqK0/49Yf9xf5VLX0kPhR7i2OF+In/H7Z/wDXM/zrkq634if8fln/ANcz/OuSFeJiP4zPGx+4tFFLVRPnqm4maM0UYqrmdgzSUpFJRcqKEopaSsps9HC07s6z4e2XmXk94w+WJdi/U9f0/nXeVkeFLP7FodupGHkHmv8AU/8A1sVr162GhyU0j6elHlikB4HNeQ63fjUdWubgHKs+E/3RwP0Feg+NdR/s3w5dSK2JJB5SfVuP5ZP4V49BcYIBNTiabqKyN5YaVWk5I0zzUTDaafHIGUYpzDNcOsNGeDaUJ8shqNkV654ds/sGjW0JGH27n/3jyf8ACvNPDVib3XLWEjMYbe/+6OT/AIfjXrldGDhduZ6tGmoq6CqWtXgsNLubn+JEO3/ePA/XFXa434iXuIrayQ8sfNf6Dgf1/KuqvPkg2aVJcsWzhyckkkknqaKKDXl0kfMYud2JS0UGupHkT1EpaT+VLWiZjJCUUYoq0zJhRiikqkSJ3opccUYqkxEUsYdSrcg1yOsae9lci4txgdTiuy9agu4FmjZWA5FKTPUy+u6crPYz9E1AXEIDH5hXuXhnnQLD/rktfOzQyabebl+4TX0J4RfzPDGmP/egU1lQ+Nn2GGpxj78dma9cL8Y4TP4VhVeoulb/AMceu6rlfiOofQolPI+0L/6C1b1naDOmUuVXPnKcEMQ3BFQxKXl+tb3iTTzExkjHFZ+lQE/vGHArbBL2ljtws1Wasa1qm2NV9K958A/8ijp3+63/AKEa8Kh617r4B/5FLT/91v8A0I104nR2OvHq1NHQVyXxQ/5FZv8Arqn9a62uT+J//Irt/wBdUrlW552H/iRPGHHNItOkpqda9CL90+hO5+FH/Ixzf9ezf+hLXrdeS/Cj/kY5v+vZv/Qlr1quCW54uO/ihXz94m/5D2p/9fMn/oZr6Br5/wDE3/If1P8A6+Zf/QzV0fiNMv8AiZiP1NInWlfrSJ1Fe19k9U7b4Wf8jVF/1yf+VezV4z8LP+Rqi/65P/KvZq8Wt8R42O/iBXzp4m/5Dmo/9fMn/oRr6Lr508Tf8hzUv+vmT/0I10YL4zTL92c/P1NVJKtz96qSV9vg9kekyI0w080w160BEZpjVI3FRtXTARj+JZNmnkD+I4rimrqfFsmFijz15Irlmr4jO6nPiWux89jZXqMYaYae1MNeQjiGmmGnGmmqQhDTTSmkNUIeKeKaKcOlSxjlp4po608VDKHLUi0xakFSxokXpW/4Sl2als4+dSKwFrR0eXyNQgkz0YVVGfLUTOnDS5KiZ6OvP0p601etPFfROV0fYJ3Vx1SoKjHapkWuSrKyGTxLXV+A9O/tHxHaRsuY4j5z/Ref54H41zMIr1j4S6d5dldag6/NK3lIf9kdf1P6V8/ip3djkxlX2dJs9AooqG+uUs7Oe4lOI4kLt9AM1yHziV3Y8p+KGo/atdFsjZjtU2/8CPJ/p+VcM5zV3ULl7u6muJTmSVy7fUnNUTya1oK+p9RQp+zgoiDrU0YqJRzVy0heaZIowWd2CqB3JOBV152VjVuyuep/CvT/ALPpE1664e4fCn/ZXj+ea7equlWaWGnW1pH92KMJn1wOTVquZKyPl69T2lRyGyuscbO5CooLEnsK8A16+bUdUurts/vXLAHsOw/AYr1v4h6j9h8NzIpxJcnyV+h+9+gI/GvFJTyacVzSSPUyylZObK8hqBjUr1E3WvYoqyPZQ002nHpSGutMoaaKXNJWiYxM0UGiqAKBRS0ABoFJ3pRSYEi9qtQ1VWrUXWvPxOxDPT/g/wDe1T6Rf+zV6RXm/wAH/vap9Iv/AGevSK8dHzGP/jMo69/yBNQ/695P/QTXgRGWr33Xf+QLf/8AXB//AEE14VCmWzis5y5WdGBnyQkPhAjXJqJ33NiluGPQcUWsRkYd6idox5mbJqPvyO9+FS4vL0/9Mx/OvR64H4apsurv/rmP5131LDS5oXPKrVPaSciK7/49Zv8AcP8AKvGUGTmvZrr/AI9Zv9w/yrxxRgVwZk7OJy1pWiOFLH99fqKTHNLH/rF+ory+qOGk7yPZaKKK+qjsj0zgPiD/AMheD/rgP/QmrmK6f4g/8heD/rgP/QmrmK+exH8aR5eM3FNNNOPWmmsmc2Hep7Faf8esP+4v8qlqK0/49Yf9xf5VLX0sPhR7q2OF+In/AB+Wf/XM/wA65MV1nxE/4/LP/rmf51yfavExH8Zni4/di9qBRQKcTwJ7hRRRVGYhpKWjpSbNIK4hq3o1p9v1S2tsZV3G7/dHJ/TNVG4rrvh3Z7prm9YcIPKT6nk/0/OppR9pUUT3sDSu7ncgADAGAKKKR2VEZnICqMknsK9zZHuI82+Kt6Zbq2skPyxKZHx/ePT8h/OvOySDXQ6ze/2pqNzcn/lo5Iz2HYflisK6iKmow8+aTuethpqMfZyLVncYOCa1I3DAYNc2h2kVq2U2cCscdQS1RxY7L03zxPSPh3ZYW5vWHX90h/U/0rs6oaDZ/YNItrcjDqmX/wB48n9TV+tMPDkppHJGPKrBXk/iO9+36zczA5j3bE/3RwP8fxr0PxRff2fod1MDiQrsT/ePH6dfwryZHBrlxsr2ijDFX5NCTvQaKO9YQVj5bEO7DHFAGRS5o963TOGSEoNHeiqRlJCUUvtSVaZm0GBzRQaM+1UmZtCHijtilNJ9KoLCEdKOxpT1ozUyeh0UdynfWqzxkEc16/4NQx+FdLQ9VgUV5Wea9b8MjGgWA/6ZCs8O/fZ9ll1RyhY0q5f4if8AIEh/6+F/9Bauorl/iJ/yBIf+vhf/AEFq6K/wM7q3wM8xvLdZ0IcZrDubcRHCDCjpiulPNUb23DDNGArezepx5fjPY1bMxYete6+Av+RS0/8A3W/9CNeHFCj17l4C/wCRS0//AHW/9CNduIlzO6PpcZNTpJo365P4n/8AIrt/11Susrk/id/yK7f9dkrBHBh/4kTxl+tNXinv1pi13Rfun0J3Xwo/5GOX/r2b/wBCWvWq8l+FH/IxS/8AXs3/AKEtetVwy3PFx38UK+f/ABN/yH9T/wCvmX/0M19AV8/+Jv8AkPan/wBfMv8A6Ga0o/EaZf8AEzEfrQlD9aROte19k9U7b4W/8jVF/wBcn/lXs1eM/C3/AJGqL/rk/wDKvZq8Wt8R42O/iBXzn4m/5Dmpf9fMn/oRr6Mr5z8S/wDIc1L/AK+ZP/QjXRgv4hpl+7MCfvVR+9W5utU3r7fCLRHpkRpppx600160BEbdaY/Snmo3rpTsrky0RyHimTdeBf7orCatDWpfNv5TngHFZ7V+d46p7SvKXmfMV5c1RsY1MNKaaa5UYDWpppTTTVoTENNNONNNMRKKcOlNFOFSxoeKkFRipFqGUPFPWmLUi9ahlIkWrERwwI9agWpUqL2ZcXZnpdhIJ7OCXuyCrYFYnhSbzNMC942x+Fbq19BRnzU0z63DT56aY5etWIxnFQqOTVqEVyYmdkblq2jZmCqCWJwAK+g9AsBpmj2lmMZijAbHdupP55ryD4fab/aHiS2DDMcH75/+A9P1xXt1fP1Jc0mzxsyq3aggrj/idqH2XQltUOJLp9p/3Ryf6D8a7CvIfiNf/bfEDxKcxWyiIemep/Xj8KxqS5Uc2Cp89VeRx0lQkfNVh19KYENbU6iSPohqLXYfDjTvtviKKR1zHbKZT9ei/qc/hXLRpXrPww0/7Nosl0ww9y+Qf9leB+uaxnPnlY5MbV5KT8zsqKKivJ0tbSa4lOI4kLsfYDNW3Y+eSu7HlvxR1A3OspaI2UtU5/3m5P6Yrg5a09Rne7vJ7iU5eVy5+pOaz5F5qKFROVz6jDw9nTUSq4qMirJTmmFK9aFZWOhMr7TmkIqwUpCntWyrodysVpCKsFKPLq1XQ7lfFIRzVgpSFMVoqyY7kGKSpCpzwM01l2/eIUe9aqaFzJDRSioJbu3i6vuPtVSTVgOIox9TWc8TTjuzKWIhHdmugJ7VZjwv3mA+prm/t9xL/EQPap4PMc5YmvIxWOhayOeWNj0Pa/g6ys+qhWzgRf8As9ek15X8DxhtX+kX/s9eqVw0p88eY8LFy56rZS1z/kCahjr9nk/9BNeD3U7W9vkH5jXvOtf8ge//AOuEn/oJr521GUzS7V6VxY2bjJWJpyaiyhGbi9ucb2xmuv0y0EEIz96qWiWIVQ7CtzGBgVw1azkrHm4rGNvlTOs+Hn/H7d/9cx/Ou6rhPh5gX12O/lj+dd3XpYD+Cjei7wRHdf8AHtN/uH+VeOCvY7kZtpQOuw/yrxwVyZo9Yk1ldDs0qf6xfqKZT4gTKgAySwryk9UctODUj2SiiivrI7I9A4D4hf8AIWg/64D/ANCauYFdP8Qf+QvB/wBcB/6E1cyBxXz2I/jSPJxj1CmmnUhrJnNh/iPYbT/j1h/3F/lUtRWn/HrD/uL/ACqWvpYfCj31scN8RP8Aj8s/+uZ/nXJV1nxD/wCP20/65n+dcmK8TEfxmeJmG4valFJRQjwJ7hQaKDwKohCUhNKaRjgVEmdmHhzSGOwUEnpXqvhez+xaHaxsMOy+Y/1bn/634V5ZpEP9qeIbKwUZRn3Sf7g5P6DH417RXZgaermz6vD0vZwQVzfxB1Iab4an+bElwfIX8ev6A10leS/FvUDc6vDYofktky3++3P8sfnXZXqezhc7sPDmmjkYrhQ3yyD6VaYCVM1zsqHPFSWdzNC4G47fQ1yRxC3O+tG/vLc0niKtW/4JsTf+ILSIjMaN5j/Ref54H41kxyCaPOOa9F+Fmn7Le7v3XBdvKQn0HJ/XH5VvHEKs1EJ1/wB077neUUUjMFUsxAUDJJ7V1PRHknC/Ea88ya3slPCDzH+p4H6Z/OuFfMZzWtq14b/U7i5OcSOSuew6AfliqLoGFeL7fmqts5qk2nZjYpNwHNS9apEGNvarEUm4e9dEkt0eTisE370SUHiigdaKz57HlSw7QCgigdaKtVDGWHYUGikqlMylQaAUUppDWilc55U2gxSmkzQea0TM7CHrRR3oNTI2o7h61614a/5AFh/1yFeS1614a/5AFh/1yFRhvjZ9dlmzNKuU+JLbdDgP/Tyo/wDHWrq6474pHHh+A/8ATyv/AKC9ddRXi0euo8+hwQORmkdQy1Wtps4BNW+1cfK4Hz2Kpyo1TMurfBJr2LwGMeE9PH+y3/oRry2VNwNereDBt8MWA/2T/wChGuilVc3ZnuYbEurRUX0NquT+J3/Irt/11SusrlPiZ/yLDf8AXVK3eh1Yf+JE8akHNNUc1M601V5rojVXKfQnafCn/kYpf+vZv/Qlr1qvKPhWMeIpf+vZv/Qlr1eue9zxcd/FCvn7xP8A8h7U/wDr5l/9DNfQNfPvic/8T7U/+vmX/wBCNbUF7xpl/wATMV+tCdaHoTrXt/ZPWO2+Fv8AyNMX/XJ/5V7NXjPwt/5GmL/rk/8AKvZq8Ot8R4uP/iBXzn4m/wCQ5qX/AF8yf+hGvoyvnPxP/wAh3Uv+vmT/ANCNdGB/iGmX/EzAm71Tkq3MetVHNfc4RaI9RkVMapO1RtXrQQrDDVa7kEcEjnoqk1ZbpWR4im8rTXA6vxSxVT2VGUjDES5INnFzMWlY+pNQmnmoz1r85k+Ztny7d2MNNNONMNNEjTTTTjTaokaaSlNIapASrTxTBTx0qGNDxT1pi08VDKJFqRajWpFqGUiRamWolqVayZaOo8G3G2eWEn7wyPqK69BXnWiXH2bUYZCcLuwfpXo6YP0r1cFUvT5T6DLanNT5exLGKuQjmq0QrQtIWlkRI13O5CqB3JrlxlSyPSbsj1X4Uad5Ol3F86/NcPsQ/wCyv/18/lXd1T0eyXTtLtbRMYhjC5Hc9z+dXK8g+ar1PaTciO6doraV40MjqpKoOrHHSvHrnw7rc80kslhOzuxZjgckmvZaKyqUlPdl0MQ6F+VHiTeFtZ/6B0/5CkHhbWf+gdP+Qr26il7K3U6f7SqdjxaLwtrBZV+wTDJxk4wK9i0+1SysYLaP7kSBB74FT0VUKag7nNXxMq9kwrn/ABwl5caKbawgeZ5mAfb2Uc/4V0FFVOPMrGMJcklI8WfwxrB/5h8/5CoW8Layf+YdP+Qr2+isoUFDZnf/AGlU7Hhp8Ka1/wBA6f8AIUn/AAietf8AQOn/ACFe50Vsk11H/adTseF/8IprX/QOn/IUHwnrX/QNn/If417pRT17h/adTseFf8InrX/QOn/IUn/CJa3/ANA2f8hXu1FNSfcP7Tqdjwg+Etbxxps/5Co5PCWtqMjS7hj6ACve6KpVJLqH9p1Ox81a7pOuaXbefd6fNawbgm9gMZPb9K5WYzSklmNfQvxlAPhBc/8APyn8mrwSYAE1zVcTNS5bk/WZ1FdmcYTnk04RqO1Sv1ph61m5uW5i5NkkeB0xV63aqCVcgPSuepqVFnrXwTlAvtSizy0SN+RP+Nes14h8IrvyPFaRnpcQvH+PDf8Aste3104R3hYwr/EV9SjM2nXUQ6vE6j8Qa+fLC0M0wYjivouvHr+wGn6pdwAYCSMF+meP0xXJmKtaRz1KnJBkEKBEAAxTzwKBTJG7DrXmbnzrk3O7NzwTdi38QRKxwsymI/U8j9QK9Mrxm3LROsiNtdSGVh2Ir1jRdQTUtPiuEI3EYdR/C3cV6eXVVZ02e1hailGxerzfxNoE2n3Ek9vGXs2O4FRnZ7H/ABr0iiuvE4aOIjZnU1c8YzXQeEdHlvb+K5kQrawtu3EffI6AetegNZWrNua2gLepjGanAAAAGBXFRyzknzSdxKKQUUVU1a+j06wluZf4R8q/3m7CvUlJRV2NuyuzgvG04n16RQciJFj/AK/1rCxT5pHnmeWU7pHYsx9SabXzk5c83LueBiqnNIQ0AFmAHUnAoNXtAtzda1ZxYyPMDH6Dk/oKSXNJJFYWN5HqyLsRVH8IApaKK+lSsj3UcF8QmzqdsncQ5/Mn/CuXFbnjWYS+IJVHIjVU/TP9awxXg1nzVZM8DMJe8xaOKSlFNHhSeolBPFH4Uh9KoIq7A1n6neCCI4PzGrN1OsMZdj0rkbu6a7uSc/KDSsfSZVg+d8zPTvg9YNK99q0wyT+4jJ/At/7L+tem1j+ENN/snw5Y2hXEgj3Sf77cn9Tj8K2K9ehDkgke3N3egMcKTgnAzxXi+reH9d1DULm6k06fdM5fGBxk9K9ooqa+HVa12XRrOlqjwdvCGuE/8g24/IUweD9cz/yDLj8hXvdFY/UY9zb65LseHW3hfXIzzptxj6CvYtBsRp2j2trjDIg3f7x5P6k1forWjho0ndMxqVnU0CsnxU11/Yk8dhC808uIwE6gHqfyzWtRW8480XEzTs7nkyaBqxHNhMPwp/8Awj+q/wDPjN+VerUVwLLoLqTUSnqzyWTw5qjD/jxm/KoR4c1hDkWE35V7BRW0cIlpcUYpKx5Mmg6vjmwm/Kn/ANgar/z4zflXq1FJ4KL6mE8NCTueU/2Bqv8Az4zflQdA1X/nxm/KvVqKX1KPczeCpnlH9gar/wA+M35Uv/CP6r/z4zflXq1FNYOK6kSy+mzyO60fULWBpri1kjiXqxHAycVRr1Dxn/yLV5/wD/0Na8uqJx9nKyPDzHCRoytEDRilNFWmeFNWY00po+tFEjSk9RPWvV/Cr7/D1if9jH5EivKK9K8BzeboCpn/AFUjJ/X+tRh3aofVZXLodFXK/EmIy+HRgZ2zqx/Ij+tdVWT4rtTd+H7yNRlgm8f8BOf6V2VPhdj2r21PEAxikrTglDpVW8h6kVBay7G2k4ojFVqd0c2MpLEQ5lua1el+A5xL4fjjB+aF2Qj6nP8AWvMkYMBXS+CNUWw1MwzNiC4wpJ6K3Y/qR+NccH7OpqcGDn7OXKz0qsrxPpZ1jRp7RGCyHDIT03DkZ/lWrRXc9Ue1GTi1JHgup6XeadMY723khbOAWHB+h6Gq0FvJNKscMbSSMeFQZJ/CvoJlDAhgCPQ02KGKL/Vxomf7qgVHI9rnorMXbVanG/D/AMN3GlvLe36+XNImxI85IXIJJ9+BXa0UVcVZWOCrUdSXMxsjrHGzuQFUEknsK+cb+c3FzNM33pHLn6k5r1v4na2tjpH2CF/9JuhhgDysfc/j0/OvG5WzXdhKbbuengKbjFyfUjY5NOTrUZ61LEOa9WppE9A7v4TxF/Erv2S3Y/qo/rXr9ecfB+zIi1C9YcErCp+nJ/mtej14NR3keHjZc1VgelfN/iKQSaxfuvRriQj/AL6NfRN9OtrZXFw/3Yo2kP4DNfNF25ZiWOSTkmu3Lo3nc6MvW7M+Y81VerExqs9fc4WOh6Yw0w040xu9epFCGGuY8XTf6qIfU107e1cL4gn87UpT1CnArys8rezw/L3POzGfLTt3MtqjNOY0018Uj58YaaaU009KpEsaaaaU0hqhCGmmlNJVATCnimCnioYxwqQVGKkFQyiRakWo1qRahlIlWplqFalSsmWiePIYH3r0nSJhcWEEgOTtwfrXm0XWu18Gz7oZID1HzLWuGq8k7dz0svqcs7dzqYhXZ/DjTvt3iSBmXMduDM31HT9SD+FchCOlew/CrTvs+jTXrrh7l8Kf9leP55rLFzu7HrYupyUn5nb0UVFdzpa2s1xKcRxIXb6AZrjeh8+ldktFeen4kY/5hY/8CP8A7Gk/4WT/ANQv/wAmP/sahVYs6fqdbseh0V56PiRn/mFj/wACP/saevxFJ/5hg/8AAj/7GpdeC3YfU63Y7+io7d3kt4nlTy5GUFkznaccjNSVqnc5noFFY3ijXk0GzjmaLzpJH2qm7b2yTnB/ya5Y/EjH/ML/APJj/wCxqHUinZm9PDVKi5oo9Corzv8A4WV/1Cx/4Ef/AGNJ/wALL/6hQ/8AAj/7Gnzov6lW/lPRaK86/wCFl/8AUKH/AIEf/Y0n/CzP+oV/5Mf/AGNPmQfUq38p6NRXnP8Awsz/AKhQ/wDAj/7Gk/4Wb/1Ch/4Ef/Y0XD6lW/lPR6K84/4Wd/1Ch/4Ef/Y0D4m5IH9lD/wI/wDsaYfUa/8AKej0V5dJ8WQkhT+xs4P/AD9f/YU1vi2B/wAwX/ya/wDsKylXhF2bMpUJx0aNn4ynHg9f+vlP5NXgk1d/42+IA8SaOLAab9mxKsm/z9/QHjG0eteeSnqa5aklOd0aR92NmQP7UynMaYapEtki1ZhPSqimrthGZZQO1ZzWgufl1Oq8JztYala3v/PGQP8AUZ5H5V9FI6yIroQyMMgjuK+bJJlt4VjXqa9o+GWqnUfDUUUpzPafumz3X+E/lx+FGEnaTi+pnKXNqdZXDeP7Ax3MV8g+WQeW/wDvDp+n8q7mqup2UeoWMttN91xwf7p7GunFUfa03ExqQ542PIycCo1G9jmrGoWstndyW064kjOD7+49qjQYr59e7ozwa8HBjgO1aegavLpF3vGXgfiSP1HqPes2inGTg+aJnRxDg7nrdhe29/brNayB0PX1B9COxqxXkdleXFjMJbWVon74PB+o710lp40uEUC6tUkP95G2/pzXrUswg1aejPap4yElqdxRXJ/8Jrb/APPpL/30KpXnjO4kUraWyRH+87bj/StpY6ile5o8RTS3Oxv72Cwt2mupAiD8z7Ad6838QazNq9wCQUt0P7uP+p96pXl3cXsvmXUzyv6sen09KgrzcRi5VtFojz8TjLqyCiig1zbHmXc2Ia6/4f2JaWe+cfKo8tPr1J/l+dctZ20t5dR28AzJIdo9vevVtNs47CyhtovuxrjPqe5/OuvA0eefO9kezgqVtWWaR2CIzucKoySewpawfGd/9j0d41OJbj92Pp/Efy4/GvXqzUIOTO+cuWLbPPr64N1ez3DdZXLfTJqGgUuK8GOruz5XF1bthRRRWqR5blqITTJXCKSTwKccVz3iTUxBGYkb5zVxjc78Dh3WmkUde1Ezy+TGflHWtDwDpf8AaniWxgZcxK/myem1eefrwPxrlbcFm3HkmvY/gxpmy3vdSdeXIgjPsOW/9l/Kt4Q5ppH3lGksPR0PTKKKRmCKWYgKBkk9q9PY5dxaK84m+J6JI4TS9yAnDG4xkeuNtR/8LSH/AECP/Jn/AOwrm+t0u5v9Wqdj0uivNV+KIP8AzCf/ACZ/+wqVfiZu/wCYV/5M/wD2NDxlJdQ+rVOx6LRVXSrp73Tre6kh8lpkD+Xu3bQenOB2q1XQmmrowas7BRWV4m1mPQtKa8kj81twRI923cT74PbJ/CuMHxPXODpX/kz/APYVlUxFOm+WTNI0pyV0j0iivOm+JeFyulZ/7ef/ALGq7fFUKcHR/wDya/8AsKn61T7j9jPsem0V57Z/ElLkcabtPp9oz/7LV0eOsj/kHf8Akf8A+xpfW6XcwnJQ0kdrRXFf8J1/1Dv/ACP/APY01vHZA403P/bf/wCxo+t0u5HtoPqdvRXnTfEwJN5cuk7ff7R/9hV6Px6HAI0/j/rv/wDY0/rVPuVKcYq7O3oriv8AhOv+od/5H/8AsaP+E6/6h3/kf/7GhYmm+pi8VSW7Nvxn/wAi1ef8A/8AQ1ry8V1GteLP7S0ya0+xeV5mPn83djDA9Me1cuPpXPVkpyujwc0xEKkrxYdqDQaQcmrifOzd2BopaSmwg7MK7H4dXe25urRj99RIv1HB/mPyrjquaNenT9St7oZIjb5h6qeCPyrC/JNSPoMurcskev0EAggjIpI3WSNXQhkYAgjuKWvT3PqNzyHxJp/2DVbm3Awgbcn+6eR/hXNXURRsivWvHmlG6s1vYVzLAPnA6lP/AK3+NebXEW9TXJSm6FTlexyOTpTt0K9lNkAHrV2sc5hl9q04H3qK1xNJNcyOLF0uR+0idz4X8ViJEtNUY7FGEnPOPZv8a7eORJY1eJ1dG5DKcg/jXilWrHVL7TWzZXDxjqV6qfqDxWFKs4+7I2w2NTtGR7HRXl6/ELUrfie2tpQO4BU/zps/xNu8YisIEPqzlv8ACu+EXPY9mnQnUV4nqVcv4q8Y2WixvFCy3N90EanIQ/7R7fTrXmur+NNY1JCklz5MR6pANg/Pr+tc08ma6aeGlJ6nbRwGt6ha1bULjUbyW6u5DJNIckn+Q9qznOTQzZpvWvWpUlBHpqKSshRyasRLUca12Pw90I6trCSSp/olsRJISOGPZf8APYVz4qqkrE1JqnFyZ6f4M006X4cs4HXbKy+ZID13Nzg/Tp+FbdFFeO3c+dnLmk2zlviVfix8KXKg4kuCIV/Hk/oDXgtw3Jr0b4u6sLjVYdPibKWq7nx/fb/AY/OvNJ25r3sro9T2cFT5Kd31Kspqu3WpZDzULGvssPGyOsaTUZpzUwmu+CEV7yUQ20sh42rXnk7l5GY9Sc12Him48uyEYPLmuLY8mvks+r89VU10Pn8xqc0+XsMNNY0pphNeCjzRDTDTmphqkSIabSmkNUIaaKDSGmInFOFNFOFQyh4qRajFPWpZSJRUi1EvSpBWbKRKtSrUS1KnWs2UizCOa6Lw3L5F/Gx6N8prAgHNbNgpDKR1Fcs58judVB8skz02xgeeeOGJd0jsEUDuScCvofS7RLDTra0j+7DGEz64HWvG/hJZ/wBp6xb3DrlLZDI3+90H6nP4V7bSlPndzux1XntFBXJ/ErUPsnh8wKcSXLhP+Ajk/wAgPxrrK8m+J1/9q10W6nMdqgX/AIEeT/T8qym9DHB0+eqvI453qPfQ9Mq4U42PoCdGzXQ+DbH+0dftIiMxo3mP9F5/U4H41zkYr074Vafstrq/ccufKQ+w5P64/KuedNOaRz4qp7Om2d9RRUN7cJaWc1xKcJEhdvoBmujY+eSuzy34l6j9p1wWyNmO1Tb/AMCPJ/oPwri3erV/O91dTTynMkrl2+pOaovWNKKm7s+moQ9nBRAvTd/vTDTSDXfGlE3JN+aQv71HRWipRGPMlG+o6TmrVKIEhkpBJgio+aQgke9aKlEZm6k5juz2B5qNpcqMGrWpwGWIOoyy8GshHIGGNePjMPyyujxsXTcZ3JneoWbmgkGmMa5FGxwSbEY5pDSH600tjvV2IuSKMkAda3dPRbeDzG61lafF5j7j0FWLy63yLDF9OKzmmzlqzL9oHvboY5Ga9N8FXg0a+jZziCQbJPYdj+H+Ncl4Z07yoRI4+Y10GMCuCpNwkmjy6mPtPlR7ICCMg5BorlfBesieFbC5b99GP3RP8S+n1H8q6qvao1VVgpI9alUVSPMjA8V6GNTtxNbgfa4hx/tj0/wrztlZGKspDA4IIwQa9jrn/Enh2PUgZ7YrHdgcns/19/euHGYPn/eQ3OfE4f2iujzwUtSXVtPaTtDcxtHIOoYVEDXk6rRnh1aEosKMUUUaGN5RDFGO9FFOyHzyYAUYopKL2CMZSA0AFmCqCzE4AHUmpLaCW6mWK3jaSRuiqK77w14cTTsXF3tku+wHIj+nv71tRoTruy2PSw2Eb1YvhPQ/7NgNxcgfa5ByP7g9Pr610NFFe9SpxpR5YnsxioqyAkAc9K8x8Uan/aeqO0ZzBF8kfuO5/H/Cum8aayLaA2Nu37+UfOR/Avp9T/KuCFedja/M/ZxPMx+JUVyIUUopKWuWKPl61S7E70N0pSeKguJQik5xW9ODm7IijTlVmoop6vfrZ2zMx5xxXntxdPd3LSOc5PFdFrQW+kxK7bB2FUItNhH3WP4160cvnGNz9EynKJUoKbRBagkgDr2r6X8K6aNI8P2NmRh0jBk/3zy36k14z4C0JL7xLZo3zRxN5zjHZef1OB+Ne91jSpOEm2dWNvFqAVznxB1L+zfC12ytiWceQn1br+ma6OvKfjDftLfWlhGflhQyPj+83T8gP1qsRLlg7HPh4c80jzmWWoDLzTZtwqEE55FeZGnoesy7HJk1ueGrI6prNnZjOJZAGx2UcsfyBrnoa9P+D2m+Zd3eouPliURIT/ePJ/IAfnSjS55pGdWfJBs9TVQqhVAAAwAO1LRSSOsaM7kKqjJJ7CvZ2R4+55Z8XtU339rp6N8sKeY/+83T8gP1rzSWX3rV8R37anrF3eNn99IWAPZegH5YrDlJya8aT9pUcj1oR5IJFm3u8Hax4p1ym5d6VltnOat2tyfut0rVQRjNNaoS2vGt5gc8d667T7tbiIEEVyF5Bkb0pdKvXtZgrE7aTpo8/FUXUjdHd0hqvZ3Czxgg1YrLkSPmarnTlYz9UtBPGSv3h0rL07UWtp/IuCRzjJrpDyORWFrum+ahkjGHHNaximdFDEOa5JG3G4dQVORTxXLaLqbRP5FweRwK6hHDKCKfIkcWLhOmxTRRRWkUePUk3uFHHag0YrVHI2FJS0ZqgUhKKKTvWNSNzvw1blZ6D4D1YXFobCZv30Iymf4k/wDrV1deNWdzLZ3UdxbttljO4H/PavV9G1KHVbFLiEgHo6Z5RvStsPUuuV7n2GCxKqws9y8QCCCMg15z4u8PNYStdWik2bnkAf6s+n0r0akdVdCrqGVhggjIIrWrSVRHXUpqaszwi7h3DIFQ2zlGwa9D8SeEGXfcaUu9Dy0Hcf7vr9K4C6gaOQ5UhgcEEYIqKc3Fckzn9m2uSRbU5FKagt3JGDVjFYySTPCrUpUp6FK8hypIrEuVKMa6Z13DFZd/bZyRXpYKvFOzPbynMHCShIxd3vTSc0+SMqxoVc170ZwtdH2cJqauhgBNSIlPWOum8MeEr/W3V0QwWnedxx/wEdzWFbEqK0CdSMFeRm6Bo11rF+lraJljyzHoi+pr3XQtKt9G02KztR8q8sxHLt3JpmhaNZ6JZi3so8Z5d2+859Sa0q8ipUc2eJicS6rstgrP8QapFo2k3F7ORiNflXP3m7D86vuyojO7BVUZJJwAK8R+Ifij+27/AMm2Y/2fbkhP9tu7f4e31q6FF1ZWJw1F1Z26HKaldyXd1NcTtullcux9STWXM2TUsz9aqSNX2eAw/Kke8lZWRG55qJqcxphr36cbDEPNRk081XvJhb20kh/hGa2nJQg5MzqS5Yts5HxTdedfGMH5Y+KwjU1xIZZWdjksc1Axr88xVV1qsps+UrT55uQ1jTDTjTCawRixCaaaU009KtCEpppaQ1QhKQ0UlMROOlOFMU08VmUPWpBUYp61LGSLUi1EtSLUMpEy1NF1qupqxD1rKRaL9sOa3LBORWLajpXS6LbyXV1BbwLulmdY0X1YnAFefiGdVI+ifghpZs/Cr3kgw95KSv8AuLwP13V6HVTSLGPTNLtLGH/V28Sxg+uBjP41bpwVopBJ3dyO6mS2tpZ5ThI1LsfQAZrwbUJnu7ua4l+/K5c/ic171PDHPC8UyK8bjDKwyCKzv+Ee0g/8w61/79ioqQlJqx1YXERo3bR4Sy0mz2r3b/hHdH/6Btp/37FH/CO6P/0DbT/v2KpKSVjs/tGPY8OjjJIAGSewr3bw/YDTNGtLTGGjQbv948n9SaZHoGkxurpp9qrKcgiMcGtOlCDTuzkxWK9skkFcl8Sb/wCzaItspw9y+D/ujk/rj8662ql7ptnfMrXltFMyjCl1BxTqJyjZHPRkoTUpHgsi1CyV7v8A8I9pH/QNtf8Av2KQ+HdH/wCgbaf9+xUU4Sh1PU/tKPY8FKU3y/avfP8AhHNG/wCgZaf9+hSf8I5o3/QMtP8Av0K3U5D/ALTj2PBPLpPLr3z/AIRvRv8AoGWn/foUf8I3o3/QMtP+/Qp+0kH9px7HgRjo8v2r33/hG9G/6Blp/wB+hR/wjejf9Ay0/wC/QqlVkP8AtOHY8B8uk8uvf/8AhG9F/wCgZaf9+hR/wjei/wDQMtP+/Qp+2kH9pw7Hz/sIPTIPWs+801ZctFwfSvpD/hGtF/6Bdp/36FJ/wjOif9Auz/79Cm6vMrSInmFOejifLM9tNCSCpqm7OvUGvoT4naLptj4cE1nY28MnnKu5IwDjB4ryGRIyeYkP4VdLCRq6oqlQhiI80dDlN8rHCqc/Sp7axuriQYRse9dDhR91FH4VPEGxk9PSu6OWwS1G8FCK1ZXgsGhg2FwGPXFaOhaJCswkYl265NNt4zNKO4zXU6db+Wg4rzcwjToxtHc+azmtSw0Go7lqFBGgCjAxTyOKUClxXzE/eZ8H9YbncbG7xyK8bFXU5VhwQa9F8Na8mqRCKYhLxByOm/3H+FedkUsTvDKskTMjqcqynBFOhXlQldbHvYHH8js9j2CiuX0DxRFchINQIin6CTor/X0P6V1Fe5SrRqq8WfS06saivFlXULC21CHyruJZF7Huv0PauQ1LwdPGS2nyrMv9x/lb8+h/Su5oqK2Fp1viQp0oz3R5Jd2F3aEi5tpY8dyvH59KrZr2Sq0thZzcy2lu5/2owf6Vwyyx/ZkcksBF7HkmaM16r/Y+m5z9htv+/YqaLT7OI5itLdD/ALMYH9KhZbPrIhZejy20sLy8IFtbSyZ7hePz6V0Wn+DZ5CrX8yxL3SP5m/PoP1ruaK6aeXQjrJ3OiGEhEqadp1rp0Xl2kSpnq3Vm+pq3RR0HNdyioKyOpJJBWJ4k12PSoTHFh7xx8q9l9zVLX/FMVsHg04iWfoZOqp9PU/pXCzSvNI0krs8jHLMxySa4cTi0vcp7nBisZGmrR3CaR55XllYvI5yWPUmkpAKUe1eco9WfLYrEuTExSilpGbAraKvojz+ZzdkNkYKpJrB1W95Kg1c1O7EakA1y91MZHPNfRZbgb+9I+54eyrmaqTQFt7ZzViFelVY6twAkgAZNepifdjZH6AoqEbI9V+Eun7LW7v3XmRhEh9hyf1I/KvQazfDdh/Zmh2dpjDRxjf8A7x5P6k1pV4rPlsTU9pUchGIVSScADJNeGa/dnUdWu7puRI5K5/u9B+gFe5yIsiMjgMrDBB7isz/hHtIPXTrX/v2Kxqwc7WNMJiI0G21c8HkgRuqioGsoz04r37/hHdH/AOgba/8AfsUf8I5o/wD0DbT/AL9il7LSx2vMab+yeBLY46V7n4F0z+y/DNpEwxLIPOk+rc/oMD8Ktjw9o46aba/9+xWoBgYHSpp0FCXMceJxMaqSirBXNfELUPsHhm4VTiS5/cL9D1/TNdLVW+0+0v1Rb22inCHKiRc4rWpFyi1E5abUZJs+dJVqpJHmvoo+GtFPXS7P/v0Kb/wjGh/9Aqz/AO/Qrz44Kcep3PGRfQ+cDCab5RBr6R/4RfQ/+gTZf9+hSf8ACL6F/wBAmy/79Ctfq0+5DxUX0Pnq3bja/So7q153KK+iR4X0IdNJsv8Av0Kd/wAI1omMf2XZ4/65Cj6tPuZutHseA6PdtCwRzxXURSB0BBr1T/hF9Czn+ybLP/XIVOmg6Ugwun2wHtGKl4Sb6nn4jDwq6o8nprqGBBr1z+xNM/58Lb/vgUn9iaZ/z4W3/fApLCTXU4ll9ndM8B1vTCG86HhhzxUmiaiSPKlOGHHNe8toWlMMNp9sR7xioB4W0INuGk2Qb18oVosNPqzplhlOHLI8sVgRkU6vQPFuladZeHbqa3s4IpE2YZEAIy6j+teeqcjPaplBwdmfM5jgvYMcaAaKO9WjwJ6MWkx60Zo5qzO4n0o70ppKTVzSFSzCtDQ9Vn0m8E0PzIeJIyeHH+PvWfSGsJRad0evhMW4NNM9i0y/t9StVuLV9yHqO6n0NWq8h0jU7nSroTWr4zwyH7rD0Ir0fQ9ftNWQBG8u4x80LHn8PUV00q6lpLc+sw2MhWXma9Zer6FYaqCbqECXGBKnysPx7/jWpRW7Sludlrnm+qeB7y2LSae63MfXaflf/A1g3NldWvF1bzRf76EV7NQQCCCMg1zzw6lsznq4eNQ8SNMkQMpyK9nfT7N/v2lu31jU/wBKjGk6cDkWFoD6+Sv+FRHDzi7pnPHA8jumeEyafLPJtghkkc/wopY/pWxpPgXWb5gZIBaxHq8xwf8AvnrXtMcaRLtjRUX0UYFOrvhVnGNmz2qWLnTjyo5DQ/AWl6cVku83s4/56DCA/wC7/jmuuVQqhVACgYAHaloqW29zGdSU3eTCgkKCScAdzVfUL62061e4vZkhhXqzH9B6n2ryLxr46m1ZXs9P3QWJ4Ynh5fr6D2//AFVrSoyquyNKOHlVemxc+IvjMXgfTdKk/wBFHE0yn/Wf7I/2f5/Tr5pNJk0Sy1UkfNfT4DAqKR7tKlGlHliNkbNQMac7VCxr6WjS5UaCE000pppNdsIgITXPeLLry7ZYQfmfk1vk9T2FcHr919q1GRhyi8CvLzrE+yocq3Z5mY1eSny9zMJqMmnMaYa+JPnRDTDTiaYaaJYhpppabVCA000ppKoTENJSmkpgTLThTBTxUMY8U9TzUYp4qWUiQVIpqJTTxUMaJhViE81VU1NG3SspItGtankV618CNK/tPxnFO65hsYzcHPTd91R+Zz/wGvHrd8EV6v8ACXx/YeDbW/W5sJ7ma6dDvjYABVBwOfdjXFUjrqdMHofUNFeRp8b9Mf8A5hN2P+2i1Zt/jLpssip/Ztyu44yZFqOeOxag3sep0VwH/Cy7PP8Ax4T/APfYpf8AhZVn/wA+E/8A30KuzNlhKvY76iuB/wCFl2f/AD4T/wDfQo/4WVZ/8+E//fYosH1Sr2O+orgf+FlWf/PhP/30KP8AhZVn/wA+M/8A30KQfVKvY76iuB/4WVZ/8+M//fQo/wCFlWf/AD4T/wDfYoD6pW7HfUVwP/CyrP8A58J/++xR/wALKs/+fCf/AL7FAfVK38p31FcD/wALLs/+fCf/AL6FJ/wsuz/58J/++xTsP6nW/lO/orgP+Fl2f/PhP/32KP8AhZln/wA+E/8A32KLB9Trfynf0V5//wALMs/+fCf/AL7FL/wsyz/58J/++xRZh9Trfynf0V5//wALNs/+fCf/AL7FH/CzbP8A58J/++xT5WH1Ot/KegUV59/ws6z/AOfCf/vsU0/FCyH/AC4T/wDfYpqnJ7IPqdb+UvfFv/kVl/6+E/ka8UkNd5418bW+v6QLOG0lhYSB9zMCOM/41wDHJ5r1cHTlFanr4KnKlTtJWEUZNSryQopg4HHWr2l2xlkGRxmuyvUVODbMsdiFRpuTNPR7TOGIroEG1cCobOERxgAdqs4r4jG4h1Zs/I82zB4iq9dBKDS0mK4LHjKYUmKKWpcTppV3EZitrRvEV5poWNv39uP4HPK/Q9qx8UmKUZSpu8WexhcwlB6M9M0zX7DUAFSXy5T/AMs5OD+HY1q147ir1lq1/ZYFvdSKo/hJ3L+Rrvp5g1pNHv0c2jJe+eqUVwNv4xvkGJooJffBU1eTxquP3liwP+zLn+ldUcdSfU7o46i+p2FFcn/wmsGP+POXP++Kik8bDH7qxOf9qT/61U8bR7lPGUl1OxorgLjxhfycQxwRD1Clj+prIvdVv73i4upGU/wg7V/IcVlLMIL4VcxqZjSjsd/qviCw0/KtJ5sw/wCWcfJ/E9BXFaz4hvNTzHu8m3P/ACzQ9fqe9ZGKMVxVMTUrabI8rEZo56LQToKb1oJyaeq4qYwsjyK2J0uxQMUYxS0Y4qrHlzquTGmqt7cCKM81PO4RCa5nV73LEA16mX4N1pI97JMuliqibWhT1K6MjkZ61ng5PNNdyzZNANfbUqCpwsj9dweGjQpqKJ4zXVeALD+0vE1nGwzHG3nP9F5H64H41ySGut8CeJLbw7c3M9xbyTPIgRdhA2jOT1/D8q4cZTbi7F4pS9m1BanvNFeeL8ULM/8AMPn/AO+xTh8TbM/8uE//AH0K8N0pLdHzf1Kv/Keg0V5//wALMs/+fCf/AL6FL/wsyz/58J/++hU8rD6lX/lO/orgP+FmWf8Az4z/APfQo/4WXZ/8+M//AH0KXKw+pVv5Tv6K4D/hZdn/AM+E/wD30KP+Fl2f/PjP/wB9iizD6lW/lO/orgP+Fl2f/PhP/wB9Cj/hZdn/AM+M/wD30KLMPqVb+U7+iuA/4WXZ/wDPjP8A99Cj/hZdp/z4T/8AfQosw+pVv5Tv6K4A/Euz/wCfCf8A76FH/Cy7P/nwn/77FPlYfUq38p39FcB/wsyz/wCfCf8A76FMf4nWqDP9m3BHs60mmhPB1l9k9CorzRvi1YqedMuf++1p6fFewccafcZ/31rN1IrczdCa3R6RRXmzfFmwVsNp1yPfetaFn8RbG6UGO0m/FhUutBdTKa5FeR3NFcj/AMJxbf8APnN/30KT/hOLb/nzm/76FL6xT7nM8XSW7JfilK0HgTU5F6r5R/8AIqV5LouqJdRgFhurvPGHiSDWvDt5pyWsiNMFG4sCBhg39K8Mmkn0bUO4XNRK1SV0cWKdLFR5YvU9RU5HGMUg61kaJqkd7ApBGcVrjkdaOWx8Vi6UqUmmKB6mjigAUn507HFzC0hHp1pcflRigXMJRig0lDiawq2FoVmVgykgjkEHpSCisJUj0aGMcTqNI8YXdqFjvV+0xDjcThx+Pf8AH866/Ttf06/AENwqSH/lnJ8rf/X/AAryijNONScPM97D5s0rS1PbKK8jsdZ1GxAFtdyKo6ITuX8jWzb+Nb+MgTQwSr9Cp/n/AErVYmPVHqU8xpS3PQ6K4tfHS4+bT2B9pf8A61DeO1/h08n6zY/9lq/bw7m31yj3O0orgZvHNyc+TZwr6bmLf4Vj6h4m1a6Vh9raJT2iG39Rz+tHt4vYh4+ina56bf39pp8JlvbiKCP1dgM/T1rhde+JVrAGj0eE3EnQSygqg/Dqf0rzvVRJJIzyuzuerMSSawpZCCQa9fB4NVtT28DTo11zXua2t65favcGbULhpWH3R0VfoOgrGkl96ieXNQu9fS4bAKHQ9qMVFWQ53zULNSM1Rlq9ulRUSgY5ptBpDXbGICGmmlNNJFapWEzP1u8+yWMjA/MflFefu2ST61u+Kr3z7vyUPyx9frXPk18RnGK9vXstkfL46t7SpZbIQmmk0E00mvJRwiE000pppqkSIaSikJpgIaSlpDVCEooooESinCmCnCpZQ8GnioxT1NSxj1NSKaiFPU1DKJQalRsVADT1NQ0UmXYnxVyGbFZatUySYrCULmkZWNuK5x3q1HeEEc1gJLipVmPrXPKijWNRo9P0XUBeWatnLr8rVo+bXnXhnU/s1+Ec/u5flP17Gu63162FoxqwPewdb2sPMt+bzS+bVTdRvroeDR2FsS0ebVTdQXqXg0Mt+ac0eb71U30hal9UQy2ZaPNqpv8Aegv70fU0MtGWjzaqb6QP701g0Oxb82kMtVd9Jv601g0Oxb800ebVMPnmkL4NUsGhlzzqTzc96qF6N9WsGgsWfNppkqvv9aQP71ccKkBMz+9A9aiXk04HJxWypqKuZVJJK5NAhlcYFdXpFpsQEisjRrTewJHvXUwR7Exivmc2xf2EfnXEua704skUYGKdSDpS818u3dn53Opd3AA0UUUiOYAaKKKClITFGKdSYzRY1jVaG4oxS9KPwpNHRDEtDcUbadijjNLlOmOMaGEUYp5FJ+NCgV9dYmKMUpHtR+FUoGcsW2JimOacxwOtRjLHNdEIW1KhUb1YqjPJFSYoAx0pSTTkc1WtzOwmKa52jmnE4FZ+o3IjjPNbYei6skkbYLDyxFRRRU1e8CgqDXJ3Uxkc5JxU+pXRkkPNZ4NfeZdglRhdn7HkeWLDUk2tR9KDTM0Zr03E+ksTKakV6rZpwasJ0risW1k9KkEtUg9LvPrXLLCJk8pe800vm1R30oesng0HKXvN96PN96pb6XfU/U0LlLnm0vnVS3+9G/3pfU12Fyl3zqPO96peZ70eZ70fU12DlLvnUnnVT8z3o8z3p/U12DlLnnUebVPf70m+n9TQcpcMvvSecfWqe+k3+9UsEhcpYlCSDDDB9aozwSRtuiO4e1TF+KTzMdDUTyunU3RjUw8Z7lN596kNkNUmlas9pcBXPy1JKkcn3hg+tZWoWkgG+Mbh7V52IyVpXiePi8BLldj06wvEuYQyHqKtivL/AA1r7WdyIbjhScc16RaXCXESujZBHavCq4R03qj88zSjUw8n2Jzg8Gub8UaSLq3ZlHzY9K6XjNNkUOu080U1ys8ajjpUp3PItOv5tIv/AC5CQua9N0jUI7yBWUiuW8Y6B5itPCvzDniud8N6zLp10IpmIXOMV1cvMj269KGNpc8dz10dKKqafdpdQq6kEEZyKuZ4rKUWmfJ1qcqUmmJzSU7tSUkYcwlHFLRTDmG9KKXFFFi1UsJRSUo6VPJc2jXaEopaSp9kbxxbQUGigUexRp9dfcKKOKDWkaSM5YyXcqXkO9DXL6lAUYnmuxYZrI1W1DqSBXvZXXVOSTPfyTOXSqKMnocgzHpUZapryIxyGq2c191QSnFNH6pQqqtBSQE0lLmmV1xibC5ppopCa1jEAJ4qjql0LSzkkJ+YDC/WrjGuO8WX3m3At0b5E6/WuLM8SsPQb6s4sdX9lTb6mFNIZJGZjkk5qEmlJphNfANuTuz5Vu7uITSGg0hNBIhNMpTSVQgpp60pNJTEFJQaSmIKSlNJTAkpwNMFOFSUPFOHBpintThUsZIKcDUYNOFSxkoNPBqEGng1LQyUGng1EDTgahopMmDGnhj2qAGnhqhodyykhBBBwRXovh6/F9p0bE/vU+R/X615mGra8Maj9i1BQ7Yik+Vvb3rpwlT2c9dmduDr+yqeTPRiaMmmryOv5Uucmvf5U9T6RO+qDPNGeaSjvS5CkOyaQmkpPxpcgx2TRmmk0maOQY7PekzTc0Z9qfIUOzSZ5600mjtVcgxxNNzSZNJnmnygLmgmkHFJnmmojHd6OTTaelPlJbHAbRirdjB5kgxzVVBvbFdHolpnBIrzsfXVGDPCzfHRw1Ju5r6ZbiONeO1aQ6VHEoVR6VJ+Ffn+KqupNs/Fswxjr1XIKWkxRiuU87mFxRij1pOaA5hcUEUmaWgakGKQdKXPNH40FKYlFLikxTK5w/GkNO20mKdiucKSloosPnEP1prGnVFI3OK1hE2pq7EY5NPUYFIij0qStJO2hpUq8qshDSU48VHK4RCSamEHJ2RlTi6suVEV1N5aHJrktZvS7kA1e1m/6qGrlrmYyMeTX2OUZda05I/UOGMl5Uqk0Ndy7k5pAaZSg19SoWVkfosIqKsh2aXNMzS5o5Sh2aXNMFLS5QH5ozTOaUGk4APzSg0zNGalwAfk+tLk0zNLmp5BD8n1pM03NGaXIIfmjNNzSZo5AH5pM03NGafIIdmjNNzSZquQLD8mkzTc0mapQCw7NITTc0matQFYUmgOR0/Km0VoooTVyreWEV0cjCSdiKu6Bql1pUwgvMtF0DdqjJo38YIyvvXDi8thXWi1PIzHKKWMg01qeh2twlxErIQc1YziuN0fUBAwUfd9M11FrcrMuQa+RxeXzoPY/Jc4yWrgpt20JbmJZoirDgjFeZeJvDjnUwYcqjHkjtXqPbiqOpWwkjYgc1lhWudKRhlGM9nVUJ7GHoV0ttHHBn5VGM100MgdRg1xMytbTntW7o99uAUmvZxuAi4e0pn0WeZRGpT9vRN0d6KRG3AHNONfOyjyuzPz6acXZiUd6dSUiLh60mKWk61Vh8wdqQ0uKTmiw+YKMUUU7BzBj1oPNFJmqSFzAeKKKSqSFzXENRzRh1IxUvajrW1OXK7oqFVwldHKaxZckgVzsilHxXoN/biSNsiuO1W0MbkgYr7PKMbzJRkfqHDOdKrFU5syyaSg8Eg0h5r6mKvqfep3V0BNITgUE80w81drK7B6K5T1a8FnYvKT83RR7157PI0sjOxyzHJrZ8U6h9puvJjOY4+PqawCa+GzjGfWK3LHZHy2YYj2tSy2QE02ikJrxzzwNNJoJptNCCkJpSabVAFIaDSUxBRRSUxBRRRQA+lFJRUjHCnKaYKUUhklOBpgNLUjJBTgajBp2aQyUGnA1CDTwaloZKDTgc1EDSg1LQ7kwNOVsHINQhqdmlYadj0jwrqX22wCOczQ/KfcdjW3Xluiag2n36TAnb0Yeor06GVZokdGDIwBBHevdwNb2keV7o+iwGI9pDle6Hk0pPFN70ua7+U9JBmjPFNopcoCk8UZpvFHU8GjlKQuaTNJ1pM0+UYue1GcUmaPenyjFzSGkzSZp8oxRR9KQHJpRz2osJsVRUnXpTDwKltoy7ioqNRjdnPXqKEXJl7TLUySLxmux0+38qIYrO0S0wASK3EXAAr4XN8Y5ycUz8j4mzZ1ZunF6Dh0pfwpKUV88z4ZzuxM0tFLSJ5hKM80YoxQPmD60cUGgfSgfMLjikoxRQNSCjFFGaZSkGKKM9KKZSkJ+NHNKaYxAqoxuaRvJiSNgcGo1BJzR95qkHAro+FHW5KERQMCl5HajNIxNZbs5XLmYjHHWsjWL3YpGauX1yIkPPauK1a9MkjCvoMpy91ZKTPtOGsnliKinJaFW+uTI5qkDSM2TmivvaNFU42R+yYbDxowUUOzSg0zNGa15TpH5NGTTc0Zpcox2TRmm5ozRyisPzS5pmaM0uUB9LTM0ZqeUB9LTM0Zo5RWH5ozTM0ZpcoEmTRmmZozRygOzRmmZozT5RD80ZpuaTNVyhYcfrSZpM0mapRCw4mkzSZpM1SiIcTSUmaQmrUQsLmkNJmirUQsOVtjZFb2jahsYAtXPU+GUxsOTxXLi8LGtCzPKzPAQxdJxaPSLeQSKCKe46g1zejajjCu1dJG4kXIPFfDYzCSw9Q/Fs2y2pgKzdtDndbss5YCsW2lMEo7YrtbqISRkHmuR1S1MUzEDivby3EKrD2cj6/h/Mo4qj7CodLpl2siAZ5rRByetcRpd2YpACeM111nOJUBBzxXm5lgXSlzLY+b4iyh4ebqR2ZaNIaXrR0rxrHyDdhMUDNLRimLmEoOaUcCimPmG9KM0p+lBxTsHMIaSlNFULmENLRxR9KpEuQhoFHWiqSJuNYA8GsfV7PepIFbQqG4QSIQa78JXdKaZ6GXY2WGqqSZ51ew+VIfSqmea6TW7EgkheK56WPY5FfomAxKq00ft+T5hHFUU7kZrL1+/FjZtg4kcbVrRlcRozucKBkk159rt+b68Zs/IvCiufN8asPScY7s6cxxKpQ5VuzPdyzEnvTKCaQmvhW7u58u3cCaaTQTTaEhBQaDTTTADRRSUxCUUUGmIQ0UUUwCg0UlAh4OaWmU4c0ihRSikoFIB4pwNR07NIY+nA1GDTs1Nhj807NRg0uaVh3JA1OzUWacDSsBIDShqjBpc0rDuShq7TwVqu5TYTN83WIn+VcPmpoJnglSSNirqcgitaFR0pqSN8PWdKakj2Gis/RdQXUrGOdcb+jgdjV+vp6bVSKkj6mlUVSKkgPvRSHNH41fKaiUUdaAOvrRylAaSgmkJo5Ri0fjTfpRT5RhRxRQBmnYLigZp2MD370Iv5UH0qCHIRck4rd0azMjAkcVlWUJkkAx3rtdGtgkanFeHm+LVKFkfJcSZmsNScU9S9aRiNMAVZpAMDAoHWvgKtRzk2fi2KrutNyY7FGBSUozWBy3DFGKTFLzigVwwaKPxopjuFAooz7UD5gooz7UZFMdxDS8UcUcUDuH86KKQ00VFtsQ4qGQ5OBTpWxwOtCJ3NdEY2VzuguVXYIuKeBSgdaCKlu7MJ1HJhjmobiRY1JJp8jBQc1g63fBVZQa7sFhHXmkerlGXzxdVK2hna7f5JVW4rmJn3MTUl5OZHJzVYnk1+jYDBqhBI/dsny2OEpJJBS5ptFejY9sdmlplLmiw0h1FNzRmlYB1LTKWiwWHUU2lo5QFpc02lpcoDs0ZptFFgHUZptLmjlCwuaM0lJRygOzRmm5ozT5RC5pabmjNPlAXNGabmjNVygOpKTNJmmoiHUmcUmaKpRAUmkzSUVaQrC5pOaSjNOwWJ7aYxSA5rr9Fvw6hSea4g/rVuwu2hkBrzMwwCrw0PnM7yeGNpPTU9GVgy8Vm6taCRGIHOKbpN8JUALVpsodMHmvjbTwlU/JOWrlWKs9jz+4UwyH2ra0a/IKqTRrdlglgtYcbmKQdq+oShjKPmfoiVLNcL5noUMnmICDUtYej3odAGPStlW3AEV8hi8PKjNpn5PmuBlhKzi0PpMUUVyHk3DFJS5pOtO4XFwDTTS0E1SFzCY96KD6UmKYri0UUVSFcSg5NFLmqQrjRmkNO560ADvVonmM7UrYSxnAya47VLUxSHivQGXII6iuZ8XW7Q6TeXMa5aKJnA9xX0GV5h7F2kfZ8NZ06FRU5vQ8n8W6mFX7JEef4yP5VyBNPmleaVnkJLE5JqImufGYqWKqObPua9d1pczFJppNFJXLYwCjNITSUwA0UlJQIWkooNMQGkoopgFFFIaBBRRRQAooHFJS0DH0UwHFOHNIYopaSgUgHZpwNMpc0rDHg0uaZmjNKwEmaXNMzS5pDH5pQaZRmgLkgNLmo80uaVh3Nzw1qzadejcf3MnDj+temRuJEV1OVYAgg9RXjGea7XwVrWcWNw3P/LMn+Vepl+J5HyS2PWy/Fcj9nLY7SkzSA0V7qVz30wB4ozyaSkNOxQuevFGeKSiiwwo7UgNLRYLiCnopNIi5atexsd4BxXNiKypK7OLF4yGHV5MzQMLTAMtWrdWDIvC81UhtWMo+U1zxxcJRbTOSOZUpwclI1NFtd7qcV11tEEQVnaNahIwcVrr0Ar4bNsV7SbSPyTiXM3XquKegoFLSCivDPjnIKXIpKWkTzB60UnejAxQHMLiiilx70D5hKKKKYkwooooKuJQe9HajvTHcKY5wOtOyBUTkMcVrCPU6qMerGqCxyamAxxSIABTjirk+hdWr0QdqaTx1pSeOtVbucRITnH41VGk6kkkVhaEq9RRRW1O7EUZGecVxGp3hkkbnNXdavzI7AH261z8jlmyTX6Bk+WqlFSaP2rhnJVh4KclqDNk5NN3elITmkr6RRsfdRSSsOzSZpKKdihc0uabRRYB+aM0yjNHKMdmlFNFH40rAPzRmm5ozRYB2aWmZpc0WAdRTc0ZosA7JoyabmjPtRYB1Gabk0Zp2AdmjPtTc0ZosKw6jmm5o5p2Cw6j8abRTsFheKM0lJxVWAXNGaTNGadgFyaSkozVWELRSUlNILC0HjpSGg1Vricbmlpt8YnHJFdnp16s8Q55rzkEqcitnSNQMTqC3FeDmmWqrHnjufFcR5DHFQdSC1OzvIRNERgGuO1S1MUh4NddZXSzxjnrVTWLISIWAzXiYCvLDVOSZ8bk2NngK/sKuxzWm3RikHOMV2Wn3AmQc1wk0bQyGtrRb7YygmvRzPCKvD2kT2+IsrjjKPtqe51gNOqKGTzFBGOakFfGzg4OzPyOtTdKTiwoxS9uKTNSZXEIxRRmjvVE3DA5pMYpaKpA2NpcUZoqibhxSE0vWjFUiWxCaQUpFLjC1aFcSoriJJoXilXcjqVYHuDUg60EZq4uxVOo6clJdD5w8c6DJ4f12a2I/cP8APE3qprna+g/iT4dGuaC7xKPtdsC8fHJHcV8+OCjFSMMDg11Rd0fqOT5gsZh0+q3EpCaSiqPWCkNGaSgAoopM0xC5pKKKYBRRSGgQGiiigYUUUhpiFooopDFopKWgB2aWmUuaQDqWm5paQxaXNNzS0ALSg02lzSGOBpc0yiiwEmaM0zNLSsA7NSwytFIroSGU5BHaoM0uaFoxp21R6n4Z1ZdTsQWI8+Phx6+9bPSvIdJ1CTTrxZoj0+8vYj0r1PT7yK+tI54WyrD8q+iwGJVWPK90fR4DF+1jyy3LQz6UhNFIa9Kx6YpozTaBRYoXv/hSDqaUVJEuSKiT5VczqT5Y3ZYsbcySDAzXaaTZ7YwSKyNBs8kMRXVRrtQD2r4nOswbfLFn5XxXnT5vZwZBNaLIMEDpVMaaofOO9awpSOfavnY42pFWufEU84rwXLcjgjCKABUuOKTHFFcc5ubuzy6tZ1JczAUYpeKKgx5hO3SlpaPSgLjaWijPHSgXMFFBooHcPWjtRRQFwopRQB1plXE60E/lQenFNY4FVFXNKa5mMdu2aEGeSaaBls1KBge9bN2R1ynyqyFooIprsFXNTFczMIpzdkMnkVVJJrmNd1AfMAwrQ1i9EaMAa4fULkyuea+vyTLeZqckfpvCeRObVWaK9zKZHJqA9c0E8nNGa+5pwUFZH67RpqnFRQlLSZoqzcKKQmjNOwxaKbmlzRYYZpaTNGaLALRSfSlosAtFNpaLDHZozTaKLAOzRmm5paLAOzRmmZpaLAOzRmm0U+UB2aM02iiwC5opKKdhWHZpM0lFOwC5ozSUlNIB1JRmkp2ELRRSVQC0dKSjNOwC0lGaTNNIQGnRkhhim98VesLVpnHHWsq84wi3I48ZXhRptzNzQJJGZRziup8vfH81Z+kWAhjBI5rVHAr89zHERlWvA/CuIcwpzxXNSOT1yy2sSM1h28hjkHbFd5qFuJYjxXFalbmKU8dK9/KsUq9PkkfacOZnHGUPYz3Oo0a83oqk1sqcjI71wOmXRjlHPFdpZT+bGMGvHzbA+ylzI+T4oyh4eo6kVoy0T7UHgcUowKUnivBPh27DKUYpaTApom4jUClPWjtVom4goxRjmjiqC4mKU0H2/Sg1SEJzSUppKpEtgQKDzQRQBVIm4h5BBGR6GvBfit4cOj6211AhFpdHeuOit3Fe9gVjeL9Ej17Q57Nx+8I3RN6MOlbU5WZ7mRZi8HXSfwvc+YqKmvLeS0uZYJlKyRsVYHsRUFdJ+oRkpK6CijNJQMKKKKYBRRSUCCiiigYUUUhpiA0lFFADqKKKACiiikMWikozQA7NFJRSAdmjNJRQA6jNNpc0h3HZozSUUAOzRTaM0BcdRTc0uaBjs81veF9abTLrZKSbaQ/OPT3rn80uaunN05KSNKdSVOSlE9qidZI1eM5VgCCO4p1ef+D9fNrItpdN+5J+Vj/CfT6V34IIyDX1GFxEa8b9T6jC4lV436i9aKKAK6rHWCrz3rR022Mkg471Tgj3MBXUaFZ5CnFeRmeKVGm9T57PcwjhqL1NnTLfy4xxWgKbEu1cCpMV+aYqs6s22fg+Y4t4iq5MKSlpMc1ynncwZpaQUtIVw+tFGaM0wuApeMUmaM0hXFopM0UDuLSUUUAgzS8UlKDTGA4PFH40ZpOlCRS1A1E2WNPc0ij25raOiOqHuoVRgUpyKOM80HFJ6siUuZgfrVHULoRIeR0qa6mEaEk1yGuahuJUE5r2crwEq80z6jh7KJYuqm1oZ+sXpkY81isSzEmnTyF3PNR1+lYTDqjBJH7xl2DjhaSikH5UlBNJn3rrsemg/GijNNJ4plC0dKDx3puTRYY6lpM0madih1FNzRmiwh1FNzS596LALRSUUWAdRSUUWKFopKKdgFopKKLCFpaSiiwwpc0lFOwhaKSinYYUUlFFiRaKSinYBeKM0lFOwCignikpc00gEooop2AKKKSnYVh8ON+D0rsdA8oheBmuKzg571raTeGORea8zM8O6tN8p85xBgp4ig+RnoceMDHSn1R065EsY55q5xX5viKUqc2mfz9mFCdCs4zBlyMetc/rtkGUlRzXQVXu4t8Zrqy/EujUR35HmEsLXVmeetmKXHTBrotEvfuqT+tZur2vlyk4qlZzGKUcnrX2lanHF0Ln6ziqEMzwl+tj0WJtyg07rWdpN15sK5P0rRBr4XE0XSm0fi2ZYSWFrODFAzSYpc4ozXOjzncbSnFB60hqkyQx7UYoHpRxVJiuAFAGaWm81SAXpSUYoqiWFBPtQRRjiqTEJ3owfSjoaWqTBOzujxj4zeHPs12mr2yYimO2XA6N6/jXltfVGu6XFq+lXNlOAVlXAPoexr5l1nT5dL1K4s7hcSROVNddOV0fpfDuYrE0PZyfvRKNFFFaH0YUZpM0UAFFFFAgoopM0wAmkoooAKKKKAHUUlLQAUUUUgCjFFFAwpaKKAClzSUUALRSUuaAClzSUUgFzRmkooGLmlptLQAtFJS0AKDg8V23g/xBuKWV43PSNyf0NcRSqSpBU4IrahXlRlzRN6FeVGXMj20EY705Rk8Vx/hDxB9pVbO7YCYDCMT972rtbaPewA719JTxUalPmTPoo4yE6fOmX9JtjJIOK7TT4RHEMDFZOh2e1AxFdBGu0Cvhs7xvPLlTPyPivNva1HTix/5UdKPwpa+Xep+fSldiZopcUYpE3EzxS0YoxQFxKKXFLgUrDuJijFL60GmK4mKAKUUCkO4mPailophcSilpaCkxopGPFONMJzVpG0O40ctTxwKUAYo/CqKlMSmSOApJp7nArM1W8EUbc811YTDutNJI7suwUsVVUUjN1u/2gqDXGXk5kkJzxVrUroyueazWOa/SsrwEaEFofvPD+UxwdJNrUYetFOwKSvaR9UmNpDS0GqLQhpv60tHamUJRj0pce9FBSG9qKXFFFhiUUooIp2ASiloxRYApM0uKMUDFozSY96WmAZozRijFFhhmjNJRQA7NJmkpadgFzQTSZpKdgFpaSiiwCk0maKSiwhc0ZpKKYC0UlApgLmijFGKYBmjNAFGKYgozRS07AMIqSBij8dKbijpSlFSVjOpBTi0zrtAvDhVJrqojuXIrzfS7kxyDJrutLuRLEvrXwud4HklzI/GeMcodOXtYo0MUjLkUoPNAFfMJ8rPzeMnCVzC1uz3AsBXIzIY5CMdK9FuohIhGK43WLUpITivscmxnMuRn6twnmqqQ9lJk2h3hV1UniuthcOgNedWzmOQEGuz0W63xgE1lnOD+3E5uLspuvbQRr9qKAc4NLXybVnY/LZJp2ENJTqMVSIbGUtLRVJhcbRS0tUmSN7UEE0tFUmISo4po5JGjVh5i9R3qTFef+Pby70DVbTVrUkw52yr6irirnZgsL9an7NPXod+Qe9LjBFUtI1GDVtOhu7ZgySLn6H0q7inqtDmrUpUpuElqhPpXlfxo8N+bAms2qfMnyTgDqOxr1Y1Bf2sd7ZzW06hopVKsD6EVpCVmduVY6WDxEZrbqfJfekrY8VaRNomt3NlMCNjZU+qnoax67FqfrVOpGpBTjswoooplhRSUlAC0lFFABRRRQAUUGkoAWlpKKAFpabS5oAWiiigAozRRSGLRSUuaACiiigApc0lFIBaKSlzQAUuaSigBc0tNooAdRSZozQA+N2jcMhIYHIPpXtPw3uW1vTlZhmaFgknv714oOSAOtfQnwa0N9N8OG5uFKyXTb1B4+UcCsq+LeGptpnm5tmP1HDOSerO5tIfKjUAdqsUv06Uc96+SrVXVk5M/JMViZV5ucuoUCj0oFYnLcBRRRTHcBRRS0guFFJRQK4tHFJS9qYgo5oopDQGiij6UxhS0n4UtA0IRxSAU6jpVI1UrDTQeKCaiuJRGhJrSnBzdkbUacqslFEF7cCJCSa4rWb4ySMAeK0td1D7yg1ylxLvc88V97kmWqK55I/YuE8iVKKqzRE5LHJNMNKeaCa+uirKyP0qCsrIQ02nUh61aRqhppKcaafxploSiiimMQ0dqWkFBQGigc0H9KYwFJRRRYYUUUU7AKKKSigApaSlxQMKKKKYwpaSigB1FNzRmmIdTaXNJQG4UUZozQA6ikzRQMKMUUUxBiikooAWikopgLmjNJRTQC5ozSUVSELRSUGmA6Jtr11fh+8+6Ca5E9a0dNuDHIuDXmZlhlVps+cz/AACxVBqx6VG29QacB3rO0m586Jea0RX5riqTpTaZ/PmY4V4es4sGAPesfWLQOhIFbGOaiuUDxnjJrTBV3SqJo2ynGywtdNM86uozFKQR3rT0S62OASafrdrscnFZNtJ5cgNfde7isOfsycMywXyPRLeTfEDU3asjRbkSRgE1sDkV8JjKLpVGj8WzjCPDV3GwetJ3p3ekrkR44nNBHNLSY4qkIQ9aTrTsCirQhuKBTjSCrRNxDWP4p0lNY0W5tWALMp2+x7Vsmkq4OzNsPWdGopx6Hinw11+TQdck0bUGKwu+wbv4Wr2s9MjketeKfGHQ2sNUi1a2UrHKcMQOjCvQPhz4gXX/AA/G0jg3UACSDufQ10TjdcyPp85w0cTQjjqXXc6qjvR3NLnjFY3Pkdjzf4y+Hvt2lpqdvHme24kwOSn/ANavCzX1xcwR3EEkUy7onUqynnIr5j8Z6M+ha/c2bA+WG3Rk91PQ110pXVj9E4YzH21L2E3qjDpM0lFbH1gUUUUAFFFFABRmkooAKKKKYC0UUUgCiiigBc0tNooAdRSZpaACiiigAozRRSGLRSUZoAWiiigAooooAXNFJRSAWl703NWrC1mvruK3t0LyyMFVQMkk0PTVilJRV2dX8MPDDeItfj85T9jg/eTHHBHp+NfSMarGiRxKEjQBVUdAKwPAnh2Pwz4fitcA3L/POwP8Xp+FdF3zXzGPxPtZ2WyPyriHNHjK7jF+6hAaUUYorzj5y4UUUUguFFFLQAlFLSUAFFFLQAUUUYpgJSijFGKY7hRRiloHcSgUUtNDTEo9aDSMcA1SVzSKcnZCO20Z6Vha1fBEIBFXdSuhHGcmuI1a8MjtycV9Rk2XOrJSaP0HhbI3XmpzRUvrgyueapHmlJyeaTjNfodGiqcbI/asNh40YKMRtB6Uppua2sdaEakNKaKdi0NxSGlNIaaKQHpSGlpDTKCjrRSUDQvakNBo6UxgaSlpKZQUUUUWAKKM0Zp2AWigUUrDCiiimAUUUU7ALiikzRQAtFJRTsAtFJRRYBaKSiiwC0UlLTAKKTFLiiwBmjNJRTQC5ooozQAUUUVQAKKQdaWgQhqS3fa4xUfajpg1M48ysZVYKcWjr9AvMFQWrqo5N6A15xplwY5F5/Wu60q4EkY5zXwud4Llbkj8Z4wyjkk6kUaI6UY4oHWl65r5VOzPzO7jIx9ZtN8bHHauOuIjFKQeoNeh3UW+MgiuP1i1KSE4r6/JcXdcjP1PhLNOaPspMfot35bLzx9a663k3oD7V5us4tzljgCur8Ja1a6mksdvMrywj51B5xWWeYeK99GPGOXxt7WB0dJS5oxmvldj8uasIKDSkCkqkSIRzQaU0mKpCEx1opTSGrQriGkxS44oxVJiMbxVpEetaJc2jj5mXKex7V4j4H1iXwp4rMVzuWEsYpl9s4r6HIrxL4zaF9j1KPVbdcRz8PgdGFdVKV9GfXcO4qNVSwdXaWx7WrCSNXQ5VgCCO4pQcVwvwl8RDV9BFnO5N1aDHJ+8nau6rOUeV2PnswwksJXlSkHtXnfxj8P/ANoaMuowrm4tOGx3Q/4V6L3plzClxBJDKoaORSjA9waqErMrLMZLCYiNRHyKRjikrc8YaQ+ia9dWjghVYlCe6noaw67U76n69SqKrBTjswoopM0yxaSiimAUUUUAFFFFABS0lFAC0UZopAFFFFABRRRQAuaWm0UAOopM0tABRRRQAUUUUhhmlpKKAFopKKBDgCTgd691+Dfg8WNqmt6gn+kSD/R0YfdH96uB+FvhU+ItcV7hT9ht8PKfX0H419HoqoipGoVFAVVHYV4+Z4vkXs47nxvFGb+xj9WpPV7i4pTRSHivnz85bu7i9+KO9UNc1a10TTZL29cKijhc8sfQVR8Ha2+vaOL51Cl3OAOwBrT2MuTn6HUsHVdF17e6bucUUUVicgvGaMUlAoAXFJiilzVAGKSlzRmgAooooADRRQaADOKM0YoxQMKM0vakwOeaaKFJ4qrdzrGpJ9KlmfYp5Fc5rl8FUgGvVy7ByrzWh9HkeWSxdVaaGfrl/vZlB4rmZn3kmp7ucyOTmqp5P61+mYDCKhBKx+9ZPl8cJSSSE70E0YpCK9I9xCdDTad1zTaZYUUCjrTQ0NopT1pKZdxKaacaQ0DTEFGKDRTGGKTtR2oA/Cgdw7UAUg+lHrTGLj86SgUUx3FoptOoGFFFFABxRSUtMApaSgUDFooopgFFFFABRSYpaACiiigAopeKTtTAKKOKWgANJS5pM0DDFKKTNFOwhaKSiqsAtGaSigQuaQ0Uh60wZJC5VxzXWaBeYKqT9K48HBrS0u4Mcg5/CvMzPDKrTZ81n+XrE0WekwsHUHrkVL0rL0i58yIZOTWoORX5ni6LpTaZ/PuaYV4as4tCMM5BrI1iy8yNio5rZ7cUxkDKQwyCMEUYXEujK6FluOlhKqlE+evGevmO5ks7NwSOHZe3tWb4D8QSaD4kt7pmJhc7Jh6qetSfEfRH0TxLcIQfJmPmxn2NcqDggivYq1XiFeR+ouosdQvJ3TR9fKyuivGQyMAVI7jFKPSuI+EWuf2t4XS3lfNzZnyzk8lOo/wruAPzrwakeSVj8nzHDPC15U30ExRS0lSmcAgpcelJSirEJSUp4pD0q0xCUUuKSmhCMO+M1jeL9HTW/D9zZkfOVLIf9oVtYpQO1awlZnRhq8qFVVI7o+ZfCWrT+F/E8crZCo+yVPVehr6VgljngjmhbfFIoZWHcGvC/jHoP9na2L6FcQ3PzHA4Dd67P4N6/wD2horabNJme05TJ6of8K6akeZcyPss8w8cdhI4ynutz0XGKKBSGudM+E6nlvxt0PzrCDVYVy8R8uTHUg9Ca8TNfWmrWEepabc2cwykyFT9e1fLOt2Mmm6nc2kwKvE5U/nXbRldWP0rhjHe3w/spbxKFFFFbH1AUUUUAFFFFABRRSUALRRRQAUUUUALRSUUgFooooAKKKKACiiigBc0ZpKKAHUU2lzQAtFJmloAKt6XZTajfQ2tsheWVgqgdyaqDk4Fe5/BTwl9lt/7dvo/3jgi3B7DoW/wrnxNdUYOTPPzPHQwNB1ZfI7zwf4fh8N6FDYxY8zG6Z8feb/AdK28UUV8jVqOpJyZ+O4rETxFV1JvVhz60yaVIYXlmYJFGCzMegFP68CvGfjH43EhbQ9LkzGp/wBIkX+I/wB0ewrfCYaVedlsduU5bPMKygtupzHxJ8Wy+JtcEFqWFjC2yJf73v8AjXt/gfSzpHhextH/ANYE3v7E84/WvCvhPoDa54ohaQZgtz5shPt0FfSZ/Ku/MpRpxVGPQ+i4mq08NShgqWy3CigCivEPhwooooAKKKKAFpKWl4qhjaWlxSYoC4UmOtLRQAnrRS0YNUNBSMcDrQT61VvJhHGcmt6FJ1JJI7cHh5V6iiirqt2I0YZrh9TujI7YOa0NavjI5AOawJCS3Wv0TJsuVKCk0fuPC+Sxw1NTktRhOT15pvNKaDX0yVj7qKSG5o59aCKTJpmgMeKaadR1qkWNozxSmkNMaEzzSflS0lBQZpM80uKSgYh60UUnSmMKM0UGmNCGkpxpOlFirhnmjpScelBp2GmGaKTjNHSiw7i5ozRSVVgFzRmikoAUHmikpaEgFzRmkop2C4tFFFABRRRQMKKKKYXClpKKAFxRRRTAKKXiigdgzSZpaM0AJRRRVCCiiimAUhooNArCHpUsD7WFRdBTXdI0LSNtVeST0FZ1bcr5jnxCjyPm2Ow0G9KsAT6V2MRyo96+d9Y8XyoWh01tuDjzP8BXqvwo8TPr+hvHdsDe2pCsR1dT0NfnedKEpNwPxTjDARletS6HbkYpDS85pQODXzWzPzbY4D4w6B/anh37XCoaezy3HUqetfPZBBwa+v7iJZoZIpBlHUqwPoa+XvGujtoniK8s2BCK5Ke6nkV62Dq8y5WfoHDGO9pTdCT1RufCHWxpPiuGKVsW93+5f0yeh/PFfRB6mvkCGRoZkdCVZSCCO1fUfgzV11zw1ZXoOZCuyX/fHB/xqMbT+0cvFeC+HERXkzcI4pD14pRzSV56PhgJpOaU0mKtMTENFFBq0xMSg+1LRTuIM00jFO60h5FWmBzfj/RF1vw3dQKuZkHmRnvkV4J4P1iXw54kgueQqPtkX1XoRX08Pw96+dfitoZ0bxPK8a4guP3qY6c9RXbQldcrPuOGMUq1OWDqbM+hreWOeCKaFg0cqh1YdwalPNeb/BrxCdR0Z9MnfNxaDMZPVkP+H9a9H7ZrCceVny+aYOWDxEqbFAyOK8T+OOieRqMGqQphLhdshH94f/Wr2uuf8d6QNZ8LXtsF3SqvmR+u4VdKVmdWQ436ri4t7PQ+X6KfKhSRlYYIOKZXefrCd1cKKKKACkzRRQAUUUUALRRRQAUUUUAFFFFABRRRQAuaKSikAtFGaKACiiigAooooAWgDNJV7SbCfU7+G0tUMksrBQoFJtJXZMpKCcpbI6f4ZeFH8Sa2glBWyh+eVvb0+pr6UijSKNIoUCRIAqqBwBWN4Q0CDw3okVlCAZSA0z+rd/wrcFfL4/Fe2nZbI/KOIM2eOr8sX7q2Cik6ZrK8Sa5beH9Gnv7ph8gxGnd27CuKnTdSSijxMPQniKipwV2znPin4vTw7pLWtq4/tG4GBjrGvr9a+c5JHnmLsSXY8k1d8Q6vc63qs97duWkkbPsPatr4a+Hm8Q+JbeFwfs0Z8yY+ij/HpX1NCjHC0rs/WMvwVLKMI5S3tds9m+EWg/2P4YSaZMXN3+8b1C9v8a7nvTFCqoVAFRQFUAdBTq+YxFV1ajkz8uzHFyxdeVV9QooorA4QooooAKKKKAFox/8AqopaYCYpKUn0pO1MAopc+1GaYw5pMmlBprnqacVdlwXM7IZNJtUmua1y/wAAqDWnq92Io255riNRuDLIec19fkeXc7U5I/TuEck9pJVZoqzyl2JPNQk8045zTSeeK+/pwUUkj9io01TiooTikJ5p3Sm8VqjcQ/SkNOPtTWGaZSEPApM0tIeO9BaAmkzQaOtNDEoNFFMaEI6ikNL/AJzR3plCYoo60ChFCUlOPWkximAhxSZxR0owKZSAn6UcZooxxRYYdaTAoFJk5oBC4oIpKO9MoKKWkpgFLmkop2AXNGaMUYoGGaWkFLQAmaM0GloAKKKKYBRRS0WGJRRRQAtFFFOwXEFLSCloAKKKKdxBRSE0U7gHfikJqG6uYbaMyTyKij171yeseKmcNFYjaOm89a4cVj6WHWr1PPxeY0sMveep0Wq6vbaeh8190mOEHX8a4bWNbudRfDNsi7KKzJZXlctIxZj3NR5r5bGZlUxDtsj5LG5nVxLtsha6r4b6+dA8TW0zuRbyHy5h6qf8OtcpSqSpyO1eXKPMrM8avSVam4S2Z9hAggFTlSAQR3FKfWuI+E/iD+2/DKQTNm7sgI2yeSnY/wBK7YdK8CrBwlY/I8wwssLXlTl0AivJvjvooe3tNWiTlT5cpH6f1r1rtWR4s0tdY8OX9kRlnjJT/eHIrTD1OSaZ05Ni/quKjLofKNeufAvXPLvLnSJnASYeZECf4h2H4fyryi4iaGZ43GGUkEVe8PalJpOs2l7CSHhkDfXmvYqwVSDR+lY/DxxeHlDuj6wXpS49ahtLmO9tILqAgxTIsike4qfoa8NqzsfkNWDpzcH0EIpO1O7U3tTTMmJ3pf60CgdKtMQhoxQaKpCExRQaPpVoYh4NcF8YNE/tPw39qiXM1odwI/unr/Su+PSorm3S6tpreUZjlUowx2NbU58rO7LcW8LiI1EfMXgnW5NA8R2t6pOxG2yL/eU8EflX09FIk0UcsRDRSKHQjoQec18seKNMk0jXbq0ddpjkOPp2r234O69/avhw2Uz5ubLgepQ9PyrprR5lzI+y4mwaxOHjiqfT8jvRS7QeD0PWgdcUY/KuVPU/P4txkmj5l+I2k/2R4rvYVUiJm3p9DzXL17J8etNBWw1FR2MTEe3IrxqvRpu8T9hynE/WcLCp5BmiiirPRCiiigAooooAKWkooAWikzS0AFFFFABRRRQAUUUUAFFFFABS5pKKAFopKKQD1BJwOte+/BnwkNN09dYvY/8ASpx+5DD7q+v41518KvCh8Ra2r3Cn7Fb/ADynHX0H419IxqqIqIoVFAAUdh6V4+Z4vlXs47nxXFWb+yh9VpPV7i54570GjvRyTgda+f3Z+cq8mMnljt4ZJp3EcMYLO56AV81/EvxbJ4l1hhEStjD8kKe3qfc11/xm8aeYzaHpsg8tD+/dT95vT6CvHCcmvosuwns17SW5+l8M5N9Xh9Yqr3nt5CqCzADqa+j/AIQ+Hv7F8Ni5nQC5vMOcjkL2/wAa8a+G/h9/EHiW2gKnyEO+U+ijrX0+qqiqqDaigBR6CozXE8sfZox4uzH2cFhoPV7hRS0AV88fnNxBS0YooAO9FFFAAKXNJRTAXNGaSigBSfSq17exWhiWRhvkOFXuadeXUNlaS3VywSGNSzE1wHg69n8VeJ7nVZQwsrf5Yl7V0U6LlFzex6eDwDrU5Vp6Rieig+vWijvRWLPOluLmq13MI0J4FTseK53Xr3YCgPNejl2G9vVSPcyLAPGYhRRj6zel3YA1gu2Salnk3yE54qE81+pYHDKjBJH9CZVgY4WiooZ9aOKcaaQK70ewgYcU00v1oNMoQHjtQfpSUHNMpCYpM4pxpKaKEI9aSnU0ihDQh6UlLSUyhKKWkNMYGkpTSGgaA+1JQfzoNMoTFJS5pAOtMYUAdeaO9J3pjQp+tJS5pDQMM47UYozQaYwNApKTODTC4o4paTPSimMKKPxoosMUUUlGaLAOpKTNFFgHUU2iiwXHUcetJRVAFKKbS5pWHcXNFJRTELQaQ0UgDNBprusalnYKvqawdU8TW1sClt+9k9ewrnr4ulQV5s5cRjKWHV5s3pXWNC7kKo6k1zmr+J4YFMdoPMf+8egrldR1e6v2/eyHb/dHSs7r1r57F5zKfu0tEfM4zPJ1PdpaIt3t9cXkhaaQsTVSkorw5TlN3kzwZzlN3k7hRRRUkBRRRQB1vw28RHw94mt5nYi2lPlzD/ZP+c19MKVcBozlGAZT6g18eKSCCK+hPg/4l/tfQvsFw+buyGBk8sn/ANbp+VefjaN1zo+Q4oy72sFiILVbnoFKDhgcUYwfejGc9jXkp2Z8BGTjK582fFfR/wCyfF10FXEUx81Pof8A6+a4wHBr3L476T5+lWmpIp3Qny3PseleGZr6DDz56aZ+tZPifrOEjLrsfQnwX1n+0fC7WcjZmsmxyf4G5H65r0H2r5z+EGtf2T4tgjkbEN3+4fJwBnofzr6LYbWI69s15mLp8k7nw3EmD+r4pzW0tRc02l65ormR82xKMUtIatCA0YooNWmITFIetOxQ3BqrgJimkc08cUhqkxp2PFvjpo/lXVrqca4WUeW5x/EK5X4X67/Yfiq2eRgtvMfKlz02txmvZfijpw1HwbegLl7fEyn6da+bASj5zyDXpUnzwsfp2SVFjsv9lPpofYHuOh6H2pM1zXw51k634TtJ3bdNEPJkz1yOn6V0pGDXDJcrsfnWNw7w1eVOXRnJfFOwW+8E3uR80BEi/hXzUeCRX1l4iiFxoGownkPbuPxxXyhKMSMPc124d3R97wlV58NKD6MZRRRXQfWBRRRQAUUUUCCiiigYUUUUAGaWkooAWikozQAtFFFABRRRQAUUUUAFTWsL3FxHFGCzOQoA71DXefB3RxqnjC3eQZitv3zfh0/XFZ1Z8kHI58VXWHoyqPoj2/wFoSeHvDdta7cTuBLKe+49vwroqCckk9TSV8dWqOpNyZ+K4zESxNaVWW7F/OuA+KnjVPD1g1hZODqM64Yj/lkv+NbnjnxPB4W0d7hyrXbgiCM+vqfYV8xarqE+p3011dSNJLIxYsT1zXp5dgud+0nsfU8NZH7eX1msvdW3mV5ZGlkZ5CSzHJJpqAswUdTTK7z4S+GP7f8AECSTpmztsSSZHB9B+Ne9UmqUHJ9D9BxNeGFoupLZHrHwk8ODQ/DazzoFvLzDtkcqvYf1rusUmAOnAHQD0pe9fH4iq603Jn4xmGMljK8qsuolFFFYHCFFFFIAp1Np1NAFFFFMBKOc8cmiue8c+II/Dnh6e7LDz3GyFfVj3/CtKNN1JKKOnCYaeJqxpQ3ZwHxf8SveXkXh7TW3fMPOK9S2fu/hXo3g/Ro9C8P2tmoHmbd0hHdj1ryX4QaLJrfiGfWr4b4rc7wW/ic9K9069etejjZKlFUY/M+kz6pDB0oYCl01fqJRRQc15i1Pk1q7GT4n1iDQNEuNQuBkRjCL/eY9BXzxqHjzV7y9aaSRNhPCbeK6n45eJPtmpppFrJ/o9tzIAeGf/wCt0ryivqMtoujBT6s/WOGcu+qYdVX8UtTvtM8aRykJfx7D03L0/Kups7u3vI99rMkq/wCyea8Yqa2up7Vw9vK6MO6nFfR4fM509Jao+4w+Zzp6S1R7T260V5/pnjS4i2pfRrMg43Dhq67TdZsdQUGCZQ3dGOCK9uhj6VXZ2Z7dDH0quz1NGkxSnjqMUnI712ppnepJiUGl4ppPpTKTDtQTzRQexoKTEptPNJTHcbikPFL1pCOfaqKTD8ab2pSKRRTHcKSlooKTG4o7UtIc07DuApDTjTaCrhikpaQ0wuHekpaTHFNDTCm0tAplXA0daX60GgBlOo7UdKoaYgpRRR2oGFFApKAFopKKAFooozTAKKTNFMBaWkoqW0txOSW4vekqne6la2YJnmVT/dHJrnNR8W9Vs4+P7zcmuKvmFGitXqcGIzOhQ3ep1s0qQoXldUUd2OK57U/FNvBlbVfNf+8eBXHXmo3N2xM0rN7Zqnn1rwcTnM56U9D5/F57Uqe7SVkaWo6xd3zEzSHHoOgrO6nmkorxp1JVHeTueHUqzqO8ncKKTNGagzFopKKLALRmkooAXNJmiimAVveDdcl8P69b3sRO1Th1/vKeorBopSipKzM6tONWDhLZn2BY3UV7ZQ3VsweGZA6N7Gp8+1eTfA/xOJrd9Bu3G5cvbknr3K/1r1nmvn69J0p2PybNsDLBYhwe3QyPF2mDV/DV/ZnlnjLJ/vDkV8pzIY5XVuCDivsMEA8/lXzB8R9LbSfFt/DjCGQunuDzXdgKm8T6fhLFXUqD9TnbaVoLiOVCQysCCK+q/Dmorq/h+wvkYEyxLvx/eHBH6V8nV7l8BtY8/Tr3SpG+aIiaME9jw39PzrfG0+aFz0uJsJ7bC+0W8T1QdKKXGBSCvGR+YjRyaUjFCLwaca0TExuKWm0pzVJiBjzTW4NO60hqkNDRknml70uMj2oC5OKpMCrqFsLvT7u1Iz50TR/mK+Tb+Bra9nhcEMjEEHtX14pw4PTkV81fFWxFj411BUXajv5i/Q8134aWtj7fg+vrOk/U6P4Ha6LXVJtLmfCXeCmTwGH+Ne5Hrg9K+Rba5ezvYri3JVo2DqfSvqLwlq6a74ds9RU4Z02yD0YcGliIW94XFWXPmWJgt9y1rUiw6PfSHosDk/lXyXN/rX+pr6T+KerR6Z4Ru1Zws1yPKjHc+v6V81NyTWmGWh6PCdCVPDSnLqxKKKK6T6sKKKKACiiigAooooAKKKKBhRRRQAUUUUAFFFFAC5opKKAFopKM0ALXu/wC00RaTqGoEfNI4iU+wGf614QDX0p8FlVfAUJXq075/IV5+ZScaLsfO8UVXTwMrdTuBVHW9VtdE0ua+vnCxRg4XPLnsBV2SRYomkkYLGgLMx4AHrXzl8VPGMniLVjBbORp8BKxqDw3qx+teJgsK689dj4PIsolmFa8vhW5g+MvEl14l1eS7umO3OETPCL2Arn6KXqa+phFQXKj9apUo0YKEFZIms7eS7uY4YVLO5AAHevqXwL4dj8N+H4LQAfaHG+ZvVvT8K88+CPhIc67fx5C8W6sOrd2/CvZCc9eteDmmL5n7OJ+f8V5vzy+qU3otwo9KKK8U+FCiig9aACiiigBc0ZpKKAFzRmkoNFhgSAMk4A7189fFDXpPE/ilbGyJe2hbyogvO49Cfxr1H4q+JBoHh144nxeXYKIAeQvc1578EvD/wDaOsS6vdJuhtuV3dC56fl1r2cDSVGm68vkfb5Bho4LDTzCsvQ9c8GaInh/w7bWSqBLjfKfVj1rb6UdTk9+aCa8urN1JOTPkMViJYirKpLdhWP4p1mPQ9Bu7+QgGNSIwe7npWxXh3x18Q+few6NbvmO3G+XB6uR/QV04Kg61RLoenkOAeNxUYtaLVnlmo3cl7ezXEzFpJGLEnuSaq0UV9WkkrI/YIxUUkgzRmiimUGaerspypIplFCdthp22Nqx8R6haYCzFkHGG5rpdP8AGsThVvYtrdNyf4VwGaK66WNrUtmdVLG1qWzPYbLU7O8Aa3uEY+hOD+Rq6eleJq7KQVYg1qWOv39pgJOzL/dbkV6dLOP50epRznpNHqw5oP4VxFj41bgXkCt6snBrbs/E+mzn/WNEfR/8a9GlmFGp1PTpZjQqdTcpMVDDdQzgGGVHB5+U1MTn/wDXXZGcZbM7Y1Iy2YGmnntS5oqzVCH2pDSg0h60xoTFGaM9qSmUgpM0tIRTuMDQSDRn1pD/APrpjD/OKKOgoyKY0FJij2owKBhTaXJoxwKYxMc0UUcU0MKQmgnniiiw7hmiijIpgFFJxQDmmF0LRSA5PvTJZ4olzJIqj3NRKcY7siVWEd2SZx1oJrJufEFhBn97vPoo/rWNd+MCCRawge7HNcdXM6FPdnDWzXD0t3c68mqtzqFtbAmadF9gcmvP7zXr65zvmYD0HArMeR3OWYk15dbPelNHk1+IOlOJ2974sgjyLaMu3q3SuevvEF7dZHmFFPZeKxqK8mtmFatuzx6+ZV63xSHvIznLMSfc0yiiuJtvc4W29wooopCCiiigAooooAKKKKACiiigAooooAKKKKALukX8+majb3ls5SWJw6keoNfU3hnWIdf0W21C3ZT5i4kUfwP3Br5Mr0j4O+Kv7H1f+z7xyLG7IHPRH7H+lceMoe0jdbo+f4gy365Q54r3onv56V5B8fdJythqka4yDFIfccivYTgd+K5n4j6aNU8GahEBukiXzl9tvJ/SvLw03Coj4jJMQ8LjI39D5crr/hZq50jxjYuzYilfyX/3W4rkWyGI9DT4JDHMjqcFSDmvdnHmi0fqFekq1KUH1R9hn5WKnsaAetZXhbUF1Xw5p14py0kQDf7w4P8AKtU8DIr5+UeWTR+N4qi6NWUH0Y0HB570poAoxQmcwhoxTsUdBVhcaBS89qCM0q9OlUhXGn1oJAPpTeSwA5Jry3xx8Ujpt5LYaNAjyRna80gzg9wBW1Om5uyPSy/La2PnyUkeia1q9jotm11qc6RRqDgE/Mx9AK+bPHfiD/hJPEVxfiPy4jhUT0UDis3WNYvtYumuL+4kmkbuxrOr0qVHk1P0bJ8lhly5m7yYV1Hg3xnqHhicm2Ilt24aBydp/wADXL0Vq0mrM9irShVjyTV0b/i3xNeeJr/7ReEKqjCRjoorAoooSS0Q6dONOKhBWSCiiimWFFFFABRSZpKAHUUUUAFFFFABRRRQAUUUUAFFFFAwooooAKKKKACvov4FziXwY8II3R3B49iBXzpXaeCvG8/hjSNVtrdWM10qiJx0jPOT9cGuXF0XWp8qPJznAyx2GdKO53vxl8bCCOTQtMkyx4uJFP8A47/jXh5JJyetSXE8lxM8srFnY5JJyTUVXh6EaEOVG+XYCngaKpQ+YZrp/Avhu48Sa5DbRqRCCDK+OFXuaxtH0641W/htLSMySysFAFfUHgnwzB4X0ZLWMK1w4BmkH8R9PoKwxuKVCFluzgz3N45fRaXxvY2rK2hsrOG1tlCQxKERR6VPSdKK+VlJyd2fkdWpKpJzluxe/NFJRmpMxTRikzzzRmmAuKKM0ZoAMUUZoNABUcsiRRPJKwWNBuYnsBUhPFeb/GvxL/ZejLpdu+Lm7GXwfup/9eujDUXWqKKPRyvBSxuIjSieVeOdam8V+LHMWWiL+XCg7LnAr6C8HaKmgeHbSyVQJAu6U+rHrXjnwR8Pf2lrrancput7T5hkcM56f417/wC5616OY1VBKjHZH0vFGLjRjDA0to7jRSnpR2oP0rx0j4q1zM8R6rHomh3eoSkfukO0Hux6V8oapey39/PdTsWllcsxPfJr1T47eI/Nu4tFt3zHB80uD1c9vwFeP19Pl1D2dPme7P1bhfLvquG9pJe9L8gooor0T6cKKKKACiiigAooooAKKKKACgHFFFAEkc0kZyjsPoa0rbX9QtwAtwxH+1z/ADrJorSNWcPhZpCrOGsWdXbeMrpBieNJPfpWnbeMbZ8efEyfTmuCzSV1QzGvDqddPMq8Op6jD4j02XGJ9uezDpVyLUbOT7lzEf8AgVeRZpwdh0Y/nXXDOai3R1wzuqviR7EsqSDKMCD6HNOyPWvIo724i+5K6/Q1aj1u/j+7cSfnXTDOo/aidUM9X2onqnb3ptecReKdRj6y7vqAatR+MLwD5442/CuiOcUXudEc7ovdHfGm1xK+M5f4rZD9CanTxmv8Vp+T/wD1q1jmtB9TZZzh2dfSGuT/AOExh/59m/77pw8YW3e3b/vqrWaYfuWs3w/c6o0nFcuPF9r/AM8JP++qP+Ewtf8An3f/AL6p/wBqYfuP+18P3Oo70Vyx8YW3/Ps//fVRt4wi/htT+LUf2rh+4nnGH7nWfjQT78+lcafGDj7tsn51DJ4wuT9yKNfwzUPOMOtmS87oI7fIx1FFefv4qv2zgqv0UVVm8QX8vWdh9OKylndJbIxln1JbI9HZ1QEswH1OKqT6rZQD95cp9BzXm017cTf6yV2+pqAsx6k1yVM9k/giclTP5v4Inf3HiixjH7ve59hisu58Xuci3hVfQtya5KiuGpmuIn1sefUzbET62Ni58Q384IaYgewxWbJcyynLuxPuahorinXqT+JnFOvUn8TFJJ6mkoorIyCiiigAooooAKKKKACiiigAooozQAUUZpM0ALRSZozQAtFJmigBaM0lFABmjNFFABmnIxRwynBHPFNooBq59GfCTxYNe0gWV0+b+1THPV09fwru5IVuIpIXGUkUow9iMV8oeF9auNA1m3vrViGjYZXsw7g/WvqTRtUt9Z0uC/s3BjlUHH909wfpXjYuh7OfPHY/PM/y14SusRTXutnylrlqbLVru2YYMUjKfwNUK7X4u2IsfG9/tGElIlH4jJ/XNcVXrU3zRTPu8LU9rRjPuj3n4D6t9p0W801my9u4lQZ/hPX+VengZHpXzn8GtUGneM7ZHOI7kGE8469P1xX0d3weo4ryMbDlqXPzninC+xxXOtpaiYFFIaUc1yJnzAUUnelNaIQ1jkUntS9aQ9KpDQKMSK3oc8V8vfEPT5NN8W6hDKSx8wtu9c8/1r6fAyK8r+OHh0z2MOswD54v3Uw9R2NduFnyysfV8K4xUcR7OW0jw+iiivSP0kKKKKACiiigAopM0lAC5pKKKYBRRRQA6ikzRSAWiiigAooooAKKKKACiiigAooooAKKKKACiiigYVd0rTbrVb2K1sonlmkO1VUZzTtG0y61e/itLKNpJZDgAV9J+AvCFl4S0wPK0TX7rmWdjgL7AmuXE4lUY6bnk5rmkcBTuleT2RX+HPgWDwtbC4udsupyDBI5EY9B7+9dr+VYeoeLdBsAftGpwZHUK24/pWHN8T/DUZIFxM/uqV89Up18RLmaPzXE4bMcyqOrODdzt8UYrgh8VfDhP35/++RVq3+JfhqbGbt0Oe6Vm8FWX2TnlkeOirumzsxS9RWdpmtabqag2F7DMfQNg/lWj361zypyho0efVw9Si7VI2EopaO9QYiUDrS/hRTASilooQEF7cxWVpNcznbFChdj7CvljxbrM/iTxJPdSEnzHwi+g7CvVfjl4n+y2iaJaviSTDzkHt2U/wA64X4Q6B/bXiqF5l3W1ufNk9OOg/OvoMBSVCk6sj9G4ewccvwcsbV3a/A9u+HuijQfC1pblQs0g82X1yex+ldLnig8k/pRjivFrVHUm5M+DxuJlia0qsurENZfiTV49D0S6v5iMRJ8g9WPStT0rw/47eIzNfRaNbP+7t/mlwernt+FdGCoe2qJHoZFl7x2KjHotWeXatfS6jqE91OxaSVixJ96pZoor6pJJWR+xRioxUV0DNGaKKZQZozRRQAZozRRQAZozRRQAZozRRQAZozRRQAZozRRQAZozRRQAZozRRQAZpaSigBaKSigBaKSigBaKSigBaKSigBaKSigBaKSigBc0maKKADNGaKKADNGaKKADNGaKKADNGaKKADNGaKKADNGaKKADNFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUBcK9P+D3jRNFun03UXIsbg5BJ+4/r+NeYUDIPHWoqU1Ujys5sVhoYqm6dRaM7/4z6jBqXilZbZgyrAqkjuea4CnO7O2XYsfU02nCPJHlLoUlRpqmtkW9LuWtNQt51OGRww/A19cWtyt5aW93H9yeNZR+IzXx4pwRX078Kr43/gOwZ23PCWiPsAeP0NcOYQvFSPluLsPz0I1ezOtI4ooAPrRXkpn5yIaTinGkxV3EIRSMvvTqQ9atMBD06VV1Wxj1PTbqynH7ueMxnHb0q43pTelaQdmbUKrpVFNdD5H1yxfTdVurSQENE5Ug+xqhXoHxtsxa+NriRf8Al4RJfzH/ANavPq9qD5opn7NhKvtqEKndC0maSiqOkXNJRRTAKKKKACiiigAooooAKKKKAFozSUUALS02lpWAWikzRmgBaKKKACiiigAooooAKKKKAOg8L+KLrw20z2EUJnkGBI65K/Sk1jxbrWsE/br+aRT/AA7sD8hWBRUunFu7Rk6FOUuZrUe8jsfmYn8aZk+tFFUaJJBRk+poooGWbW+ubSUPbzPG4PBVsV6X4O+K17YlLfWM3VvwN5++v4968rorGrQhVVpI48VgKGLjy1Y3Pr7Q9YstbshdadMJIzwR3U+4rQzxXyl4P8UX3hrU47m0kOzOJIyflcehr6Z8O63aeIdKjvrBxsPDoTyjdwa+exuBdB3jsfmue5BPAS9pT1g/wNSlzSCivNPlxaqarqEOmabcXty22KFSxPv2FWjXjPx08T5ePQ7V/lT558f3uw/CuvB4d1qiR6+S5fLH4mMOnU8s8R6pNrWtXN5MSzyuTX0B8H9DGkeFI55EAuLw7znrt7V4V4G0V9e8S2dko+V3G4+g6k19WQxpDDHFEAI0UKo9ABXq5nVVOCpRPsOLMYsPQjhKfX8h9BpKQ+1eElc/OUruxm+JNXi0PRLrUJiP3S/ID/E3YV8oatey6hqE91OxaSVixJ716j8dfEZmvYtGt3/dwfNLju//ANavIq+ly7D+yp8z3Z+r8MZb9Uw3tJL3pfkFFFFeifT3CiiigLhRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQFwooooC4UUUUBcKKKKBBRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAA617n+z9f8Am6bqlgxH7orMozzzwf5CvDK7H4X+JY/DPiRLi5UtbSqYpAPQ9/wrDEw56bR5ub4Z4rCTprc+msUGorS4hu7eO4tpFlgkAKupyCKkPX+tfP2admfj9SnKnJxkrNAaSjNGeKpEWChqKD0q0FhGHOaaSdw6044NNbHXvWqKjvoeCfHv/kbogOv2aPP615nXffGu7Fz44ulUY8lUi/IVwPevaoq0EfsmWRccJTT7ISiiitDvCiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKWkooAXNGaSigBaWm0UAOopM0ZpALRSZozQAtFJmigBaKKKACiiigArrPAHi268MaskqMWtXwssRPDD/GuToqZwU48sjKvRhXg6c1dM+xdOvbfUrCG8s3EkEyhlP9D71a614n8DPE7x3Emi3TEwy/NESeFb/69e1jnOK+TxeH9jU5T8eznLXgMS6a2exm+JNXh0LRbnULgjEanYD/ABN2FfKGr30upajPdTsWklcsSfevTfjn4l+16imk2z5t7bl8dGc/4dK8u0+2e7vYYI1LPIwUAdzmvcy+gqVPnfU++4ay5YLC+2nvLX5Ht3wF0NYNPudXlH72Q+TFkdB3P9K9YI5rO8O6dHpGh2djEABDGAxHdj1NaIrw8XW9rVbPz/Osa8Xi51OnQMcVl+JdWi0XRLq/mIAiX5Qe7dq1O1eH/HbxGJ7uHR7V8xQjdKR3b0/AVeCo+2qJGmRZe8dioxey1Z5Zq17JqGoT3UzbpJXLEn3NU6KK+qSSVkfsUYqKUV0CiiimUFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUlGaAFopM0ZoAWikzRQAtJSUU7ALmjNJRQAuaAeaSigD0n4YeP5NAnWx1EmTTZDg9zEfUf4V7/BNFcwJPbSLLDINyOpyGFfHGfzr0T4aePp/D84sr9ml0yQjK9TGfVf8K8/FYRT96O58rnuQxxSdairS/M+he1H+cVFaXMF5bpPayrLDINysDU1eTa2jPzecHTk4y3QhNBo70VaJBuOhpkkixRvK5+SNS7fQDP9Kdjk1yfxR1QaX4Kvip/e3GIF55wep/IfrW1KPNJI7MvoPEYiFNdWfO/ia/bU9dvbxv8AlrKzc9smsulY5Yn1pO9e4lZWP2aEVCKiuglFFFMoKKKKACiiigAooooAKKKKAP/Z"
-# Black Logo Base64
-BLACK_LOGO_BASE_64 = "/9j/4AAQSkZJRgABAgEASABIAAD/4QDKRXhpZgAATU0AKgAAAAgABgESAAMAAAABAAEAAAEaAAUAAAABAAAAVgEbAAUAAAABAAAAXgEoAAMAAAABAAIAAAITAAMAAAABAAEAAIdpAAQAAAABAAAAZgAAAAAAAABIAAAAAQAAAEgAAAABAAeQAAAHAAAABDAyMjGRAQAHAAAABAECAwCgAAAHAAAABDAxMDCgAQADAAAAAQABAACgAgAEAAAAAQAABACgAwAEAAAAAQAABACkBgADAAAAAQAAAAAAAAAAAAD/wAARCAQABAADASIAAhEBAxEB/8QAHwAAAQUBAQEBAQEAAAAAAAAAAAECAwQFBgcICQoL/8QAtRAAAgEDAwIEAwUFBAQAAAF9AQIDAAQRBRIhMUEGE1FhByJxFDKBkaEII0KxwRVS0fAkM2JyggkKFhcYGRolJicoKSo0NTY3ODk6Q0RFRkdISUpTVFVWV1hZWmNkZWZnaGlqc3R1dnd4eXqDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uHi4+Tl5ufo6erx8vP09fb3+Pn6/8QAHwEAAwEBAQEBAQEBAQAAAAAAAAECAwQFBgcICQoL/8QAtREAAgECBAQDBAcFBAQAAQJ3AAECAxEEBSExBhJBUQdhcRMiMoEIFEKRobHBCSMzUvAVYnLRChYkNOEl8RcYGRomJygpKjU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6goOEhYaHiImKkpOUlZaXmJmaoqOkpaanqKmqsrO0tba3uLm6wsPExcbHyMnK0tPU1dbX2Nna4uPk5ebn6Onq8vP09fb3+Pn6/9sAQwABAQEBAQECAQECAwICAgMEAwMDAwQFBAQEBAQFBgUFBQUFBQYGBgYGBgYGCAgICAgICQkJCQkKCgoKCgoKCgoK/9sAQwECAgIDAgMEAgIECwcGBwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsL/90ABABA/9oADAMBAAIRAxEAPwD/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKACiipFAINA0rjQSOlf1Gf8EKvgXY6P8LfEvx+1WISXmt3I06yLKDsgt8mVlz0ZnIHHYV/LkK/u3/YM8CW3w9/Yx+HOhWm3/SdFt9QcDr5l4PObJ/4FXn5lU5KXKup+C/SIzurlfCzwWGlZ4iag/8ACrt/fZH1y4BO0jODwff/ABqpFaG2BLnJNTEhgGGcn86kdkKACvDhK7ufwE7rQjVMZz1PPWmo2cqRtA/z70isd20dPWnKhZM1stNTG99EfEn7an7EPwz/AGxPAR0nW400vxLZox03V0XDI+MiOYADfGT1zyB05r+N34+fs/fE/wDZu+Id18N/ipp72V9bk+W+CYZ48/LLC/R1Yc+3fmv7/wD5cjJ3HGOlfMv7Un7J3wq/a2+HDeA/iXahJ4QzafqcSg3NnL22MRkox+8p4NehhsTye7LY/oLwk8aMRwdOGSZ83UwbenV079Y913j80fwWmgHBzX1P+1d+yJ8WP2RPiFL4J+Itt5lrIS1jqUKk213EejI2MBsfeU8g+vWvlooR97ivVTT1R/d+X4/D5rh6eYZdVU6c1dSTumhuaSnDFNpnWFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQB/9D/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKAFFGKSlHSgDY8PWCatrtlpUh2rdTxxE+gdgK/0J/APhu18H/Dzw/4TsH3W+m6bZ20Weu2OBQK/wA/n4YrbyfEjw/HdcRNqVoH5/hMy5/Sv9D77JHaRpp0R+S2jSIH2VAo/lXhZ0/4cfU/kr6UleSp5Thb6P2j+a5F+pCWDR8DHY0zAweKlMTdyMGmKCBk9T3ryoOx/H24kScc84pFXb+NMRXTqKlHzrljXSpGTRHtx0708kBckfhS42/N1FRJgHnitkzOZ4/8aPgb8Mf2hfh9dfDf4oaat7p10m0Nx50DjlZInxlGB9K/jx/bm/YK+JP7HHjJkug+r+FLxt2n6vGh2FT0jnwMRyDpg9e1f24xIAQi4IJ71xfxB+H/AIP+JvhW+8BfEPTotV0fUFMc9tMu4Hg4YdwwPII5FdtCu6ej2P2Lwv8AFzHcA4lYas3Uwkn70L7f3o9n+D2fdf54zqUOGGKbX6kf8FCf+Cb3jP8AZH15/GHhDzdZ8D3sjeRdAbntCTxDcY9BwG6HvzX5cEYODXqxkpK6P9Bsiz7A8SYKnm+TVVOlPZrp5NdGuqYlFLikpnrhRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAL3pKKKACiiigAooooAKKKKACiiigD/0f8AP/ooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKALlheTafexX1ucSQusin/AGkORX+gz8FvGknxQ+DPhL4kr/zMGi2d+RnPzyRAP+TA1/ntiv7UP+CR/wAQZfiF+wp4YtZrkTXfh25vNKmUH5o0WXzIQfT5Grxc6j+6jVXRn83/AElsq+s5FhM3UdaNS3ymv84o/SdrSMW20Phs/lQQw+Vqk8tWTePvd6bcJ5jbxzXhQkfw1L3tRjhWximADJwaeQQcGmlc/KK6Ysj0ISwFNC55/SpcDr7VCM9+3HNdEJGbIhxMMjn+tTyyKzjcckDGKaI2cfJyT+dV44C0g+0jnOc+ldCMrWd2YHiXw9oXizQLrwh4rtItQ0rUImguLWZd6PG4OVx2+tfyl/8ABRj/AIJheIf2dtTuPin8FLafVfBM5Mk0ajfNp7HJIcDJMQ7N271/Wo7idtoOVBqreWFpq1jNpOqQpc2twhjlhlUOkiNwVYHIIIrqo1fZvRH6X4ceJuY+HuMVbCvnoSfv029Gu67SXR/J6H+dIeOKUda/fb/go5/wSkvfAX2747/s22rz6IxabUdHQFpLQk5Z4MZLRkn7vVR7V+BRVlYhhgjsa9KMlJXR/ohwnxdlvGeBhm+R1eaL3X2ovtJdH+D3Qh9qSlPXNJVH0wUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRS0AJgnpRX1b+yJ+x/8Xv2zPijF8NPhXZlxGBLfXcnENrBnDO7dM4+6vUmv0G/4KQf8Ej7r9iv4aaX8WfAmsXHiTRXlW11KSWJUa3lYfK+F6IzcD070rq9j5PH8c5Hlmb4bhLG4yMcXW+GHXyv2v0va/Q/EyiiimfWBRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQB//0v8AP/ooooAKKKKACiiigAooooAKKKKACiiigAooooAcDzmm0opKACv6SP8AggP8VrkXPxB+Bl2iC3khh12KQnD+bCRAUX1BV8n6V/NvX3T/AME4fjjB8Af2xfBvjbUQWsLm6/s28XdtXyr4eQWbPGEZw3PpXNjKPt6MqZ8P4kZC+JeGsxymCvJwbj/ij7y/Kx/cMbgIxKqRgcjNTmYBcdyahktxbXTRRgSAscMDww7Ee1WLrYFUYHFfGxum0z/MSouSTi0EnDFc0OrDnNCkOufXmmYKjHWumEjHYYy5PPSoyMHIFWe+SOnpUXRvWt4yIIVZo2znkdqle5MiFW+X3701lGaayKy7T3rojIzaKXyxEuh5P8qBIyyblHPYVYVApJb8qrMGZvMHQV0xdxMn3By0cmCrcEMOCDxgjvX89X/BSz/gldBqcN9+0H+zPYrFcLun1bQ4FOG7vPbgcD/aQdeo9/6E0UL8x59qUCQMGH+e1b0p8jPteBOPMx4DzGOZ5VP3XZSi/hlHs1+T3TP856aGW3laCdSjoSrKwwQRwQR6imYr+o7/AIKM/wDBKvTPicuofHD9nKzSy8QDdPqGkoNsd56vAo4WTjJXoa/mG1nR9W8P6ncaJrttJaXlpI0U0MqlHjdeCrA8gjFejCSktD/RngjjvLOPMDHMsoqe8vjg/ig+zXbs9mZNFLikqj7MKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiilAJOBQAlFbul+GfEGtSCPSbOa4Y8DYhP9K9m8N/sy/FjxCUdrH7JG/8AHMdo/IZNezlvDuaZu7ZZg51P8MW199rHdhcsxeOdsHQlP0TZ8+UuCK+8dF/Yk1ZyJNf1eJAOqRKcn8TXrmk/sffDGxP/ABMXuLph1+bAr9FyzwO4szL3pYVUl/fkl+Cuz6XDcA5ziEpToqC/vNL/ADPyyVWY4UZNaNto2rXhC2ltJKT/AHVJ/kK/ZTRvgb8MNB2/YtKjJXu43E/nXe2vh/RLFQtnaRR7em1AMflX3mXfRqzGpZ5pmEIeUU5fi7H0GG8L8RLXGYlR9E3/AJH4u6X8KviHrDhLDSLl88coR/OvRtM/Zf8Ai/qP3tPFvn/nq2P8a/XKLagwoC/TilLjoBmvuMB9GnJ6aTx2NqT9Eo/5ns0fDTAQ1r4iUvSy/wAz8wrP9jT4kTf8fc9vF7bs11Nt+xVrhAN7q0K+6g9K/RIfNk4FNA/yK+nwv0fuE6CXtKM5+s3+lj0KfAGT00uaEpesn+lj4Th/Yr0tAPtWtMx77VrXi/Y08HIAJtRnY+oAFfahBJpmBn1r3qXgpwfSVllyfq5P9TpjwblENsMvm3/mfHUX7HfgJcl7ydj9QKvJ+x/8OwOZ7g/Vq+tCBTMZJrsp+EPCMNFlcC1wrlMP+YSP4nyef2Qfh5tZRcTj3z/9aq8v7HngGRT5d7Mv5Gvrbk8mm4rV+EfCLVv7Jh9z/wAzOXCuVP8A5hV+P+Z8bz/saeEWQm31OZT7gVhXP7GFgctZauVHYMua+4yDSEDHIrireCnB1b/mWpejkv1OWfB+Uy/5h7fN/wCZ+fl3+xlqijNnq0bf7y1zV3+x547iz9mvbaQD6iv0k46AU08nmvJrfR94QrfBh5R9JyOOpwRlUtoNejZ+WOofssfFWxBaK3jmA/ut1/CuD1P4KfEzSc/adKlIHdRmv2KKg9qYQTx1r5/GfRm4frX+qYqrD5xf5o8+t4f4KX8KrJfc/wBD8Rbzwl4n0/P22wuIsesbf4VgyRSRNtdSp9CK/cy5sLa7BS6jSRW6hhmuM1X4X+BdZXbqWmQyNg/NtGa+MzP6LteN3lGZp+U42/FN/keTX8Ppr/dsRf1X+Vz8YqK/U3Wv2XvhlqKs1rbtbOe6P/TFeW6z+xzpz5bRtUaNuyyLn9RX5/mX0e+LcDeVClCqv7stfudjwq/BuZUdYwUvR/52PgSivqPXv2TviLpZL6W0V8o/unB/I14nrnw48ceHC39saZPEq9W2kj8xX5vm3BGfZHf+1MvqQt15W196ujw8TleLwf8AvNGUflp95xFFPeN422SAqR2PFMr5ZprRnAFFFFIAooooAKKKKACiiigApQM0lFABXoHwv+GfjL4weP8ASvhp4Asnv9X1m4S2t4YwSSznGTjoqjknsK4i3tri7nS1tEaWWVgqIoJZmPAAA5JJr+yb/gj1/wAE8G/Zs8Fp8f8A4tWYXxp4gg/0O3kGWsbV+R9JJB19OlTKVkfm3il4jYPw1yWpnOKtKtL3aUOsp9P+3VvJ9tN2fev7B/7GHhH9ij4IW3w+0kR3euXgFxrGoIPmnnI+4pIyI06KPxr6g+Ifw58H/FnwRqfw68eWa3ulavCYLiBxncrdxkcEdQeoNd3Emcn35qQqvRcg9a43775kf5QZrxNmWb5pV4lxuIbxMpc/NezUr3Vu1uiWx/FP+3l/wRs+Nf7Nl3ffED4OQy+L/BAZpN1upa8sk/uzxDllXON65z1IFfizLDLC5SUEMpIIIwQR2I7Gv9PwllLFT94YIIBBB6gjuDX5Lftp/wDBIn4AftVWdz4o8Iww+DfGD5Zb20j220788TxDg5PVgAa6YTb0Z/ZPhh9KuMlSyXxFhZ6JV4/+5Ir8ZR+a6n8M9FfSX7UH7LHxa/ZI+Jk/ww+LVl9nulXzbeeM7obmHJAkjb0OOnUV821ruf2rgcdh8yw9PH5fVU6c1eMk7pp9UwooooOoKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigD/0/8AP/ooooAKKKKACiiigAooooAKKKXFAABngVsaJ4d17xNfLpnhuyuNQuG6RW8bSuc/7KAmvsj9iT9hv4lftm+Pf7H8PZ0/QbJgdQ1ORTsiXuqdA0hHQZ46mv7Df2bP2Uvgn+yt4Th8O/C/SIEuVwZ76ZRJczPjG4uwyMnsOBXk5hm9LA+5vLsfk3iH4uZZwGvqnL7bEfyJ2t/ietvJWv6H8TUf7J/7TMsP2mPwDrpQ9CLKbv8A8Brw/XfD2u+GNSk0fxJZT6fdwnDwXEbRyL9VYAj8q/0dDrGpBivmHnsOlfL/AO0l+yb8Dv2pfDE2h/FLQ7aa9dGW31OGNYruB8cMsijJA7g5zXnUOIlOVq0LI/Kcl+k1CviY0s8y3kpP7UJXa82mlf70fwJkEDJpK+zP2zP2LPih+xv8Q5PDXi2JrrR7li2nanGp8qePqAT0WQDqpPvXxoR3HSvpYTjUipwd0z+octzLDZxhqeZZbVU6U1dNbNf106CVYt5pYJ0uIHMbowZWBIII5BBHOQar09FDMATgGqO619D+8P8AYV+Olj+0V+yV4S+INqzSXllaLpl6HIMnn2YETO+P7+A3vX1WGyD5nJxnFfxs/wDBLb9tbVf2WvjtZeGfE186+DPEkv2TUYj8yQvJgR3Cr2KsAD/sk1/ZXtiKpJC/mI3zBh0KnlWHsRXyOYUHhqr7PVH+dnjNwFPg3O6laiv9nxDc4eV3rH1T/Bpjo1BAOPwpHXJwRipJD83FR8nnPU1zQdz8Z3EIGcU0jg4qQKT16Uwnt3roiyWhjjI9/SmhcU884560m3nHSuiLM2yFlyML/wDqoBtowTcnHp9aeUCk1VntEueSTmuhS7ErfUaEjmbcrcirSxRuAwPOOarRWIiAKGn7DEvGcH1rZS6GcknsDRGePC8OOh+lfkN/wUT/AOCZ+g/tMaXcfFP4RQQ6d43tVLSxDCQ6gqj7rdNsvoe/Q1+uckmT8pp6ZMfzffPc+ldFKpyH0/CPF2ZcGY+nm+TVOWa3XSS6qS6pn+d54o8LeIvBXiG88J+K7OWw1HT5WhuLeZSrxupwQQa589a/s9/b4/4J1eAv2uvDUviXw/5Oi+O7GNjbX23CXgUcQ3OME5/hfqvv0r+P74k/DTxt8JfGV94B+IWnzaZqunSGOaGZSp4P3lJxuVuoI4IrvjJSWh/ox4deJOXeIeCWIwb5K8V79NvVPuu8X0fyZwVFFBqj9GCiiigAooooAKKKKACigDPFaWmaRqWsXAtNLgeeRuAqKSc1cKcqslTpq7fRFRi5tRgrszsGgAnpX1Z4M/ZE+JniQLcayiaXC3P745fH+6K+qPCH7HHw+0PbN4glk1OUdVb5UyPpX6VkHhDxNxBadHCezg/tT938N/wPrss4GzfM7TjQ5IvrLT8N/wAD8uLLTb/UpRBYQvM56BFLH9K9t8K/s2/FbxQFlj09rSJ/45/k4+h5r9ZNB8B+DvC8Qh0HToLfb/EqDd+fWunCds8elftGRfRvw8OWpxDjnJ/ywVl971/A+8wHhVRp2nmeIcn2jovvd3+CPg3wx+xLZRESeLdU80/3IOB+JIr6C8Ofs8/CnwziS30xLhxxumG4/XmvcFXaeKXAr9kyXws4ZyNL6pgIykuslzP8T7TAcJ5VlyTw+FjfvJcz/EyLLSNI06MRafaxQJxwiAfyrRKY6VLsGOaCuetffUMLSw8eSjBRXkrHvKmoLlgrEW3FJjn0p5ABwaNvORXUkS0MPpmk60/bQRzzWqIa6kRXjimlRU3WkqjNxIVGDRg96kye9Nx3rQmxHxUTZzzUppCM0zJq5CevFJxUhB700iqRm0RUm3FSYNJimZtEJFJUjDtUfWq8yGhPpTCe9ScZzSYBNUQ0Qd6O/NSkAmoyO9NGbQw+9MDYHWn7eabsIPFG2xmM5pMk8HpTjzwaaODmnYlkZUZ6EVVubeO6j8mdQ6nqGGRV9hzzUeMVE6UaicZq6M5RUvdZ5V4g+EXgDxIC+p6dGzN/Eo2n9MV4P4o/ZI8PXhaXwzdPat/Cj/MK+yivpTc9q+Izvw14b4hT/tLL4Nvqlyy+9WZ4mLyDAYy/1iir91o/vR+Vfij9nP4h+HCzRQi8jX+KHn9DXid9pWpaZJ5OowSQN6OpH86/bplUnnvXKa/4K8M+J0MWtWcc4buyjP5gV+IcR/RkwVZOrw1jXTf8s/eX37/mfJ43gWm7ywFVp9nr+J+MOKSv0Y8Xfsn+FdSZpvDUzWUrZ+VjuTNfKni/4B+PvCjM/wBn+1xL/HFzx9K/AuJvB/ifhfmq4rCOpTX2oe8vu3X3Hx+O4dx+AvKtSuu61R4lRVi4tLm0kMN1G0bjghgQf1qvX5jOEqbcJqzR4jVtGFFFFSAUoFOCE9K/aX/glV/wTH1b9qnxNF8Y/i7BJZfD7SJlYqylW1KVeRFHnH7vP3mH0oeh87xVxVl3BmW1uIM+q8lKmvnJ9IxXWT6L9D6V/wCCMf8AwTh/4TDVLX9rb442DDSNPkD6DYzLgXUw6XLqeTGh+72Y81/Vijo4G09P88VlaXp2laVpltouiW8dlYWKJDb28ShEjjQYVQAMYArQjULll71zSldn+VHid4iY7xJzipneYPlprSnDpCHRer3k+r8rGnH8gLipVj7k5FVkYbNtWYtkcbAnrUW7H5m9NSRADzmhl+YFP0qtDG8Rzng1YlQ7g0bcd6L9Sdna5+Mn/Bbj9nnwl8Vv2Q734szwCLXfA7rcW9wAAXt5TtliY9SDwfrX8S5Hev7Zv+C337Q+j/Cv9kO4+F7urar43k+zRw5+ZYY2DPIR1wAMA+pr+Jmuin1P9NvosvHvgqLzFv2ftJ+zv/Jpe3lzc34geKSlpK0P6RCiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigApaSigAooooAKKKKACiiigD//1P8AP/ooooAKKKKACiiigAooooAUYr6l/ZG/ZW8eftafFq1+HPhBDFbKRJf3rA+VbQA8szAYyeQo7mvlkV/W/wD8ENNd+C2p/s36voPgyAW/jCwuidd3Y8yaORj9nlRu8e35ccYYH1rz8zxcsHh5VoK7/LzPhPEnijEcIZDic6wFLnmrJdouWnM/JfnY/U34H/BfwB+zv8NdP+Fvw4tI7WwsEAZ0A3Ty4+aVz3LH1r1rJxuTqeadsXoDn/PNNWQKeOK/NJVXVk5zd2z/ADczDG18yr1MbjZuc5Ntt6ttkTvMclzwe1NVthww4OMjGKsSfMDjiq5Ung4+b3FaU3scLXQ8n+OHwR+Hn7QXw9vfhp8StOjvrG8UhWcfPC/O2SNuSrLntX8V/wC2z+xd8Qf2O/iVL4e1yN7rQb1mfTNRC/JNFnhWPQOvcV/dVGGt0O7JB79vavGvj58A/ht+0j8Obz4bfEmxF3Z3Kny5AAJYHx8skbdmB5r6DLMzeFapy1iz9g8KfFTE8B4tYPGtzwdR+9H+X+9Hz7rqf58eO9TSHPAr67/bH/Y8+If7IXxLn8IeJ0a70mZi+naiiny54s8ZOOHHcflXx/gnmvtKc41IqcHdH9/5bmWGzbDU8xy2op05q6a2a/r7hQxUhl4I7iv7Xv8Aglz+0tP+0f8Asr6Y2uTNPrvhb/iU6g0hAaQRANDKAOcGMgE/3s1/E/X9Kv8AwQU8OeKrTS/HHii7hkTQ7p7eCNzkK8ygltvrgYzivOzamp0HJ7o/IfH3KcNmHCdfGYnSdGUZRfm3ytfNP8D+iMjecAYHSn7MDA/OkZ2YDB609j7Z4r5enpoj/PR662AjkY9KjKgY96d2wT+NN3dq6YMzfmRMCfrSLweP0p5GMkc0bT6cVupGTIzz+VMIA4NTABTgfSmMD1NbxkS9Ri/L96o25GQalYY+pqHuRW8ZdjNoiGw53AVJjJ45FSKgByePrSJgj0raLuT1uVhtBO8fSvjP9tX9ij4Y/ti+B207xJGmm+JLNSNM1dF+eN+MJJjl4z3B+oxX2bIGRcqKaAP+Wo4IrohLl0PayDP8dw3jaWb5NWdOpDZr8n3T6p6H8Bnx/wD2fviX+zX8Rbv4a/FCwa0u7ckxSYPlXEWfllib+JW/TpXiFf3jftR/srfCr9rT4dSfD/4m2u25jy2n6nEo+02Un95D/EhP3lPBFfxoftSfsrfFT9k34l3Hw7+JVoQuS1lfRgm2u4c/LJE/Q8dR1B4rujJS1R/ob4V+LWC8QsMsLiLU8ZBe9D+b+9Duu63XofNFFH0oqj9gCipIoZZ5BFCpZm4AHJNfRnw5/Zj+IXjtY72aP+z7RzzJLwxX1Vepr1MqyXHZ5WWEynDyqSfRL83svmd2Ay3FZnUVDL6TnLyX59j5xVSxwOa9S8D/AAZ+IPxAmVNBsH8s/wDLSQbU/M1+kXgH9lv4ceDFS6vYm1S7X+Ob7ufUL04r6Ut7S3tIhb2kawxrwEQAD9K/feF/o+4rE8uJ4or+zj/JDV/OWy+Vz9SyTwrq1rVs7q8q/ljq/m9l8rnwt4F/Yt0azKXXjy/Ny2ATDB8oz6E19b+Gfh54M8HQCz8N6fFbKo67QW/Enmu5VdowRikCAmv6H4b8Psj4ZSeV4RKS+09Zfez9SyzhjLcmS+oYdJ93rL72RqOMLxS89qkpK+6glHY9przGjg8mkPFPNJ24raJDRGBnjrS8d6fxSHkVoiGhvfPemfSnkHPFBwa0RLRGcE4pCP0pxGKTHerRm0R7TSck1IAMYpCOwqkZtER5pvNSkU0g1a8yGrbDPpTSvpT6afWqRmxpUjkVGRzUvFR9TVESQ0gGm89KfQfSqM2iA80H3p5DE0wdeKoyYw9aYQalphxmqIasRe9HWnHHak/CqIaGkZFJjI5peBQaaM2iLg8YpCvalA9KTPpVWIsRstMzipeDTD1zTMmuow8mmYBp+OcCk4zRa5DXcZtphGOnapOc00gg5oIsR0YoNLQTuQE9xTJEjk/1g3fX/JqwRTdoJp76NGTV9zzXxd8JvBnjWBl1i0QORgOg2sM+9fKHjP8AZJvrdWu/Bl15o5xDNw3Hoa+9HzimhsDrX53xR4V8OcXKU8zwiVT+ePuy+9b/ADueBmPD+Cx93Wp2l3WjPxm8SeBvFXhK4a312ykgKnGSDt/OuUwe1ftze6Dp3iNRY3tqlyr8bWXNfTv7OX/BLn4HfFXxbZeKvE9rcfYYJBJLZrIVjmxzsJByFPfBr+SvEjwRfB1OWY5bjVOl2lpJfNaP8D8Q8Qcwy3w9ws81zbE/u10+0/Kx8Sf8Euf+Caev/tgeNB8Q/iVDNp3w60Zw9zcEFTfSqQRbwk9Qf42HQcDmv7T/AA14d8PeEPDlp4P8I2kWn6TpsSwW1tAoSONEGAAPw5Pf3rnvB/hbQPBfhqy8HeEbCHStK06NYre0t0CRxqowAAP8mu2iKhdo71/PNR3dj/Kbxd8Vcf4mZj7ereGGp/w6d9Ev5n3k+r6bItxKgA3cAfjQ3J29M1E24LipYVJHqahdj8dfcu4UDJ/ClzlaavTk5pSQHzUPyMiZmCDniqV5qOn6Zp8+patKLe3hQySyucKiKMsxPsKtOyuOTkEc1+Ef/BbL9uq3+C3wrb9mr4dXePEviiIfbpIyN9tZN1BI6NKOPpzVQjzO59fwFwbjOO87wvDeWx96o/efSMV8Un5Jf5H8/P8AwU+/a7uf2u/2n9W8SaZK3/COaKzadpEROQIYjhpOn/LRwW/GvzmpWOTk80ldSVj/AF/yLJcLw7l+GyPLIctKjFRivJLf1e78xKKXBowTQesJRS4o470AJRWzo2ga14huxYaHZz3szdI7eNpGP4KCa+jvDP7Ev7Wfi+yXUfD3w/1q4gcZWT7MyA59N2KN9jhxeZ4PL9cdiIU/8UlH82j5Yor7T1D/AIJ2ftr6XZm+vPhzrCxAZLCHPH0BzXz74g+CPxi8KvIniLwvqlmYjh/MtJQFPuduKHpuYYfPstxj5cJjKc35Ti/yZ5dRUjxSRSGGRSGBwQeCDUdB6oUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAf/9X/AD/6KKKACiiigAooooAKKKKACvsT9hv9rHxN+x7+0BpPxS0pnl0xj9l1a0U8XFlIQJFx0LJ99fcV8eqcHNOZwTkDFRUpxqwlSmtGcmYYChmmFrZdjoc1OonGS7pn+i34Q8YeHvH3hLTvHXhG5S80vVoI7u2nQgq8cq7l/EDhh2IromJGJG5+lfzX/wDBFD9tuPSdSb9kP4lXYWzvnefw7NKcBLgnMlruPaTkoPXI7iv6Uv8ASFz8gULndn19K/MMwwUsvrSoyWnR+R/nB4i8F1+CM4rZVVV6b1hL+aL2+a2fmiVcnBPOahliyePwq2Dhdx9O1RMxrmjJn57r1KSKzIwfv/Si2JlieJhgngVaByCfekZQvCnr+VdMJ6k3vofPn7SP7PHgT9pf4ZXfw+8a2iXCyoTBJj54XA4ZD161/EF+0r+z/wCK/wBm74r6l8NfFEbgW0jfZ5mUqJos/Kw7Zx1r+/0bUcSKMDvXhXxn/Zp+BH7QVvDa/F/w3b619nYNCzjY6kejqQfqOle9luZfVHyz1iz9t8J/FyfAU6mBzOMqmFl0VrxfdXsteup/GV+xh+xZ8Q/2t/iDa6RpUEtr4filH27UWQ+WiA5ZUY4BfH5V/bB8KPhR4I+Cfw8034beArVbbTdMhWGNQMFiPvOx7sx5zW54K8A+D/hz4ct/CPgjTYNL0u0ULFb26bFGO5xyW9ySa66QsBgHjPSqx2YSxbSStE8zxR8VcXx/XjQpx9nhofDC+77y7v8ALp3Izndx0pGjIHFPXDDpUbdciuOLPx1gSNuCM56UMaXcx60MF6ZrWMrGbI+TyaT3FSYOM9aacHp+NdCkZPQi47d6ToM9zT2U7h/Kmkdq3hIkjbaMkU0Y55604qQQe9Mxn7tbqRD1EyFXoRUUaDJbtUoyeB9TUX3ePXgVvFkrzIzPG/yg4PTFDpIMHGBVJrbY/mA++KuGaSYbXGK6U+o9PsiFfM6/SvCP2hP2f/hn+0t8Nrv4YfFGzFxZ3ALQTqAJ7SfGFmhbqCO46Eda9vbcGwD1qOSBChZW+YcGtac2md+V5picnxdLMcuquFSDumnZpn8UP7W//BPj45/ss+LXsbqxm17QJm/0TVLKJpEdTkqsiqCUcDqD+FeN/Df9lz4nePtmoXVq2l6eSN090pQkf7KkZNf3D+LdBg1PT5Ld4g4YHBIBIz357/hX5l/G34YXEF7Ncwo2zk47Z+lfqPh/kOUZ5ioxzqrK38q0v8/8j/RvwL8VsBxvKjgOLdKi3cXyqT9NbedvlY/K/wCHn7O3w6+H0ayQ263t4oybiUZOf9kdq94SNF4VQAOmOKuahby2d00EqbGXsaq8H8K/t3IMky7JsNGhk9CMIeS/N7v5n+jmTYXB4XDxWV01GD6K39MdggZoJyaTNSAd6+oj5HpjP6UnJqTjGO9MatoktEZpwGeQacT60ma1Rk1YPYd6O9JnuKWtEyWrjMY96dSZFBzmtUyPIXrUR4bFSn3pKtEtXIiBTakPGSKZxnrVpmbQDFNI96d9aQjnNUQxozmmkYOKd9KaV5+tWjNjMU3HrT8AmkOelWjNoYQTUeMnjvUxFR45qjNojNFPI4pmD1ppkNDCO1MNS49ajwfzp3M2ug3pTCM8U8imnrVmbQ3B71Gc1IwycUzB71Rm0N75pPenUnXrVIhruM2gCmN19alqPtVmbQym8k07GKbjk4oM2MIHWmHipSKYRzjNBDQ3GTzSEZp2B1FNpshkVGMUpFBXnmhEEbKD1ozgUEYpjcDjk1XmZvTUYTnrWvp+kz3soVEyT271Z0TRLjUbhQqkknHHWvs74M/Ai88RXEMhjbBIPI96+S4n4pwuQ0J1K9RJo/KPELxFwPCWEqVK9VKSRhfBH4JX3iW9heWA7SR16nNft18GvhtD4R0mOKKPZ8oz61ifB/4Saf4SsIXaLDLjt3r6WAjiiWJAOmK/gzxN8Qq3E2InQU/cTP8AJjxp8X8Xx3jJ0IT/AHab6lqNkCiNOAKljLAYPWolj24Yd6l37uVr8cZ/PEvItAtv9qmAbvVMNxgcVOuaLGTRcVgODSeZk7W69qiztAzzWfqOoWGk2M2p6lMlvbwIXkkcgKqqMkknio5RQpupJU6au3ojwr9p/wDaN8F/ssfBfVfjF43mVUskZbWDPz3FwR8iKOMnPWv8/D45fGTxl8f/AIpax8WfHtw1xqWrztK2TwiE/Ii+iqOAK/RP/grF+3Zf/tXfGM+C/Cdyw8H+FpHgtEB+WeYfK8x9cngV+SRrohGx/px9HvwqXAOT/wBsZpD/AG3EpOV94Q3jDyfWXnp0Eoooqz+hwqQZ3AY5r69/Za/YY/aO/a+1xNN+EGgyzWQcLPqU4MdnCM4JaQjDY9Fya/qT/ZG/4Io/s9/AKW38TfFx18deI4SHPmrtsoX/AOmcZOXwehaldH5R4geM3DXh1GVLNcR7TEdKULSn/wBvdIr/ABP0TP5lf2Xv+CdX7Un7WN3DL8OfD8ttpMjYbVL7MFso9QSNz/8AAQRX9Dn7O/8AwQK+A3gRINW+P2uz+LtRCgy2lrm3tVf0BzvYD1NfvhpGl6bodjHpWjQJa20I2pDEoRQPQKOBV9IiG34wfesZVHf3T+IuOPpPcUcTynhskksHQeyh8bXnN6/+A8p4p8LP2ffgn8FrCPTPhb4V0/SY4xgPHCpk47l2G7PvXuHnXCx7sYC9hwBTwF3bgeSPSpFcFCp71Gr3P52xuZYrMajxOOrSqTe7lJtv5u5VjursvwWwaW/t4tUhaw1OGK6gkXa6TIrqw9CGBq2rFcLipO/NQ79zkjXnTfNTdn5H5D/ty/8ABJr4B/tP+FL/AF34d6Rb+GfG0UbSW1zYoIobiQA4jnjXAO48AgZr+JDx/wCBfE3wy8Z6n4B8ZWrWep6TcPbXET9VdDg/geor/TmlXysTx/K3YjqDX8Xv/BfT4TaP4H/a4sfHGhW6wR+KtLS5uCgA3XMZKyMcd24+tbUpt+6z+3voseKWZZhj6nAmeV5Vabg5U3J3cXHeN3rytapdGj8K6KKK3P7qCiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAP//W/wA/+iiigAooooAKKKKACiiigAooooA1tD13V/DWtWniPQZ3tL2xmSeCaM4eOSMhlZT6gjNf2/f8E9v2ytI/bE+BVvr1/PHH4s0RUttbtF4O8DCXAB/gmAz7HI7V/DaBnJr68/Ym/av8U/sgfHPTviZorPNpshFtqtnk7Li0c4cEd2T7y8dR715Ob5cswo2S95bf5H5l4qcBU+OsolRpR/2ileVN+fWL8pfnY/vJ8xpJNmQV96AuPm5GTXPeEfFvhT4ieFdM8feB7tbzSNZgF1aToch42/qpyCPUV1KupGHOa/NnF03yM/zpxeGqYSpPD148sotprqmnYiII46+9JyeKkJHQd6aVJ+YcE1rGRyMrvuOVGMVGQQ21fyqzJGCu2mMhx71vGXUzWmhC2Vyp/WlWNthBOameMdfWkHI610RnfVk77lYdCvTtT/vYz1oC7TT/APZraMiHrqRbQGyKdwOTTx82TTdvGPWtoshkTYPBpOAeePrTz6Hik6k1vGRmyFsh+TS7ewp59B9aaRjmuiL0IY04/wA+1R8AdelS4H3Sfem9BnvW8ZEehARxiq/CjHXNWfYDrUeARzXTGRJXA796CPlwRwRinnO4etNYDPzVupDepAQScjrVZo2DgqetXCm1snkelVlmBm8s8VomJp9BLq2a6j2qPm9K8X+IfgC21a3cmMEnNe5INpyvNVryKO7j2MOox7V7eVZpVwFWNWnK1j6HhviLE8PYqni8LK1mfjJ8XPhPNpdzLKqYPPQV8s3FpPZyGN1Ix2r90PiP4Bi1i2kKxhs+3evzj+KPwiudPnkZI8YOelf114d+IsMbCGExctT/AFT8AfpCYfO8PSyrN6tpLTVnyKhz71JjnBqxc2E1lO0Uo2kE8VV8wGv6Bw9aFWKnBn9v4fE08VTVajK6YYpcZOKk4ppHTFdkTZoZjB+tOxjmpDwaazYrZKxLViIqO9FPI9aQ9cirRm0MoHpTvwpOe1aRIaA+1IaU5o5PWtESyMgHimnrUn1pu3mrXkQ0R85pDTsdqQ1Zk0JRmigjBq1qQyNueaTb6U4/NTSvaqRmxnNJinEYFJVENDDio8VKfSmN7VRm0R4PTNJj0p5B69qSqRm0RNzxTccVJimEVSM2uozjNNwaec009QarYzaI8ZFKeMYp+MmoyuDTRDQw88VGRg81NjJqMDnmqRm0Mximn1qXbzTD1waozaIyOc0w4zUhGaD70ENdCIjBptTnB61EV556015EtDM89KaRu5pdo7Uj/KtGm7M29LsiYlSAa3dF0G51SdVSMnJ7DNLoeg3Gq3K7ATuPFfe3wK+BNzrN1BMYiRw3I4r4vizizD8PYaVapPVH454meJmC4OwdSdSouZIo/A74GXGsSwvJEdpIyTX65fCz4X6f4YsIf3QDqB19qs/Dn4caf4XskRYwGwO3oK9sSELGMjntX8H+IHiFiOIcRUp05Wif5KeK3izjeM8bVjCo/ZtlmFFRQijtV2KJVPHeq43fj61ICVPc9q/JG2/eZ+DyblqywwyOelAGODTA3y9OKfikkZkgOeKnDY5PHaq54xmngfjTIZZMm0YPPbNfj3/wWS+JHxT8FfsyXOj/AA5jlih1IiK8ni+8IifmAx0BFfsBtJI3Vxvjn4f+FPiT4cm8K+MrOO+sbhSrxyKGUg+xoWjPqeCM9w/DOd4LPMfQVWFKak4vrb/I/wA1STrnqTyT796jAya/pi/bd/4Iia7Nqc/jz9ltFmWcl5NLdgoBPaMnpXxd8Af+CKX7W3xQ8Z29j8R7GPwloSuPtV7cOryBM8iKNTkse2eO9dFrH+oGVeM3B+Z5X/b/APakKcEruMpJTT7cu7fa179D8mvBXgXxh8RfE1r4O8Cabcatql64jgtrZC8js3AwBn8+lf0z/sQf8EG7aGOx+I/7YlwWkOyZPDtu2AO+LmUHk9Mqv4mv2p/Zb/Yp/Z//AGPvDq6R8I9HQajIgW61W4Ae7nPfLkfKPZcV9eOJWwC2D71zzqW2P5J8UfpRZhnSnk/AKeHou6dV/wASS/u/yL75eaOb8J+DvDXgHwza+DfAthBpOmWSCOG2tUEcaqPYVundC2Fzmrlu48vDdTUioCQSOPU1nrZH8kV8TUxFSVfEycpSd23q231b6hAjyJvnb5scVKrFBj86jlGBxxTcHHI6U0c2+ofOWz39qmGScHt1qI5DirCHK5zz60gfcsRtlfWpCQRz1PSq6qdwzU+QFDdKGjJocyM+FPSv5Tv+DjW3gHjP4bTIPnNhcqW9cOv8q/qskIAr+Tj/AIOLtcin+J/w78OgDfbaZczE+qvIMfyopq0rn9BfRgpznx/gHHZRqv8A8pyP5tKKKK6j/UsKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooA//9f/AD/6KKKACiiigAooooAKKKKACiiigBQcDFSJyOKipynmgaP6Cf8AgjD+3QvgzxCn7JfxQvAujatK0mg3Ep/49ryQjMGTwEl7Z/i47iv6gQZ0kMEwIYDkV/nA2d3d6fexahYStDPA6yRyIcMrqcqynsQRxX9tX/BNT9s21/a++BMX/CQSqnjDwukVpq0efmnAG2O7A44kAw3owNfFcS5Zy2x9Fadf8z+RvpA+HSpS/wBdcpp+7J2qpLr0n89n52fU/RdW3cHrTZdqdT1qGG485xOBgE9O/wCOfWh0S9n7/LXycZH8mTi07Dw21sD6YodMcginPGASV/Omr1O4YreEjFrsMxx9KjCkk5qZcA5FNZeeua3TuTIZnPA/Gk2gDpQwJbijAwOBxXRFmbDbzmmFc4J60v8ADz+VLt43E5zW0X0IkiL+dGAx4p2PX6UMBnIHH1rogzNjAmSV6UwdefyqVgOtNKk8it4skZ0BYUwqOvenH7vH1qMjuK6IvsQNcKRzTWwWOOTUnOc/jUbcj29q3hIlohO4nNRlWHINS7V+6aawAH9K6IsREyk8frUBtFM3m96skAHmlraLBtoYQFHA4qk+4nKDrV4hT1OKhI3NvA4HQCtYvXQi9ilNFuiKyg/jXjvxD+H9nrlpI2wcg17a2ZDufOKguY1mQxSdDwM17mVZpVwFWNWg7WPouHuIsTw/iqeNwc2mn3Pxx+Kfwkl0u6knjTAGTwK+Vb2znsLgxyg8d6/dPx/8OrbWLZgEBPevzh+KHwfl06eRoYjxnOR3r+uvDnxJp4uCwuNl2P8AUv6P/wBIWhnFCGV5tU97Ras+QEbclOIBGKs3+n3Gm3TRTKVAqmrjt2r+g8PXjXip03c/ujC4qnjKca1GV0yXrSADNLwBmm57V2RNpAenHFMIG6n8E9aQjmrIeogHekOR1pc44peO1aIljSMHJ70361IeBio8AVoiJISkpeabjHSrXYzY0j8M0zJJ5qTHam+wrRGchlFOOe9NzVpmbQADHFR85p9HIq7kNEZBx1pp96lIzTMdjxVIlojIpDkU/FNIpmbRFjPSkxUh9KjIxV3MmhmPSkweuaeetIaozaIBmjHOaeeORTe+Ke5DQ0r2ppU5qTFNPPNUuxDXUiI9aZipT7Uw1SMmhhGOaaVyeKkxTec0yGiPaT0ppBp5XvSEY4NMhxG4phXJqYjHUVGzAHimu5ErJXZE2E61t6NotxqtwE2nkjipdD0afVboKATzmvtr4G/BW41m6jlkgO047e9fHcU8VYbIcPOrUnqkfkfiR4k4Lg/B1Z1Ki5kiz8DfgjPrV3DI8GVOCTjmv1z+Gvw8svDOnRFYgGAHb2pnwx+HFj4Z02N9ihlXHAr2IbYkCxDqePav4M8QOP8AEcRYipThP3Ef5DeLHirjeNsdUUaj5LsdDGMgrx6CtQM20bsVAuAoJ596lBJ68V+USbk7s/Dpvmd2SBsc1KADy1QLkHH4CpFA6MaixkyXJOMdBUvTpVYZY0522jrzTsTa5cpwI6CqSyA8VZTvQS1Ys5YYA49qlGVAIqDg804dQM/pScTJotJOYx8/H+fpU0ckmdxyVPaqMgDcE1NGMxgDtUtEtInglLMd2OakuIzMvmMenNUwcNgfWrvDrtHSly3ViWrNNEqNhQFqzGe1UgNvAqdD2Y/lTtoZtE+S/wBKl6HIqFVUjjqacCevtQZsb1bJFWlJ25U1WI4znFSpJ5SkHmkJ6lgnPI4qddwy2elZjXEglwo4I4NS+fNKNuKzuS4MtSXDRgqoyD2r+IT/AILmfFWP4hftr3fhu22tH4VsYdPJByd5BdwfoTX9nXxN8faF8Lvh7rXxG8TypFY6JaS3cpdgAdikhcn+8cAfWv8AN9+NHxN1j4y/FfxB8UtdbN1rt9NdsPQSMSq/8BXArSir6n9j/RA4Xnic3x/FlSPuUYezT/vTs390U7+qPMKKKK6D/QQKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooA//9D/AD/6KKKACiiigAooooAKKKKACiiigAooooAXOOlfUv7Hv7UXjL9kf42ab8WPCrvJBGwh1GzB+W7s3I8yNh0zjlT2OO2a+Wacpw24jOO1RUpxqxdOorpnLjcFRzHD1MBjYKVOaaaezTP9Er4eeOvDHxa8CaV8TPAlyLjR9ctku7Z15+Rxna2OjKeCDzkV6JEqlfMx1Ffyvf8ABGL9t+P4b+M/+GX/AIkXZj0LxFNu0iZz8trety0ZJPCTdP8Aex61/U8n+sNuc7kJBA7V+X5pgZ5fXdFr3ej8j/ObxN4HrcEZvUwDV6Uvepy7xf6rZkmNyk59qYwwppx4UqKQngFq4otpH5m10IeMYpcbhk0pUAkgc04DkkV0RkZvyK8o6+ppuCOamZM8t36U3ov1raEiNhCpJ3HimAEkBjTyVPNJt4wOldEWZtDOOh7007e3WpGPGabtGNtbxZDQ0gZ47008Zpzj09cUY5x1roiyCDBBwf8ACo2yBmpmB/h6UwjnFbwkSyJh2po+Xk+lK4A680hDYroiybDSAajIAOe1S4xx6UEYGe1bqQrFfryetNcE9Kn25z/jURBP9a1jIGRnGMHtVOVf3gHp6Vpd8VXkiQEYraMiNho4h25zUcsbngckVYXCnLUgHy89a2jIV7GZtEmVYdRg8V5B438B2OsWzkpnivaRuDkHpUFykUkZj2bs+te3leZVMBUjWou1j3+H8+xGRYqGLwk3Fo/Iz4vfBx7OWS5tYycZxxXyBqGmXWlTtBOrYBI5r95fGfgqy1izdWQYwa/O34tfCE2t1LLGh4zgDiv6q8N/E5VlDA42R/px9H76RlLMoUsnzifvaLVnw8si49aca1Nb0W60q6aNgQMn/CsZWUnA7etf0nhcXDFU41aTumf3xgsfSzClGvh5XTJ8etMyM048ik6mu6J1sFHag9z0p1MYd62RDQY/WmVKTjmo8npWhDEx3pKdgik71fmQMxSEU85zSAYGKtGbREeTQetPwM80fSrRDRHzkCkpcZNLjuKsiwz2FMI65qQ008cdqoh6EQpKm5B9qQgCmQ13IaYRx71JTcZ5NUjNoixgYpPpUpXFMxVmTQwjFRkVKfSk5qkQyLbTe9PI7U3FMhobt9ajI7ipiKZiqM2iIjFIacR1Io4HFNOxnyjCPSmMp3YqbFQvgHiqIkupCenJq9p1hPqE6xp0J6UWllPfzrHHwCcetfW3wa+Dt/rl5EDFlSQcmvmuI+I8PkOHlXrytZH5vx7xzg+EMDUxWIqJNI2vgj8G59bvoS8RxkZyK/X74U/Da18OabGWjw2BniqHwl+F1j4e06PfENwA/CvfokESbUHHpX8FeI3iDX4hxNSjRl7h/j/4yeLeK42x9WnRqP2d+5YVSFEUY2jFTjA4A5qA4ZcJUsS8V+PNuT5mfz9J31ZNF83zU/OGGKiXlsDmplO7ijczY8ZzkYp6nJGaYigDNO24ORSJZKPSkkXI45pQKk+9waCPMzkbn/CtKJgV54qoyAnI4qzCp2ihFTs1cvICVBB9qlAHaoUXC896lzxTOZkoVTz60sS7e/Wmj2p/G7IpEvsTZBFHHBXikj64IqUpjBWi1iNnYEJPOKsIPyA6VEpGelPBx1pEMm46dzT880xc447UoUn0pMgl6/j3p9s2dwk5pipzk81IqkHHqeaz66EvawtwrqwaPgU1mCR7WOGNSOzK2Op615/438aaN8PPB+p+O/FdxHa6fpFvLeXErHAWOFSx69ScdO9S9XY3wmGqYyrDDUI80pNJJbtt2SPwU/4L1ftat4M+GOl/sveF7r/T/EmL3VNjcpaIcJG4ByC7jP0r+SOvo79rT9oLxD+0/wDH/wAR/GXX3Y/2rdMbaM9IrZDtiQDoMKB+NfN9dUVZH+vPhPwNT8PuGsHkKX723PUfectX92kV5IXpSUUVTP0gKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooA/9H/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKALVle3em3kWo2ErQzwOskciHayMpyrKRyCDyK/tY/4Jh/tnWv7WPwLgsvE06nxn4URLPVEyoaeHBEN0FzkhgMOf72e2K/idr6f/ZB/ab8WfslfHXR/jD4WzJFav5N/a5wt1ZyECaJhwM7eVPZgDXl5tl6zCg4L4lqv68z878TOBqXHOT1MClatD3qb/vdvSW33M/v1j+bdsHK44qB2xIU7etch4A8f+Ffij4I0j4meCLoXWk69bJd20q90kAJUj1RvlPuK7ZyZCTjkdPpX5e1KnJ056NH+cONwdXAVp4XExtKLaae6aKzff3dc0/ygqFs03acb/XvRHuIOa1hKyOFqwdQc+9RNtJyTirW3Iwc1CVwAp5FbwmRsNVQwweabxyB0qUAZwO9IOm1q6ISuZtEQAY/Wgon8RpzDOCeKQqBlQa6YyM5ERA6ZpGHHHpUgBz/AI0mB0rdMzIdoBqPkEelTbRnAphRRzW8ZEkBAPXvTHX+L1qUDPNRn1FbxkSRjB5604ZpTjFJ0PHNbxkSxrrTFUAe5qQYb73U0hGWyPpWsZAyNlBORTT1wKcQDgd6GWtk+xLIWUZ9KY4UdO9TsuD1queff2rWDFYY3J2kUzABx2qQqBz6U2QNt61vGZNrFR4VYGPqCK808Y+CrLXIJIdnzEdcZr0fZIScDrR5ZH3x1r18BmNXB1I1aMrWPcyfOMRk2IhjMHNpo/LL4vfBiS0dzEnIyeBXxJrOiXWlXRSSMrtzn8K/fDxh4LtNZgYMoJPtXwN8X/gsFmklgjOec8V/Ufhv4nr3cFj5H+kfgD9I2FaNHJ86qa6K7PzxV1ZQR3p+McCt3X/Dd7ol66up2DisBJVIr+oMFi6eNpqtRd0z/Q3L8xo5lRjicNO6ZMOlGD1NNXJ5NPrvizusIwwaZjqKkxmomrVESXUXPPWmYp+MHmkII5PHtWiZDG4xSU/6daZVohiH1NMC9zT+vFN61Zm1cDjrTCMGnc560zjvVpkNBTSOeakAwaTv1pkNER4PFN74FS0VS7k8pAR60mKkIpn86ozaGYyeaaakINJjHSrM2iI9OaaV5+lP5HFIemaZm1chxzSACpCPSkHU1Rm0RUmDnBp5z6U0CqRDRGwzxRgdKfjIwKiPIzVIzegwk5zUtvay3kwhjGTUQ3yyLDH9419I/CT4V3PiC9jzGSpPLH614efZ3QyTDzxWIlayPiONuLcLwpl9THYuok0jT+EHwnutevY2ePcCRxj1r9hfg/8ACu08PWEcjxKG6njH1rC+C/wfttDsIZ7iMKw9hzX1DBbLDGIkXAxxX8K+J/iPVz7ETwuGl7p/kR44+MuJ4zxs8Jhqj9mn3JoITbYSLgfT0q4isSCRkU62tmdNzdTSQAxna3Ffhs5OT5pH8yTnztt7k6g8kjrzUwXb161EATgkYzU4ztz+FQjFj1RTwOalVc8dTUCjj61JGO/WqRDJxgdKcoB+UnNQKOelPAJ4FBLRIp5545qxuwvJqqAR+FTDIHsaCZEqhcY7/nU4weDxUCgH7v604DpQjNosjhcVKBngVVH1p6HJxQQ0WlHcVMAB1quvzDJNOXkkmghroWCegzUqtnnpVdQCARUyt8uKRDVizj5uKMjOKiDY+tSIQWpENE6HpzSt+ZqPGDkUqk9fWk+5NupOr8n36+tWUZhletUgcPtNSF8Lk1myHG+wspbeEbHqTX86n/Bej9rlvBXw8039lXwlcbdQ8RKt7qpRjlLND+7iP/XRhnnsK/dT4t/E7w38H/htrfxT8YTLBpmh2Ut3KSevlrlUHqWPAHev88z9pX48eKv2lPjTrvxi8XyM1xq1wzxxkkiGAEiOJc9Aq4q6dPXmZ/VX0XvDn/WLO3xZmFO9DCWavtKq/hX/AG78T87dzwnI7UlFFbn+joUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAf/9L/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigD+hr/gif+2mvhXXJv2TPiNeY07V3NxoMsr8QXf8duCeizdQOMEe9f09MGi3RyDY68MvcHPSv837R9X1LQdVttc0ad7a7s5UmgljJVkkQhlZT2IIzX9x/wDwT2/a70r9r79n6y8UXLonifR1Sy1yFSAfORQFuNv92Ycj3yO1fDcTZZ7OX9oUVo9/8z+QvpBeHnsan+umVQ92bSqpdJdJfPr5+p93SL5SZXnd2/wpi8ZA47VKsgI4xxxTRmViVr4+Ej+TpaXix4yueaYwJOeuKfggZOKTHeumEjLfYZjvjimDjgdfepeeQKj25FdUJ9yLEZVT34ppUgc1M4BG31puPXg10RkQ4kTZHQcU0jDEinZ55p3p7V0RkQ0QlcjA4qMrxg/Wp2HccdKhbjrxW8ZEPUjYY68VHwDg8ZqY4NQgHqDW8ZdyGhOD1ppUGnkUhBzg/nW8ZEEbfewTTSOmKewH0pp4NbRkIZt5pCOMHrUjKMnntTGWtlIRHg1Hj14zUhG4ZHemgnvitIyCxFjJxnrSBQQe/tUu3nPSmMAelbRkJ+RXAw3IxTMu8pLcYqzgdvxpksBZNqEjNbRYJ2KRR0Yg8qRj2rgvGXhiLV7OSPYDkfnXfx2hQ73PNN2bnIbmvUwOPqYSaqUpWsetlWaV8qrwxWEnZxZ+Z/xY+DbZdoYsDk8CvhfxJ4avNFu5FkQgdq/fLxH4as9Vt3SRQePT1r4d+L3wXVlknt4+RnGB/hX9OeHPin7FwwePlpsf6IeAn0juV0snzyp5as/MhW+bntUucjNdh4s8HXmh3bBgQP5VxETn7rdRX9VZfj6OPpKvhpXTP9HMnzrD5zQjisHNSTJjR1o6UuK9OOp6zGnpTck1JjHWg5Naoza7jM46U3GelPJpu01aJaGHg4pDzxTvTFHSrRD1GYzSEU7mj2qvIzsMPBprDHWpajZc1SJaI8UVJ1xikPWqIaIyM0wjuKeaMCqWpDRCRzRipGXjNMIAqzJqxHgA896YemKkxmk20zNoiIPJNNOe1S7TnrSEc4qiGiMjimlcmnk4ppODVEPzGY4zTCPMcRryT2FSYZ2wgyfavVPh/wCBLrXtQijRC24jt715uaZpSyyjKvXlax8xxNxFhuHcJUxeLmlZGz8L/hxe+IdQiURsQTk4r9dvgp8JoNBsobl4sEAdRXMfAb4MRabaxXVzEC2M19uWFjFaxiIADAxX8R+KviVPNa08DhZe6j/Jjx/8bK/E2Mq5VganuJk1jbpbxBVGBirg65xzS/KT8hzUiqM5NfzzOo6jcpPVn8gVKjnJzm9SUq7J8tMjTaPnNIrleB3oTpWZlZosA96lAxzUXQYBp4xnjimtCGWExkE/hTwMGoVBHB704A4qiCwME048Gq4yB+NSKS1BDViUHNPB9KZgdRT1UGkxMnA45qUc8ZqDAxk/5FSZ9aZmTAHrT+BgVWXJwKkQZGTQiWrFtWAHNOwAuarAnP1qyoUc5pGbRIvBwal4GMVCOuBUwPpSbIZIASMfzqVTg46cVVdwg5ogdXJNBNtLlzNPUlulRKzsDkZzSglQCecVDRLRKDk4biqt9cLDAznjFTzPhCXGK+Z/jb8SoPC3h24zLh9pAGea7sryyrmuIhhKCu5Ox62RZPWzvGUsBhlrJpH4s/8ABcj43eJtU+DOn/C7wbIy2Et+r6rsP30jBMSt7buv0FfylkEda/ov/aA1+2+IOp3VvrAEyz7lYNzkV+IXxl+E194C1Z7y0Utp8zEowH3c9jX7Nx34RY3hzLMPxDgouVOy5/7r7+h/rz4Z8Cf6mcLYPB4enaOspPq2+r/I8MopcYpK/Ej7IKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAP/0/8AP/ooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACvuX/gn9+1zrn7H3x+sPHAlkfw/qJFlrVqrHbLayEAvtyAXjPzKT059a+GqXNZ1aUa8JUqiumcWY5fQzXC1ctx0OanUTTXkz/R10LxDofibQ7PxP4buFu9O1OCO6tZ1xtkilUMjDHHINb/lFMM4xX89//BE39sxvFXhx/wBkjx3dD7dpSvc6C8jYaW35aW3y3Xy/vKB/Dn0r+g4bp4/lOR2Oa/J80wUsvxEqD26eaP8ANrxE4Or8F5xXymqvcTvCX80Xs/0fmiQbdu4jrSDDdBUbkgbfTvREPwz0rkjKx+fyHsn4YqLAHWphg8HFRsARXTCRm+xGQG5pnXIp545NRsPT866YyJYm0dBSbQBjrSkZbikx+VdEZeZD1GHB9qjZec+tS7cDB9aYSD93P4VvGRmyIqOc0wr0qU4J9qj5znHJrohIlkLfzoUe/wDSpecYphXitoyIY043ZOKZ161MwBXAqMqccn61vGQmR42jNIQM807imkA1spC1IioPC00jjmpX4HrTccdK1jIXmQ9M5OKMHBFOx69aXAIIrWMhDCNowKTjGGp3LDgjmj72ea1jIkiMe4c1W8jknv1qyVGetKWwDg9PWtoyHzPoUVgBJVznPFcxrXhmHUIGV1DZ9a7V0JO89fzpWjLD2PFd2Fx1TDTU6TtY7svzOtl1WNfDys0fn38YPgxHOJJLeIbiD0r86vGHgy80G7dSrDae4r99de0K31aBkcfe/EV8V/Fr4Nx3ZkuIoxnk9K/pHw08UpYKUMJjJaH98eAX0jJ5dKllGcVPd21PyjjfJ2v2qwCK7vxn4FvtCumBTG0nt2rz5JGVjGwwRX9e5bmNHMaUa+Hle5/pvkWfYXPsNDGYKaaZKQDRg0p9aXk816sT2mRtx2oI9OtKR2FKRnitERbuRgYHNHPpS8E07FWibdSLoaKeVphA6CrM2rCGmbam256UzHPNUiWiPBBxSkU8fzpp5NMkhx2pDzUrCo8GqRm1YYV5pcc5pdtIR2qzOxGQRzTadtGcUpUdBVIhq+pERSdSafjNN24qjNoY4G0kVGqlztXrUpx0PWuq8K+GLrWL9NqEkkVxY/GU8BRlXqu1jxM8zehk2GnjMTJJJGh4K8JT61fxoqFifWv1P+BPwWWzSK8uosNjPSuL+AvwVbEN3LF1weRX6OeH9BttKtEgQAYH41/Hviz4myxE55dgZ6bH+Xf0ivHarmeIq5PldX3dtC1o+mQ6darBEMYroggb5u9VjGjDPcelTQyhxg9q/l6vWlXm6k3qz+EsRWniJutN3bFUFW+lWUYk8GoFAzzU3BPHSsWc0tR+MtTsDtUeBnnvUq/lTRLJl4J9KeG6ioQcfjT89j1NMgnGM4FGB2pg6CpF55qmQyQc8CpAABkfyqIYPTjNSggcjn6UEseMYxUq/KKiHv3py4bikQyYDI5p4UEYPWmKONtSqe/f/ChaEMeo7CpF61GM09SOcjNOxLJAoBwPwqdMdKrr61KrZO2kyGiVSV57mnK5j+/TVJqUrmp8yCIx+ZjH6U6CPbg05BtJBFP83AwaBNvZFneAvvSl1zljVcuGXArLvNQt7G3kuJ3wFGaqnBzkoxW4Qpuo+WO5geMPFUGhaXNcSPt2A9a/F39qP41vql3NYwzZVSe9fS37UPxvFlDLp9lLwFYHnFfi/wCOPFs+t3ztJIZMn61/Vvgr4dOtOGcYynp0P7v+jP4MTzCtTz/MqWm6ucfrupNq9685bgnj6ZrznxT4f0zxRpUuj6mm+KQYOfX1z7V1ILD5jyT1qq67mx0PrX9kVctw9fDSwGIgpQas09mmf6aUsupYfDxwcY+7ax+THxL+H2peAtdksp1LW7EmJ8cEV5rX67/EXwTpfjfQ5NP1CMZx8r/xK3rX5beM/CWo+Dtbl0m/U/Ix2t2YdiK/z68YPCqtwPi3mWXxbwlR6f3H/K/0PzTOsnnllTmjrB7eXkcjRS0lfiJ4YUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQB//U/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKUY6mkooA734Y/EfxZ8JPH+k/ErwRctaarotyl1byKT95Dna2OqsMhh3BIr+7r9lL9pTwt+1D8GdI+LvhmQI15GI7y3zzb3icSxEf73I9QRX8BS9a/ob/AOCTXiLxh8FPCl9ba3KI7DxBcJdR2zZyjIu0Seg3LWNbhavxQpUcDC8oJu/l5n534jeFdTxLy6cctpXxFBOSf93qn69P+HP6d0kVjwKcqhSeeK43wh4rtvEFnHLEwO8cc12SknJHvivyTF4KtgK0sNiI2aP87M6yXE5HiZ4DHQ5ZRdhuGPOOKGPY08qMb+xxTSP71ZwkeG0R7c4JpG4GDQRk5A4pGUg4J/CumMtCGhhH8JpGIJwPyqTHrTCoPSuiMjNohIJXmm4OM+lTsADgUxlUd66IzuQyErxTWUBsipSuTxTNgxt/+tW8X0IaIfw703GfYU/AHuaNnGD6d63jIloiIyMdc0xskYzUhUg5HrSNwQBW8ZEMYwJOe9N6DavennljSEZ6flWqkAwqBwDURHepmUjvmmlFI961jIRGQMZ/nTCFqRlzz+lLtAJLVqpEkBUdD1oUKDk1IcjkU32rWMhfIYVyfU56VXYHzMYq2VbgZqNweea1UriHIFJ+tIjM3yE0wA9D060qx4bA6mtUybFe5SMLz1Irn9U0KLUoXDICGHQ10t1HuUMx5qlKW4UdO/0rvwuJnh5KpB2sduBxlTBVI16ErNHxL8W/g/aXkMr28WWwTwK/Nzxv4DvtDvGAQjGefpX7zahodtqG7eNykY5618ufFj4RWupQSyRIM4JGBX9FeG/ihPLqkcJi53i+5/cPgJ9IitkFWllOaVG4vTU/HVWaNjHKMH0NT1654/8Ah1daHeSMI8bfQV46Q8LGOUYIr+w8nznD5vRVfDyvc/1E4Y4pwfE2Fhi8DNO6JqTpyKAeAaOor2kfTsaRmnUYPal9q0RNhhHNB65p3GaU1oiGiA0AZ4p+3jmm4xxTRLQmKaRipG55plUiJIackYqPmpvc1GRVIzkhrAjFMqUg9aaVAqiGiMDFJ1qTHpTQPw9qpXIasRgCkk4XJ4p7rgZanwW09/KsUAzzipqVI0oudR2SObE14YanKrVdkjR0LRZtWuwiqT0wK/Rb9nv4KG5mhu7qMcYx9a8z+Bfwql1i5ieWLKkg5Ir9YPAfhOLw9YJEq7SAK/lnxf8AEf2UJ5bgZ6n+cP0l/HH2Sq5JlVTV6aM6Hwt4fttC09IoRg+n9K6hWJXmkC4fC/nSoSSO1fx9i8VPF1JVqru2f5t43GVMdVlicQ7t6kiqQwBqUJhgR+dR4GM0o69s1ynCP2kMCO9SqfU1CDwM/WnqDii3UTJyxqTgdKiHHNSdsGmQSDnpT8jpUa5z8op5K7vT3pkMnz7U/NQqf71S9aZLJFPfpUoB3ZNVwDTxkg0IgnHHB71JkYquF6H9ak3Dp0pktE4xng1IWIPWogRThigi1ywCOvSpgOcVBnIznNS/7NIhkgwTUo61ChzU6kYwfypMzZIuM96kaQJwDVcsvRanFu20FqCHbqPRxgtSll6g81DMFJwKZJIqAlmpKN2Fr7DZpTCpkPTHU18k/H34uQeHNMmtoZcPg9+uK9M+JnxCtfDWlySmQLtB4r8Vv2g/jBda9qMqxy5BJyM1+ueGnAlXiDG06lSn7iP6B8EvCrE8a5nSqVaf7tM8R+MfxFvfEupSO8hIz0zXzNKxMhkfqe9beq3899cEu2e9Y7Lu61/oTw9k9PJsJDDUY2sj/YngzhWhwxl9PA4eFrIhx0JNR4XdUpHYmoSuG4r6FOx9XJdQYAjD968Z+LPwy07x7orKVC3SDMcmOc+h9jXsgfdwabIgdcDmvJzvJMJxDg6uV5nTU6c1ZpnFjMLTxtJ0KyumfjJrmiah4e1OXStSQxyxMQQRWPX6KfHv4TjxPpzazpUY+2W4JOOrqO31r875YpIZWhlBVlOCD1yK/wA2PEvgDE8AZpLA1U3RnrTl3Xb1XU/I8zy6eW1nRnt0ZHRRRX50ecFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQB//V/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKK9T+Efwv1j4reLYfD+mqwiyGnlxwid8104TCVcfWhg8JHmnJ2SXc6cFg62YV6eCwcOac2kkurZ7D+y/8CLn4meIF8R67Cf7GsWy2QR5sg6KPUZ61+xmjTvo88LWoEaxgABeAAOAPyrnvBnhLSPA+gW/hzQo/LtrdQAo4ye7H3NdHJGcb1Nf13wZwbQ4awH1aaUqs9Zvu+3oj+zeDuAsPw1ln1KrFSq1Feb7vsvJf8E/Qr4FfGe4tTFZ3Eh4wOT+HSv0j8N+IodZtEmicNuH15r+frwv4im0i/RgxBGO9fpR8CvjCjmOzvJj2HXivwHxd8OLOeaZfS8z/P8A+lF4BRm6nEOTULPVux+g5IOGXp9aQhivFY2lalHf2aTId27+ta2R0PSv5TrUZ4epKlUVrH+YuPwNTBVZ4evGzTsMRVwT6cGhkz9e9LtB5ApSDjcO9VCZ59iIjHNLtzk0Keg7UYJPSumEiHGw0g8gUxlz0608ng85phPHNbxkZNdGQ7CTgcZpQOPlwKdtwOetRkkdfpW8ZXM2rEf1/nTQuR9fSpQpyM03YQ2O4710xZLGleOnNQ7ccGphkKc9aYx7Ct4yJsRlRjikKjHPFOxnPbNHAHNaKQn5EfOKjYcc9+1OkXtjilxk4NaxkJjDgU0AAg9KkPXikIPStkyRhB28UnX5qfjB4NHy4yKtSERYwSRQwXolLupoUbuetaxkIbt/OlIXr3py9eKbswSa2UiRjAE8857UwtGn/wBap+APrUToCfl54rZTsBWYJvyv0rJ1LSVvbZw44Pb610EGADu4qJIQwPP4V3YbFToyUqZ04bEzw81Upu1j5C+KPwmg1eCR4Yhuwfzr82fiP8N7rw/du6x8ZNfuVqVnbzxGFgDmvmn4p/CiDVbR7iGIEn0r978N/EutlNWGGxM/dZ/ZPgN4/YnhjE0sszKpem3bU/F7c0blG6jtUw9q9r+Ivw1udIuZJo4yoTnpXiBEkDmOQEGv7VybOsPnNCOIw0r3P9XOFeK8HxThIY3AzvclA9aMUq880DBr3EfV2EpDS/Sk9xV36ksbjFIVHTFPODTMfjV3IsNOAaaetSY5wTSNwaZLRGfSkxjpTx70h9+apMiSEIphXIp2Oc01uuO1WZsjxzStwMUrZAzULv8ArTvYylaKbYkSG4lEC5zXvfwu+H8+s6jCmw5JHQc1yXgPwlc6tfIPL3En0zX6q/Ab4Vrp9vFeTRgHGcEV+MeJvHkMiwtShSl7zR/J3j/4w0eE8DWwOFn77Vt+p678Jvh5baBpcUk0fOBwBXvsKBVCL93HFRwWyQQiKIYAHSpI93II5r+Dc5zWrmmIniKsr3Z/j1xDnuIz/F1cdip3bZaIC85pVGRxS4HB6U1CuBivHsj55lhAFGRQB6nrQee/vxSg4980iBUHXApyg55poOOc07270JWEyZTk0/APNRAetPWmQT7R3+lB280wH0oJpomxZGOvWlA561ECCCf8mlAGT3qkSTjinhvzqBQT1p4Jz1oJaJR19qlUjj1+tQAY6VIvWgllhQecmpR71XBwcGpivHNBDJ1OelSA5xgVXAPSpE55NDIasT9BTyc81GQxOQaYGZTjsakkm8wZw1SyTEN8tUZFdpAFFWpVWDCsfxpvUTitCxGxbDVx/i7xBBomnSXMzhcDNb15qEVjbtI54HNfn/8AtG/GRNPtpLK1l4II696+l4W4frZ7i6dCnC+p9fwVwpiOKsxpYHDQum0fO/7RvxsF28tpDL8uCMZr8xPFWvz6reSSbs7iQa7D4leM5NY1CQ792T615JtyTg1/oV4e8HUciwdP3LOx/st4LeF+G4RyyjKVO07FI4HNRAYqyyVAQK/Ukfu81Yr4GeaYwz0qx71CwyaowlErbdppXGMbaMGm85ppHOytNEssRRuR3r4K/aH+FJ0udvF+ix/unOZkUcKfWvvsDHWsjVNJttaspbC7QPHMpVlIz1r4PxF4HwvHWU1crxMffSvCXWMuj/zPGzbLIZlRdGW/T1PxkIwcUlet/Fz4dXXgTxDIkaH7HKxMTf0NeSGv8zs7ybFcP42tlGZw5alN2a/VeT6H5LXozw9SVGsrNBRS8YpK8oyCiiigAooooAKKKKACiiigAooooAKKKKACiiigD//W/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiilBxQAlFFKBnpQBqaLo9/r2pw6RpiGSe4cIijnJJr9tPgD8HrL4UeDobMqGv7hRLcyjruI+7n2r5n/AGNvggltb/8ACy/EkP7yYFbNHHQd3/Gv0UjA27T2r+jvCng1YSiuIswh7817ifRd/V/kf1H4PcDLAUFxLmUP3s17if2Y9/V/kSZBAxyKUgbfrSYwaeDnjtX7de+p++JdGQjMZ3Kegr0bwL40utGvYyrlQrDIrz3aRSRyyQyb1NcWYZfSzKjLD143TR83xHkGHzzCVMHiaaaaP2U+CPxXt9Vs4raaQE8A5PSvrC2nW6iE0WNrelfhX8K/iFc+H7yNQ5GDjr+dfq58KfiZa63YIhl5wOP/AK9fxF4reHVTJsRPHYWHus/x/wDpK+AdfhnF1c5yyl+7bbdj35G4570KpOR0pqOsyBkOQRxUwC4Br8FtKm3GR/DNejKjJ05qzQxgEHuaYwUfjTX3lsnp09KkKitoyuc8k9yJRxmmldzccGpsDdxUIUgEfSt4yMmhO9R8Z54FTgAeuDTGzz3A71vGZi0QcjrSBefXmnAA/jSMmDkd66YyJYwjrim7SB708gdzTeASBzXRGRDI2GOT60gFSYyc9RimbQCAPzrVSJGsM9qjYgfhU+3Ge9IQBkelaRlYTID6UnGM07HJoIPU1spEjT0z1NRkdjUxAzwKbjitIyAj6E4pNuPxpzDJOeKQ/L0rWMrCYzHPFHXPpRgjrSnBNaqRLGtwM1FuPQ08Y+6DSFCTnvWyYh4Ud6q+bztTPp71NsPSoFVo5CR3xW0X2BeYnlAtlu2Ko6hpcFzbtHIvB61qFMfN/OmEHAPbpzXbh8Q6LU4OxvQxM8NNVKTs0fJHxW+FVrqlq7wRAdSDj1r81/iV8OrnRbuQpGRg9cV+5l/Yw3UPlSr8v518zfFf4UWmsQySrEM4Nfvvht4k1coq08NiZ3if2L4D+PeJ4YxVLLsyq/u9tWfiyhkjkMUowwqzkMa9k+I/w2uNFvX8uM4UmvFsSQTGKUEFT0r+1smzqhm9CNfDyvc/1i4V4rwfE+Ep4zB1E+ZEnf0poz0qRW3CkxmvcR9X5iAd6bT8HFIRVIloZ3pDinnIpuM00ybDcZ4ppBBqXvUbdcZq0Q0IVxzTG55NSlTnjvTHAQ5p+hDXUjfj3rQ0jSpdTvkjjUnJAqnHDJd3CwRdzX178F/hbNq17E/lEjIPSvl+LOIaOQ4SeIqu2h+ZeJfGuG4OyyrjcROzs7Hu3wD+FRlMF3NFxjNfox4e0qHS7RI4l7fpXJ+AfCdvoukxxhQG2jP4CvTodoG0HNf588c8VVM+xtSblof4neK/H1fjLNa+InP3Luw8Hb8zCpcAcnvSBOxFKACMD61+fX1PyBsnVQRk9aaoxyKiVSepqYKQOtF7kD/anAZXJ5pka54HWnhcHnvSJY5cA4p3fBpgAxmngVSESKO/c08881EM45qXOevaghjx708YyR0qPnOaccZzVCJRinYOck0zryOtLwOT3pkEgABqQc9BUQ45/GpA3emIeBgZPNOHNR8kYp4GDzTJZYBB461KDnjpVcYxmpMcbqXoQ0Thj27U6o155PFODEHjihkFpW4xTWNMUjBxS5/d56nPFIixYSYOvzdulQzSAlnc4C1DmYt7GvM/iT4zt/DukPI7hWI/Hp0rsy/BTx1aFCkrtndl2XVMyxEMHhleUmed/Gn4p2/hywmhSXDAHv8AhX4nfF74mXXiHUJWMhIJJ617H8evi/caxeTW8EuVBOefyr4G1S7lv7h5HJPNf274Q+HUctowx+Lj7zP9TPo0+CMMmw8M5zKl7zs9SlO7zSeYxOTyagO7qpqXACgVHX9KQioxUUf3RGmqUVCK2IGBzzUW3k1ZYd6jA9a0RnJalcjioCMtV1qgKg8VSMZxKrrURXDVO6g8GmFRVHNJFZ89DSKM81KVIbNNPP3aGr6mTVjzX4neBbHxx4cm024XEmCYm9G//XX5Va5ot94f1SbSNRXZLCxUj+tfs20YcbTXx9+0l8Lv7RtP+Ex0eMedCP34Xqy+uK/mf6QPhss9wX+tOU0/39Fe8l9qHX1a3Xlc+M4oyj20Pr9CPvR381/wD4OopSCOtJX8KH52FFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFAH//1/8AP/ooooAKKKKACiiigAooooAKKKKACiiigAooooAK97/Z9+E918VPHENjKCun2pEty/Ygfw59TXiFhY3OpXkWn2aGSWZgiKOpJOAK/cP4C/Ci1+FfgO10tkX7bOBNdOByXIBx0/h6V93wBws+JMwXt4/uadnLz7R+f5H6P4Z8HvirM1LER/cUrSn59o/Pr5HtGn6fZ6bYxafYoI4oFCIo7KOlXwMdKRelO4HIr+uacFTioQVkj+1qdOMIqEFZIeFJoPWmjg470/HPBrZFoduOeaiNSg+lITxWifYTV9xttcPazLKvUV9S/Bv4qXGj3SQzSkAdua+WcMau2V9LaTrIp5U/pXgcRZDQz7CVMPXje6Pz7jzgnB8XZfUwOMp3bTR+83w38dW/iDSoiHBLKO/WvV0fIwDX5GfBD4wS6VPDBcSkAHGOxFfpp4L8YWuv2EcwYEsARiv4L8ROAa/DeKnVpw9xn+K/j14JYvgbMa2IoUn7JtnoUynbvB4pEAC5pV+Ybk4BpQMLntX5ZF9D+WXF/CxvrTApHXj6U4J8vHSk5xnHFbxkZNDCu3g01lA5Pf8AWn4AORTTg9enet4SMmiLGBnrTCgAzUhU9T2/SoSuDiuiMiLAyEikKqVxmngcHFIUxya6IyIaIyveo2Uipioxk0wjuK2TJasJgJgg5xTOhzTz8vHrTK1iyLDcAc1EVzhqnIGKYcjPuK1jIljeRyBSt6dqUqPu0YG0c1opCIsE0wIR0qXHUgU3GRx6VopCZEV+bFIQc/WnMMdaVkUDitoyJGdsU3aD9Pan4JPFIOma1ixCAEEimSrnGTjNSbQODShVzjqa3jIRCyk8N1NR7CV96neM/XFMIy2PzrVSC1yOVHJDdazb6wW6hKMvXitsgFB61G8Y2dK7MPXlSalB2sdFCvLDyVSk9j5N+KPwptNXt5HSJQxFfm58SPhhc6NcySrG3ykngV+32oWMd2pjcZBxXzx8TvhVaavbyOiD5h6V+9+HPiXWyepChiKj5T+vvA3x5xXC2Jo4DH1nyXPxJaOWBikoIPvTgTj1r334n/DK70S/kKR4UHHFeASRvbyeVJwR61/bOSZ3h85oRxGHmnc/1l4R4uwfFWCp4/BVE7ruTDNJ3oDZHHajdivfPr9BpGDQRzTiMCm496BDaQinfSkIP51otCGhh4qGU7yEXnJxU7gMcdK7Hwl4an1q7XAyc8cVyY/HU8DQlXquyR4eeZtRybDVMXiZWSR2Hw08DzaxfR7VJ5Bziv1s+DHw+j0rTopnjCkDnivEvgT8L1toIruaPGMH3r7w0yyjsLdYYgQoHav4j8XOPZ5nWlgcPPRH+Sv0lvF+pxBjKmUYOp7qdjUjRQuxBwO1IkOORwTSq25iRxmpM8V/O8puTbkfxRObk25bsl2jPXpS8Bs+tIRwRSgGouY+oqkEZP8AjUo61AOuPWpvxqhNDxke9SoCBUI9qcQBx+tMhknQ5NPAOajA96fx3p3JHgc1JjPSoQR+dPyeoP5VQrXJ0AxjNPXGPWouOpqTB70eRA8buM0gznnigdeO9LxjNUtRD8jHvSqcj600D+/T+TxTJHqBjFTABuPWogSMnpT+nNBLHkbuakQjvUIOeKcoA68ijyJZKnIwanH5moEPO2pxjjFJvoRIfGDzx1pDu3YHNTM20ZxzWbdXi2tu1xIcBR3qoRdRpRQQi6jUYopa9rEWk2TzTMFVQSc1+Xv7Snxoa4MtpbygKNwAXvXtH7RPxlXTrKWxtHwcYOK/Hv4i+NZtYv5P3hZSTjOa/pXwe8OpY6pDMsbT0R/cP0afBKpneJp57mdL3VqrnD+J/EF1q188znKkniuTbpxVjcWbc1QP6V/bmCwsMHSjRpKyR/qxleWUsqw0MJh42SRCwJGKgI9asmmMuea7EdclcrkZFQnIqfHeo2BqjCSIGBNMBxU/U88VA3BwKaZjJWIXXnihhxgU/BxUZ+9VIwaICSBUfK81YI7VDtPWncwkiIAnOKp3lnBe2z2twu5WBDA9wav8jkUhBznHtWdSkq0XTqK6ZlOKkrSPyt+Nfw6m8BeKnSEZtLkl4iOgz2rxqv1g+MHgGDx14XmstgNwmWhbuG64r8rNQsLnTLySwvFKSxMVYH1Ff5zeNPh/LgrOZV8HC2Grtyh2T6x+W68vQ/JM9y15fiHyL3Jar/IpUUUV+MniBRRRQAUUUUAFFFFABRRRQAUUUUAFFFFAH//Q/wA/+iiigAooooAKKKKACiiigAooooAKKKKACnrg8GmV0/hDwxf+MfElp4d05S8t1IEwBnAJ5P4CtKVKVacaNJXk3ZLzZrQpTxFSNCjG8pNJLu2fZ37GfwfOu6y/xH1uLda2Z22wYcNJ3P8AwGv1JB3jHYcVxvgPwbp/gLwtaeGdLQLHAg3Ed3xyfxNdsvqK/sDgzh6PDeW08Fb33rJ95P8Ay2P7m4E4XhwrldPL0v3j1m+8nv8AdsgUHOetS5qMfNUnSvsEz7VKwtPX0pgwDxUwGDirT6jSF68ikNJxQOtaobFyR2qGVd3FTEA0hHerXmRJXVjW0PWZ9MullViADyR1r7c+B3xmks54rWeVgMjOTXwQyBRz+FbGh6zPpV4k0bEYPOK+P4t4Rw/EWGqU6kdWj8g8TPDTBcb4CthcVBNtdj+gvwz4lttYsopIm3ZHNdOrqMj9a/Oj4D/GNB5djdSnacDrX33oGu2+rwLNEwOR1NfwHxpwhieHcXUpyh7tz/Evxh8JsbwLmVaPsnyXfQ6BGDpnPWq0jiNRgZzS4YvhBUnGzDV8JF9D8Deu6I/NGML07fWnbhk+tRFdr+1OQgnnit4yMJRBR1qMxZNSMdtNUhh14610QmZvQiI556U7Hc1IqbcgU0DB+aumMiGRHHU8U3jocVLtxx68Uxk65raMkQxp69c01uRn8akbGflpnGOTWkZEv0GYGc/nSbMdKlIxz2NIRxj/AOtW0ZEkW0Nwabt2/LU3Q4HNRsoq1IgjJHcUhAHWnbecflSbewrVSENPLYqNh+BqbCn6mkwDkmtVInchOe1L0ODUm3Hoc01hg/L/AIVtGQiFgc8UA56elO/iwwoC85at1LqAnmDJ9xUewFstQ6kNzSgHvWikIa4OMCo/MZuO/pU4VmyKWKFVY1tGQLRalYROB835VUvbSO4QhwCDmr7OwJWOqMjSjBxx/Ku2hXdKScTelVlRkpwdmj5s+KHwvstYt5GjQFj7V+anxO+F1zpF3JKIyoU9hxX7a3NpHdIY51+9/hXgXxR+F9nrdrIyw5JFfvXhz4k1cnqww2JneJ/XngX474nhfFUcvzCq/Z7an4hMr20hhlXbt4pxBJ5r6C+JvwsuNEvZXMZUdRwa+e3imtZjBMMEcc1/beQ57QzuhGvh5Xuf6y8IcX4PirBwxmDmndBz+FO255pQ3ehicgV70X0PsvMTnNG71p2etJHG88m1RnNOc1BOUmZVakaUXOT0Ltjp02o3CxRA9f0r7s+BHwue5khnlizjBORXj/wi+H7aneQtImSTnFfqh8LvBkOjachZQvAxX82eL/iDHB0p5dhp6n8E/Sa8ZIZdQqZNgKvvbaHceE/D8Gk2CoEwRjtXdY+TJqoYWwAOAQO1XUdlQCv4vx2Mni6sq9R6s/yqzTH1MxxE8XXd22KY8DPQ1ImMetRlt55p3zdfSuC55b8yYdeCKQcHJNMjORxTulMkkC56/jUoyRUGPWpVJH3hTTJY9R2Hel788UzOKk5A61SYmO69DmnDB46YqIccVICd1UiWiYDPeng1ABxT1Axj1qkSThTTwvGagUc1Ip420yGiQDsTUp9BUfAIpQPXvVIl9yUdOTzSA45pAKcPlHPSnuSSAN1p6gdfWoT8x61IPRe1L0ESk4X69KDnrTcbR701lwfemiSfzB0xUiyALuPFR5A603HOW6CklcVrhLdBfmPAr5++N3xJg0PSpIkl2NtPAPWu18f+NLXw9p8sjyAED8a/JX9oD4v3Gq3ctrBLkHPev1Pw+4MrZ9jKUpU/dvqfu3gz4X4njPNKE3SvTT1PGvjN8TbjXdRliVyykkda+Wp5pbmYzyHcc961dUv5b+5aRznnOfrWQy4OTX+gXDGR0smwkKFKNrI/2d4D4Pw/CeXUsJhoW0GEHHIzUZFTn0qNhivqEz7hxIdvrUX1qdh2NQkYNUjCSIWzURz161Ow71EcVWxhJEAqBl7YqyR3qIgUznkiGoSfSpXHpURHaqOeQh/nTB14p5zmmEVRkxhGeRTDzxTwMHHWhuvWn0M2rlNkBBUjg18H/tL/AA6Nnejxnp0fySnE2P7x/ir71cE9OK5jxZ4dtPEehz6VepvSZSB3wcdRX574lcGUeNskr5VVXvpc0H2ktv8AJnh5zlyzHDypdVqvU/HM+1JXVeM/C974P8RXOhXwIaFjg+qnoRXK1/mNjsHWy/EVcDi48s4Nprs1ufkk4OnJwmrNBRRRXKSFFFFABRRRQAUUUUAFFFFABRRRQB//0f8AP/ooooAKKKKACiiigAooooAKKKKACiiigAr9K/2IvhX5Mc/xK1eLLS5htdw6D+JhXwL4C8JX3jnxbY+F7BSWupVViBnan8RP0Ffvf4V8O6b4U0G18PaWoSCzjEagcZI6n8a/V/Crh3+0cc83xEfcpbecnt92/rY/a/BjhX+1swnnmKj+7ofD5zf+S19bG/sAG3PSkAIqRhzxTQa/pdeR/WjiOHXNSjPaox7U7INWmNDhkU8HFNpDmtLjuT5B6U3jpSLyadznFaJlbigjFNbPQUcd+KULzWkX0JYAZFRbQDu71Njmm4IrRPuZzipKzO08KeKbnR71JEbaARnFfpN8FfjHFewRQTydMAAnmvygY7DlDXo/grxpdaHdo3mHKnt7V+acf8C4fiXDTlye8fzr41+EGD47wFT92udJ20P310fVodTtEmRtxb/CtLcHXNfFPwT+M0F9BFa3MvIUDk19m6bdxX0fmxnOcZr+COKuGq/D+KnRrQaVz/FDxN8OcbwNmNXCYuk1FN2ZKmD+NNePccGpmZUIFV5CY5M+tfKxk07H5NLcR48d6I02gd6cU5qJy0Rx1rqhMi19CQYGaa3XFOAWTkGnkEiuqMzJoYcUwj0p4UY5+lKVByDWqlbUh6ERwOo5qMjP0qYhSMEUgUscVtGYmiFvTOKRhg8cVKVOOvPvSFT1PHFbJkERUdDSHGeTj6VLkY2rTWXgg1omQ0RBQx9Kjb0qbaD8vembQDitFIljDx+NJtycjnNSHgc8U0r2FaRkKwxsKKTGRyaec7uDTdueD2rVSJI9mRgjFLtA70/GRTAoU5reMgIyAeKTBFSMpIwRSN271upCK0h6igM44/8A1U4A7s08IBWkZW2HsRHDdBzTShOM1Iq4PFMYEnaDxW8ZhtsU2jcjI71Dc2YmTa4DDmtRkwQ1RjeuSOh9q7KVd0mpI0p1pUpKdPSx86/E74aWGt2bmKMM5B7etfl58UPh5J4Rv3e82wxE4yxwBX7eywJNH+8XKmvmb49fALQvih4ZuNJuY/mmQ4YdQfrX7JwH4o4rhmUYSblHtc/qvwS8fsbwRiaeExknKltq9j8WWvtKVipvrfPs4pftWnSfduYTn/aFfFH7S3wB8ffArxRNJGZpLLzDhsk8V882XiTWJF3pO+B7mv6RwPjhRxMFL6rf/t7/AIB/p/w34xYbiDC08VhqSldfzf8AAP1eXy5TmGWN/YEV6X4N8F3mpXKS43biOlfjSni3xDczra2tzIHY7RgtX7hf8E9vgt4rvtOTxJ4quJpg+GRZGJx+dcPEXjfhoYadKjR5ZPzPkfFfxsw/DOUVasY8s353P0d+CXwv/s6ySaZNpIHbn1r62sbAW8CJGOBxiqGi6XHp1ssEQ5xjNbu5QuK/jziLiCtneJnXqy3P8eePOMsVxXmFXG153uxWwg2A4puwE5qV0yAR1qMDHWvm3I/PmPXOR71Nx3qEYxzTxjGBTv0M2OHH0qTPPPSo1yQakGQME0JiH45qQdMVDyR6Y7U8YxVp3JY5eOnOamHIqPA6+lSjinfoSMBzT1PFNHJxSg1VxPUeBxwamGRyetVx3AqQHjFWtSWupMBx1qQcDFQ8fWlHPTvVIlq5PnPQ1JntmoMnoOKcrDpnNNEtEwGTgUuB1NMz2NLgdaoRMODmnBuOaiVvXin4J4x/9ak31IaHRjdyeamIO4Y7U0kopYc/Snb944o3EI5bjBzXM+JPEEGj2TyysBtGea1dSvUsbdp5Djb6+or4Q+PfxeSyhlto5cEg9DX1XC/D1bPMXDD0o3V9T7jgTg7FcXZjRwWGg2r6nkv7QPxoEkktpFNycjAPSvzP8Ua7Pqt48rsTursfHvjKfV72RmcsWzg5rychictzX9+eHnBlDIMJByh7x/st4JeFOF4NyynKVK07IrAZ/Glb0qcA+tR81+qLRWR/QTikrIgOM1E2APWpWHNRsM1SMZELVGcdqnYAcmosDvVGEokee1VyBVjFQtknFV5GEyLH51FjvU5B71Ew55powkupCy88VFtANTnGdtMxxiqWphJXKxQnoKaQKncetQnkcVZjJWID14pDwakIxUZoMWRnFRud/wApqxt9etNwCfeh69DNxPkP9pf4frqujx+LbBf9ItciXA6oM8/hivgUjFfs9qmm22pWctjdKHSVSrAj1r8nviV4QuPBXiu50iUER7t0Rx1U/wCFfw79JDgT+y8bT4vwMP3db3Z26TWz+a09V5n5rxRlv1eosZTWkt/X/gnA0UUV/Lp8mFFFFABRRRQAUUUUAFFFFABRRRQB/9L/AD/6KKKACiiigAooooAKKKKACiiigAo60Vv+GNAvvFOv2fh7TFLzXcqxqB7nr+VVCEqklTgrt6I0pUpV5xo0leTdku7Z+hX7D3w2e3gu/iZfphpP3FqCO38TD+VfomDhQo4rlfA3hWy8FeELHw1pw2w2cKoPdsfMfxNdMnBzX9g8I5LHIMso5el71ry85PV/5H928E8Px4ZynD5Wl7yV5ecnq/8AL0LA9qUc8UlLyOa+pR9eKQc8U/mmnjjrQQK0TGS8Gim579qdVxAdjuKUDnmm4p4BBxWiZXqOI460g/OnY96j47Va0Ex9M5+gp4BFR9DVxZLGdePWoRuWXcMj6VaCkkY6mmXc0FlH5t9MlumM7nOBVOaUXKbsjnqQiot1Nj1jwJ41u9Au45FcgA+tfqN8F/i3HrFrFb3cg3YwckV+El98VfhvoMu/UNTDY6+UM1o+E/25vhn4M1OMwXVyQG7Jwfr1xX4P4o8OZNnmHlNYmCqLzVz+RPpBeFGR8bZfUdGtBVknZXV/wP6cY5vtIWSFtwNOEDu/LYHpXxJ+zZ+1J4T+KukwHS7jqOjEZ5r7btrqKWDfCdysOor+GszwM8BXnReqR/jHxhwhieGcbUwlaLSTLBUN8oGKrzLvG0ipoCSMHNBj3HiuRTPiXHlZUQlGwO9WSA3WpZIgi8ioVcCTFbRqGcl1GgEcGkKk9qlHzDI60hXnNdEJ3M3EhK0zaSacytnind63jLzIIzuB455o2npUu0AY70jKAPet4yIaISMGkPc9qkYZ/wAKawXFaKRLGYUmmDnI9aecg4pCMHIrVSM2RAHPWmtyeBUvBO3vTCDjFaxYmM6c5zSHpx0p5UE0nBHNaqQPcjU4pCOcdqceuOnek2kfStlIQzIA+tMcfWpSnBB7U0rnLVtGRLIdvUUpBAyKeePem5GcZ61qmBEqjbz+dAQnBp2Bkmk9P510RkG4xlPTNNzt/wA81KpxwfyqJgCDurVSF5MacqvA6/pVR7cuCHA5zV4AsCBQFDZ4rohO2qKhUdNpxPk/9ob9nvw58XPD0+n3MCeaynDY74r+YX9pf9nDxX8DvFFwVhf7IzkkgcYr+yF4hMpUDgdq+W/2gP2dPDvxa0GfTry3V5GU89817+XZ5UwlrPQ/oDwp8YMVwhWjhcXNul+R/M9+xh8CdW+L/ji3v7iEtaROOCOODzmv6tvhP4CsPBXhyDT7OIIERR0x0r56/Zn/AGWNC+Ctm0dpEFbdn3r7XjVlAUHgdMVlmmZzxsr30MPGDxPqcZYx08HN+yWxLDJ61OQP4qqqirIGHNWkOTtWvFUkz8Dm7u5Lz0pPxo6sWxQ2GH0ouZAq9zUgz25pvHangbQOaq5LDHNP71EetO75ppiJB6U9celQAdj+tTj0NWJjwQOTUucc461COnNOB7GmQyT2P4Uu445ozkUds1SYhcVLyc57VD7inj6/nVpiY/BB61InHvTD069KUHnrVIgk3k8U9SBwDUI5JpwANUhExIHWnAntUa7T/KnjBNVoSx6n5snpVgBcAk4qqOCCO1THPGOan0JZK7/N9ahmuxbRmRuOtD5BGP1ryj4jeOYfD+nSDcAwBr0MtwNTH14YejG7bPTyjKq2b4mngcLG7k7Hnvxr+KUGh2MkKygNjjmvx8+LXxDudZ1CXLHBPrXqfx5+KEup30sSy5GTnn3r4vuLmW9laSQ7t3ev7i8JfD2nllCnj8TC0mf6yfRs8EKXD+CpZtmFP33rqQzSvcSGRieeajIpwU5weKUjnrX9DU6apxUUf23TpKlFU4LYgbrmmGpm55zUfuK1E10IT0qI4ByamfsKiI7UzCZCcmo2JzU7c9OKjYelUYNdiE9cVER3qVh6VEwOOKdzCSIDweKYwzUxXmmkVVzCUSBgCarkc1ZKkmoyMH0qjCSICDmo2+lTsvBxUTDPWqRjNEWMcd6QgE56U8Lj5qaVI60zJoiYfyqFhmrDcdO1RHmgyl2ISARg818r/tM+BxrOgL4ksUzPZ/e458s9fyr6tCBuvBrG1bTYtTsZrC5UMkq7SDzkGvlONuGaPFuTYrI8StKkXZ9pdH8meVmeBWOoSoS6/mfjFQDiu5+I3hWfwd4tu9GlGFVt0fujcjtXC1/lpmWX1sqxVbLcZG06cnFrzTsfj1SEqUnTmtVoAopRQeTXCQJRRRQAUUUUAFFFFABRRRQB/9P/AD/6KKKACiiigAooooAKKKKACiiigBQM9K+8P2Ifh/8A2p4pu/iBexbotOXy7diOPNbv9QK+FraGW4nSCEZd2CqPUnpX7o/A7wDD8O/hpp2gIoWeRBNcHuZJBkg/Sv0Pw1yVZrm0cRVV4Ufefr9lffr8j9X8IeHf7ZzqONqq9Oh7z/xfZX36/I9h6rgcAdqYfWpWXbxTB0yK/qO3Q/saxJx1qQ81GMDjNP8ArWiLJMccUg54FN6VIB6VaY9wxz7U/pUQGTUmAOKtMaHUoB6UlKM1ovMY9jwabt7GlLGgN2qwYDgZJpVTfkt8qgZLHoBTEieZwo+ua+V/jx8Z49Mhfwj4akIIyJJFPJPoK8rO87w+Q4WWOxj0Wy7vseRnGb0Mlw0sbi3p0Xd9jqPiZ+0BpXhEvpXhci4uQMNJ1APtXxjrnjvxj4vunk1K6fa56AkDn2rnobF53N3enLtz/nNaMaIoKjv6V/L/ABNx9js6qSjCbjDpFbH8+Z3xRjs6m3OfLDpFbf8ABMOPS2umLzyM2Oxq0ul2cbbMZFa+Q7YIqJRn5sV8HLEymnznzcoKafP1PW/gn8aPFXwb8QwX2mTsINw3KDxjNf0o/ssftV6D8StFhhuLhRMVAIzzmv5WIzmNh1zXqvwe+LviH4U69FqGmSsIwQWGa+bzfLI4yMpKOp+BeK3hJheKsNUrUKaVTuf2lQXCXMQkibKkZGOc1NbucnfyRX5yfsp/tbaP8QtJt7TUJx5u0AgnnNfonYXkF9Es1qdykZBHPWvzjFYaeFm4SR/m3xbwXi+GcVUw+Kg0kyZpXlYkcYqvukL/ACjrUgG2coDVmUxhv3f5VhF2Ph5RcdCNcKBg9uablcds04ghc9xWWZneXGK6YT6GfLfc0Tg5I5ph9+lNidznfUjgEV0QlcxaGgYBNI/J/GncYyO9ChTkt3reMiGiM9MEdabz1NSbRyR9aCD0NaxkQ0REEDgUwkDA9akOPShl/irVSIaIiM55zSEDPvUrcdB+VMYADPetoyJIsZ5HFNK1LwcZPNNUY4rWMgauRbRjg00DgmpvyqJhzwOlbRYrCe2PwppXuDUp6HI4obDDOeDWikSQEZ69KjXgYFSlcnmkKn0zW0ZDGFcHBqIg55qYKWHPWgrxx0reMuxPoQgY6CmlAM4qXocD/CmYPUVtGQtiPaMEcUkZHSnsPwoIwvA61rzkkMhxwtOUMWCn1p4T2zT9uOR1qlLqUnYqtEqthOMdKXORirBRVPGDQEXG6qUhOV9wSFXAINSqnFRHHWph16fnVJ9SXdi5zSBfm4o4zzQDg0JkEoXAwaO3NIOnvSY5zVpk27jwAR060lHbilPPU00K1hw+7gU8GoxxnilB/GtEIlIFO59aiQnOBU3Bp3JZJtz05oBBqJcGpBwKsT0JBjNKMD61Fg08ciqQh/bI5qTj19qiAz04p4GBxVIlokXDDFJnnNMA9DmnhcjJNWImT3NLgk9c5pyL8uMU3bTRFyQMGGM9aejAtjP61CTsPXp1qlqGpQ6fbmeU4Ve9VCLm0oq5VOlKrJQpq7ZmeKNet9KsJJJW2lQfavzB/aD+MHm+baW8gIORkGvXv2h/jbaaaG0q2uBvYHoefwr8qvGfiG5128kluWbDHt0xX9O+Dnh+8bUhmeLhoj+/PoveCM8yq0uI82pe6trnNa9q8+qXjSNyDzWOvA9KchD96XOCc1/aOEw8MJTjRp7I/wBTsvwFLL6EMPQVkiI5qI1NUTDnmuq9zpkiMjJ5pOR1NPPrTe+KZk0QHrUPuaske9QtTMZIhI3CoyuamPFRhc00YSRXbGajNWGGDULDHBqjCSISM1GRkVORmosd6pGEkRnmoWXPWrGO9RnHSqMpIgYd/wBKjxUpHFMPB+lUmYSREaQgf/Xp5GaQ5zincyaIWAJqDkHirLDBqEgk4p3sYziRHpUeSMhqnYdarE5PFV6GM9ND41/ar8IfabS28WWseWi+SQj+72r4Yr9hvGHh238R6DdaPdDcs0ZGfwr8jtc0m60PVp9JvFKSQOVIP6fpX8D/AEjuEf7HzqnxDh42p4la/wCOO/3r8mfl/E+A+rYhYiK0n+Zk0UtJX84nzIUUUUAFFFFABRRRQAUUUUAf/9T/AD/6KKKACiiigAooooAKKKKACiilAoA+k/2Wfh//AMJ18U7Rrpd1pp/7+Qnplfug/U1+05X7hXv1Ar40/Yw8CHw58OZPE90u2fV5Nyk9RGnAr7LKYJK1/UHhrk39l5RCvUjadX3n6fZX3a/M/svwjyD+xsip1qkbTre+/R/Cvu1+Yvvim9sigZxmgrxx0NfovmfqnoKOetSDrxTPc08DmrQ0OGKTNAGKXFWgFBweKf3qMHJqbjNaLuNai4zTgM0n1pwyKtMsCewph4pw+Y81NaRGacRZ4PU9sVpHXQT1PK/jD41j8B+EHkiYC7ugVTHUKR1r82Uln1a/bUbxyzMScnpXrvx+8WyeK/Hk9lCxMNufLUZ4wOK88toUiQRrzxX8teJnE08zzCeCpS/d09F+rP5z40z2WbY+VGm/3dPRfqxpIQDjOaHwuGUZFIVw/PfjmnqqbTv7V+Wc19WfJR21ABQwwOtOO3YVHNNZW3YHSpHTjzIxg+lPcHroMCqVDYqJvmG2p8MGLdfWhU5PSk/MmUVJNSPRPhl8U/EXwz1qHU9JlZURhuUHt3r+hv8AZI/a/wBJ8dabbafqc4E+AMEjtX8z8gQLtbkcZrp/A3jrxD8P9Zi1fQ52j2NkhTjivDzTKoYuLcVqfhviZ4XYTirDzqU4JTP7a7HUrPU4hcwsGDAHIOasxKBIWkPJ6CvyF/Y9/bQsPFdlBo/iC4XzsBTu65FfrVout2etWcd3ZMJA47e9fnWMwU8LNxmj/NzjfgTG8L4udGvT92+5r/Lu5GRTXhVcnuanzk9KU7WznnNc0J6an5pJNaMrOgXO3jjpTSxbinRtnOe5odCK6IzJkrirgDA7U0DceKesinjFNzlvl4+lbxkZtBg+4PSo9vcdKnAPsKjKkjArojIyaIhjp6+9LtJ5B/D0qULzTCM9OlaRl3IaIztzmmjGT71IRkHmmsABW0ZCGMmKQrxipAuBnv6U18Hha1jIViEjPzU33qbblqawABHr2raMhNEW3saa2c59amIOaixnIFaxkRYQj5eaYU5pxUjIHFIxycfnW0ZAxuO5FIVXGe9KoJOKUDitoyE0Q455/wA5obBHFSYA4qM46VspCsMdec0wrjk9KcwGfSlAwMA1opCGDAJP50889aaEAx607H8Qq4u+4DdnrxmlIHTPWl2/3aAuOKtSJsEYyT/k08DilXP4U08nFXF2JuNxj5jUmOeaYoyMdakAxwD1q7g2KBxkUqgAZpOO54o2AjNUmSxQC1A5JzRxtzRVpgx/oB1pBxSAc5pcVSZJIOnFOx600HilFaJiJMZOen0p/I9qh6c1ICDxVIljxu70oOTwKb1Gc08H/Cnckdnt61Ivpn/Gohg8U4dzVJ3E9RxGODTyxHFQrknpn2p/J4FWhWLKMMc/lTV2g5HWon54FI84jXkYH9KpJvRCUb7C3TBQSTxjNfCv7WH7Sej/AAk8I3VxNOvmhW2ruHJANeqfH3426L8MfDVxf3cyo0aEgZHXFfyYftW/tLeIvjt44nsLWdjYxuRkHg/TmvrMgyZ4yrGUlof0F4M+FdfivGwxuMh+5i7vzOI+LP7RXxC+KHxFn8TDUp4oY3PlIrkDrXWeEv2jfFWmskWtFb2IcENwfzrwbTtLgt4Qsw+c81YuNMjIypOSM1+65Hn+K4cUYZdVcfy+4/014boVOGcPSoZXLkUVsj7/APDXxr8FeIwqyyfY5W7Mcrn616pDcW95Es1pIsqkcFDkV+S5t7u0bzIxke1dl4b+I/irwtOHsbl1A/hzwfwr9iyTxdvy0s3o384/5H6Tl3H1Wm1DM6V13W/3H6edsg1Fkk18xeEv2j7K7C2/iqDB6GSPj8xX0Homv6F4jt1n0S6WXIHy5ww/Cv1vKuJMvzmKlgKyb7bP7j7zAZ7g8zSeFqJvs9H9xsHimgcU6RWjbBGBikzxnFe7c9TuQHFNxT9tIaZhJdSAqaZtBOamOMcUw56GmjKSKp461CVJq2ydxUVUvMwlErkU3rz61MVOaYRiqvYxcSBgc8VAUNWXqMjnincxlEgYY61CR61YYD6VAUOeapHPJDCO1IQCc07GBmkOTVIyaGk56VAfapW7471HTMpakDDuKjB2nAqQ0zpVo5pbjHQPzX54/tP+DW0jxLH4kt1xDfZDY6Bl/wAa/Q1upxXi/wAdfCS+K/A10kS5ltx5kf1HWvyjxm4UXFfDWKw1KN6lNc8PWOv4q6PnuIcH9cwkklrHVH5akUlPYc4PbrTK/wA0Xo7H5SFFFFIAooooAKKKKACiiigD/9X/AD/6KKKACiiigAooooAKKKKACuj8J6DceKPElj4etATJeTJEAPRjz+QrnK+0v2K/BY1r4jSeKblA0WkRl1z/AH3+UfiK9XI8uebY/D5fH7ckn6dfwPc4aymWeZnhcrh9uST9N3+Fz9S/D2iWnhzw/ZaBaLiKxhWFcdwoxmtxVzznmhTtG3qO340ccEdK/sehSjQhGlTVkkl9x/fVCjHD040aSskkl6IcRnjvSECpOT3zUQ4GDW60OhseBnk8+1P70wfepVPOatMof3pwGaaKXGOK0TGgDBqftx9aQZOBT/c1cR2FFSAYGfSmfWlHXitEyhx4bFU768GnaPqep9DDbOw+uMVbkrC8VRGTwPrIU4P2ZqjEzdOjUnHdJv8AA5sXJxpVJQ3Sb/Bn5TNM1/4hmupfmzIzc98muichTuxxXL6ezf2tL6bj/OuqbHnc847V/DOaVJVMVUnN31Z/I1RuVWTbK8i7iBmjaqLhhT2kUsSR+vSpCCygiuK5rFu1iILu/edvShxJFJkcqaeQGxu59qXPGV7U+bqU31G7S/zZ5pmyRj8pxj1qbadgk6c0yNuSXGBmne5DdyIA4Y+9NEp2eWRnnmrAKhyMc1A6scHHHQUb6EuCkmpHQ+FfF2seDNVj1jR5DGyNu4JGa/dr9jn9tu11mzt9B1+cB1wDuPXtX4CqMj5hkVo6DreqeGNQj1TR5WjkQ54OK8jNMrhjYPufkHiP4b4Ti3DShKHvdGf24eGfE9h4gs476xcMsgz1rqCCOe9fz6/sd/tu3UM1v4a8Tz8ghRuPav3R8HeOdJ8W2Ed9YSB9wGMH1r87xuAq4WTuj/OLxB8N8bwtiZxlT9253saYXB/KmyKVX5acrBuQMfSjducE158Z20Px+UWnaSINmQSDk0yMYBParOzADDjNQAYyPX0rohIy3HFOOnFMIwcU/nPBpSMniumEkQ0RYySO1NKsuSOKkPPXilKgZPStoyM2rIjIPVetM2Ht6VJxmmnOOa2jITREwx359utR7eOal5PymmlQBk1pGWpImO5puB97rTjk8UYwM1tGRLIiONtM2549amwOaG4FbRkIhCZXJpjE8Bqmxj86jJGc1rGRLIwO/pTcDOPapSeOKaMZ962jIQ1hzkVFjjn8ak4wc800g4x1reMhXGELzmmkYHHepAMdqiP6CtIyuAuzb1pu0DgfrTiAeSKVBjnpWifckaEPX2pcDj/P9KAMHFKRxnp7VomIQqPX/GndRSYH0oxkYHpWiZIzGee1Kq5GaXYppAP4RzVJhuOxxmkJwKf047GkXPQ9KtMVx2M96Me9Nwehp+ccVaYC47UpznjmjjnHTpTcn+GmSSHjr+VLz1poAz15p44HpWiEOOD170/HFQgBuKeTjiqRLRIBxx6VJk9GqFWx0p6gsMd6tO5LRJgdqUZHINNAwcGngDdWiYiTIA4FLu7VGScVErZ+U9KpdhJFgHYNxPSvLviR4+0rwX4fudT1CRY1jQnkj0rqPEWu2mjafJe3TAJGMnJx0r+d7/got+2bKzz+BvC1xmV8owU9K9zKMtnjaigkfpfhtwHieM8yp4alH3L6vyPk/wDby/a61n4o+KJ/Bvh+5YwK5Dsp4x6cV+f+laSdOiWVgC7cj1z61V0iyluJ31PUCWllJZieeT/9eumUM6jeOfWv2HB4SGBpRpwP9RuDeFMNwzgKWCwsLKKHxyMX3L1FaKqJQQwIxTUgZW3NwSOOKliQ8ueKmdS59Y6ieiKRRo+O5qN7e2dcOvzHvWqJPMPzVXnWNHBAyaUa7RPtV1MOTTSkO+E4NSWGr6xocwuLGV0ZTnKkitPbuw7np0xUDRM0vTOexr0MNmlXDyU6U2n5Fwk01KDsz3fwX+0lrWllLPxFGLuAcFj97H1r6d8N/ELwh4vjU6XciKUjmOU459q/Nu4sYgCw+U81SiOpaZJ5tq7LjnKmv1HIPFbH5bajj/3sPPf7z6vLeLcdl9qdZ+0h57/efrA8bqevBpp9OlfB/gr49eJdAKWmqsbq3HBDdcfWvqXwr8WPB/igKiS/Z5m/hc4GfrX7hkPHWV57FKjV5Z/yy3+Xc++y3ifA5laEZcsuz/zPSCpB69aZk4xUnzhd3BU9COlREEHIr7NST1TPefkMI5pm0VIEPWmEVXmZSRXbIFRnNWGGKi2iqMJIhIGeaYVFSsOajYY/GqTMJIhYVFjOanIBpuACasxkiDbg1F1NTMPembfxpowkiI4PNVyCDVpuuOlQEZNUjGaItueai28k1YqIjtVHPJdyEqOtVbq3iu7ZrWZchwVP0NXj0wagKnGD0rOrTVWLpz2ZlON1Zn5G/E/wy/hPxre6QRhA5ZP91ua8+r7P/ay8MiPULXxRCv3/AN3Icdx0r4wr/LrxM4dfC3EmPylK0VLmj/hlqvzt8j8ZzPC/U8VUodE9PQKKKK+DOAKKKKACiiigAooooA//1v8AP/ooooAKKKKACiiigAooooAUDNfr9+x54MXQPhXFq8y4uNUlMx4wdnQD8uRX5MaDpNxrms2ujWozJdypEuPVmA/rX9APhjQoPDPh+w0G2AVbGFIsD/ZXBr9X8KMt+sY+tmM1pTjZesv+Aj9x8D8n+tZliM2qLSlGy/xS/wAkn950DDjk8U4fLx6Ujhg1O5zX9EI/qlPsIQScr1pRRlg1IeeBn61S1KvrcF5HNOwSabg09Tz0rRFp9BRg9KfjNRk4OBT6tMpBxUinJpg9afnp61aGPoyOtGKXIxjvWiKF6mqd5bm+0LUrBeTLbuAPfFWsZ4qS0cRXALjKnhvoaqUVUi4S2d0ZVIKacJbO6+8/IlYWsPE01qwxl2U/ga6UxeXPsI612Hx38KzeDPiFNMikQzv5qHsVauWhljnt0lxyRmv4l4py2eWZhWw1Rapv8z+S82wc8vxlbC1VrFtECRKwYE4NNQGE7MZqZF8p93qM0OM8Yx7184pnJGTViApsGP0qbAONo/CjGCCw604IAQ2atu6NHPQaVPQjpTJAgJKjk1ZK44A+tRRn5snue9NSsTzW1ZGwJIK9ahlDDGKssuCC1RsNxCDvmtFK41JS0Kg2feHH1pVwcd/arAgjLZao23hs4xzTvcmVpaNC2tzd2Fyt9YyGOReQQcV+mv7J/wC27q/g6+t9B8T3GYshQxPGK/MZu2BgdahlSQSCSIhSvORxXBjMvjiotNHwfF3A2C4ow06OJgrn9ovwu+LuhePtLiu7SdW3KDwfUV7WkgcB1PX0r+Sz9mj9rXxB8MNUgsNVuibfcB8zdvxr+iH4D/tHeHPiTo0L2twrMVHGRnNfAZnktXDSbUdD/OvxR8HcXwxXqV8NC8PI+sWy3HfrUGzB96lt51uIhKjcMO2KeqY4HpXipOPuvQ/nqvh50W4VFZoZ0zTNvf8ASnushPrzQUyuRWsZHLJdxoCjpzmm5YkYyfajeDxTtvZua6YyIkrajNu7rTcevcU5toxjvQVIOR3rZSIasMAUcdKa+AMGn7DngmjHUda1UhEAXBxSFSGGeKkZWBBpNvqeK0jIlq4wjHI70wkEe9O/nSsFxW8ZCasRuvbNMGSTjr7VMwyRuzUQU5xnitYyIYwYxheaY4XbjOakHIPam7R3reMhERGOc4ppHbHSpSMHNJ046VrGVxFcL6UuKeBgUFfl+taxkAwjdgmlKY+7TtvGRS8YIzWqlYljAAenpRkZK0DPUigqD+NWpCEbim8ZqTGO1NxtrRMkQdePwoXaOnJPrT8/LwaYc55rRO4hSM4HrR0pSPemhTnmrT7BbuHQY6UwH2p45+UU7aK0vcAGGOKccY4pqqB160oxnHQdatCHA556Uo4x6mjHcGl+WrTJAEc/0pwYkYqNRn2NLtAJz2qriZLnPapRyNtQqaeGzVpktXJFPGTUuM9DUSnPFPD5XcOK0RLQjPkkCqN9c29nAZ5zgc5qzMyqhkc8DrXxz+1D8etI+FvhG6uZZ1VgpwM89PSu3CYeWImoRR7mQZJXzzF0sDhYNuTsfKX7e/7W1j8NfDN3pel3AM7KVAB5J59K/mN1nWtW8ceIbjxbr8hkuLli4DHoDXovxv8Aixr3xw8f3OvajIzWkch8tT0PNeefZ/JUDoO2K/YskyuGAoqUlqf6e+EXhxQ4Py6m5w/eNastxFmwpHTitKNSr9MelVoAU+Veea1YdhG7oRXo1qp+zVNtBzEsPTFSfNs2jmkGwkY/Gnum8ArxXLJ36nIluQzIIVHcnvTkCuoicDjml2seMcU4+So2nris7k2uQyheGIxiqzs2dx6jpipGJK73PH+feqzlov3h5AqoyNYFaRfNJz9aUyQxAxgdaNzlxx1oaJWADHBrZVO50p9yrc2NqWypIz6VRkt7qzxJbOwyeoNakkg/1MYyB61JDDkBs8DqK6qOKnRfNFikkzuvBfxs8XeEVFq8pubcnlJOfyNfXHg34ueEfGQWHzBaXbAfu3PBPsa+DLjTrO6BK8N+VYtzp91p0m6Bz67gcfyr9H4b8Tsxyblo1pe0p9n+jPayziXG5XaClzw7P9Huj9WWSVcHqD0Paojg9O1fB/gX47+K/Cu2xvT9ttlwNkhzj6E9K+tPB3xK8JeNogmnzfZ7rAzE55z7dK/oLh7jvLM/UYUqnJUf2Zb/ACfU/RMs4mweaWhGXLPs/wBH1O7I2jmmHHSpJBIG2yjFMIx9K+2ue80QsoJ4qMjnNTYGP8KjxnitEzGUSufvcU0jIwKlI70zHpTRg4kJUDimEZ4qY5HFRHJNWvMxkiFlx0qEg1YYc9aibnimtTnmiEjnioyBUxBphqzCSuV8YpuMjn0qbHvTAMDNFzJo8X+PPhw+Ivh/eW8a7pIR5qeo28nFflcQQa/arULeO8tpLaQZWRWUj2IxX5A+O9Cfw34tvtGYYEUrbf8AdJyP0r+LPpQcO+xxeB4lpLSadOXqtY/hc/OeL8H7OrTxaWj0f6HJUUUV/Jx8YFFFFABRRRQAUUUUAf/X/wA/+iiigAooooAKKKKACiinAZoA+lv2T/CaeKPjBYtcDMVgpuTnplen61+0RBLnd36Ed6/PH9hDwz5enax4vlHLutvH64Aya/Q9cM46HFf0p4X4D6nk6xElrVbfyWiP6+8Hct/s/II4mS1rScvlsvyJW5Gf/rU09aeQADzTCuRnPX3r9JXU/WVpoKqHGRSZwc9aZuI+UU4NnhqtFoQAdQaeB8vNN5zz6Uo9BWiLQuM8d6UU0cHFAq0WOyc04HFIKevtWiGh4xjPWkGe3SlHFGK0RQnNKxIyadg9aUAkVSA8X+OXgE+O/CI1KwXdd2CkH1Kdc/hX57aZPdabeGzvgVwdoz+VfrjDI1pMJVGVIww9R3FfJ/x4+CC3qv4x8IRlo5CWliUcoc5OAO1fkXiVwVLN4PN8BG9SK95Lql1Pynj7hOWOTzfARvNL3l38/wDM+agyldn6mmSeYeFAxXKNqk+nEw3SEFTjYw5rqLe8s54hLG4Oe1fzHWw9TDycKkbM/DJScXySViXY20u1IG2kA9akKjcFjbgUx0AOScVlG63QJtDyBjr1qFo3U5Vs1HNNBGhLSY9ay5datYG2ht+a3jQnPZFqLka4ibdsHQU1UWIHJzjrXNzeICxIhUn396WCx8Q6qwisoXfd/dBNd+HyyvXajCF2dFLD1KjtCN2a0s9vA5Z2H51nza5bjhSGPQV6L4f+AnxH8SgBbV40b+KT5R+te2aD+ydIFE3iG+jQ9wvJr7bLPDrN8wtKnhmk+r0X4n0mC4RzTH2dLDtLu9F+J8dz63cz8RoVzUUUeuXrgW6M30Gc1+k2ifAD4daOFku0e7YdjwK9O03w34X0hQul6dBHt6Hbk197l3gxiKivj68Y+S1Z9VhPDDFVLPF1ox9NWflLZ/C7x1r7qbWznY9jtIr7h/ZnH7RHwo1y3lgl8qxjYbknftnnjNfS6ySRDbDhAPQYqHMobJJPOetfVQ8E8pnDlxVSU38l/mPM/BHJc3oyw+aJ1LryX+Z+vHwY+Osmq2cFnrkyGYAKdp/xr7C0vVrbUoFltnBz2r8AvCvjS88OXwaGQ4yOM44r9BvhF8dxIIoriXAwByf0NfhXiN4IyylSxmTRbij/ADz8fPonSyf2ma8L0247n6AybmGUHFSMpwQOMd65bw34otNatklicMcV1cRJb5jwf1r+bcVhKuBqSo142aP88s3ybE5NWlhMbCzRVdAGyTilWQlcip9qc45pWAA3DvWUZXPHa7kHl/xUm3b/AIVOrAcZz6/WmFcnjjNbRmZtdyv1yOvakz7ZzUrpjkd6acH73St1MkYQepprLkHingBuRxSMo6fhzWqkTYj2EHimFRmpT14pjYJwOPpW0ZMVrkZU9aYVyf8APSptq8Y/+vTCM/Ma2jIjyIyvHFIPSn44600g5rdSJIyAaQZz83NP9qjI9+vtWsZCI8Annj1pMYyakGcgiggA+ua1UiSMqRS45Oe1PwScZpvIbC1omKw1kYn5aMY5xj1+lOIHamkHPJrSLEGCOtNAC5A/SlI9aae1axkITBz60YI5bvQ2Rnb16UNk8n/JrRSEIO3NLgf40485wetM+netUxDgcGlJx1qMnHLDmpDz8w/yK0TBibefrSgYxg9aY3rTiMcnmrQiQDFBGTzUecck9aXeDzV3FYcijOf/ANdKw4waOhzTygxxV3ExgwBz3qQN8vzHmmlxtwOKdkEA5z+lXFkjhwMH6mn7g3Sq7HbHk+9cz4o8Q2uh6VJeyuF2qTk100qTqtJdTpwuFni6kaNJXbOJ+LvxK03wL4dn1C7lCiNCeTjGK/lQ/bN/aT1r4x+MpvD+nzt9gRiGIPDCvrT/AIKH/tZajq92/gTwrcfO5KuVPQd6/IeJHjjCOd7tyWJ559TX6hwxkyox+s1on+gHgD4TRy2hDPcxh78tVcZHZW1tCsMXOPTvVn5pELEDjpSoCflb8anY7G5r7OpPoj+uI01SioRI49yqGBx7Yq3C+8bSeDVYcqWP5VYwDtA4PWuWZEywFCgg0o34+Y4IqIAr0NPzyCO1c7Odx6jkLqpJPWkl3FskZpi5YYPXrRIN5wDis2RZCCHgknH1qCaVWCoOVqXY20IxBNDiMMSBxjrQ5WKWhXdooV343Go0IkG4jk1cCwMNyAA+nSotqBevvT5i+buRbWBwOKRreQH5Tn1FTNtz0polZT83Q0+ZikwRIQ2O/p9KaIpQ2w8VIUQnepwTUsSyMcZo9ozFsyp9Lt5mGzHH51mpbajpj/abGQqyngqcH9K6UxLGxdqjd1VsDuK6aGNqUZKVN2sJSe6Pon4R/HJr+SPw34tbLH5Y5m4OfQmvqQrt5yMHkHqCD0Nfljf2ZjxeQHa6nOVr7Z+BfxDXxXow8Oakw+2Wy5jYnBZR2+tf0v4ZcfzzNrJM2lef2ZPr5M/RuFOIp1Zf2bj5Xf2W/wAn+h7i5G3NNwSMipPvDB4IprA4zX7lHuffyRBj0phyTzU2OM03HpVoxkiAimFe1SlaZ0qkYyRAQajI9anPHvUZGatGEkV8UwrU5U0wjsaswcbFcr261G9WDgcYqMjNBk49iq0fmIVAr85/2ofDf9meNY9YRQEvE5I/vL61+jpXjivln9qfw8dR8Gpq6r81lIDnvhutfjXjtkazvhLGcqvKjaov+3d/wufL8UYX2+CnJLWOv3H51kYOKSlPJor/ADgZ+UiUUUUAFFFFABRRRQB//9D/AD/6KKKACiiigAooooAKcvLU2tfQdOk1bWrPTIxlriZIwB6swFVGLm1CO7LpwdScacN27H7N/sv+Gh4Y+DmlRSrte7BuGPQnecjNfRSpWL4e0uLRdBsdHgGEtYI0x9FGR+dbqjGSa/sTJMGsuwGHwUfsxS/A/vvIcvWV5dhsvj9iMV9yEwB070hG78qGAPOKBuFeuexcO/A6U7aWBYcUdU5wcUwLt5/SmNPuMUgVIpI60ilW5FKM5ArVGq1DIHFKDTQeop4A7GtEaDgOPpThz07UzPrUgOBnFWhodnnFHU0Gl960RQc0tA65oPPFWmFh33xg0sM0lucA/IeGHqO4pFOOac4BGKt67B5o8T+IXwJ8L+Ow99pWLW7bnH8LGvkPxL+z/wDEPwvOzQ28ki9Q6cgj61+kuwqeDirkV3dQjYjcelfFZ34f5VnknVqw5J94/wCR8bnHA2W5zN16keSb6x6/I/JBvC3jyJzE8E429tp/wq9a+A/iBfuBFaTNn0U1+rvnb/8AWRRNznlBmnfaZ1OEwo9gBXy0fBzARld4l29F/mfOQ8KsHF3lipNf4V/mfm9ov7O3xL1llElo8KHnc/Ar13RP2TXXEniG8RD3C5J/SvsTfK/3yTTQjA19HgPDLJcHZ1IOb83/AJHuYPw8ynCvmnFz9X+iPGNC+AXw50U7pomu2HXdwK9d07TNJ0eIQ6VaQwKPRRmrgGDk08A49K+1wWT4LL1bA4eMPRH1mDyvCYFcuEoxj6L9dxrhpPlLE0wRLmp+KbzXqKx2uKAqCOKkGAabTSwzj1rWLsPYeTnk1GVzyafR9K1izOSvuQEDr3rp9A8TX2j3KSLIQAfXmuaIJ70wqM8VlicNTxlOVKsrpnk5nllHMqUsPiY3TP0D+EPxxltpore4l2gYHJr9DfCHjiy1+CNo33ZHrX4C6XrM+nTpIjlQDX178Jvjfc6XcRwXUpxkdTX8yeJvg/TxsZ4/Lafvb6H+fP0g/oxUc6hVzfIqNp6vQ/XaFhnI5B4qdizKExXj3gH4lWWu26ASLuI5BPNeuWkqXKiWM5Br+PM2ybFZRVdHE02rH+VXFPCOO4ZxM8JjqTjysRV+Q8cDrTFfq7VYLDGM8ntVaXdu29jXnxZ8pbWw1DvOacEyP8KSHBHT/wDXSjOTW8JdzOUbCY6kUxvmpdrnnmhsjGPyraEiV5DW60zBFSYDc+tDKevUVupdiWQjk+460AHuKcEINOxnJ7VpGRG+xCduMGm4/WpDyeP8+1NIxnnpWykS9SPgc+lRlcHNS4ycimY9ODW8ZEMjIzxSMOeaXDduKCnT0NaqQbCHnmmEc59afjJyKaQRWiZLGZIOaCOeKUAAnv70vBFaxl3EQn5eAcGj605lJOaTHqOK1UhDcHHvTsc80gGeRQB+VbJiFHGR61GeORT8ikBBPpWiZIgBxuFPzkYNN9VpRk8A+/FaKQh23jJ701+Tj0pT8y5FBXIzWiYDCobg9qawG7ilAIOAaV+OT39K1WoCtIe1PXJ5zUKrufPQelT7di4BFaLuDRKpBbBzSMoXoeO+aqDK5I685qO8vI4rfe2BjP5VvRpyqzUIFU6UpyUIatiapdxwW7SE9Otflv8At2ftMwfDXwbc2VpMBcSKwC556V9Z/F34qxaDZyRW7BnAIx+dfj58am8M/F26KeM7ZbxUY7cnBU/UV+4cBeFWO4jccSlyxXc/sT6P/gJjuK8TTzbFwtTjrZ9T8WNV8U6h4w1658T6oxM0zEr9CaVJYFG8k5z+lfbmv/sv+E71S3hm4NuT91HPA9q8H8U/s/eNtADSLAbmIc7o/m4/Cv1LMPDrN8mhySw/NFdY6n+iFPg/HZDQjRjh/cS3WqPJHaB03xtx6VGFz9c1VvtIvdMl2zRvGydiCP51nNqFxE24HcB618ZWwtSi3GpGzPJqy5W1UVmb/lsxHY1KCxyrHFZFnq4UYnXcKuxXEEzEoc+1cE4NaMytzK6ZorgD5qa7RcMox9KYGbftAp5MaZ3HOa5mmjOUB4AYEocCmJtAzThhlG2noePTFZbGbjbUHHHzmljCqCzHr2qN4yr/ACnjvmmOhbBTOazIGyNKYyVFDpuj3NwevFLFHjOSSfrTdrupVximmAzhRu9KT5Cpz19KcVYAYOfWlaHI3JmqGxQSjjaOKcBvQSH73pSqgQbQNtPQLjjrSb6kMajliQ/foKgW23FpAfYVclYNwOo6fWo44ZChEhwfT0pKTJ9CsYl8kxuAQaZ4Q1e/8F+KoL+HKhWBHoRmrNztVCyrmuZ1vgx3KDBU4NexkuYVMDiaeKpOzi7oulVlSkq0HZxd0fqNaX9vq9lDq9p9y5QOPx6/lTyCTxXlPwR1h9X8ArA5ybR9vPoea9WOR1r+68mx39pYKhjl9uKf+Z+74HE/XMNSxS+0kxppD604qetBFesjdohPTFMIqQjPBPSmsuBkU0ZNELAk0zbmpWph5GBVpmMkQ9eaiK4NTfhTWBJqrmLRDio2HepyKjbpxVXMpIrnpzXnfxP0Ua94Nv8ATsAs0TbfqBmvRtp6GqN1B9ogeE87gRz7jFeZm+CjmODr4GqrqcXH71Y4cVR9vSlSls00filPE0Ezwt1Rip/Coq7X4iaP/YPjTUdL7RTNj8TmuKr/ACdzPBSy7F18BVWtOUov5No/DakHTlKnLdOwUUUVwkBRRRQAUUUUAf/R/wA/+iiigAooooAKKKKACveP2a/Dv/CR/GXRrRl3JFL5zZHZBn+deD193fsK6Et1431DxE4/484Nin0Ln/Cve4XwX9oZrhMLbRyTfotX+R9RwXl/9p53gcHa6c036LV/kfqU3LnsM/5NWC+QT09Kgbh8Z4JzUvVgT9K/rpaaH91LRJD8cccDpxTSmCN1KODknvSsQWHetCxmcjGP/wBVCsM470rgg0iqwPAq0NdhDnIU96QYPIowCTikLbutaI1QoBPNOHFOXAIPWjr2rRGiEGetTKOKiGSKeDiriWu47NOBpi9aeavYYgOfpTx7UzOTUnfiqQ0KMZpwzTBzwKeOmKu40ONJzSA5p4PcVaY9xNvel4ozQB3qxbC9akU+tRjrjFSAVcRod04oxzSHB5pcGtEHkL3pD1ozRmrT6AxfakPqKXvRVXEwOKMetIRjrRWkWQxmM5NLgDpSgikAGcVqmZtELg5FXbDUZrGbzI2xjkYqvt7L2qIrnnpTnShWThUV0zixWEp4mDpVo3TPp34Y/Gi90SeNJ5TtGB155r9Jvhr8XbTWrVFaXLH3r8PYp5LYgqe+c+le5fDz4n3mgXMYMuAMda/DvEfwsw2fUJYjCU7TP468dfo6YDjLDVMdl1FKrqz9zra4S5jEqHOanjxjGMn1r5U+FnxottWt4opJOeByfavqXTdTt72ISxkfMB0xX8P8RcM4zIq86Nem0kz/ACG4+8Ocy4OxdTDYyi0kyRgyOMc96lZT17U5Cu/L84qU8p8/Svmot35T8wUJN2RCmSu89qqDMkm3oKxtV8UWFjN5cr4Pb61p2N9b36CaE5DV6rwVenTVaUdGerXyLGYehHGVKb5X5FgKT8uae2AMN1ojRVJ96iPJ3EYNYqVjxJDgfzFAQnnNPwNpambQVx+daRkZvzGnniomGenNT7KbgYLetaxkSyMrke1QlcEgYqcjPvSZB461updCGivtwM9aCuevJqQrzk0hwc8VqpCIsbhzUbL+dSsoIwfpTMHr0z1rZMTGEcUbcjFSED/IqLH+FaxZLFC85NRlefepFRQMmk4wQPStkxEIU54oK9TUhXHtmmYyc1qpCHHJGP5UmNp4704HPegj09q1TuSMIA5JpQB3pQo6Cgj2681omIaq4GaQjinZxR2x1rZaAR7TnAp3ApCOSM80p24JNapgRyDC570sLGRt7UuPl5PX0qFYmDFm79a2V3oV0sy0cbjnhRzXk/xI8awaHYSAv8wUjivQdfv49N08yq2MDJ5r85/jr8RmmM0HmdyoANfpXh/wtPPcdTjKN431P2vwY8PavGmbUYOneCaufPXxc8fz61eyxiTK896+ZJpWmkLvzW3reqrf3LnJ49e9YSZK5xX+hvC+RU8mwtOlSjbQ/wBtfD7hDD8LZfSwmHhayRAYyTuqdZHjPB49KceaaUH1r6g/QXBLY57W/CfhXxNGYtbskfd/GoAavn7xd+zFoOoqZPDFxsbsknHNfUJGahZcV4mZ8M5bm8Wsbh02+trP8DxcxyDA5krYqim++z/A/MvxX8F/GXhUnz7VmQfxJyCPwrzC4s7mwIWVDGw71+v29ipRhuU9Qa898TfC/wAF+LUZru2EMrdHj4/MV+VZ54P06ilVyatZ9pf5o+BzHw9SvPLKvyl/mfmVDqckbBZMEetaaXcEwDBq+iPGX7M+s2O678OSLdxjJ46j8K+aNZ8L6xocxivIXhYeuRX47nXCeYZPJxxtBrztp958Dj8rxmWtxxlFrz6fea3mNH8y9DzU0QVzu/HrXHQ6rdQHy7kZHqa6O11CGePK9TXyU6Uo3ujyfj+E0gVVvn6UqSoY2Cj6VBhtmG6mjbtUmuZoy5e4v/Lbd2p4m+0EoBjFNVSDlqUEkEr1qdiH5EPYGNcEdacwkVQCeBT2QJhh19ulIpdmDsv60XC/UaFZWEhPGOlP+6N3elYqWyRxTtm5MRmi9xMaEkkcyR4ApsUjzlhNxUmcNgnG0VA2DMdh5PPFSZsYxIPtXP65uFsvT73WusEYlXbJ94VyviBmCJD6nNdOFbc9Ahrc+wv2anZvC97GRwHX+VfQqjJJNeGfs6WL2vgqe8IwJJMZ+gr3fbtr+5OCIShkeBjP+X9T9v4cg45bh+bt+pGwNMKmrB44puK+uR7LiVuc1GRk1ORzTT1poylEgYHH0pmDU5U9OlREYqkzKUSAjFRFSTVhl9KaVxVHO4kBAxz+dR471ORmoypHWqT6mckVmGKhcbsirTDPSoWXqKJanPKPc/Mv9pvSP7O+JU14gwl2gcfUda+c6+2/2utKIfTdXA6ZjJ+vIr4kr/Mrxgyv+yeLsyoJWUpc6/7fSl+bPxXPKH1fHV6fnf79Qooor8zPJCiiigAooooA/9L/AD/6KKKACiiigAooooAK/U39hnRBZ+B9S1xxzdXIVeOyD/Gvyyr9qv2VdFOj/A/R3xh7syTsPUMcA/pX6H4ZYb22cqq18EW/yX6n6t4OYNYjP/byWlOEn99l+p9Iw4HI7+9TEgdT2pq4APHanOuea/pVdz+u1qhCOjdxUmwMT7Ugxjpk0xztGa0Rdx4PHpUYGCc/lTwN2JcH6UjYBz2qkUiIj5wDQowNw59alXjAqJdo69RWkTSLFJAOTTu2aTHJzS/yrRGqdxTwcdKcBTDz15p3YAVaKRIOvSnZpowOB3pfpVlIO+akzxTOD0pc5qkPYcDk560vBplOqtwJMEe9A64FJnFKD2FWihetKOnNNHFO960TAdntTwKjz7VKOOlXEaDA9KOtN6dKMHPNVcCQ000uecUcZqkwYmOhFOIzxSd8UpGelXFitoFIRTqT2rW5LXcTqaORzS005HStEyGrBzSH2paD1FaxIZAVI4qNfMhk8yPg+tWH61G2AOlaaNcrOarSU04yPWvAPj+80G7Rg5HI71+hfwg+OMF4kVtdzn8T7V+Sn+0o5rsPDXii60u6R43IxyMHFflnHHhzguJaM3y++fzp4teCGV8cYSpzU0ptaOx/QTo2u22oxLNGc7wKb4g1eGx097hn4UH8OK/PT4Q/HZSsVteycYAya+gvGHiqPxDoEsemzb9ynp16V/GuaeHFfJ8yVKvD3L7n+VnEfgDjOGs/p4fFwfsube2m58z/ABL+L00GrsEmICn1r0/4UfGqK4WO2ebGe5NfBPxFhvk1GX7QhYZI5zXG6D4iv9EuQ6Eha/p+n4Y5dm2TwoUUr23P7qqeAOTcScOU8JQgnLl3S62P3y0XX7fVoVkgcEEetbxGVJGDX5xfB/46NEI7Oebjocmvubw34vt9agQxuDu/qK/k7jDgfF8OYicakPd7n+anip4OZjwPjanPSap30Z3HKZxxVQM2cMOlIkZL5ZutSysiDpn2r4G9tD8JqU+R8ooJx/Ojnoe/NNtn8zOeKmdAFypxWkZGLIflFRk5GPX86UoHHSlCbV4NbxZAzCsMmm455qYAYwRUfAzzW0WTYYVHemjk4qTHPHNIwA4zitosViHaSuO9Rt9eeasEdulQkN1xW0WQR8Z9aXHPApcZ6HmlxgdK0UhtWGMO9HH8NOAyOeP0phxndxWqZA0579PajB65pQBilYA8DqeK2TEM6jPrTev3etO27W+tLtHUVtGQDOv40ufWggj5jTQCBW0ZXF6CZ9elIy9l5zTgpoIAbFapiInYEbMfhS/MxGaHUHp+FRsm5cDj+ddVNrS5aseNfF3W7i10ySKDOdp/lX5G/E/U7ya/drjJ3Emv2T8aeFTrNu+BncO/0r89/jF8LZV82WKMjqfpiv6a8Gc7wGAqxpV92f3j9FPi/J8kxMMJjGlKT+4/P5fnbe3JJq3gitDWNLn0u9eOVSBnvWcDX9t4WvGvTjVpPRn+s+XYqljKEcRh3dMTBNIQelP7ZpNtdF7HZa5Gcnoaa2e9SHpTG6c07ktEXWmEDtT6Q07mTVyEB15VsH2rB1rw54f8SQmDXLNZd38Q4auk5BqI4Jxis6+HpYmLpV4qSfR6nNWoQrR9nVjddmfJ/jb9mKC733nhKUEf883PNfKfiH4d+KfCFyy3sEibT1wcGv1bP15qpe2llqERg1KBLhGGCGGa/NM+8LMszTmrYL91N/NfcfD5rwHgsY3Vwj9nLy2+4/JEa3cRkRzKCFGK1Le/hnjIRgG9K+2fGX7O3hzXw91oDC1mPO09D9K+R/GHwo8TeD52juoW+Xo68g+/FfhvEHh5meRtyq0+aHdbf8A/NM14ax+VXlWhzR7r+tDGimePMf3vQ1ZUkgDOD6VyFvqF/YN5Ewz7HrXQW2oQ3aCNjtJ7Gvga+GnTbVj56ylqi/KSMEnmkjGMLIcikjRlbEnT161KqKTuz+dcbVtzN6bkgIZce1RAAHOeKkZ1LDaKYYgvzr071D0IbK6keZtABNWF2nA7/wAqSSFNwaMbT9MVIsJAyefpS8kRuNyoOcZ57VyOpK2p66lpGN23AGPU1o6vqn2ZDbocyvwAOa9f+A3w7bXtdXWtWX/RrbDsW6EjtmvquFMhr55j6OEoLd6+h2ZdgJ5hiIYairt/kfW/gPQz4a8GWel4Adx5jjuCa63HSnEh2ygwBwKVvQV/cuCw8MHRp4WltFJL5H7/AEMPHD0oUKe0Ul9xFzUZqck4qMjnFddy2rkbDimgYNPwabjvVJmbREwz0qB1yassMdKiYHgiqMZroV6aVNSEc/LTcVSZzuJER3xUZXvUxph9qaZk4kJHUCoWHP0qQ0xgxaq2MZHzB+1NpYu/h6bxRlraZW6dAeDX5sV+svx009r/AOGuqQgE4i3YHtzX5NV/BP0l8AsNxNRxcV/EpL702v8AI/I+L6XJjlUX2kgooor+dT5UKKKKACiiigD/0/8AP/ooooAKKKKACiiigByruYL6nFfvh8JdMGj/AAx0LTQMeTZx5+rDP9a/CHRLb7ZrNpa9fNmRPzYCv6FdDtfsej2lmowIoUT8gK/YfCSjevi8Q+0V+Lf6H714GYa+Jx2La2UV97b/AENkbhwelL8rEtTwAgIPNIcHrX7sj+k07aiH1JpCGAOKd8p+8OlJjAJz2q0aCZJXPrTGGPmAqUgkED6UxmGeBitEXHQhP+0adu70vB9sUnBORzVo1iOPA700KCMUcE4ozzkAVaZohcAkn0p3brSdDk0gFaItaD8nNKKTPy08ZzVoscAM0tMBFP6nmqQxfxpwHOKb2pw96uLGB5OaX9TS5yMEUz6dKvzES9aAAOlNznn9adxVbjHE0oP400Z+tOz27Va1Hew44ByaBg9aZwadyODV3C4/HFIDxTATnFOz2xTQXQvendsCo8dO9PSC4kOEUmrSYr+QufWjvg094HjP711T/eYD+tZV3rPhzTxuvtRt0x1G8EiiVaFNXqyS9XYznVhT1qSS9XY0SQOTTTivPb/4s/DfTmP2nUw23si5ridR/aO+Glip+zrLcH8q8vEcS5Vhb+3xcF8zxsRxDl2Hv7bExXz/AMj3kgYzSZcV8oX/AO1npEKmPSdJBx0LEk1xV9+1v4lc7bKxhjHbjJrxK/iTkGF0lir+ibPFr8dZRR/5fX9E/wDI+5QsjH5FJp62t0x+RT+VfnNqH7T/AMS7wlbWUQA9kGK5TUPjV8VNSP73Upx3+Viv8q8et4x5JRuqUZy+SX5s8iv4k5bHSnTlL7kfqDJY3QyOB68gVS2QQYaWeCM88s4HFflFceNvHl5J5l1qFwxbPJc9fzrHfUvEV1IDc3Uz/wDAz/jXj4jxswiT9hhJfNr/ACPIxHiTTnpRwj+cv+Afr5beO/DmiSh21q0iIP8Az0r2zwH+1d8NtDnS31nxHZAHgqHJr8CDb37j96Offn/GpE0m63CQ4yvPSvg8+8SaWdU505YOKfqfmPF2OpcT0Z0sRg43e3c/ph1LWfhl8R9Mk1bQNRilXGSUGc8dfWvhb4kfEf4ffDq8aPW5rgqMY2J1z/KvhP4W/HbxX4AdLaOTMAPKk4BFfSmveOfAXxo03yNUSOO5cYJ75rwso8TszyROnSinHzPzPI+IM64PqSou0qXS/Qg0n9rLwEdYt7HwtZ3M88jgKc/0r90P2ZPEOu+KfDtrrF1E8Ksu4I3UCvxT/Zk/Y+vNV+I0GrA+bYo4IOOMV/QYo0z4W+Bi67YVgi9hyB/9avjeOvErF8UKOFxNOPyR/Ov0g/E3/Wr2eRQpRlN6XSs0etQ+JNMFyLRpRv8ATPNdGFjuFDhgc8jFfzb/ABF/b01fQ/jeY7CbdaRy7SAeOtftR+z58brL4p+G4L6BslkX/Jr8kxWAdJKb6n8g8YeGWMyDD08zqR0krn1KIhGu5uagk4YKtMZiy5fp0/CpoyD1rzNtD8dlHldmIrKD1zUpAKioJLdgSVOaWM4Xa3atYyIauKRTBjJz1qcjNR8VtGRD7DQCOQetNIzmnnJ5700+vX+taxkSMIFRMDzUzAHkcd6jORwBWykSyPr37fjTalI5+aoiAGPtWqZInPahhwB3puCDQRng9fStosB2D0FNxzkfTijnr0/GkH3iOoraLFbqJtIG2gcjpS4BOPXmm4I/KtosLBkHtRtIGBSt2AppNbRZI4ggZA+lQkenFL2wfwFIcrkevWtYy6gMJwcinIVXn1o2Y5NOKZGa6IsPIpnDEhuAa8w8eeDbbV7GTAySMV6pJHI5HpVa4t0kTEnPavcynM6uArQr0pWse7kWd18kxdPG4Wo04s/Hr4w/DGbT72SeOPGD6V8nTwyWk5hkGMcc1+5XxM8AWusWEhVBnGOnevy3+Knw4fSL1/Ljwo9sV/bfhT4jwzWjDBYufvI/1r+jf47UeI8LSyjManvpW1Z88Kcmg8HmmtHLbyGKUEFfWnE8V/Q1Ooqi54s/t2nUjVipwd0NxzSnmgnNIa1TGyNgKj+tTc9aYwx0qvMzkuoz6UwjPOKkNJjmqRnIhwKaalNR4NNeRm0RMM1Vure11CI2+oxLMjcEP6VaOM0ypnGNRONRXRhOKkuWSujwPxt+z14a8RxvdaC32e4PO09M+lfIPjD4UeL/AATcMuoW7eWDlZBkgj+Vfpxgg5FRXUVnqUBtNTiE8TcFWGa/PeIvDbK86UquHj7Kp3Wz9V/kfGZvwXgswvVw/wC7n5bfNH5L2usy2y+XfA/X2roYLqJ0Emc8dBX2F49/Z80LXRJd+FXEEpGfLbofp6V8h+I/hr4w8JX2y+tZFxnDAZBr+fOIvD7Mcjm3Up80P5lqj8tzXh3GZVL9/C8f5lqhoRm+ZOnpUqMTGEI+Yetcx5+uK+GiI/AiljXxNKfLiU+nAr4p5VXlK0YP7meA6M3pFHSNKseZWOMcc9K5q+13yw0NofMfPUdBXQaV8OPG/iKdVhgmlLdsHpX0l4H/AGaI7bZd+L5RHjB8peWP19K+ryHw9zTOqiUKDUe70R6eA4dx2YvloUnbu9F954b8LvhPrPjvVFuZwUizmSRumK++dD0PTvDWmJo2krtRB8x7k+tatlp2m6ParpukQiCBRjAxz9anCAcr0r+ouEODMLwtRUaXvVHvL/LyP17IuHaOSU9Naj3f+RGke3mkOSKnbgbai7819stND3nG2iI84PFRnjmpCDSE5o2Rm1ch96bjPFS0h6VSZm0QYHSmNjvUlNOOTVpmMkQEelRlcHHrUxHrUOTnBqr2MJKxGaiI71OcfWoiKLmMkV2HpUZGTVnHrUTLk1Wxg4nE+OLL7f4Vv7Tr5kDr+lfjfOnlzvGf4SR+VfttfxCa1eNu6t/I1+LviO3+ya9eWx/gmcfqa/jv6U2CtUyrMF2nH8mfmfHNLlnQqeTX5GLRRRX8inwQUUUUAFFFFAH/1P8AP/ooooAKKKKACiilHXmgDufhnaG++IGj2gGd91H+hzX9AMS8bR0/Kvwo/Z/tftnxe0OEjIFwG/IE1+7Ue0pkmv3bwkp8uFxdbvJL7l/wT+lfAyjy4LG4jvNL7l/wSwG9aTapGDS8EgAdaV+flxX7Cj92uRgYPFOIxyOfSgRkcj6Yo471aZohygBcLxUUi7s5pSpwQOnWmHG7Hb+dWi4jV54NAAU5zmnHOcGm7eck1aNU7i7SDkD8aZxuyKeRnimqDjNaRRrHqwz6dqfjio85PWnDqd1aLQtEhPFOBqPPanj2q07lpjgc808e9MznrS85HNUih4GeKNxzSfWl9qtAP/WlwOpqPNPXCjmqTHuIBzT8c1Fuzwvapo45ZnCwAnNaRJuIMZGaCVFYPiHxR4O8KAnxNqkUTL1jQ5avDfEf7UXhPS8w+F7E3LD+OY9fTivGzDiLLcqTePxEY26Xu/uR42P4hwGWJ/XK8U+17v7kfSaQTu37tCaJo4rMF9Qnjt1H/PQgf1r899f/AGmfH2vF4YJVtIz0WP5cD8K8i1Hxd4v11y93czPu9WNfBZh4u5XhrxwcHUf3I+OxniZgKSf1SlKT89F+p+nmreP/AAFomf7Q1ONsdo+Sa831f9pD4e6axSzie42jqSBk1+e39m6xeHMrMR75q5F4UuJMfaZOp5r4rH+NOKk2sHSjH8T5XGeKGMqaYWnGH4v8f8j6o1j9rO9O6PQ7GKMHoW+Y/wBK821T9o/4k6kpSKfyVYYwo5rzCHQrSHJRdx96upptpA+5lHTtXxmM8TM5xjalimk+2n5HymK41zTFP38S7eWn5BffEHxvrDbry8mfPYE1zkkniW+O+V3PruNdXHDEOFUcUjFc7BXzWI4hx2KbdavJ37tni1cyr13+8qN+rZycOi6lMxaR/rVhfDkLjMzk+1dGzAAkjFQgp1zxXnzx1apdSkYurORl/wBi2Fu2VySfWpJbC0iO4qOKtvIhBcimSMWAIGduDWftZdWK8urGxxW4TytmM9OO1RyxoHwoGO1SsxPzAYFQFyz8jn1pqTfUobIMr5eMVWVJVIXPHvWkhBO5+Pxqvsy288jtT9oRz9CJkI5JyBSZcrkN+FOB3qWznPBqLZt+73oUjP2jiKIC8hbOa7T4YeHdZ8Q+MLTTNJDEyOM7ewzXHwKZJFtYxl3OCBX7M/sB/s2GdofFWrwZGARuHNeVmOKVKLVz8n8R+JKOSYOrUnL3rH6a/sw/DlPBHgm2k1FMSbAWPpxXyB+39+0UvhPRp/DOlzDzHBGFI4z+dfbnxw+JWj/CjwNK0bhWjjwo6dvSv5fvjh8Ute+K/jKe6uSZI/MIXHOcmvnMDSdao8RPY/lngPh6fEuZ1OJswX7tO6ueTeE/D+q/EjxsnkAySyygk8k8mv6ov2MfhHe+B/BNv9qyGKg4P0r8zf2Bv2bX1K8h8Ranb/eYMMj19K/oK0HSYtJ09LSABQoAwB6VGbYxS9xHz/jpxrRqxWTYS1o6GzNEGiHfFMjYjCMOf6VbUYG3tmmvDuXivnYyP4/qy5pNjtyFCB0qMxhjxVfzdhweKsrhlyK0TMLNEYXaPmpMgnI44p5Ud6iMW38a0jIhgV4JNKEBHHIzSgEU3BIOK2iyWMbPA/lTOpzUm2kC5HXrW0WTe5GR8tMA7mpsfjUDD0rZMLDGHX+lIenFSHnCkZphHpWkWIb06GgLkDJp5Q//AK6btPQVumIbjnpmkwce9GecZo4H9a3ixNXHYyPaoz6Uvy9DSrwMCtosQwrkFutNKlmwvSn/AC5zTMA8GtkwGHjmnD0/Sgjjaehp+xTyBWqfULCMdowfTFRtsyM0SAKQfXikCI2R+Fbxn0DzKWoWsNzF5TjIPBr5g+K/wzg1S3keOPPXmvqTcq9Rn+YqnqWnw3UJhYbgRX1fDWfVsmxEK1CdrM+34J4xxfCOPpY3B1Gknc/C74ieBJ9Iv5MKcAntXi5DROY37V+wXxc+GVrdwTTRRgg55xX5q+PPAl1ol07KhCg49K/u/wAOPEDD59ho0a07SP8AYvwM8bcFxngKWFxFS1Raas8qHSjk0iHD7D1FScjiv2WMuZcyP6jjJTSnHZjD61Gw3c1M2CajwMVdxSRFjvSGn/XtTTjpiqM2iMnBphOakbFM69KLmTIiMmmYGPepSKaRnpQZtERHNNI708HnFIRimZtEW09R+lJIqXC+VdRrMvo4B4qU9eaQihxUlyy1Rm43VjB/4R3wrKxM+mwMf90U6HQfDMJ3Q6dArDvtra24PSkKg81zrBUE+ZUo39Ec6wtJaqmvuQxWEKhLdFjUdAigVCxdz83OKmxUTHnFdSVti5KysREZ4pCvpUh460zGa0Ri0IaiIzxUxHHFRle9MiSIzyKZjJqQ88VEenpTMmNNIc048U0+lNNGbRF0OTUZz0qUjmmdOKadzKSICPSo2GanPH1NRc1RhJELc1Hj1qbFR7ccCqSMJIiI71H3zU5AHWoSO1UZSRVlGUx+lfj/APFmy/s/4javagYAnYgfXn+tfsIylgcV+Tv7QVv9n+K+qL03Mrfmor+ZPpQUFPI8DiLaxq2++Mj8+46p3w9Gp2l+aPF6KKK/h0/MgooooAKKKKAP/9X/AD/6KKKACiiigApaSigD6H/ZctzN8bNHA/hdj+hr9u4htYIcYAx+Vfix+yNF5vxs04/3UkOP+A1+1EY4Bx1Ff0B4UxtltWXeb/JH9Q+CcbZRXl3qP8kSkMMY/GlwBwO9KcA54pdvsOK/Vltc/abkff5aQqOq9aeAduXNRkFgcVaLQ77qkdfb2qI8nnmn8NyOaZy30q0aoVuADUR4qTapGTQ7Zfgdas02G4+WmoeDx+NKof1pwHy8961RqmM4Bz6U4cdOgpBgUvB6VaNEw5Bp4xn1qPgGpAB0q0UhBxUgHJNNHoaeMCrRSE461KMYpuaKtDF7U3PenCmMrOwReSTgVTFLRXJo1Vw0krBIkG52JwFUcmvk34v/ALRJsnk8NeB3Kxr8rSj7zfQ9hW9+0f8AE0eFdLHgXSH/ANIlXdcsOoz0X8q+K9I0d7hVvr8ks3IFfi3iR4gyypyyfKp2l9pr8kfj/HfGk8JN5TlsrNfE1+SK88WseJbk3t5IzsxyS5PNalt4cSJwJDnHNbhjVPljGAKlYEFWXpX84YjMq2JnKpUm22fik8TUqtzm9WVY9K06A/JFyeatCP5cxIAB2p2MqTjmnoHXk8VxOpJ7syc292M3MgO089KCWAO85NMcB8k85qQhXXIIzjmk3pcG+5Er4yrdfaqzSM2SeP6VYJ2rg81Hl2+Rh0pwkOEl1IwcH5ecU1IzId7ipC7Dgjqf0qGRnX5jW0bvY2j5A4VW2sOPSo34PyjHb8amc9xwKjwdvPUVSdtC79COQqQFxioQCgyBVhlXOBTAM5zWqZdxjLjKk89arF8NgHkVYcSBi459KjCnG7PNVFgmIFU8sSKGjAPPP0pWH8ZGf/rUpCH5h17UakS7EJ+VvaoAcgAgYHNTLCHYbjkL+FaOhaJe+ItXg0qyjLtKwXA96U6ipxcmzzsyxtPAUZ1qj2Poj9lb4L3vxO8b28jQl4kcc4r+nHwdoGi/CXwGh2rCsMQ9ugr5M/Yk/Z/tfAfhiHWL+ARyFAxJHPT1rD/bk/aEs/CXhybQtNmw7DaRnmvh8XXljq/s4PQ/iPjXNsRx3nccnwcr009T87v26P2jr3xl4hl8PaVcZiVipweK+aP2aPhHqnxG8ZQBomaEOMnGc814laW+q/EDxhn5pZLiX68E1/Rt+xN+zzZ+FNBg1K6hAkZQckV2YitHB0lBH2nFOaYTw+yOODofFY+zPgf8M7TwP4ZgtIogpVF7V9BL5YGwdRVezhS1hSKMAAADirQXLcdv0r5CtX9pK7Z/n9xFm880xU8TVd7sgfI5/SplYOvPXGKkMQbJIqssZVyB+dRF9T5i9xtzbhuVNJCpUFSKtYJ69KjYLtxjPtWydyZMYeOvrSMOMgUpBJx0pGUda1izJhg9ulRtnnNPOG5HakIPQ962ixEZGGoIqRhgio8L0AraLEM6cdaiwF6Z7CpmHYVF1z71rFiGg8UmMnOMU84H1pBjjNbJ3ExuATimgDJzS7McU3jIyK2UhDSM0EAkH8KAPU5pF49q2hIBMc544pnJ5PrSgd/TrQOvNbRZLQidck01hnqcU/DD73X0qPnPHrW0WG405zxT9uOKQZ5x3pOBnPHatosr1I0O5tpGKlMYP8qFXGKCnatIu+or9SswwcHoeaaTJnHap3ABxTjEFTPXFdMJNBc53W9Hi1G2MbLw2Rj8K+Pvi58KIriGV40zx2Hevt4biMdawdd0W11S1MUw5Pavt+FOJ6+R4mnUpzaVz9M8O+P8Zwbj6NfD1Wopn4N+OPBtxo18+EKhSc8dq85Vs8V+oPxh+EkcplkjQHOelfnn4w8L3GhXrLtIH/16/vTgHjnD8QYaEXP3j/ZjwY8W8Fxtl9GPtbzscaBu4FR7Tml3ZOKQk1+pJ31P6A0kroaR2pCAOOlSdODTWA6mmTYi+tNw2c08jP3aTp0pmTRGRz1phGODT93ApCOtVclrqQt15NNYDNSGkouZNdyKndKAuaPfFVsTYZTc08j0pKaIaIiMdqZUnfBphpmTQ2o2Hr3qWmEDGaZDRFSYp7cHFIfQ1aZk0RsMDiofrU7Duajwc0zKSIinPHaozUx9KYVoM5IiPXio2yDxU5GOKhZSDVJmUokeOMVCwIPNTYpCM1SMJK5XPtTTipSKYQadzFroVipJzTCCetTEc4FIQDVmLiVSOv41+Wv7TUH2f4q3f+3FGf0r9TmGCQa/M39q6JV+Ju8fxQJn14r+efpKUufhenU/lqx/FNHw3HMP9hg+0l+TPl+iiiv4JPyYKKKKACiiigD/1v8AP/ooooAKKKKACiiigD6s/Y4iMnxntiOqwyGv2ZiUNGCDwK/HD9i7I+MkbDqLaTH6V+yKL8oyefSv6H8LI/8ACTJ/35fkj+p/Blf8Ik3/AH5fkh53A0v3TyaGAzwaMY4Xr6V+nI/X0DKC3vUYYE4qQhun51E33jmrTNYsB8+SMEU35idvX6UqgKdx4FAzjBq0WmJjcTn8KUg496d97kVEV+Y5OMda0WupsmNK45GBQwX+KnA5/ClI4BJ571ojWIwYPy9KXGDmkDEdOlGMVojWLFGO1ScH8KjyRz2pR61aLQpGTnNPBzx60zqM0KKsaZLSg03JpapFCnjmniWHTrK61mf7lrE0mfcdP1qI4A5rk/iXd/2d8MdXmQ43RqufqayxNb6tQq4hfZi39yOTG1/q1CriP5Yt/cj81PEuq3Xi7xtc6hdPvDSsx/OugRFRRgYHauX8NR73muj1Zjz9a609dgHvX8MZ5jZ43GVa1V3bbP5AxeJliq9StUd227jgxIx60m0Hg8+1JsUcx/Snxsu1snmvF21OTRbBjBJQc09s8Z/OkRwvQc0q/MSrE+lJOzFexAY3YkjinKqjnPNSHCEITyaaF+facc+tVLVFXuMZVVQx69MVCyEMdp/CrBjAbcarkFTknIpRaHAgKsAS2AfrUeSufMNT5YPuPWmuGP3e9dMXY6ovbUqkyL8z84NLGGJBapAxPyt3pzIuAg6mqG2QlSvIPFM2NgkHFTt06VGdpXCirWoXuNjDY35HFQPGxlLL0IqcggFlpJMqu0HmqTsNSIV3bW3d+KWCMDJY5oJKj1z19qcEJAcjA60pNmNSdk5DSDjKck8ce9fpP+wZ+z5ceL/EkfiPUYSY0YMpIyOK+JfhL4B1H4h+MbbSLKMsjON2OnWv6dvgN8MtG+EPw8iuZYxFIkWST9K+czjHOK9lDc/nbxf4z+pYf+zcK7znodR8WfHOj/CP4eyxxyCLyYyAMjsK/mA/aA+K2qfEzxncXEjl4d524PvX2/8At3/tFXHiLXZfCekTnylJDEHrXwj8E/hvqXxJ8awWUUZkTeNxxxnNceBoLDU3Wnuz5XgLhyHDmXyz/M/jkr6n2h+wp+zxeeK9fh8Q31uSu4EZHav6RfB3hi38OaPFZWq7cKBXhH7NfwdtPh54St9kWyRkGeOc4r6pG7AHUD0r57MsZ7WXus/lHxc45nn+OnRoy9xXQD1POaaqsWOOO9SKB09aVAOcCvJjK5+FTlzBg44/KmEc4qTgj5ehpgB+tdEX0MmxvbBpmOcnjNT7AM4qMnuBitYszepHjHJ47004Ax3qUqOlN/StoyIIz82RSZ4p2OmDTdnPJrVCaGkcU3HP9acQOtB5PrWsWSMIxgVFgltvpxUu3B478UzqeD1rVMZEem79KawBFTcUzvitosWw0jd0pjDj0x61KQO1MJBGAK3TJIs4603nipSMNgU0KTz2raMhsTtTMnpTiMjikA464rZMQw5phORhhUgQZ9M01lHTsa1i7i2Grxnv7Uz73FSnpgU1T26VvFjE5zgGlzgc044LfWopOMkVrF3FuOcdxQWGME1Esm8dKYP/AK2K2TJt1JjyMVUck5B65qyZFj5PaoWGwmRjW0G0+ZFJNanI+IfD0GrWzq6gnHcZr8+fjp8KxGZbmGIjJPav0zZiTjOQe1cR428IWuu2MkEqbiV6+9fo/BHG1fh7FU581opn7Z4SeKmM4FzKjUVRqF9T8Edd0a50u9kjZDgGufRwRkV9P/tP6FY/C6Z9Z1S1kNnyWkjUnFfJGia54b8UQfbPDV2k4bnZkAgfSv7x4F45wPE+Fg8PVXP1XU/2c8K/E7LuO8roYrCVk521XU2jTCM8ij5lPzjaemKYWO6v0S6Z+ttp6ilMU3rT+OhppFVcloYT6VFg/WpiKZ05FBm0R4pMZ4FPI9utNOM8imQ0RMpzTSMcVNTDjOKrzM2hMVGevFPIA4puKZLQ3GDTD1yakINRnrzTM2huBjNNxmnbTikPpTRDQ09aiYdqmPtTDjFWjKSImBHFRkZ4qWmEdqLmUkRYppHFSHjpTapGbRGR61CRkVYI54qE9aaZlJETDJzUeKnIqMjnHrTuYuJEV9KZtOKnK4qPHFVcylErnj60xuT71MQetMxzVXMZRIMc1+an7WybfiJCT/FbrX6XkFmxX5t/tfqP+Fh2xH/PsK/BfpGK/CU3/wBPIfmfE8cr/hO/7eR8kUUUV/AB+OhRRRQAUUUUAf/X/wA/+iiigAooooAKKKWgD60/YuyfjRCoPW3k/lX7KIDgDrX4wfsbTGL44WK5xvilH/jtftFF8q5I5PNf0P4VyvlU12m/yR/UngxP/hFnHtOX5Ikxg/MO9MKhmIqQt6ikwScmv00/YU+ownb0qBsFsHmrO0j6VEyEAe9Ui0+gFQEOaQjBJzmnuORio2BD8mrNExx3NuOOlMIGMeoz+VKWCjac80nyjIPUVojWJE+evQmjBAHcU/bx8x60wA9R0FaRNou43BL7W4FPA42E0mFUkj6UnTDDrWqNUAAxxR3xSlt3HtTe+DWhY7pzTsc/Wm/MMinDdnNUikOzxk06k24OcdaXNVsWBODz0rjvidZyal8K9atkOTGiuAPQGuxIqRLSHWLW50ObhL2Jo+fUjj9a58ZR+s4erh19qLX3o4sfQ+s0K2HX2otfej8m/DEqsjr3zz+ZrrEBZvlrkL/TpfCXjG70a8XYUlaPntgnn9K7RUBG5frkV/Cuc4aWDxVWhVWqbP47xVKWHrTo1VZpiKFzl+Oaf8u4Y6e1Iq5O49BzzQmAM+teVcwb1B1wfkpP9YCUHNOYYb5untTvkCjaMGhsVyMRYGW7/nQ5A4PehuJN2fwp0h+Xjt6Ur30KbRAqADAqB9qcg4PtVhQoHqajKKW3LxWiNI6akO8E7SccUuzII/X2p5jDjIx9aasKqxIPUdDW62NFMhKLtzzmmfMCSD0p7GIfJL1Hc+lVHubWMEuRkZ71cU5aJGmvQslcmo8gDd07VnHWbC2/jHNU5tdt1HmDnnj8P8a2jSnLRI0jFvSxusSycmkRdzZHpXIS+IZGb9wmV/lTF1bVHOUWt44OrLaLD2M5bI7FIipHqaWCJr2aO1tgWZyBwP8ACuGd/EN1MNofA9Aea+xf2QPgP4r+JHjWC+1K2mWCFgx3KcVGLwWIo0pVHB/cfN8T42WV4Kripq1kfpx+wP8As8LptpH4s1iHDthgWHavo39tH4/WPw68IzaJZThJ2UrgNjseK9xv9b034O/DU2mmLiSOHAA65xX85/7S2q/Gb4y+NbyexsZ5bdXKpgEivmst4ex+bVnWVFtLyP5a4c4XzDj/ADuedYmk3Sg9NHqeEXV9qXjvxU8xYyTXUpx3PJr99/2DP2Z49B0yHxFq0H7xxuyR61+ff7En7I/inVfFMWveNLKSFYiCFcY5Ff0v+AvDFp4a0SCwtkCBFAxiuHiNVMtvh6qs+x8/45cavIqMsgw/utaWOss7SO0tlgjGNoxVryto+Y1My7evSmnaRgV8Bz8z1P4XxdaVeo6s3uRADJwaUlQuSacVAO7+VCoNu4jNVFnDLuQqMEnj8Kce/rT2CnANGMnB/StovoZPyIxxwe9RjAGKkTuPWmld3St4sVxm1etNI55P6VLjjFRsATtxWqZLIyO570MpwcdKkHoCKTjBANaxZJGeBkjrTCmeKl2ntSEqeM81rFiIcfpTGIJJ6VMRg1Eff8q2ixEZCjimBeeOc1N3pvHGeRWyYMiIGOee9M285FS7iFx1zTccdM81umDI9vAppUZx1qQH+9mo+p9K1ixWGqBmmEAnPpTwBnBpSoI+tbpkkRA69c0uOw70rAD8aQjbyQDWsWG4zknbSKuO3FSkcjFN49MZrZMNxCgA5700lWXDU7aclaYykHGa2jILdSErg4PNKOGBFG3+90pRwcetbKQMzdUEnk+bFyRWPpetLczfYrj5XHGDXUOqldjYxXmXjLRLsRnVNKOJoew7gV1Qloehg1Cu1RnoelMFUgDkmpJBvXb1OK8y8E+M4NdX7NMwWePh1PUV6I0gSTepyDVx91pozxOFqYSpyyWx4n8X/hhpPxD8M3Oj6nAHWVSvI9q/ly/ah+BPjz9mTx++reHGmj013LAoThTn1Ff1+F1lQo4/ya+PP2nv2fdF+LfhG5sbuEM7KSCR0r67hvP6+UV41sPNp+p+6eC/itiuC8wp0K02qUnrqfzd+BP2npJoks/GEXnjgeavDfjX0/oHiXw/4qtReeH7hZARkpkBh9Rmvzt+Nnwg1z4H+OLjRNQR/s+8+W+Djr0ri9H8S61oFwt3YTMm05BB61/VnCfi/iaUI080XtI/ivmf6xcHeJ8sbhaOIclVptfNfP8AzP1kKshw4waf8or5K8CftImRY7DxYm5QAvmjgj619PaPrujeJbcXWhXCzg8kD7w+or9/yXibL8+gqmX1bvs9/uP2fK89weax5sLU17PRmr05FBx2pHjIOG4pTivoE+h7BE3Wmt7VLnvUWMGquZtCEU3HpUhAAqPPODVGbQY9Kic5NSkHrSY5zTJavoQmmE1IRg8008Gi5lJEZ44603vzUmM8VGcUzNrqMI7UmOMU89KbjnmqRDQzqBUZHGKmIGOlRHpiqM5IjK96YQKlx3pCOcigyaIsE0wg5yKkKkUznpVJmckQ4pu3nNP6fWkNUjForkYpCO1St0yKjKjrTMmiLGBUZGDU7Dmmlcmm2ZOJWYfOSK/NX9r2Tf8AEOBeu23UV+lxBBNfmL+1nKX+JKg/wwjivwT6Rk7cJSi+tSH5nw3Hfu5el3kj5Zooor+BD8bCiiigAooooA//0P8AP/ooooAKKKKACiiigD6T/ZKn8j466Pn+Muv/AI7X7cQYChevOa/CX9m+8+x/GrQJCcbrkKT9Qa/d0LgHHHt9K/ffCapfL8RDtP8ARH9L+ClVPLMTT7T/ADSJWTkkcUh54p4Jzt6U1lJO7Ffq6P2xCDoD7VHyQQakY4X5BkGo3DcE1SXUtMaducUgXjvinEEj5V6ULyuFrRI0iM2hOV603bkbMe/FO+XbtGKiJ5q0aIeducnpUB4yeoqTHPsaYBxt6VaN4iY9DnFNHoe9IOOnWnKB+dapmyEIXb7CgAhwKFweDzz0pTgHjtVl37Eh5oBBYc01fbrinqBnirRaHY75pDgUdWoJ5wKooUAng0iu0JEq5BU5FOznmhgD1+lV5oUldHyN+1N8NGubmP4g6HGfKmAE4Tna/qa+adA1Y3MItbk/NjA9eK/Uxksby0l0jVo/NtbkbXGM4HqPcV8OfGT4C6p4RuzrvhnNxYMSyMgyQPQ4r8G8TOAp4qUs7yuF76yS3T7+h+HeIHBdSdWWc5XG6eskuj7+jPNFQgev9Klwv8J59DXC2viiaCRobxMMOoIIrUTxDpsieYX2k9jX87VcNUpScZx1PxqVOUdGjqpI8gHOKbuYNntjvXPSeKLGIYZlOO4NZ154ttWQC25as4UKk3aMQjCT0SOuZVbjGf8APNRStHE+CwHrXCS65qs7eVaIwJ9Bmr1voXjfXZwtnbSv9FOTmvWw2R4rEtKnSb9Ed1HAVqzUacG/Q6Z76ztUzK4GPesyfxDpaA7WzXcaN+zn8UNdKyS2zQq2Bl+P5167pP7Izph/EOpRR46qnJ/Svssu8Nc5x1nDCtJ99PzPqMDwRmuOs6eHaXd6fmfJs/ieRgfKUt7VGuq6xekLbwnp2zX6F6P+z18NtH2m4Ml249flB/rXpmn+DvBGkgLp2lw8DGXG4193gPBbFTSeMrRj5bs+uwfhZippPF1Yx/Fn5c2XhDxzrjf6JbzOG6YU16JpH7PHxL1hd7WjIDwS/Ffo9E4t12W8UcQ/2FA/lUsk0zLlnJr7HBeD+WUUniq0pPysj6bC+GWBpa4mtKXokv8AM+JNM/ZH1uRlbV72CAHqC2T+Vek6Z+yt4KsiH1W/ec56Rr/Wvo7bnqKYFIr6rB+HmRYOzjheb1dz36HBOUYbVYfmfm2zya0+A3wmsfvW0s5H95sV19l8PPhpp/yWukRtjoW5NdbwT61rafYS3cwK8/WvehlGV4CDnSwsFb+6jullmXYCnKrGhFJf3UXPC3gbw/e3iRWmk26jOAQgzX6MfC7whaeD9AGqSRpCSvRVC4H4Yrxf4L+AZb2RLmVMqMHmvY/in4oh0bShpNqQCo6elfhvGGaRzvHRyjCRSinrZI/kPxVz3/XDNaXCuVpcl/et/wAA8Q+MvxDfUbiS3tj8i8YGSDivFvCOk3Ws3SRRKCrnjjJ5qXUJTqt8WB3bjyOvNfYHwA+Gkuo3EV7LHlBg8ivdzDHYfgfJpzVoya/E+gzzNcB4T8LzqJKMnH53sfQ/wL8AjRtNilmHzkfzr6ttQkSYUdKy9C0mLTrZVjGABitB50ztU1/DnE2dzz7HVcVLqz/GzxH4urca5xiMdPZtlrduIRuPp1qGQdh3qSMh13GnGMHPPJr5m/Lofl9dezfKxuAo3CkAHShsjjHFIny4AqlI527ihT/FSEYOf89KmICjNM6jI/pW0ZGbIByfUU0Dvmn4BHPFLyoBraMiWhjelNwDnGBTyF7Cm8YwRW0WIYQBknkUhHrTzgd6bxk1tGQhjgYwKhA9R1qx3qLAHFap9QG+9QnkYxVghvxNR7MggHitYsViHHcUzGc5qbjBqJlz0OO1bxkMDkDFMIHSngAHFNA+b2rdSFYYRnmk2gHH6UpbAyOPpSDn61smDQzPOO9NyDx0qTaOoNRAZJBNbRZIgGM/zpMHIxS49OKaWFaxYWuNI4pcYHoaBgc0jdfetou5IZJ/xprYyKds3c0zAxyelaJjGHk5HWl2k/KOtBKjB6CgsrHitYyuS0I6YJ9KqyRLIpRvumrufWq7Fg3XOPSumLtqVCTg1KJ8s/E/w9rHhS/Hjfw0GDQ8zIv8S554r0b4Z/EnSvHGjpdWkg83G10JwwI68V6lqNhb39s1tcKGVxt5HXIxX5v/ABW07xD+zl4zHjjw0jyaTcP/AKTEOi89QO1dUXuz9AyelR4ko/2dVdqy+F9/L/I/SVFLD3/zzTbi2FzGYn5Vhj8K84+GXxL0T4i6DBrGjzK6yKCcHkV6UqlgWQ5J9PWrTcXdHyGLwVbLK7pVouMos/ML9tn9k3Sfij4cutRtLdTcqjMhA5r+Y3xX4S134c+KJ/DWuRmMIxCFhwRX9y+rafFq1o9rcLu3givxB/4KC/sa/wDCR6dL4y8M24M8Y3naOeM19fkWcyoSVOb0P6w8C/Fp5fVp5LmVS0dlc/BVol35Q5HXIroPD/i/xD4TvBcabcPGw9Disj7PdaZcyaTqCFJoTtYMOeKJIULetfp+XZxWw0o18NUcWtrH+gGAxscRThi8JOz3TR9q+A/2jdN1cpp3i5fLl4USr0P1r6TtJ7PU7Zb3TpFmibB3Kc1+R0tnJCCyNjHXsa7/AMGfFTxX4FmH2GZjDnBRskfrX7fwr4tzpcuFz1c0f5luvXufoOS8d1MLbD5sueP83Vevc/Tbk89KcVyOa8q+HnxZ0Dx9GISy295gfJ0DH2r1R1dW2OMGv3rLcyw+aUY4rA1FKL7H6hhMbQx9JYnCT5osOtR8DmpAOM4ph64FekdLQmMmkp5APHamU0S1YZt7imMuDUuaiGCOKLmckMK+tNI/WpCKSmZtEJBpuKlIyeOKZxVIzaGH0qPHHNS0zpzVXM5IjORTcVJ1NG0U07kOJERjmoyCamPvTCD07UzOSITyeajK1NimMOM1aMZIgIphGelT7e/YVEUouYyiQ4pMUuDnFLzmmZWK796/K79qW7Nz8VblM5EaKK/VOU4bNfkd+0Xd/a/izqjKeFcLj6V/OX0la/Jw5h6P81Vfgmz8+8QpcuCpw7y/RnhtFFFfwwfj4UUUUAFFFFAH/9H/AD/6KKKACiiigAooooA9D+Et7/Z/xL0O7zjbeR/qcV/QeAGLKRnn+dfzleGrr7F4gsbzOPKuI2/Jga/oyt7pZ4UnAyJI1bPbmv23wjrfu8Zh/OL+9P8AyP6D8Eq9qWOw/nF/en/kTkZJOMgDtSFQOlTHCDHt1FBIJ+b61+zI/fFIhHI2k9KgJDYFWiMHgZpvlgks3NWjWLuQ5K57emKaMYIp5UjikbJatF2NokYT5cCmOFHTrUrDHGKYdvQ/nVGkSIL8xGM1GByc9amyCxPrUfllfvdOlaI1j5kQwOn6U8BSMYzTFGOQOtS9OK0RtFkajue1AxnmnZwdvb2FIRhMHnFaLQ1Q7gH5TSjGPmNJ3zRnHSrXmUh4B+ooyOhpA9GM5JqtyvQeMdO9KOtN+6M0Bh3p+oxAMnJ4qdJmjUwMokjbqjDIqEc078avpYVux5d4o+CHw48YM115J0+dsktGMqa8jv8A9kOxlb/iW6tGVHTfkE19WBWUfePNM2L0r5vHcH5NmEnVxWEjzPqtPyPncbwplePk6uIwy5u60/I+UrH9kK1VsalqsQHP3Rmu50j9mf4Y6dhr+WW6cdlG0V7sETjgU4tg9MVnheCMjwlpU8HFvzu/zMsPwdk+GfNHCxfrd/mcxpPw++HmgLjT9JRmHRpDuP5V10U0dovl2VvFCP8AZQZqHIpwIzk19Jh8JQwq5cLTUV5JI+hoYWjhly4amorySQ9ppXHzNx6Dim854poyTin445rq3OjcQUoGOtLyaKpaAAwOlKPek70AYqkLYWmHAPNKm3FKgUsFHrTbsrkSelyxbwrI4OM16t4D8My6tfRQxru3HmuM0TSnvLtI1U8kCvtz4QeELbS7T+1LwbQo71+dca8RLLqEqNKV5M/GfE7jSGQ4KpSpSvOWiR6xplvbeBvDCtHgOU7/AEr5A8d+JpNZ1J/m3ZJx7V6Z8VvGrXLvZwSDYoxweK8W8M6PPreoIqqSS2eK/PeFsqhg6dXiDMnq9dT8P4C4ehltGvxjnb96XvandfC/wJL4h1KNjEWGepFfqj8NPB8Gg6XGuzBABzXlfwM+GyabZxXk8fOAemK+oSsNrGWQYAr+efFTjupnWKll+Gl7q0P4N+kr4yVeKcxnkOXT9yLtoNupxEuO49Kx4A8su9frULlr2cbeRkmtu3tzFt44/Wvx5NUo2lufydOMcHTvLdk8UIRdh5+lShV9Oabj+E9qEkGPeuTmvufMV5OpJtkUyfNjp3NQx5Od34VoDDLk1GVVfvCmnfVmBGR2xTSuakX7uaDzzW0X0JZEUJ5PJ60wgrgY61LgUEDHStlIllc89KQKqtx3qbb3FMK7RmtoyERgAHim7cct3qQgZINM+8DWqYhhCimheQDUhJz9aT5etbKQELryTmo2GMtU5HrUbe3c1qpAVXDHp3pd+7kd/Sn71HHShlyN3r+NbQlYd7FORcnPUUpORsqZ1AAJ61BKyA5NdkU5aI2jTdT4UMdHIwh4qIQSKd7nn3q8ko8vHb/Gmv8AMa0Wm5lNOD5ZIgRD1XqKNoBJNP8AMPANR7wxOfxqoyJsIQKYcEY7+9PABGelMbjkDpW0ZBYbgA9KQjj5ec0uVbNOXhfpW6kBEDxnrQfT86eFJ9qbjqDWiZJAWyeePanE4HH5UpXJx6daQrkY7etaxYhquDzmoUD5ANSBz94011OQy9a6IsXkI4A+Ru9cZ468Iab4u0KbSdRiEkcqFTkZ4rthw3y80hHmDYeldEJ9TswWLngqsa9F2aPxhGp+LP2SPiWLW43y+HryXK9dseT/AEr9U/APjrR/GWiw6ppkqypIoIwc1yHx1+D+j/E3wpcaZexhnKEK3cHHr2r8vPg78UfFX7NnxGPww8eM66fJLi3lfptzxzXbH31ofs7w1Dj7Lni8OrYqmveX8y7+vc/bORFPzAc+nrXMeJ/DNp4g0ySwuk8xWBGD7ipvDPiKz8R6bHfWTh0lAZSvIxiuhGQRgHH+FJScHdH5D+/ynE9Yyiz+Z39vb9kG68Ha1N4/8K25ELMS6gfnX5bSOl1D+5GHXhgeoNf2sfFP4c6T4+8OXGlX8SuJEZcEdyK/lf8A2vP2add+CPjifV7CBmsJGJO0cAZNfb5NmysoTZ/eHgX4srM6EMnzCp78dFc+REiO4K/61Fd2pMg2/wD1qvRsLkLOrdRkD0p2Cu55DmvsYYjVSif1nRxCqpVIsyNL1K88Pagt3ZuUKHIKnGDX6JfCL4mR+ONJXT79gb2Edf7y/wD1q/PuW1hnRhj5j0rZ+H/iS58LeIoruJ8bG6Z6iv0/w94wq5HjIUajvSm7NfqfU8N53UyfERaf7t6NH6l4PanYFZ2l6hHqul2+qw42zoG49T1rQOc5r+u6VWNaCqwej1P3qnNVIxqQ2Y0jA5pmO5qQjNNbrWo2rjO9RHGalI7GkK80zNq5EeKbUuOc1GaCGhpHPpSH9KdSHNVchohI5phHpU7DHBqLGadzOURhGTTMHNTU3aKZm4kRHPNNPSnkHPWmYx0qkZyQz60wgGpu+aYwPXtVryMmiBhnrUfpVjAqI980GUkQkY5HWk6nBqYimMOKbZk42M+44PUcc1+NfxhuhefErV5s5H2hhn6V+y178kUkjdlJ/IGvxE8aXYvvFuo3QOQ9xIf1r+VvpP4lLAZZhOrnJ/dG36n5f4jz5aeGpd23+H/BOYooor+Nj8pCiiigAooooA//0v8AP/ooooAKKKKACiiigCSFzFKsq9VIP5Gv6J/BWpLqng3StQQgia0ifj3AzX86o61+7v7M2rjW/gvod8rFvLh8jn1jJB/Kv1bwnxHJjsRh/wCaKf3P/gn7P4L4n2ePxWGb+KKf3P8A4J744yP8+tLs285pxGV5PX0qULjksK/fUf0qmQtjk1EQBkn8qsEEdTTAOOD0q0aRkQOSDhelN2jIweTTzknH5Uxhg7icjNWbJiZ7gcVAAMkjv2FWOhqIDHB6DitF5GsWNUEkHrimDoKkJyu09qj24HOPeqRrF3GBf0pDzkgdalXIXGMCmqvzHcKtGyI8MeCaUgcjHQU4nOAKM9AevStEaIYd33ielIBk8U/BBI6jFMOd2PSrRomIQRjNLk560oHOc5o2lzn+VUmUL1GRSjPbrSjjOTSL1w1MocPfmgHFBHGegphzuBBp36hckDY4oxmmqckAGjoQau/ULjhmlzTe9OxzVoaHHGfSnd6ap7ChjzxTWgx6jmjnOKQMKQ8cDvVgP6cU0sc4p1NxgZpgLjNJuBIAozk4pq9jjimS2SbSBuH6VYs7d55wi9DUaHAyRivSfBvh19SvERBu5rz8zx8cDRlVk+h4mdZrTyzDTxFWVrI9Z+EHguTU72NnQsOp46V9LeO9ftvCmjDS7JgDt5FJ4U0u08FeFzqEw2yMvHr+VfMfjbxFPq1+7Fycn1r+f3GpxTmcq83+7gz+PJKt4gZ/PF1X+4pP7zlbm4uNY1FupLn+tfZHwG+F0l7JDfXK/KMdRXinwh8AXniHU4pJoyyZGMDNfqj8PvCcGgabGI0CnAB4xXy/itxtDKMK8py+WqR+T/SS8X6PDOXPhvKqlpWtodPoGnpptkseAOOap6jfecfKiOfpV7U7pbePb0PtWNpFm91KZ3Ga/k+VSVaUsXiNWz/NBzli5VM4xuspam5pVoUgBbkn1rXKj73pT1jAUL6VJt3DArzatZ1JXZ8djsY8RUckyt5eSMD8KR4tw2r16VYB2jDULjGWP5VFzz27kCgxnBNITgYPPrT2UZDY4p4G0fWri7GbfUjbA6dqgDD0qxj8MUjDvWsZEt9yFgM+nvTCB0FSY5yRijCk56cVtFkkWB1pmD0AqY8cLTCCDg9K2jITZERg0EAmnkKQaU5xitUwZDjDY6VGTU64PTioyMjjvW0GBXVtxx0pqqB9Kk8sliR+tRlcADr7Vun3AZtB5PWoSdp2r1NTlMrtzUcjRxoWftzzXRSu3ZGkYOTstyFxu6Hk1zWqzyQkso6eldELy3LYJ5IqpfRJdLg9xXr4V+ymlVW57WXP6nVj9ZhozD0zWRMdrt+FdKjKwBXvXl+oWF1YTefD0HWuh0TXop1ETnBr1cVgFUh7fDn0mbcPU8TRWY5fquqOsZTndnFMSEED3qYEEbgcg9qUH+XFeI7xdmj4GcHB8rIioA+tRsvPrVkjeCR3NRkAqQK0UjMiAGOO9IME4FSsuF6/n1pijGQecVqmPcauB3qMjPINSgA4UUoBHP4VoncnzISo796YelWmwwHvUWc9q6IsRWK9Ce/pSbSPlqcgY4pMA9a3jIViFgScUpHAI4p5AGaZnPFaxkTYgaPzUKNyD2+lfC37WX7Oen/E7w5Lf6dF5eoW6l4nUchhzX3cQEFULmyjvLdoZBkMMV1UanKfScN57WyPFwxeGlazPxp/ZL/aR1XwTr8nwl+IrPHc27eWjSnG4A44Jr9jNM1SPU7WO7t2DI6g5XnqK/KH9tX9l+4uR/wsTwHGYdQtD5hMfBbB9qv/ALFH7VzeIoB4F8ZS+VqNqdm1zgnHGcGuyUVJaH6/xTw7heLMB/rTkUfe+3FdH/kfqzL86kHpXy7+0f8AArQ/iv4SuNPvIQ0rodrEdOOK+n7S5h1CBZYDnIzxS3MCywtE/A6YNKhVlh5XR+QZPmmJ4dxkMTQbjKLP4tvjh8IdZ+CnjW40e/icWzyEIccDPavNSqiLfnOa/p2/bR/Za0v4peGZ7yygU3KKWBA5yBntX8zfizwrqvgXxRceFtXRomicqCR2FffZTmPt4qLep/pD4S+I9HinBUqdWfvpamGg54rH1COSG9ilI5bpXRyQAfMvI5rndTBku4YCeRmvssvk5VIpH7vCpzWsfo18FL9tR+H0RkOWhYrn2616wM968e+BVnJZ+AlkkGBLJkZ9q9jr+5+GpSllmFdTflR/RuQOUsvw7qb8qGbe9NOenWpCPyprV7x6zViM8U0jmpcdjTDxTTJaI/rTOc+lSEU0rTMmhu3I96ZU2DmmsB3p3E4kWKixg4qY0z9KDJoiNKR6U4pzimkYqkyGrDDimMD3qXpTCD2NNGbREw9KQ5p2CaQiquZtEB5pKkA6CkI7mncycSLbTGAqyV9OaiI/OmQ4nKeMb0ad4bv709I7dzn04Nfh5dzGe6knPJdi35mv2T+OGoNpfwx1a4GATCVHuW4r8ZCcnNfxd9JvHe1zHLcAn8MJP72l+h+M+I9bmxVCh2i397/4AlFFFfzAfnAUUUUAFFFFAH//0/8AP/ooooAKKKKACiiigBVJB4r9jv2HNXW/+DT2BOXs7uRcegbBFfjj3r9Nf+CfGuBovEHhxz90x3CD6ZB/kK+58O8T9XzqlF/aTX4X/Q/RPC7GfVM/ow6TUo/hf9D9KGYOB3/pUoGRuPApCCDgcVK3AzX9Mo/rSL6ldgQCTSYwxVf0qwvpmmsd/PUVSLUiuwJJbqaTbnkmpcDtUeQOnXvVp3NUxjLnIHWoGbnAq2VyAB9ahDYJIJqkzVO6IicDrUKgeuasEZOeuKr7flrSJvCQ0jnIx7YpvJ4NSMCrcUhyTuq15G8WRjIPUUYyc56UZ+c5GKcM7q0TNYsCSfeog3OCKkHp0oCkOcGrTLTAKoHXvmowMjHXmnkDr3pOj4qkXzAflOc5pBycU4dMHtSgY74NWXvsIVApCF/KlJIbHem7aYDs/lS4B4oQZ6UoIPFUt9Sw56UZwdtAPeggdSKpCHDrTaUDNC46GrAO9OIB6U0HHOaU4GaafQPUdgU3DYoB5p4HHWrS6oNxh5P1p6DDAHrTSM8HrVy0tpJZBjrSnJQTlIxqzUIuTNDSrI3Eqqozn0r7C+Dngwqo1K6X5V55rxn4deFZ9bv4lSMMMgfhX1V4n1i38I6ENPgID7QCPwr8g41zieLqLK8K9Wfzf4pcTVMdOPDmWSvOe9uiOU+J3i8zA6fbNgDjAOOn0rxzwpoN54l1eO3jXeGNVAbzxHqqooLeYfr1r74/Z/8AhQLaNdQuouTyOK+OzzNsPwRlUlOXvtfifmPF/E+C8JeH6k6017Vr8T2H4OfDmPQ9Pjd49pwD+NfQE0sdrFt6AdqLS0hsbURg42jBFcfrN+ZpfskRyW4xX8bZpmdbiHF1MTWelz/JniHPsXx9nFfMsZO8bkbGXVLvyjyvXIrtrC1FvEI8dqydC0lliEjferrApHXkivEx2KUW6NM+N4gzFRbweGeiIFGDk96UkipguBz9Kbjuf0rzIyufH76kQxnDfnUeMZqTZmlC7Rnua2jIVyJR60hQ4x0qZenP6UmcHPrWqkSRBMimEYBFWMAj1phHp9frWsWIrBfWggY44qQ7m4b+VMYdAea1i+wyLB65/CkI44p+4/5//VQeOcVtFiasRMuKaOBipcBju9f/ANVNON3JrTmYEXA4puAB0p7rk8VEeuTW0JWKQ3vmkOwnJ60oznIppxjNdEX0DrYqSHnk1yfibWINNs2mnbjFdQ8m99w4zwM18vfHjV9Us7CVYdwBBGRX1/CuVLMsbSoVdmz9L8NeFf8AWTN8Pg6+kW9Tm5Pjjaw+IvsckmF3Y69K+j/Dnimz1m0QxSZDCvxM8ReIb2PWXnZiMHv7V9M/Bv4xz6fNFbXE3yDjn9fSv6R4p8IYwy6GNy6N3Y/vDxK+i3S/1fpZjkcFzxjd29D9N7iGK5RlYZBHGP6155f2c+k3Ali5Udq6Pwz4otNbs45Y3Bzg8VvXllDexlW+bcK/nuDq5XWeFxasfwTT+t8KYx5XmaaV7NMxNC16O7RVY8106ybmAHIPpXk+qWl5oV150GVTvz611mieII79FDde9Vjcu9pH61hldM0z/hqOIpf2tlivB9Ox2Kn5vm/yaaqovTimEhuAeOvFNRMceteBbl0Z+dTpODcZLUmwrdKiXIzUh4+U8+tNZ9wx0q0zNIiOSeBzinYOMZ5pyndx2ppc7vrWsZdiWhP4c+nek2gdT2pdyt16UMAvatYyFYYwB56+tN6jp/k04KAaTaB3x0rdTFboRsuBx1pCMrszTtp3ZppXv1rWMgt0ICMtz/KkBIyFqXHyfKetRFNv3eOP8mt4ysHoc/r2h2us2L2V4A8cgIII61+E37XHwC8R/Bfxovxa+HCNCqMHkWPgep7V++yoMHP5V518Tvh/pXjnQJ9M1CJXWRCPmHqK7qFW/uyP0jw/4vqcP4yMKzvSlpJdGmfHP7HX7UumfFDw9HY6jMEvoQEdCec/Sv0EhnF1DuXv0r+ar4meEfGf7H3xdXxToIf+y5ZcuBnAGa/bj9m/47aF8WvCNvqljOrysoDLnkfWumcL+8fY+IvBdL2ceI8kV6NTXTp5M+lNSsINRtmhmGcjH51+If8AwUB/Y7bWrSfxp4Uh23Ee5ztXk1+5qDzR5g/KuX8S6BbeI9Klsb6MSIykYPetMHi5YeommfDcCcYYnhLH08RSlZJ6o/h3c3VlLNpepoYbmBipVuOlN0Gwn1/X1EI3F2AAAr9JP+Ch/wCyde+CNVm8d+F7f92clwo/HpXzl+zB8Ob29Y+MdchKQw8puGNzn/Cv6C8N8tfEuLpUKSv38l1P9U/CvOaXHVPDSwsr3tfy7n1l4a0pdD8P2mkAYESDI9+9b1OHzMc8A9KftzX9x4ajHD04UYbJW+4/smjSVKnGlDZK33EODS0uMUhB610FjD600rnk0/pzQadyWrkWKaae2M0nvRchoZ0OTTMc+lSYpBT5iGiL+tMqUjuaa3B4p3M3Ei2j6GkII59akHvTSM0yGiMjJpuOKmI5xTCDVJkOJERjpUR561OR3qMjdTuZtDAOeaaRmpAMGmdTVXM2iLGOtNbj5jU20VAy8elGxm1Y+YP2stWOm/C+S2jODcyrH9RnmvynPWv0D/bT1gra6XoitjezSMufTivz7r/P3x9zJY/iyrRi9KUIx+drv8z+feOcR7fNakf5Ul+F/wBQooor8UPjwooooAKKKKAP/9T/AD/6KKKACiiigAooooAK+x/2IPEP9k/GT+zGYKNStXgAPdgQw/HivjivUvgp4kbwl8VtB11TtEN5HuP+yxwf5162RYv6jmOFxf8ALJfdfX8D2uHMZ/Z+aYPGPaM439L6/gf0HRbn+9yF7f4VbwO3TrSRvGTvxkH7v0PSpSOmO1f13zKSTif2vCamuaPUjYBW5/SkIGSe1OO7jdTnTK46iq2NEQkDcd3HFQyfLVg55zUTgMMjrVxN4sgYYPHGKYOhA/MVOy8k5xUGW+tWrmsZXIGJA2AflURA6dKusCOGFQ8n5QKtG0X2IgMHGaad4YqORTsMjAZ+tOZew6VZsmQe+PakQZPzdcfpUpAYBj171CUwfmPNUmbJisvb86Y33gV6c1KevP0poj24JPX1rROxqpDEO846c0gqbGOR2pGVgRIDT5iuawkijBJNMQcf0qwASOT+FV5Fb+H9atMtSuGAvNIPU07ccbRSAncB1q00WpAOTkGnDDfjQB0HWl+XkirTHzERyeMc1JnBzSFQrZFKvWmmCfUQDjBozRntQAOtPcYuRnFKOvFIPSlIAOM1aC/cMYGaUcD3pRgHk1HuT+I9PenexLkluTpjPzdq67w7pz6hexxpzurmbSB3mXjv+dfUPwm8ItcuLx4SV6j+tfOcSZosBhpSW58PxtxBDJcDUqydnbQ9b8CadbeE9FN9ccPtyM/yrxjxn4kk13UmhjJwT0H8q7P4gaxdmI2EJEaJwdxAHt6ZrJ+FPw8vfF2uo0JWVY2ydpBH6Gvymn7LKaVXiHNpb7XP59w0aGR0MRxrxFUSum1fT03PZPgJ8K59Yu4rq5j+XIPI7V+mvhrw/baHpqQRLtOAMelcp8NfA8Ph3SYkEYVsDtXoVy6wQtKxHHFfx34ica1uJ8fOlCXuXP8AK/x68W8V4gZ1VwWGn+6TsjC1zUUsoGbd8x4Fc9oNgdQuPtEo4zWVdiXXNU8mPlQefSvTdJsYrK2EaduK+SrVI4ChyxerPyzE1aeRYH2UJe+9y7BEIVwB09KtBiTk0u3NLs4xnivnJ1HOXMz81r1nVm6kiLep+90NV3uCz7Mdas7SR9aYY8c8VUWZXGA7uCeaNuQM0pUfiacQMccVtFg3fQYV/Omn+dS9PbvTCB3NaxdybkeSKQjuKkYHrTAM9OK2UiiEnJ9qawHOOanfk5/Co8EkYFbRZJAygHikC+tSgbuPWjgjHetoyKaK+SePWnbRinhQi5/nUYOeK0UhMjfAHzVERu6d6mbGCacAoPtWkWHTQhKqo9fWs68u4IYyGP51qXBjRG3cgGvIPHni2HQ7CS43bdgP4V7eT5fUzPEQw1KN2z6PhjIMRxDjqWXYSN5SZyPxG+KFt4Yk2I+Oen4VxUXjDRPiJpD2czLvPGM5Nfnl8W/ihc+IdXkjikYgHr+NZHgD4m3GjXq7pD1HB7iv65ynwengsup5hT0qrU/1A4b+i3LK8goZrhdMTFc2nc7X4w/DSfR7t5Y4/lyTkDpXz/YXk+m3QZTt2+vFfojbatpnxH0UQkgyFehr47+Jnw/vNDu3CqcAkiv1LgriSVeDyHOlaa01P3rwu40q4qi+EeKY8taHu69eh9G/BP4vXGnyx2N3JlDgda/Q/wAPa/a6vZJcRODuHIz61+B9jqs+mXKzRtgrzX6AfAv4vhXis72bjjrX5t4reGalGWbZdHXdn8+/SW+j5Tx1CfEuSU/f3aSP0B1DT4tQjKScjHevGdVtL/w9emeLOzPavYNK1JNTgWaI7kx2680alpsOqQmOQc4r+bsBjJ4Co8Lilof56ZFm1fh3FzyvNI3hezTOZ8NeJYdTgUl+f1ruo/TNfPGo2moeGLw3FuCY93IA7Zr1Dw74nt9UiX5stjmuvNssjUj9dwiun2PS4x4RjUgs5ydXhLXTodwzAPhTmmvyfpSriQEoc+lMSJwck18s/ddmfkc4OD5ZKw9VwmTTUjLpzU0bNu+ehkwN1WpGbTK33RtFOPOc1KAchulIfmB7E1akTuM2kDIFNKrgjvUo6bSc0wjJzW0WIZheajwfXn0qUjPSjk8461tGQrFR9yDI5xSKrFQvQmrMgBHtUZ2mt1LsJ9isyFcMOPrSP88RVu9PkJcYJGaUOFXOMk10wl2Ki+Vpo+WP2kPghpPxT8G3Wm3UIaQxnacDOcV+Cfw4+IHjX9j34wt4e1tpE0x5sfMTgAnFf1FTwi6QxyKCOePwr8s/27v2WbP4heGp9c0qHF5EpcEDnIB9K9LDVOd8h/QPhdxnRnF8NZ270ammvR9z7o+EvxW0T4jeG4NY0mYOJUyACO9exuGkAHf2r+aj9h74p/GX4eePG+HWo2kz2Ns+HnkyI1UHrk9a/of8KeJ7XX7NSjbjgdK9bFZBi8PSjjJ0movZ2PK8SvDDGcMVf7Sow/cS1jLo0cN8Y/hbofxF0eWy1i3WaNgQyMMgj06V+WfxR+Gtp4Kf+y9Ht1t7aInYiDAA96/bORVmHlMOAOfevlT44fDKHV7WS4gQbsHnH5c1+n+EPFq4cx8aVZ2Uj9L+jV4tT4NzelgMdO1OTt95+N6btxB7fpTmzmuy8aeGr3Q9SdHHfnNcYpyMr3r+/svxsMfQjiKLumf7LZLmtHOMJTxuFldSVwbHSkIp46cUGu5HqtERHNN9qeevFJinchojznrTcc1IRmjpRcixCQaawyMCpiD9ajNO5DiMGBxQc9qfgUwjNNMlqxFigjHSpCOaaQKaZm1YYajZfSptpzUZHHFNESiRkCmmpSM9OlN2+9MhohI5yKYwyanIxTMVVzJxI8elV5jhT24q2eO9U58KpZ+BilKVk2ZVFZM/Lr9r7VhefECDTg2fs0PP1Y18l16v8bNePiD4matehtyrM0Sn/ZQ4FeUmv8xePszWb8RZlmEXdSqSt6J2X5H8v55iFi8wxOIWzk/zsJRRRXyB5QUUUUAFFFFAH//V/wA/+iiigAooooAKKKKACp7Wd7W5juYuGjYOPqpzUFAGeKE7aoabTuj+jL4Za/H4u+H+i+KF5a9tI2ODnBAwR+legbeM8V8c/sOeKP7f+C8emSMTNpVy8OCf4G+cfh2r7QjUnkdAPzr+tuHcb/aOW4bF9ZRV/Xqf2dw1mH9p5ZhcbfWUVf1tr+JSJ6A0523LtNTshJf/APVUHyr/AIV7dz6GDIGBUNtpq4GDVgrkeYKj2+WBz71aNou5FIgJ6VHjk881MoJJOajZcH3rRG0WRkYxzxVYKd+7GKtMuSZKhC4eqTNU7EbAY2imhVAyevtUxAX5etQKPm2ueneqNYyIirLwDzSpycdxUjIWOBzimoCpx7fStEzdMYchcrzTNwIGeRVjGOAe1Iy8gtxVXNFLqRSLxxThgYA7UBMOFfpSrgnb6c5plc1xvIYjqD3qMnAGKmK9D0pjKvUc1cWXFkZ45PFRs4/hGaXbuO3vUuAGwKq5d7DOCcHinYGaedo5FNJ2/jVp3Hz9wU4P07UgXI46UiCSZsQIzk8cCrElo1qvnahNHaRjvIwB/Km2oJyb0F7VQTk3oVeSd2elJu7c1weu/Fv4Z+GiUuL43ko42QdD+Jrw7Xf2s0gUw+FdMjXrh5vmY14GY8W5Tld/reJV+y1f4Hg4/i3LMuusRiFfstX+B9bQWl1McRxk+tRXSWOnrv1O9t7ZV5IkcZ/IV+eOtfHj4teJVMa3TwIx+7ENox7YxXmFxD4p1yQyancSsT1LEmvz/NPGfLMJeOCpOT7tpL9T4rMPFjAUVbB0XJ927fhqfo9q3xX+FeguVvtVNw6/wwrnP4151qP7UPgaxJXRNLa5cHhpT1/CvieHwoXYfaHLd+f/ANVdHp/gyDz0SL52c4r4LM/HDHTv9ThGPyv+Z8Hmni/i7SdCMYr0v+LPrDwJ8fPiB8RPFMGkeG9OhtInYDcF3YGcV+j3xB+LGr/CD4YK8c6pqU0WTtXGDj8a8a/Za+D2keBdAbxxrsaKVUMMgenvXzl8e/iHffE3xx/Ymjkyw79iqORwcV+P594lZtndRvE4h8q6bI/mzizxEzLivGOFau/ZQ+48U8KXPxv/AGjfiQts2o3b2zy52hyBgn0r+mv9lP4B2Xww8G2/2gFrplBZ3JJ6c18p/sF/sw2+iabD4m1eBRI2H6V+vtrax2cCwwgADtX5jxHxdiMb/s8qjaXmfx942+LtfHt5HharcY6bk0exIgqk5GP0rifEGouT9mhOWPH51uanepYwMzHOa5vQ7OTULz7VcLlc8e1fGUHyfv57n8y5bH2KljsRv5mh4c0dYEEswyzc/wCc12SDPX6YpIoo40CAVMAMZNYYjEOtLU8jNMfLG1OaT0BQDw3NLtJ4qMKpPSpCPbrWCfY8qTsMK4OOtMIzxUoGeBTcLgrWsWO5Fj5eKQ8cAVIR69TSBAPmNbxdthp2GkDBOKQrg4qT5cYI4NNI9KtSERsO1NXjrTwozxTQeOO9bKVx3Izio8VMeajbaeorZOwr9iPORxTcAnpS8AHA46UnB5HWtU+wIY+GHFIQR81PfaOv51HISBxWsZDvcaxUGomZQfQD8KkckkL2Y1SvJ1tkLSHaq8lq3gud8kTow1GWJqRpQWrOf8R6/aaJpk+o6i4jiiUsSTjAFfzV/tuf8FCfHOo/E2Twp8LrwQWNmxSVgNwcg/lX2V/wUi/a4/4RPR5fhz4Rnxd3ClZCh5ANfzwXBa4ne9vP3kkpJYn39TX6rwdhp5dOGNgveWx/oX9GvwseDlT4kx1P3ul0fUui/tfeKgAfEdpb3ueGO3ax/EV6z4f/AGmfh9qbKdVgks34y0bZAr4CksYHT+7jpVCWwgkbEXyk1/QGW+KucYVKFWanFdJL9dz/AEMwnFGYYOKgpqce0kj9v/hR8cvCEeoRvomvRSFuBFI21vwzX2/cnT/H2gidkDOAeVII59xmv5WPs+o2xDwStkcjHB/SvqD4C/tMfEz4Z61DatqkrWhO0xyncoHTvWGa8cUMxqRzCVD2dVdYvRn5jx5Rjmc1nmBpKniIa3j1P1D8ceFp9Eu3AQ7S3FZHhjxRPo14rq2Cp9a9Y0T4jaH8VPCI1CSJJpim4hTg5x6V8u+IfiB4A0fXTouvXD6ZOWwPNHyE/Wv1bhjj3K+IsMsszGolPb3tLn13B/G+XcUYP+w89ajVWjUuvofrZ8D/AIupf20VnPIMng5NfZdhcpeQpKhJ3V+FPw+8UT6feR6hoF7FeW4YHdC4PH0FfqZ8HfijB4gsIopWCuB0PHT1r8J8VvD/AOoVHmeWxvB63R/B/wBJ3wHllFWfEeR0r05O+n/APdda0SHU4XRhyRivnzULS+8H35kj3bAe3SvqWGbzog8bfWuU8SeHbXVbdlx8zDivyXIs5+rT+p4z4XofytwPxZLLKrynNlek9Hcw/CPi2DVraPLjPcZ//XXfpMZPnX618qXCXng3VcciNWzxmvb/AAp4vh1iBdzDdjtXdnmRJr69gVeLPQ454CTh/beRxvSlrp0PQxKp+XoahDs2AO1KnzNvXp+tOG0tgHk18U04O0kfiVSm6cnCa1HKy4/x60jxjkjvTFVg3zVOcFc9a0jIxZBtGM0j4xkGpWUMMCoyPX8a2UhMaP6UY3cf5FOIAPXim7e46VcZC2GldwPNMKgD8Kcw/hpkoJGRXRCQtyBhuIFPZFYDmkxzmiTkc810RYmrkIcrlU44rn9a0aPWbCSC5UOGGCD/AJ5rpAufmqD51Y5GQf0rpo1nTkpxOjCYiWEqxr0XZp3PzI+Mnwzm8L3LXOkwiKPdnCDGf8a6f4IfEZbOaOxuJCBnGM19gfETwfDrunuNgzivzo8VaBf+DteaWIFVVq/qHhjN8Nxnk/8AYWOtzxWh/oHwBxTgvFjhn/VHOWnWgrRfU/U/T72O+t1miOQRmq2rabbalbtC68MMV8+fCH4ipqcMdpO+SQByea+l42LrleQelfiedZZX4dxzjJWs9D+OeMOGsZwNm8qEotcrumfnB8efhIsJmuoU5HOcV+e2radNp1y8UowcnrxxX75eM/CcOuWMiyKGO0jmvyq+Nfwwk029lniTGCTkCv6j8GvENYqEcrx09Vsf6F/RW8b1mNOHDub1feWiufKKcrmginzwS2ty0EnGKbnNf1LTqKrFVIbH+iFCtDEQVSm9GQEd6cRk04jPFNNWXYjwKWnheeTTKadieUbwSAKjIz1FS03bkkihMhobgYyKiPrUuDSYBqkyGiM5owCadjPSmtx1ouS1Yjxg00g1IAM03gmmmZuIzGaacDjFSfSkqrkNEGMUhU9KmxRjPIqkzNwKzAfSuS8X6zDoXh2/1aY4WCB3J/4DxXYEcZNfNP7UniIaH8KLy2Q/NqDLCPX1/pXznF2bLJMnxuaXt7OEn80tPxseLnuK+oYKvin9mLf4H5M6jdPfX815Jy0rs5/E5qnSnrSV/l5ObqSdSe71P5bbbd2FFFFSIKKKKACiiigD/9b/AD/6KKKACiiigAooooAKBRRQB+iv/BPrxo2neKtX8Fu3y3sAuIwem+I8/oa/WOJAEDd6/ns+AHjY+APi5oniJ32QrcLHN6eXIdrZ9sGv6GFaN1wnzKO/sf8A61f0D4XZj9Zy6eCm9ab/AAeq/U/pDwmzNYnLJ4CW9KX4PVfjcRRlSW61ASuScdPzqzgVG0YIyOPWv01I/WVLuQk7uPWhh61N1b296iKZfnOBVp9TeMuxXZcNuWhhzU3BGKavJJ61onc2UuxUZSSCKY4P3gMVYwxAXoR6VEVPGBmtDdS6DAmcnHSoEXPyenXjrVpuenSoxhlyxGapaGkJFbYz8k8VCeXwatbWXnr7Uwx4O48+tWbp9iI4zxTM5bdgkVLgBhkcU0J5n4VSZomN2kgk/pQh+X5zyOvrSgFeSOab3z6c00VF63F5GM1CeW2CpmTjORkelRoncVZpfzGlMYZe3XinKq8kinoPlA9PWmMBVIfNYZseSQRxrkk8Af4Vx3jj4g+DfhzCZPEc4luT0gjIJB9GpnxH8bQ/Djwu2sj5ry6GyAHtn+KvzwS11XxlqMup6zK0zSMWJbJya/O+PePqXCNNYeglKtL8D884144hw1GOHw6Tqy77L/gnuXin9qnxdqp+xeEIF0+HGMoMsfxrxDUNX8deLWabVLqZ93XceDXX2eh6bZIAiDI4q5ujjO1V24r+ZM48Rs2zeUnXruz6J2X3H8/ZnxnmOaycq9Z2fS+n3HnMPhOZz/pT9euetb8Hh3TLVcKoJHQGuhYNu6ZNV3jbccnBr46tmFau+apNv5nz0sTUqa1JXK0cMEHEaqoA44/WpBIoB3Dk+lP8pSmM/wBKZ5fp09K5pVG92c86jl8TI0jDDJFfS/7Onwvm8aeKopZkJhiYEnHHFeHaDol9r2oQ6ZaLuZyBx71+r3gzR9L+BnwvbVLsKLuRO+M8ivLx2K5VywPheLs5dCn9VoP3pHKftJfEuz8KeHIvAPh8+XJt2tt+lc9+xZ+ztffETxZF4m1eIvEGDZYcda8P8GeG9a+PHxOX5WljaTJPJwM1/SB+zt8IdP8Ah74St7cRhZAg9q+VzDHLDQ5Vufz74hcW0+FsueFoy/eSWp7N4N8MWXhnRorGzQIEUDgeldTNIIYjIOABT+RnbwAK4vxJqjIn2SAnc1fH+0dafPI/iOviKmb4qWIrO92Yt28utaiIIvujr6V6NpenpY2yoAMiue8KaM0Uf2iThjzmu1JAG0VpWrNJRQZjjOSCw1LYiYcc9TSlRjgYPrUgUsQSM04LgZHftXLzXPAciADnOacFz3pfc0frWkX3Jb1GKoJyeKZt7nr6VZIx0/GoypzWsZApEBA+92oZe9SdOKYemK0UiriEHrTCDnBqVTuODxmkLEDBraMh3IwMctTBgMd1SkZ61GF7nmtYsW40AEf5NRDAqYMQcYpMDPI+taqXcERYqMKBz0qZ8DINQFgc9hWkZDQyQHn3qElVGD3qck7sMM/pUDOOV7evpW0XdpI0hDnaiRy4VcnoOa+I/wBsL9o3S/gt4Bu7lJgLt4ysakjOTmvor4r/ABI0f4eeFLrX9XkVEgQnk45Hav5M/wBrb9ojXPjt8RbmVZSdPgcqi54wDivsOH8qeImqk1of0n4HeGFXifHwx2Jh+7i0fP8A468a678SfFl54s16Qyy3MjEEk8AmuUMWxiynjvV0xrbIEGNxqMsoJWVs/wCFfqdGPsoqCR/qPkWW0sowsMLh42SRUePc+X/CmRREsc/hVkpk5U5z604Ag8nFbc1tEe0paaESK0WW9f51FEzb9pG6rDCQHYOQOaUZK5A59aJJNNMxqQjUjyyPoL4MfGvVvh9qkUUzlrcnDKemCa+1PiZ4J8L/ABz8J/27piqbkx7uOucV+UpLEbCefWve/g58Y9Y8EailrNJutmOGBPGK4pRdOXNBn59nnD3JU+vZfpJankut2fxC+EOuOmn3lxbeU527WIFfYv7OH/BQD4g+BvEVvZeNo49Qs2IXzfuyAe5GK9M+IfgvQvix4b/tvRAjyuuSB1r82vFPh288L6y+n3kZR0OATXu0+I8Y8NPBTqtxfRu6+4ipjp8Q5dVybGvdWae33H9kHwV+Lug/E3w7baxosm6OdQcEjINe8MN8ecZHSv5d/wBhf9qHUfh94gh8Na1OwtiwC5PY1/Sr4K8Wab4q0WHU7CVXWRQeMGvzLNaDjUc4KzP84vGPw5r8MY2VehC0b7lTxX4Ut9XtnVR82ODXz5cx6x4I1Mu+RGD2zX2ERvTaBjrxXEeKPDFprtu4ZQxOe3Ne3w9xK6TWDx+sNjx+A/EFYNrJs796i9NdTI8HeMbfW7ZdsgJxg816OhLLvTkdK+N7iHVfh9rHyg+UW9+9fRnhDxTba3aJIjZPGR0rs4hySNvr+B1gzq8Q+AYKKz7Ifeoy1uj0HdkYPamSjn5cU8SKY/lPWmxqzNuYmvhLtPlZ+DTg4ScZbjEIH9KkZVK/L6UMp57fSg4HGa0UjJq4wqD+VIQOSBT2GRxUYyTgd62jO2pDI3wxO40wpzwamIHIOee1JjGSO9bqQehXZQeFAprYAyKnZccmonXIINbRkO1yNRjJpxf5eBSMADxzToxznpxWsZk27FCdQylCMjpXzr8Vfh5Fq1rJLFH82K+kJFy27+dZl9aJcwtEy9sV9Vw5ndXJ8TCvRdj7HgninEcLZhSx2Fk1Z6n5deGtW1DwT4hEEhZQrDOfY1+hXgbxbBrumo6vk4r5v+Mfw8w731snI54ri/hN42l0S+TTLp9mCBya/e+IMFQ42yyOaYRfvIrU/sPjfKMF4sZAuIctS9vFK9tz79Y5XaeeDXgnxW8AQa1YSOY9zEHnFe2aVqUWp26SxtkEZp99aR3ts8LjIbjmvxXLMwxHD+OjOLs4s/kbIc4xnBWbQr0m4yg9T8PPif4En0a8kYrtOTXikbk8Gv1s+M3wqju4JZ44wcA9q/M3xn4euNH1KRduMHtX96eGvG9LP8HCjUleZ/sl4BeLWG40yylh6tS9RLU4leOD2oA70KwKg0/Oa/XOh/TCSeowg0zBPNPLYbFMwaBMb1pDSgZpfemQ0R44zTfvHipPaigloixzRtp4HPNJgY96Li5SEjigDnNSYpvWquZtERGaaakPA4puO1NO5m0Mxk4NIOtOOQaYcnIp3JasQOMZxX56/tr+I902leFYmHyhppB1PoK/QqTP3l4Ir8cf2j/E48T/ABZ1OZW3RWz+SmO20YP61+FfSDzv+zeGXl8Je9Xmo/Je8/yt8z838SMb9Wyz6vF61Gl8t3+R4NRRRX8IH4EFFFFABRRRQAUUUUAf/9f/AD/6KKKACiiigAooooAKKKKAJIZHilWWPhlOQfcV/Q18B/GMfj34VaJ4gWTzJXtkinOcnzYxhvxr+eIHBzX6v/8ABPLx39t0PWPh7csTLaut3bjP8DcOPzFfofhtmn1HNPqk3pVVvmtV+p+l+F2a/Uc1eDm9Kqt81qv1P0mO3d8pzzTCwxs696sfKBgdVprLzuFf0Vof0vCV0VQATnvUbjHPWrAX5vUUjADmqTubxl1KrICM0woBU7IgIAOMnpTTk8dKtG0WVmUbQvXPekbbjp2qY5A4pm0DLZ4q0zWMiqEx0qNlLDC8Va6rg1WZzkbgOK0RtF9is2fM29vSpAMrjk55pxIBwe/qKVMHJarOhSsQMh34HQfrTACowBntVhiAuRVdjubAFUjRSGHluB071IEzz0NOI2AEHPamK3zE85rRGifQjOUxgZpyrzjGaf1ORjNIQabdiuboyNsbcj8RQ1v5zJH/AM9CF/WnELjPNS2sSyX1qhxjzVB7VpBXZcdXZnwv+0zrcmsfEBfDluf3NkBHjtkgZNcRpduthZLEuMAfl+lL8SnkuPi3qXnEbmuWGDzwK1FhygYdK/iXxRzCeKznEc72k19x/IHHeYzxeb13J3Sk19zKMjlHG3vT2RGGTwcVOUw27jI7ZqMxsCZBk+tfm/Mj49TuQEAcL0qExEn5u9WDzzng1Hs2c0cwpTaVkM8or93kUvl9BF1NSqGByR17V6L8N/B83ivXobNF3Juy3Hasak+RNs8/GYv6tTlVkz6k/Zi+GkTzf8JPrK4iiG8MeBxzVX4//EK+8e+J4/B/hnLorCMKvPtXo/xQ8X2Xww8DxeFtDIW4lXBI610n7Ev7P1/8QPFa+LtbiLRhgwLDv1r57FYhRTryPxXP82p4OnVzzGy0V7I+7f2Gf2bLfwpoUOt6rDmdwGJI9a/UuGJLSFY4gAoG3GKyvC2gWug6TFZ2ybAqjgCt1oxIOnSvz/H4l4io9dD+B+POK63EeOnPmvG5QvLhbWIvJjOK8/060k1fUGuZRkdQK6LVme9mFrHz61v6TpiWcQCDtWUJKnE+YpVVhKOu5oW4WOPy8VYKAjJ604KjEsKkCAc/0rJzb1Z4tSs6knKQxRgECmYJ5FSYGdwp2CRyKd7ENkJHeheakII4NIRjrzV3JuQkZ4prD8KmwARTcjJNaplcxCQc4Hb0ppAxzUhAPHWmlRjJ4zWyfYu/QYWyKaRgZp/ABA707B25Faplp3IDjbkUwLmnEYyCMGk3Z6GtEx2Gngk0hIzj0pGb5c9qCuOelbIewjEH7w5PWoslckfSnv7cfWomAAz09q1irkX3sQsUVju6+9c9r+tW2i2E17cuEjjXJJ4GBW1PLGEO7jHUn0FfkP8A8FFP2tLb4eeGpvBOgXAN/dKVIU9M+te3lOBeKqJWP0jw94Or8V5jSwlGOl9T4g/4KM/tb3XjXW5Pht4SuCbaIlZSpyD+Rr8ko0wu8nJPX61NJcX+o3cmrag5klnYs7HknNOkixz/ACr9iy/BxwlJRij/AFk8OuCMNwrl9LDUoWshpY4y2OajI3EenvzUh2qOeTSbq9BLsfpfLYh2KDub9KfsjOCpyRSDklvSgqTkKaLieg8jcpwMkVEoIHXpUig7CM4NN4jwM5obuZtkbxEKHPanKduSvTrVjIYfN0qBUVh1/P8AxpPXc56sFOLTPoP4PfGa/wDCN8un3sm62kOMN2zX0Z8S/h/ovxH0T/hINEVWfG47etfnkcBgFPPrX0d8Gfi/feHr5dM1J90D8EHpiuOpHld0fC5xlcsPP65g1Zo8L1Gw1PwlrIOGjlhb5Tzng1+1P7B/7XLXMcPhHxHcYlGANxr4w+Knw70rxppP/CQ6CAWK7jt6818c6Nq+tfDvxPFqli7QywOCeo6GuTF4dV4N9T4bjDhzDca5bUoYmK9okf2uaRqlvqdit1bsHDgN+dX3kKsNv8+1fmd+xP8AtP6d8QfD0Gk6ncAXKKFYMec1+mEE8V1CssRBB7/0r4rF0XQldH+avHHCWI4Xx06FSDSTZ594z8Lx65YPFEAZCPlzivh4/GK7+C3j5PD3jKE2trcNhJ/4MnsfSv0llAMfI6dq+cvjz8HdG+JvheawvIlMuCUbHIPavbwGd1qdL6rKV49j6PgzjepRpvI8ylelPSzPXvCPirT/ABRpiajp0qyxuM5U8V2wVTECOa/Ej4NfGzxT+zd49Pwx+JDubFn2wTP0APQfSv2N8MeKNL8TabFqOmyLIkoBBBzwa4MXBTftIKx4nG/Cs8uq/W8NG9KWqa2OkGOc9aUjPIqOTEjFk70iPklT0rkWh+aSTWg8+3QU0qvXFIccmhc56VdyPUTGTgjNRsp7+nSnyfJwOtIfm5P5VtGRNiMqRgEdKY3qtSj161HtUmt4SBEe0EHdQEC/MKXaB0/WnY+TA71spEsicY5FUmOcsefarMytjIpRxjI+nauinKzCLs7o4/xRoNvq1o8bLkkHFfBfxK8G3XhrVjf2YKbDngV+kEg4ww/CvKviB4Pi1mxkfaGJB6j8a/VOA+K55TXVCq7wejR+6+EPiJV4bxscHiZXpS0a9Tyr4N+O47yCOznI3YHFfSi7WG5T19K/Ogi88CeJiVyibvp3r7j8E+IYdZ06Ighsiva4/wAgjTlDN8ArwnqfR+NPA8KEqfFOTq9Krrp0L/iPQo9Us3jdd2RX54/HD4VtA8lxFH16ke1fpuVDHb1Feb+OPCdtrdg6lMkg/TNcfAPGdbhzGU+WXu3PB8G/FDF8A5rQcZvkb1Pwd1TT5tNvWhmXaAeKpDkZr6m+M3w2uNKvJZY02qpPOP8A9VfLssT2shhfIx61/oFw1xDRz3C069N3dj/a7w/4zwvGGW0cdhp3bSuR9RmmdGwaeCSKQ5/hr6I+/avqN29qbjilAJOabjiquQxKMU/HpTSKNxWIvfNLgYp+DSY9eaRNhoGBzTNpzU1NNWS4kJFM5+tSnrSe5pmbQwjjmoiuMg1L2qJicGqv3MpI4nxx4gj8NeFNQ1uc7fs8LFc/3iPl/Wvwy1K8k1C/mv5zl5nZ2J9WOa/UP9sfxa2j/D+Pw/A2H1CUA9vlXk/hxX5YMSxr+JfpF599ezrD5JTl7tCN3/inr+SX3n4B4lZh9Yx9PAxelNfi/wDgWG0UUV/Ox+bhRRRQAUUUUAFFFFAH/9D/AD/6KKKACiiigAooooAKKKKACvo39lXx7/wgHxp0m/mbbb3b/ZJucDbLwM+wODXzlU0E8ttOlxAxR4yGVh1BHQ11YHFSwOIpYylvBp/czrwGLngMTSxtLeDT+4/qEZU3ADGBkZHTHrQc+mRXj/wH8exfEn4T6J4r3AyvCIZ8dfNiAVs/WvZEKqxWv63wOLhjqFPF0dYySaP7Hy7Gwx1Cli6HwzSa+ZAqFXbA6VEMHOOlXNoJwahZNrE9q7Ez0oyIOjcDjrUEgAyx5q66qfmHaq7jHJHAq0axZDsJHBqHKirRAVfmH4UwxkA+1WmbRZXGSMgUzbkmp9o2c8fSoQrba0RtB9SsVJG4Z60w55J9KsEYU8VGRlcKKtG/MVS5B6fWgoCM9qnYENuHJqJkYdTzV3NlIaFLjAP403DYwTwKegP3c0o4XOfwqjRPoRkgrgUh5AI7UpGRz+lKAB85OapMpO+o3dkcVJBKLe5ilI4RwfwBpq8ds0+RCYj/AAk960i7e6HNbQ/Pf9oTSn0D4vXdxgos7iVD7MARUULCazjMZ6jNfR37RHgWXxj4eh8VaapkurFPLnAGSUHQ/wDAa+MtA8RrHCLK+YqwOOeK/kTxd4bq4TM542lH3Zu5/LviTkNTBZpPExj7k9V8zuyctwfwppyZMGokuLa4w0LCrJkjPTFfi04uDs0fmM/cdpIYQrDCrg9KilgIyRwB0q0FUkHdVa6nRB94UveeiQnJk1pZSXkqwxcseMV94fCfQLD4eeFX8SajgSsuVzXzd8HfC8et6ot/cKPKh+YnPHH/AOqu5+KfxDn1nVIPAfhtSwJEeEGcZ+lcGKU6i5UtD4fiDFOs3Rg9FubfhPw9rnx6+J0VrbgzW4lGcZIAzX9JnwA+E+n/AA68J21lDEqMEG7HrivjP9gn9mxfCfhuHxJq8OLiRQeRzzX6oxW4hiVFHCjGK+BzvG2l7GLP4k8aePXiav8AY2Cl7sdCYBR8o4HpVS7cxRsPXp61eOFNIyb2w4r5eMtbn8yxq2nztGJp1gobzpB83rW5g4AXtTQg4GPyqboSBxVymFatz7DFXIOKkGR/hR1J9aclJMw5rjDjNIBwCf8A9VSHHekIGCDVKQ7jMbuCMYppHcc048jnikxjljmtVKwyPbzu6U0xgjJ5qT5TkU0jPWtIyKWmpGQeophXseRU5VGXjqfwqOTjjGK2Uik7ELKeFpFbPyipSCAccVAMrzn8a1iy1qPYEndmoWQkEjn6U5SS3PNP+6CT3rdSNfIgxzj19abnBJH5UeYGOKk2D7wNapjkmtGQD7xI7Gq1zJtjyv8A9erEjoVPYVwfi/xVFodjJNI4Ujnk8V6uWYCtmNaOHw8btns8P5HiM+xlPAYKHNJs8B/ac/aA0X4KfD691q8kCTGNhGp65xX8hvxh+MOt/F7x3d+KtYlZ1kkbywewzX7YftdQad8dtXOn+JtRnWyhOFSMgA18FS/srfDh2/0HUJYyP74zX9XcKeCWaxw0cZGC17uzP9evAH6NeN4dy2lm+IoxdSaT1ep+fR1R967TwOlXxrQUCPgg19q3v7JujSKTZaqC3oynn8a4zUP2Stfjy1jcRT+ynFe7ivC3PaC5vq1/Rp/qf0tW4Ezekl/s17dmn+R8xJqtvIdjce9XvMEoAQ/lXpWq/s7+P9MYkWjPt7rz0rzbUPAvi3SXK3VrLGB1JBr5zGcKZlgf95w0l8meLiMjxmEb+sUZR+THkEfKDximAYXcepNYDf2rZ53q3vkU6HVZlGbhOleFUwVSG8Typ0JJ2NtuenPvSqsRGSTms+LUbN0wWwT2qxE8c2NjZ+lc7pSjujnlBomyuCBRDEQcHoe1LGcnO7Ip6qW5B4FZWbZjNMjJ8rAPQcUsTNGwkjODnOaaE2tyaahZW570nG+5yVaKqK00fUvwd+LT6ZOujau26F/l+b/Cu/8Ait8L7DxDpp8Q6CoJYZIFfEETyxOssZwQeK+qvhL8XDEBoOuNuiYbeTXNOOrPh80yuWFn9awy9TgvhD8Vde+DPjaG8SRo4lcB156Zr+nr9m348aN8U/C9vcW0yl3UEgHJ6V/OT8X/AIZ2+oQHxBoADK43fL0/Sr/7J/7RGvfBrxlDpWpTMLYuAVJwB7V5GOwSqxbR+J+J/h/R4uwM8ThofvUj+tzd5igL0AqpIob5WAOePzrx/wCEHxT0r4h+H4L2xlV96A8H1r2bAxnoK+RqU3Qlsf5253k+IyLGSw9eLTTPiL9qn9nPSvin4emuLeILexAvG4GCCORzXwn+zL+0l4h+DXjM/Cb4nM6CNzHFJJkDHQcmv3CmhS9iKSLxjHPYV+W37bH7LaeMdKfxZ4bj8q/t/nR0HPHNephqirLllufrXBOfYfO8O+Hc71i9n2Z+mmga/Z6/pyXtk4dZADke9b52Zwvevw7/AGOf2stT8M6wvws+I8xjuIW8tC5xnBx3r9sNI1S01ezS9s3DKwByPcVjWouGqPg+NuDK/D2IbUbweqfSxqyDaAx9aaG6r1pzKNuc9qjRQM7q5U2j875dNROCNxpcg8rTtqt04oaPBzWqlYm1hhUEgH8hUeBmpzgc9qTjpWsZWEVsfWm4xx2NSYXt3pgX5gD2roUriZGwJGKjCAE1My7uQMetIFXB9q2jIS0GKMscdTVK4iScFJOhq8OvNV2yqgiuujWlBqUTSnUdOSnHRnzB8WvAEd6j3NugyBmuI+GPiObSb8WF0SADjk4FfX+oWEd5btBIu4MMc+9fJvj/AMGz6TqX9pWobAOTjiv2vhjPaecYN5JmMumlz+ofDziyhxNlsuEM8nunyt9z6ssJ0uLZXVgcj8qnljDKVcYB615B8OvEsl7arbSn5gAPoa9jKKzbz3618Dm2BnleJdNPS5+G8U5JV4fzCdF7J6HzL8Yvh3DqtlLKiAkg9sfh3r8tPiF4Nm0XUZPlxg46V+6epaemoQGFgOnOa+Hvjp8L4mWS5jQkcniv3nwi8QpZdWhl2Kn7rP7B+jD42TyTF0sizOo+R6K5+Xi4IxmkIIziuj8SaJLpN/IjIVG41ziMDX9pYXFU8ZSjXovRn+smW4+lmVCGJw7umrjeTSY71Jio9uK6juaGkEUdeMUu0g4z0pRRcnlGYwaSlp5XBzQTuMxim9OBTjTcYppiY09c00j0pSDk0duTVJmbVyLB6VWf7v0q0QQa5Xxr4jg8I+Fb/wASXBCraRM3Prg4/WufGYqGCoVMXXdoxTbfklc5cTVjh6c69V2UU2/kfl7+1z41Pif4kto8DHyNMXywM5G48k18p1qa1qdxrWrXOr3RLSXMjSMT6sc1l1/mPxTnU+Is2xedVt6km15LovkrH8k5pjpZli62On9tt/Lp+AUUUV4BwBRRRQAUUUUAFFFFAH//0f8AP/ooooAKKKKACiiigAooooAKKKKAP1G/4J4fEYJcav8AC+9c4kUXtqCe6cSKB6kc1+oykHMgHXpX833wh8d3Xw2+I2k+Mbdios51MgBPMZOHBx14Nf0eW08F7aRX1qwe3uY1ljYHIKuNwx64zX7/AOGObLF4GWW1Ze9Sen+F7H9D+F2c/XMBLLKj96k9F/de33PQtGMoMfypjICc+1Ts25umKY4z8uK/S9z9WUrkMgGz3prjp/SpDhT9PanMQ2T3HWr8jVMpdTgmo1Ab5WqyyndnvUTHygQB061aZtFlUL1z+FJu45NWTxjH51AQByTwa0TN4yvoVJCQfp+dJk1MEO7GenpR5YzzzWqN4u5ScHzB6YqMKhBGOcVaCgyHnNRAdParTNoyI8Aru70u3jjpUhXIx0FVwGK/PVXNlIaVwM54pxxt9TTo0LPg9BTpPlYgDPvVotMiXhsD1pyltvSkHzZwOlM3AUCSuENz9nkJZA6ScOp759q+dPiX+zlpfixpda8EyLBcOdzW7DGT1+U19FqqqTinKGPzIdhHcV5+ZZXhc3ovC5hTUo/l6HnZlluHzSm8PjoKS/Feh+XuteC/H3hCVre9tZIypxyMj6/Suc/tvVbfKyRMW9CMV+tzXEk0ZjvVS5X0dQeKym0jw3dPvudGtXP+4BX5PmHg3gMRNzw1ZxXZpH5pj/CzBV5OeFrOK7Nf5H5W22qeLNRlEdjbuWP91ST+leneCfgn8U/G+rRFLOYRtjLONoA/Gv0ctLfToGCabYQQnp8iYr1HQILxIzc3BARRgKOK5YeEOWYNOeJrOXorHlVvDXAYWnKWIruXorfqeWeGPgffeE/Ci6LPfJBPMuH2DkA+9fTX7LP7G3gyx8RL4kvmk1K4Lby8oBA+lZ/hDw7deLNdjTBdd2Pb86/Wf4O+Ao9B0yNlXbkDgivx7xSpZNwvhnhsDSXtGj+SPpC53k3A+V1KGXL99NW3PX/DWjw6Lp0dpaIERVAwB0rplR1GWPWoYoXChelWFUDrX8fYqu69Rzkf5K5tj54/EzxFWV7sgKljipMc/WpDGAcjpTtoHsCK5k+p5nNoMK96cAQd3rQQC22n7Rt54q+YXMJyFK9KUpzwcUxVI6fnTwDTuFxhU+tJtw1Ko9aUgEVVyrkR9hmmkEHipMfw004HB/z+FaKRSkMI/vUhGBj1pxHpRznBrdM0TIyTkUxhzhe1OKgcfmKSTIOO1ap9i7dgGMZPFQkDOR2qUYJz15qnPcRjgdTXTCLex0UaMqmyHEgnA6dqcxBTH6UyEB8FutSbf7vTkZrR6aF1Y8j5bFIIWYcVIGxkmrLjC5zVG7vFhiMjHGBnniumjB1ZRhBbmtKlPGVY0aau2ZOs6rFp1q00xwMGvzq/aE+MQ3S6fbScDrXvHxx+KcWjWMtojgMVxx/hX5HfEPxXNreoSbnzk8c9a/rfwT8NniZwzXH09Fqf6YfRI8BPrlWnxFnFHzVzjtZ1GTWLxpXYkZPfrWWLePAGOe9MiXAwRUgyc1/bNGlChTjSgtEf644HBUsFRhh6MbJC7MHinEEcqcVEDzmlrXmOyyRZ+0XCjAcj0qOcx3CeVewpOp7MoNRjHeg0O01aSuEtVaRyOq/D7wDrmTf6Yisepj+WvNNY/Zy8B6iubCZrY+h5/kK94JOeKaYs9q8jF8P5bjk1icJF/K35Hk4nI8Bi7/WMNF/K35WPivXP2VNWiDS6LNHOOwB5NeG698GPHXh183NrIFXuBkfpX6i7Sh3AkVMbm5ZPLlPmL0KtyK+NzHwrybGJvDqVN+Tuj5bH+HuW4n3sPem/LVH47y22taY5SVTx2NRprUoIjnXAzzX6s6z4E8FeIU26nYqrf34wAa8V8SfsxeHtTLS+H7ry2PRZOP1xX5zmvg3jaXNUy2SqLtsz4jMfDnGULywklUX3P8T4eh1G3kIBYgirIy48zII7Yr1HxX+zz418PMzrD5qDPKcj9K8Wn0nXdIkMdzE6YPQg4r8zzPhTMMrk44yhKPqj4PH5NisBLlxVJx9UbMMb8uG496mt53t5fOBwynqKw49Z2YS5TGa04ZobhC8ZHvXzdajOm7TR8/iMO5JwqI+tfhV8Tobq3/sDW2DRtx83OPzrk/ix8PGtJG1zRx8rfNlf6V8/W1xcWsoktuCOc19T/D7xzB4i006BrRDsRj5vXFckqe6sfDZhgHhJSnTXuvc+kv2Hv2qL3wZrEXhHxDORGWCoWOB196/o48G+K7DxTo8N7ayBgyg8d81/HN4+8H6h4Q1Ua7pBICHcCv51+vH7Bv7X6X0MHhLxDN+/XAy5/DivnszwHN78Efyx40eGEM0pSzrLKeu7P3K2Beh4NZuraRZ6jZvBcDcrAjBqXS9Rg1a0W5t2DK4DDBq9gqCBivlFJ0JXP4dar5Rie0os/Dj9uD9lnUdJvT8SvAUbQ3Nu3mER5BOOe1dz+xB+2Amvwp4H8XyiO9t8RkOcE44r9ZfF3hiw8UaVJYXsQdZFI5HrX87H7XP7O/ib4FeOP+FofD1GREk8yRU47+1e9hqkcTCzP6Q4RzfCceZc+H82t7RL3Wz+j6x1CC/t1ubZtysM5FahXKfKa/LX9jD9rzSviVokGh6xKFvIwEYE4OelfpxZ3kd1Es8bAqwyMc1wYii4M/DOMOEsRw7ip0a8bJM0yB60yPDkjvT8c+lGwZz+lc6l3PiGmhCvG3OajC7m5p5bcfXtSnOMetaKRnJEGMeoqNgoPXFWWGOe9QsADjv3rohIREeeTSYBJJ9KkCUxsFd1bqQMYw2jj8qiQ5/+ualMYXA65pgUA8VtGQvQgOF6jg1zGu6RBqts0UqhsjAz9K6s4HLc/rUEgDkBhXo4LGTw1RVIvY9DLsfUy+tHEUXZo+fIdEm8O6p+7XCk/QV7XZSGe1Xd3ovtKguVLOoJ7cVPZ2jW6+WOwr6LMc4WYU4up8SPrc/4ghntCnOv/EjoPdWB6f8A665PxT4et9a090mXLEeldk2Vk2N06UskKOpAxjGK8/L8dPBVY1qTs0fL5XmNbKsTTxmGlZxdz8lvjj8Lm0+eSZIyo5NfF13bSWV21vJwQa/cn4o+B4da06Q7QSQR0zxX5TfFn4fT6PqcsyptCk/pX9xeEPH0c0w8MBi5+8j/AF2+jD40U+JMDTybMq37xK2p4XzR7A0w7lco+QRTz0r+hE7rmR/bcJKcVKI0803oeKeMdBSdMCrQNCFBSAHdTsc806i4WISMdaQ+9S/X1qMmmS0IQM8U3ApaDjHFNMhog3AZxyDXxL+2j41Gl+E7bwfbviXUGEkgB/gXsR9a+13ZUBdz8qjJr8YP2ivHp8e/FC/voW3W1u3kQ+mE4JH41+J+O3E/9h8PTwFGVqmJfIv8P2n92nzPzfxHzb+z8seGg/eqvl+XX/L5nhNJRRX8HH86BRRRQAUUUUAFFFFABRRRQB//0v8AP/ooooAKKKKACiiigAooooAKKKKAFBxX7n/sTfEqDxx8HLbR7twb3w+/2VwW5MR+ZGx174r8L6+r/wBjv4q/8Kz+L9rDfSbNO1fFpc7jhRuPyOfof519XwZnH9jZnTqzfuT91/PZ/Jn1/BGdf2LmlOpN+5P3ZfPZ/Jn71nk7uT605lY/NnigQukoQ9OMD2PSpHCjOa/p1NSSlHqf1PTkmk4vQrHBBx0pNvBA4qdgA3rikxvGMdapM3UijIoB9hTHyp+lWie2etQbucHr1q0bRZC6ngAfhVN8bsNV5V6sT2qF497Z/nVp3NoMq7MjLc1DyDtXpVt+AAB1qFgc5boe1ao2hPoQOo3e9RdsL0qycLmo2TgkVZumQMRhs59sUgwPm4P9KlPqKYQWG09R0NVF2NYyIsYb1FPYDGBzSuNwG05x1/Cl2s65rS5pzEeBgjqaiZQOn5GrG0KevSopV3EDP40LULjQAQDTGVFkHNT4yMjFKVAXGefWqTsHNYekQHU8e1NCtnAOP1qxEm75QOvtVm3gMzBWHesak+VXOWtU5Fdmlo9i00mW5969Bs4/PkjsYufpXP2cfkQAIfmbjFfQnwV+H0+v6pEzR/KGFfB8WZ1TyrB1sXWlayPyjj/iajkGX18fip2sj6Y/Z5+GIdYtQki4JBzjFfoVptmlpaLEnYAflXG+APC8OiabHHGm3C9vWvQlRSQBxX+cfH3FFXPsfUqSlpc/w38a/EWtxnnNepze4m7IjVG7damZOQD29aUZxThyT6V+d3ufgkpMQL60q45JNAxjFLgL05zVIm/caPQ803a3JHfvUgBAyeKOtUmO40AdaTB7804gE+lGAatMdyMdODijk89OaeRjp+VHXnPWrTKT6EZHHpUR6jtU+AM0w4IIH/6q0RYwDPtmgcE5pzYxwKOO1bxZrEruhLcHrUbYY7R3qyVUZqo7bEIY81vTjztRR0UqbqSUIkVxJ5UZBrHLG5faeajvLlriYxrWnZ24RQPbrXscioQTZ9P7GOAoqc9yaKMoOfypzIV6DFPzt59fanYyuTXFKXOz52rVlXlfuVZX2jLEjrXkvxM8c2+gaTK2/DAEcmu28S63BpNi0zkfKDX5iftB/FWe5nltIpMryMZ71+u+GHBFbiTG05Sh7qZ/Tf0ePCDEceZtQq1qf7tO54R8afiPca5qMkayZ3kgc9s18xs5mkMjnJNXNTv59QvWmk55qniv9IeHcnpZJg6eEoLZI/3j4F4Sw3CeW0cvwkLWSEB3GnZ7U0deaXJGa91yPtloLRSZ5pcdqEx+gp4NJmiincBenWjvSd6MVW4iTPY80jHimU/K1omIYVOPl4qPaMg1LxS/WqSTIauMW4lT7rbh3Vhmud1fwx4S8RAx6xYISf4kABFdFigjFFWjTxMfZ14qS7NXOerRhWjyVoqS7NXPmXxZ+zHoesK8/he62Mc4jkwOfrXyx4q+C/jTwfKzSQtsU9U5Br9PSuDuB5p0kjSRmG4AljIxtYA8V8HnfhnlGbpzpQ9lPy2+4+JzXgLLswvKlH2cvLb7j8cmvNS05jHcqSoPfrW1oniFbedJon2svPuK/R7xZ8GvA3i9WbyvsszdwODn2r5N8c/syeJdBL32ij7TCP4k5/8Ar1+KcReE+ZZYnWwsfaw7x/VH5Pn/AIeY3CRlKEPaQ7r/ACPS/CPiDTPHmiNpV+Q0oGATXkd3Dr3wq8Vx61pTGPyZNwx3GfavJdNvvE/gHUhLcI6hTyDnNfRVrrmj/ELRfLlYfaFXp3zX5XjMrq05So1oNNH4jnOSToudCvD3X5H7wfsP/tTWPxD8PwaVqE/+kooBBPOa/T2GQXEQdcHcM5+tfxo/DTx7rfwS8cwanaStFAJBvGSB1r+nL9l/9oHRfit4WtrmG4VpCgBGec4r8+zfLJUZOSR/B3jX4WzwFaecZbD3HvY+vT0IIrxv4tfDDR/iB4cuNMvYlkMiEcjNe0K/mDco/wDrVGgWTKL3rw6NZ4eR/NmWZlXyTFRxFF2lFn8qXxq+Gvjj9k74p/8ACU+HFkWx8zLBcgYz7V+zv7H/AO1NovxZ8N28VxcL9pVQpUnnpXsf7SnwF0X4seErm2uIA8hRscc5r+bmX/hYH7HfxgKjzIrMy8qcgEZr6KHLjIW6n9WYT6l4qZR9Wq2WIgtO7P67obiOSPMeGBGc0ucvxxXxx+zD+0ZoPxY8K200UymVkG5c85r7EiYSKHU5z/I15Fal7GTufy3xLw9iMhxU8LiIWsydRySRUbbcDip1KuuDULLnnHFZJnyurEbBH060wj0605UAYjtS4OauMjOxEFGcfhmoivrzUr8DApuwAEetdCl3B6kZHTPNM69etPC8/pTVyx4Nb83UnYZtGen4VE4JOCamHI6f/XpjMDlRW0ZFEJzuz60EdcdalKbfm/8A10wlifUd61jMCFlyST+FKkb44qVgWH/1qcWwMVvCXLYz2Mi+tRcRNC69elfHXxs+GUdzFLcRxj2OK+0pR5jfKK5jxPolvq1i8LrnI6V91wfxHVyXF06sJWVz9O8M+OMTwbmtDG0KjUbq5+DXjLw7No+oyIRgA1xPOK+9Pjp8K2t5ZLiNMYyelfDF7ZzWtyY3GAK/0L4H4mpZ/gYVKc7ux/t/4Rce4bjTJ6OKoVbysrlMrmg084xgUmMnA5r7g/X2uwlJRx3pDzV3EAppB9afSAc5o8ibEeOKjbOMCp8Y6VCxUHb7VLfLuRPY8Q+P/wAQf+FffDi+1WB9txOpt4eeS0gxkfhX4oySNK5kc5LHJPqTX19+1/8AEiPxV43XwppzZtNJG1v9qUj5vyr4+r+B/Gziz/WXiCeGw8r0sP7kfN/af36fI/l/j3Of7WzOdOlK8KXur9X9/wCQuaSiivx4+JCiiigAooooAKKKKACiiigD/9P/AD/6KKKACiiigAooooAKKKKACiiigAqaKV4nWWM4ZSCCOuRUNL2o21Q07an9BP7KXxW/4Wz8KrPU7ls3+ngWd5zk7kHytj0ZeTX06wOMDkHvX4Q/sU/F5vhr8Vo9G1B9um66BbS5bCrIf9W/4H+dfvAQ21c4LDjjoeOua/pbgbPP7Zy6Cqv36fuv9H80f05wJnzzrLYe1d6lP3ZfLZ/NEEifOfWoZFAJq40ec+lVsEjcRX2Z91FkWM8fp2qvuJyasAdlqFwM5FWjeLvsQMzl8N0FM+51PXtVhWJJ45xULIoXP51ojZSKxUZ3gUx8r15+lT4y3J4qJiCemSKvfY3UitKy5GO/8qaCMYx2qbKuTkVFEjDkHPNWjZMh29SajKgNuNWGAb5e9NB67+KpM1jLqRhADnvmnozLlW60RoHO/wDSmBAPaquVzXFBUjio1VWAHTNOPzdOnajJA5HWi9iuawsfJ+YUiKS2AM05Djk1NACrF85FHNZXJlOxIsa7cA810NhZbE85+azbO1W4lyeldFbr50ohQ15+LxChByk9jw8yxUacJVJPY6Xwvodxr2oxoqE4OBiv1V+Anw3TSbGK7mTDEA18ufs+fDg6hcRXUseQMMDiv098N6RHptksSgDAxxX8ZeN/HbqueV4Weh/mB9LPxgbU+Hcvqaapm5boYY/K6Y4q7gHFMTaU2471JtwcetfyDVqOpJzl1P8AMPFV5VpurLdjVGR8xzmndD65p2PU+9Nx82TWdzkbsKOBSgY9s8Udev0pcgAVQrht4xTQPlp/BNIdrcHpVJhcZlaAOOaXpyaQgHtV3NENyp5NDDoBShcCnYAOcVaLQzbxk8Gm7QB6U/g5HrUT7gcN3rRFoBljk/jUZTBz+lK0e49KY7H8K2gr6G0VzbDW2gE5rA1O6AX5eT6CtG8uFhj55NczGr30u9hgZr3cDh+T97NH12S4FU19YqrQu2MRuCJHGM1v8hQvamQRJFjbwamd8jrwKzxVf2kuVbHnZrjvrE/Zw2QnXk9e9ZmoXq2cJZ2wMetWbiVI4d7YFeE/Frx7BoelSkOAcEGvZ4dyarm+Lp4enG6bPoeCOFMRxRmNDA4am5czPGfj38VEsIJLO3lxwRivyc8beJbnW7+RnYlWNejfF3x7ca1qcg8wkZNfPu5jyx61/o14V8D0eG8DCpOPvNI/3f8Ao7eEOG4FyijVlTXtGl0HYzzTx6ClBzS1+xXP6lUbaIb34oJIpfamgZNK7CwvXjNLjmk7UdvWmnYB9B57U0AinfWqTuMKMcUlBPOatCfmLj0pxJApuOKDwatC2DvR05FLk0nSquIDnqabT8+lNrRMiSISc9aeABS8bvejqavmM7DXGORT0nkiHJ49D0pnU0hJI5rVSvqZvTY43xN8PvB/jKNotStxDKRxIgx19a+XPFX7PfiPwlenXPCDC5jQ5IT0HPSvtNhnnNOSeaI5TjjBFfO5zwjlmfxf1yjaf8y0f/BPmM74VwGdxlHF07N9Vo/+CfnvqlqniPTHg1GIwXajBDjByK9M/Za/aE8Q/A3xvFpt/MfsRYDBPABNfTms+EvC/iFS9/bqkxz868c+9fKHxc+CWvWsB1nRI/tEaHOUHPHavwXjLwexFCnLEZf+8iu26P5v498GZYjDVacI+0pvy1R/U58HPizo3xK8NwatpkofegJAPqPavbogHTd61/K3+xP+2HrHwh8XReCvGhaO3eQJ85I/nX9MXgbxzo/jTQodY0mYTRyoD8pz1r+Vs7yOtgaklKFrH+S/i/4X4rhLG1KsKT9m29TvZQky+RJ3HNfmb+23+y5YfEjw1c6nZwj7UEJUhecgV+mShWcdgKpapp8Wq2rWcwDhlwQa8nCYl0Z2kj844P4mxHDWOp4iEtEz+RL4LfFzxp+y/wDE3+wNZZ47cS4wxOMZxX9OHwH+M+ifFHwzbajZTKzMo6HNfmB+33+xvHq1pP4z8N2/79AXO0da/P79kn9p/wAR/BLxnH4Z8STMsCyBCrE8YOK+gq0li4c8Uf1RxDkOC8TMnWcZcl7ZLU/rHjYlOnXrTiGKZFeW/DH4kaZ4+8PW+r2Eiukyhsr05r1YSYQY714NehOjLlmj+M85yitlFeeGrxs0yJFGOeKUcNUoyExj8ajOMY65rKL10PFerI3XPHSm4wPepcZ96Y5I+U8e9bKXcllcqFOBxTMNkHNSkdwKXaAOK6Iy8xkBGMUff+lP2jOOtA27eK0jIRAykcnnAphyDn61YC8dOaj29cd62jIRHnB4pXi3EM3/ANepNqg0xCQOO1bxkSyIqAucY+lNZQQcjhsip1I3YppXb8hrqp1GmvIFJppo8X+JHg2DV7FnC54Oa/LT4wfDuTSr2SSJTwT244r9o7y3S4BjIyCDmvlT40/DmDUrOSZIwSM81+9eFPHc8lxUMNXn7rZ/YH0bvGGtwlmNHLMXVfs5M/HV1eNzG/DCmdeK77x14buNG1ORiuAp/rXBx/OMCv7wy3HwzChDE0ne5/srkebUs6wdPHYeV1JDSMcGmkVKB6dajNeieu0GOab3wKd+NIucZ9KXkSNb1FeU/F/x5a/D3wFf+IZj++jj2wL/AHpG4AH869UlJC7lr8sf2xviSde8Vx+B9NlLWunjdLhsgyn/AAFfnHifxbDhLIsRjYy/eyXLD/E+vy3PjuN88WR5bUrxfvy92Pq+vy3PjjU9QudV1CbUrxi0s7l2J5yWOTVHNJRX+eE5yqSc5u7Z/Kzk5Nyk9RSQelJRRUiCiiigAooooAKKKKACiiigD//U/wA/+iiigAooooAKKKKACiiigAooooAKKKKAJIpZIJVmhYo6EMpHUEdCK/oS/ZV+LkHxd+ElhqM0oOp6Yq2d6MjcXRRtkPs4r+eqvq/9j74yf8Ko+KkEGqS+XpOsFbW6z91Sxwkh/wB0n9a+x4Jz15JmMHUf7up7sv0fyPs+B8+eSZjH2krU6nuy/R/Jn78PgkHg4pCwfOakiRZED7htHTbzkdj+VK8asxXp9K/pVSvZo/p+M72cTPZW3EDtURJDHAq3sIOQf6U0jklulbI6YyKjRsCGIHvURzggirZADYx1qNjycdatM0UisvygqPzxUJJAwatSgKfwquQQvPPamtDWMisIyWLgdfSow+RwKsDKqVPemOvAPWtUzdSRCBnIx1FRbRu3HirDEg5POaUAbCT16mi5qnoV2Q8ngUzG0Cpi5ZsYqE5ZuDmquUpAPl6DFNYdhUqoUxUWMsCDSWmo0+oqoGbcO3FWIonmbZ1X1pBGTjFbNlCi/P6VFSVrnPWq8qauTwxLbQ7M8t0x1r1X4ceEpNb1OJI1JwQPb3rz7T7NtQuVjUbiTX6C/s8/DjzHiuJY+eCcivzDxD4lp5Fl9Wcp62Pwbxl46ocI5PXxFSpaVnY+qPg94Ij0bTIG8vB2jtzX0JFHsQcfSsfR7FLC1RI1AUDHvW0o9q/zd4pzeea42piZu92f4VeIvFVTifNa2NqyvdsexxjtUnQYP1qMDDc9KkwAMf5FfLtn5xKVwAVRThnk/wAqMZzmgrxzSuZ3HJmjB7dqYMDNSEdMf4VQ9w2rjimqPl+lOGScCm/jxVJ2Ghu3Pf8ACnY4wO/rTQMDNHHT1q0zQOnJNNYA9PzpyrkfWgjnOOD1qzQYPU08gN97+VN20jEc4rRMsa/IwDVK4mCKWHbrVh5cAhhXNanfhm8tBmvVwWHdRqTPeyrAOvNSktCrcyyXUmF5zWxaWvlpk/lVbT7bI3uOnpWzkH1Fejia/IvZwPXzPGrDw+r0RHGDyc/Sojx8x6CpZWVfw4rD1rVIdNsnnlbAUd+K5sJh54urGlSV2zxcuwFXNcRDC0Y3cmc/4y8Uw6Tp8juwBHrX5SftA/FNtRvZYYpAVGQOa9y+PvxdfEtlby889+a/MTxV4gn1m7kJYkZOOa/tjwS8NVhowzbG0z/W36JfgIsvhTz/ADOlra6uYWpahNqN28jHIJ6Gq/QdKrqMcdanGK/rmlCNGKpwVkj/AE3wmHhhqcaNJWSHAn608NmoCCTT/wCVWdRJjmkBNNwR1pTVoBcelOqIflTxxwKYhc4607gikzikzxxQMXNFBx1pOKpMBaPrSc0e9aJ2JY6kye1H1pCTVXExwGaSj60ZrRMkac0Y59acTjrTDitEQBPNMPJp3PFI3JyDVkMZg0vJpx4NIT7VojNoiwMAntU8F1PByhyDwVPSmspAzRgE1tCXRmU6dzybx78FfB3xAk+2RKNP1FfmjlQcFu3TpXt37LXx++Jf7OuuJ4H+Jm650piEiuRkpjtz2rHkU9qtR3TRx+TcKJIf7rjd/Ovzbjfw0y7iqlKcIKFTulv6n4v4oeDOT+ImBq4XE0lGo07Nd+5++/gvxvpHjLSYdS0qVZFkAYYPrzXc+btXj+LvX5GfAP4vR+D7mK0ibbbkjMe4kA+1fpj4O8cWHiS2WSBwSwycHOK/ifjTw8xvDFaXPC8V1P8AGrxo8Ac48OcbVm6TlST0aWhs+KfD+n+J9Jm02/QMrLt55r+b/wDa+/Yd1N/i7HeeGVaC1uJQzyKMBRnk5Ff0ylgVwvO73rxL4r+B7bWdLmlgjy474/rXh8KVqTxlKhjfhvqeP4K8ZTyfNqGAx8rUpOzTZ8b/ALN/ji08CaTZeC1k/wBHtUVNxPOQMEmv0a0LWoNUtY2jfOQDyc9q/G7XLG+8F+IWDEptbmvtn4F/FD7bBHZzScjGMntX7f4h+H9CthI53k0fda6H9QfSF8EcJmmXR4z4XhpJXdv+Afa655zTWyxzVOxuo7uJZUO7Iz1q+T0FfzVWpujJwnuj/ODE4aeGqSo1VZroIU/WhRkjNPYDGOhNMO9uWqVM5bDcZBY1Cw71aPFQ4D8V0RkIgHTp1pjIRwO1T7QDnFNIwK1jLsFiPA64xxTGXHFS43Z2kUhGDgnrW0ZCaIioHJpjDPBqYgniomJQ8dD2raMjNoa/HI4/pTQpPNSkknBqIA7ga3jIW5XfO7celc/rukQ6payQMoOR3rp2B/Kmgbie4NelgsXLC1FUg7NHZgsZUwNWOJoSs4s/MT46fCzdJJcwx8ZNfA+p6fNp14YHBGDX7tfETwjBrOlyhkB4P9a/Kv4yfDuXSr95o02jrwOK/tbwc4/WMpQy7GT1P9Y/os+Ncc4w1LIs0qe8tN/Q+a8jtUZU5qVlMUrROMEUjc9K/pqElNc0T+/oyVSKnF7kRxSMNoyacTkZNMIBXHWlOXKm2EtE2eU/GT4g2vwz8AXniacjzmXyrdOPmkbpX4e6pqN3rGoTapfuZJrhy7se5Jr6r/a2+K//AAnHjQeFtKkzp+kExjBBDy924646CvkWv4M8aOM/9aM6lgsJO9DD3iuzl9qX36L08z+X/EDiD+2sxdChK9KlovN9X+nyCiiivx0+DCiiigAooooAKKKKACiiigAooooA/9X/AD/6KKKACiiigAooooAKKKKACiiigAooooAKejFWDKcEcgjqDTKKAP3n/Yw+NI+KHwyTSdSlDatoYW3mBJLPFjEchzzk9DX2Syu3zjr/AEr+br4B/F3Ufgz8R7LxXbszWu4RXcQ6PC3DfiOo9xX9GOha3p/iTRbTXNImSe0vIklilToyuMj9K/ofw/4h/tbBrB4iV6lPR92uj/Rn9HeH3Ev9r4JYLEP95S0fmujLb5VuKSVcrkDvVgJ8/wAwzRxyFFfoaP0iMr7GeFxz6UjAFf51O+Dw3GKaI8kg+2KryLT7lMkFQjDkd6hUHt3qw4G47qiaMMwCnkVaVjaLK+09s5+lRlMkVZAL8Z/+vTcDnb2qrmsWUwuG2DnNI6lABVlB8xJ/Wk2AjdVGqkVgAFGOhNR4J5QYA6VPwO3Xml4Hyjv3NNal8xURVzx9KlEIbAWnou5gV6irUUBY8ColJJXInU5VcS1tSx56e9bCqjkRoOnUVXcLEgQHmuq8KaK2o3kaNzuPpXnZhi44WjKvUeiPCzjMI4LDzxNV2SPWvhH4En1nUYspvDEduea/Wb4aeEY9C0iMRqFIAFeDfs/+AktoY7qSPsOor7KsrUQxrGo4xX8DeMvHFTM8XUwNGfuo/wAd/pS+LlXPcfVyfCVPci7aMvxr8gzzmpAMnByKi5A21IqEjnrX85zlc/hOdTmbkx3Qg0/AyBUeBxjvUuecYxWbZgxoGTnNGMmlHUE/rSAfLnpTELgY5pw75pp5/Gk9yM00A/Hy7ulLnB/pTSDxzSkkHHWqWpSABaQKDRsAGaQEYDetaItDSOPeneufyFITjFHWrRtEQnFRsMHIp0hI64qhc3HloXaumhSdWSsd+FwssRNU4op6peRxptjPPSsWzt3nlMpqLD31zvHTNdFDCIlGOK+iusLSstz7ZuGW0FBbk8UaxoF//XUrMUbpS7iveq0zkDce3615blKtM+Qqzli6nqRXMqxKZH4A/CvlT46/E5NLtJLZJACARXqvxG8aW2h6dIzOAQp71+Qvxo+JlzrWpypG24HPev6F8HfDypnmLhi68Pdif239F3wPrcWZjSzXG0/ci76o8p+IfjG41nUJDvJ3E5/GvI1Ocn161Pc3DXMrSHkmouMcfnX+hOVYCnllCOGoqySP9uOHMio5DhKeCwsUkkhxHOcUopMk0cA16N7n0a01HYyaTjPNK3XrTT14oGP6cCjJHJpmeTS9eKLgOzkUEDtTD1qQ4FUu4gyCenNPpmecUuPU09hjqTHcUmT0oJxVCFyBRS9Oabg5zVITFxS4oz6UAkHirT7AJ7mlzmmjrS9etWmSB4oowaWtNybDCBnmjp0pWpParTIaEbgUmD3oPByaTArRPsQxzH1po5OadyaCTWifYTXViDJ5ppUA808EH60h5NaJmbVyazvJdPu1mgJH0r7f+A3xdl0y6jgnlO3IAGe1fCxGflrb0PWLjSbpGViNpznPbvXyXF/DWH4iwc8PWjds/LfE7w/wfHOWVcBi6SbaZ+/3hzWIdWs0uIW3BhnitK8tlZWhk6GvgX4EfGRU8qwvZcA4HJr7403UYNTtlkjO5W7/AFr+A+MuFcTwtj23G0b6M/w+8XPCzMPDTOZ1PZtU73TPhL4/fDEzNJfQrjHPAr5F8J+IbvwtrSsTtKNyM+hr9fvF+gQ6vpsltKAxI61+XPxc8BzaDrcssY+UHjiv3nwv4rpZzg3kmYO+lkf2r9G/xLw/GOTz4SzyzlayufoJ8JviFba3YRR7wSQPzr3eKQyEMDX5BfCP4gT+H9RWCR/lDdCa/UTwV4nt9bsI5Y33EqOK/LPE3geeR4qWKoR9xn8vfSQ8GKvCWY1M2wEP3U3fRHfuCgyelIxwcgfnSnEvIOAOlOCBWyDkV+N/DufyDOHK+VjR81MAzx2qTAzgdD3NBHINaKZkyPbzmmMnr3qQcKOetMI5/wAK2jICIrSYB470512ngUNjr61tF+ZL0IXBA296jCc5P51I/wAvIGTSFWX/ABrZSE9BjLzQQO1Pwp+93ppXHC9q1jMh+QxuBj1pq8Dp1pwOe3FKqbh83X2rojLqhWsZ1zGkyGJuQRjHpXy18aPhzFf2ss0UfLDHHrX1mkfvXNeIdIj1azeGQdvxr7PhXPqmUYynXhOyR+g+HnF+I4SzbD46hUcYpq5+EfjzwxJo2pupXC5ODXnnU4Pavvv48fDJ7eZ5YYuOa+HtV0htPvWiPTPFf6HcDcU0s7wFOXNeVj/cvwg8QcPxfk+HrKpeVkYZOPumvnn9o/4ox/DDwJcSWsm3Ub5TBbjuMjDN+Fe+6re2mjWE2oahIIoIFLu7HGAO9fiX8evildfFHx1NqisfsVuTFbLnjaP4vqa+b8YOOo8K5RPDYOdsRWTjHyT+KXyW3mfR+IfE0clwLw+Hl+9qaLyXV/11PFJppLiZ55mLO5LMT1JPU1FS9aSv4Pbbd2fzE3fVhRRRSAKKKKACiiigAooooAKKKKACiiigD//W/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigBQK/WP/AIJ//HcXMUvwU8ST/vV/e6Y7nr/ei/DqBX5N1saDruq+GdYttf0SZre7s5FlikU4IZTkV7GRZvVyTGU8fR6bruuqPZyHOKuR4ynj6D23XddUf1MOWDFAOfelPI9K8Y+A3xf0741/D2y8Y220XTDybyJcDZOoG7jsD1Fe1gE5PSv6mwWMpY+hTxmGd4yVz+q8vx1PH0KeLw7vGSuii/X5qAQR1qw4+Ygng1BjYcZzXaj0IvUpY2nk9KaFUr6kjpVwMHByMHoPwqFIj8wPXrVpm90VmVSuFqDGRhRVqRVPA+tNYkdKq9jVMhITotJjAxTynHy9fambTge9O1ylroVgpA45oAC844qcr8ufSnJFv4puXKrspz5VzMjihWQ4/WtRItiAj7w61PYWO4lwPlApk48z5E5FcMqym2cU8QpPfRFe2iaeUIO/YV9kfAn4aSardRXUkfyjHavnDwF4cm1bVI40X7zj8s1+t/wO8Dpp2nxTPGAcDpX4b4wcZxybAyw1CdpNH8n/AElfE+HCeT1MJhalpyTPZfB2hRaNYLDGo6eld0RjG09feoY4vKUIi4FTIhzmv8+81x8sfXnXqO9z/E/iTOKuc42rjK0rttkgTPBqTApODwOlPGOorx2+x802R4UcUvbHen4yaDnH86VzO9xgDDk07nkHml43dcUo9KYDQCO9KoGemacRgHHNNHA5796odwBHUc5pdrdD1pAePrSjgfrVosa44zTtoAye9LtA5/lSFhiqT7FIbgd+tB4+XvQWGMmq0sm0/NxW0FzNJHVRg5yUUNlkVcse3WuV1G6a4m8mKrmq3xT90hyT6VFYWhdvNlr6DDUVQh7SW59xgMJHBUlXqbliwszGgyMHrWqvHHXPapYgApA6dsU1wGzurlq1XVlqeDjsZLGT8hSFySa5XxHrlvpdpJPIwG0YPNa2oahFbxMXPAHNfFnx7+KMVpBLZ28nr0PtX2nBXClbiDHUqMY3Vz9S8JPDjFcb5tQoQp+5fU8F/aI+LLXM0lnazfKM8Dmvzs1vUXv7ppST7d66fxt4kudY1CSRmyMnv6156zl2POc1/pRwHwnS4bwNOjTjrY/3t8HvDjDcC5TQw1KC5rIjQYp54FMUGnA4+Wv0G5+2p9BacTmoh1BPFSUrlIWkNJkZ4oz2ouO4pFOGO9IMUlNMCTrSDpQTk04cmquMTBpcdxSDHalPXmmAvB4oPTNHPSkwMZqrgBz0NO7YozR7iqTFYDRijANBq0wYmecdaXGRTfrQSelUmQGOwNOpDig+lWnYVhM+lLjijFHTirRIh5NNPFSCk+vFWmTYZk/lR0pze9IDuNWnYljOBS4pSo600jnitkyGhxw1MKblPrS/WnDg+tVe+hLjfc6nwn4kuNC1JZASAD+lfqT8CPizDqNvHZXEvzDAHJNfkUyliHHBHvXqPw88eXfh/UozuwAcda/MfELgWjxPhJcsfeR/PHjj4O4PxEyupS9mudJ20P3Yt7mO8gDxnIIz1r5/+MXgK31axmnijywU/nVf4NfE6112wiilk5x619CXlrFqFkYX5DDr2xX8UxhiuCs25WmrM/yB+q5l4M8VKnUg4xjL8Ln4i+JNNu/DuqsGyrIeM+lfWHwL+KDwtFZ3MpI4UgnNWPjz8M/JlkvoIuOelfH2lahcaBqilSVAPPNf1bTWE4/yVJu80vxP9JoUss8aeFVCaTny/c7H7f6Fqkeq2kdxG2cjNbgXJzXyV8EPiSNSsY7e7kIKgY5r6ttblbmJZI+45xX8c8V5BWyPFzoVI2Vz/JDxQ4ExXBWbVsHiKdopuxZYZwPWmbRUnBGOKAAFya+VjK5+WtEGzC8HrTMkCp8gdajIDA+tbRmSMwGPpULL1XrVjA603IxjHWt4yJK2DnOaaQenYVMcAFRTMH7w/StlIT1AYxuHGaZt745708AdDSgelaRkQQkZ6dajZWPAqzgilHNbxkIqJvDFW4qCQkgovQGrmwg7z370RoCcNx9K6qU7aocZWdzxD4o+CoNb0+Ty0y2D29q/Lr4reBpNEv3dUx/L/PFftRc2nmIyMNytwQa+Bf2x/C134f8Ag94p8eaRAZZtH024vFXB+9Gvy9PQ4r958L/EF5HVVLGztBH9kfRo8Zp8M5jRyTMan7uTste9rI/m2/bK+M62sP8Awq7QZP3rc3jqeg4IT6/0r81zzzWlrOr6jr+qT6zqsrS3Fw5d2Y5JJrMr5njLinEcX5nVzbFvTaK7RWy/V+Z/cGe51Wz3Fyx2Jfkl2XRC9TmgnNJRXyp44UUUUAFFFFABRRRQAUUUUAFFFFABRRRQB//X/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigAoopSMUAfT37LPx1u/gr4+jkvHzo+olYrxDnCjPyyDHdf5V/QZp93BqllDqNlIJYbiNZY3VuGRhlSD7iv5Vc1+sf7B37R3mBfg14uuD5g506VzwQMkxEk/981+oeHvFH1Gr/Y2Ml7kn7r7Pt8/zP1Tw74peBqf2JjJe5N+75Pt8/wAz9UCPmJxj1quVySTxVyMZG7ofTvVcjHHQ1+8RlfY/e4TT1KobC5NNYAsSKseVjg4JNRMqrx2rRHQncplcgjHtUw2lcGnMGzwcDvTChxwabZSdiuEycUgUfdNSqCT1xSjGdo70+lyuYrqPm24H4Vq2FhJO25Rz9KSytWmlCLzzX038PvhlJqECyLGSD2wf8K+b4gz2lk9L2leVj47izi7DcNUHXxk7I8CSxa2tzvGMj0rLt7MNcAdea+lfFvwr1DT7fcsRB9AK8x0TwLfvqqI8TAA4xivCwnFmCxNCpXp1loj5jBeIGW4/B1cXRxKstd0fQnwJ8CrqV3DctHnBB/Ov048K6THplhGg4wK8R+CPgZNO02KUpg7QenNfTMEeFUAYz+Vfwz4tcWvNsdOhTleKZ/kb9JPxJnxJmtXBUKl4RdiSJDgECpGIbFKo5yeKTbkZNfiMpH8iVZ83vMQYzj1qTHpio1AyKnwBz29KzbOdyGDHOeaUHoBTe9O4A4pbibDvkd6N3PJpue/6U/A6k9aBi8jmk2gcUmaXg9elWhIBj6U0+3anBACBRldv19DVItDOewxQdoBzQRkAjv2pMYPFaI0irsCVBFZl7c+WhJPNXiyoMmuXvXN3OY0PHtXq4Ohr7SWx9NlGDd1XmtEV7SB7ucySdq6OOIRLsHSks7dYYxxmrDIeoGcV1Yivze4tjszPH87VGnshTkJ9OlVJrhUUsDjg0+aRgmM9K878Z+J4NGs5Hd9uB6105Rl1TMa0KFKN22acNZDWz/G0sFh43bZwvxY+IEehafKnmYbb696/IL4r/ECbWtRlYOW5IBzXsPx1+Kk2qXs1uknBJXAPNfFWo38l1OZJjkE5r/QDwe8O6eSYaGLxMPeep/tZ9GLwRo8JYGlmWMpe/JX2KNxO9xKZHYmqjMc5H0p0hyd3600jv/niv6LjBQXKj+46MI0oqEVohM4WowcGnk7ulNGCPlrQ6V3AkE5pw9aTHY/pTjyM5oLDOOKDk0hx1xQOKaHcXrR0oBB5paA8wJxS5pM4pSaoY/jHvSA9c0nbHrRmmMcB36UHpg9qZxnBpQKq/QQ8c07mmZ/SgE8VQD+lIAe9KKKpAxPcUZOcCkwPvGkz6/WruQKAMYoG4cUd8rSkZNUmAhHNKaBjrSnrzVXFYOlJkmlOKQccCrTJaAjvSYpT60dOK0EMxSDr0p3TkUdqpPoRYaR7YpMY4FPI54oODVp2JaGBfenEMmHTtzS7TnFNOTzVpp6MicFJOMke7/Cz4lXOhXse6Qrj3x3r9WPhj8RbTxPpUe+T5iB9D+FfhbFJJbSebH2Oa+pfg18WZtCvYoppSq5HBNfhHij4cUs6oSx2Ej76P40+kd4C4bjbBTzTAU7Vo3eh+qfjbwzb+IdKeNlDZU4r8tvix4Hk0PU5GCnqeccV+mvgXxpYeJ9NUBwdwHAxXm/xp+HMOq2MlzDHuJBPHNfh/APEWI4UzB5Xj9Fex/GfglxvjvDXPJcKZ/eMHK2p8D/DDxnNomoxhpCoQgYJ4r9TPh14ug8QWEbb8nHrivx41vSrrw9qbKwIAOK+rfgZ8SGsLiG2uJCAMDk1+meJ/CdLiDBf2tgl7yVz92+kb4WYbjjJnxJlEU5pX0R+kwkG3nJNTKfwrn9F1VNWtUljIIYZrejNfxxiqEsLUlTqKzR/knmmAqZbiKmFrxs4uxEuScZxmlVfXrUvQcDrTdwrGM+55liFwRxTW9BwacxG7Oc0oXLfL9K6IzIt1ISqnOBTAoU/L+tWSMjNRbfSt4yJa7kHQYIpwGRzxT8BhnPP50Y2AYrRSE/IZtBGeuKaSpOT+PrU21T0puMD61vGRDXUYx7Covm6+tSyjABH+f1p/lgQ7z1PeuiDJt3KxJxxx2rA8S+H9N8SaLeeHddiE9nfQvBPEwBV45BtZT7EVvBUDZY5FLNEHX5fwrqo1nTldG+FxM8JVhXoytKLumfwr/t4/stat+yf+0DqfgN0LaRdk3mlz9Ve2kJIXP8AeQ/Kf/r18X1/aR/wU+/ZGT9pn9ny61PQoFPiXwur3unsB88qAZlgz6MvIHqBX8Xk0U1vM0E6lJEJVlYYII4II7EV9FQqqrBSR/px4Qcew49yGli6sr4ilaFRea2l6SWvrciooorY/VAooooAKKKKACiiigAooooAKKKKACiiigD/0P8AP/ooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACr+malfaPqEOq6ZK0NxbuJI3Q4KspyCKoUU03F3Q4ycWpReqP6FP2Vvj1ZfGrwBFNeuq61p4EV7HkZYjG2QL1w386+o8qh6Zr+Zz4PfFbX/hB42tvF2iMSEIWeEk7ZYifmVv89a/on+HHxB8OfE3wjZeMPDcwlt7tc4zyjDhlbnhge1f0PwHxTHOcOsDipfvoL713/zP6I4D4pWdUFgsVL99D/yZd/8AM7ZFIByPyqvJySeg/wAauMGK7u561CRuGcV+h9T9ITa3KpHzZPNBODUhGD8+SKULn6mq2NU9LkAQ5HT8OKRIyJScVPEoc+1bWkWLzSLtGSe1c9fERoQlUn0OTGYuOGpSq1Hojs/AHhOXWNSRVTIJGcD1r9VPhB8PI7TTYpJk5wB+Ar5v/Z++HizNHeSLwCK/RTS7JLO1RFA4A7V/FfjVx/KrVeX4aex/lv8ASt8ZqlWtLIcvqWtpozitc8BadqsYieMdO9eZw/Bu0gvhMqABW9K+lAuRlhSlB91sY+lfz5huMsfhYSpRqPXzP4py7xYzrLqU8NTrvlfmYuhaXFp1qkEYwBjgV0Oz5fTPT/8AVTVGBg96M549q+TxmLni6jrVHqz80zPM6uZV54nESu2xqBqcUwKkABGCetNAriueXzCj7uQKecYyKYTgDJowMgmpvYm4vGadweTzTQOh9aXPy460XJuLx3pCMg96ac55pwwOfWmNBgHNKeVI9aQgDGPen8Z5qigA2gU3bnoalTB6GgAZJ71aLRENp4prsF57UNnGUNU7i68uPGc5rqoUvaNHo4DDvEVErGdqFztzCrZPI496i0+03HzH6k1BDG9xNvx+NdBAqqOetexUmqUEoo+oxNeOEpeypjiMHFOBIpCSBmqd5eraQeY3Qda5KMJV5KKR4NCjPG1FTpq7ZleINYgsrZ3kbGPevz7/AGgfiumJreKUDr3r2z40/EmDTLSWGNwDyAM+tfkh8R/GM+tX7ln3ZJyPrX9aeCfhx9ZnDMsXT21P9KvomeBjx9SlnuZ0dtdThvFOty6peySk5ySa5KQln354xT3k3OS9MYjPNf3DhMNDC040qS0SP9bsrwNPL6MMNQjZIg7HtUm0Alh3/lTegOf0pg9Grrbvc9i/MHTimBvXkU58Y55pnTqao1XccpAHNLzUY46Uvf6VRpcCT2pR0GKOnQ5HtR0oDzHdOMUgNNzg4FPBoGLjtR9aaad7HrTTGhR6UUClOe9UAZ55pSCKQHHNOx6VSGA45o6nNICRSjPSmmF7kgpO+aTr70cE1QDvrSbRmjrRnmrTEABzzSE88Ggk96UgVSEApcim9+aORVCF3d+1A9aOc0hGMmqTEx1B+lIcd+1NHI4qrkscQfWmgAU/60mDV3E0J+tGMdKXryO9N69eKpO4mAHcUmM8jijdzjNHP4VpEh+YxsdKt6XLLDdDyiarKm5tv4V618P/AAJe+IbxFSMkMRgYrzc4x1DA4edXFuyPl+Kc3wmT4GrisxklFLqfWv7O2sa1c3MUAZvL4r9DU0xdQ0wpdLnIxXi/wc+F0Og6dHLImGwDX0Yn7tNiDgfrX+ffiNxDh8Xm0qmW6WZ/hv8ASF48wOacSzxXD6tyy3Xkz83Pj38PBZzyT26HnJBH418jeHtVn0jUVYfKVNfsX8RvCUGt6Y+EBODX5S/EvwlNouruduNh5z7V+++FfFdLPsC8qxbu7WP7T+jj4m4fjbJf9X8yleaVtT9Bfgj8Q01KwitJHBOAOTzX1DazLKgkj6NX44fC7xnJo2pxbXwoIBya/U/wL4ni1rT4mR8nHNfjvivwY8nxUsXQj7sj+TPpO+EM+GMwnnWAh+7qXei2PRCQTk9qRgFA209SqjI5NKz7VINfiG2jP4tlFxfKyswzz2pyYI296kxkADvSBApyKuEtTJ6Eci560wck5qRiWbb2NJg4wa6YyIZEFGBmk29lOKeEyfegAda3jLoBFt/iNDKAM9KlI7jj6VGwwdp49a2iyXoRqC3HWmOx+56dqmPHbioyO2M9q6IyIYx41BGOKWWMMcg0514xTEU52k+9bRkSQuhdDG6h16FW6H1BHoa/js/4K1/sjXH7PXx9m8e+GbUp4Y8XM11Ayj5Ibk8zRHsM/eA9D7V/Y0kORycfzr5Z/bJ/Zq0f9qT4Dax8LdQUC8ki+0abMRkxXcQJibPXBPB9q9TA4n2cuV7M/YvBfj+XA2fUquIl/s9a0Ki8m9Jf9uvX0uj+Ceit/wAU+GNb8F+JL7wl4lt2tdQ02d7a4hcYZJI2KsD+IrAr3z/TGE41IqpB3T1QUUUUFBRRRQAUUUUAFFFFABRRRQAUUUUAf//R/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAHMQTxwK+tf2UP2jL34J+MBp2sSM/h/UnC3cfXy26LKo9R39RXyRRXXgcbVy6vDGYWVpRdzswGPrZbXhjcJK0ou5/VNpWo2OsWEWpaVIJbe4RZI3UghlYZBBHFX8c9QK/GD9jD9qaXwLfw/DPxxOP7KnfFrcSc+Q5/gJ67G7elfs1FLFcoHhYEYBUgjB9wfSv6c4Z4jo8Q4VYinpNaSXZ/wCXY/pvhniOjxDhVXpaSXxLs/8ALzHMA2c8VHwRVjBHBA5pVTGNtfRN9T6fmK9tBmQLzXt/w08Jvq2pRgpn5h055rzfQ9Ia7ulRRnJHAr9AfgB8PRIkM7IRxnI6/WvyzxJ4ohkuAqSU7Ox+D+NnHlHhbJ69T2lnY+m/hX4SXSNOjG3BA5r21FIHXkdBWdplolnbiOPjFaqgg81/nJxLms81xc8RUd7s/wANePeJq3EeZ1sZWle7YobIxSDGfpTyTu5pMZx7181zdT4OUh47Zo2EdKYuMbhyKeMipM72G7T0Y07pxSdOacRQIUMAOaXjGDxTeOtLn2qdiWx5IJx70ZzSe56Gl4PSgdwHpR2A6ULyPTvSDHSqWoIMj65qTHYVHtGM9acOMYq0UtR4BVsL7c033z9ab14FN6c5q4ps3pQcnYa7bVLH6Vzlx5lzJt7VqXs7fdFNtISRvxgnnHpXq0LU46n1GCgsLT5mPtojDEABzirbZQ5oAUMAelRynH1rOcnVloefia31mpcdLJtQkmvH/iP43g0Wwl3MMhT+FdZ4r1+LS7F5ZGwQD1r8zfjv8UzeSSWqOc5IwPT1r9b8NeBq3EOMpylH3bn9KeAHhFiONc0oVJ0/cTR4t8ZviNNq91Im84ORgV8q3M0t5OZZDkEdK0de1WXUb15HbI9c1jZY4Ff6P8NZJSyTCU8NTjayP90OA+EsPwpl1HA4eFrJERwAVOAagYDOfSrTY9cmq2O6mvpV1Z+hRZFkAdelM5PPXNSkqxx3qCUrtxV3OhMQjqTzQQF96c2EXGahGe1UjSLFxjpSDrzTxxgnpSA85IrTY1DoOaYOKf8AWkY5ajzGJ9aeB3pvH0pRjvTuNDiOcUo4GaaCe/FO6e9Ax+Pl4oxxSZoqrlCg+lKB600HNFUId7UvbjpSDnvSZ9KBseeeKXn60UoJ9KtDG8ilwcYo5PNLkf8A1qtEi+9GKTqc0cVQDc8daOB17Uo457UpHSgkORzS/Sm4yetGKtMAGO1LweRSikPHNMQDPfmkz3FHanVaENC/pQSBxTh0o71SFYi/ipO+KlyO1Nx6CtEZtGjoqxNeKJfu5ya/Tr9nr/hH3hiBjUOcDkc/h1r8skcxvvXqPSvoz4R+P5NJvoV37QCB6d6/N/Enh+rnOAn9Xm00mfz94+cFYrivIqtPAVXGST0R+1emLEsS+R909MdKvDCghu/pXl/w48Wwa3pkb+ZliOa9MyhOW+n41/nbnmX1cvxlSjX3TP8ABTjjI8VkObV8Fj1qm9yC7gE8Rjbo3rXxj8e/hyt3FJcQR/Nz0FfaoBY7QOPSuN8Y6Kmpae6sMkg8V9JwLxJUyPH05xlZXPuPBjjyvwbnVCtTnaLaufihPHc6Lq3l/dKt0Pt+VfbnwK+I2DFaXEnAOOTXh/xh8FNpWqSTLHwCa8w8F69JouqRvuKgMO+K/svNsDhuNMmdRK7UT/WHibJcF4s8LuduaTj662P200u+W9t1mU9Rmrxy4xjrXiHwj8ZJrekRF2BOBivboscEHqM1/Dmf5XPKsVUw81azP8Z+PuF63Cua18urxsk2SBdw3D6UzqM9aeNwXI70oHJQ/wCf1rxFI+EkiAKDyaCoIxipmUBtvFQsuPl963jIzaGkHGG5pApGe9PQZO00oVc5x7VtGYmiLBPP8qjC7uO1WCM1CM54NdEJCYmMHnoaawUH5elSbedv6UgXIIrZSIauRlQD60EjJIH/ANapMcnHSkaMhc9M9a3jIkr5y2T3o2NkFRzxxTtmDk9DUpQHj863jK2wXs00fy0/8Fr/ANkk+DfG1t+0z4Ptdun67ILbVQgwI7oD5JCAP+WgBye5FfgfX+gz8fPgt4b+Pvwh1z4T+Kow9vq1u0aNjJjlxlHHoVbnNfwX/F34X+Jvgx8Sta+F/i+IxX+i3UltJxw2w4DL6qw5Br6bBYj20OV7o/0Q+j1x8uKMk/sHGzviMKktd3T+y/l8L+R5tRTmUqxU9qbXaf0IFFFFABRRRQAUUUUAFFFFABRRRQB//9L/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAFUlTletfqz+xh+1UJpLX4U/EKb5/uWN3I3Uf883J7+h/CvymyakgmmglWaBijodysDggjuDXr5JnOIyLExxuEfqujXY9fJM6xGRYmONwj9V0a7M/qyiMZUAknI/D86u21tulwpGTX5o/saftXDxhbwfC/wCIE6rqkKhLS4kY/v1A4Vv9tQPxr9UvDWlHUrlI0Gdxx7Gv6LwHE2FzPA/X6M7aarqn2P6Fw3FeEx+A/tGjO2mq7M9f+EXhCfVtRjAjzyK/Ub4deH4tI0qNUTacc4r55+BHgL7LapdypnPI9vevsnT7OO0gVFxX8TeM/GTx+KngqE7pH+Uv0p/FJ5zjquTYSreMWXlGSFwOKmB2fL0pm3nOPpznpU4UDr09q/mycnJ3Z/BtWq5u7GKcdqUDt60uCOG+lKB3rMwvcYv3dvr29Kf04xSEn6U7PPAo2E2JjjpSHPcdacR27U75aNtQv2GEY5/lTscdKdjrSMewoC4uMnJoA70i9acMjincQmAOgpQSeTSZ/OlXHUdqZQrcjrSDjr70Agnk8U9cDqatI0iNU556ZqvPMUjOBT3yOe1ZzS+a2AcjOK66UdmezgqSSVSQxVaaXLfXNaK7UjxTUiVFB7mpTgkDGDW0paWN8TiLrlQcA7j3rJ1O/jt7d5HPIBq7dTCGIs2BivAviz8QIdF06XEgDYPFfR8N5HWznFU6FKF7s+u4C4PxXFWY0cHhqd7s8T+OvxQFvDJawSYOCOOtflx4y8RT6rfvKzZBJzXffE/xtc6xeyFXyCTxXg885mG1v/11/o54acEUeHcHG8PeaP8AdHwH8J8NwNllKXJ77S6GfKf3hHXHWmkqBgGrXB61AwGNxr9gT6H9Mwl0KwODmmsvOAafwTjFI23IHTNM6IvsV2xnjGarkHOTzVg43c+lRkkg5qzoi7kZYsCPT86aVyuU6+9KQAMHk0mSFAHSrRshONnPWmggHHWlKetKBwBWiNE+4mQeRScE04dgKCcHA6U0Uho6+lOI5/woB4zTc0ehQ8EdDSnOcCkI+bilwfWmMfRjtTe9OBHeqKTCjqaQjvS4Oaa0AXmijmjNMZJ7005AzSU4VW4Dsk8U04707pTRVAxep5o6nFKBjrSnHeqQWEyBSA9jzS4zxSZNNMliYI6dqdgd6YOtPpruITpS8mkyDSLVJ9AHnmkxigilxzWiYmrgMdqAR0oAwKOlUhMTHNHsaWgVrEkhxjitfRLuWyvQ6nAJrM25pgyuGxUVqUa9OVKS0Zw43CxxVGdCotGj9MP2eviIQsVpNJ0IHJr9BdLuo7u2WZOcgdDX4b/CvxdLpGpRtI5wCOP0r9b/AIWeLItb0mLa3OODmv4l8auDHg68sfQhuf5AfS+8J3lmKln+DpaNu9j2f7xxnpUVzCrqRjOafC46VJGC1fzbCboTVt0f560qksLWVSO6Z8i/HHwEl7FJcwxkkd8V+butWEmmagyOuNp57dK/bDxVocWrWbwMoJINfmH8ZPBUunahJJtxg+lf1v4OcXrE0ll+Il0P9RvoqeJ6zPDLIMbU1SsrnWfAfx99iu4raRztJwRmv0g0bUo9Qs45V5OBz9a/EbwzqD6XqCyxsQQ30r9Pvgn41GpafGkjZ6ZBP1ry/GLhBX/tTCx3Pm/pZ+FSrQ/1my6n5vQ+mTgJx09KQnByOaZFIswWT1HQVOAMbfav5cl+7fKz/NCtB05OnJaohYBuVqPBzlqsMdowORTGHWtYy6GDK2M8VLgAdacMEcnOacFHUfSt4SEysdpOKadpxUhIBpCBg5610QkQyPouaY4ZgePrUy4Kn16cUIuQdx6CtoyuR6ldg2cL1rK0vxBoupahPokFwn2y3A3xZG8D1x6VslT0J61+KH/BRL4g/En9lH4veF/2nfAzvJpXmraatbDJV4nwATj/ADkivQw1F13yxep9Zwdwz/rdj1klGoo1Zp8l9pSSuo/9vWsvM/amZWHDHqacY2V1Cng9f/1V5Z8Hvi34R+Onw40v4leC51uLTU4FlXac7WP3lPuDxXqoyFGTTalB8ktz53H4CtltepgsZBxnBtNPdNbkGxh8y1/PP/wW4/ZHOqaLZ/tS+DrbM1jttNZVF+9GxxHNwP4TwT6Gv6IHUNwnT865X4geC9E+Ivg7UvA/ieJbjT9Ut5LaeNgDlJFKk4PcdRXZg8Q6E+Y+u8OOM63Ame4XPKPwp2mv5oPSS+7VeaR/nQkYpK+hv2pPgR4i/Zv+N+ufCfxJGymwmLW0hH+ttpOYnHqCv6ivnmvqk7q6P9UMFjKOYYelj8HLmhNKSa6pq6CilpDTOoKKKKACiiigAooooAKKKKAP/9P/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiloAtWF5dafeRX1jI0U0LB0dTgqy8gg1/Uz/wTQ8aXP7SPw1ivrtC+p6NMtpenqW+XKyf8CFfyuDrxX9nf/BEv9mzWPhN+zHJ8QvF0LW954vujewRONrLbIoSMn/e615uccU1OFsFVxVKdubS3f/hj888UvEF+HfD2IzOnUtObUYxv8Tf+SP1x8IeHv7G0+K3jHAUZ7c12oYgigKFxt+7x+VOwScnmv5YzXM6mZ154mtuz/KviDPa+eYupj8W7yk7jgAOD+VKq5GenvTeeM0qjGAeK8ps+ebuKrAdKcfemAbcjrSr60AKox3pVUjANNyBxTxxwaVuxIDjk0EA9BTTnFHJHpQu4XHA5Apx20w8Uv8NMQAZ5HQelOG6m5yee9CgAYJ/KnYaHHpk0o24NNHX607/dplC8YJApQeMt1FN/ClJIHpVxXQuC5nYbIgZeearJEB81WCpY0u3Zz610Ruj0adTlVkMbGPamORGCT+HNKzL1Hb1rnfEOrppto0shwQDXfgsJPF1I0aau2eplmX1c1xFPC0Y3bZyvjnxTFo9jJJM+CAe9flf8afiVc6pqEqRyfKMivcPjv8Ut3m2kT+vQ1+dniHWH1G7aRm+Uk1/cPgp4dwwVKOZYqnqz/W76KvgjTyjDQz3M6V5NJq5g3s8lw5eRtx+veshkweuauO3m/NUEjdSK/q6jFU4qEUf6LYaCpwUIqxXdQCTVXljuI4FW+cc5qBuGDHpW8TvgQOeNo4qvznoD9KsuMjOarkDrzitVpqdMHYiI6jr600IOMHvxUxJ24qI4ACYNUmaogYbjgGlxtXBFSZVfu9qTBxnOTVo6UyF1IIPWkJHepApbk1G/ByuMVaKTBeR9O5phGKCR93FKAfwp+hd7CYOOtJknmgg5H9aCPSmO49cdKM7jxTBTvamWncCKkqPvgGn4qkhjvrTuKb1FOyaoaYfWgYzSE0Ux3FxRSZp2efWmFxwBAzTc0YJOKfwPxqgeogBIoPtSDmgHnmmIdk96OFNBPPNB96fmMXORSY7UvOetLzVCEIyaSm9fwp455piEJ7dacvSmFcHmne9UgFHAzSgUUmOKtCYtJ1oxSY71omSx2SOaYcgUpznBpRyMitYu5LLmlXrWd0u045FfoZ+zz4+x5EEj47YPpX5wkbHDD617X8M/FL6ZfxFXxg561+d+IXD8c5wFSPLd2PwXxx4Gp8XZLXoOF3Zn7n6bdJe2yyqeo9auRqS2/oDXjXwj8XprmkwndzgA17OmP4ehr/ObiLLZ5XjKlCcbWZ/glxzw1V4azTEYGtCyTYs0SPkg+xr5m+M3gOPULOS4jXn6V9LsAJD7dhWH4k0yPU9PkR13HHSu/hHOqmT42nVhKyPY8LuMK3COc4fFUZWV1c/E7xXpEmiaq6MuMNXvHwO8bNYXkduzED3NaHxv8Fixu3kCnAyTxxXzr4Z1I6RqaSHsfSv7gjKjxdkNpO7sf7DRlhvE7hD3/eco/oftZ4c1U6lpccqnIIGcc10mTtx34r5w+CXi5NS0+OFnHAHWvpGNtybzX8PcV5TLKcbUoyjbU/xx8VOFKnC+dYjCThZJsf0yDTCozzVkZBphBGa+Zi7H5Z5lcrjmgpg5FShc9aaVOOOtdEJXJuVnUk4qLA+73NW2jVRtFMGB1+ldMZEMqOhAIA6U5eQRVhyACB0pqEAbBxnPFdEZEdSuQSMD0NfM37WPwL0j9oL4H698O76MPJd2zmA91lUZQgn3xX1DICq8/wD6vwqvjJ4GVPbrXdhqzpyUkz0cpzKtk+MoZpg5WnTkpJ+adz+Uv/gl5+1L4i/Ze+O9/wDss/FuY2+lX141tGJ2IFvdhtoxnor+nrX9WMyptDxnejAEMOcg8g1/Kz/wWf8A2Z7n4ZfFPTv2ivB0bQWmsOkdw0Q2iO6i5V8joWx1r9l/+Ca37Vlp+1P+zxaXmr3Ct4i8PhbPUY/4jtACSfRwPzr3cfSVWMcXD5n9GeMWQYfinJ8D4s5HDSslGul9me1/vTT+T6n6JKoVuMinYYvkcCo1HzHjHv047VPuVlCjkV4ynY/l5q1rH4W/8Fr/ANlA/EP4W2f7QXhC03at4WBS/CLlpbFz1J7+UeR7Zr+UM8nNf6OHifw7o/irQbzw94giFxY3sLwzxMNwdHBUgg5zwa/gw/bH/Z61X9mP9oPxB8KrxGFpBMZ9Pkb/AJaWkvzRMD9OPwr6jLMQqtPk6o/vT6NHHqzjLavB+On+9w/vQvu4Pdf9ut/c/I+XKKkMbVHXp7H9RhRRRQAUUUUAFFFFABRRRQB//9T/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACnAd6bXUeC/BviX4g+K9P8E+ELSS+1PVJ0traCIFneSQ4AAHuaUpKCcpOyRFSpGjGVWq7RWrb2SXVn6F/wDBLn9i+6/a9/aHs7fXYH/4RXw4VvtWl2ko6owKW+emZcY+lf3P6fZ6fpVlb6Ro8KWtlZxJDBDGAqxxoMAAYwABXxl+wB+yJpH7GX7Oun/D0qsuv3+L3WZ1IJa6cfcBH8MY4FfbnJbcec/1r+buOeI3nOMdOi/3UNI+fn8z/L/x38TJce57Ojgp/wCyULxp9pfzT/7ee3kkKG49j2p6gYyTSBRw1CkYyetfBvXU/CXK4oHc96QDjjtSdvmNOIzzipJHAc+lL/DTRTiuMmgA4xikx3zSkHk0n60xC4x0pRxx2puP1p44NACfrS55pKOoxVbgIOCc09eBmk6n0owO5plX6CjBP4UhwOD2o4PJ605uARTSKGEk0q8E5pMLnHQU8AGtYrqaQYme4FHXNNcH1/8A11DczCCNmJHAzW9ODm1FdTtoUpVpxpw3ZDfXaW0JlYhcD/PrXyV8a/iTHp1pJbQyKBg5wa9U+JPjCPSbCQO4HB4FflN8W/HsusXsyIxK89a/o/we8PpZviIY3EQ0R/dv0YvBSfEeMpZpjqXuxfU848deLZdXvHcvkZP415TL+8bd61ZmlWaUtJznn2quygNgV/fmV5bSy6jGhRjayP8AY7IMloZLhaeEw0bJIpkAAqPeo2CEY/U1O+7JPT2qBixwB1Neva59NArzEH5RUTZ2571M2OT+FRkDkH6VSVjoh5Fcop4FROOijuOakfk+lQspzxVI6IDXDBCuOajYDjjpUu3dwDUEh3deMCrXY2TEBwOnSk+Vzz2p5xjHWmbMDJqkaxY4EBfWonUDgevSnHPAJ4pvCfKO9Wi0I2FIB4qIAA8dcVMVDfhUYVl5zVmt7DWRGPHOKTBHNGAc0cjPeqS6lIT2oB4oxjpSHk1Vh3H96UAHigDNKCCcUWuaADzzSjI703kHC0vtTQD6WmKB2p3eqsAvU80tJzRnsaYxRS54pOnWk4BqkIUU7rSdDSd+KqwB34pwxj0oAxRjsKEgFJx05p3y9KYePen4J5NUMb35NJg0/Oe9HIpiGEgmnLjtRnqaUZzVIB1FBPekxVLTUBRSEcU7pSZrREsapzxTgTTQOaX0q4skjb2rb0C8NteIUO31rG5ycU0MVIYVliKKxFOVOXU87McJHGUJ0ZLdH6Ufs++PvIkitnl4yK/QrTdSS/tI5FJOR+lfiB8MPFD6ZqELbsEEd+1frP8ACnxWurabGofJIGK/ibxn4NeFqzxtCJ/kN9LbwoeAxNTO8HS31Z7hHkr8w9qR40KEN6dBUQDGQEHg1a2FlI/Ov5lhUdOoujR/nYpSoVNN4s+avjT4GXUbCW4VcnB5xX5leIdHl0jUnjkHKtmv2m8UaOt9YPE65yK/NP4x+Dn0/UHl2YznPHvX9WeDvFTqUv7Przuj/TH6J/iS8Th1kONq3tpYvfBLxpJpdzCDJtVuCCcelfpLoGpJfWUcg5yor8PLfxLb+FZPOuW2qvXJx+NfoX+yL+0N8P8A4zWWoaH4X1WG81DRkX7TArfOq9NxHpnivO8bOH6NJLMKL1Z5P0vOAKMKP+seBV++nc+2FzuzjikwCTntQkozhehqRuRnFfzGny6H+bFSPI7MgwN3vTSABkdancAqSvNJ6Y/SuiEjMrspJw1MZAMtnk1O69WNNKkd66YyIZX8vJJ6VGVP3jwRVt1DDNQuN3Dc10Qlci9iBy2OTxUWzC8VZMQK4NNETD5V4xXTGYj5b/ay+AmkftGfAvXPhvqKDzbmBmtmxykyjchHvuFfyffsI/tAeI/2HP2tW0XxkZLfTZ7l9J1iA/KAN+wSYP8Acbn6V/bHIucKT1r+UX/gtd+zF/wgHxUsP2g/DMPlaf4kxBd7FwEuol4bjgb1H4kV9LlNf2vNhp7M/qH6P3EWHzRY7w0z7Whi4vlT6Stql2bWq80j+qu2ubfVNNg1OwkEkNxGskbqQQyOoII9qtQsIyFxnPFfkb/wR/8A2tYvjr8AR8K/FNw0viPwcqwEu2Wmsz/qm55O3oa/XReu4cZGa8zE0nhqjpyPwbjThjEcH5vicgxys6cmk+66NeTVmDLkeXX4kf8ABaX9llPid8Frf47eHLYvrPg8bbnyxlnsZDli3f8Adtgj0Ga/btR847n0rJ8SeH9K8VaDe+GtZiWez1CCS2njcAho5VKsCD7Gt8FiPYVE0a8BcWVuDM7wmfYZ/BL3l3i9JL5q5/nDcjj1pD15r6T/AGuPgRqn7OHx/wDEPwtv42SC0uWks3b/AJaWshJicfUfyr5rr7GLUkpI/wBXMBjaOZYajmGEleFSKkn5NXQUUUUzrCiiigAooooAKKKKAP/V/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKMUAFFLjtSlSBQAKhbpX9ZH/BFT/gn+vw68Nwftc/FqzI1vU42Gg2sy829ueDckHo0nRfb61+Pn/BKz9iCf9r/49x3XimCQeDvDBS81WXGBIQ37uAHoS5HI9K/uRsoLTTrSHTNLiSC1tYlggijAASJBhVAHGAK/KPEbij6nT/sXBS9+XxW6Lt8z+Q/pNeKksow3+oWR1bVaqvVa3jB7Q8nLd+Vu5Ns5JPPU8VKT+tMRjjrSMQg4r8KsfwG9WSKTuxTiFDYOM14z8efjt8Pf2a/hdqHxW+JV0tvZWaN5cZYB5pAPljQdSSfSvHP2HP2l9S/ay+B0Xxi1W0WybULq4WKFedkMUrIufc7a71ldeeElmSj+7TSv5s9+nwtmNXKanFSotYaElDmfWTTdl30WvY+yOnFC88mhRjANKMdq8w+cF7jNL2ApMDPtQuAKBi96Mc+9IMHindsVQgx0NOwOhpDikJOOaYD8ZGQKTO0ZFIBkZoC8kCmA40w4zkCnAUh6Ypoa0FBC89MClHJppA3evtSnHRapItCgAc9KaxYHg/pTlJ25prBSck9a2jE0S1sSO4VdxOD6VwfizxDb6Xbu8rAYU963NZ1JbGBmLgYGa+Kfjn8TI4IpLaGT1yAa/RuAuE6ufY2lBQurn734M+HGJ4wzWhCNNuNzxj46fE17+4ltoX+Xkda+FtZ1F76ZpT05rqvF/iN9Uu3kLZznrXAzMsjFieozX+jfBHDFLIcHTowhZ2P9x/CrgLD8G5bRw1OnaVimdxPHSnMQF4/KlIOd3pUbMe1foKP2KK1uV2yrbutQNxjtirDHcx9qrlscVojqiV3HzZHT+lMKkc1OV7g00gPyKtG8GUiB379KYw+YdcVZcqH+bjNRbl9feqsbpkBAJB7e3+cVCwIIPc81OQp/KmMV9aZrFkQz35NR7TnGamcZPzDFNA2/LVI0TsREbRxTM7lz71KASvFRooUFiNtX6mifUM/JkfSmBcDmkXIyNtL0J71aLTGsu3PrTCABk8Z61IOflX+dKQzA8VSZafUhxzkHilAPU0m0EbjRnBqrmiYop3TtTOScilzjmmtB3JAQee1Mzk5NNHqRT2FUO9x/POe1O46etQZxUgJprzGmScdqTPejHejOOasYoNHek5PIp2aYXAdM0Z/Wm55p2adgTuOBOcCkYc8ULjvTl6461QxAOOaQZp1LnPIoAbninZpNoP40/NNAKQOlNOBS/jR9KpDYgp1JS1SEObg8U3JpxzTevWrBiA44NGMUuOaTrVJ9CGrCD0qNgCMn1p/OP8imsDnFWRLY19Gvms7xWDd6/Q/4AePRE0VrM+7HTnFfmxGxRtzdq9x+FviiTTL6MhgOQMdO9fm/iLw7DOcBUTV3Y/n/AMceA6XFWTV4ct2kfuPo94l9bpKp3blHX1rbXEOGb8ia8B+EHjJNU0mNZX3MvGM175Gzyxhsf596/wA6+JspqZTjKlCqrWZ/g74icMVuFs2r4OvCyTdhtxCJVZG5zxXzd8Y/h7/a2nyy26ZcDP5V9Onfs3AYx1rPutPjvIGt7ld8cilXU9wRyPxpcN8Q1ckxMMRRkZ8Aca4rg3MaWY4N7PU/jD/bV/aiudM8S3vw2+H90peMlLm4jIIQ90U+vrXz5+wT+1NrP7L37Tei/Eu6nZtLvJRZauh5ElpOwDk+6cMD7Vvf8FJv2cNU/Zw/ag1rR3RjpetOdS0+Q5wYpiSVz0JVsivgQV+s5lmtXiJfWMbLmUl9yP8ATKrj6HH2Uxr4yXtaOIp/K0lr81+DP9KG1uLHULOHUNNlW4tbiNZIZFIIeN1yrDHYg1Ko2kqTX5M/8Eb/ANpdvjl+ytD4F1+5Muu+BpfsD72y8lm43wP9FGU/Cv1qiBYfMME8/Svw/MMPLBYieHn0Z/llxpw7X4UznF5DilrTk16r7L+asyMp2B4pOeinHpUxGMkVCuSdw71jCp0PlN9iPaRkUKhHIGTUgXjrimkY5PauuMiWMIUVFgfnU8h2DOOaYyjbgda2hIzZWIPSn4ONwp5jGM03HY10RkQ3fQqyoxIYDd7/AOc18vftkfs+6b+0n+zzr3wwuUBuJYGntHIyVuIhuTHpkivqjyzt2rSoF2MrdCMe3Nd+GrulNTjuetk2a18kxtDNcDK1SlJST807n8Gn7JHx38U/sY/tQ6f4uvQ8Uen3bWGrW5JG+At5coIPdfvD6V/djoGs6J4m0Gy8S+H5Rc2GowpcW8qkEOkgypBHBr+R3/gs7+zEfhF8ek+LOhQCPSPF2ZHKjCrdKPnHHA3Dmv08/wCCKv7UA+J3wPuPgD4ku92seDiXtBIfmksZCSMZ6+WeMds19LmdFYqlHF091uf1x425LQ4/4Yy/xRyWPvRilUt/K9Hf/BK69Gft8FVSMc1HgHPvUqLkZPpUEgznuDXz9OV3Y/i+3vH8+n/Bc39m1te8D6L+0b4fgBuNHb7DqJUZZoJD+7djj+FuOfWv5ea/0T/i18NND+MHwx1z4aeIoxJa61aSWzAgfeYYUj6Hmv8AP3+Lvw41v4RfEzXPhr4ijMV3ot5LauCOoRjtb6MuCK+syvEe1pum90f6CfRp41/t3I6nDWLnerhXp5wlt9zuvmjziiiivUP6VCiiigAooooAKKKKAP/W/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAJFXvXY/DvwD4o+KXjfS/h74KtXvNV1i5S1tokBJZ5GAHToBnJPYVxYJBr+rD/ghv+wo/hXQv+GyfiZaYvr+N4fD0MgwY4jlZbkqRwW6IfTJrxc/zmlkWDnjqz1Wy7vofC+I3HOF8PsjxHEGN1klaEespvZenV9kj9f8A9jH9lbw1+x38BdL+EuihXv8AaLjV7oAbri7cfNz3VPur7V9YKgPWgkkknnPPrTgAelfyvjsZUzCvPF4l3lJts/yTzzOMVn+OxGc5nU5qtWTlJ+b/AMtl5Cj61m6xq2meHtHute1+4SzsLCJprieUgJHGgyzEnj/Grp2yNsT0/wA/Sv5e/wDgtH/wUdHiOaf9kL4J32bC1bGv30J/10yn/j2Rh/Av8WOpr1+GsgrcQYuOEpK0V8T7I+v8MvD3HeI+c0skwKtBa1J9IQ6v1eyXVn5/f8FOf27df/bS+OH/AAj3g5pE8I6JMbXSrYE4uH3bTOyjglz09q/rI/YQ+Cd1+z/+yh4P+G99xeRWi3NyM52yT/vGX143V/I//wAElv2XZ/2k/wBrDSn1GMnRfCxXVL5j0PlNmJOePmbt6Cv7opHJ9FwAMDsB0r7nxExNDLaGG4cwKtGCu/0v59fmfv30lMywHDWAynwr4dio0qK55pd7Wjfzd5Sb8xVzjNL2pFwacoxX5Cfx4IBSqv8AKjI6/lSCmAv0peBR70Y55oAX/P50vtQF/ClGOhNMBOBzinEUYHftSe1UA4478U0gck0uPWm8dP5VaQxeGyTTcYyexpwA5zxSYyMjmtVoXFMGK49/SoJ5FRN7HFK8igfN0rgvGfiGHSrBneTGAT1r18py+pmNenh6K3Z9VwvkdbPMbTwVCN7s8/8Aiz46h0yyljLkcH0r8pfih40k1W9lWJtwBP5V7P8AGv4kvqV1JBHJuByDzXx5qU7zyk7s55r+/vCDgKGT4Wni68PeZ/s99Gjweo8LZbQzHF0/faTMiaUyuCxyapMjZJq2692PWmNtIIXrX9EQioqyP7ToRUUlFFMsF6nOfSm4PTPWpZEOcCqpkZiM8YrVHcvMdKRjFVyoI3Z4qY453HmkK7yOeK0RvHQgZB145qE7QpU+tWWAByTx61FISenFWtDaJT4LHPWmEEgggY+lWCozg96Zhe3IqzZMgxx8o+tQ4y+41aKd8/hj9KhOemelM1iyuy4Yk9qMM2SOlPIGfm/Ko1GD16VVzVMbtxyTn6VHgBQTzU5HHFRsPkq07FpkJzjmmEEMB7VOw7mmj5RzVGqZW43c0/YENSbFyRjmmsACM1RomRAjqfzqP5QcnoRUoRS2WNR8I23GapFqQEZ4HWkyD92nYBABpoCqeOlUO4mcVIPY0wIP/wBVOx3qhp3HLkEUo55puc0/k9elUkVfoO9qCeM9ajJx0p2RmqXmO4p4HFLnFIMkUopoQ44pKT6UtO9ihxo6dOtIBScGqC46ng/jTBjGKBjOaBj8U7pwKYD82RTjwaoYvBpR70mO9KCD0oTHYKXFJ7GlNUgCjml70DB5NWiRnejvxT8YFM71a0JaIznPNBIzzT8HqOlNYY5FNa7EMhfkc1uaHeNaXCMp6Ed6xiBnmqV7qNhpNlJqGqTi3ihG5nY4VR6k1yY9QdGftnaNtbni5xTpzw044lpRtrc/SP4B/EGS0uY45jgZUc+9fplpFwbiBCAMMM1/Fh8X/wBvjWbBpfDPwenMYRiv2/HocZjU+3ev6Cv+CSX7ZOp/tR/Ay88P+PZY5PFXhOZYJyvDXFrKD5cxGeoOVJHcV/AfjBTwOLxE8TlUudRerW3y7n+O/wBLfgrC4j2vE+QWnGnJKbXZu1/NX3P1jZNi4PWo2AHOOKdtYsCOQakVWKMua/n3Z6H+fa916H42/wDBZr9lz/hdX7OA+Jvh2ATa14ILXQ2DLvaP/r1PqFwG9sV/G3g7s1/pQeINE0/xBot34d1ZBLa30MlvMjAEGORSrA59Qa/gH/bT+Aeo/s2/tJ+J/hbdxGK2trppbM4wGtpTvjI68AHH4V+m8I5l9ZovCVHrHb0P7k+jRxn/AGjl9fhLFzvOj70P8Leq+T1+Z9V/8EgP2i1+A/7X2laNrU5TRPGI/si7BPyCSQ/6PIf92TH51/a+42uynuePzr/NY06/vNLv4dS06Qw3FvIssTqSGR0OVYEdCCK/v2/Yj+Pln+01+y74U+LCtm+ktha6iuclby3+SXPpuxuHsa4+McCk4Y+K8n+h8v8ASj4PtUwnGeEh8X7up6rWLfqrr5I+rGXoMfhTWRc/IMcVMpLZ4wDSfL2PHevhoS1P476EDbT0pjK2Of51O20/jURUn73WuqEiW+hE3zD60bcA+9JhsHPFK4JwB/jXTGZEtCEjqPWmsCPu9+9TAAGkxycit4yJY0nKnJqpIqou7nBq5jcOv1qN0Z1JrphPoNOzPhb/AIKGfs32n7Sn7MmveE7aMNqljH9vsHxlhLAN2B/vAY/Gv4/v2OP2gdd/ZQ/aS0T4kJvjis7n7LqUJyC1s7bJlYcdOv4V/fCuNxUgEHhgemDwR+tfxQ/8FXf2b2/Z+/aq1K40uERaP4nU6nZlRhQZCfNQdsq386+vyTEKrCWFqH9gfRt4kpZthsw8OM496nUi5RT7NWnFfKzXoz+0jw/rWleJtEsPEugTLcWOp28dzbyrjDRyAMpBHsa232kk9R3r8O/+CKX7VU3xW+DF7+z94puN+s+DVElizHLy2Eh6Dj/liePoRX7iKwKBu+K8bGUHhasoM/nDj/hKvwXnmKyHEr4JPlfeL1i/mgSLeh2/TNfytf8ABdP9nU+E/ilov7QmhwbbLxJCLS+KDgXUA+UkjjLp+eK/qlUleT+NfF37f3wDH7RH7KHivwHbQCXUoLc6hp3Yi5tvmUDr94Ag11ZbifYVlfY+j8GOLnwhxRg8ZVlalUfs59uWWl36Oz+R/BtRVi6t57S4ktbpDHLExR1YYIZTggj1zVevsz/UFO+qCiiigAooooAKKKKAP//X/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigApRSUUAOXrzTkQuSF+tMBwc13fwy+HHi74uePdK+G/gW0e91XWLhLe3hQZJZzjJ9AByT6VM5xpxdSbskZ1q0MPTlXryUYxTbb2SW7Z93f8ABMj9h/VP2yvjzb2GsxtF4T0Ard6vccqGRT8sCnB+aQ/kM1/dPpelaboemW+h6DbJaWNnEsFvbxrhI40GFUD2H518w/sZ/sr+Ef2O/gVp/wAK/DyJJfuqz6rdYG6a7K4c5HO1TwK+rl4Qnmv5q414lef4txpP91C6j5+fzP8ALrxz8UKniJnTjgpNYSheNNd+835y6eVg4PXt/npSjP3Rye1MOc9K+dv2nf2lfAv7J/wV1b4x+OJl22amOyts4e6uiD5cajr15J7AV8ng8JVx1WGGw8byk7I/HsqyrE51i6OV5bTc6tRqMUt22fDv/BWL9vqx/ZK+Esnw38BXSt478TRNHEAQWsrZwQ0rdcMeig/Wv4mL2+vNRvJb++kaaedy8jscszMSSST1JNer/Hz44+Ov2i/ivq/xd+Ily1xqWrTGQgklYkydkSZ6Kg4FfTv/AATX/ZUuf2sf2pNF8HahG39haY41DVpcfKtvCd2wnGMyEbQK/pfI8ow/COXSlVeqV5P9P0R/qN4f8GZb4L8LVa2NkueMXUrz7tL4V5LaK6t36n9O/wDwRx/Zdf8AZ/8A2VLbxZ4jtvK17xsy6hOGHzpb4xAh7jK/N+NfrX3GRVW1t7Wyt47DT40gtrdViijQYCRqAFAHsMCrR+UbjX84Z1mc81xlXH1ftNv5H+aHGnE2I4vznGcR41+9Wk3bsuiXorIUDjmlxj2pg5HNPAxk15R8sKBgc0DHagUo5GaYCY7elONJ9KD6GgA56UDoM/lQAM5peOtUvMBQM8UnWncZyKY3T5jzVpBuID696UgHjrSDAbpnFLnA9TV2KsKen6Uwv8p7U8HjjjmqVy6opfPTvWtGDqSUYo6sNRdeapwW5Q1jUVs7dpm4AFfC3x0+JmxZLWGT1B5617z8YPHdvo9hKiyfNjjn86/Kv4ieK59XvpMvuyenU9a/qjwV4AljasMxxUNEf6LfRS8GnmdeGe5jS91bXOA1/V5b24klclua5eUs5Jq5M7u25vrVZnBbC1/c+Ew8MNThTprY/wBasuwUMHRp4ekrJKxVYKTk1EzMGIbkD1q2xIz0quwXdkc12xuetFlaTcMcdetRyrg4OKsSEg/JzxUMgMh3DjnpWi8jeLIWQKu7p+tQHk8cYqwwIJHWomznOeapaaHTCRExY8EfjUQLnO4DirDAH5j9aYRvGTVR8zRSKzDj6VCwKnpkVaIJAzx6VEx96tM0jIqMpLFT0prgg/TpVgjPBHHrUeMPu9q02N13ImTLADFRlcnk808KH5z0NMQ45I/CnE1TGDBBYdBURAzip2+9lemKbsKDniqLTIHCnjAppO35lGfapiAn3qjZUxn681ojRPoNbcOuB2pgXLc9KnKlThaiZeOOaa1LT7DSodc49sVD5W3k96kOB8vX6VGN27J6VSLi3shFjP3m5pjIBzTwDu5pSNrEelXc0vcg2ECng4GaeuAMgfWodxHJNUhp2HnsaXGTmlxknNG3JwKtKxYA9qfjNJtAPNOwKqwxOg9aM9u9IODmnA00gEzk8UoJOPemtk8DvThRYBeKdznHrSUpNUWOGegpuCT6UuMe+afz9aaQxuOKfjk0nXpR1NADh70dPxpBn60px3plXCjHHFNNO6U0Idz0FHTrQD600nJq7gKetIeRTc4ppbPXgVSkQ2IWHSmPIfvD9a5fxZ4w8MeCtKfWfE95HaW8QJy55bHYDqTX5z/GT9tvU9TSbQPhdH9mhIKteOPnIP8AcB6fWvkuJeNMt4XpuWPq3n0gtZP5dPVnxPFPHWV8KU3/AGhVvPpBayfy6erPtb4t/HzwD8JLJv7ZuPPvypMdpFgyE9t3PAr8mfjF+0N47+Ll00eoTfZdOB/d2sRIXA6Fz1Y14hqWo3+q3j3+qTPcTynLSOckn6ms+v5k4t8RMy4olKhzezo/yp7/AOJ9fTY/lfjDxIzPiuUqDl7Oh0gnv/ifX02D6198f8E3P2n5v2V/2pdB8Y307x6FqUg07VkB+Vrec7d7D/pkxDfga+BzwcUD1HFfnVajHEU5Uai0asflebZZQznBYjKcdG9OrFxfo1b/AIY/0sYplkiSe2cPFIqyRsvRo2GVI+oqxIXGW6V+T/8AwSH/AGqj+0X+y/D4N8RXHneJPAoSwuSzZkltTnyJMHkgKNpPqK/V1SSnPfrX4dmWGngMRPCzWz/A/wAquMeHMRwnm+KyHHR96nJq/ddGvJrUWWNiMd+lfzlf8F9f2fIrvQPDX7R2hWw8y2c6ZqUiZOVfBhZvoQR+Nf0dhgEwea+a/wBrv4LWf7QH7Nni/wCFc8Yknv7CV7TPJW4iG+Ij8RXXkOO+pYunVvpez9GfQeFXE8uEuJcDmjlaHMoz/wAMtH917/I/z1vav6Jf+CC/7SEmieO9f/Zn165C2uuxf2jpqyMP+PqHh0XPdkOeOuK/nq1bTLzRdTudH1FDHcWsrwyKeCHQ7WB+hFen/AP4s6z8C/jL4b+LegOUutAv4boY53IrfvF/4EhIr9czLBxzDDTw76rT16H+i3HPDVLjLIcZkU9faRfK+0lrF/el8j/RRhHynuBTimMufyrmvB/jDR/iH4R0rx/4ddX0/W7OC9hZDkBZkDY47gkg105YiQjNfi0ounNwluj/ACnxWGnhK1TC1o2lFtNea3GEDHPPak+Urg08ElfaoSPlK1pCRyMZghqcQDwO9LGMDJpBgCuqEiJDGGeTimEYBx1p7AEcCoyCeO9dMGSROm35h/8AqpRkAj8acybRzwTTdrbflJFdEGVa+pE22Ngx53c9e9fj3/wWW/Zx/wCFwfsyn4i6LD5ureDJDdKwHJtX4mX1PYiv2JcZTA/wrA8TeGtL8ZeG9R8Haym+01W3ktZlIHKyqR/M16mAxbw9WNRH1fBHE1XhLO8Fn2H09nJN+cdpL5ps/gn/AGL/ANonVP2XP2j/AA38XbF2+y2dwsN/GDgS2k3yTKw7jac49RX98Ol6ppuv6XZ+INElW4sNRgS6tpEOVeKVQ6sD6YIr/Pw/ab+D2p/Ab46+Jfhbq0RhOmXsixD1hc7oyD3G0iv6lv8Agi/+04fjT+zZJ8IvEE/ma74DZYEBOZJLCTPlN9EPy19NnWG9vTjiYdPyP62+klwnT4hyfBcf5Sub2aSk11pzs4v/ALdb/wDJvI/YtTkfKMUGGN/3bKDG/DD1B6+vamxHL+SP4cinGPB+bp0r5eFSzTufw6nKlNTjpY/hF/4KKfBFfgL+1x4s8H2kbR2F1cnULQngGK5/eHHsGJFfDdf0o/8ABfj4SRlvBXxus4wC/m6TcMo64/eIWI/EDNfzXmvvsJVValGaP9V/C7iH/WjhfLc2m7zcFGX+KHuv77X+YlFFFdJ9+FFFFABRRRQB/9D/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKPpQAU4DccdzSU5eDmgCRYyMv2U1/XZ/wAETv2FE+EvgFP2pviZZeX4j8QxMNIhlUbrayb/AJa7SMhpe3+z9a/Fn/glV+xDc/tf/HmK78TQuPCHhfbd6nJj5ZWBzHbgnjLkc+1f3GWVra6faRadp8S29vbxrHFEgwERRhVAAwAo4Ffk3iRxN9Vp/wBh4OXvS+Jrou3z3Z/Hv0nvFF5bhlwBk1S1Sok6zXSHSH/b278rLqTeZuBL9WzzSlj0IpQAHyDzjpSqryPsj5JOK/DrO+p/A/xMytc1vR/DGi3fibxPcpZadp8TT3NxIcIkagksT0r+F/8A4KXft0a5+2b8app9HleDwdohNto9pkgMoODcOP78n6Div0j/AOC1f/BQw+Ir+f8AZA+D94P7PsXB168gbieYci3Vh1RP4vU8dq/mxJzX754f8K/2dSWb42P7yXwrsu/q/wAj/Qr6NvhF/q5hI8cZ9T/2isv3cWtYQf2v8Uvwj6gAzHA5Jr+2f/gjZ+yg37PH7MaePfFFv5XiHxxsvJQ4xJFa4/dIT1G4fNj3r+Yv/gnD+y1f/tX/ALUeg+BZImbR7KQX+pyYyq20BDFWPQb/ALo+tf3z29raWNrHZafGIraBFiijHAVEGAAPoK4vFDPnh6NPJaD1lrL06L5nkfSu4++pYPD8B4CfvVffq26RT92Pzer9F3JBySVp3HBp2Ru9aUAD8K/Cj+Cmxopw6elJxTuF5oATAJz3pepzQoxzR2waYAM9TSj1NHSjNUgDvmlxTc4+tKufXiqSuIGBJ4/KuD8cfEPw74BawtNYnAutTk8q2gHLufXb1x71peMvGvhv4d+Eb/x94vuFs9N0uJ7ieWQgABBnH1Pb1r8W/wBiL4leLf28P2svEX7SerpLF4S8MbrLSIWzsLZ+8B9Oa97LconiaVXH1NKcFq/N7L1PvuFODp5zgsfxFjnyYXDR96X803pGC829+yP3JWQlRu4JAOB2zUuFPfrSY53d8U4qpIIryHq9D4abTeggIGQeK4rxhriaVZSXLkKFBHpiuunkKg+uOK+L/j78RBYRyaZDJ8xHIyOBX3fAXDss/wAypYeKvZn7F4M8D1uNc9o4KjG6TV/Q+aPjT8QW1G9ljjkJHPvXyNfXL3EzM3IJrf1/UjfXzSFsqfxNcxJtbk8iv9K+EOH6OR4OnQpLof7x+HHBuG4TyuhgcKtUkUiDn5ucdvamZQ9eDVpl6DOePxqF41I5H0NfZrufp0FYrSAeWSDyKrNuA5xmrDBS3zY6c02XHOOeK1TOhMrbjt4IOKa/H3RS7QTk0PnNWvI3i/MiKDHtUDYHK/yqy4LHHUfypmMcmqRsmVZOD8/1qHGchquHBXJP4VVdD1zVo2jruQuOMVEVBx274qZgcjBqMj+I1SXQ1SISDg4/nUePXmrBGPlpjAdG61fU1TsVZeCFHU00bQTip2TJ+ntTGUjI7+1UjWLK7nnaB+JqMKPWpGRgMg7qRl4xniqLXkQAFDzzmkOC1SEkA4qNEPO7t/k1otDZMYzZ+lMAIyAelSjaWwB/n86jkALCrWpaI2AwSG4pgyRhulS4XJCnmkZSAcUyxpwh2AdKYV52jp+tL83Qc80jIOx5781a1LTGNwcUKoB4PNPAwMg0wYU8DAq0UmIGwMU7B+6KAMAUigk9eK0Re2goDEUpzmkxg8mnMTnJot1LTA9PWgHmkx3/ADoz6DFUguL3yKMZ4oHIoAFMY7pilJ70gpPxzTsO/YeDk808hepNMGfuilxzimUA608CmHbijNFhpj+/FFISe1GD09aNwH9KaeeKRsimZKjpntS8gbsLu7elDEA8mqN3eW2nWzXuoSpBEoJLSEAYHfmvj34sftneBfB6SaZ4LX+178ZAYcQq3uc5NeNnPEeX8PUvb5rXUPLq/Rbs+dz3ijLuHKX1jN66h2V9X6Ldn2HqWoWWlWbajqkq28CDLSOQoAHua+HfjD+2p4a8NwSaJ8NkGp3XKm5fiJD7DqxH4V+fPxG+OHxE+J1yZfEd+/k9FgjJWNR9B1/GvIsmvwTijxhxOO5sJw9D2cH9p/E/RbL8Wfzrxb42YvMFLCcNw9lB/bfxP0Wy/F+h3HjT4h+L/iDqT6p4qvZLmRuQrH5FHoF6CuHJzRmkr8Yr16mKqSr4iblJ7tu7Z+G18RUxU3XxM3KT3bd2/mFFFFYmIUUUUAfoB/wTY/aruf2Tv2odG8Z6jcGPQdTcafrCckG2mON5GesbYbPYZr+7W3msb+KK701xLbXKLLC4IIaOQblYEdeK/wA0vJHSv7I/+CM37X//AAvX4CH4NeMbnzfE3gZBHH5jEyT6eT8jnPUxn5T+FfCcZ5W6tNZjRWsdH6dz+UvpL8AvMcJS41y+Hv0vdqW6xv7sv+3W7Pya7H7OhsqRjHakiYxTrLjJzjHrTyuG3dzSNGzqXU7T1x3r8yjNxem6P4fjNxlfqj+Gf/gq98Bj8B/2yPEVlZQ+VpuvMNVtCOjCc5kA+j5r82Bw1f1W/wDBfH4HjXfhX4W+POnwk3GiTnTrpxyRBOcpn/gdfypbiWyeK/ccixn13BUqz32fyP8AUXwk4j/1o4WwGYVJXnGPJL/FDT8VZ/M/sZ/4IjftAj4pfsrzfCrVZy+p+A7nylDMCxs7kl4sd8K25a/ZonHynAPfFfxNf8EgP2hv+FE/ti6Ppmqz+RpPjBf7Fuiz7UVpyPJkOePlfgHtmv7ZJoTbTyQD5gCVDDuB0P4+tfnvFGB+p42VSK92eq/U/i/6QPCf+rnFNbGUI2pYle0Xa70mvv1+YZyBgUzAI+tPwGUtjn0pxBPWvnqcrH4NJ6kAXgH86TYGBXpUx6nJqKQnpXVCXYhu41iM9OMU3y+fWpACAFApHXArqjIzb7EJQkkkVGwy+P61acYPH51HLgNtUYzW8ZFJkJQqd/4VWlGD/WrQBQkHvSMmTg9TXRTnqrjTs0fy2/8ABeD4D/2F428NfH3S4dsOsRtp12QMDzoRuQk9yy5/Kvz+/wCCX37Sz/s0/tb6Br2pTiHRdcb+ydS3HCCG5IVXPT7j4Nf04f8ABVr4R2/xY/Ym8VpFFvuvDmzVoGxkgw/6zHfleK/iEjLIwdWwVIII7Gv0HLaqxmF5Jeh/oj4K42lx1wHLh7NPe5OajL/C1eL+Sat6H+k35aswmjIKyDKEcgq3IxUKy54P418L/wDBNf8AaBuP2kP2QvDvinU5xPq2jx/2VqJJ+YzWwARjjnLpg190PHslwM8V8XiKbw9WVKXRn8E8TZJW4bzTF5JjI+9SlKP3P9VY/N//AIKx/DO2+Iv7DPiyR1Jn8PtHqUGBkkwsM/8Ajua/iFZs/wA6/wBDX9o3RIvGHwA8beFbldyXuiXqY9xCxB/MV/nlMpRip6ivr8iqOdBp9Gf2v9FbM5YnIMdlk3dUqqa8lOP+cWNooor2z+owooooAKKKKAP/0f8AP/ooooAKKKKACiiigAooooAKKKKACiiigAooooAXHFamiaPqPiHV7XQtHiae7vZUghiQZZ3dgqqB7k1mEfhX6q/8EcvgPH8bv21tCudTTfpvhVG1q4yNy7rcjylOfVyPyrjzDFxwGGq4yptFNni8R51S4cyvF57ivhowlL1stF83of1Z/wDBP39l/S/2Tf2ZdD+HvlBNXvlXUdVk43NdSgEoTjkRj5RX2xjHWh5DcSNPL8pfJwPTNNGAeOK/k7McbPMMRUxlZ3cm2f49cRZzieI8yxWeZhLmqVZOTfq/02HZAAAyc1+Nn/BWP/gotY/sreAJfgv8L7pZPHmvwlJWQg/2dbOMeYfSRs/KO3WvrX9vP9tDwl+xL8Fbjxtfsl14j1BWg0bTyQS85GBIy9fLjzk1/Bv8SfiL4t+K3jfU/iH45vJL/VtXne4uJ5CWZmc5x7AdAPSv0TgHhD+0JrNcwj+6jsn9p/5I/pH6O/gz/rTiI8ZcSUv9kpP3Iv8A5eTX/tkXv3enc4+7vLm+uZb6+kaaeZy8juSWZmOSxJOSSarBWJAUZzxim4r9Vf8Agkn+xy/7VP7SdrqfiS3L+FvCRTUdRLKSkjK2YoM9Muw5HoK/bcfjaWWYapjcQ7Rgr/8AAP7z4iz3CcLZZic+zKVqVGLk/lsl5t2S8z+h/wD4I8/siH9mr9mZPGfiy0EPinxvsvLjzB+8htcfuYvbIO4j1NfreAANoqNY0QBIgEVQAqgYAUcKAB2Ap4HPNfyjnOaVM4xdTH195P8ADovkf5DcZcUYnjLOMXxHmD9+rJv0W0YrySskGadx0FNH5CnAAV5J8uJ7E4pQe4pcYpMZpgGMHPWncUnbFKOKaEwFGcdaMelHB5qgAep5pAsjMFjG4noBS4JIBPWviz9vT9qzR/2P/wBnHVviPPKp1i8Q2ekQHrJcyAgMB1IQck13ZdgamY14YTDq8pOx7PD+R4riPMMPkmWQ5qtWSil5t/kt2fjD/wAFov2yNV+IXjPTv2IPg5OZ/MniGryQnc0ly74S3GP7h5NfuR+xh+zxov7Lv7Ovh/4Wacq/aooBPfSKADJcSgM5J74JxX83/wDwRl/Zy1z9pD9pLV/2qvidGb6x8NytOsk+SJ9Rm5UDPXYDn8q/rqJaQl36k8199xjVpZTQw/DWDekNZ26yZ+/+N+KwfB2X5b4R5DK8cOvaV2vt1ZLr6L7rpdBv8OAe1NyPpUnTmomLZC988fjX52tdD+aY6s+b/wBqr9oXwn+yx8Cdc+Nni5fMi02Py7a3Bw1xdS8RRg+55PtX8ZHj7/gpt+0r8QPFs3ifWLq2EMjlltljwiqTwuepwOK+6P8Agur+1w/xI+MFn+zZ4MuydD8JKJb8RtlJdQZcHP8A1yU7fqTX8/pyTX9H+HuVTyPBxx8W41Z636pdD/TX6N3AX+p+QUeIsTG2KxPv36xh9leV17z9Ufr/APDL/gofomrSxad8ULI2TthTcQfNGPqvWvv3wd458HePtO/tPwbqcGpwgDJhcMw9iM5Br+YGul8MeMPFHg3UBqnhW/msLgfxwuV/PBwa/fci8ScdliVHHr2sF8pff1P7OyHxIx2V8tHHR9pD7pf5H9RG4lcq3XpxSH5Rz3r8bvhh/wAFDPG2hiGw+JFhHq9tGAnnQ/upz7sejH8q/SP4ZftB/Cf4q2qy+FdSjWXgvazEJKn4HGa/Ysl41yrOUoUKvLP+WWj/AMn8j9kyTjbKs5ShQrcs/wCWWj/yfyZ7XgHp2qFoyGx1yKsSKYx842g9M+/061CQ6LjOc19anfY+yjJdyrtJ+719qaynoBU+FBwDx3AqNm6lR1q0zeLsMI+Tj86iY85PNO4xjmmMp3Bu1XsbRkNPBwR1H41VKsATVtySQKjI/iPFUmaxmymYT1Hb2qNhtI9KsMeqjPFQMAXyORWid9TeM77jNnG4mqxVsbhVxwMZ/wD1VAEPTsapGqfUhLcZNRt83T61ORtBxURO3g9atGsZX3IGU9Dj/CoyDt2tzUxUmmuHBH61aLUiJMnKjvUTBgSpA4qywxkMOtQ8nnHSqRqpEZT1qPGMHr71IMg7mFNY88/SqRUZdxu1S+3ODTCobJ/SpMFuQQajCKFxyatGikR4YDJpF4BJ/KpTGFGU9KiKtgZGe9Wmac1xAc8//rppYOdx/wA5qReBhsdaVgM7h3qkUmVyc8igEdBUhAPXoKb9wj35rRM0TGKc/wBKcmSdzHNBYYx6UnRcZqkyk77hnaTgYpwJHTmmqeuaaT+VWVckPbaKTJHB703nOaQGi47kgJ6UvTkVGuOtBye2aryHckzmlHBqEE9qUHPJoDmJacDk1CScYPPvSAsCOP0qW7bhz2LIJJqNmUHmvLfHXxj+HXw7gLeK9UigfBKwr80px6KK+HfiJ+3dcyiSw+Gth5anI+0XfzN14Kqp4/Gvkc845yfIU44zEJzX2Y+9L7lt8z4vPvEPJOH1KONxKc19mPvS+5bfOx+keraxp2gWbahrNxFawKMlpWCA464zXxb8Tv24PBvh1n0/wFCdVuVJHnMCkQI/U1+Z3jH4meOPHtybnxRqM1zk52FiEH0UcVwdfifEXjDjcdzUMip+yj/M9Zf5L8T8I4m8b8fmClh+H6XsYfzPWfy6L8T2D4jfHH4j/E+6efxNqEhiYkrAh2xqD2wOv415AaSivyLF4yvj6jxONqOcn1buz8VxmOxGYVXicdVc5vq3dhRRRXMcoUUUUAFFFFABRRRQAV9P/sf/ALR3iL9lf4/aF8X9CZmis5fLvoAflntJeJY2HcbeR7gV8wg9qcpwf0rOrSjWhKlUV09Dkx+Bo5lhquX42HNTqJxku6asz/SS8CeM/DnxI8F6X4/8G3C3ml61ax3lrMpDAxyqDzjuO4611obdwR+Vfzlf8EKf2x01bRrz9jvxxcqs9qHvdAeRgNykl57cZPJySy/lX9GqhmB4yCeSPWvwzOMvlleLnhpLS+nof5b+I/BlfgbPMTklaPuJ3hL+aD+F+vR+aPmn9sH4NW3x9/Zj8ZfC6ZQ81/p7y22e08H7yMj6EV/nu3tpPYXctjdKUlhdkdTwQynBH4Gv9LmNkjlBlGQCPlPfnp+Ir+CD/gox8F7j4E/tg+MvB5j2W0961/akDAaG5JcHHbkmvteBsbzKrgpPzX6n9H/RY4i/5GPC1aXapD/0mVv/ACVnxho2rX+hava65pchiurOVJ4nXgq8bBlIPqCK/wBCP9mf4tWPx+/Z38IfF/TZVd9W06D7Vt523EaiOVCfUMvNf55Ar+qX/ggR8em134feLf2cdWnPnaTOusaejN/yxm+ScDvhGAPH96vW4vwX1jCLExWsPyPvvpIcLvOeG451h43qYWXM/wDBLSX3Oz+8/oXQ/KfbimcZ54/WpCmyPg5PeoF3EbfXivyqDsf55dSvGvmOQcYqw4UD61BYw5Rsnv8ApVkjJ+YV2QkKa1sRFcfjTOT05pWB3YGfemkMRuHeumMjJ+YkrhTg1G42nPrVgICvNNk4465rohIqJUwSctTiuH3E9f51MR5q4fkH86eIA7BW6f8A1q1jK2iB6nBfELwpF44+HniDwNKm4axptxZjjJJljZRx9a/zuPFHhy/8IeKdT8JapGY7nT55beRG6q8bFT+WK/0f4ZDHdJKPlCsp9eAea/hm/wCCqPw6j+GP7cnjXT7KEwWmoXC6hAOmUuFDEj6tmvtOHa+s6HdXP7A+ijnbp4vM+HpvScY1F6xfK/wkvuPtT/ghj+0lB4A+L2q/s/8AiC4MVl4xWOWy3NhFvIM/Lz3dePwr+sJ1ZZGRuACfy9R7V/nK6T4q1LwN4x07xd4RkNvd6bPDd2rjOVdCGHfOMjmv72P2Qvj1pn7Tn7N3hj412h8ue+tfJvYjjKXcB8uYY9CwyKjiDC8kli0tHuZ/Sd4CeHxVLjjL4e7VtCp5SS91/NK3qj0H41anbaF8HPFer3RHl2+k3jMfYwsP5mv86uVg8hbsSa/uA/4Kt/HTRPgx+x34jsJrlbbV/FMf9mafHn55N5BkKjrhU6mv4fmztxXfw9BqhKbW7Puvos5RXwOQ43MsRGyrVFy+agmm/NXdvkMooFFe+f1CFFFFABRRRQB//9L/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKAHADNf1f/APBvl8JYNJ+FXjn413C4m1K9j0qBmHIjgXzGwfTLV/KAuA3rX9u3/BEKysrb/gn9p09v9+51q/MgHGWBUZ9+K+G8Q8RKhk81B/E0j8A+kvmVTL+CMTCh/wAvZwg/S/M//ST9Z0yFAxn2ryD47fHL4e/s3fCnVPi/8TrlbfTdLjZliLYkuJsZSGMdSzHivUL3UrLRdLn1fWJ1trOzjaa4lchVjjQEsxb2ANfxH/8ABVP9vbV/2vfjBJ4a8K3DR+CPDkjQafCjHbO6nD3DjuW7egr8c4O4ZnxDirVFalHWT/T5n8U+DfhZX8Ss4VCteOFpWlVl5dIr+9L8Fd9D5L/bA/az+Iv7Ynxkvvip4+mYRsxisLIE+VaWwPyRoO3HU9zXyp16UE05QWNf0vQoU8NTjh8PG0Y6JH+pOXZdhspw1LLMtpKFKmlGMVskja8O+H9Y8Va9Z+GtAga6vb+ZIIIoxlneQhVAH1r+/L9gT9kvSP2Pf2dNK+HMcaPrl4ovNYnA5e5kGdgOORGOBX4s/wDBDH9hm2vZ5f2w/idYlo7QtD4ehmX5Xk6PdYPUJ0X35r+nppS7F5Opr8T8SeJliKiyPCP3Yv3n3fb5H8JfSg8UVmuLjwBk1S9Ki71WnpKfSPpDr/efkIq4Qt/KnAAAAUnHbvTsY68V+Qn8ebicDv1pcYpCAtB680AOx60lO6cdKT6UMAPHNHvS+9IGpiHe1NYhTk9aUkdDTHOAQBk1dg3B5Io1LzsERQSzE4AA5Jz7Cv4p/wDgqr+1Drf7Z37WEPws+HLPeaHoNwNJ0uGI5We4LBHlGOpZuntX9BP/AAVq/bAj/ZZ/ZtuPD/h+48rxR4wjeyslRhviiIIllI6j5eAfWvxf/wCCGH7Kw+K/xt1D9o7xnai50rwfzamUZWXUJeh54JRTu+uK/W+CsvhkuCr8VY5bK0L9/wCtD+vPAnIaHA+Q5j4zcQw0pxcaCfWT0uvWVop9uY/pC/Yn/Zt0n9lL9m/QPhVaRgX6xC51KT+J7qUAvuI67c4/CvrD7mM9BSu7Mxkfncc/nTSQBjH4V+ZY3FVMdWqYyu7yk7n8r53m+Iz7H4jOMwlzVKsnKT827hkZ6V8y/tYftBaJ+zJ8APEnxh1mQK2nW7R2anBL3knywoAep3c/hX0424nHXNfyff8ABeP9qlfGHxE0r9lzwrc79P8ADIW91TY2RJfSrwhxkfu0P619DwlkzznMKeHlH3FrL0R+heDXA8uPeJsJlVSN6MHz1H2hHVr/ALedor1PwB8a+Lda8eeLtT8aeIpTPfarcy3Vw7ckySsWP6muWp7nc271ptf03GKglGK0R/rJTpxpQjSpKySsl5ISilycYpKZYu09amglmt5BPbsUZTwVOCKYJGAxTNxpp21Q07O6Z9JeBv2rvjZ4GEcFhqzXNugCiK5HmDA7A9QPxr7k+Hf/AAUU0TUEi074i6Y1pLgKbi3O5D7letfkTuagEjkV9PlfGWb5S19WxLaXSXvL8T6fLOMc2ylp4bEtrtLVfj/mf0n+CfjF8M/iBAt14W1m3uH6mMsI3HplXr09yQvTGQOeo/Ov5Z4bq5t5RNbyNG4OQykg5+or3nwL+0z8ZPAW2LSdXlnhXpFcnzU9vvHP61+iZZ4ubRzbDfOL/R/5n6PlXi7ZqGa4b5xf6M/oXU7jtByaickN1B/nX5UeCf8AgorqsKJD8QdES6K8NNZnYxH+6xxn8a+pvBv7Z/wJ8UFRJfvpUhHMd2Npyf8AaHFfoOXcd5NmKSp4lRb6S91/jp+J+jZbx9kmYKPJilFvpL3X+J9YMpbJAqMJgE5rn9H8YeGPEcS3Ggahb3iOuQYnVv0ByO1dAxd1Jzn8a+qo4inXSlQmpLyd/wAj67D4uliEnQmpejTGOpGSv+NVHycFhnHftVvcqjceajC+vTvXQmd0GQtgfd6nvUT4PerCjJ5qJgCfl5+taX7GsWQqoYZPNNPSpOvyn88VGQegFUpI1jIhCsc1HllO41OBkADtUUilutWpGiZEwDA+hoba42innCna3NNwc89+taJlpkDqeo5B7VFtPLfpVg8Jg1GdrEE+/wCVWjVPoRgAqdtNKjbgCl2bCVzxQsa9/wCdUXfqNHIz0qMANkN9KlDHH04qPy22jJzT23LvYTyxuyewqMgls9R604Ko49aU7FP1rSJaehGRjCrzUL4PJqZ3JbMf4Co8MThfxql2KUhuTt4Of0qPPO2pCg5PU0g244q0XzWEIyfxpOadlAMjr7UiMGPy8/SrRXOlqIPalIxQpBbAPzegrK1bxBoeiw+dq13FbIOpkdRj9c1nVr06K56s0l5uxjVxlHDxc61RRS6tpGqGweaCw6r2r5v8TftXfBfwxvi/tIXkgH3IFL5/4EOK+ZfGH7fd62+HwLpCx9hJdHdx67Vx/Ovkc08Q8iypNVsWpNdI+8/wPi828TMgyhONbFqT7R95/hp+J+lDSYHAxjrXBeKfip4A8FwtceJNWt7YL1TeGc/RQSa/Gvxl+0h8YfGhZNT1aSCJv+Wdv+6XH4c14jdXlzfTm5vJGlkbks5JJ/E1+a5t42Ru4ZNhL+c3b8F/mfl+ceO6d4ZJg/nN/ov8z9TPGv7dvhPTA1v4I097+YcCSb5I/wAutfG/jj9qP4u+OA9tJqBsrZycRW/yYB7EjmvnTcR0puTX5dm/HmdZ1dYnEuMX9mPur8NfvZ+TZ14gZ7nraxeLai/sx91fhq/myzdXl3eyme8laV26s5JP5mq1FFfHttu7PjG23dhRRS5PSkICCKSiigAooooAKKKKACiiigAooooAKX8KSigDvvhf8SPFPwi+IWjfE3wVcNa6rod3Hd28inBDxsDg+xHBHcV/oBfsv/tCeFv2ovgjofxm8KSxuNRhC3sKEbra7X/WRuB0OeR6jFf54eMLnrX7P/8ABG79teP9nf41t8H/AB9dmLwj4zkSL5iNltfA4ilyeiv91vw9K+V4qyf+0sN7ekvfht5rsfhXjx4e/wCueSPMsBC+Kwyco95R+1H9V/wT+x1mJXBHIGfxr+aX/g4F+B6K/gz9obS4QDIr6RqDqOS4+eEsfYAj8a/pikULg54PIIOeD0Pp0r4R/wCClfwdT40/sT+NPD8UX2i90y1OqWvqslr85/8AHc1+ccOYx4HH0pvS7s/nofxt4QcQy4W4ty/F1HywlL2cvSfuu/pe/wAj+CWv0R/4Jb/HV/gN+2p4P165l8rT9XuRo97k8eTekR5P0Yg1+eDZB561bsb25069h1CxcxTwOskbqcFWU5Ug+oNfteJorE0p0J7STR/pXnWV0s7wGJyfFK8KsJRf/byt+B/pZsGguZLWTny2IBHOR2P40xGPPGeK+f8A9k/4r2nx0/Zo8EfFO0bfJqWlxLOc5IngHluCfXK/rX0HKvlR+bF1PpX4NWpOhVnSl0bR/khnGW1MpxtfLcQrSpycWvNOxWjIhlLP/FxUjncTgUKoxz3pSmASa0hI8qT1IH569/SgL29anZcDpTeEGa6oyuS2R+XjKsajYysw2jrUk6bxyfr7VJBjy84/+tW0GLm6kMiHGabJIiEMTt7/AJVWKTyXK2yAMznj1z6V/Pt+3P8A8Fqr34U+NtS+Df7OOk293faTIbe71fUQzIk6EiSOKAYzsPG4nGR0r08FgauPn7PDrY+44K4Bzfj3GPLsgpczirybdoxXdv8ATd9D9qfjZ8dvhH+zp4LuPiD8Y9Yg0rT4FYojMDNO46RxRD5mZj04x71/Dv8AtzftQN+17+0brHxkhsDptlcLHbWdsTlkt4F2puxxubqccDNeMfF/42/FL47+K5vG/wAV9buda1GdiQ07lljB/hjT7qKPQV5OzFjk1+gZZlMcB+8k7yZ/fHhP4OYTw3jPMK9b22LmrOVrRit7RXru3v2QpZiBk9K+5/2OP2/fjZ+xr4ikufBsq6pot0CtxpF2zfZmLHO5cco/uOvevhU0oJFepVpQrRdOqrpn65mWWYXOMNUy7NKSqU5qzi1dM+q/2tf2u/ib+2B8Rh4++ITCCK3j8mzsomJht485O0Hqx7nqeK+VDgnIoycYpKdOnGlFU6askaYHA4fLcPTwGApqFOCsktkgoooqzqCiiigAooooA//T/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigBRX9nf/AAQT8RW2tfsT3nhiNx5+m+IbncpPIWWONuPav4xB61+lv7Ev/BRDxf8AsZ/CL4ieCPCMEkmqeKoIF0y5yPLsphuWWUqedxRhtx3HNfMcW5PUzzL3gaHxcyf4n5X4y8F4rj3hqrkGWW9q5wkr7aOz+5Ns/Wz/AILVf8FE4tItLv8AY8+Dd6HmmUDxBfQSA7R/z6KV75+/+XrX8sxPetPVtY1PXtUuNa1qd7m8u5GlmmkJZ5Hc5ZmJ6knmsuu/I8mo5FhY4LDL1fd9z3vD/gXAeHuT0eH8qV7azl1nPrJ/ouiCvs39h39kjxh+2F8dtL+HGhQvHpkcizarehfkt7VT85J6AnoBXzr8LPhj4y+Mvj7S/hp4As3vtX1edbeCJB1LHqT2Cjkn0Ff3r/sK/sb+Ef2KfghbfD/TRHc63dqs2sXqjmafqUVsZ8tOgH414/GHE0OH8Ly09as/hXbzPiPG7xWo+G2UOGEalja6apx/l6Ob8o9O79GfTngnwh4f+Hng/TfAnhGBLTStIt0traGNcAIgwPzPJ9ya60DBzS8DoaFA4r+Za1WVacqtXVs/y3xWJqYyrPFYiTlKTbbe7b3E4JwaeOfxpO/1pCcHjisr2MBSPzNLg03vk0bs1QDh14pOCcUA8ZpcjrQIKXrzSYpScZNACHg5rM1LVNN0XS7rXNYmW3srONpp5HICpGgyzE+wFXnZfqa/Df8A4Lh/tdn4O/Be2/Z48HXXl694yTzLzyz80NgOOT2Mp4+ma9zIsoqZzjaWAprd6+nVn2XAXCGJ45zzCcN4Ja1Je8/5YrWUn6I/nq/bs/aN8T/txftaX2s6GJJ7J7saVodqOcQh/LTAz1c8mv7Nv2Lf2c9M/ZY/Zr8N/CayiVbyG3W41GQdZLuYBpCT7dK/mR/4Icfsqp8Xv2hJvjh4pthNoXggCSMSLlZb6T/VAZ4Oz7x/Cv7HNzFjJIfmNfoPiFmVPDRocOYLSFNa+vT+vM/oj6THFGGyyOXeFfD3u0MJGLml/Na0U/NK8n5y7jFOTnPNPYKF56VHkBcU2RtowBnPYetflaR/I1r2seGftLfHLQf2bfgT4k+NGvuuzSLVvIRjgyXL/LEg9ctiv88T4g+OvEXxM8bar4/8Wztc6lrFzJd3ErHJLysWPJ7DoPav39/4L0ftYN4m8caZ+yl4Su/MsfD+281by2BWS7cfJGSOvlrz9a/nPOK/ofw/yT+zMB9bqr36uvoun+Z/pX9GngF8K8O/29joWr4y0vNU18C+fxP1QE5pKKK+9P6RCiiigAooooAKKKKACiiigBcnGKUHFNooA0bLV9U02QSabcywEdDG5U/oa9t8MftOfGzwkiw6drkska/wz4lH/jwJrwGiuvDZhicE+bCVpQfk2jswuYYnBS9pg60oPybR9/8Ahr/goF8R9PjWHxHp9tqAHVwTG31AHFe8eGP+Cgvga82L4p0y4sz3MeJB/Q1+RFFfU4PxBz3B2tinJf3kn/wfxPq8F4iZ9gbcuKckv5kn+O5+9Ojftd/AfW9hi1oQGTqtwpQr9ck16fpfxY+GmsJ5mm63ZTBjwBMo4+hr+cinxzSwndExU+oOK+mw3i7mNNWxGHhL0uv8z6nDeMmZ01bE4eEvvX6s/pltdZ0/U4/OsZ0kVuhRlb+Rq4HjH3WJ4/z2r+bXTfHPjLSMDTNUuoAP7krAfzrvtM/aG+Muk4Frr9yQOztuH619DhfGLDtL65hJJ+TX6n0WG8aqNrYvBtejX6n9B+3CkYwfeqzHtmvxB0n9s/476ZzJqEdz2/exqc/XHWu8079vf4pW6bNTsrO557KV/ka9yh4sZLP+Ipx9Y/5M9yh4x5RLSrTmvl/kz9gyCG54qA8jb39K/Ky3/wCChHiZV23mgwP/ALsjD/GuptP+Ch1soH2zwy2e+yf/ABU16VLxOyCe9dr1iz1Kfi1kE96jXrF/5H6TDPOaY67TgnmvzmH/AAUE8OHGfD0445/fA/0q3H+354McgzaDc8eki/4V2R8R+H3r9b/B/wCR1x8U+H3tibfJn6FsgwMcmmYUcevpX5/J+3x8PxnOiXv/AH8Xj9KVf2/fAoHGg3f/AH8X/Cr/AOIj8P2/3xfc/wDI2Xilw8l/vX4M+/yoDfNjp1qMgjrX5+P+374MHK+H7k/WUf4VlT/8FAND5+y+HZM9t0o/wqZeJfD0f+Yv/wAlf+REvFfh5f8AMS//AAFn6KjAOcjmhpAwCswB9K/MKb9v/V1z9j0CFfTc5Nc1fft7fEOYf8S/TbWHjHOX/nXNV8V+H6abjVk/SLOSr4x5BT1jOT9Is/V/zoyu3cM9h3pCw4J5Jr8arz9tX41XWTDNbQAjHyRLXC6x+0/8atayLjWXjB7RAJ/KvMr+MuUU1+5ozk/RL9Ty6/jflUF/s+HnL7kft9c6hZWamS6lSPHXewX+deaa98dPhN4YH/E3122Uj+BGDt/46TX4a6t438X66xbV9SubjP8AfkY/1rlyzM25jkmvmsd411pe7l2CS85O/wCCt+Z8xj/HPFTusuwUY+cm3+Ct+Z+wXiH9tv4SaUDHpIuL5v8AYj2D8zXhHib9vjXZg8PhLR4bcYwsk53MPwHFfnn9aK+Mx/ihxBjrxjiFTT/lSX46s+JzDxS4hx919Z9mn0ikvx1f4n0P4l/am+NfieJ4LrVjBE38MCLHx6ZAzXiGpeINb1eRpdTu5p2Y5PmOzfzrGpRxXxuMzbG5g+bHYiU/WTZ8XjM1xuYPmx2IlP1k2GTSUUV5554UUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUALUsFxNbTpc27GOSMhlZTggjkEEdCDUQODRQHqf2kf8EgP25F/aY+EI+E/jy783xj4Qtwh8wjfd2gOEl9SUGA351+uWo6FZeJtKvPDOpKJLbUYJbaVf8AZlUoR+tf54P7NH7QXjP9mH4zaL8ZfA8hFzpUwMsOSFuLdiBLC/8AsuvH61/fp8FfjL4L/aC+Fej/ABg+Htys1hq8KTbQQTFJtBeNsE4ZDwQa/I+KsmeWYmOYYVe5J39GfwJ48+HL4PzeHFGTwthq8ru20J7tej3j810P89b4weC5/h18VfEXgS5Uo+kajc2pB6gRyFR+lecjFfpZ/wAFc/htD8Nv27/GcNnF5dtrEkWpxe/2mMM/0+fNfmkOeK/U8HW+sUKdbuk/wP7i4dzFZxlWCzWL/i04S+bim/xP6y/+CBnxuk8U/BnxX8BryYtdeHbtdRtFJ/5dbkYdV9ldCfxr98wjSrj7uK/iZ/4I2/GRPhL+2/4fsL6Yx2PiqGbRphuCrvnAMRbPHDgD8a/ts2srGJz8ykg47EcV+U8YYT6rj3VW01f/ADP4B+khw6sl4rqY2jC0MTFVPntL8Vf5kOxBgHrTjkdPpSOqGnhTjNfOU5dT+fnoMzxj1pmOwpxyWHvTW4JbNdcGQNlG5Sp71Aq7RsXvU3UkdzUTkhPlGDXRFhHyC1gEOoQ3JOSjhjt9v8K/gZ/4KBfCrWvg9+17458IaxI0zNqMl2kzf8tEuT5oYHuMsR+Ff3srGzLuPGeOtfz3/wDBdX9lSbxF4L0j9qbwzEGudGC6dqwUfM0LsTFJx12kkE9ga+t4ZxKo1vZzekj+k/o18WU8i4jllGMlaGKjyJ/307x+/VerR/LPRTmUA8Gm1+hH+hAUUUUAFFFFABRRRQAUUUUAFFFFAH//1P8AP/ooooAKKKKACiiigAooooAKKKKACiiigAooooAKUGkpaADjvXefDX4ZeOfi941sPh58OdNm1XV9TlWKC3gUszMfXHQDqSeAK0PhH8IvH/xv8eWHw4+GunyajqmoyCOONBwMnlnPRVHUk1/b9/wT9/YD+GH7CvwxXVtdms7rxjfRBtT1eUqiRBuTDA7/AHUXuQcsRn2r5niTiWjkFG9uarL4Y/q/I/K/FPxRwfhvgPa8ntsVU0p01u33lbaK+97LuuF/4Jr/APBMzwt+xX4dHjvx0YtU+IWpxbZ5lw0dlEwBMULYzu/vMPTiv1T3MeTgZr5P+I/7df7IPwwSQeLfH+lpJGSrpDMJnBHtHk18nax/wWj/AGDtMneCHXb27xwGht22n6ZAr8GxuAzviOs8fWoSk35aeiP88s6yDjvxIx9XiLH5bWqzn15JcqXRR0skuiR+sOKQHjNfj9H/AMFwf2IJJADd6kB6m3ruvD3/AAWP/YQ8RFY5PEs9izMB++t3UDPGc4xXJPhLN4K8sJL7jzK3hBxlQjz1MlrW/wADP1GU4GGpeO/evGPhh+0L8C/jRbrP8L/FVhrG4Z8uKVRJg/7B5r2kjB255x+leFXwtbDSdOvTcX5nwmOy3FZZVeFzCjKnNdJJp/cxCO/UUpOOD3/Sm98Ec+tGRux0rFHEO68GkHXmmhh1xThhcgUwF68UoOTQTgUZ7YoTA5bxn4v0L4e+EdT8d+JpRBp+kW0l1cSE8BIwSfz6V/n1ftaftB+Kv2tf2idb+K2r75H1O58mwgHPl26ttgjUduP1Nf0H/wDBdv8AbF/4RjwpZ/sk+B7ox32qhLvW2ibBWAZKQNj+8eSPSvyb/wCCQ37MY/aM/a50m61q2M+g+Fz/AGnfEjKFojmJD2+Zv5V+68DZZHIctrcQY5Wcldf4Vt97P7y+j/wvR8O+Fsf4pcRRtOpBuF91TjtbzqStbyt3P6qv+Ccv7N1v+y/+yd4c8CzwrFq2oxDU9SI4Y3E4B2tn+4uBX3SrbVxSO5ldmPGTwPQdhSkccH8K/H8yxs8wxNTGVnrNtn8T8R53X4kzPFZ7j3edabk/m72+Ww0jB457V4B+058etA/Zp+BfiL4z+IXAj0i1b7MnGZbp8iJBn1Y170TlwvX1xX8pH/Bef9rCfxV8R9N/ZY8K3OdO8OKLvVTG2VlvH+5Gcf8APJeue59q9vhLJHnePp0JfCtZei/zPuPB7gWfH/EuFyeS/cxfPUfaEXr85O0V6n4G/Ebx54j+KPjvVfiH4tna41HWLmS6ndjkl5Dn8h0HtXFscmnMATkcZplf01GKhFQgrJH+s1KlDD040KMbRikklsktEhKKKKo0CiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAClyaSigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigBe9fuZ/wRw/4KC2H7OHjG7+BXxTuWTwj4kmEsEjsdtneYwCBg4WT+Ltmvwyp6O6MHQkEcjFcePwNLMaEsJiFozwOJ+G8FxbltbIc4hzU6i+afRrzTP1u/4LP/ABR8J/Fj9reDxD4RlSaKHRbW2kdDkF0eU5/IivyOq3d3t5qM5ub6VpZD1ZySTj3NVT61eDwywlGGGi9Iqx05FlFLIMvw2S4V3hSioq/ZHYeAfFN14H8aaT4ysyRLpV5BdoR1zDIHHf2r/Ry8K+LdO+IHhHR/iJpB3WniCwttRix/duI1fH5k1/mvgjoelf3T/wDBJP4lT/E39gDwZNfy+ddaFJdaVLjkqsEh8rPvsIwK+N47wqqYeli/5Xb5P/hj+bPpU5GsTk2A4ggtaM3B+k1dfjH8T9HXDMoyMetIR/CKVA2M5xSgAZBr8xpy6H8HW7kXBXrUJZF+Ujk9KmZSevpUbRnIb05rtjITIm4PHSoprcjHzZHXFXAWztIqF1IYt0rqhLuC33IJNhXG3k1wHxZ+GujfGf4aa98KvEik2fiCyksnK43IXHysu7gMGxzXpFy2BsOeKgJKNhed2cD37V3UKrpSU4s7sBjKuAxFLG4aXLODUk1umndH+cl8Yfh1qfwk+KWv/DTV0ZLjRb6a0YOMNiNiFJHuuDXm1frj/wAFtPAVt4J/by1vUrU8eIrCy1VhjGHljKMP/HK/I6v13DVfbUoVe6R/rdwpm/8Ab+TYDO3vWpwk/VxTf43Ciiitz3wooooAKKKKACiiigAooooA/9X/AD/6KKKACiiigAooooAKKKKACiiigAooooAKKKKACnfWm0UAfYf7Lv7ZfxC/ZIk1HU/hfYWLapfpsW9uo/MkhGMYQHjFZfxm/bY/ak+P0jn4m+MtQvYHJ/0ZJDFAATnASPaMfWvlHJ7UuT2rleCw8qn1mVNOXe2p508owVTEf2hVw8XV/mcU3972JpZJZXMkzF27liSf1qHpzSZ9aK6tj0fQOO1Gc9aSigDp/C/jDxV4M1SPWvCWpXOmXUTBklt5WjYEdOVIzX7h/sdf8Fu/i78Kp7fwd+0NE3irQ8qn2sf8fcK92Bzh+PWvwVpQcV5mZZPhM2pujjqSku/VejPluKOC8l4yw0sBxDhI1E+rXvLzUt195/o7/Af4+/Cf9pbwLF8Q/hBqsep2LnbKgIEsD/3JY+qn617UCuAQcelf55/7If7YPxZ/Y7+KNr8QvhzeP9mLqt/YOx8i7hz8yOvTOOh6g1/dl+zV+0h8Nf2sfhHZ/Fz4X3ANvcALc2jMPOtLjGXikXOfvfdPQjFfgfF/BdTh+X1nDvmovr28mf52eM/gjivDeuszy6Tq4Ko9JW1g/wCWf6PZ+p77yOT3qTvg1GrAjrzUmeQO9fB7n8/injoM15z8Vvih4Z+DXw01r4oeL5hDYaLbSXDse7KPlX6s3GK9DYtghetfy+/8F4/2x5L7VrH9kPwPdj7PZ7b3XTGR80x/1UDEZ+6PmI9cV9Hwrkc88x9PCJe6tW+yR+jeFfAlbxC4iwuQ00/Z35qkv5YR3+b2Xmz8Bv2gfjH4k+P/AMYtf+LXimRpbrWruScBudkZOEQeyrgV/Yb/AMEZ/wBmyP4E/sj2njHWrcRa543k+3zbhh1thxAvPIyOfxr+Tj9in9nzUv2n/wBprwr8IbFSIb+8R7txnEdtEd8rE9vlGK/0J9I0zT9C0m10PSI1is7KGO3gQDG2ONdqj8hX6h4lZnHBYSjkeGdubVryWx/Vn0qOK6WSZRl/h5lXuqpaUkulOGkI/N6/9ul4Z5FIxwcD8qdk46YzUUjFQCvNfi0Vc/g5K7seC/tM/HnQP2aPgb4h+MniF1I0m1Y20bHHm3DDEaD6sa/z0viP488QfE/x1qvxB8U3DXOoaxcyXU8jkklpGLY+g6D6V+9f/BeT9q2XxZ8QNN/Za8MTg2HhzF3qoQ533rDCo3+4v86/ncr+heAcjWV4FYuovfqa/Lp/mf6V/Rq8P/8AVTh7+3sdC2Ixlpeapr4F89ZP1Q7k8UNyaSjvxX3h/SAlFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFAD48bwG6V/VD/AMG9PxKfVPh98Rfg7dspGmT22sW4LfMfPHkyYBPRdgP41/K4BzzX6Mf8Ew/2vNI/Y4/aatfH3i2KSbQtTtZNM1BYz8yxTMpEmO+xgDivGz/BvHYGrQgry3Xqj868WOGqnFnCuY5NhIc1Vx5oLvKLUkl62a+Z/dmyE/0qNmOev5VjeEfFHh7xx4cs/GHhK9i1LSdRjWW2uoGDo6MNwOR/nNbMgO4pgcHrX4ak6cnCSsz/ACyxGFq4WrPDYmDjKLs0900MYY5ppAHSnElgRimKEIx3NdEJdzneogJJx+tRyjkHOeaey7TxQwONxHvXXB7EtDJ4VMgkU9R0xVV2dbhCucir0ojlIYDGOtUpkjAMo+8AcCu2n71kaxvdJH8gf/Be0oP21rBF6jwzp5bvyWlP8q/EfGK/Wb/gtX41tvF/7fPiK2tlKjRbKy01snOWhj3E/wDj4r8mTX69lyawtJPsj/V3wxoSw3CWS0aqs1Rp/jFP9RaSilNdp90JRRRQAUUUUAFFFFABRRRQB//W/wA/+iiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKACvu/9gf9uDx/+xV8XoPFWjyPdeHr9lh1fTix8uaHPLqOAJE6g/hXwhSiufFYWljaU8NiY3jJWaPNzfKMJn2DrZRm1JTpVE1JPs/1XR9Gf6VHw2+I/g74v/D/AEr4m+ALtb3SdYt0uYHU5IDD5kb0ZTwR2rvA2Rn61/K1/wAEJf2wr7w74uvf2UvGM7SaVqwN1pTM2Et7hRmRRuPSQfrX9TsX7wMq8f8A1vSv5j4myKWRY6WD3i9V6H+UHit4f1fDviCvkMvepv3qcu8JbX81s/NHh/7S3x98L/syfBHXvjV4qIaPS4G+zREgGa5YERRjJHJP6V/nm/Ev4g+I/ir4+1f4i+LpjcalrN1JdXDsc/PIxOOew6D2Ffub/wAF2f2t/wDhYvxWsf2bfB1yX0Xwria9MZ+Sa8cdDjgiIHA9/pX4O+D/AArrHjjxTp/hDQImmvdSuI7eFF5JaRgo/nX7LwFkayjAPHYhWnUV35R6f5n9wfRw4AhwZw4+Isyjy18WlN3+zTWsV5X+J+q7H9Sf/Bv/APs422ieA/Ef7TuuQ/6fqkv9laYXXlYEAaWRT/tH5fwr+inaF+7xXif7N/wi0f4B/Anwt8JNBQLFo2nxxSMP45mGZG/Fia9sQcBTzmvxnifNXm+Y1sW3pey9Fsfwx4qcWz414mx+fOTcHJxh5QjpH8Ff1Y4cJgivA/2mvjn4e/Zx+BfiH4v+IXVI9Jt2aFCQDJcEYiVeeSWIr3o424biv5SP+C8n7WcXjHx1pP7MHgu736doKi71Mxk7ZLpxhIz2Plr+tdPCeTPO8fToP4Vq/RHf4P8AAc/EDiTDZTJP2MXz1H2hHVr1l8K9T8CviP47174n+O9X+IfiiYz6hrN1LdzsTn5pGLY57DoPauJpSSetJX9NxioJQgrJH+stKlChCNCirRikkuyWyCiiimaBRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAUUUUAFFFFABRRRQAU9SRye1MooA/Zv/AIJe/wDBT7Xf2U9ft/hJ8VpXv/AGpTBSzEtJpzucebFnny8/eUfWv7FtA8Q6D4w0O28V+Eb2LUdM1CNZra6gYNHLGwyGU/z9D1r/ADT6/YD/AIJo/wDBTvxT+yPr0fwx+JUs+qfDzUZF8yIfPLYSE/66DPO3+8nQ/Wvh+JuGI46+PwKtU6rv/wAH8z+ZvGvwQp8VRnxPwvTUcWk3OC2q+a7T/wDSuup/Z+GBApw+Xtz6VzXg/wAX+EfH3h208X+B9Qh1TS9RjWa3niYHKsMjIySCO+e9dPtwck8+1fmajKk+Wpo0fwNicNUwdSWHxMHGUXZpqzTISTnnmpGjUfnUb8Nt6ntT1ZiuCBmumDMmvIJiYxuB7VlX2qWWjafc69qLBbaxt5bmYk7RshQuRk+ymr0g3M23t37V+cf/AAVY+NCfBr9h3xc9mT9v8SqmiwANtdVuciSQY54QEH616uX0Hia0KEerR9FwjkdTiLOMFkdBa1Zxj8m9X8kfxkftDfEy5+Mnxy8WfFK6Jzrup3N0obkiN3Plr+CYFeMU4+lJiv2SMVCKguh/rdhsPDCUaeEoK0YJJLySshKKKKo3CiiigAooooAKKKKACiiigD//2Q=="
-# Image Base64
-LOGO_BASE_64 = "/9j/4AAQSkZJRgABAQAASABIAAD/4QBYRXhpZgAATU0AKgAAAAgAAgESAAMAAAABAAEAAIdpAAQAAAABAAAAJgAAAAAAA6ABAAMAAAABAAEAAKACAAQAAAABAAABLKADAAQAAAABAAABLAAAAAD/7QA4UGhvdG9zaG9wIDMuMAA4QklNBAQAAAAAAAA4QklNBCUAAAAAABDUHYzZjwCyBOmACZjs+EJ+/8AAEQgBLAEsAwEiAAIRAQMRAf/EAB8AAAEFAQEBAQEBAAAAAAAAAAABAgMEBQYHCAkKC//EALUQAAIBAwMCBAMFBQQEAAABfQECAwAEEQUSITFBBhNRYQcicRQygZGhCCNCscEVUtHwJDNicoIJChYXGBkaJSYnKCkqNDU2Nzg5OkNERUZHSElKU1RVVldYWVpjZGVmZ2hpanN0dXZ3eHl6g4SFhoeIiYqSk5SVlpeYmZqio6Slpqeoqaqys7S1tre4ubrCw8TFxsfIycrS09TV1tfY2drh4uPk5ebn6Onq8fLz9PX29/j5+v/EAB8BAAMBAQEBAQEBAQEAAAAAAAABAgMEBQYHCAkKC//EALURAAIBAgQEAwQHBQQEAAECdwABAgMRBAUhMQYSQVEHYXETIjKBCBRCkaGxwQkjM1LwFWJy0QoWJDThJfEXGBkaJicoKSo1Njc4OTpDREVGR0hJSlNUVVZXWFlaY2RlZmdoaWpzdHV2d3h5eoKDhIWGh4iJipKTlJWWl5iZmqKjpKWmp6ipqrKztLW2t7i5usLDxMXGx8jJytLT1NXW19jZ2uLj5OXm5+jp6vLz9PX29/j5+v/bAEMAAQEBAQEBAgEBAgMCAgIDBAMDAwMEBgQEBAQEBgcGBgYGBgYHBwcHBwcHBwgICAgICAkJCQkJCwsLCwsLCwsLC//bAEMBAgICAwMDBQMDBQsIBggLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLCwsLC//dAAQAE//aAAwDAQACEQMRAD8A/v4ooooAKKKKACv5Cf2n/GeofEL9obxd4nu3Zll1S4RN3BWGJjFGoOSRhFGCAcjNf17V/IF+0l4auPBvx/8AGPh6XhbfWLxVznlJJC68kAAFT8uAee9eRnEmqcbdz+cPpJqu8mwah/D9q+b15Hy/+3HD/Df4i+K/hR4xs/iB8Pr02Gq6e+UkAzw+QVYEFSrZO/IIINf0pfsgfts+C/2l9HTQtU8vSfFttHm4sC3yzADmSAk/MO7JksnfOM1/LpJHtbyYvuetami6zrPhjVLbWfD91LaXdmyywXMDmOSN1OQQwwa4MHjpUvd3ifz/AOG/idj+FMRyJc+Fk7zp+f8ANH+WX4S2fRr+1qivzI/Yo/b70T41wWvwz+Ks0Vh4tUCOGY4SHUOONvQLN/eQcEg7f7o/TevpITU1zRP704e4iwGd4KGYZdUU6cvvT6qS6NdV+lgoooqj2wooooAKKKKACiuI8V/E34b+BITceOPEGm6NGOrX13Fbj85GWvnfxT/wUC/Yd8GRmTxF8WvCkQHaPVbeZvTpG7Hr7V24bLcXiNMPRlP/AAxb/JG1LDVan8ODfomz6/or83Ln/gr9/wAE0rSQxTfF/RMj+75zD81jIrY0X/grD/wTj1+UQ6d8X/D+5unnTNCPzkVR+tek+FM7Su8DWt/17n/kdLyrGrV0J/8AgL/yP0Lor568K/tbfsseOSieD/iR4Y1J5OFS31a2dz/wESbv0r3uzvrLUbdbvT5knicZV42DKR7EZFePXwtag+WtBxfmmvzOOdOcHaaa9S1RRRWBAUUUUAFFVb29s9Ns5dR1CVILeBGkkkkIVURRkkk8AAck14P8G/2nPhH8db/UNK8C3zG60+Vk8m4URSTRr0miXJLRn14YfxAZGVdHn4nNcFh8RRwletGNWrfki5JSnyq75U9XZb2PoKiiimegFFFFABRRRQAUUUUAFFFFAH//0P7+KKKKACvhT4zf8FC/gJ8GfGMnga9a71e+tW23f2BFeO3YdVZmZcsO4GcdCQa+nfjTpvjnWPhR4g0v4aXH2XXp7KVbKTuJCOgPZiMhT2JBr+QfVbG7sNWudO1dHiuo5JFnWUESb1YhwwPO7dnOa8POszqYRQVON+br0R+MeL3iHmPDVHD08uopzq39+SvFW+yldavzei79P6/PhT8XPAPxq8JQ+NPh5fLe2ch2sOkkTjqki9VYenccjI5r8PP+CrXwbuPDfxY0/wCL+nIRY+IrcQXDADal3bADnj+OPbjIOSp7V8d/s0/tD+Mf2b/HsHi7Qpml052RL+y3fu7iA/eB/wBsZ3Kw6emCa/Uv9v39p74B/Ev9nG28N+F9Qh1jU9Zmt7m1jjP7y02HLPJkfI2CU2nBOT2BNY/2hTxmDm5+7Jfn5ep8dmvGuVcacF4yGOlGjiqMVPlb+1H4XC+rU9Y21avr0b/CPYtNYuvWrTLuqu/3a8CnUP47lErwTXNrLHdRyGOZCGV1yrqy8ggjkEH0r99P2EP+CgNv8QVs/g38bLtYtdAEOn6lKwC3uOBHIeMTdgT988HDY3fgaP8ASPuVXTKSLsOJEIKtnBBHQg17OExkqb12PtuAuPsw4Wx/1nCvmoy+OH2Zr9JLo/zV0/7cKK/Db9kL/gpppHhrw0vgL9pq7lUWMZFprJUys8aDiOcLliw6K4zno3PNflx+2r/wchePbvVdQ8A/scaFHolvA7xf25rEYmu5NpwGitj+7jB9ZPMOOwPFfpvCPCWZcSV/YZVBStu27RivN/ok35H+jXhxjqPHFGNbIZKel5JtJw7qS7ryvfdXR/Wt8RPif8OfhH4bl8Y/FHXbDw9pcOd91qFwlvFkDOAzkAtgcAZJ7Cvw9/aJ/wCDiz9iH4S+dpnwkh1L4i6gm3a1lH9jsjnr+/nAY7fRYjnseRX8TXxm/aD+OP7RXiOTxd8cfFOpeJL+Qk7764aVUBP3UU4VFHoFCqOAAK8QAIbCjNf03wz9HXLqSjUzrESqz/kh7sfRv4n6rl9D+isq8IsNTSnmNVzfaOi/H3n+B/Q58af+Dkz9tjx28tl8JdK0PwTbb32SRwG+uTGegZpy0WQO6oM9sV+VHxY/4KGftw/HATRfEr4neIL+2lbcbZLx7e3HJ4EUZRMe23px0r47+fqp5+lVZBKeC1ft2TcAcOZbyvBYGnGS6uKcv/ApXf4n2+E4VyrBK9DDRv3sm/vd3+JZ1PXdZ1qUzaxeT3b/AN6aQufzJNYrLuq3jvUTr3FfbU4xjpFWPRdFLRIp1Ey45FW2XdURGODXRFnNKCIUmnhffDIysP7pr0fwj8bfjL4Av49T8E+KtX0qe3I8t7W8lh2kdwUYYrzry1/z/wDrqIg9Kzq4WhWXLWgmvNJnBWwtOatOKZ+tPwi/4Lff8FJ/hGFS1+Idxr0GeYtbij1AY4wN8q7xx6PxnnHSv2O/Z+/4OirvdDpP7THw5R+VV7/QJyjAd2NvNuyc9hIv07V/H8yuKehI61+f554R8KZpD99gIRf80FyP/wAltf53PmMdwnlmJXvUEpeXu/kf6ev7MP8AwVN/Ye/a3aHTfhX42todXmA/4lWqD7DeBj/CFkwrt7Ruxr9Cgc8iv8hvQotXudRhi0jzBcMwCeXw4I7jFf0o/sR/GX9s7wt8Jp/Ani3x7qs/h+8jVRaXE7TPGqgDZHLJuZUxwwBycdOuf5S8WvCPLuFcP9fw2PTi9qc/jfo1v80vU/nDxlzzJPD/AC7+0cbXcm/hpq3PJ+T0Vu7tofu1+3d+19H411C5+CPw0ug2kWj41O7iORcypyIlPQxqRyc/Ow44HP5o6Pqlxpt9Hq+kTyWtzCwZJomKSIy8gqwwQRXPpIqg7+SOa+gP2e/gZ4r/AGhPH1v4R0NPItY9st/eMMrb24znI/iY/dUZByeuAa/lfETrYmsnD5H+S/EPEnEPiDxTDEU1KWIqSUaMIv8AhpaqMdrKO8padZOx+6f7E/xK8bfFT4C2PiHx8XmvoLia0W5kXa1zHCRtkPABPJUkdSpJ5zX1pXL+EPCfh34eeE7Lwj4biW107TIRFEvTCrySx9Scsx7kk18mfFn9vb4HfDWeXSdGnfxJqEQIMdgQYFccbWnPy8nuu7HfFfT88aUE6kj/AE7hnGD4XyLC/wCsmPjGVOnGMqk5W55xilJq/vSbd3om3uz7bor8k/8Ah6XbtL5kfgpjD/1/jd+fk46/h719+fAb4+eC/wBoHwm/iXwnvhltnEV3aTY82CQjIzjgq3VWHBHvkCKOMoVZctOd2cXC3itwnxHipYHJsfGrWSb5bSi2lu1zxje3W17LXY9wooorpP0IKKKKACiiigD/0f7+KKKKACvxP/4KX/spRwPJ+0b4Etj8xC6zFGOAWIVZ8DBG77shHse5r9sKzdZ0fS/EOk3Oha3Al1Z3kbQzQyDKPG4wykehFcmNwkcTRlSl128mfM8X8L4biDK6uW4nTmV4y6xktmv17ptdT+L5o0kjKJ8pqv5M0ZDvX1L+1/8As66n+zl8VLnw3EHk0q7zcabOQcPASDjjq8f3GHOcBiOcn5lk3so3/dr83qU50Kjo1d0f5351k+JyvG1cBjIclSnLla79mvJrVeRXprLuqdl3VFWtOoeFKJVK7fk6UzG16tsu6q8i/LzXfTqHNKmULiHczI+GRvlx/er89/2mv2YrbWIX8YeD02XCqzPGo/z8tfodtdo9j9aY0K+TtmUFW+8tfa8I8YZhw/joY3Azs1vHo12Z914deI2c8F5vSzbKKtmvij0muz8j+bK5sbnT7p7K/QxyRfeBqiciTCV+sv7TH7Mtn4jsZvFvgyHFzH8zxp/FX5Wajp95pd7Jp2pRmKZG2kGv9FfDzxDwHE+BjXoStVXxw6p/5H+0fg54y5N4gZVDF4OXLiI/xKb3i/8ALszHPWoWXbVplzyKir9Lp1D9dqUyqy5qGrbJjkVEy5rpjI46lMquvcVEQCMGrNRuvcVvGRyyiU2XsahZcVdZMjmoCvY1vGRyVKZEyMvJFLb2NxqF2ltYxl3Y4AFWIoZZ50ghGWdtor9Qf2R/2U3nmTxx4zT5P4UI/wDHa+N4644wPDOXTxuMlr9mPVvsj8i8XvFPKOBMlqZpmNT3/sQ6zfZfr2Ok/ZE/ZOSCNPGfi0ZMm1lBH/jtfrHYwW9hDHZ2aiJFXaEFYmmWVtp0a2tugREXaoFbCyGRd5G0iv8ANDjrjTMOJcwnjcbPT7MeiXZH+Gvij4l5vxvnNXNs0qXT+GPSEeiRp75g2JPmBr63/ZV/ay179mfVNUaLSo9Y07V/LNxb7/LmDxBtrJJgj+IgqQe5BHf45aS489Yzyv8AEa0kfEwCjiviYSdJ88Nz47hziTMeH8xpZtlVTkrwvZpJpJpppp3TTTs7n2L8ev2yvit8d520+/n/ALG0L+HTbNyA4z1mYgNIRjjkICOmTXy3Dtik8xflHpWUsk0nLLVpZiV+YVyYmpUqvmqHPxRxTm3EGMljs4xEqtWXVvRLtFLSK8kkjZ8wRplPxr9fP+CWen3y6Z4z1mRXW3mlsYlJztaRBKWwemQGXOPX8B+OtvHdXDiCyTzZ5WVEjUZZ3cgAADuTwK/pt/Ze+ELfBP4M6V4PvlUalIDd6gV5/wBJn+Zh1I+QYQEHBC5rqyTDN13VeyP3/wCifwnicZxXLOUrUcNCV5d51I8sY/c5S+XmfQdFFFfVn+kgUUUUAFFFFAH/0v7+KKKKACiiigD5a/a5/Z00z9o74U3PhxFSPWrENcaXcMPuTAfcJ/uSYwfQ4bqor+WnVtGvdB1KfSNYie3urSR4ZonG145IztZSD0IIr+zuvww/4Klfs9Wfh7Urf9oHw5GscGqypZ6pGB0ucfu5Rngb1XaxxkMARyxz8zxFljrQWIpfFHfzX/AP588c+AVmGD/tzBwvWpL31/NBdfWH/pN+yPyEZd1QsvY1Z27VFMZd1fEU6h/G0olGmsu6rTL2NV676dQwlEqsu6o2XaeKuMu6omXHBrtp1DmlEoMvysjrkV8M/tJ/sz2fim0fxR4Vj2Xi7mZEHWvulky1ReW+5t3zLX2XCnFeOyLHQxuBnaa+6Xkz7DgLj3OOD83pZvlFXllHddJLs+6P5uNS0+/0nUH0/UUMckXDA1QMbPJlutfrx+0n+zVpfjOxm8S+FYxFfR/M6J3r8mdW0zUND1KTTdSiMU0J2sK/0V8OvEXA8T4KNWlK1ZfHDqv+Af7SeCnjXlHiDlMcRh5cuJh/EpvdPuu67MxGXse9Qsu2rLr/ABCo6/UKdQ/ZqlMrMMioKtsu2omXJrpjI46kSsWLIVqNk3ELFyasEnr0FfV37MvwFv8A4meI4dU1KIrYQHPI/wDHq8jiPiTCZJl9XH42doQ/HyR8Hx9xrlnCeTV85zWdqdNfNvol5s9W/ZI/ZiuvE96njbxZEUtI/mQHvX7A6VbWunWkVjaRBIkG1QBXP+GtIs/DemLpNhEI4kXbhe9dHbytL+7A5Wv82/ELjvG8UZnUxeIl+7XwR6Jf1uf4R+M3izmnH2eVcyxsrUVpTh0jH/PuzaVypq+j4+lY0betWVYqa/PJRPxWUTZVsHmriPmstXxwasK+OK55ROaUTWV4g25TkVZjuAwL5+VayY52Y/IOorzL4tfFPRfhb4OuNd1JgJAGCLn+L1q8DltfGYmnhcPHmnOVkjvyzKcRmGLpYHBwc6s2oxS3bZ92fsLfFL4DQftcaP4Y+Jmq2llcGNjpMd26qk+og7YkBb+NRuKZ534/ixX9Ptf5OPxT+KviHx945/4SqzuXhkhlLRurYZWByHBHIIPQ1/aJ/wAEQ/8Agrs/7Sej2v7Kv7R18q+O9Nh26TqMpx/atvCMbJCcf6QgHUgeYAeNwOf6Q4s8DcdkOR0c0w75+WN6sUtY315l3ivtdt9r2/2F8MvBqvwVwhhsO0nVd51dNVKXfvZWXkkf0lUUUV+Jn0oUUUUAFFFFAH//0/7+KKKKACiiigCOaaK3iaedgkaAszMcAAdSSegFfwt/8Fbf+CtOvftEfHY/Dn4E6m6fD3wjK0KlMqmq3WfnnYEcouMQ56DLfeYAfq5/wX2/4KPSfBTwAf2PfhDf+X4o8UW4fXbiCTbJZabLjEORyslyM55BEXY7wR/FJKUIBhGK/ePDDgGjiaMszzOneMlaEX2ejm/yXld9Uf0J4WeGWGx+DqZnnNNSp1E4whJbxejn+kfK76pn77/BH4raV8TfCMGpQuPtKr+9TP8A49Xse3dl/wCGvwL+Cnxd1b4WeJ47yFybVm+dM/LX7j+B/G2g+ONDh1XR5A+4KzDPSv5+8V/Dmvw1mEq1CN8LUeku3kz/ADT+kr4B4zgPOZ4nCRby+tLmg/5f7r8107o7Bl3VCy9jVpl21Gy7vrX5XTqH8tTiUaay7qtMvY1Xrvp1DGUSBlxwag5Q1cZd1V2Xj567adQ5pUyhMsLSf3mr4n/aQ/Zr0rxpYyeJPDEeL1fmYIOtfb0lukjLNHTGj/GvsOFuKcZkeNhjcBO01/5N5PyPrOCOOc24Rzalm2T1ZQqQ+6S7Puj+bzW9E1Hw9qMul6rEYpoTtZTWU6AjfHyO4r9hP2kv2cLP4g203iTw1EIr6FdzBB1r8kNZ0TUvD99LpWoxGKeFtrCv9FfDjxHwPFGCjUpStXXxw7enkf7SeCPjflPiBlMa1GUYYqEf3lPqn3XdMxQjSSZboKgcsJCVqdyyjYK0NL0m81bUI9LsRmSY/lX6bUxNOlTlVqStFH7Dja1PDUZV60uWMfelI7v4SfC/Uvih4sh0azB8jcu9sf8Ajtfut4C8C6d8PtAt9A0ZEQKq7yo/irxz9m/4M2fw18Jw3lzGPtsy7mYj5v8Aer6YiMjSF42yPSv4D8ZfEmpxFmMsLhp/7NS91eb7/wCR/id9Knxyr8a57LLsBU/2GhJxiuk31k/08i7G3c1cRu1UQoHNSrJ+NfiR/Hc4mmkhzVtWxyKykbsatJIc1EonPKJqKxU1oI+PpWMslWlk2/OTxWbiYODew/UdWsNBsZtTv3CQxhmJJr8JP2vf2iLr4leJ5tI0Vz9kt22ZB+Vl/u19Qftn/tM/2XE/gTwrKPN+7IQf4q/H+5uZJZJHc5Mrbj/vV/aH0evCn2KjxFmdP33/AA4vt/N/kf6cfQ5+j+6EI8aZ5S99/wAGMui/m+fT7xytt/eGuo8H+MvE3gDxPp/jPwbeS2GqaZMlxa3MDlJIpYzlWVhyCCK45H21ZU7P3g6V/WtWhGpFwmrp6Nd0f6I1aSmrPY/0iv8Agkb/AMFJvDn/AAUD+AyNr0sdv4/8Mxxwa7ZjAMvGEuo1H8EvfHCtxxkCv1pr/LP/AGHf2vfHP7FP7Reh/HrwG7mOzkWPUbIMfKu7KQgSRMBgfMvK8kqwBHcD/Te+CXxi8DftA/CjQfjL8Nrtb3RfENpHd20ikEgOPmRsdHRsqw7MCK/z98ZPDp8N5n9YwkLYSs24f3JdYfrHy06M/DuKcieX4jmpr93PbyfVf5eR6lRRRX42fLBRRRQB/9T+/iiiigArwP8Aag/aE8Gfsr/AXxL8efHbgWPh6zadYs4M85+WGFSATmSQqucHGcngGvfK/jr/AODkL9sM+IvHmg/saeErpvsmgqur64EJCtdzIfIjYY58qI78gnmTBAxX0XCmRSzfM6WDXwvWT7RWr+/ZebR9ZwTw3LPM4oYDaDd5vtBb/fsvNo/m9+OPxj8bftC/F7XvjL8RLt73V/EF3Jdzu5yF3nhF4GEQcAYCqoAAAFeTk7jQSX4pOQa/s3Cwp0aUaVJWilZLskf3jh8LTw9KNGkrQikkuyWyHtkDI6Gvpr9n/wCPWs/CvW4bSSbfYSnDKx+6v93/AHa+ZGOFDnrSz3FlZWjX144jhX7zOdqrXDxBk+BzXAVcJmMIum+/TzPleNuD8q4myqtlWb0ozozjrf7PmuzR/R34U8XaP400dNY0GYSoy/Nz8ytXQsJmXe/Ffz2/BD9u7wl8FdbGm315PfWLMqlbdd6r81fvX4H8ceG/iJ4VtPGfhK6jvLC8Tejxmv8APDjnhWOQ5jOhh6qqUvstfk/M/wAOfHPwZxXA2cTpUZ+1wc5e5Na6dn2Z1uNy1Cy9jVimsPlxXyFOofgsolGmsu6p2XdUVd9OoYyiVWXdTPuNVtl3VXZd1dtOoc0olCaDc2//AL6r4z/aM/Zx0zx9psviDw3CBfr82EH8X+zX2rtRI96fdqtNC/8Ayx+WvruGeKMbkmMhjcDO01/5N5PyPquCuNc24Szalm2T1eSpD7pLs+6Z/Mfr/iTQPC2u3PhrxPeR2N7Zvslin+Rl/wC+q/Sb9jX4L2GuQxfEjUtk9vIqvauDuVlr6H/aI/Yr+Ff7R+oWWu+KrZLTUbF1ZriFF3SR7vmRv71fT/hfw1oPhXRbbw3oNsltZ2cSxJGg2qqp8tfuHFHj7mWb5O8BCCpynpKS7dl6n9Y+LH0wMXxJwjHKMBT9liKulaSvouqXr+R0iqkaqidFqZOlRUV+BKbe5/AFWF3dlimfL9+hWzwafWsZHmVKY9ZPxqyjdjWe/wAvz1PHJVnHKmaIkckMeRXyr+018fLX4Z+GZba0mH2yddqop+avUvin8StO+G3hifW71wHUfICa/Av4pfEnW/iX4nm1jUnJVmbaua/ePBTwvqcQ45Y/Fx/2anv5vt/mf1t9FrwBrca5xHNcyh/wn0Hr/ff8q/U4nxPr2o+JtXm1TU3y8h6elc1tIbG2rK7RcHfUIVz8461/oTh6FOjTjSoxtGJ/snhsDRwtCOHoR5YR92MV0SK9SK38BpnJpK3lHmJqUy1GxWMp021/WN/wbe/t5jw54qu/2IfH98fsWsb77QDKwHl3agmWEdMCVBuUY+8vA5r+TTP2iXHSu7+FnxC8T/CT4iaP8SfB1y9pq2h3kV5azodrI8LBlII9xXxHHvCNHiLJa+W1dJNXi/5Zr4X9+/k2j5/PsohjsLOjLe11/iP9cCivnD9kb9onw1+1d+zl4T+PXhZ1MOv2KSzxr/yxuV+WaMjqNsgYDPOMHvX0fX+ZuKwtXDVp4evHlnBuLT3TTs18mfz1UpyhJwkrNaMKKKKwIP/V/v4ooooA8++LPxL8M/Br4Za/8V/GUoh0vw7YT39yxIBKQIW2jP8AE2NqjuSBX+Xn8fPi3rvx++Nvij4z+KJTJf8AiPULi/cnoBO25VHoADjBGAAAOK/td/4OHf2gm+Fn7FcHwm0ycxX/AMQNRS0YL1NlZ4nm9xlhEPcZr+EFj5URhYfNur9+8I8pVLDVMxl8U3yr/DHf73+R/U3gPkSo4Gvm1Ra1Hyx/wx/zlp/26NpR1qNWzwafX7ZGR/QRMeZwsdfFHxS8Z6n4q8STaZbSY0uzlaIRD/loyfeLV9roJGfbFwzdK/PC4hubS+1CyvBiaG4kVgfvfer8e8Y84xWHwNGhQlaE3qflfifjq1DCUqdKVozbv/kY8j+XH8ife+8K+1f2Tf2wvHP7NOuxw+a974ZuH/0iyJ6f7cf91q+M2/fNvtjtWqbR3iNsT5a/mutCGIh7OqtD+bs/4ewOdYKeBx9JThPv/W5/aJ8Kfip4G+MXg2Dxl4JvEu7W4Xd8h+ZG/iVl/h216G23y/3/ANyv5FP2af2oPH/7N/iZNV8LTGawmZftlm5/dyr/AOytX9O3wB/aE+Hvx+8Hx+J/CVyHfav2i2c/vYW/ustfn+aZPVwkueOsD/ObxZ8GsdwtiZYihFzwjej7eTPeMblqFl7GrLDZ9KYy7q82nUPwiUSjTWXdVpl7Gq9d9OoYyiVWXdUfKGrjLuqJlxwa7adQ5qkSFl/KocJUvKGlZcciu6nUOSpTGVXqVlzyKPb9a64yOKpTIqd95PpTaK6YyOKpTI2YyL9mf+Gqer6zp2g6XNqWpyJDb26NJLI52qFSrvmJb7kmr8K/+ClP7Ys1zPN8Bfh1dYh+7qlxGf4v+eS/+z16+W5fPGV404/CfX8AcBYzinNqeAw0fd3m+yPnX9rX9vLxT8SviHeab4Nghl8L2LeUgk3CWT+827/erwLw78cfBWrSpbakJNNuG7TD5P8AvqvkP52leFGxu+6afN5P2UfaV3u3tX9N8G8cY/h2hDCYWzpLof6ycBYqfCGWUcpy2K9jDo197P0Yi8u6t1v7dxJC33XU7lNRMig7TXwF4f8AEXiTwzMH0K/ktRu3eWTuiP8As7a+ifCnx10m5nTTvFcH2SVvu3EfzQH/AHv7tf0Hw34sZbmDjSxf7qf4feftWT8fYDFtUq/7ub77HuAXyz6GoSxap4LiG/thf2rrNbt92ROVNK5VO2a/VqVWNWPPTl7p9reMo80ZaFWpEbsajorSUeY5qlM/sR/4Nif2qA1r4x/ZA8R3R3JjXtHjdhj+GO5VR13H5Hx0AU1/XfX+XX/wTd/aJn/Za/bS+H3xiWVobW21OK1vwv8AHZ3ZEMy47fu2JJGADjg1/qIxyJKiyxMGVgCCDkEHuK/gX6QXDSy3iT67SVoYmPN/2+tJ/pL1kfhXHOXLDZh7WO1RX+ez/wA/mPooor8JPjD/1v7+KKKKAP4dv+DkP4vy+Mf2xNE+Fdq7m28IaLAJI8koZ7wtM5wD1MZQHgnjucV/O7PksCOrV94f8FJfimPjb+3R8SfHsNwbm2l1u6t7Vz08i2IiiGcjoigdVxmvha4XF4npX9acJYR4XKsNh3uopv1er/Fn95cDYBYHIsHhmrNQV/8AE1zP8WZ7r3FIhwcetXZI9v3Kqsu6vq6dS59lGRLvMZMQ5rxL4pfCW/8AEd+/i3weFN5Iq/arYnHm/wC2v+1XtHBO3rT1MgGRzXl5/wAP4TOcN9WxUf8AgHlZ1kuGzOg6GJjddPI+An0TxDp9w1pNod6snp5R+9XU6P8ACX4i68yTJbJYQt/z9Ha3/fNfbf2iX/loxNRkRt1r8+wPgxl1Opz1qznE+Ew/hbgYz5qlRuPbY+adO/Z1le5F3ruqtt/ijtk2/wDjzV9G/BrS4vgJ4nTxd4Du7pJ/uvvlO11/2l+61WtjH79PQRjgnFfeYXw9yCnT9m8Mn66/mexifDzIcRhp4PE4SM4TjZ8+v5n7kfAv9obQfiro8dtcyCLUF270P8VfS0ivGd+3cK/m+8OeJdY8KarHq2iSmGZP1r9Wv2d/2rtK8YQp4e8ZzeVeKu1XP8Vfy94peC2IyqU8yyaPPh+sesP80f5cfSN+iVi+G6lXPuF6bqYP4nDeVP8Azj+R9z43LULL2NMkvbSO1F48yeU33Xz8tTeZDIu9CCvrX4BDnW6P4RnRnH4olSmsu6p2XdUVdlOocsokDLjg1Byhq4y7qiZccGu2nUOaUSFlxyKZTuUNIVK9a7qdQ5KlMqtsj6UzcrQ+Z91aezYYIf4q4P4ieMNN8F+FLvXtV+VIV+X/AHq9XA4aria1OhRV5yfKjXA5ZXxuJpYPDwvOclGKXVvRHxt+3t+1hpv7Pvw3m0TR7pP+Ei1hGitUB+aFf4nav5dNQ1a/1y4lubyczzXDs7ux3MWf7zM1frL8WvEMXxW8Q3OreIoFuEZmEaSDdhf+BV8s63+z/wCDb93udIaWwk6r5R3Lu+lf11lngbmOAwFOpTmp1XHma8+3yP8AXDwr+jbW4VyKnKDTxNSKdTo0+y9D4x8y8X5IVzT9tzHh5mr1jxN8IPH3h1zPBGNSt1/jh+//AN815EHzMYbxDE6/eR/lYV8xmOSY/AT5MZQcT2szyXE4N8telJeq3LVSfIy7NtMRkZaSvNifOVKfU67wb448RfDy5ElrIZdPkb/SLUn5Nvqv+1X3DbSRXOnw39s26OdFlQ+qvX56Ry+ZZzJN/EjV90/DtbtvAOkC7HzLbR/981/Q/gtn2LrTrYCrLmgtUfq3hpmGJqSq4WrLmildeRvuvcVHVph82KhZe4r+hj9YlEdBPJbuk0ZIKNuX61/qP/8ABN/4y/8AC/P2G/hn8TJWLXFzokFtcFjuYzWWbdyx9WMe78a/y3Jk2xBq/vL/AODaH4s/8Jh+xVr3wwuJDJP4Q1+Tbls7YL6NXRR6AMknTj0r+cvpLZOsRw/h8wjH3qNSz/wzVvzUT818RsFz4GFdfYkvukrfmkf0Z0UUV/Dh+LH/1/7+K5H4geJofBXgLW/GVx/q9JsLm9b6QRs5/lXXV8p/t0+Ix4T/AGM/ilrxO3yfC+prn3kgdB05/i7VthqXtKsKfdpfezpwdD22Ip0f5pJfe7H+Z34p1CTWvE2o6xL967uZZyT6uxJ/nXLSx/x1pTLukZ/71VypXrX9gUXyQSP9AsNLlioroZ1V5I/40q9JH/GlQ12U6h6FOoZjLnkUK+atyR/xpVN17iu2nUOqMicBSfnOaFXdzEKwPEfiTw94P0tNV8QT7PM+WKKP5pZG/wBla8Q1b46a+sb/APCN6bFArfde7O9tv+6tfMZ3x7lGUS9niq3v/wAq3PnM44uyzLnyYmfvdlqz6RxM52qvP1qneXkFgu/UJo4R/wBNGVa+JNT8b+P9WkMt5qUsKN/BbnYv/jtcXdW/2qRpryV5nbvKd7GvgsZ45YaEuXCUG/X+mfDYzxSw/Ny4ai36ux9x33xJ8C6WSt5q1sD/ALLeZ/6DXOP8ffAGmzrdWN3K0kZypiQ18c/Z7O3T/VJn6VDJHDIPkXbXhV/GnMqq5YUIKP3nzeN8R8ZWhKnKlHll8z9p/hf+3x4V8faDD8KNburnTZptqQXlxGqxK3+9/DX3P8A/jdr1mviDSvijp13puneH0WWXUbkr5Dxv91o2X73y1/Mr4P8ADPiTxx4osfCOgwmS6vJViiQf3nav1f8A2gNY16PQfDH7DHw0vJNQ1HbCurTgszPI/wA2z/dX735V+M59j1iVUw/soJVHz6L4O7T6emx/FHirwnlNec8swtCnCFZ+0n7tvZJW5pp9L7W2ufuv4X8XeG/GXh+28SeD7tL/AE66G5JYz8pre2ouUTjbXlH7P/wh0H4H/CnSvh1o5Lizi/eu33nkf5mb/vqvXfnuGKY21+XynFVJRh8KP8+c5w+Go4yvRwc+ekpPkl5EVNZd1TsueRUVdVOoeJKJAy44NRP8vyVaZd1V2XdXbTqHNKJmsqJIH27ttcN8TPAdh8RPCdx4ev2+WZflr0Lf+82Y4pknnR/Ig3Bq9rAY+rha8MRQdpw95M6MuxuIy/F0sbhZ8tWElJPs1sfz+fFP4Wa18Mtfl0q/Q+Tn922P0rynYqqVbr61++Hxk+Dej/FDw69pcoBdRq2x8fe/2a/D/wAc+C9W8CeIZtA1eIo0bcZFf6F+EHilQ4lwiw+Jly4qmtV3Xdfqf7K/Rv8AH3C8dZYsDjpKOYUl76/nX8y/XscVL8vyr+tcR4q+H3hDxhatHrFonmdpk+Vx+NdyFII31I5icZUc1+y4vA4bFw9jiKfOvM/pbF4KliIOFeKkuzPhjxl8EvEfhRzfeHs6nZf3P+Wqf415EJN0hWcPCV6q45/Kv04EU7fMOlZUmlabPP5r20ZkHfaua/K848HcHiavtcHV9n5bn5Zm3hjhK9Tnw03Tv0tdfI+JvAXw01bxZexyTWr2umbt0ssi7WlVP4Vr7Wt4oIrdbaJPLiiGxR/dWrzKWPynpUZZCuxq/QeDuEMJkNFwo6ze7PoMg4Xw+UUnCk7ye7fUoEYODULLjkVbZd1QkY4NfbRkezKJUkG8iv6z/wDg1r8fvb/Ef4p/DEnC3unWepgZxzbSmLpgf89uoHboK/k4KYAIr+hn/g2k8TSaV+3xqWhBsLqvhq9jI9fLkjk/9lr8y8Z8GsTwdmEeqipf+AyjL9D4/jPD+0yfELyT+5pn97VFFFf5wH85H//Q/v4r4B/4Kn3Etr/wT0+LEsPX+w5F/BnQH9DX39XxN/wUi0CXxN+wf8VtHhG5m8O3kmP+uK+Yf/Qa7ssaWMoN/wA8fzR6eSyUcxwzfScP/Skf5rUi/MarMuODV+ROwqsy54Nf1hTkf3VTqFEqV61Ukj/jStNlxwarlSvWuuMj0adQzqiW38y4SPszbatyR/xpUW7y/n/u10KWnunWpnxp8StU/tL4har9pYuunv8AZYFP3UVP7tcEyvIzef8A8Br3D4s+DLqw1uXxxYQG4sr4bpyg+aGb+8y14euoWD28v76Pc3vX8V8aYPHUc5xDxEZXbP5Z4owuJpZnWVeMruT1fVdLFZo0XnbmoZPJZv3iYat7S9L1vWv+QJptxeL93fHH8v8A31Xbaf8AB/4i6oyvIlppyN977RJub/vlazyzhzNcZ/u+HkzDAZFmGI1o0ZOPex5F5ttI3kzJtK1C0dn5i8He33RX0jD8Ap3dpNV1gZb/AJ4Rf/FV7H8Jv2TfBXizxIiaxdX89tD8zkuqqzf3a+vl4cZ1Rw88ViIckEru7PVzLhTMsvwNTH4qKjTiru7Ov/Zn8O6b+z38Ib/9qXxbbh9RmVrPw/BJ955H+Vn/AOA/4195/wDBOn9nm/mjvP2n/H++fWdcdmt/N+8kbt8z/wDAq4/T/g94b/aM+JGl+GLqxlk0Dwuiw29ukjLAn975f4vu1+zGk6PpXh/RYtK0SEQwW6Kiog2qqp8tfkvGNHEZS1hq8v3tRJtLonsn5n+f3jzxJiMohPAVKi+uYlKVRJ/w6f2afk3uyeoWXbV5lJX61Cy7a+Eo1j+Nymy7qhZexq0y7ajZd1ehTqGUolGmsu6rDLuHFQ1306hjKJVZd1Rsu08VcZd1V2XdXdTqHNKJQmYSRh3+WvmD9or4G6V8UPD8t/psIOo26bkdO9fUskca7kdfvV57cavH4V1hLO//AOQffNhH/wCecn91v9lq+p4dz3GZVjYY7AztOGqPpuDeJMyyDNKWa5RVcK9N3Xn5enkfzs3Op2lvr954Wum8nUbGVop4JBskRk/2atH5DnoRX6H/APBQH9jiP4oaM/xh+GsZt/E+lxs8gtztNzH/APFLX4aeFvjf4i8N3H9m+OYWnWNtjOB+8T/eWv7l4B8c8HmlKNPMV7OfV9L/AKH+xXg19IPLOMcrp1MV+7xMdJron+Z9dF/XNMOHO1hzVTQte0fxLpq6npEolhbuDytWwPn21/QGFxdOvTjVpSvFn9DwnGrGNSnK8WVGHHvUBOeatuuDmomXNejGRzVIlV17ioiMjFWajde4rojI5ZRKxX5fpX7j/wDBu3M0X/BTHw/GnSXR9XB+gtyf6V+HbD5cV+9P/BuNor6h/wAFGrTUgM/2foGpyn2EiiP+bV8P4oTS4SzO/wDz6n+KPluLVbKMW/7j/I/0AaKKK/zQP5gP/9H+/ivGf2jfDUvjP9nzx14RgXfJqfh/UrVF9Wlt5FX9TXs1RyxJPE0MgyrgqR7GrpzcJKS6amlKo6c4zW6af3H+UxfW72d5LbScbHII9CKpMvY17r+0f4Avvhn8fPGnw+1VNk+j6zeWrL/1ynZf5CvDWBjav6ww1VVaUZrZpM/ubBYpV6Makdmk/vRTZc8GoWXHBq+y9jVZlzwa7YyPTp1CiVK9aqyx/wAdaTLjg1WZexrppyPRp1CmreTu8kgoy/Mh+63/AAGuck0LwZHd/aYtEsluPvb/ACRu3f3q6Bl8n5HT71M8u2X58UquBwteSlWpxmaVcJQr8sqsE7bXSZX+0PFGsNt+6Rf4EG1RVYydnqw0fG9Pu1XfqK9WhGEPdpo9ClTjGPLFFqKF7q4WCEbnY4UetfXej6DN4f8ADcPgzRE/4mWpMqykfeRk+89eZfCTwtCrv4p1VN0MPyqp/wBv+Nf92v0T+APwxeSSX4leKlzLIVS1Q/8AfK1+QeJXGlDA0pKTvCm9v56n2Y+i3fyP5V8f/E/CZVhpKbvCi17n/Pyt9mHmo/FL5HvHwR+Gdn8KvCMem2oEl/dLud/4tv3tv+9X0Gse6IJ0b+KuW8L6Pcqp1K8c75Ox/wDQq7Ty+d9fwjnmaVcdjauJrz5pt3b8/wDJH+NnG+eV81zatjsXU9pWm25vu328lsik0e37lQsv5VfZdtVpI9vzpXDTqHyRQZdtV2XbV5lTtVC+uIbK1e5uWCpGu5ia9OhOUvdQ4QlKfJAoTSYVnQZK/d96x7DU4b5ikvySx9q+Kvi1+0VrHhXxNZ6loSGWxjbdOAfl8v8Ahavpbwz4q0f4jeH7fxVoDhnYbnCH5kb+9tr9CxfCOPwGBo43Ew/d1Nn2fZ9j9Pz3wrzjJ8ow2b5hStRr7TX2GvsyXRvc9RbfupfvrWTpeqfav3M339vX1rVb5Tvr5/3oysz8rxGHlTlyTKci7Zax9f8AD9h4g02XTbxN6SKysGre2+Yue9QvHIveu6nU+HU5oydOSnDdHzl4T8bTeG/FCfCX4hP+/ZWbTrmT7t3D/d3f89F/jr8iP+ClX7Gtz4b1G4+O3w2tv9FuDnUYIx8sbP8AxrX7Q/GT4W2HxT8IvpokNpqNufPs7tPlkhuE+6y14V8FfjBD8SrbU/gn8cLaODxLpqNBdW8g/d3UL/L5sf8Ae3LX1WVY6dCf1ij03R+w8BcSYrJ8VHPsqfw6V6fdd0v6s/U/mJ+C+val4c8YW2mk/wCj6l8jp23etfdrnEyoTUvxt/Y01j4KfHl9d01d3hU7rqzf+6ztt2N/u0rMs+B2r+//AAVxtWvkXtZyvBt2/r1P9hfB3Paed8OU8xw8705u8fTqvvKbLjg1Cy7asuvcVHX7RTqH6bUplVlzUNW2XbUZAPWumMjjlTKrrl+O9f0vf8Gw3hWTUv2uvHPi5o8xab4XaEP3Ek9zDgde6q3v61/NSV3EGv7JP+DXDwBJafDj4qfE2eDC3t/Yadby/wB4QJLJIAfYumeTX5b43Zh9W4OxvefJH/wKSv8Ahc+C8QK3sclrv+ay+9o/q3ooor/PI/mo/9L+/iiiigD+AT/guP8AC9vhp/wUN8U3ltbtHaeIo7XV42PCu9xGBIRwM5kV8nPBycjOa/JG46V/Wn/wcm/A4X2h/D/9oHT4GLW0k+iXsoxtCsDPAD35bzeRz247/wAljfM3HSv6P4Oxv1nKMPJ7xVv/AAHT8j+suAcyji8lw0lvFKL9Y6fkkyntdelMZexq8y7qqMvlt7V9TGR99TqXKbLng1WkX9K0mXsarOp27K6IyO+nUM1o9vzvyWqtdNpumL52qzxWUTfNunk21curj+y9Hu9YmG+LT4JJ3T12LXw5qFxc+Kp18ReIWN1PefNyflRf4VVa/P8Aj3xDhw9CEIQ56sz5fi3jWGSxhBRvN7K+iXc+ntS+Jnw70+Qpc6gbtP4Rar5lYmg/E2w8Wa9a+G/BOh3d5cXUqxJ55WNW+avnG3hhtWNnuCD+HA+9X3L+zP8ACvxDcQ2CeFo9/iDxU0lvYEj5rS1/5a3Df3flyqfjX4Xm3jdncoSlTahHyX+Z+IcYeNWZYHAVMQpwh2/z/Vn3V8A/B/iH4tfER/C+hW1uPCnhfal3fjc3nzfxJD/sq2fmr9MtPs38QeLE03R0EGhaOjQPtH+vm/iVf9yq3gf4Z6D8Efhzpfwo8AJ5V7MuzzSPmaT70krV7T4f8N23hzTbfRE+5Gvy/wATbv4m/wCBV/PGe8ZY7MqqqYiq3a9vnu/mf5X+JPiljuIcbOvUqtwjdU/n8VR+cn/WhfSFIowiLwvaqzLjg1qsu6q0kdfN065+LOd9TNZf4H6VWkXy6vsuODUDL8ux/u16FOoaRkZcipzcutfmh+35+1pZ/BPwvD4M8PIl5r2pfN5fmbVih/vN/vV9n/Hr4weFfgX8OdR8eeKpgiW6MsUedrSyfwqv/Aq/kM+MHxK8SfGb4g6j498VTGa61CVmUZ+VV/hVf91a+/4Qwcp4iOJfww1+Z/Tf0e/DKWdZnHOMZD/Z6DTjdfHJfn5n0h4J/a803Tb8ReObK7+zXDZlMW2VQ1ffHwb+Omm/DXVtO8VaVqcUvh7Vm2JJI2xd39z/AGa/ChWuYYTbXMWWb71ewfCn4nWHhma48JeLIP7S8OaoqpeWx+8P7rxt/DIv3q/oHE8aYrFUalHG0oVKco8sltfs1bZroz+9eMaCzPB1qGKoRqUpxtKFkrrpJdpro/kf1rR6lDr3h+HxboL+dFIu5gnzba63SdYs9Wtx9lxuVfmFfhp+yT+0Vc/s2+LoPhp4qvzqngbXDv0vUHPyxb/4W/u/3XX+Fq/YnxNZ3Oiw/wDCZ+DIzeQ7fNeCI/M/+7X4zicNBTdKbt/I/wBGf5qca8CSyrGywNdWhO7o1H1/uPs/yfkeptInmbB1Wmfv3k/2a5nwX4w0H4haFF4h0SQFejD7rI38Ssv8NdPuYRts6+9eXFyUuU/HcVhauHqujUjZorMUac7/AJttfIv7RXwZ0rXNYsPi7oMJi13Q1+SWIssm3+Ldt+9/wKvsDbuUVDcWttNG32lAw+6Qa93J8zeCxMMRa6XR6p+TPU4Yz6tkuY08dTtJL4ovVOPVNdmfG1tJoP7SHw7k0TVcJqlqvQ/eNflL438IX/gfxFP4e1lCpiPyk1+qnjjwlc/CXxtD458NxkWdw+6VB93d93ZWJ+0h8I7D4peEYvF/hhAbqNN77f738Vf1N4ccd0MizClGM/8AhPxW1/8Al3Pqv66WZ/dfgl4s4bhDOqEKVT/hFx70T/5cVXvF+V/vVmfkhLH3HQ0zk1dnt57S6ksrkYeM4NVGjINf2fQrxlHngf6YRlCrCNWm7xkVKiZdtXCuTUJGOK7acjCpTK7fcKd6/wBEP/ggt8IW+FH/AATc8J3lypS48V3V7rkqsMMvnSeUgOQDykSt6c8cV/n7fDnwPrfxL+IGifD3w7A9xqGu30FjbxxjLvJO4RQB3JJr/Vd+E/w90n4SfC7w58LNB5svDmmWmmQnG3clrEsYJA7nbk+5r+a/pKZ4o5fg8ri9Zzc36QVl97l+B+L+LmNjDDYfBreTcvlFW/Fv8D0Ciiiv49Pwk//T/v4ooooA+JP+Cin7Og/ak/Y98Z/Cm1iEmpPZm903K7iLu1/eIAPVwDH/AMCr/N9uLWa11CfQ7lSkkLFXU9Qy8EH8a/1Xa/z+P+Cxv7J3/DLn7Z2rz6Ja+T4e8X79Z00qMIguGJmjGOPkl3DnJVCCOor9S8Nc1UatXL5v4vej6rf71+R+x+E2d+zrVstqS0n70fVb/ev1PygZdtMZdwqzULLtr9iP3ynUKDL5be1Mkwq7+1X2XcKpuvl/f+7WkZHo06hQuLewvrOaxvztt76JoH/4H8tfF3iDwn4k8C3X9iaxbSPHH/qrmNN0csf8P/Aq+2pI4bgeXbttRfan2f2m4mWz3lxu24PzLXw3G/A2H4gpwlOfJOHU+d4q4Uw+cU1UnPknDr5Hyp8J/hrqvj7xNbv9gu5bCNt08iRN93+6v95m+7X9KX7GvwL/AOEN0KT4neKrMW2t6oixJbj5ls7VPljiX/gPzV83/sp/CjUvEmsRTPEUtLdf3nPymN/4/wDer9fbOzSxhSwhGEhXbX8P+KVDCZXiVluGr8818Xp0X6/cf5R/So42w+Dxv+rmXV3OUfjfZdF8935WMSHSYY74383zyt8qn0Wrkww1adVyN1flFOpL7R/Fn1mUzLmXbzVP94zfdrVki3SVj6jfJZx/INz/AMIrtoyvLlidlGLnKMIfEyGTYrZ/irB1rULPR9Nl1K/cIkKM5rSsWmmha6dcbu392vza/bS+PqWVn/whnh6Yb2+R8H+L+9X6DwNwniuIM2pZbh1o/ifZdWfrHhP4ZY/jXiOhkWCjo5e/LpCPVnwJ+254rb9pLxLDpsmq3VtYaWWWKGAr5W7+8y/xNX526l8AtejkZNB1KIp/03Xa1fUcpExaVnyWOTUhWNMyM2Self6H5f4TcO0cJDCrD7Le7+8/3O4Y8H+HskyqhlWFo2jTja99Zeb82fC2s/Cn4oaSxL2guo1/5aWzZ/8AHa80nS9065MGoQyW0n3cTLsr9L87GytU9V0jTdagMGqW0VwjdpEDV4+YeDOFnH/Ya3J6mWYeF+HnGUsJVal2eqPjvwD44SGxbwT4zBm0W8bdkfetpP4ZY/8A4n+Kv2w/YR/agm0u8T9nj4m3ga5jVf7Ju3P7u5h/hXd/6BX5UeJPgD4Xvw7aDNJp8p+YBTmP/vmuUttL8ceB0hsNfR5ItPfzbDUbbczW0m7d838W1v8Ax2vx7i3wszbC05OdLnh3hqfzR4teBOIzDAVadSlzJ9Vryv8AmXbz7o/o8+I2k+Ifgvr1z8Y/AcZm0y4+bV9Oj/jX/nvGv/PRP/Hq+kPBPizQfHHhm08SaJOlzaXUe9XSvif9iv8Aas0f9orwafBnjB0TxLpaeVcRMf8AXr93etYPiC41v9jv4nLrcIeX4e+IJ/38Y+ZdPuHb76/9M3r8Unhp80sPV92rH8T/ADezvhPEutVybHQ5cdR+D/p5BdPXt32P0gZc8GmHG395VDTdSsNYsY9SsJRJBMqukiHcpV/u7WrSZc8GuKMre7I/HMRQlTk6dSPvHN61otnr2ly2F+NyMvy5/hb+9XmPgPQbzw79p8N6kMw7m25+6zfxN/utXtMi/uyhqrJHC22aYZZe9e9g81q06EsOvgf4NdT0sPndehgqmB3pytK38rWzX5H5K/tcfAt/DGqHxnoKbrab74H8K18MNgxbQOe5r+iXxZ4R03xlo82k6kmUkXv/AHq/Dv4z/DLVPhf4um02eMm3ldtj9jX9u+A3iZ/aeEjkuOn++pr3W/tL/Nfkf6j/AEQPHWOfZdHhXN6v+1Ul7je849vVfkeJ1Gy9xVp13cioTGWIXHPav6bp1LH9wVKZ+7H/AAb7fswn44ftyW/xO1m3MujfDm1bV3ZlOw3rHy7VcjA3K5Mi5A4jPFf34V+MP/BC/wDZAb9lz9inTvE3iK2MHiX4htHrd8HGHjtiuLSI88gRkyDIBBlIPSv2er+A/F3iiOd8SV6tGV6VO1OHpHd/OXM/Sx/I/HucLMc4qzg7wh7kflu/m7/KwUUUV+Ynxp//1P7+KKKKACvyM/4LN/sdS/tWfsk3ureF7fzvFHggyatp4QAvNCq/6TCM/wB5BuHXJQDvX650jKrqVcZB4INdWBxlTCYiGJpO0ou6O3LsdVwWJp4qi/eg01/l6PZn+U9dKyAW2CHQ8g9ac37yZfMr9qf+C0n7Bg/ZR/aCPxN8CWbR+C/G0kl1bhV/d2t2OZbc8AKoJ3r3KnqSvH4tXDed86V/TOVZjSx+Fp4qg9Jb+T6r5H9Z5Lm1LMMLTxVF3UldeT6p+hVZdtMZdwqzUDDaa9E+go1Ciy7Y9idf4a9O+HPg/Ute1yCztkLzTMrNgdY/4q89hh8y4V9ufav1W/Yi+DMwuG8bawm9F2vFkdG/u18F4kcX0uH8kr4ucvet7q7t7L+uh+TeOvidh+DOFsVmlSXvcvLBd5vZfq/I+7fg78OLDwD4JttJRAJGVWb+8v8As16i0e1m31bCx7Tt+Vqib5V+av8AMnMMxrY3FTxWId5zd38z/BLOs+xWbY6rmWMnz1Kkm36sidN3NUmXPBrSZUZd9ROm7msYyOKnUMOaRLdT/Ft6159bsniTVHeFilvGvT1X+9/vVq+LtYuVuE0fS1y8n3iP7392qus6lonw98MzX1+Qvlrub/akr6PA4eoox9nHmqz92Mf1/wAj7rKcFVUKcKcOavW92EVv2vbz2R4t+0d8YLD4S+C5vJcfbJkbamf4a/n/APFXibUvFutza3qbl5JG+X2Wvcf2jvi9qvxU8bTb5j9ljfgA/Lur5x8pldgBmv8ARjwW8PKfDeVRrYiP+01tZvt2R/tr9FnwOpcC8OxxWNivr9eKlN9l0j8uvmR0ZNMVs8U+v3SMj+rApytim0V105GY8/pRtR1ZH6Uitto25Py10pqSszKcE9GZ1jZHwp4ss/iD4DuX0TXrF90VxB/q5P8AZkX+JdtfuP8AD3xl4b/ae+Eb6J4zt4vOvoPKvLcHcqt93cv/AAL5q/EwRwgbpOnrXqnws+JuufDXxDDqVhIRAWXeM/8Aj1fjPiR4SYLOMLLF5dDkxUfeT7+TP5R+kD9HrCcV4CWZ5RFU8yo+9Bx+15P16Pufe3wDm8T/ALO+qTfBbxzqJ1LS/tUn9myyfK0Nv/CrN/s1+gsbedGuwgj+E18f+MtP8K/HzwHH4l8Ozf8AE1tU3K6fe/2mrY/Z1+K0uuWZ8GeIXzqVn8rF/l3f3Vr+Ws74eVbL/rtCHJXo+5Wh2fSfo+vmf5lcf8Ff2jlc86w1F08ZhvcxdK2qeyqpdpdez9T6sqNlQrmrLKG9qir8+p1D+cJRKcivyifLtr5o/aM+D1t8SvB8k0KA3luu5CB/DX0yzB1/ulqreW5XY4+X0r6bh/PcTleMpY7CytOEro97hXiXHcPZtQzfLZ8lSnJNf15n832q6bc6RfzafqC7JImwymv0g/4JPfsZTfttfte6B4Jv7dm8L6Cw1jXZRnb9jgYYi7YaZyqKeuGJIIBrA/ax+AOpy+Jo/EPg2xe6kvWAMUCFmZm4CADqSa/tI/4I9fsHRfsP/suW0Him2WLxr4v8vUtbJHzQ8HyLXP8A0xRju4Hzs3YCv7kz/wAYsNU4PhjMFP8A2mvHlS6xf25fJbebR/s9lXjXgc/4Jo5zgai+sVo8jj1jP7T9F082j9X4YYbeFbe3UJGgCqqjAAHAAA6AVJRRX8hn4sFFFFAH/9X+/iiiigAooooA+Zv2vP2YfBX7XvwF1v4I+NgI01GPfZ3W0F7W7j5ilX/dPB9VJHev85748/Ajxx+zZ8WdY+EfxQsnstU0aZopFYECVBgrInXcHGCDkhlIINf6fVfj5/wVs/4Jr6N+238Kz418C26QfETw3A7WEoGPtsAyWtnPqeTESDhuDkGvueC+JVl9d4fEP9zPr/K+/o9n95+gcCcVLLMQ8NiZWoze/wDLLv6PZ/f0P4JZlSSM+T/FT7Wxuby4hhRd7syooHetHVdC1PwzrU+ga3bvbXVpI0M8MylXjkQ4ZWB5BBGCK+sv2Sfg3P4+8ZJrWpL/AKNZt8wx/wCPV+s8TcQ4fJsrrZlXl7kY3X97y+Z+ucc8c4LhbIcTnmNqWp0otr+9/Kvm9DB8O/sw/EW41zT4ZrIrBcPvYn+JU/u/7Nftv4D8LWXgvwxbaJYrjyxl/wDerdhtraC3hWJQBCNsfHSr4GwBUHFf53eIXinmPFSpUsSlCnC+i6t9X8j/ABW8avpEZ34ixoUMbBQo0ruyvq29G/NLQuKcVI67hiq6tuFSBsV+VH4FGRWkifbsRttYmuahNpmn+ci/N91a6PMaozVxUljNrGpedc/LCvf+8tehhUnLmqbI93KXGU/aVvgX9WMTw/pbQ+Zr2q8Ft24v/wChV+WX7a/7QT6ndTeBvD0/7r7rsP7v96vsn9rT46WHwv8ACL6PZzD7bcLtUD/0Gvwc1jUn17UX1bUsvJMzNnP3a/rv6P8A4dvH4j/WXM4e4v4cfNdfRdD/AEs+hl4IzzjHf6957S/dQdqMbbtdfRdPP0OeZdzb35b1qtLH/GKvyR7fnSoK/tunU6H+rdOdtDMZc8ihHq3JH/GlVGXPIrtp1DqjIfRTFbPBp9dcZGgU5W202iuunUMrDm/Snp0pitto/PFdVOoRKJ9CfAL4zar8LfFUSSMZbO4bY8f3t3+zX198VtGufB/iKw+OXhJHhguG3zoBtw393b/s18KfCC/8MWPxCsrvxbHutFfkV+6OteF/DHjDwKulIgezki3Rf7Py/LX8u+L+aYXI+IcNiVh2lWTjUf2KkdmvVf5H+b30pM5y7hHjXA4+GCahiYOFeX2KtN6NW/mW9/QZ4D8ZWHjzw3baxYOH8xfnx/errdskcyp2avz6+BviDUfhH8SJ/hprZxbXD7YM/wDfVfoiuJOe9fztxfkayrHuFF3ozXPB94vb7tmfwB4p8GQ4ezhwwz5sLVXPRn3pz1XzWz80VmXPBprjctWGXdUVfO06h+WSiXfDOuXvhXxZpHjWyjV7vRLuG8hV1+UvEwYKfZhwfY1/YL8I/ib4f+Mnw40j4leGCfsmqwCUIfvRuPleM8DlHBUnvjI4r+OBlfzPOdco3y1+tf8AwS3/AGiT4P8AGtz8BPEk4Gna6/n6eztgRXoXlBkn/XKOR13gAZ3Zr6jKMc1JUZvR7H9AeA3G8stzP+xcVL9xiPh8qi2/8DWnrY/fqiiivpj+0wooooA//9b+/iiiigAooooAKKKKAP5+P+Ct/wDwSU8K/tA2WoftMfBnyNG8W2cZuNXgYbINQhjHzykgHbMqDJI4kA555r8u/gV8NYfhp4Mg01wPtGOWx822v6Ev+Chn7R8HhLwy/wAEvC8obUdWi/4mTKeYbZuRHkdGlHJ64TqPnBr8S02uQB1HSvyjxS42xWJoU8hhWvTp6yXZ9I/Lfy2P4y+lL4v4jGKhwXhsRz06PvVF0Un8ML9eVata2bS6NLVp6tjg1TRs81Zr8JlE/jCnULFTBtwqorY4NSE4FQdMZEjorxFJOQ1cD8RPGmj/AA18Hz6xeSBfLVtin+9XbT3S2dk95eHasY3Ma/FL9sP48zeNfE58KabKwtYWZWwfl2/3a/S/C/gTEcUZxDDLShHWb7L/ADZ/Qn0efCPF8f8AElLL4prCw9+pLsl09Xsj5X+NXxQv/ih40uNSv2LJv+X3/wBqvI5oZLeSNE+ZatyRutw0033VqsVdW85/utX+m+V5fh8BhaWEw0bQgrJH+/XDmU4TJ8voZbl8FClTiopLyKdVZI/40rTZccGq5Ur1r14yPo6dQzqryR/xpV6SP+NKhrpp1Dtp1DMZc8ihHq3JH/GlVGXPIrtp1DpjIfRTFbPBp9dcZGgU5WxxTaK641DMnLyRlXjO0pzX7I/sb/Fn/hM/CTeGNTOZ7Lue9fjYAY5NsnFe5/AD4k3Pw68fW15vP2aZ1Dp6t/DX5r4s8Ix4gyCrShH99T9+HqunzR/Ov0mfC6nxnwdiKVOF8VR9+n3ut181ofpL+1X8O7m40+38f+Gwftliy5x3+avafg348Txx4Hs9VRg0qrsZP4v7td/cR2fjLwi8MOHivovy+WuH/ZU/Yz/aPGm+K/HXh/RpLjwjowDSXJIAcKfnES8FghBLAKPl6dq/jnCYuOa8O1cvxUv3+GleF93F/FD5PVH+VGXxfFPBWIyPEa4/L5OVNP4nTb9+Hyeq+Z6zjctVmXPIq5t2r/eFMZd1fnsKh/OE4Huf7N2ieFPGvjdvhf4wMcMPiONra1uSObe7HMLZ/ulhtI9Ca8v8QaF4w+EvxCm0nUFl03WdDugT1Vo5omG0qe4OAQRwa5aC8uNM1GHULVik0MgdHU4KuhBB/MV+lH7Xvhi1+NfwS8M/te+F4hJeSxx6d4hCYOJ4wESUjjqR1PHK5FfQYVe1oOUPijr8v+Afd5PlizPI69TDK2LwT9omt50m/e+dOVpJ9nLsj9rf2Z/jZpv7QHwc0j4i2ZVbmaPyb6JT/qrqMASD2B4ZevysK97r+eX/AIJYfG5vA3xWuvg9rc22x8ToGtwx+VL2AEgDJ43plQB1O38f6Gq+ywOJ9vRjU69T+1/DjitcQ5Dh8fN/vbctT/HHR/fpL52Ciiius+6P/9f+/iiiigAooooAK8Y+P3xh0r4G/C7UfH2obXmhXyrSFiB51y/CJyRnnk8j5Qe9eysyopdyAoGSTwAK/nh/bb/aIk+OHxP/AOEe8Oy7/D+hM8FptJxPL/HMRnoSMKeoUD+8c/OcUZ5HLMFKqn+8lpFeb6+i3/DqflfjB4h0+EOH6mMg08TU9yjHvNr4rdoL3n3do9T5si/4Tj43/E3aTLqeua5dkerPJK3JPUKFH0AUdgK+iP2sfhF8Mfgg2gfD3wnctd+I7a1MmtTbjsZ3wU4424GcDj5SDyxNfZH7Lnwk0X9mD4O6n+018U4NurSWpks7eQYeGJxhFA/56TEgcDhMerV+SvjLxZrPjnxXqPjLXpTPfalO08jZONzHOADggAHHIAAwBX4zmmXwy/LubFR5sViPe974oQ3b/wAUn+F13P4j4nyClwxwrGpndNVM3zJ87c9ZUKSfNza6qpUlZN9uaPR3xASOanVs8iqwYHrTgcGvgZRPweEy8GIG4Cl2h2GetXl0rUV0sa3JCy2fmiFZDwrSEZKg9yBgnHSvJ/in47svh74TufENycMi/LXRgsur4rE08LRjec3aKPpsnyTGZjjqGXYam5VariorvzdfQ+bP2vfjt/wgnhp/DGjyD7VMu1ip+ZW/u1+JmoXM19dPeallnkbcx9a9C+KHjrWPHniS417VXO6R22ZP8NcBMqbo5k+bb96v9KvC3gShwvk9Ogo3rT1m+77ei2P96vo7+EmE4A4ZpYJRTxFT3qk+7tt6LZFArgezUxl/75q+y7hVNv3bf7Nfp0ZH9EU6hTZc8GoWXHBq+y9jVZlzwa3jI76dQolSvWqkkf8AGlabLjg1XKletdMZHfTqGdVeSP8AjSr8kf8Ac/KoWVx/DXTTqWO2nUMtlzyKEerckf8AGlU3XuK7adQ6oyJKKYrZ4NSqrMwVRkk4AHrXXGZYofHyMM1oafp+p3uow2WkRPcXczBYYo1LOzHoABySfSv09/Y4/wCCRf7YX7Z0sGv+HtFPhfwzIy7ta1lWghZM/wDLFcF5u+dq/exnGc1/Yp+wl/wSQ/Zf/Ydt7fxLpNofFPjVVHma9qSAyRt/07RcpAPcZfr82DivhuJPEfLcqhKnGXta38kdl/ifT01fkflnGPilk2TwnQjL21fZQi9F/ilsvTV+R+BXw5/ZR/aZ+B/7P3hvxt8dNDl0e31kukcMxBubdsEqJ0+bYZFyVUjgAggHFfs1/wAEqvizaTx+IPgbrWCJydRtFfOG4Ec6YIwcjawA7ZJFfqT8ePhHpPxz+FOr/DTVmEX2+L9xMQT5NxGd0T8EH5WAyAeRkd6/ml+FHiPxP+zl+0Vpl7qMTWt/oOpm3vojjPlg+VMhPoyliOme2BX8RZ9WeHzpZnGPLCrJ8yXwq+/+a9D/ACg43p/6tcd0OJaEFDDYuTVRL4U5O0lbtZqa84vsZP7TPwtPwT+Nev8Aw6jjItba5eW0znm2uMOhJPDfKQDjuMdq8DaHC76/bP8A4KrfCuz1LRvD/wAcdHTft/4l91ImcGOQF4WJHYHcPxHcAV+KTcR7f7tfK5thvquMnTjs3f5SP5/8TeG3kvEOJwsVam3zw/wS1t8m2vkUJo/mx/C1fpZ/wT28XaP4tm8R/sw+OJC+keMbN1gUsMR3EQyCoIGDgZHXlVr84hHuj3/xVs+DPF2teBfF+n+L/D0vkXmmzrcwspxh4zkH6EcH2Na5bjfZVozey0fp1PJ4Lz55Nm+HxslemtJx/mhL3ZK3W6/FGxr+ieLPgb8VbjSrjfa6z4Yv1YOoKsHifKsG6neQDzkDgjiv60PhL8Q9M+LPw00P4kaQNsGs2kdyF/uMw+dP+AsCv4V+GH/BRnwjo3i3R/CP7VPhBAbXxfaRQ3ezlVuETKZODyV3J2O5OTjNfcH/AASw8cT+Iv2frvwpcyF/7A1GSKIH+GGdRIB/32XOenPFfYZZfD4qphvsvWJ/SHhjSfD3FuP4djK9CrFVafmt4v5wbv5xP0yooor6E/pA/9D+/iiiigAooooA+Nf27vifefDT9n6/XSpDHea3KmmxspwypKCZSPqilc9iwr88f2Dv2VP+Fma6nxb8f25/sPS5v9FgcHF3OpzyCOY4zyeoY4HQNX6R/tPfs8337Q2q+EtGnn+zaNp11Pcai6thyhVQqoOQSxBGSCB19jwH7Wvx68N/sx/CiD4cfDkR2ms3Vt9n0+3iHFrbqNplPoQPu55ZsnnBr4rN8vhLHyzPMH+4oxXKv5pb3t6tJLq7H888dcMYepxNU4w4qkllmX0o+yg9eeo/ecuV6NqTUYr7UlFbJ3+Jv+Ch/wC0UfGvisfCHwvPu0rRJN106N8s11jB+ojBKgdS2e2K/NIvtQbe9NmlnuHaaZy7uSzMTklmOSSfUmmq4B2mvxbPMyqZji6mLqu19l2XSPyP8/eP+OcZxVndfOMXpzu0Y/yQXwxXot+7bfUsbgyiM9f4q7z4a+Adb+KnjjTvBPhqPzLvUJVjTuEUn52bkYVV+YnJGBwDXAI+M46mv0V+Bmkj9nr9n3Wv2idWjCazrStpfh8MeVEgxLMvHbB29/lx/FWOTZYsVibV3alD3pv+7Hf79l5tHp+HPDNPOc0SxjthKMXVry/lpQ1a/wAUvhj/AHpI8P8A2ndX8MW3jW3+FvgMj+wvCURsYWzzNcZ/fzH1Zn4zk8AdOK+9f2av2F/g/wDEr9nmd/jvoEOrnxagkCy5V4bUf6vYykFWbl8g8gr6V+df7OHwlvvjt8Y9P8KyFmtWk+0X0nXbAhy/PUFvug8jPTvX9NdnaWun2kVhYxrFDAixxoowqqowAB6AcV+l8AYF4rG1s7nHlSfLBdrdv8KtFfM/rj6PGQzzfOMdxxiaShDm5MOukUrL3eyhBRhFrz7H8wX7Sn/BuL4V1drnXf2YPF0mnyHLJpetDzIunKrcRruAbpgx8ZPNfgz8e/8AgmJ+23+zm00/jzwNf3OnwfM99pqfbbULkgZkiDAf8CwQOTgYA/0a6K/pDLOPczwqUKrVSK6S3+9frc/v/J/ErNsElCo1Vh2lv96/VM/yoL+wubCdobuKSF14KyKVYfgcGq0i2bL++5Nf6bvxZ/ZF/Zi+OdvJB8V/Aujay0p3NNLaok5J7+cgWT/x6vzR+Kf/AAQD/YG8fiWfwxZ6r4VnfJX7BdmSJSRjOyYOT/32K+0wniZg52WIpSh6NNfo/wAD9Hy3xgy6VliaEoPurSX6P/yU/hAZoYvuCmM2fuDNf1x+L/8Ag2f8OSq8ngb4pzof4I77TVIHsXSXnPJJ29eRjpXznrP/AAbT/tGRSkeH/iF4cnj5x9oS6ibnt8sTjnvxX0FDjvJZf8v7esZf5H1+G8TOHqn/ADE29YyX6H8z7t2FQs22v6PH/wCDbP8Aa6L7f+Ex8JEeolux/wC21adp/wAG0/7UUxA1Hx54WiU4z5Zu3Ix0wDABx2yT1rt/13yVf8xEfuf+R60fEbhyKu8bH7pf5H808ypJ86Ltqs0d+33HFf1geCv+DZDXZMf8LC+KdvAD1Gn6e0x/OWSP+VfVvw5/4NsP2RvD0gm+I3irxD4jYYO2ForGMn6BZWx9GH1rnqeJGS0V7tRzflCT/OyOTEeL3DVGOldzf92Ev1UV+J/EY6ufvjbXrnwt/Z7+N3xs1VNC+Evg7V/Ety/RNOtJZsc4+ZlHAzyeQAOTX+hJ8LP+CRn/AATw+EV1b6l4e+GmnXt5bEFbjVGkvmJHcpMzR/8AjlfoToHh3w/4V0qLQvC9jb6bYwDEdvaxLDEg9FRAFH4Cvn8d4uwStg8O2/77svuV3+J8lmXj3RjHly/CSk+9SSS+5Xv96P4i/wBmf/g3S/av+KEkOr/H3UrP4faW+1jCSt9fFWGfljjJRSD1V3U+o61/RX+yl/wRh/Yf/ZajtdXTw8PGPiG32t/amvBbkrIBgmODHkoD15VmB/ir9YqK/Ps445zjMk4Va3LD+WHur8NX82z8lz/xK4gzdOnXxDjTf2Ye6vw1fzbQ1VVFCIAFAwAOABTqKK+QPgwr8TP+Cn/7P507VbT9oHw1B+7uylnqgQY2ygYil4xjcMIxzxgY5NftnXJeO/BPh74j+D9Q8D+KoBcWGpQtDKh9G6MPRlOCD2Irz81wEcZhp0Hu9n2fRny3GfDFLP8AKa2XVHZyV4y/lmvhf36PybPgTwBLF+1J/wAE+JvDv/HzqVtpz2ZVjlxdWGGi9wzKqfnX89aoYi4UElSRg8EEV/QJ+w34V8SfAb4o+N/2dfFAJSPytT0+bB2Twg+WXXPqCmR2IPJ5r8fv2pPhz/wq34/+KfBduvlwRXjTQZ7W9x+9j68dH259uvavh8/p1HgsPiakffj7kvVf8M/vP5p8W8qxOJyHKs3xUeWvTToVfVaK/wA4yfzR86bmYbKqxRS3l19lhjMjOwCgZyzHoABySfatncir717x+yl8TdD+FX7QPhzxn4itkmsYJzFOWAPlrODGZeeMpu3DPPy8eteDgWqlWNOT5YtrU/C8lwWHxmPoYTE1eSE5pOf8qbtzH6j/ALPfwA+JfxS/Yb1v4I/ErTpNMkklafQ5LvKMrZEiHByyqHB5I5DnAxX0l+wh+zV4q/Zv+HOpaf45libVdXvBO8cDb0ijjXag3dySWY44GQK+4kdZFDoQysMgjkEGnV+t0cFCnyPeUVa/kf6C5VwXl+Cq4TE6zrYel7KM29eXzS0utl2TaCiiius+uP/R/v4ooooAKKKKAKOpxahNp80OkzJb3LKRHJInmKrHoSoK5x6ZFfHmofsK/B7xTr9z4t+I9zqfiLVLw7pp7q42Lu/2VjC7VGMBckAcCvtGiubE4OhiEo14KSXRq6+56HkZvkGW5rCNPMsPGtCLuozSlG/fld1fs7XR8BeMf+CcX7P2v6c0HhtbvRbkKQksUplXJ7usmS303DivyB/aE/Zu8c/s8eJl07xIouLC5J+yX0Y/dSqOMHjKsByy4JHUZFf09187ftW+CfDnjj4BeJrXxFbrMLGxnvbdsDdHNAhdWUkHHIwfY18lxFwfgMThp1KNNQqRTaaVlp0aWn6n4X4r+A/Dea5PiMVluGhhsVSi5RlCPLF8qb5ZxjZNNK10uZPW7Wj/AJ7/AIB/CLWPjZ8UNM8A6ZuWOd/MuZAOIbdMGR+fbgA9Wx3NfRP7dHxO0rxB4+s/hP4L2x+HvBsH2GCOP7rTLgSHjqF2hfcrnvXuX7F8UPgP9mD4j/F7w+irr1tHcwxXDjdsSGIOuOn8R3H1IHYCvgv4I6Bp/j340+GtA8TBp7fU9Ut47kbvmkV3+YE/7Xevzmphvq2VYfC0/jxUk5P+6mlGP36s/l6WWvJ+DMrybBu1fOZqVSfSNOElGnT725nzy+7U/Y3/AIJ7/A1/hv8AC9vHuuRbdT8RhZEBGDHaDmMe2/7xxgEba/QWo4YYbeFbe3UJGgCqqjAAHAAA6AVJX7dlmX08DhaeFpfDFW9e7+b1P9DOFeHMLkGU4bKMEv3dKKiu7e7k/OTbb9QoooruPoAooooAKKKKACiiigAooooAKKKKACiiigAooooAKKKKAM+XSdNn1KLWJYEa7gRo45sfOqPjcueuDgcdOK/Ef/gqr8LJ7DxpoXxb06EmDUrc2F0yg4E0BzGWIHG5WwMkH5eDmv3IrmvF/g7wx4+8PXPhTxjZRahp92u2WGUZUj+YI7EcivOzXL1jMLPDt2b2fZrY+U414Xp8QZRWyyUuVys4yttJO6f6PybP48pIf46haPe20ZOSAcdc17T8f/A+ifDj41eJfA/hzzPsGm3rwwCVtzhB0BbAziuW+EukWWv/ABT8OaJqS77e81O1ilUd0aRQR+Ir8dhTkq/sG9b2/Gx/nvLKp080/s2UldT5Lra/Na/p8j+qX4HWmsWHwZ8KWfiB2e9j0mzWYv8Ae3+UuQfcdDXqdIqqihUGAOABS1+4xjypLsf6XUKXsqUaad7JL7kFFFFUan//2Q=="
+# Spotify Rate Limiting
+SPOTIFY_REQUESTS_PER_SECOND = float(os.environ.get('SPOTIFY_REQUESTS_PER_SECOND', 10))
+SPOTIFY_MIN_REQUESTS_PER_SECOND = float(os.environ.get('SPOTIFY_MIN_REQUESTS_PER_SECOND', 1))
+SPOTIFY_BURST_SIZE = int(os.environ.get('SPOTIFY_BURST_SIZE', 20))
+SPOTIFY_MAX_RETRIES = int(os.environ.get('SPOTIFY_MAX_RETRIES', 8))
+SPOTIFY_READY_RETRIES = int(os.environ.get('SPOTIFY_READY_RETRIES', 4))
+SPOTIFY_READY_BACKOFF_SECONDS = float(os.environ.get('SPOTIFY_READY_BACKOFF_SECONDS', 0.25))
+
+# Spotify Response Cache - GETs revalidate with If-None-Match and a 304 reuses the cached body.
+# RESPONSE_CACHE_SIZE=0 turns it off; RESPONSE_CACHE_DIR (e.g. /tmp/spotify-responses) also keeps up to
+# RESPONSE_CACHE_DISK_SIZE shared (non user-specific) entries on disk for warm containers
+RESPONSE_CACHE_SIZE = int(os.environ.get('RESPONSE_CACHE_SIZE', 512))
+RESPONSE_CACHE_DIR = os.environ.get('RESPONSE_CACHE_DIR', '')
+RESPONSE_CACHE_DISK_SIZE = int(os.environ.get('RESPONSE_CACHE_DISK_SIZE', 2000))
+
+# Spotify HTTP Transport - pooled requests session used when there is no aiohttp session
+HTTP_POOL_SIZE = int(os.environ.get('HTTP_POOL_SIZE', 20))
+HTTP_TIMEOUT_SECONDS = float(os.environ.get('HTTP_TIMEOUT_SECONDS', 30))
+
+# Chron Jobs
+MAX_USERS_IN_FLIGHT = int(os.environ.get('MAX_USERS_IN_FLIGHT', 10))
+ALBUM_CACHE_SIZE = int(os.environ.get('ALBUM_CACHE_SIZE', 2000))
+# Above 1 the scheduled invocation coordinates and each shard of users runs as its own invocation
+CRON_SHARD_COUNT = int(os.environ.get('CRON_SHARD_COUNT', 1))
+# 'lambda' invokes the function itself per shard, 'local' runs the shards in-process
+CRON_DISPATCHER = os.environ.get('CRON_DISPATCHER', 'lambda').lower()
+# Time left when a run stops taking users - enough to drain the users in flight (and queued) and flush results
+CRON_DEADLINE_MARGIN_SECONDS = int(os.environ.get('CRON_DEADLINE_MARGIN_SECONDS', 120))
+# How long a worker's claim on a user holds off other workers - at least the Lambda timeout
+CRON_CLAIM_LEASE_SECONDS = int(os.environ.get('CRON_CLAIM_LEASE_SECONDS', 900))
+
+# Spotify Access Tokens
+ACCESS_TOKEN_REFRESH_MARGIN_SECONDS = int(os.environ.get('ACCESS_TOKEN_REFRESH_MARGIN_SECONDS', 300))
+PERSIST_ACCESS_TOKENS = os.environ.get('PERSIST_ACCESS_TOKENS', 'false').lower() == 'true'
+
+# Authorizer
+AUTHORIZER_TOKEN_CACHE_SIZE = int(os.environ.get('AUTHORIZER_TOKEN_CACHE_SIZE', 1024))
+# Allow policies cover every route of the API, so API Gateway's cached result is reused across routes
+AUTHORIZER_WILDCARD_POLICY = os.environ.get('AUTHORIZER_WILDCARD_POLICY', 'false').lower() == 'true'
+
+# Playlist Images - packaged under lambdas/common/assets
+IMAGE_ASSET_MMAP = os.environ.get('IMAGE_ASSET_MMAP', 'false').lower() == 'true'
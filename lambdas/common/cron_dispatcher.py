@@ -0,0 +1,265 @@
+import json
+import asyncio
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+import boto3
+from botocore.config import Config
+from lambdas.common.constants import LOGGER, AWS_DEFAULT_REGION, CRON_SHARD_COUNT, CRON_DISPATCHER, CRON_DEADLINE_MARGIN_SECONDS
+from lambdas.common.user_scheduler import run_user_pool, UserStream
+from lambdas.common.run_ledger import get_event_run_key, is_run_complete, process_claimed_user
+
+log = LOGGER.get_logger(__file__)
+
+# ------------------------
+# Shards
+# ------------------------
+def shard_index(email: str, shard_count: int):
+    """Stable across invocations and containers, unlike hash() - a user always lands in the same shard."""
+    digest = hashlib.sha256(email.strip().lower().encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big') % shard_count
+
+
+def get_event_shard(event: dict):
+    """The (index, count) a worker invocation was given, or None for an unsharded run."""
+    shard = event.get('shard')
+    if not shard:
+        return None
+    return int(shard['index']), int(shard['count'])
+
+
+def in_shard(email: str, shard):
+    if shard is None:
+        return True
+    index, count = shard
+    return shard_index(email, count) == index
+
+
+def is_shard_coordinator(event: dict, shard_count: int = CRON_SHARD_COUNT):
+    return shard_count > 1 and get_event_shard(event) is None
+
+
+# ------------------------
+# Deadline
+# ------------------------
+class Deadline:
+    """
+    The invocation's time budget. `expired()` turns True once less than `margin_seconds` remain -
+    the job stops taking users then, and records where it stopped with `stop(cursor)`.
+    Without a Lambda context (local runs) it never expires.
+    """
+
+    def __init__(self, context=None, margin_seconds: int = CRON_DEADLINE_MARGIN_SECONDS):
+        self.context = context
+        self.margin_ms = margin_seconds * 1000
+        self.stopped = False
+        self.cursor = None
+
+    def expired(self):
+        if self.context is None:
+            return False
+        return self.context.get_remaining_time_in_millis() < self.margin_ms
+
+    def stop(self, cursor: dict):
+        self.stopped = True
+        self.cursor = cursor
+
+
+# ------------------------
+# Dispatchers
+# ------------------------
+class LambdaDispatcher:
+    """
+    Hands each worker event to its own asynchronous invocation of `function_name` and returns once
+    Lambda has queued them - the caller never waits on a worker, so it can't time out before them.
+    Returns one result per event - None once queued, or the exception if it couldn't be queued.
+    Workers report through their own logs and the run ledger each finished user is marked in.
+    """
+
+    def __init__(self, function_name: str):
+        self.function_name = function_name
+        # Not retried - a resend after a lost response could queue the same worker twice
+        self.client = boto3.client('lambda', region_name=AWS_DEFAULT_REGION, config=Config(retries={'max_attempts': 0}))
+
+    def dispatch(self, events: list):
+        with ThreadPoolExecutor(max_workers=max(len(events), 1)) as executor:
+            futures = [executor.submit(self.__invoke, event) for event in events]
+            return [self.__result_or_exception(future) for future in futures]
+
+    def continue_with(self, event: dict):
+        """Hand `event` to a fresh invocation and return without waiting for it."""
+        return self.__invoke(event)
+
+    def __invoke(self, event: dict):
+        response = self.client.invoke(
+            FunctionName=self.function_name,
+            InvocationType='Event',
+            Payload=json.dumps(event).encode('utf-8')
+        )
+        if response.get('StatusCode') != 202:
+            raise Exception(f"Invocation for {event.get('shard')} not queued: {response.get('StatusCode')}")
+        return None
+
+    def __result_or_exception(self, future):
+        try:
+            return future.result()
+        except Exception as err:
+            return err
+
+
+class LocalDispatcher:
+    """Runs each worker event through `handler` in this process, one after another - for offline runs and tests."""
+
+    def __init__(self, handler, context=None):
+        self.handler = handler
+        self.context = context
+
+    def dispatch(self, events: list):
+        results = []
+        for event in events:
+            try:
+                results.append(self.handler(event, self.context))
+            except Exception as err:
+                results.append(err)
+        return results
+
+    def continue_with(self, event: dict):
+        """Run the continuation here and now, without a deadline, and return its response."""
+        return self.handler(event, None)
+
+
+def get_dispatcher(handler, context=None):
+    """`CRON_DISPATCHER=local` keeps workers in-process; otherwise the invoked function fans out to itself."""
+    if CRON_DISPATCHER == 'local' or context is None:
+        return LocalDispatcher(handler, context)
+    return LambdaDispatcher(context.invoked_function_arn)
+
+
+# ------------------------
+# Coordinator
+# ------------------------
+def coordinate_shards(event: dict, context, handler, shard_count: int = CRON_SHARD_COUNT, dispatcher=None):
+    """
+    Fan a cron event out to `shard_count` workers and merge what they return.
+
+    Each worker gets the original event plus {'shard': {'index', 'count'}} and only processes the
+    users that hash into its shard. On Lambda the workers run asynchronously and are listed under
+    'dispatchedShards'. Workers that return (local dispatcher) have the list values of their response
+    bodies concatenated, and those that handed the rest of their users to a continuation are listed
+    under 'continuedShards' - their users still in progress are not in the merged lists.
+    Workers that errored, or couldn't be queued, are listed under 'failedShards'.
+    """
+    try:
+        dispatcher = dispatcher or get_dispatcher(handler, context)
+        events = [{**event, 'shard': {'index': index, 'count': shard_count}} for index in range(shard_count)]
+        log.info(f"Dispatching {shard_count} shards with {type(dispatcher).__name__}...")
+
+        results = {}
+        dispatched_shards = []
+        continued_shards = []
+        failed_shards = []
+        for index, response in enumerate(dispatcher.dispatch(events)):
+            if response is None:
+                dispatched_shards.append(index)
+                continue
+            if not isinstance(response, dict) or response.get('statusCode') != 200:
+                log.error(f"Shard {index} failed: {response}")
+                failed_shards.append({'shard': index, 'error': str(response)})
+                continue
+            __merge_body(results, response)
+            if (response.get('body') or {}).get('continued'):
+                continued_shards.append(index)
+        results['dispatchedShards'] = dispatched_shards
+        results['continuedShards'] = continued_shards
+        results['failedShards'] = failed_shards
+        log.info(f"{shard_count} shards: {len(dispatched_shards)} dispatched, {len(continued_shards)} continued, {len(failed_shards)} failed.")
+        return results
+    except Exception as err:
+        log.error(f"Coordinate Shards: {err}")
+        raise Exception(f"Coordinate Shards: {err}") from err
+
+
+# ------------------------
+# Continuation
+# ------------------------
+def continue_run(event: dict, context, handler, deadline: Deadline, body: dict, dispatcher=None):
+    """
+    Hand the rest of a run that hit its deadline to a continuation invocation.
+
+    The continuation gets the same event (run key, shard) plus the `cursor` the run stopped at, and
+    picks up from that page. On Lambda it is an async invocation and `body` is marked 'continued';
+    the local dispatcher runs it in-process and its response body is merged into `body`.
+    """
+    try:
+        dispatcher = dispatcher or get_dispatcher(handler, context)
+        continuation = event.get('continuation', 0) + 1
+        log.warning(f"Deadline reached - handing the run to continuation {continuation} with {type(dispatcher).__name__}.")
+        response = dispatcher.continue_with({**event, 'cursor': deadline.cursor, 'continuation': continuation})
+        if response is None:
+            return {**body, 'continued': True}
+        if not isinstance(response, dict) or response.get('statusCode') != 200:
+            raise Exception(f"Continuation {continuation} failed: {response}")
+        results = {key: list(value) if isinstance(value, list) else value for key, value in body.items()}
+        __merge_body(results, response)
+        return results
+    except Exception as err:
+        log.error(f"Continue Run: {err}")
+        raise Exception(f"Continue Run: {err}") from err
+
+
+def __merge_body(results: dict, response: dict):
+    """Concatenate the list values of a handler response body onto `results`."""
+    for key, value in (response.get('body') or {}).items():
+        if isinstance(value, list):
+            results.setdefault(key, []).extend(value)
+
+
+# ------------------------
+# Cron Jobs
+# ------------------------
+def run_cron_job(event: dict, context, handler, job: str, run_job, build_body):
+    """
+    Handle a scheduled event for `job` and return the response body - the same for every cron handler.
+
+    Pins the run key on the event so shards, retries and continuations share it. The coordinator
+    fans out to shard workers; a worker awaits `run_job(event, deadline)`, turns its result into a
+    body with `build_body`, and hands whatever it didn't reach before the deadline to a continuation.
+    """
+    try:
+        event = {**event, 'runKey': get_event_run_key(event, job)}
+        if is_shard_coordinator(event):
+            return coordinate_shards(event, context, handler)
+
+        deadline = Deadline(context)
+        body = build_body(asyncio.run(run_job(event, deadline)))
+        if deadline.stopped:
+            body = continue_run(event, context, handler, deadline, body)
+        return body
+    except Exception as err:
+        log.error(f"Run Cron Job: {err}")
+        raise Exception(f"Run Cron Job: {err}") from err
+
+
+async def run_cron_users(event: dict, deadline: Deadline, job: str, page_iter, process_user):
+    """
+    Await `process_user(user, run_key)` for each user of a cron run and return (success, failures).
+
+    Users are streamed from `page_iter(start_key)`, starting at the event's cursor, so users on the
+    first page start while the rest are still loading. A shard worker only takes the users that hash
+    into its shard, users the ledger shows finished are skipped, and the rest are claimed before
+    they are processed. Once `deadline` expires no more users are taken, and the page it stopped on
+    is recorded for the continuation.
+    """
+    shard = get_event_shard(event)
+    run_key = get_event_run_key(event, job)
+    users = UserStream(
+        page_iter(event.get('cursor')),
+        keep=lambda user: in_shard(user['email'], shard) and not is_run_complete(user, run_key)
+    )
+    success, failures = await run_user_pool(
+        users,
+        lambda user: process_claimed_user(user, run_key, lambda: process_user(user, run_key)),
+        should_stop=deadline.expired if deadline else None
+    )
+    if deadline and not users.exhausted:
+        deadline.stop(users.cursor)
+    return success, failures
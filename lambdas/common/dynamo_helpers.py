@@ -1,6 +1,11 @@
 from datetime import datetime, timezone
+from concurrent.futures import ThreadPoolExecutor
 import boto3
-from lambdas.common.constants import AWS_DEFAULT_REGION, DYNAMODB_KMS_ALIAS, LOGGER, WRAPPED_TABLE_NAME
+from botocore.exceptions import ClientError
+from lambdas.common.constants import (
+    AWS_DEFAULT_REGION, DYNAMODB_KMS_ALIAS, LOGGER, WRAPPED_TABLE_NAME,
+    WRAPPED_INDEX_KEY, RELEASE_RADAR_INDEX_KEY, ACTIVE_INDEX_KEY_VALUE, DYNAMODB_SCAN_SEGMENTS
+)
 
 log = LOGGER.get_logger(__file__)
 
@@ -11,15 +16,25 @@ kms_res = boto3.client("kms")
 HANDLER = 'dynamo_helpers'
 
 # Performs full table scan, and fetches ALL data from table in pages...
+# Optional kwargs:
+#   total_segments - split the scan into N segments scanned in parallel on a thread pool
+#   projection_attributes - list of attribute names to return instead of full items
+#   filter_expression (+ expression_attribute_names / expression_attribute_values) - server side filter
+#   attribute_name_to_sort_by / is_reverse - sort the result
 def full_table_scan(table_name, **kwargs):
     try:
-        table = dynamodb_res.Table(table_name)
-        response = table.scan()
-        data = response['Items']  # We've got our data now!
-        while 'LastEvaluatedKey' in response:  # If we have this field in response...
-            # It tells us where we left off, and signifies there's more data to fetch in "pages" after this particular key.
-            response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'])
-            data.extend(response['Items'])  # Add more data as each "page" comes in until we're done (LastEvaluatedKey gone)
+        scan_kwargs = __build_scan_kwargs(kwargs)
+        total_segments = kwargs.get('total_segments', 1)
+
+        if total_segments > 1:
+            with ThreadPoolExecutor(max_workers=total_segments) as executor:
+                segments = executor.map(
+                    lambda segment: __scan_segment(table_name, scan_kwargs, segment, total_segments),
+                    range(total_segments)
+                )
+                data = [item for segment_data in segments for item in segment_data]
+        else:
+            data = __scan_segment(table_name, scan_kwargs)
 
         # If we passed in these optional keyword args, let's...
         # SORT the data...default is ascending order even if there are no sort args present.
@@ -31,6 +46,37 @@ def full_table_scan(table_name, **kwargs):
     except Exception as err:
         log.error(f"Dynamodb Full Table Scan: {err}")
         raise Exception(f"Dynamodb Full Table Scan: {err}") from err
+
+def __build_scan_kwargs(kwargs):
+    scan_kwargs = {}
+    names = dict(kwargs.get('expression_attribute_names', {}))
+    if kwargs.get('projection_attributes'):
+        projection = {f"#p{i}": attr for i, attr in enumerate(kwargs['projection_attributes'])}
+        scan_kwargs['ProjectionExpression'] = ", ".join(projection)
+        names.update(projection)
+    if names:
+        scan_kwargs['ExpressionAttributeNames'] = names
+    if 'filter_expression' in kwargs:
+        scan_kwargs['FilterExpression'] = kwargs['filter_expression']
+    if 'expression_attribute_values' in kwargs:
+        scan_kwargs['ExpressionAttributeValues'] = kwargs['expression_attribute_values']
+    return scan_kwargs
+
+def __scan_segment(table_name, scan_kwargs, segment=None, total_segments=None):
+    if total_segments:
+        # boto3 resources aren't thread safe - each segment worker gets its own
+        table = boto3.session.Session().resource("dynamodb", region_name=AWS_DEFAULT_REGION).Table(table_name)
+        scan_kwargs = {**scan_kwargs, 'Segment': segment, 'TotalSegments': total_segments}
+    else:
+        table = dynamodb_res.Table(table_name)
+    response = table.scan(**scan_kwargs)
+    data = response['Items']  # We've got our data now!
+    while 'LastEvaluatedKey' in response:  # If we have this field in response...
+        # It tells us where we left off, and signifies there's more data to fetch in "pages" after this particular key.
+        response = table.scan(ExclusiveStartKey=response['LastEvaluatedKey'], **scan_kwargs)
+        data.extend(response['Items'])  # Add more data as each "page" comes in until we're done (LastEvaluatedKey gone)
+    return data
+
 def table_scan_by_ids(table_name, key, ids, goal_filter, **kwargs):
     try:
         table = dynamodb_res.Table(table_name)
@@ -57,18 +103,20 @@ def table_scan_by_ids(table_name, key, ids, goal_filter, **kwargs):
         log.error(f"Dynamodb Table Scan by IDs: {err}")
         raise Exception(f"Dynamodb Table Scan by IDs: {err}") from err
 
-# Update Entire Table Item - Send in full dict of item
+# Delete Table Item - fails if the item does not exist, without reading it first
 def delete_table_item(table_name, primary_key, primary_key_value):
     try:
-        check_if_item_exist(table_name, primary_key, primary_key_value)
         table = dynamodb_res.Table(table_name)
         response = table.delete_item(
             Key={
                 primary_key: primary_key_value
-            }
+            },
+            ConditionExpression=boto3.dynamodb.conditions.Attr(primary_key).exists()
         )
         return response
     except Exception as err:
+        if __is_conditional_check_failure(err):
+            err = Exception("Invalid ID (" + primary_key_value + "): Item Does not Exist.")
         log.error(f"Dynamodb Table Delete Table Item: {err}")
         raise Exception(f"Dynamodb Table Delete Table Item: {err}") from err
 
@@ -86,30 +134,122 @@ def update_table_item(table_name, table_item):
         raise Exception(f"Dynamodb Table Update Table Item: {err}") from err
 
 
-# Update single field of Table - send in one attribute and key
+# Update single field of Table - send in one attribute and key, fails if the item does not exist
 def update_table_item_field(table_name, primary_key, primary_key_value, attr_key, attr_val):
     try:
-        check_if_item_exist(table_name, primary_key, primary_key_value)
-
         table = dynamodb_res.Table(table_name)
         response = table.update_item(
             Key={
                 primary_key: primary_key_value
             },
             UpdateExpression="set #attr_key = :attr_val",
+            ConditionExpression="attribute_exists(#primary_key)",
             ExpressionAttributeValues={
                 ':attr_val': attr_val
             },
             ExpressionAttributeNames={
-                '#attr_key': attr_key
+                '#attr_key': attr_key,
+                '#primary_key': primary_key
             },
             ReturnValues="UPDATED_NEW"
         )
         return response
     except Exception as err:
+        if __is_conditional_check_failure(err):
+            err = Exception("Invalid ID (" + primary_key_value + "): Item Does not Exist.")
         log.error(f"Dynamodb Table Update Table Item Field: {err}")
         raise Exception(f"Dynamodb Table Update Table Item Field: {err}") from err
 
+# Create or update an item in one call - `fields` are always set, `defaults` only if the item doesn't have them yet.
+# Returns the whole item as it is after the write.
+def upsert_table_item_fields(table_name, primary_key, primary_key_value, fields: dict, defaults: dict = None, remove_fields: list = None):
+    try:
+        table = dynamodb_res.Table(table_name)
+        response = table.update_item(
+            Key={primary_key: primary_key_value},
+            ReturnValues="ALL_NEW",
+            **build_update_expression(fields, remove_fields, defaults)
+        )
+        return response['Attributes']
+    except Exception as err:
+        log.error(f"Dynamodb Table Upsert Table Item Fields: {err}")
+        raise Exception(f"Dynamodb Table Upsert Table Item Fields: {err}") from err
+
+# Update an existing item in one call - fails instead of creating the item if it does not exist.
+# Returns the whole item as it is after the write.
+def update_existing_table_item_fields(table_name, primary_key, primary_key_value, fields: dict, remove_fields: list = None):
+    try:
+        update_kwargs = build_update_expression(fields, remove_fields)
+        update_kwargs['ExpressionAttributeNames']['#primary_key'] = primary_key
+        table = dynamodb_res.Table(table_name)
+        response = table.update_item(
+            Key={primary_key: primary_key_value},
+            ConditionExpression="attribute_exists(#primary_key)",
+            ReturnValues="ALL_NEW",
+            **update_kwargs
+        )
+        return response['Attributes']
+    except Exception as err:
+        if __is_conditional_check_failure(err):
+            err = Exception("Invalid ID (" + primary_key_value + "): Item Does not Exist.")
+        log.error(f"Dynamodb Table Update Existing Table Item Fields: {err}")
+        raise Exception(f"Dynamodb Table Update Existing Table Item Fields: {err}") from err
+
+def __is_conditional_check_failure(err):
+    return isinstance(err, ClientError) and err.response['Error']['Code'] == 'ConditionalCheckFailedException'
+
+def __add_ledger_condition(update_kwargs: dict, ledger_fields: dict):
+    # Passes unless every ledger attribute already holds its value - i.e. this run already wrote it
+    names = update_kwargs.setdefault('ExpressionAttributeNames', {})
+    values = update_kwargs.setdefault('ExpressionAttributeValues', {})
+    conditions = []
+    for i, (attr_key, attr_val) in enumerate(ledger_fields.items()):
+        names[f'#l{i}'] = attr_key
+        values[f':l{i}'] = attr_val
+        conditions.append(f'attribute_not_exists(#l{i}) OR #l{i} <> :l{i}')
+    update_kwargs['ConditionExpression'] = ' OR '.join(f'({condition})' for condition in conditions)
+    return update_kwargs
+
+# Claim an item for a run before doing its work - SETs `claim_attribute` to a lease expiry (epoch seconds).
+# Returns False instead if the item already holds `ledger_fields` (the run finished it), another worker's
+# lease hasn't expired yet, or the item is gone. The check is strongly consistent, unlike an index read.
+def claim_table_item(table_name, primary_key, primary_key_value, claim_attribute, lease_seconds, ledger_fields: dict):
+    try:
+        now = int(datetime.now(timezone.utc).timestamp())
+        update_kwargs = __add_ledger_condition({
+            'UpdateExpression': "SET #claim = :claimed_until",
+            'ExpressionAttributeNames': {'#claim': claim_attribute, '#primary_key': primary_key},
+            'ExpressionAttributeValues': {':claimed_until': now + lease_seconds, ':now': now}
+        }, ledger_fields)
+        update_kwargs['ConditionExpression'] = (
+            f"attribute_exists(#primary_key) AND ({update_kwargs['ConditionExpression']})"
+            " AND (attribute_not_exists(#claim) OR #claim < :now)"
+        )
+        table = dynamodb_res.Table(table_name)
+        table.update_item(Key={primary_key: primary_key_value}, **update_kwargs)
+        return True
+    except Exception as err:
+        if __is_conditional_check_failure(err):
+            return False
+        log.error(f"Dynamodb Table Claim Table Item: {err}")
+        raise Exception(f"Dynamodb Table Claim Table Item: {err}") from err
+
+# Give up a claim early so a retry can take the item right away instead of waiting out the lease
+def release_table_item_claim(table_name, primary_key, primary_key_value, claim_attribute):
+    try:
+        table = dynamodb_res.Table(table_name)
+        table.update_item(
+            Key={primary_key: primary_key_value},
+            UpdateExpression="REMOVE #claim",
+            ConditionExpression="attribute_exists(#primary_key)",
+            ExpressionAttributeNames={'#claim': claim_attribute, '#primary_key': primary_key}
+        )
+    except Exception as err:
+        if __is_conditional_check_failure(err):
+            return
+        log.error(f"Dynamodb Table Release Table Item Claim: {err}")
+        raise Exception(f"Dynamodb Table Release Table Item Claim: {err}") from err
+
 def check_if_item_exist(table_name, id_key, id_val, override=False):
     try:
         table = dynamodb_res.Table(table_name)
@@ -145,6 +285,20 @@ def get_item_by_key(table_name, id_key, id_val):
         log.error(f"Dynamodb Table Get Item By Key: {err}")
         raise Exception(f"Dynamodb Table Get Item By Key: {err}") from err
 
+# Single GetItem - returns `default` instead of raising when the item does not exist
+def get_item_or_default(table_name, id_key, id_val, default=None):
+    try:
+        table = dynamodb_res.Table(table_name)
+        response = table.get_item(
+            Key={
+                id_key: id_val,
+            }
+        )
+        return response.get('Item', default)
+    except Exception as err:
+        log.error(f"Dynamodb Table Get Item Or Default: {err}")
+        raise Exception(f"Dynamodb Table Get Item Or Default: {err}") from err
+
 def query_table_by_key(table_name, id_key, id_val, ascending=False):
     try:
         table = dynamodb_res.Table(table_name)
@@ -156,6 +310,91 @@ def query_table_by_key(table_name, id_key, id_val, ascending=False):
     except Exception as err:
         log.error(f"Dynamodb Table Query Table By Key: {err}")
         raise Exception(f"Dynamodb Query Table Item By Key: {err}") from err
+# Query a (sparse) index in pages - only the projected attributes are read
+def query_index_pages(table_name, index_name, id_key, id_val, projection_attributes=None):
+    for _, items in query_index_cursor_pages(table_name, index_name, id_key, id_val, projection_attributes):
+        yield items
+
+# Same, but yields (start_key, items) - start_key is the ExclusiveStartKey that reads that page again
+# (None for the first page), so a caller can resume from any page with `exclusive_start_key`
+def query_index_cursor_pages(table_name, index_name, id_key, id_val, projection_attributes=None, exclusive_start_key=None):
+    try:
+        table = dynamodb_res.Table(table_name)
+        query_kwargs = {
+            'IndexName': index_name,
+            'KeyConditionExpression': boto3.dynamodb.conditions.Key(id_key).eq(id_val),
+        }
+        if projection_attributes:
+            query_kwargs['ProjectionExpression'] = ", ".join(f"#p{i}" for i in range(len(projection_attributes)))
+            query_kwargs['ExpressionAttributeNames'] = {f"#p{i}": attr for i, attr in enumerate(projection_attributes)}
+
+        start_key = exclusive_start_key
+        while True:
+            response = table.query(ExclusiveStartKey=start_key, **query_kwargs) if start_key else table.query(**query_kwargs)
+            yield start_key, response['Items']
+            start_key = response.get('LastEvaluatedKey')
+            if not start_key:
+                return
+    except Exception as err:
+        log.error(f"Dynamodb Query Index Pages: {err}")
+        raise Exception(f"Dynamodb Query Index Pages: {err}") from err
+
+def query_index(table_name, index_name, id_key, id_val, projection_attributes=None):
+    return [item for page in query_index_pages(table_name, index_name, id_key, id_val, projection_attributes) for item in page]
+
+# Update several fields of an item in one call - unlisted attributes are left alone
+# With `ledger_fields` (e.g. a run ledger mark) they are SET too, and the update only applies if the
+# item doesn't already hold them - a repeat is skipped and returns None instead of writing again
+def update_table_item_fields(table_name, primary_key, primary_key_value, fields: dict, remove_fields: list = None, ledger_fields: dict = None):
+    try:
+        table = dynamodb_res.Table(table_name)
+        update_kwargs = build_update_expression({**fields, **(ledger_fields or {})}, remove_fields)
+        if ledger_fields:
+            __add_ledger_condition(update_kwargs, ledger_fields)
+        return table.update_item(
+            Key={primary_key: primary_key_value},
+            ReturnValues="UPDATED_NEW",
+            **update_kwargs
+        )
+    except Exception as err:
+        if ledger_fields and __is_conditional_check_failure(err):
+            log.info(f"{primary_key_value} already holds {ledger_fields} - update skipped.")
+            return None
+        log.error(f"Dynamodb Table Update Table Item Fields: {err}")
+        raise Exception(f"Dynamodb Table Update Table Item Fields: {err}") from err
+
+# UpdateItem expression kwargs that SET `fields`, SET `defaults` only where missing, and REMOVE `remove_fields`
+def build_update_expression(fields: dict, remove_fields: list = None, defaults: dict = None):
+    names = {}
+    values = {}
+    set_actions = []
+    for i, (attr_key, attr_val) in enumerate(fields.items()):
+        names[f'#k{i}'] = attr_key
+        values[f':v{i}'] = attr_val
+        set_actions.append(f'#k{i} = :v{i}')
+    for i, (attr_key, attr_val) in enumerate((defaults or {}).items()):
+        names[f'#d{i}'] = attr_key
+        values[f':d{i}'] = attr_val
+        set_actions.append(f'#d{i} = if_not_exists(#d{i}, :d{i})')
+    remove_actions = []
+    for i, attr_key in enumerate(remove_fields or []):
+        names[f'#r{i}'] = attr_key
+        remove_actions.append(f'#r{i}')
+
+    update_expression = ''
+    if set_actions:
+        update_expression += 'SET ' + ', '.join(set_actions)
+    if remove_actions:
+        update_expression += ' REMOVE ' + ', '.join(remove_actions)
+
+    update_kwargs = {
+        'UpdateExpression': update_expression.strip(),
+        'ExpressionAttributeNames': names
+    }
+    if values:
+        update_kwargs['ExpressionAttributeValues'] = values
+    return update_kwargs
+
 def item_has_property(item, property):
     for field in item:
         if field == property:
@@ -225,33 +464,41 @@ def createTable(table_name, hash_key, hash_key_type):
     
 
 ## USER TABLE
-def update_user_table_release_radar_id(user: dict, playlist_id: str):
+def update_user_table_release_radar_id(user: dict, playlist_id: str, image_hash: str = None):
     try:
-        # Release Radar Id
-        user['releaseRadarId'] = playlist_id
-        # Time Stamp
-        user['updatedAt'] = __get_time_stamp()
-        update_table_item(WRAPPED_TABLE_NAME, user)
+        fields = build_user_release_radar_fields(playlist_id, image_hash)
+        # Users come from a projected index query - only touch what changed
+        update_table_item_fields(WRAPPED_TABLE_NAME, 'email', user['email'], fields)
+        user.update(fields)
     except Exception as err:
         log.error(f"Update User Table Entry: {err}")
         raise Exception(f"Update User Table Entry: {err}") from err
+
+def build_user_release_radar_fields(playlist_id: str, image_hash: str = None):
+    fields = {
+        # Release Radar Id
+        'releaseRadarId': playlist_id,
+        # Time Stamp
+        'updatedAt': __get_time_stamp()
+    }
+    # Cover uploaded to it
+    if image_hash:
+        fields['releaseRadarImageHash'] = image_hash
+    return fields
     
 def update_user_table_refresh_token(email: str, user_id: str,  refresh_token: str):
     try:
-        # Get User Data
-        user_exists = check_if_item_exist(WRAPPED_TABLE_NAME, 'email', email, True)
-        user = get_item_by_key(WRAPPED_TABLE_NAME, 'email', email) if user_exists else {}
-        # Email
-        user['email'] = email
-        # ID
-        user['userId'] = user_id
-        # Refresh Token
-        user['refreshToken'] = refresh_token
-        # Active
-        user['active'] = True
-        # Time Stamp
-        user['updatedAt'] = __get_time_stamp()
-        update_table_item(WRAPPED_TABLE_NAME, user)
+        # Creates the user on first login, otherwise only these attributes change
+        user = upsert_table_item_fields(WRAPPED_TABLE_NAME, 'email', email, {
+            # ID
+            'userId': user_id,
+            # Refresh Token
+            'refreshToken': refresh_token,
+            # Active
+            'active': True,
+            # Time Stamp
+            'updatedAt': __get_time_stamp()
+        })
         return user
     except Exception as err:
         log.error(f"Update User Table Refresh Token: {err}")
@@ -259,21 +506,98 @@ def update_user_table_refresh_token(email: str, user_id: str,  refresh_token: st
     
 def update_user_table_enrollments(email: str, wrapped_enrolled: bool, release_radar_enrolled: bool):
     try:
-        # Get User Data
-        user = get_item_by_key(WRAPPED_TABLE_NAME, 'email', email)
-        # Release Radar Id
-        user['activeWrapped'] = wrapped_enrolled
-        # Active
-        user['activeReleaseRadar'] = release_radar_enrolled
+        fields = {
+            # Wrapped
+            'activeWrapped': wrapped_enrolled,
+            # Release Radar
+            'activeReleaseRadar': release_radar_enrolled
+        }
+        # Sparse index keys
+        __set_enrollment_index_keys(fields)
+        remove_fields = [index_key for index_key in (WRAPPED_INDEX_KEY, RELEASE_RADAR_INDEX_KEY) if index_key not in fields]
         # Time Stamp
-        user['updatedAt'] = __get_time_stamp()
-        update_table_item(WRAPPED_TABLE_NAME, user)
+        fields['updatedAt'] = __get_time_stamp()
+        user = update_existing_table_item_fields(WRAPPED_TABLE_NAME, 'email', email, fields, remove_fields)
         return user
     except Exception as err:
         log.error(f"Update User Table Refresh Token: {err}")
         raise Exception(f"Update User Table Refresh Token: {err}") from err
     
     
+def update_user_table_wrapped_data(email: str, top_tracks_last_month: dict, top_artists_last_month: dict, top_genres_last_month: dict, ledger_fields: dict = None):
+    try:
+        table = dynamodb_res.Table(WRAPPED_TABLE_NAME)
+        return table.update_item(
+            Key={'email': email},
+            **build_user_wrapped_data_update(top_tracks_last_month, top_artists_last_month, top_genres_last_month, ledger_fields)
+        )
+    except Exception as err:
+        # The roll-over already ran for this run - rolling again would overwrite the real history
+        if ledger_fields and __is_conditional_check_failure(err):
+            log.info(f"Wrapped data for {email} already written for {ledger_fields} - skipped.")
+            return None
+        log.error(f"Update User Table Wrapped Data: {err}")
+        raise Exception(f"Update User Table Wrapped Data: {err}") from err
+
+def build_user_wrapped_data_update(top_tracks_last_month: dict, top_artists_last_month: dict, top_genres_last_month: dict, ledger_fields: dict = None):
+    # Last month's data rolls over to two months ago inside the update itself -
+    # the pipeline never has to read the (large) history attributes.
+    # The roll-over isn't idempotent, so with `ledger_fields` (the run ledger mark) it only applies once per run.
+    update_kwargs = {
+        'UpdateExpression': (
+            "SET topSongIdsTwoMonthsAgo = if_not_exists(topSongIdsLastMonth, :empty), topSongIdsLastMonth = :tracks, "
+            "topArtistIdsTwoMonthsAgo = if_not_exists(topArtistIdsLastMonth, :empty), topArtistIdsLastMonth = :artists, "
+            "topGenresTwoMonthsAgo = if_not_exists(topGenresLastMonth, :empty), topGenresLastMonth = :genres, "
+            "updatedAt = :updated_at"
+        ),
+        'ExpressionAttributeValues': {
+            ':empty': {},
+            ':tracks': top_tracks_last_month,
+            ':artists': top_artists_last_month,
+            ':genres': top_genres_last_month,
+            ':updated_at': __get_time_stamp()
+        }
+    }
+    if ledger_fields:
+        update_kwargs['ExpressionAttributeNames'] = {}
+        for i, (attr_key, attr_val) in enumerate(ledger_fields.items()):
+            update_kwargs['UpdateExpression'] += f", #e{i} = :e{i}"
+            update_kwargs['ExpressionAttributeNames'][f'#e{i}'] = attr_key
+            update_kwargs['ExpressionAttributeValues'][f':e{i}'] = attr_val
+        __add_ledger_condition(update_kwargs, ledger_fields)
+    return update_kwargs
+
+def backfill_enrollment_index_keys():
+    """One-off: give users enrolled before the sparse indexes existed their index keys."""
+    try:
+        updated = 0
+        users = full_table_scan(
+            WRAPPED_TABLE_NAME,
+            total_segments=DYNAMODB_SCAN_SEGMENTS,
+            projection_attributes=['email', 'activeWrapped', 'activeReleaseRadar', WRAPPED_INDEX_KEY, RELEASE_RADAR_INDEX_KEY]
+        )
+        for user in users:
+            keyed = dict(user)
+            __set_enrollment_index_keys(keyed)
+            if keyed.get(WRAPPED_INDEX_KEY) != user.get(WRAPPED_INDEX_KEY) or keyed.get(RELEASE_RADAR_INDEX_KEY) != user.get(RELEASE_RADAR_INDEX_KEY):
+                fields = {key: keyed[key] for key in (WRAPPED_INDEX_KEY, RELEASE_RADAR_INDEX_KEY) if key in keyed}
+                remove_fields = [key for key in (WRAPPED_INDEX_KEY, RELEASE_RADAR_INDEX_KEY) if key not in keyed and key in user]
+                update_table_item_fields(WRAPPED_TABLE_NAME, 'email', user['email'], fields, remove_fields)
+                updated += 1
+        log.info(f"Backfilled enrollment index keys for {updated} users.")
+        return updated
+    except Exception as err:
+        log.error(f"Backfill Enrollment Index Keys: {err}")
+        raise Exception(f"Backfill Enrollment Index Keys: {err}") from err
+
+def __set_enrollment_index_keys(user: dict):
+    # Key present only while enrolled - unenrolled users drop out of the index entirely
+    for enrolled_attr, index_key in (('activeWrapped', WRAPPED_INDEX_KEY), ('activeReleaseRadar', RELEASE_RADAR_INDEX_KEY)):
+        if user.get(enrolled_attr):
+            user[index_key] = ACTIVE_INDEX_KEY_VALUE
+        else:
+            user.pop(index_key, None)
+
 def __get_time_stamp():
     return datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
 
@@ -0,0 +1,67 @@
+import os
+import mmap
+import base64
+import hashlib
+from lambdas.common.constants import LOGGER, IMAGE_ASSET_MMAP
+
+log = LOGGER.get_logger(__file__)
+
+ASSETS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'assets')
+
+# Playlist cover names -> packaged JPEG
+LOGO = 'logo'
+BLACK_LOGO = 'black-logo'
+BLACK_2025 = 'black-2025'
+
+ASSET_FILES = {
+    LOGO: 'logo.jpg',
+    BLACK_LOGO: 'black_logo.jpg',
+    BLACK_2025: 'black_2025.jpg',
+}
+
+
+class ImageAsset:
+    """
+    A playlist cover ready to upload: base64 JPEG bytes, plus their sha256.
+
+    `data` is immutable bytes, so every upload in the run sends the same buffer without copying
+    or re-encoding it. `sha256` identifies the cover, letting callers skip re-uploading a cover
+    a playlist already has.
+    """
+
+    __slots__ = ('name', 'data', 'sha256')
+
+    def __init__(self, name: str, data: bytes):
+        self.name = name
+        self.data = data
+        self.sha256 = hashlib.sha256(self.data).hexdigest()
+
+    def __len__(self):
+        return len(self.data)
+
+
+def __load_asset_file(name: str):
+    path = os.path.join(ASSETS_DIR, ASSET_FILES[name])
+    with open(path, 'rb') as image_file:
+        if IMAGE_ASSET_MMAP:
+            # Encode straight from the page cache - the raw JPEG never becomes a Python object
+            with mmap.mmap(image_file.fileno(), 0, access=mmap.ACCESS_READ) as image:
+                return base64.b64encode(image)
+        return base64.b64encode(image_file.read())
+
+
+__ASSETS = {}
+
+
+def get_image_asset(name: str):
+    """Load and encode a cover the first time a playlist upload needs it, then hand out the same asset."""
+    try:
+        asset = __ASSETS.get(name)
+        if asset is None:
+            asset = ImageAsset(name, __load_asset_file(name))
+            __ASSETS[name] = asset
+            log.info(f"Loaded image asset '{name}' ({len(asset)} bytes, sha256 {asset.sha256[:12]}).")
+        return asset
+    except Exception as err:
+        log.error(f"Get Image Asset: {err}")
+        raise Exception(f"Get Image Asset {name}: {err}") from err
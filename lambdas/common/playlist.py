@@ -1,25 +1,34 @@
-import requests
 import aiohttp
 import asyncio
-import time
-from lambdas.common.constants import LOGGER
-from lambdas.common.aiohttp_helper import fetch_json, post_json
+from lambdas.common.constants import LOGGER, SPOTIFY_READY_RETRIES, SPOTIFY_READY_BACKOFF_SECONDS
+from lambdas.common.image_assets import ImageAsset
+from lambdas.common.aiohttp_helper import fetch_json, post_json, put_json, put_data, delete_json, paced_request
+from lambdas.common.transport import get_transport
 
 log = LOGGER.get_logger(__file__)
 
 class Playlist:
 
     BASE_URL = "https://api.spotify.com/v1"
+    # Seen for a short while after a playlist is created - retried with backoff instead of slept through
+    NOT_READY_STATUSES = (404, 500, 502, 503)
+    # Adding tracks isn't idempotent - a 5xx may come back after the tracks went in, so only
+    # "playlist not found yet" is safe to resend as is
+    ADD_TRACKS_NOT_READY_STATUSES = (404,)
+    # After one of these the batch is checked against the playlist and only what is missing is resent
+    ADD_TRACKS_RECHECK_STATUSES = (500, 502, 503)
 
     def __init__(self, user_id: str, name: str, description: str, headers: dict, session: aiohttp.ClientSession = None):
         log.info(f"Initializing Playlist '{name}' for user_id '{user_id}.")
         self.aiohttp_session = session
+        self.transport = get_transport(session)
         self.user_id = user_id
         self.name = name
         self.description = description
         self.headers = headers
         self.uri_list = None
         self.image = None
+        self.image_hash = None
         self.playlist = None
         self.id = None
 
@@ -29,34 +38,44 @@ class Playlist:
     def set_id(self, id: str):
         self.id = id
 
+    def set_image_hash(self, image_hash: str):
+        self.image_hash = image_hash
+
     # ------------------------
     # Build / Update Flows
     # ------------------------
-    async def build_playlist(self, uri_list: list, image: str):
+    async def build_playlist(self, uri_list: list, image: ImageAsset):
         try:
             log.info(f"Building playlist: {self.name}")
             self.uri_list = uri_list
             self.image = image
             await self.create_playlist()
-            time.sleep(2)
-            await self.add_playlist_image()
-            time.sleep(2)
-            await self.add_playlist_songs()
+            await asyncio.gather(
+                self.add_playlist_image(),
+                self.add_playlist_songs()
+            )
             log.info(f"Playlist '{self.name}' Complete!")
         except Exception as err:
             log.error(f"Build Playlist: {err}")
             raise Exception(f"Build Playlist: {err}") from err
         
-    async def aiohttp_build_playlist(self, uri_list: list, image: str):
+    async def aiohttp_build_playlist(self, uri_list: list, image: ImageAsset, on_created=None, ordered: bool = True):
+        """
+        `on_created(playlist)` is awaited as soon as the playlist exists, before tracks or image are added.
+        `ordered=False` adds the track batches concurrently, for playlists whose order doesn't matter.
+        """
         try:
             log.info(f"Building playlist (aiohttp): {self.name}")
             self.uri_list = uri_list
             self.image = image
             await self.aiohttp_create_playlist()
-            await asyncio.sleep(2)
-            await self.aiohttp_add_playlist_image()
-            await asyncio.sleep(2)
-            await self.aiohttp_add_playlist_songs()
+            if on_created:
+                await on_created(self)
+            # Both only need the playlist ID - a playlist that isn't ready yet is retried, not waited on
+            await asyncio.gather(
+                self.aiohttp_add_playlist_image(),
+                self.aiohttp_add_playlist_songs(position=0 if ordered else None)
+            )
             log.info(f"Playlist '{self.name}' Complete!")
         except Exception as err:
             log.error(f"AIOHTTP Build Playlist: {err}")
@@ -67,20 +86,26 @@ class Playlist:
             log.info(f"Updating playlist: {self.name}")
             self.uri_list = uri_list
             await self.delete_playlist_songs()
-            time.sleep(1)
+            await asyncio.sleep(1)
             await self.add_playlist_songs()
             log.info(f"Playlist '{self.name}' Complete!")
         except Exception as err:
             log.error(f"Update Playlist: {err}")
             raise Exception(f"Update Playlist: {err}") from err
         
-    async def aiohttp_update_playlist(self, uri_list: list):
+    async def aiohttp_update_playlist(self, uri_list: list, image: ImageAsset = None):
         try:
             log.info(f"Updating playlist (aiohttp): {self.name}")
             self.uri_list = uri_list
-            await self.aiohttp_delete_playlist_songs()
-            await asyncio.sleep(1)
-            await self.aiohttp_add_playlist_songs()
+            tasks = [
+                # Small enough to swap the contents in one call
+                self.aiohttp_replace_playlist_songs() if len(self.uri_list) <= 100 else self.aiohttp_sync_playlist_songs()
+            ]
+            # Only refresh a cover we uploaded ourselves and have since changed
+            if image and self.image_hash and self.image_hash != image.sha256:
+                self.image = image
+                tasks.append(self.aiohttp_add_playlist_image())
+            await asyncio.gather(*tasks)
             log.info(f"Playlist '{self.name}' Complete!")
         except Exception as err:
             log.error(f"AIOHTTP Update Playlist: {err}")
@@ -99,7 +124,7 @@ class Playlist:
                 "public": True
             }
 
-            response = requests.post(url, json=body, headers=self.headers)
+            response = await self.transport.request('POST', url, json=body, headers=self.headers)
 
             # Check for errors
             if response.status_code != 201:
@@ -143,7 +168,12 @@ class Playlist:
                     "uris": batch_uris
                 }
 
-                response = requests.post(url, json=body, headers=self.headers)
+                response = await self.transport.request('POST', url, json=body, headers=self.headers)
+                for attempt in range(SPOTIFY_READY_RETRIES):
+                    if response.status_code not in self.ADD_TRACKS_NOT_READY_STATUSES:
+                        break
+                    await asyncio.sleep(SPOTIFY_READY_BACKOFF_SECONDS * 2 ** attempt)
+                    response = await self.transport.request('POST', url, json=body, headers=self.headers)
 
                 if response.status_code == 201:
                     log.debug(f"Successfully added {len(batch_uris)} tracks.")
@@ -155,70 +185,171 @@ class Playlist:
             log.error(f"Add Playlist Songs: {err}")
             raise Exception(f"Add Playlist Songs: {err}") from err
 
-    async def aiohttp_add_playlist_songs(self):
+    async def aiohttp_add_playlist_songs(self, uri_list: list = None, position: int = 0):
+        """
+        Add tracks in batches of 100.
+
+        With a `position`, batches are sent one at a time, batch k at `position + k*100`, so the
+        playlist ends up in `uri_list` order. `position=None` appends, and the batches are sent
+        concurrently within the shared rate budget - for when order doesn't matter.
+        """
         try:
-            if len(self.uri_list) == 0:
+            uri_list = self.uri_list if uri_list is None else uri_list
+            if len(uri_list) == 0:
                 log.info("No Tracks to add this week. Skipping.")
                 return
-            log.info(f"Adding {len(self.uri_list)} songs to Playlist '{self.name}' (aiohttp)")
+            log.info(f"Adding {len(uri_list)} songs to Playlist '{self.name}' (aiohttp)")
             batch_size = 100
-            url = f"{self.BASE_URL}/playlists/{self.id}/tracks"
-            for i in range(0, len(self.uri_list), batch_size):
-                batch_uris = self.uri_list[i:i+batch_size]
-                body = {"uris": batch_uris}
-                await post_json(self.aiohttp_session, url, headers=self.headers, json=body)
-                log.debug(f"AIOHTTP Added {len(batch_uris)} tracks.")
+            offsets = range(0, len(uri_list), batch_size)
+            if position is None:
+                results = await asyncio.gather(
+                    *[self.__aiohttp_add_batch(uri_list[i:i+batch_size]) for i in offsets],
+                    return_exceptions=True
+                )
+                errors = [result for result in results if isinstance(result, Exception)]
+                if errors:
+                    raise errors[0]
+            else:
+                for i in offsets:
+                    await self.__aiohttp_add_batch(uri_list[i:i+batch_size], position + i)
             log.info("AIOHTTP Tracks Added Successfully.")
         except Exception as err:
             log.error(f"AIOHTTP Add Playlist Songs: {err}")
             raise Exception (f"AIOHTTP Add Playlist Songs: {err}") from err
 
+    async def __aiohttp_add_batch(self, batch_uris: list, position: int = None):
+        """Add one batch - only this batch is retried if it fails, the others carry on."""
+        url = f"{self.BASE_URL}/playlists/{self.id}/tracks"
+        uris = batch_uris
+        for attempt in range(SPOTIFY_READY_RETRIES + 1):
+            body = {"uris": uris}
+            if position is not None:
+                body["position"] = position
+            response = await paced_request(self.aiohttp_session, 'POST', url, headers=self.headers, json=body, retry_statuses=self.ADD_TRACKS_NOT_READY_STATUSES)
+            if response.status_code in (200, 201):
+                log.debug(f"AIOHTTP Added {len(uris)} tracks.")
+                return
+            if response.status_code not in self.ADD_TRACKS_RECHECK_STATUSES or attempt == SPOTIFY_READY_RETRIES:
+                raise Exception(f"Spotify API error {response.status_code} at {url}: {response.text}")
+            backoff = SPOTIFY_READY_BACKOFF_SECONDS * 2 ** attempt
+            log.warning(f"Adding {len(uris)} tracks to {self.id} failed ({response.status_code}). Re-checking in {backoff}s...")
+            await asyncio.sleep(backoff)
+            uris = await self.__aiohttp_missing_batch_uris(batch_uris, position)
+            if not uris:
+                log.info(f"Batch of {len(batch_uris)} tracks went in despite the {response.status_code}.")
+                return
+
+    async def __aiohttp_missing_batch_uris(self, batch_uris: list, position: int = None):
+        """What of a batch the playlist doesn't hold yet - all of it at `position`, unless it is already there."""
+        _, current_uris = await self.aiohttp_get_playlist_uris()
+        if position is not None:
+            return [] if current_uris[position:position + len(batch_uris)] == batch_uris else batch_uris
+        current = set(current_uris)
+        return [uri for uri in batch_uris if uri not in current]
+
     # ------------------------
     # Add Playlist Image
     # ------------------------
-    async def add_playlist_image(self, retried: bool=False):
+    async def add_playlist_image(self):
         try:
             log.info(f"Adding Image to Playlist {self.id}...")
             # Prepare the API URL
             url = f'{self.BASE_URL}/playlists/{self.id}/images'
 
-            body = self.image.replace('\n', '')
+            body = self.image.data
 
-            # Make the PUT request
-            response = requests.put(url, body, headers=self.headers)
+            # Make the PUT request - retrying while the new playlist isn't ready
+            response = await self.transport.request('PUT', url, data=body, headers=self.headers)
+            for attempt in range(SPOTIFY_READY_RETRIES):
+                if response.status_code not in self.NOT_READY_STATUSES:
+                    break
+                log.warning(f"Playlist {self.id} not ready ({response.status_code}). Retrying.")
+                await asyncio.sleep(SPOTIFY_READY_BACKOFF_SECONDS * 2 ** attempt)
+                response = await self.transport.request('PUT', url, data=body, headers=self.headers)
 
             # Check the response
             if response.status_code != 202:
-                # Retry once
-                if not retried:
-                    log.error("First attempt failed. Retrying.")
-                    self.add_playlist_image(True)
-                else:
-                    raise Exception(f"Failed to upload image: {response.status_code} {response.text}")
+                raise Exception(f"Failed to upload image: {response.status_code} {response.text}")
             
+            self.image_hash = self.image.sha256
             log.info(f"Image added to Playlist. Name: {self.name} ID: {self.id}.")
 
         except Exception as err:
             log.error(f"Adding Playlist Image: {err}")
             raise Exception(f"Adding Playlist Image: {err}")
     
-    async def aiohttp_add_playlist_image(self, retried=False):
+    async def aiohttp_add_playlist_image(self):
         try:
+            if self.image_hash == self.image.sha256:
+                log.info(f"Playlist {self.id} already has image '{self.image.name}'. Skipping.")
+                return
             log.info(f"Adding Image to Playlist {self.id} (aiohttp)...")
             url = f'{self.BASE_URL}/playlists/{self.id}/images'
-            body = self.image.replace('\n', '')
-            async with self.aiohttp_session.put(url, data=body, headers=self.headers) as resp:
-                if resp.status != 202:
-                    if not retried:
-                        log.error("First attempt failed. Retrying.")
-                        await self.aiohttp_add_playlist_image(True)
-                    else:
-                        raise Exception(f"Failed to upload image: {resp.status} {await resp.text()}")
+            # Shared bytes buffer - sent as-is, no per-upload copy or re-encode
+            await put_data(self.aiohttp_session, url, headers=self.headers, data=self.image.data, ok_statuses=(202,), retry_statuses=self.NOT_READY_STATUSES)
+            self.image_hash = self.image.sha256
             log.info("AIOHTTP Image added to Playlist.")
         except Exception as err:
             log.error(f"AIOHTTP Add Playlist Image: {err}")
             raise Exception(f"AIOHTTP Add Playlist Image: {err}") from err
 
+    # ------------------------
+    # Replace / Sync Playlist Songs
+    # ------------------------
+    async def aiohttp_replace_playlist_songs(self):
+        try:
+            log.info(f"Replacing songs in Playlist '{self.name}' with {len(self.uri_list)} tracks (aiohttp)")
+            url = f"{self.BASE_URL}/playlists/{self.id}/tracks"
+            await put_json(self.aiohttp_session, url, headers=self.headers, json={"uris": self.uri_list})
+            log.info("AIOHTTP Tracks Replaced Successfully.")
+        except Exception as err:
+            log.error(f"AIOHTTP Replace Playlist Songs: {err}")
+            raise Exception(f"AIOHTTP Replace Playlist Songs: {err}") from err
+
+    async def aiohttp_sync_playlist_songs(self):
+        try:
+            snapshot_id, current_uris = await self.aiohttp_get_playlist_uris()
+            desired = set(self.uri_list)
+            current = set(current_uris)
+            uris_to_remove = [uri for uri in dict.fromkeys(current_uris) if uri not in desired]
+            uris_to_add = [uri for uri in dict.fromkeys(self.uri_list) if uri not in current]
+            log.info(f"Syncing Playlist '{self.name}': {len(uris_to_remove)} to remove, {len(uris_to_add)} to add (aiohttp)")
+
+            url = f"{self.BASE_URL}/playlists/{self.id}/tracks"
+            for i in range(0, len(uris_to_remove), 100):
+                # Removes are applied against the snapshot we diffed - a concurrent edit can't shift them
+                payload = {"tracks": [{"uri": uri} for uri in uris_to_remove[i:i+100]], "snapshot_id": snapshot_id}
+                data = await delete_json(self.aiohttp_session, url, headers=self.headers, json=payload)
+                snapshot_id = data['snapshot_id']
+
+            # Release radar order is not meaningful - append batches as they land
+            await self.aiohttp_add_playlist_songs(uris_to_add, position=None)
+            log.info("AIOHTTP Tracks Synced Successfully.")
+        except Exception as err:
+            log.error(f"AIOHTTP Sync Playlist Songs: {err}")
+            raise Exception(f"AIOHTTP Sync Playlist Songs: {err}") from err
+
+    async def aiohttp_get_playlist_uris(self):
+        """Returns (snapshot_id, track URIs in playlist order), fetching only those fields."""
+        try:
+            url = f"{self.BASE_URL}/playlists/{self.id}?fields=snapshot_id,tracks(items(track(uri)),next)"
+            data = await fetch_json(self.aiohttp_session, url, headers=self.headers)
+            snapshot_id = data['snapshot_id']
+            page = data['tracks']
+            uris = []
+            offset = 0
+            while True:
+                uris.extend(item['track']['uri'] for item in page['items'] if item.get('track'))
+                offset += len(page['items'])
+                if not page['next']:
+                    break
+                url = f"{self.BASE_URL}/playlists/{self.id}/tracks?fields=items(track(uri)),next&limit=100&offset={offset}"
+                page = await fetch_json(self.aiohttp_session, url, headers=self.headers)
+            return snapshot_id, uris
+        except Exception as err:
+            log.error(f"AIOHTTP Get Playlist URIs: {err}")
+            raise Exception(f"AIOHTTP Get Playlist URIs: {err}") from err
+
     # ------------------------
     # Delete Playlist Songs
     # ------------------------
@@ -232,7 +363,7 @@ class Playlist:
 
             while True:
                 url = f"{self.BASE_URL}/playlists/{self.id}/tracks?limit={limit}&offset={offset}"
-                resp = requests.get(url, headers=self.headers).json()
+                resp = (await self.transport.request('GET', url, headers=self.headers)).json()
                 items = resp.get("items", [])
                 if not items:
                     break
@@ -244,7 +375,7 @@ class Playlist:
                 batch = tracks_to_remove[i:i+100]
                 payload = {"tracks": batch}
                 del_url = f"{self.BASE_URL}/playlists/{self.id}/tracks"
-                resp = requests.delete(del_url, headers=self.headers, json=payload)
+                resp = await self.transport.request('DELETE', del_url, headers=self.headers, json=payload)
                 if resp.status_code not in (200, 201):
                     log.error("Error deleting batch:", resp.status_code, resp.text)
                     return
@@ -271,9 +402,7 @@ class Playlist:
                 batch = tracks_to_remove[i:i+100]
                 payload = {"tracks": batch}
                 url = f"{self.BASE_URL}/playlists/{self.id}/tracks"
-                async with self.aiohttp_session.delete(url, json=payload, headers=self.headers) as resp:
-                    if resp.status not in (200, 201):
-                        raise Exception(f"Error deleting batch: {resp.status} {await resp.text()}")
+                await delete_json(self.aiohttp_session, url, headers=self.headers, json=payload)
             log.info("AIOHTTP Tracks removed successfully.")
         except Exception as err:
             log.error(f"AIOHTTP Delete Playlist Songs: {err}")
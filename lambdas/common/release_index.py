@@ -0,0 +1,88 @@
+import asyncio
+from collections import OrderedDict
+from lambdas.common.constants import LOGGER, ALBUM_CACHE_SIZE
+
+log = LOGGER.get_logger(__file__)
+
+
+class ReleaseIndex:
+    """
+    Run-scoped map of artist ID -> task resolving to that artist's in-window release URIs.
+
+    The first user to need an artist starts the fetch with their own client; every other
+    user following that artist awaits the same task, so each distinct artist is fetched
+    once per run. Failed fetches are dropped from the index so a later user can retry.
+    """
+
+    def __init__(self, album_cache_size: int = ALBUM_CACHE_SIZE):
+        self.releases = {}
+        self.album_tracks = AlbumTrackCache(album_cache_size)
+
+    def __len__(self):
+        return len(self.releases)
+
+    async def get_artist_releases(self, artist_id: str, fetch):
+        """`fetch(artist_id)` is the coroutine function used if nobody has started this artist yet."""
+        task = self.releases.get(artist_id)
+        if task is None:
+            task = asyncio.ensure_future(fetch(artist_id))
+            task.add_done_callback(lambda done: self.__drop_failed(artist_id, done))
+            self.releases[artist_id] = task
+        # Shielded - one user being cancelled must not cancel the fetch for everyone else
+        return await asyncio.shield(task)
+
+    def __drop_failed(self, artist_id: str, task: asyncio.Task):
+        if task.cancelled() or task.exception() is not None:
+            if self.releases.get(artist_id) is task:
+                del self.releases[artist_id]
+
+
+class AlbumTrackCache:
+    """
+    Run-scoped LRU of album ID -> future resolving to that album's track URIs.
+
+    Futures are registered before the album is fetched, so users expanding the same album
+    at the same time share one download. Least recently used albums are evicted once
+    `max_size` is exceeded; albums still being fetched are never evicted, failed ones are dropped.
+    """
+
+    def __init__(self, max_size: int = ALBUM_CACHE_SIZE):
+        self.max_size = max_size
+        self.albums = OrderedDict()
+
+    def __len__(self):
+        return len(self.albums)
+
+    def get(self, album_id: str):
+        future = self.albums.get(album_id)
+        if future is not None:
+            self.albums.move_to_end(album_id)
+        return future
+
+    def reserve(self, album_id: str):
+        future = asyncio.get_running_loop().create_future()
+        self.albums[album_id] = future
+        self.__evict()
+        return future
+
+    def resolve(self, album_id: str, track_uris: list):
+        future = self.albums.get(album_id)
+        if future is not None and not future.done():
+            future.set_result(track_uris)
+
+    def fail(self, album_id: str, err: Exception):
+        """Fail and drop the album if it is still unresolved - resolved albums stay cached."""
+        future = self.albums.get(album_id)
+        if future is None or future.done():
+            return
+        del self.albums[album_id]
+        future.set_exception(err)
+        # Mark retrieved - nobody else may be waiting on it
+        future.exception()
+
+    def __evict(self):
+        while len(self.albums) > self.max_size:
+            album_id, future = next(iter(self.albums.items()))
+            if not future.done():
+                break
+            del self.albums[album_id]
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+from lambdas.common.constants import LOGGER, WRAPPED_TABLE_NAME, CRON_CLAIM_LEASE_SECONDS
+from lambdas.common.async_dynamo_helpers import aiohttp_claim_table_item, aiohttp_release_table_item_claim
+
+log = LOGGER.get_logger(__file__)
+
+# Cron jobs with a ledger
+WRAPPED_JOB = 'wrapped'
+RELEASE_RADAR_JOB = 'release-radar'
+
+# Each user item records the last run of each job it completed, e.g. wrappedLastRun = 'wrapped:2026-09'.
+# It is read with the rest of the projected user and written with the user's results, so the
+# ledger costs no extra reads or writes.
+LEDGER_ATTRIBUTES = {
+    WRAPPED_JOB: 'wrappedLastRun',
+    RELEASE_RADAR_JOB: 'releaseRadarLastRun',
+}
+
+# The ledger read with the user comes from an eventually consistent index, so a user can look
+# unfinished right after a run finished them. Before any Spotify work the user is claimed with a
+# conditional write on the table itself - it fails if the run already finished them or another
+# worker holds an unexpired claim, e.g. wrappedClaimedUntil = <epoch seconds>.
+CLAIM_ATTRIBUTES = {
+    WRAPPED_JOB: 'wrappedClaimedUntil',
+    RELEASE_RADAR_JOB: 'releaseRadarClaimedUntil',
+}
+
+
+def get_run_key(job: str, now: datetime = None):
+    """'wrapped:YYYY-MM' for the monthly job, 'release-radar:YYYY-Www' (ISO week) for the weekly one."""
+    now = now or datetime.now(timezone.utc)
+    if job == WRAPPED_JOB:
+        return f"{job}:{now.strftime('%Y-%m')}"
+    year, week, _ = now.isocalendar()
+    return f"{job}:{year}-W{week:02d}"
+
+
+def get_event_run_key(event: dict, job: str):
+    """The run this invocation belongs to - carried on the event so retries and continuations keep the same key."""
+    return event.get('runKey') or get_run_key(job)
+
+
+def is_run_complete(user: dict, run_key: str):
+    job = run_key.split(':', 1)[0]
+    complete = user.get(LEDGER_ATTRIBUTES[job]) == run_key
+    if complete:
+        log.info(f"Skipping {user.get('email')} - already completed {run_key}.")
+    return complete
+
+
+def run_complete_fields(run_key: str):
+    """User item fields that mark this run complete - sent with the user's result write."""
+    job = run_key.split(':', 1)[0]
+    return {LEDGER_ATTRIBUTES[job]: run_key}
+
+
+async def process_claimed_user(user: dict, run_key: str, process_user):
+    """Await process_user() only if this worker wins the claim on `user` - a failed user is released for the retry."""
+    job = run_key.split(':', 1)[0]
+    email = user['email']
+    claimed = await aiohttp_claim_table_item(
+        WRAPPED_TABLE_NAME, 'email', email, CLAIM_ATTRIBUTES[job], CRON_CLAIM_LEASE_SECONDS, run_complete_fields(run_key)
+    )
+    if not claimed:
+        log.info(f"Skipping {email} - already completed {run_key} or claimed by another worker.")
+        return email
+    try:
+        return await process_user()
+    except Exception:
+        await aiohttp_release_table_item_claim(WRAPPED_TABLE_NAME, 'email', email, CLAIM_ATTRIBUTES[job])
+        raise
@@ -1,11 +1,12 @@
-import requests
 import asyncio
 import aiohttp
 from datetime import datetime, timedelta
-from lambdas.common.ssm_helpers import SPOTIFY_CLIENT_SECRET, SPOTIFY_CLIENT_ID
+from lambdas.common.ssm_helpers import get_parameter
 from lambdas.common.track_list import TrackList
 from lambdas.common.artist_list import ArtistList
 from lambdas.common.playlist import Playlist
+from lambdas.common.token_cache import token_cache
+from lambdas.common.transport import get_transport
 from lambdas.common.constants import LOGGER
 
 log = LOGGER.get_logger(__file__)
@@ -16,83 +17,120 @@ class Spotify:
 
     def __init__(self, user: dict, session: aiohttp.ClientSession = None):
         log.info(f"Initializing Spotify Client for User {user['email']}.")
-        self.client_id: str= SPOTIFY_CLIENT_ID
+        self.client_id: str = get_parameter('SPOTIFY_CLIENT_ID')
         self.aiohttp_session = session
-        self.client_secret: str = SPOTIFY_CLIENT_SECRET
+        self.transport = get_transport(session)
+        self.client_secret: str = get_parameter('SPOTIFY_CLIENT_SECRET')
         self.user = user
         self.user_id: str = self.user['userId']
         self.email: str = self.user['email']
         self.refresh_token: str = self.user['refreshToken']
-        self.access_token: str = None if self.aiohttp_session else self.get_access_token()
-        self.headers: dict = {} if self.aiohttp_session else {
-            'Authorization': f'Bearer {self.access_token}',
-            'Content-Type': 'application/json'
-        }
-        
+        self.access_token: str = None
+        self.headers: dict = {}
+
+    # ------------------------
+    # Initialize
+    # ------------------------
+    async def initialize_wrapped(self):
+        try:
+            self.__set_access_token(await self.get_access_token())
+            self.__build_wrapped()
+        except Exception as err:
+            log.error(f"Initialize Wrapped: {err}")
+            raise Exception(f"Initialize Wrapped: {err}") from err
+
     async def aiohttp_initialize_wrapped(self):
         try:
-            self.access_token = await self.aiohttp_get_access_token()
-            self.headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            # Wrapped
-            self.top_tracks_short: TrackList = TrackList('short_term', self.headers, self.aiohttp_session)
-            self.top_tracks_medium: TrackList = TrackList('medium_term', self.headers, self.aiohttp_session)
-            self.top_tracks_long: TrackList = TrackList('long_term', self.headers, self.aiohttp_session)
-            self.top_artists_short: ArtistList = ArtistList('short_term', self.headers, self.aiohttp_session)
-            self.top_artists_medium: ArtistList = ArtistList('medium_term', self.headers, self.aiohttp_session)
-            self.top_artists_long: ArtistList = ArtistList('long_term', self.headers, self.aiohttp_session)
-            self.last_month, self.last_month_number, self.this_year = self.__get_last_month_data()
-            self.monthly_spotify_playlist: Playlist = Playlist(
-                self.user_id,
-                f"Xomify {self.last_month}'{self.this_year}", 
-                f"Your Top 25 songs for {self.last_month} - Created by xomify.com", 
-                self.headers,
-                self.aiohttp_session
-            )
-            self.first_half_of_year_spotify_playlist: Playlist = Playlist(
-                self.user_id,
-                f"Xomify First Half '{self.this_year}",
-                f"Your Top 25 songs for the First 6 months of '{self.this_year} - Created by xomify.com",
-                self.headers,
-                self.aiohttp_session
-            )
-            self.full_year_spotify_playlist: Playlist = Playlist(
-                self.user_id,
-                f"Xomify 20{self.this_year}",
-                f"Your Top 25 songs for 20{self.this_year} - Created by xomify.com",
-                self.headers,
-                self.aiohttp_session
-            )
+            self.__set_access_token(await self.aiohttp_get_access_token())
+            self.__build_wrapped()
         except Exception as err:
             log.error(f"AIOHTTP Initialize Wrapped: {err}")
             raise Exception(f"AIOHTTP Initialize Wrapped: {err}") from err
-        
+
+    async def initialize_release_radar(self):
+        try:
+            self.__set_access_token(await self.get_access_token())
+            self.__build_release_radar()
+        except Exception as err:
+            log.error(f"Initialize Release Radar: {err}")
+            raise Exception(f"Initialize Release Radar: {err}") from err
+
     async def aiohttp_initialize_release_radar(self):
         try:
-            self.access_token = await self.aiohttp_get_access_token()
-            self.headers = {
-                'Authorization': f'Bearer {self.access_token}',
-                'Content-Type': 'application/json'
-            }
-            # Release Radar
-            self.release_radar_playlist: Playlist = Playlist(
-                self.user_id,
-                f"Xomify Weekly Release Radar",
-                f"All your followed artists newest songs - Created by xomify.com",
-                self.headers,
-                self.aiohttp_session
-            )
-            self.followed_artists: ArtistList = ArtistList('Following', self.headers, self.aiohttp_session)
-            self.release_radar_playlist.set_id(self.user.get('releaseRadarId', None))
+            self.__set_access_token(await self.aiohttp_get_access_token())
+            self.__build_release_radar()
         except Exception as err:
             log.error(f"AIOHTTP Initialize Release Radar: {err}")
             raise Exception(f"AIOHTTP Initialize Release Radar: {err}") from err
 
-    def get_access_token(self):
+    def __set_access_token(self, access_token: str):
+        self.access_token = access_token
+        self.headers = {
+            'Authorization': f'Bearer {self.access_token}',
+            'Content-Type': 'application/json'
+        }
+
+    def __build_wrapped(self):
+        # Wrapped
+        self.top_tracks_short: TrackList = TrackList('short_term', self.headers, self.aiohttp_session)
+        self.top_tracks_medium: TrackList = TrackList('medium_term', self.headers, self.aiohttp_session)
+        self.top_tracks_long: TrackList = TrackList('long_term', self.headers, self.aiohttp_session)
+        self.top_artists_short: ArtistList = ArtistList('short_term', self.headers, self.aiohttp_session)
+        self.top_artists_medium: ArtistList = ArtistList('medium_term', self.headers, self.aiohttp_session)
+        self.top_artists_long: ArtistList = ArtistList('long_term', self.headers, self.aiohttp_session)
+        self.last_month, self.last_month_number, self.this_year = self.__get_last_month_data()
+        self.monthly_spotify_playlist: Playlist = Playlist(
+            self.user_id,
+            f"Xomify {self.last_month}'{self.this_year}", 
+            f"Your Top 25 songs for {self.last_month} - Created by xomify.com", 
+            self.headers,
+            self.aiohttp_session
+        )
+        self.first_half_of_year_spotify_playlist: Playlist = Playlist(
+            self.user_id,
+            f"Xomify First Half '{self.this_year}",
+            f"Your Top 25 songs for the First 6 months of '{self.this_year} - Created by xomify.com",
+            self.headers,
+            self.aiohttp_session
+        )
+        self.full_year_spotify_playlist: Playlist = Playlist(
+            self.user_id,
+            f"Xomify 20{self.this_year}",
+            f"Your Top 25 songs for 20{self.this_year} - Created by xomify.com",
+            self.headers,
+            self.aiohttp_session
+        )
+
+    def __build_release_radar(self):
+        # Release Radar
+        self.release_radar_playlist: Playlist = Playlist(
+            self.user_id,
+            f"Xomify Weekly Release Radar",
+            f"All your followed artists newest songs - Created by xomify.com",
+            self.headers,
+            self.aiohttp_session
+        )
+        self.followed_artists: ArtistList = ArtistList('Following', self.headers, self.aiohttp_session)
+        self.release_radar_playlist.set_id(self.user.get('releaseRadarId', None))
+        self.release_radar_playlist.set_image_hash(self.user.get('releaseRadarImageHash', None))
+
+    async def get_access_token(self):
+        try:
+            return await token_cache.aiohttp_get_access_token(self.user, self.__refresh_access_token)
+        except Exception as err:
+            log.error(f"Get Spotify Access Token: {err}")
+            raise Exception(f"Get Spotify Access Token: {err}") from err
+
+    async def aiohttp_get_access_token(self):
         try:
-            log.info("Getting spotify access token..")
+            return await token_cache.aiohttp_get_access_token(self.user, self.__refresh_access_token)
+        except Exception as err:
+            log.error(f"AIOHTTP Get Spotify Access Token: {err}")
+            raise Exception(f"AIOHTTP Get Spotify Access Token: {err}") from err
+
+    async def __refresh_access_token(self):
+        try:
+            log.info("Refreshing spotify access token..")
             url = "https://accounts.spotify.com/api/token"
 
             # Prepare the data for the token request
@@ -104,7 +142,7 @@ class Spotify:
             }
 
             # Make the request to refresh the token
-            response = requests.post(url, data=data)
+            response = await self.transport.request('POST', url, data=data)
             response_data = response.json()
 
             # Check for errors
@@ -112,34 +150,10 @@ class Spotify:
                 raise Exception(f"Error refreshing token: {response_data}")
 
             log.info("Successfully retrieved spotify access token!")
-            return response_data['access_token']
-        except Exception as err:
-            log.error(f"Get Spotify Access Token: {err}")
-            raise Exception(f"Get Spotify Access Token: {err}") from err
-        
-    async def aiohttp_get_access_token(self):
-        try:
-            log.info("Getting spotify access token..")
-            url = "https://accounts.spotify.com/api/token"
-
-            data = {
-                'grant_type': 'refresh_token',
-                'refresh_token': self.refresh_token,
-                'client_id': self.client_id,
-                'client_secret': self.client_secret,
-            }
-
-            async with self.aiohttp_session.post(url, data=data) as response:
-                response_data = await response.json()
-
-                if response.status != 200:
-                    raise Exception(f"Error refreshing token: {response_data}")
-
-                log.info("Successfully retrieved spotify access token!")
-                return response_data['access_token']
+            return response_data['access_token'], response_data['expires_in']
         except Exception as err:
-            log.error(f"AIOHTTP Get Spotify Access Token: {err}")
-            raise Exception(f"AIOHTTP Get Spotify Access Token: {err}") from err
+            log.error(f"Refresh Spotify Access Token: {err}")
+            raise Exception(f"Refresh Spotify Access Token: {err}") from err
         
     async def get_top_tracks(self):
         try:
@@ -1,19 +1,86 @@
+import time
+import threading
 import boto3
-from lambdas.common.constants import PRODUCT
+from lambdas.common.constants import PRODUCT, LOGGER, SSM_PARAMETER_TTL_SECONDS
 
-ssm = boto3.client("ssm", verify=False)
+log = LOGGER.get_logger(__file__)
 
 __AWS_ROOT = f'/{PRODUCT}/aws/'
 __SPOTIFY_ROOT = f'/{PRODUCT}/spotify/'
 __API_ROOT = f'/{PRODUCT}/api/'
 
-# AWS
-AWS_ACCESS_KEY = ssm.get_parameter(Name=f'{__AWS_ROOT}ACCESS_KEY', WithDecryption=True)['Parameter']['Value']
-AWS_SECRET_KEY = ssm.get_parameter(Name=f'{__AWS_ROOT}SECRET_KEY', WithDecryption=True)['Parameter']['Value']
+# Parameters in the same group are always needed together - fetched in one get_parameters call
+PARAMETER_GROUPS = [
+    # AWS
+    {
+        'AWS_ACCESS_KEY': f'{__AWS_ROOT}ACCESS_KEY',
+        'AWS_SECRET_KEY': f'{__AWS_ROOT}SECRET_KEY',
+    },
+    # SPOTIFY
+    {
+        'SPOTIFY_CLIENT_ID': f'{__SPOTIFY_ROOT}CLIENT_ID',
+        'SPOTIFY_CLIENT_SECRET': f'{__SPOTIFY_ROOT}CLIENT_SECRET',
+    },
+    #API
+    {
+        'API_SECRET_KEY': f'{__API_ROOT}API_SECRET_KEY',
+    },
+]
 
-# SPOTIFY
-SPOTIFY_CLIENT_ID = ssm.get_parameter(Name=f'{__SPOTIFY_ROOT}CLIENT_ID', WithDecryption=True)['Parameter']['Value']
-SPOTIFY_CLIENT_SECRET = ssm.get_parameter(Name=f'{__SPOTIFY_ROOT}CLIENT_SECRET', WithDecryption=True)['Parameter']['Value']
 
-#API
-API_SECRET_KEY = ssm.get_parameter(Name=f'{__API_ROOT}API_SECRET_KEY', WithDecryption=True)['Parameter']['Value']
+class ParameterProvider:
+    """
+    SSM parameters fetched on first access rather than at import.
+
+    Asking for one parameter fetches its whole group in a single batched call. Values are kept
+    for `ttl` seconds, so warm invocations reuse them and rotated secrets are still picked up.
+    """
+
+    def __init__(self, groups: list, ttl: int = SSM_PARAMETER_TTL_SECONDS):
+        self.ttl = ttl
+        self.groups = {name: group for group in groups for name in group}
+        self.values = {}
+        self.lock = threading.Lock()
+        self.client = None
+
+    def get(self, name: str):
+        try:
+            if name not in self.groups:
+                raise KeyError(f"Unknown parameter {name}")
+            cached = self.values.get(name)
+            if cached and cached[1] > time.monotonic():
+                return cached[0]
+            with self.lock:
+                cached = self.values.get(name)
+                if cached and cached[1] > time.monotonic():
+                    return cached[0]
+                self.__fetch_group(self.groups[name])
+                return self.values[name][0]
+        except Exception as err:
+            log.error(f"Get SSM Parameter: {err}")
+            raise Exception(f"Get SSM Parameter {name}: {err}") from err
+
+    def __fetch_group(self, group: dict):
+        if self.client is None:
+            self.client = boto3.client("ssm", verify=False)
+        response = self.client.get_parameters(Names=list(group.values()), WithDecryption=True)
+        if response['InvalidParameters']:
+            raise Exception(f"Invalid SSM parameters: {response['InvalidParameters']}")
+        values = {parameter['Name']: parameter['Value'] for parameter in response['Parameters']}
+        expires_at = time.monotonic() + self.ttl
+        for name, path in group.items():
+            self.values[name] = (values[path], expires_at)
+
+
+parameters = ParameterProvider(PARAMETER_GROUPS)
+
+
+def get_parameter(name: str):
+    return parameters.get(name)
+
+
+# Keep `from ssm_helpers import SPOTIFY_CLIENT_ID` working - resolved lazily, on import of the name
+def __getattr__(name: str):
+    if name in parameters.groups:
+        return parameters.get(name)
+    raise AttributeError(f"module {__name__} has no attribute {name}")
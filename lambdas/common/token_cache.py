@@ -0,0 +1,88 @@
+import time
+import asyncio
+from lambdas.common.constants import (
+    LOGGER, WRAPPED_TABLE_NAME, ACCESS_TOKEN_REFRESH_MARGIN_SECONDS, PERSIST_ACCESS_TOKENS
+)
+from lambdas.common.dynamo_helpers import update_table_item_field
+from lambdas.common.async_dynamo_helpers import run_in_dynamo_executor
+
+log = LOGGER.get_logger(__file__)
+
+# User table attribute holding {'token': str, 'expiresAt': epoch seconds} when persistence is on
+ACCESS_TOKEN_ATTRIBUTE = 'spotifyAccessToken'
+
+
+class AccessTokenCache:
+    """
+    Spotify access tokens keyed by user ID, held until shortly before they expire.
+
+    Tokens live in process memory, so warm Lambda containers reuse them across invocations,
+    and - when `persist` is on - in the user's table item, so the next job to load that user
+    picks them up too. Tokens are refreshed `refresh_margin` seconds ahead of expiry, and
+    concurrent requests for the same user wait on a single refresh.
+    """
+
+    def __init__(self, refresh_margin: int = ACCESS_TOKEN_REFRESH_MARGIN_SECONDS, persist: bool = PERSIST_ACCESS_TOKENS):
+        self.refresh_margin = refresh_margin
+        self.persist = persist
+        self.tokens = {}
+        self.in_flight = {}
+
+    # ------------------------
+    # Shared Methods
+    # ------------------------
+    def __is_fresh(self, entry):
+        return bool(entry) and entry['expiresAt'] - self.refresh_margin > time.time()
+
+    def get(self, user: dict):
+        entry = self.tokens.get(user['userId'])
+        if not self.__is_fresh(entry) and self.persist:
+            entry = user.get(ACCESS_TOKEN_ATTRIBUTE)
+            if self.__is_fresh(entry):
+                self.tokens[user['userId']] = entry
+        return entry['token'] if self.__is_fresh(entry) else None
+
+    def put(self, user: dict, token: str, expires_in: int):
+        entry = {'token': token, 'expiresAt': int(time.time()) + int(expires_in)}
+        self.tokens[user['userId']] = entry
+        if self.persist:
+            try:
+                update_table_item_field(WRAPPED_TABLE_NAME, 'email', user['email'], ACCESS_TOKEN_ATTRIBUTE, entry)
+                user[ACCESS_TOKEN_ATTRIBUTE] = entry
+            except Exception as err:
+                # Only a cache - the token is still good for this run
+                log.warning(f"Persist Access Token for {user['email']}: {err}")
+
+    # ------------------------
+    # Get Token
+    # ------------------------
+    async def aiohttp_get_access_token(self, user: dict, refresh):
+        """`refresh()` is a coroutine function returning (access_token, expires_in)."""
+        token = self.get(user)
+        if token:
+            return token
+        user_id = user['userId']
+        if user_id in self.in_flight:
+            return await asyncio.shield(self.in_flight[user_id])
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[user_id] = future
+        try:
+            token, expires_in = await refresh()
+            if self.persist:
+                await run_in_dynamo_executor(self.put, user, token, expires_in)
+            else:
+                self.put(user, token, expires_in)
+            future.set_result(token)
+            return token
+        except Exception as err:
+            future.set_exception(err)
+            # Mark retrieved so a refresh nobody else waited on doesn't log "never retrieved"
+            future.exception()
+            raise
+        finally:
+            del self.in_flight[user_id]
+
+
+# Shared by every Spotify client in the container
+token_cache = AccessTokenCache()
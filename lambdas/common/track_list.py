@@ -1,9 +1,9 @@
-import requests
 import aiohttp
-import time
 from datetime import datetime
 import asyncio
 from lambdas.common.aiohttp_helper import fetch_json
+from lambdas.common.transport import get_transport
+from lambdas.common.release_index import ReleaseIndex, AlbumTrackCache
 from lambdas.common.constants import LOGGER
 
 log = LOGGER.get_logger(__file__)
@@ -11,10 +11,13 @@ log = LOGGER.get_logger(__file__)
 class TrackList:
 
     BASE_URL = "https://api.spotify.com/v1"
+    RELEASE_GROUPS = ("album", "single", "appears_on", "compilation")
+    RELEASE_PAGE_SIZE = 50
 
     def __init__(self, term: str, headers: dict, session: aiohttp.ClientSession = None):
         log.info(f"Initializing Tracks for term: {term}")
         self.aiohttp_session = session
+        self.transport = get_transport(session)
         self.term: str = term
         self.headers = headers
         self.track_list: list = []
@@ -68,7 +71,7 @@ class TrackList:
             url = f"{self.BASE_URL}/me/top/tracks?limit=25&time_range={self.term}"
 
             # Make the request
-            response = requests.get(url, headers=self.headers)
+            response = await self.transport.request('GET', url, headers=self.headers)
             response_data = response.json()
 
             # Check for errors
@@ -124,14 +127,23 @@ class TrackList:
             log.error(f"Get Artist Latest Release: {err}")
             raise Exception(f"Get Artist Latest Release: {err}") from err
     
-    async def aiohttp_get_artist_latest_release(self, artist_id_list: list):
+    async def aiohttp_get_artist_latest_release(self, artist_id_list: list, release_index: ReleaseIndex = None):
         try:
             log.info("Getting artist releases within the last week...")
-            tasks = [self.aiohttp_get_latest_releases(artist_id) for artist_id in artist_id_list]
-
             # Get all ids of latest releases for the week
-            artist_latest_release_uris = await asyncio.gather(*tasks, return_exceptions=True)
-            combined_artist_latest_release_uris = [item for sublist in artist_latest_release_uris for item in sublist]
+            artist_latest_release_uris = await self.__aiohttp_gather_artist_releases(artist_id_list, release_index)
+
+            # Failed artists get one more try. A result missing an artist must never be synced -
+            # the diff sync would remove that artist's tracks from the playlist
+            failed_ids = [artist_id for artist_id, release_uris in artist_latest_release_uris.items() if isinstance(release_uris, Exception)]
+            if failed_ids:
+                log.warning(f"Retrying releases for {len(failed_ids)} artists...")
+                artist_latest_release_uris.update(await self.__aiohttp_gather_artist_releases(failed_ids, release_index))
+            combined_artist_latest_release_uris = []
+            for artist_id, release_uris in artist_latest_release_uris.items():
+                if isinstance(release_uris, Exception):
+                    raise Exception(f"Releases for artist {artist_id} failed: {release_uris}") from release_uris
+                combined_artist_latest_release_uris.extend(release_uris)
             log.debug(f"Latest Release IDs: {combined_artist_latest_release_uris}")
             log.debug(len(combined_artist_latest_release_uris))
 
@@ -147,7 +159,9 @@ class TrackList:
             log.debug(len(self.track_uri_list))
 
             # Get all tracks for new albums
-            all_tracks_from_albums_uris = await self.aiohttp_get_several_albums_tracks()
+            all_tracks_from_albums_uris = await self.aiohttp_get_several_albums_tracks(
+                release_index.album_tracks if release_index is not None else None
+            )
             log.debug(f"All Tracks from Albums: {all_tracks_from_albums_uris}")
             log.debug(len(all_tracks_from_albums_uris))
             self.track_uri_list.extend(all_tracks_from_albums_uris)
@@ -159,64 +173,60 @@ class TrackList:
             log.error(f"AIOHTTP Get Artist Latest Release: {err}")
             raise Exception(f"AIOHTTP Get Artist Latest Release: {err}") from err
     
-    async def get_latest_releases(self, artist_id: str, offset: int = 0):
+    async def __aiohttp_gather_artist_releases(self, artist_id_list: list, release_index: ReleaseIndex = None):
+        """Map of artist ID -> in-window release URIs, or the exception its fetch raised."""
+        if release_index is not None:
+            # Shared across the run - artists someone else already fetched cost nothing
+            tasks = [release_index.get_artist_releases(artist_id, self.aiohttp_get_latest_releases) for artist_id in artist_id_list]
+        else:
+            tasks = [self.aiohttp_get_latest_releases(artist_id) for artist_id in artist_id_list]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        return dict(zip(artist_id_list, results))
+
+    async def get_latest_releases(self, artist_id: str):
         try:
-            include_groups = "album,single,appears_on,compilation"
-            url = f"{self.BASE_URL}/artists/{artist_id}/albums?&include_groups='{include_groups}'&limit=1&offset={offset}"
+            # One query per group, all at once - each stops at its own first out-of-window release,
+            # so a group the artist has nothing in (or nothing new in) costs a single short page
+            groups = await asyncio.gather(*[self.__get_group_latest_releases(artist_id, group) for group in self.RELEASE_GROUPS])
+            return [uri for group_uris in groups for uri in group_uris]
+        except Exception as err:
+            log.error(f"Get Latest Releases: {err}")
+            raise Exception(f"Get Latest Releases: {err}") from err
 
-            # Make the request
-            response = requests.get(url, headers=self.headers)
+    async def aiohttp_get_latest_releases(self, artist_id: str):
+        try:
+            groups = await asyncio.gather(*[self.__aiohttp_get_group_latest_releases(artist_id, group) for group in self.RELEASE_GROUPS])
+            return [uri for group_uris in groups for uri in group_uris]
+        except Exception as err:
+            log.error(f"AIOHTTP Get Latest Releases: {err}")
+            raise Exception(f"AIOHTTP Get Latest Releases: {err}") from err
+
+    async def __get_group_latest_releases(self, artist_id: str, group: str):
+        url = self.__get_releases_url(artist_id, group)
+        release_uris = []
+        while url:
+            response = await self.transport.request('GET', url, headers=self.headers)
             response_data = response.json()
 
-            # Check for errors
-            if response.status_code == 429:
-                log.warning("RATE LIMIT REACHED")
-                time.sleep(response.headers['retry-after'] + 1)
-                return await self.get_artist_latest_release(artist_id)
+            # Check for errors - 429s are already retried by the transport
             if response.status_code != 200:
                 raise Exception(f"Error fetching artist latest release: {response}")
-            
-            release_uris = []
-            for release in response_data['items']:
-                for artist in release['artists']:
-                    log.debug(f"Artist: {artist['name']}")
-                log.debug(f"Album: {release['name']}")
-                log.debug(f"Release Date: {release['release_date']}")
-                if self.__is_within_a_week(release['release_date']):
-                    log.debug("New Release Added.")
-                    release_uris.append(release['uri'])
-                    release_uris.extend(self.get_latest_releases(artist_id, offset+1))
-                else:
-                    log.debug("Old Release Skipped.")
-                
-                print("\n")
-            return release_uris
 
-        except Exception as err:
-            log.error(f"Get Latest Releases: {err}")
-            raise Exception(f"Get Latest Releases: {err}") from err
-    
-    async def aiohttp_get_latest_releases(self, artist_id: str, offset: int = 0):
-        try:
-            include_groups = "album,single,appears_on,compilation"
-            url = f"{self.BASE_URL}/artists/{artist_id}/albums?&include_groups='{include_groups}'&limit=1&offset={offset}"
+            page_uris, closed = self.__scan_release_page(response_data['items'])
+            release_uris.extend(page_uris)
+            url = None if closed else response_data['next']
+        return release_uris
 
+    async def __aiohttp_get_group_latest_releases(self, artist_id: str, group: str):
+        url = self.__get_releases_url(artist_id, group)
+        release_uris = []
+        # Common case is one page - only keep paging while every release so far was in the window
+        while url:
             data = await fetch_json(self.aiohttp_session, url, headers=self.headers)
-
-            release_uris = []
-            for release in data['items']:
-                log.debug(f"Album: {release['name']} | Release Date: {release['release_date']}")
-                if self.__is_within_a_week(release['release_date']):
-                    log.debug("New Release Added.")
-                    release_uris.append(release['uri'])
-                    # Recurse to fetch the next release
-                    release_uris.extend(await self.aiohttp_get_latest_releases(artist_id, offset+1))
-                else:
-                    log.debug("Old Release Skipped.")
-            return release_uris
-        except Exception as err:
-            log.error(f"AIOHTTP Get Latest Releases: {err}")
-            raise Exception(f"AIOHTTP Get Latest Releases: {err}") from err
+            page_uris, closed = self.__scan_release_page(data['items'])
+            release_uris.extend(page_uris)
+            url = None if closed else data['next']
+        return release_uris
     
     # ------------------------
     # Get Tracks from Album
@@ -230,7 +240,7 @@ class TrackList:
             url = f"{self.BASE_URL}/albums/{album_id}/tracks"
 
             # Make the request
-            response = requests.get(url, headers=self.headers)
+            response = await self.transport.request('GET', url, headers=self.headers)
             response_data = response.json()
 
             # Check for errors
@@ -268,7 +278,7 @@ class TrackList:
                 url = f"{self.BASE_URL}/albums?ids={ids_param}"
 
                 # Make the request
-                response = requests.get(url, headers=self.headers)
+                response = await self.transport.request('GET', url, headers=self.headers)
                 response_data = response.json()
 
                 # Check for errors
@@ -291,35 +301,67 @@ class TrackList:
             log.error(f"Get Several Albums Tracks: {err}")
             raise Exception(f"Get Several Albums Tracks: {err}") from err
     
-    async def aiohttp_get_several_albums_tracks(self):
+    async def aiohttp_get_several_albums_tracks(self, album_cache: AlbumTrackCache = None):
         try:
             album_ids = [uri.split(":")[2] for uri in self.album_uri_list]
-            track_uris = []
-            print("ALBUM IDS------------")
-            print(album_ids)
-            for i in range(0, len(album_ids), 20):
-                batch_ids = album_ids[i:i+20]
-                ids_param = ",".join(batch_ids)
-                url = f"{self.BASE_URL}/albums?ids={ids_param}"
-                print("URL-------")
-                print(url)
-                data = await fetch_json(self.aiohttp_session, url, headers=self.headers)
-                print("DATA-----------")
-                print(data)
-                for album in data["albums"]:
-                    if not album or "tracks" not in album:
-                        continue
-                    if album['album_type'] == 'single':
-                        track_uris.append(album["tracks"]["items"][0]['uri'])
-                    else:
-                        for track in album["tracks"]["items"]:
-                            track_uris.append(track["uri"])
+            album_cache = album_cache if album_cache is not None else AlbumTrackCache(len(album_ids))
+
+            # Albums another user already has (or is) expanding are awaited, not re-downloaded
+            futures = []
+            missing_ids = []
+            for album_id in album_ids:
+                future = album_cache.get(album_id)
+                if future is None:
+                    future = album_cache.reserve(album_id)
+                    missing_ids.append(album_id)
+                futures.append(future)
+
+            # Spotify only allows up to 20 album IDs at a time - fetch the batches concurrently
+            batches = [missing_ids[i:i+20] for i in range(0, len(missing_ids), 20)]
+            await asyncio.gather(*[self.__aiohttp_expand_album_batch(batch_ids, album_cache) for batch_ids in batches])
 
+            track_uris = []
+            results = await asyncio.gather(*[asyncio.shield(future) for future in futures], return_exceptions=True)
+            for album_id, album_track_uris in zip(album_ids, results):
+                # A result missing an album must never be synced - its tracks would be removed from the playlist
+                if isinstance(album_track_uris, BaseException):
+                    raise Exception(f"Tracks for album {album_id} failed: {album_track_uris}") from album_track_uris
+                track_uris.extend(album_track_uris)
             return track_uris
         except Exception as err:
             log.error(f"AIOHTTP Get Several Albums Tracks: {err}")
             raise Exception(f"AIOHTTP Get Several Albums Tracks: {err}") from err
 
+    async def __aiohttp_expand_album_batch(self, batch_ids: list, album_cache: AlbumTrackCache):
+        failure = None
+        try:
+            url = f"{self.BASE_URL}/albums?ids={','.join(batch_ids)}"
+            data = await fetch_json(self.aiohttp_session, url, headers=self.headers)
+            albums = {album['id']: album for album in data["albums"] if album}
+            for album_id in batch_ids:
+                album = albums.get(album_id)
+                if not album or "tracks" not in album:
+                    album_cache.resolve(album_id, [])
+                    continue
+                # For singles, only add the single (sometimes have other songs in there)
+                if album['album_type'] == 'single':
+                    album_cache.resolve(album_id, [album["tracks"]["items"][0]['uri']] if album["tracks"]["items"] else [])
+                    continue
+                track_uris = [track["uri"] for track in album["tracks"]["items"]]
+                next = album["tracks"]["next"]
+                while next:
+                    page = await fetch_json(self.aiohttp_session, next, headers=self.headers)
+                    track_uris.extend(track["uri"] for track in page["items"])
+                    next = page["next"]
+                album_cache.resolve(album_id, track_uris)
+        except Exception as err:
+            log.error(f"AIOHTTP Expand Album Batch: {err}")
+            failure = err
+        finally:
+            # Albums still unresolved - failed or cancelled mid-batch - are failed, so no user waits on them forever
+            for album_id in batch_ids:
+                album_cache.fail(album_id, failure or Exception(f"Album {album_id} expansion was cancelled"))
+
     # ------------------------
     # Helper Functions
     # ------------------------
@@ -338,6 +380,26 @@ class TrackList:
             log.error(f"Is Date Within a week: {err}")
             raise Exception(f"Is Date Within a week: {err}") from err
         
+    def __get_releases_url(self, artist_id: str, group: str):
+        return f"{self.BASE_URL}/artists/{artist_id}/albums?include_groups={group}&limit={self.RELEASE_PAGE_SIZE}"
+
+    def __scan_release_page(self, releases: list):
+        """
+        Collect in-window release URIs from one page of a single group's releases, newest first.
+
+        Returns (release_uris, closed) - `closed` once an out-of-window release is reached, since
+        everything after it is older; there is nothing left worth paging for.
+        """
+        release_uris = []
+        for release in releases:
+            log.debug(f"Album: {release['name']} | Release Date: {release['release_date']}")
+            if not self.__is_within_a_week(release['release_date']):
+                log.debug("Old Release Skipped.")
+                return release_uris, True
+            log.debug("New Release Added.")
+            release_uris.append(release['uri'])
+        return release_uris, False
+
     def __split_spotify_uris(self, uris):
         tracks = [id for id in uris if id and id.startswith("spotify:track:")]
         albums = [id for id in uris if id and id.startswith("spotify:album:")]
@@ -0,0 +1,74 @@
+import asyncio
+import functools
+import aiohttp
+import requests
+from requests.adapters import HTTPAdapter
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from lambdas.common.aiohttp_helper import TransportResponse, aiohttp_send, send_paced
+from lambdas.common.constants import LOGGER, HTTP_POOL_SIZE, HTTP_TIMEOUT_SECONDS
+
+log = LOGGER.get_logger(__file__)
+
+
+class Transport(ABC):
+    """
+    Sends Spotify requests for the TrackList / ArtistList / Playlist / Spotify methods.
+
+    `request` paces every call through `send_paced`, the same limiter and 429 loop the aiohttp
+    helpers use - callers only ever see the final response. Subclasses implement `send`.
+    """
+
+    async def request(self, method: str, url: str, headers: dict = None, json: dict = None, data=None):
+        return await send_paced(self.send, method, url, headers=headers, json=json, data=data)
+
+    @abstractmethod
+    async def send(self, method: str, url: str, headers: dict = None, json: dict = None, data=None):
+        """Send one request as is and return a TransportResponse - no pacing or retries."""
+
+
+class RequestsTransport(Transport):
+    """
+    One keep-alive `requests.Session` for the container, driven from a thread pool.
+
+    Connections are pooled and reused instead of a new TLS handshake per call, and each blocking
+    call runs on the pool - so coroutines gathered over this transport really do overlap.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, timeout: float = HTTP_TIMEOUT_SECONDS):
+        self.timeout = timeout
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix='http')
+
+    async def send(self, method: str, url: str, headers: dict = None, json: dict = None, data=None):
+        response = await asyncio.get_running_loop().run_in_executor(
+            self.executor,
+            functools.partial(self.session.request, method, url, headers=headers, json=json, data=data, timeout=self.timeout)
+        )
+        return TransportResponse(response.status_code, response.headers, response.content)
+
+
+class AiohttpTransport(Transport):
+    """Sends over the caller's `aiohttp.ClientSession`."""
+
+    def __init__(self, session: aiohttp.ClientSession):
+        self.session = session
+
+    async def send(self, method: str, url: str, headers: dict = None, json: dict = None, data=None):
+        return await aiohttp_send(self.session, method, url, headers=headers, json=json, data=data)
+
+
+__TRANSPORTS = {}
+
+
+def get_transport(session: aiohttp.ClientSession = None):
+    """aiohttp when the caller has a session, otherwise the container's pooled requests transport."""
+    if session is not None:
+        return AiohttpTransport(session)
+    transport = __TRANSPORTS.get('requests')
+    if transport is None:
+        transport = RequestsTransport()
+        __TRANSPORTS['requests'] = transport
+    return transport
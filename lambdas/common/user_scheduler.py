@@ -0,0 +1,95 @@
+import asyncio
+from lambdas.common.constants import LOGGER, MAX_USERS_IN_FLIGHT
+
+log = LOGGER.get_logger(__file__)
+
+# Marks the end of the user source for a worker
+__DONE = object()
+
+
+class UserStream:
+    """
+    The users of a stream of (start_key, users) pages, as an async iterable for `run_user_pool`.
+
+    `cursor` is the start key of the page the latest user came from. A run that stops early resumes
+    from there - users of that page it already finished are skipped by `keep` (the run ledger).
+    `exhausted` is only set once every page has been read.
+    """
+
+    def __init__(self, pages, keep=None):
+        self.pages = pages
+        self.keep = keep
+        self.cursor = None
+        self.exhausted = False
+
+    async def __aiter__(self):
+        async for start_key, page in self.pages:
+            self.cursor = start_key
+            for user in page:
+                if self.keep is None or self.keep(user):
+                    yield user
+        self.exhausted = True
+
+
+async def run_user_pool(users, process_user, max_in_flight: int = MAX_USERS_IN_FLIGHT, should_stop=None):
+    """
+    Run `process_user(user)` for every user with at most `max_in_flight` users in progress.
+
+    Users are pulled from `users` (an iterable or async iterable) lazily, only as workers free up, and nothing is kept
+    for a user once it finishes except its result - so peak memory is bounded by
+    `max_in_flight`, not by how many users the source yields.
+    Once `should_stop()` returns True no more users are pulled; users already handed out still finish.
+    At least one user is taken per run, so a run started late still makes progress.
+    Returns (success, failures): results of users that completed and the errors of those that did not.
+    """
+    try:
+        success = []
+        failures = []
+        queue = asyncio.Queue(maxsize=max_in_flight)
+
+        async def producer():
+            queued = 0
+            if hasattr(users, '__aiter__'):
+                async for user in users:
+                    if queued and should_stop and should_stop():
+                        log.warning(f"Stopping early after {queued} users - draining the users in flight.")
+                        break
+                    await queue.put(user)
+                    queued += 1
+            else:
+                for user in users:
+                    if queued and should_stop and should_stop():
+                        log.warning(f"Stopping early after {queued} users - draining the users in flight.")
+                        break
+                    await queue.put(user)
+                    queued += 1
+            for _ in range(max_in_flight):
+                await queue.put(__DONE)
+
+        async def worker():
+            while True:
+                user = await queue.get()
+                if user is __DONE:
+                    return
+                try:
+                    success.append(await process_user(user))
+                except Exception as err:
+                    log.error(f"User {user.get('email')} failed: {err}")
+                    failures.append(err)
+                finally:
+                    del user
+
+        workers = [asyncio.create_task(worker()) for _ in range(max_in_flight)]
+        try:
+            await producer()
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+
+        log.info(f"User Success: {success}")
+        log.info(f"User Failures: {failures}")
+        return success, failures
+    except Exception as err:
+        log.error(f"Run User Pool: {err}")
+        raise Exception(f"Run User Pool: {err}") from err
@@ -1,26 +1,72 @@
-from lambdas.common.dynamo_helpers import full_table_scan
-from lambdas.common.constants import WRAPPED_TABLE_NAME, LOGGER
+import asyncio
+from lambdas.common.dynamo_helpers import query_index, query_index_cursor_pages
+from lambdas.common.async_dynamo_helpers import run_in_dynamo_executor, aiohttp_update_user_table_wrapped_data
+from lambdas.common.token_cache import ACCESS_TOKEN_ATTRIBUTE
+from lambdas.common.run_ledger import LEDGER_ATTRIBUTES, WRAPPED_JOB, RELEASE_RADAR_JOB, run_complete_fields
+from lambdas.common.constants import (
+    WRAPPED_TABLE_NAME, LOGGER, ACTIVE_WRAPPED_INDEX_NAME, ACTIVE_RELEASE_RADAR_INDEX_NAME,
+    WRAPPED_INDEX_KEY, RELEASE_RADAR_INDEX_KEY, ACTIVE_INDEX_KEY_VALUE
+)
 
 log = LOGGER.get_logger(__file__)
 
-def get_active_wrapped_users():
-     try:
-        log.info("Geting active wrapped users...")
-        table_values = full_table_scan(WRAPPED_TABLE_NAME)
-        table_values[:] = [item for item in table_values if item['activeWrapped']]
-        log.info(f"Found {len(table_values)} active users!")
-        return table_values
-     except Exception as err:
-        log.error(f"Get Active Wrapped Users: {err}")
-        raise Exception(f"Get Active Wrapped Users: {err}") from err
-     
+# Only what each pipeline reads - history dicts and everything else stay in the table.
+# Read from the index itself, so each index must project these (INCLUDE or ALL) - see the README.
+WRAPPED_USER_ATTRIBUTES = ['email', 'userId', 'refreshToken', ACCESS_TOKEN_ATTRIBUTE, LEDGER_ATTRIBUTES[WRAPPED_JOB]]
+RELEASE_RADAR_USER_ATTRIBUTES = ['email', 'userId', 'refreshToken', 'releaseRadarId', 'releaseRadarImageHash', ACCESS_TOKEN_ATTRIBUTE, LEDGER_ATTRIBUTES[RELEASE_RADAR_JOB]]
+
 def get_active_release_radar_users():
      try:
         log.info("Geting active release radar users...")
-        table_values = full_table_scan(WRAPPED_TABLE_NAME)
-        table_values[:] = [item for item in table_values if item['activeReleaseRadar']]
+        table_values = query_index(WRAPPED_TABLE_NAME, ACTIVE_RELEASE_RADAR_INDEX_NAME, RELEASE_RADAR_INDEX_KEY, ACTIVE_INDEX_KEY_VALUE, RELEASE_RADAR_USER_ATTRIBUTES)
         log.info(f"Found {len(table_values)} active users!")
         return table_values
      except Exception as err:
         log.error(f"Get Active Release Radar Users: {err}")
-        raise Exception(f"Get Active Release Radar Users: {err}") from err
\ No newline at end of file
+        raise Exception(f"Get Active Release Radar Users: {err}") from err
+
+# ------------------------
+# Streaming User Sources
+# ------------------------
+async def aiter_active_wrapped_user_pages(start_key: dict = None):
+    async for page in __aiter_query_pages(ACTIVE_WRAPPED_INDEX_NAME, WRAPPED_INDEX_KEY, WRAPPED_USER_ATTRIBUTES, start_key):
+        yield page
+
+async def aiter_active_release_radar_user_pages(start_key: dict = None):
+    async for page in __aiter_query_pages(ACTIVE_RELEASE_RADAR_INDEX_NAME, RELEASE_RADAR_INDEX_KEY, RELEASE_RADAR_USER_ATTRIBUTES, start_key):
+        yield page
+
+async def __aiter_query_pages(index_name: str, index_key: str, projection_attributes: list, start_key: dict = None):
+    """
+    Yield (start_key, users) index query pages as they arrive, so users on the first page can start while
+    later pages load. Each page is fetched on the DynamoDB executor - the next one is already in flight
+    while the caller works through the current one. `start_key` resumes from a page a previous run stopped on.
+    """
+    try:
+        pages = query_index_cursor_pages(WRAPPED_TABLE_NAME, index_name, index_key, ACTIVE_INDEX_KEY_VALUE, projection_attributes, start_key)
+        next_page = asyncio.ensure_future(run_in_dynamo_executor(next, pages, None))
+        page_number = 0
+        while True:
+            page = await next_page
+            if page is None:
+                log.info(f"Finished streaming {page_number} pages of active users from {index_name}.")
+                return
+            page_number += 1
+            # Prefetch before handing this page over
+            next_page = asyncio.ensure_future(run_in_dynamo_executor(next, pages, None))
+            log.info(f"Streaming page {page_number} with {len(page[1])} active users from {index_name}.")
+            yield page
+    except Exception as err:
+        log.error(f"AIter Query Pages: {err}")
+        raise Exception(f"AIter Query Pages {index_name}: {err}") from err
+
+# ------------------------
+# Wrapped Results
+# ------------------------
+async def update_wrapped_user_entry(user: dict, top_tracks_last_month: dict, top_artists_last_month: dict, top_genres_last_month: dict, run_key: str = None):
+    """
+    Write a user's wrapped results - an attribute-level update, since `user` is a projected index item.
+    Marks the run complete for this user in the same write, sent as soon as the user finishes.
+    """
+    completed = run_complete_fields(run_key) if run_key else None
+    await aiohttp_update_user_table_wrapped_data(user['email'], top_tracks_last_month, top_artists_last_month, top_genres_last_month, completed)
@@ -1,4 +1,3 @@
-import asyncio
 import traceback
 from lambdas.common.utility_helpers import build_successful_handler_response, build_error_handler_response
 from lambdas.common.errors import ReleaseRadarError
@@ -6,6 +5,8 @@ from weekly_release_radar import release_radar_chron_job
 from weekly_release_radar_aiohttp import aiohttp_release_radar_chron_job
 
 from lambdas.common.constants import LOGGER
+from lambdas.common.cron_dispatcher import run_cron_job
+from lambdas.common.run_ledger import RELEASE_RADAR_JOB
 
 log = LOGGER.get_logger(__file__)
 
@@ -17,8 +18,12 @@ def handler(event, context):
 
         # Monthly Wrapped Chron Job
         if 'body' not in event and event.get("source") == 'aws.events':
-            success, failures = asyncio.run(aiohttp_release_radar_chron_job(event))
-            return build_successful_handler_response({"successfulUsers": success, "failedUsers": failures}, False)
+            # Sharded, deadline-aware run - see run_cron_job
+            body = run_cron_job(
+                event, context, handler, RELEASE_RADAR_JOB, aiohttp_release_radar_chron_job,
+                lambda result: {"successfulUsers": result[0], "failedUsers": [str(err) for err in result[1]]}
+            )
+            return build_successful_handler_response(body, False)
 
         else:
             raise Exception("Invalid Call: Must call from chron job.", 400)
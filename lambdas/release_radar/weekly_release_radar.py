@@ -2,8 +2,11 @@
 import asyncio
 from lambdas.common.wrapped_helper import get_active_release_radar_users
 from lambdas.common.spotify import Spotify
-from lambdas.common.constants import BLACK_LOGO_BASE_64, LOGGER
-from lambdas.common.dynamo_helpers import update_user_table_release_radar_id
+from lambdas.common.constants import LOGGER, WRAPPED_TABLE_NAME
+from lambdas.common.image_assets import get_image_asset, BLACK_LOGO
+from lambdas.common.cron_dispatcher import get_event_shard, in_shard
+from lambdas.common.async_dynamo_helpers import aiohttp_update_user_table_release_radar_id, aiohttp_update_table_item_fields
+from lambdas.common.run_ledger import RELEASE_RADAR_JOB, get_event_run_key, is_run_complete, run_complete_fields, process_claimed_user
 
 log = LOGGER.get_logger(__file__)
 
@@ -11,8 +14,13 @@ async def release_radar_chron_job(event):
     try:
         log.info("Starting Release Radar Chron Job...")
         response = []
-        release_radar_users = get_active_release_radar_users()
-        tasks = [process_user(user) for user in release_radar_users]
+        shard = get_event_shard(event)
+        run_key = get_event_run_key(event, RELEASE_RADAR_JOB)
+        release_radar_users = [
+            user for user in get_active_release_radar_users()
+            if in_shard(user['email'], shard) and not is_run_complete(user, run_key)
+        ]
+        tasks = [process_claimed_user(user, run_key, lambda user=user: process_user(user, run_key)) for user in release_radar_users]
         response = await asyncio.gather(*tasks, return_exceptions=True)
         log.info(f"Full Response Complete for Users: {response}")
 
@@ -21,10 +29,11 @@ async def release_radar_chron_job(event):
         log.error(f"Release Radar Chron Job: {err}")
         raise Exception(f"Release Radar Chron Job: {err}")
     
-async def process_user(user: dict):
+async def process_user(user: dict, run_key: str = None):
     try:
         log.info(f"Found User: {user}")
         spotify = Spotify(user)
+        await spotify.initialize_release_radar()
 
         await spotify.followed_artists.get_followed_artists()
 
@@ -35,15 +44,18 @@ async def process_user(user: dict):
         if not spotify.release_radar_playlist.id:
             log.info("No Release Radar Playlist ID found yet.")
             
-            await spotify.release_radar_playlist.build_playlist(spotify.followed_artists.artist_tracks.final_tracks_uris, BLACK_LOGO_BASE_64)
+            await spotify.release_radar_playlist.build_playlist(spotify.followed_artists.artist_tracks.final_tracks_uris, get_image_asset(BLACK_LOGO))
             # Update the User
-            update_user_table_release_radar_id(user, spotify.release_radar_playlist.id)
+            await aiohttp_update_user_table_release_radar_id(user, spotify.release_radar_playlist.id, spotify.release_radar_playlist.image_hash)
             log.info(f"User Table updated with playlist id {spotify.release_radar_playlist.id}")
         else:
             log.info(f"Playlist ID found: {spotify.release_radar_playlist.id}")
             # Erase Playlist songs
             await spotify.release_radar_playlist.update_playlist(spotify.followed_artists.artist_tracks.final_tracks_uris)
 
+        if run_key:
+            await aiohttp_update_table_item_fields(WRAPPED_TABLE_NAME, 'email', user['email'], {}, ledger_fields=run_complete_fields(run_key))
+
         log.info(f"---------- USER COMPLETE: {spotify.email} ----------")
         return spotify.email
     except Exception as err:
@@ -1,38 +1,36 @@
-import asyncio
 import aiohttp
-from lambdas.common.wrapped_helper import get_active_release_radar_users
+from lambdas.common.wrapped_helper import aiter_active_release_radar_user_pages
 from lambdas.common.spotify import Spotify
-from lambdas.common.constants import BLACK_LOGO_BASE_64, LOGGER
-from lambdas.common.dynamo_helpers import update_user_table_release_radar_id
+from lambdas.common.constants import LOGGER, WRAPPED_TABLE_NAME
+from lambdas.common.image_assets import get_image_asset, BLACK_LOGO
+from lambdas.common.dynamo_helpers import build_user_release_radar_fields
+from lambdas.common.async_dynamo_helpers import aiohttp_update_table_item_fields
+from lambdas.common.release_index import ReleaseIndex
+from lambdas.common.cron_dispatcher import Deadline, run_cron_users
+from lambdas.common.run_ledger import RELEASE_RADAR_JOB, run_complete_fields
 
 log = LOGGER.get_logger(__file__)
 
-async def aiohttp_release_radar_chron_job(event):
+async def aiohttp_release_radar_chron_job(event, deadline: Deadline = None):
     try:
         log.info("Starting AIOHTTP Release Radar Chron Job...")
-        release_radar_users = get_active_release_radar_users()
+        # Shared by every user this run - each distinct artist is fetched once
+        release_index = ReleaseIndex()
 
         async with aiohttp.ClientSession() as session:
-            tasks = [aiohttp_process_user(user, session) for user in release_radar_users]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            success, failures = await run_cron_users(
+                event, deadline, RELEASE_RADAR_JOB, aiter_active_release_radar_user_pages,
+                lambda user, run_key: aiohttp_process_user(user, session, release_index, run_key)
+            )
 
-        failures = []
-        success = []
-        for user, result in zip(release_radar_users, results):
-            if isinstance(result, Exception):
-                log.error(f"User {user['email']} failed: {result}")
-                failures.append(result)
-            else:
-                success.append(result)
+        log.info(f"Distinct artists fetched: {len(release_index)}")
 
-        log.info(f"User Success: {success}")
-        log.info(f"User Failures: {failures}")
         return success, failures
     except Exception as err:
         log.error(f"AIOHTTP Release Radar Chron Job: {err}")
         raise Exception(f"AIOHTTP Release Radar Chron Job: {err}") from err
 
-async def aiohttp_process_user(user: dict, session: aiohttp.ClientSession):
+async def aiohttp_process_user(user: dict, session: aiohttp.ClientSession, release_index: ReleaseIndex = None, run_key: str = None):
     try:
         log.info(f"Found User: {user}")
         spotify = Spotify(user, session)
@@ -41,25 +39,45 @@ async def aiohttp_process_user(user: dict, session: aiohttp.ClientSession):
         await spotify.followed_artists.aiohttp_get_followed_artists()
         log.info(f"Followed Artist IDs found: {len(spotify.followed_artists.artist_id_list)}")
 
-        await spotify.followed_artists.aiohttp_get_followed_artist_latest_release()
+        await spotify.followed_artists.aiohttp_get_followed_artist_latest_release(release_index)
 
         if not spotify.release_radar_playlist.id:
             log.info("No Release Radar Playlist ID found yet.")
+            # Saved the moment the playlist exists - if anything after this fails, the next run
+            # updates this playlist instead of creating another one
             await spotify.release_radar_playlist.aiohttp_build_playlist(
                 spotify.followed_artists.artist_tracks.final_tracks_uris,
-                BLACK_LOGO_BASE_64
+                get_image_asset(BLACK_LOGO),
+                on_created=lambda playlist: __update_user_table_entry(user, build_user_release_radar_fields(playlist.id)),
+                ordered=False
             )
-            update_user_table_release_radar_id(user, spotify.release_radar_playlist.id)
-            log.info(f"User Table updated with playlist id {spotify.release_radar_playlist.id}")
+            fields = build_user_release_radar_fields(spotify.release_radar_playlist.id, spotify.release_radar_playlist.image_hash)
         else:
             log.info(f"Playlist ID found: {spotify.release_radar_playlist.id}")
             log.info(f"{spotify.email} User's final tracks: {spotify.followed_artists.artist_tracks.final_tracks_uris}")
+            previous_image_hash = spotify.release_radar_playlist.image_hash
             await spotify.release_radar_playlist.aiohttp_update_playlist(
-                spotify.followed_artists.artist_tracks.final_tracks_uris
+                spotify.followed_artists.artist_tracks.final_tracks_uris,
+                get_image_asset(BLACK_LOGO)
             )
+            fields = {}
+            if spotify.release_radar_playlist.image_hash != previous_image_hash:
+                fields = build_user_release_radar_fields(spotify.release_radar_playlist.id, spotify.release_radar_playlist.image_hash)
+
+        # Marks the run complete for this user in the same write - skipped if this run already did
+        ledger_fields = run_complete_fields(run_key) if run_key else None
+        if fields or ledger_fields:
+            await __update_user_table_entry(user, fields, ledger_fields)
 
         log.info(f"---------- USER COMPLETE: {spotify.email} ----------")
         return spotify.email
     except Exception as err:
         log.error(f"AIOHTTP Process User: {err}")
         raise Exception(f"AIOHTTP Process User: {err}") from err
+
+
+async def __update_user_table_entry(user, fields, ledger_fields=None):
+    # Attribute-level update - `user` is a projected index item, not the whole record
+    await aiohttp_update_table_item_fields(WRAPPED_TABLE_NAME, 'email', user['email'], fields, ledger_fields=ledger_fields)
+    user.update(fields)
+    user.update(ledger_fields or {})
@@ -1,7 +1,6 @@
 import json
 import traceback
 import inspect
-import asyncio
 
 from lambdas.common.utility_helpers import build_successful_handler_response, is_called_from_api, build_error_handler_response, validate_input
 from lambdas.common.errors import WrappednError
@@ -9,6 +8,8 @@ from wrapped_data import update_wrapped_data, get_wrapped_data
 from monthly_wrapped import wrapped_chron_job
 from monthly_wrapped_aiohttp import aiohttp_wrapped_chron_job
 from lambdas.common.constants import LOGGER, AIOHTTP_ACTIVE
+from lambdas.common.cron_dispatcher import run_cron_job
+from lambdas.common.run_ledger import WRAPPED_JOB
 
 log = LOGGER.get_logger(__file__)
 
@@ -20,8 +21,13 @@ def handler(event, context):
 
         # Monthly Wrapped Chron Job
         if 'body' not in event and event.get("source") == 'aws.events':
-            users_downloaded = asyncio.run(wrapped_chron_job(event)) if not AIOHTTP_ACTIVE else asyncio.run(aiohttp_wrapped_chron_job(event))
-            return build_successful_handler_response({"usersDownloaded": users_downloaded}, False)
+            # Sharded, deadline-aware run - see run_cron_job
+            run_job = aiohttp_wrapped_chron_job if AIOHTTP_ACTIVE else wrapped_chron_job
+            body = run_cron_job(
+                event, context, handler, WRAPPED_JOB, run_job,
+                lambda users_downloaded: {"usersDownloaded": [str(user) for user in users_downloaded]}
+            )
+            return build_successful_handler_response(body, False)
 
         is_api = is_called_from_api(event)
 
@@ -1,23 +1,25 @@
 import asyncio
 import aiohttp
-from datetime import datetime, timezone
 
-from lambdas.common.wrapped_helper import get_active_wrapped_users
+from lambdas.common.wrapped_helper import aiter_active_wrapped_user_pages, update_wrapped_user_entry
 from lambdas.common.spotify import Spotify
-from lambdas.common.constants import WRAPPED_TABLE_NAME, LOGO_BASE_64, BLACK_2025_BASE_64, LOGGER
-from lambdas.common.dynamo_helpers import update_table_item
+from lambdas.common.constants import LOGGER
+from lambdas.common.image_assets import get_image_asset, LOGO, BLACK_2025
+from lambdas.common.cron_dispatcher import Deadline, run_cron_users
+from lambdas.common.run_ledger import WRAPPED_JOB
 
 log = LOGGER.get_logger(__file__)
 
-async def aiohttp_wrapped_chron_job(event):
+async def aiohttp_wrapped_chron_job(event, deadline: Deadline = None):
     try:
         log.info("Starting AIOHTTP Wrapped Chron Job...")
-        wrapped_users = get_active_wrapped_users()
-
         async with aiohttp.ClientSession() as session:
-            tasks = [aiohttp_process_wrapped_user(user, session) for user in wrapped_users]
-            response = await asyncio.gather(*tasks, return_exceptions=True)
+            success, failures = await run_cron_users(
+                event, deadline, WRAPPED_JOB, aiter_active_wrapped_user_pages,
+                lambda user, run_key: aiohttp_process_wrapped_user(user, session, run_key)
+            )
 
+        response = success + failures
         log.info(f"Full Response Complete for Users: {response}")
         return response
     except Exception as err:
@@ -25,7 +27,7 @@ async def aiohttp_wrapped_chron_job(event):
         raise Exception("AIOHTTP Wrapped Chron Job failed") from err
 
 
-async def aiohttp_process_wrapped_user(user: dict, session: aiohttp.ClientSession):
+async def aiohttp_process_wrapped_user(user: dict, session: aiohttp.ClientSession, run_key: str = None):
     try:
         log.info(f"Found User: {user}")
         spotify = Spotify(user, session)
@@ -43,21 +45,21 @@ async def aiohttp_process_wrapped_user(user: dict, session: aiohttp.ClientSessio
 
         tasks = [
             spotify.monthly_spotify_playlist.aiohttp_build_playlist(
-                spotify.top_tracks_short.track_uri_list, LOGO_BASE_64
+                spotify.top_tracks_short.track_uri_list, get_image_asset(LOGO)
             )
         ]
 
         if spotify.last_month_number == 6:
             tasks.append(
                 spotify.first_half_of_year_spotify_playlist.aiohttp_build_playlist(
-                    spotify.top_tracks_medium.track_uri_list, LOGO_BASE_64
+                    spotify.top_tracks_medium.track_uri_list, get_image_asset(LOGO)
                 )
             )
 
         if spotify.last_month_number == 12:
             tasks.append(
                 spotify.full_year_spotify_playlist.aiohttp_build_playlist(
-                    spotify.top_tracks_long.track_uri_list, BLACK_2025_BASE_64
+                    spotify.top_tracks_long.track_uri_list, get_image_asset(BLACK_2025)
                 )
             )
 
@@ -69,25 +71,10 @@ async def aiohttp_process_wrapped_user(user: dict, session: aiohttp.ClientSessio
         top_genres_last_month = spotify.get_top_genres_last_month()
 
         # Update User Table
-        __update_user_table_entry(user, top_tracks_last_month, top_artists_last_month, top_genres_last_month)
+        await update_wrapped_user_entry(user, top_tracks_last_month, top_artists_last_month, top_genres_last_month, run_key)
 
         log.info(f"---------- USER COMPLETE: {spotify.email} ----------")
         return spotify.email
     except Exception as err:
         log.error(f"AIOHTTP Process Wrapped User: {err}")
         raise Exception("AIOHTTP Process Wrapped User failed") from err
-
-
-def __update_user_table_entry(user, top_tracks_last_month, top_artists_last_month, top_genres_last_month):
-    # Tracks
-    user['topSongIdsTwoMonthsAgo'] = user.get('topSongIdsLastMonth', {})
-    user['topSongIdsLastMonth'] = top_tracks_last_month
-    # Artists
-    user['topArtistIdsTwoMonthsAgo'] = user.get('topArtistIdsLastMonth', {})
-    user['topArtistIdsLastMonth'] = top_artists_last_month
-    # Genres
-    user['topGenresTwoMonthsAgo'] = user.get('topGenresLastMonth', {})
-    user['topGenresLastMonth'] = top_genres_last_month
-    # Time Stamp
-    user['updatedAt'] = datetime.now(timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
-    update_table_item(WRAPPED_TABLE_NAME, user)
@@ -1,6 +1,6 @@
 from datetime import datetime, timezone
 
-from lambdas.common.dynamo_helpers import update_table_item, get_item_by_key, check_if_item_exist
+from lambdas.common.dynamo_helpers import update_table_item, get_item_or_default
 from lambdas.common.constants import WRAPPED_TABLE_NAME, LOGGER
 
 log = LOGGER.get_logger(__file__)
@@ -23,11 +23,7 @@ def update_wrapped_data(data: dict, optional_fields={}):
 
 def get_wrapped_data(email: str):
     try:
-        if check_if_item_exist(WRAPPED_TABLE_NAME, 'email', email, True):
-            response = get_item_by_key(WRAPPED_TABLE_NAME, 'email', email)
-            return response
-        else:
-            return {'active': False}
+        return get_item_or_default(WRAPPED_TABLE_NAME, 'email', email, {'active': False})
     except Exception as err:
         log.error(f"Get Wrapped Data: {err}")
         raise Exception(f"Get Wrapped Data: {err}")
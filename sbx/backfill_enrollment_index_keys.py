@@ -0,0 +1,23 @@
+import os
+import sys
+
+# One-off: give users enrolled before the sparse indexes existed their index keys.
+# Run BEFORE deploying the index-query cron jobs - until it has run, the active-user index
+# queries only return users who re-enrolled since the indexes were added.
+# Run from the repo root against the target account:
+#   AWS_ACCOUNT_ID=... DYNAMODB_KMS_ALIAS=... WRAPPED_TABLE_NAME=... python sbx/backfill_enrollment_index_keys.py
+# Safe to re-run - users whose keys already match their enrollment are left alone.
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from lambdas.common.dynamo_helpers import backfill_enrollment_index_keys
+
+
+def main():
+    updated = backfill_enrollment_index_keys()
+    print(f"Backfilled enrollment index keys for {updated} users.")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+# Cold-start import cost of every Lambda handler module, each in a fresh interpreter.
+# Run from the repo root:  python sbx/import_time_benchmark.py [--runs 5] [--budget-ms 1500]
+# Exits non-zero if any handler's median import time is over budget.
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HANDLERS = {
+    'authorizer': 'lambdas/authorizer',
+    'release_radar': 'lambdas/release_radar',
+    'update_user_table': 'lambdas/update_user_table',
+    'wrapped': 'lambdas/wrapped',
+}
+
+# Just enough env for constants.py to import - nothing here talks to AWS at import time
+STUB_ENV = {
+    'AWS_ACCOUNT_ID': '000000000000',
+    'AWS_DEFAULT_REGION': 'us-east-1',
+    'DYNAMODB_KMS_ALIAS': 'alias/benchmark',
+    'WRAPPED_TABLE_NAME': 'benchmark',
+}
+
+MEASURE = """
+import sys, time, resource
+start = time.perf_counter()
+import handler
+elapsed = time.perf_counter() - start
+print(f"{elapsed * 1000:.1f} {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss}")
+"""
+
+
+def time_handler_import(handler_dir: str):
+    env = {**STUB_ENV, **os.environ, 'PYTHONPATH': REPO_ROOT}
+    # The Lambda runtime puts the handler's own folder first - handlers import siblings by bare name
+    result = subprocess.run(
+        [sys.executable, '-c', MEASURE],
+        cwd=os.path.join(REPO_ROOT, handler_dir),
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    elapsed_ms, max_rss_kb = result.stdout.strip().splitlines()[-1].split()
+    return float(elapsed_ms), int(max_rss_kb)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Import-time regression benchmark for Lambda handlers.")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--budget-ms', type=float, default=1500)
+    parser.add_argument('--json', action='store_true', help="Print results as JSON.")
+    args = parser.parse_args()
+
+    results = {}
+    for name, handler_dir in HANDLERS.items():
+        # First run warms the bytecode cache, same as a deployed package with .pyc files
+        time_handler_import(handler_dir)
+        samples = [time_handler_import(handler_dir) for _ in range(args.runs)]
+        results[name] = {
+            'medianMs': round(statistics.median(sample[0] for sample in samples), 1),
+            'maxRssKb': max(sample[1] for sample in samples),
+        }
+
+    over_budget = [name for name, result in results.items() if result['medianMs'] > args.budget_ms]
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for name, result in results.items():
+            flag = ' OVER BUDGET' if name in over_budget else ''
+            print(f"{name:<20} {result['medianMs']:>8.1f} ms  {result['maxRssKb']:>8} KB{flag}")
+    sys.exit(1 if over_budget else 0)
+
+
+if __name__ == '__main__':
+    main()